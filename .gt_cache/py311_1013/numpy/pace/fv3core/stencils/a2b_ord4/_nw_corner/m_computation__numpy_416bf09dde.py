@@ -0,0 +1,189 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, qin, qout, tmp_qout_edges, lon_agrid, lat_agrid, lon, lat, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    qin = Field(qin, _origin_['qin'], (True, True, True))
+    qout = Field(qout, _origin_['qout'], (True, True, True))
+    tmp_qout_edges = Field(tmp_qout_edges, _origin_['tmp_qout_edges'], (True, True, True))
+    lon_agrid = Field(lon_agrid, _origin_['lon_agrid'], (True, True, False))
+    lat_agrid = Field(lat_agrid, _origin_['lat_agrid'], (True, True, False))
+    lon = Field(lon, _origin_['lon'], (True, True, False))
+    lat = Field(lat, _origin_['lat'], (True, True, False))
+    
+    qa__658_41_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p1a__658_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    x2__658_21_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p0a__658_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ta__7a5_12_9__658_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ta__7a5_12_9__658_21_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p1b__658_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p1a__658_41_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p1b__658_21_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p0b__658_41_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tb__7a5_13_9__658_21_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p1a__658_21_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    x2__658_41_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p2b__658_41_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tb__7a5_13_9__658_41_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tb__7a5_12_9__658_41_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qa__658_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p0a__658_21_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qb__658_21_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p0a__658_41_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p2a__658_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ta__7a5_13_9__658_41_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ta__7a5_12_9__658_41_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p0b__658_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ta__7a5_13_9__658_21_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tb__7a5_12_9__658_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    x1__658_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p2b__658_21_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ec1_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ta__7a5_13_9__658_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tb__7a5_12_9__658_21_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p2b__658_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ec2_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p2a__658_41_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tb__7a5_13_9__658_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qa__658_21_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    x1__658_21_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qb__658_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p1b__658_41_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ec3_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    x2__658_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p0b__658_21_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qb__658_41_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    x1__658_41_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p2a__658_21_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        p0a__658_21_14_gen_0[i:I, j:J, k:K] = lon[i:I, j:J]
+        p0b__658_21_14_gen_0[i:I, j:J, k:K] = lat[i:I, j:J]
+        p1a__658_21_14_gen_0[i:I, j:J, k:K] = lon_agrid[i - 1:I - 1, j:J]
+        p1b__658_21_14_gen_0[i:I, j:J, k:K] = lat_agrid[i - 1:I - 1, j:J]
+        p2a__658_21_14_gen_0[i:I, j:J, k:K] = lon_agrid[i - 2:I - 2, j + 1:J + 1]
+        p2b__658_21_14_gen_0[i:I, j:J, k:K] = lat_agrid[i - 2:I - 2, j + 1:J + 1]
+        qa__658_21_14_gen_0[i:I, j:J, k:K] = qin[i - 1:I - 1, j:J, k:K]
+        qb__658_21_14_gen_0[i:I, j:J, k:K] = qin[i - 2:I - 2, j + 1:J + 1, k:K]
+        tb__7a5_12_9__658_21_14_gen_0[i:I, j:J, k:K] = np.power(np.sin(((p1b__658_21_14_gen_0[i:I, j:J, k:K] - p0b__658_21_14_gen_0[i:I, j:J, k:K]) / np.float64(2.0))), np.float64(2.0))
+        ta__7a5_12_9__658_21_14_gen_0[i:I, j:J, k:K] = np.power(np.sin(((p1a__658_21_14_gen_0[i:I, j:J, k:K] - p0a__658_21_14_gen_0[i:I, j:J, k:K]) / np.float64(2.0))), np.float64(2.0))
+        x1__658_21_14_gen_0[i:I, j:J, k:K] = (np.arcsin(np.sqrt((tb__7a5_12_9__658_21_14_gen_0[i:I, j:J, k:K] + ((np.cos(p1b__658_21_14_gen_0[i:I, j:J, k:K]) * np.cos(p0b__658_21_14_gen_0[i:I, j:J, k:K])) * ta__7a5_12_9__658_21_14_gen_0[i:I, j:J, k:K])))) * np.float64(2.0))
+        tb__7a5_13_9__658_21_14_gen_0[i:I, j:J, k:K] = np.power(np.sin(((p2b__658_21_14_gen_0[i:I, j:J, k:K] - p0b__658_21_14_gen_0[i:I, j:J, k:K]) / np.float64(2.0))), np.float64(2.0))
+        ta__7a5_13_9__658_21_14_gen_0[i:I, j:J, k:K] = np.power(np.sin(((p2a__658_21_14_gen_0[i:I, j:J, k:K] - p0a__658_21_14_gen_0[i:I, j:J, k:K]) / np.float64(2.0))), np.float64(2.0))
+        x2__658_21_14_gen_0[i:I, j:J, k:K] = (np.arcsin(np.sqrt((tb__7a5_13_9__658_21_14_gen_0[i:I, j:J, k:K] + ((np.cos(p2b__658_21_14_gen_0[i:I, j:J, k:K]) * np.cos(p0b__658_21_14_gen_0[i:I, j:J, k:K])) * ta__7a5_13_9__658_21_14_gen_0[i:I, j:J, k:K])))) * np.float64(2.0))
+        ec1_gen_0[i:I, j:J, k:K] = (qa__658_21_14_gen_0[i:I, j:J, k:K] + ((x1__658_21_14_gen_0[i:I, j:J, k:K] / (x2__658_21_14_gen_0[i:I, j:J, k:K] - x1__658_21_14_gen_0[i:I, j:J, k:K])) * (qa__658_21_14_gen_0[i:I, j:J, k:K] - qb__658_21_14_gen_0[i:I, j:J, k:K])))
+        p0a__658_31_14_gen_0[i:I, j:J, k:K] = lon[i:I, j:J]
+        p0b__658_31_14_gen_0[i:I, j:J, k:K] = lat[i:I, j:J]
+        p1a__658_31_14_gen_0[i:I, j:J, k:K] = lon_agrid[i - 1:I - 1, j - 1:J - 1]
+        p1b__658_31_14_gen_0[i:I, j:J, k:K] = lat_agrid[i - 1:I - 1, j - 1:J - 1]
+        p2a__658_31_14_gen_0[i:I, j:J, k:K] = lon_agrid[i - 2:I - 2, j - 2:J - 2]
+        p2b__658_31_14_gen_0[i:I, j:J, k:K] = lat_agrid[i - 2:I - 2, j - 2:J - 2]
+        qa__658_31_14_gen_0[i:I, j:J, k:K] = qin[i - 1:I - 1, j - 1:J - 1, k:K]
+        qb__658_31_14_gen_0[i:I, j:J, k:K] = qin[i - 2:I - 2, j - 2:J - 2, k:K]
+        tb__7a5_12_9__658_31_14_gen_0[i:I, j:J, k:K] = np.power(np.sin(((p1b__658_31_14_gen_0[i:I, j:J, k:K] - p0b__658_31_14_gen_0[i:I, j:J, k:K]) / np.float64(2.0))), np.float64(2.0))
+        ta__7a5_12_9__658_31_14_gen_0[i:I, j:J, k:K] = np.power(np.sin(((p1a__658_31_14_gen_0[i:I, j:J, k:K] - p0a__658_31_14_gen_0[i:I, j:J, k:K]) / np.float64(2.0))), np.float64(2.0))
+        x1__658_31_14_gen_0[i:I, j:J, k:K] = (np.arcsin(np.sqrt((tb__7a5_12_9__658_31_14_gen_0[i:I, j:J, k:K] + ((np.cos(p1b__658_31_14_gen_0[i:I, j:J, k:K]) * np.cos(p0b__658_31_14_gen_0[i:I, j:J, k:K])) * ta__7a5_12_9__658_31_14_gen_0[i:I, j:J, k:K])))) * np.float64(2.0))
+        tb__7a5_13_9__658_31_14_gen_0[i:I, j:J, k:K] = np.power(np.sin(((p2b__658_31_14_gen_0[i:I, j:J, k:K] - p0b__658_31_14_gen_0[i:I, j:J, k:K]) / np.float64(2.0))), np.float64(2.0))
+        ta__7a5_13_9__658_31_14_gen_0[i:I, j:J, k:K] = np.power(np.sin(((p2a__658_31_14_gen_0[i:I, j:J, k:K] - p0a__658_31_14_gen_0[i:I, j:J, k:K]) / np.float64(2.0))), np.float64(2.0))
+        x2__658_31_14_gen_0[i:I, j:J, k:K] = (np.arcsin(np.sqrt((tb__7a5_13_9__658_31_14_gen_0[i:I, j:J, k:K] + ((np.cos(p2b__658_31_14_gen_0[i:I, j:J, k:K]) * np.cos(p0b__658_31_14_gen_0[i:I, j:J, k:K])) * ta__7a5_13_9__658_31_14_gen_0[i:I, j:J, k:K])))) * np.float64(2.0))
+        ec2_gen_0[i:I, j:J, k:K] = (qa__658_31_14_gen_0[i:I, j:J, k:K] + ((x1__658_31_14_gen_0[i:I, j:J, k:K] / (x2__658_31_14_gen_0[i:I, j:J, k:K] - x1__658_31_14_gen_0[i:I, j:J, k:K])) * (qa__658_31_14_gen_0[i:I, j:J, k:K] - qb__658_31_14_gen_0[i:I, j:J, k:K])))
+        p0a__658_41_14_gen_0[i:I, j:J, k:K] = lon[i:I, j:J]
+        p0b__658_41_14_gen_0[i:I, j:J, k:K] = lat[i:I, j:J]
+        p1a__658_41_14_gen_0[i:I, j:J, k:K] = lon_agrid[i:I, j:J]
+        p1b__658_41_14_gen_0[i:I, j:J, k:K] = lat_agrid[i:I, j:J]
+        p2a__658_41_14_gen_0[i:I, j:J, k:K] = lon_agrid[i + 1:I + 1, j + 1:J + 1]
+        p2b__658_41_14_gen_0[i:I, j:J, k:K] = lat_agrid[i + 1:I + 1, j + 1:J + 1]
+        qa__658_41_14_gen_0[i:I, j:J, k:K] = qin[i:I, j:J, k:K]
+        qb__658_41_14_gen_0[i:I, j:J, k:K] = qin[i + 1:I + 1, j + 1:J + 1, k:K]
+        tb__7a5_12_9__658_41_14_gen_0[i:I, j:J, k:K] = np.power(np.sin(((p1b__658_41_14_gen_0[i:I, j:J, k:K] - p0b__658_41_14_gen_0[i:I, j:J, k:K]) / np.float64(2.0))), np.float64(2.0))
+        ta__7a5_12_9__658_41_14_gen_0[i:I, j:J, k:K] = np.power(np.sin(((p1a__658_41_14_gen_0[i:I, j:J, k:K] - p0a__658_41_14_gen_0[i:I, j:J, k:K]) / np.float64(2.0))), np.float64(2.0))
+        x1__658_41_14_gen_0[i:I, j:J, k:K] = (np.arcsin(np.sqrt((tb__7a5_12_9__658_41_14_gen_0[i:I, j:J, k:K] + ((np.cos(p1b__658_41_14_gen_0[i:I, j:J, k:K]) * np.cos(p0b__658_41_14_gen_0[i:I, j:J, k:K])) * ta__7a5_12_9__658_41_14_gen_0[i:I, j:J, k:K])))) * np.float64(2.0))
+        tb__7a5_13_9__658_41_14_gen_0[i:I, j:J, k:K] = np.power(np.sin(((p2b__658_41_14_gen_0[i:I, j:J, k:K] - p0b__658_41_14_gen_0[i:I, j:J, k:K]) / np.float64(2.0))), np.float64(2.0))
+        ta__7a5_13_9__658_41_14_gen_0[i:I, j:J, k:K] = np.power(np.sin(((p2a__658_41_14_gen_0[i:I, j:J, k:K] - p0a__658_41_14_gen_0[i:I, j:J, k:K]) / np.float64(2.0))), np.float64(2.0))
+        x2__658_41_14_gen_0[i:I, j:J, k:K] = (np.arcsin(np.sqrt((tb__7a5_13_9__658_41_14_gen_0[i:I, j:J, k:K] + ((np.cos(p2b__658_41_14_gen_0[i:I, j:J, k:K]) * np.cos(p0b__658_41_14_gen_0[i:I, j:J, k:K])) * ta__7a5_13_9__658_41_14_gen_0[i:I, j:J, k:K])))) * np.float64(2.0))
+        ec3_gen_0[i:I, j:J, k:K] = (qa__658_41_14_gen_0[i:I, j:J, k:K] + ((x1__658_41_14_gen_0[i:I, j:J, k:K] / (x2__658_41_14_gen_0[i:I, j:J, k:K] - x1__658_41_14_gen_0[i:I, j:J, k:K])) * (qa__658_41_14_gen_0[i:I, j:J, k:K] - qb__658_41_14_gen_0[i:I, j:J, k:K])))
+        qout[i:I, j:J, k:K] = (((ec1_gen_0[i:I, j:J, k:K] + ec2_gen_0[i:I, j:J, k:K]) + ec3_gen_0[i:I, j:J, k:K]) * (np.float64(1.0) / np.float64(3.0)))
+        tmp_qout_edges[i:I, j:J, k:K] = qout[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,158 @@
+
+
+import pathlib
+import time
+
+import numpy as np
+from numpy import dtype
+from gt4py.cartesian.stencil_object import StencilObject
+import pathlib
+from gt4py.cartesian.utils import make_module_from_file
+computation = make_module_from_file("m_computation__numpy_9c54decef7", pathlib.Path(__file__).parent / "m_computation__numpy_9c54decef7.py")
+
+from gt4py.cartesian.definitions import AccessKind, Boundary, CartesianSpace
+from gt4py.cartesian.stencil_object import DomainInfo, FieldInfo, ParameterInfo
+
+
+
+class divergence_corner____numpy_9c54decef7(StencilObject):
+    """
+    Calculate divg on d-grid.
+
+Computed in order to damp the divergence, the damping is applied
+at the end of d_sw directly to the winds.
+
+Described in detail in Chapter 8.3 of the FV3 documentation.
+
+Args:
+    u (in): x-velocity on d-grid
+    v (in): y-velocity on d-grid
+    ua (in): x-velocity on a
+    va (in): y-velocity on a
+    dxc (in): grid spacing in x-direction
+    dyc (in): grid spacing in y-direction
+    sin_sg1 (in): grid sin(sg1)
+    sin_sg2 (in): grid sin(sg2)
+    sin_sg3 (in): grid sin(sg3)
+    sin_sg4 (in): grid sin(sg4)
+    cos_sg1 (in): grid cos(sg1)
+    cos_sg2 (in): grid cos(sg2)
+    cos_sg3 (in): grid cos(sg3)
+    cos_sg4 (in): grid cos(sg4)
+    rarea_c (in): inverse cell areas on c-grid
+    divg_d (out): divergence on d-grid (cell corners)
+
+    The callable interface is the same of the stencil definition function,
+    with some extra keyword arguments. Check :class:`gt4py.StencilObject`
+    for the full specification.
+    """
+
+    _gt_backend_ = "numpy"
+
+    _gt_source_ = {}
+
+    _gt_domain_info_ = DomainInfo(parallel_axes=('I', 'J'), sequential_axis='K', min_sequential_axis_size=0, ndim=3)
+
+    _gt_field_info_ = {'u': FieldInfo(access=AccessKind.READ, boundary=Boundary(((1, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'v': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (1, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'ua': FieldInfo(access=AccessKind.READ, boundary=Boundary(((1, 0), (1, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'va': FieldInfo(access=AccessKind.READ, boundary=Boundary(((1, 0), (1, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'dxc': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (1, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'dyc': FieldInfo(access=AccessKind.READ, boundary=Boundary(((1, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'sin_sg1': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (1, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'sin_sg2': FieldInfo(access=AccessKind.READ, boundary=Boundary(((1, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'sin_sg3': FieldInfo(access=AccessKind.READ, boundary=Boundary(((1, 0), (1, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'sin_sg4': FieldInfo(access=AccessKind.READ, boundary=Boundary(((1, 0), (1, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'cos_sg1': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (1, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'cos_sg2': FieldInfo(access=AccessKind.READ, boundary=Boundary(((1, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'cos_sg3': FieldInfo(access=AccessKind.READ, boundary=Boundary(((1, 0), (1, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'cos_sg4': FieldInfo(access=AccessKind.READ, boundary=Boundary(((1, 0), (1, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'rarea_c': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'divg_d': FieldInfo(access=AccessKind.WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64'))}
+
+    _gt_parameter_info_ = {}
+
+    _gt_constants_ = {}
+
+    _gt_options_ = {'name': 'divergence_corner', 'module': 'pace.fv3core.stencils.c_sw', 'format_source': False, 'backend_opts': {}, 'rebuild': False, 'raise_if_not_cached': False, 'cache_settings': {}, '_impl_opts': {}}
+
+    @property
+    def backend(self):
+        return type(self)._gt_backend_
+
+    @property
+    def source(self):
+        return type(self)._gt_source_
+
+    @property
+    def domain_info(self):
+        return type(self)._gt_domain_info_
+
+    @property
+    def field_info(self) -> dict:
+        return type(self)._gt_field_info_
+
+    @property
+    def parameter_info(self) -> dict:
+        return type(self)._gt_parameter_info_
+
+    @property
+    def constants(self) -> dict:
+        return type(self)._gt_constants_
+
+    @property
+    def options(self) -> dict:
+        return type(self)._gt_options_
+
+    def __call__(
+        self, u, v, ua, va, dxc, dyc, sin_sg1, sin_sg2, sin_sg3, sin_sg4, cos_sg1, cos_sg2, cos_sg3, cos_sg4, rarea_c, divg_d, domain=None, origin=None, validate_args=True, exec_info=None
+    ):
+        if exec_info is not None:
+            exec_info["call_start_time"] = time.perf_counter()
+
+        field_args=dict( divg_d=divg_d,  cos_sg2=cos_sg2,  sin_sg4=sin_sg4,  sin_sg1=sin_sg1,  va=va,  dyc=dyc,  sin_sg2=sin_sg2,  cos_sg4=cos_sg4,  dxc=dxc,  u=u,  ua=ua,  sin_sg3=sin_sg3,  rarea_c=rarea_c,  cos_sg1=cos_sg1,  v=v,  cos_sg3=cos_sg3)
+        parameter_args=dict()
+        # assert that all required values have been provided
+
+
+        self._call_run(
+            field_args=field_args,
+            parameter_args=parameter_args,
+            domain=domain,
+            origin=origin,
+            validate_args=validate_args,
+            exec_info=exec_info,
+        )
+
+
+        if exec_info is not None:
+            exec_info["call_end_time"] = time.perf_counter()
+
+            if exec_info.setdefault("__aggregate_data", False):
+                stencil_info = exec_info.setdefault("divergence_corner____numpy_9c54decef7", {})
+
+                # Update performance counters
+                stencil_info["call_start_time"] = exec_info["call_start_time"]
+                stencil_info["call_end_time"] = exec_info["call_end_time"]
+                stencil_info["call_time"] = (
+                    stencil_info["call_end_time"]
+                    - stencil_info["call_start_time"]
+                )
+                stencil_info["total_call_time"] = (
+                    stencil_info.get("total_call_time", 0.0)
+                    + stencil_info["call_time"]
+                )
+                stencil_info["ncalls"] = (
+                    stencil_info.get("ncalls", 0) + 1
+                )
+                stencil_info["run_time"] = (
+                    exec_info["run_end_time"]
+                    - exec_info["run_start_time"]
+                )
+                stencil_info["total_run_time"] = (
+                    stencil_info.get("total_run_time", 0.0)
+                    + stencil_info["run_time"]
+                )
+                if "run_cpp_start_time" in exec_info:
+                    stencil_info["run_cpp_time"] = (
+                        exec_info["run_cpp_end_time"]
+                        - exec_info["run_cpp_start_time"]
+                    )
+                    stencil_info["total_run_cpp_time"] = (
+                        stencil_info.get("total_run_cpp_time", 0.0)
+                        + stencil_info["run_cpp_time"]
+                    )
+
+    def run(self, _domain_, _origin_, exec_info, *,divg_d, cos_sg2, sin_sg4, sin_sg1, va, dyc, sin_sg2, cos_sg4, dxc, u, ua, sin_sg3, rarea_c, cos_sg1, v, cos_sg3,):
+        if exec_info is not None:
+            exec_info["domain"] = _domain_
+            exec_info["origin"] = _origin_
+            exec_info["run_start_time"] = time.perf_counter()
+        computation.run(u=u, v=v, ua=ua, va=va, dxc=dxc, dyc=dyc, sin_sg1=sin_sg1, sin_sg2=sin_sg2, sin_sg3=sin_sg3, sin_sg4=sin_sg4, cos_sg1=cos_sg1, cos_sg2=cos_sg2, cos_sg3=cos_sg3, cos_sg4=cos_sg4, rarea_c=rarea_c, divg_d=divg_d, _domain_=_domain_, _origin_=_origin_)
+        if exec_info is not None:
+            exec_info["run_end_time"] = time.perf_counter()
\ No newline at end of file
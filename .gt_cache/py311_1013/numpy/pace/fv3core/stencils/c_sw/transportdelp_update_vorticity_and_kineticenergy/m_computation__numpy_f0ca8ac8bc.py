@@ -0,0 +1,160 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, delp, pt, vtc, w, rarea, delpc, ptc, wc, ke, vort, ua, va, uc, vc, u, v, fx, fx1, fx2, sin_sg1, cos_sg1, sin_sg2, cos_sg2, sin_sg3, cos_sg3, sin_sg4, cos_sg4, dt2, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    delp = Field(delp, _origin_['delp'], (True, True, True))
+    pt = Field(pt, _origin_['pt'], (True, True, True))
+    vtc = Field(vtc, _origin_['vtc'], (True, True, True))
+    w = Field(w, _origin_['w'], (True, True, True))
+    rarea = Field(rarea, _origin_['rarea'], (True, True, False))
+    delpc = Field(delpc, _origin_['delpc'], (True, True, True))
+    ptc = Field(ptc, _origin_['ptc'], (True, True, True))
+    wc = Field(wc, _origin_['wc'], (True, True, True))
+    ke = Field(ke, _origin_['ke'], (True, True, True))
+    vort = Field(vort, _origin_['vort'], (True, True, True))
+    ua = Field(ua, _origin_['ua'], (True, True, True))
+    va = Field(va, _origin_['va'], (True, True, True))
+    uc = Field(uc, _origin_['uc'], (True, True, True))
+    vc = Field(vc, _origin_['vc'], (True, True, True))
+    u = Field(u, _origin_['u'], (True, True, True))
+    v = Field(v, _origin_['v'], (True, True, True))
+    fx = Field(fx, _origin_['fx'], (True, True, True))
+    fx1 = Field(fx1, _origin_['fx1'], (True, True, True))
+    fx2 = Field(fx2, _origin_['fx2'], (True, True, True))
+    sin_sg1 = Field(sin_sg1, _origin_['sin_sg1'], (True, True, False))
+    cos_sg1 = Field(cos_sg1, _origin_['cos_sg1'], (True, True, False))
+    sin_sg2 = Field(sin_sg2, _origin_['sin_sg2'], (True, True, False))
+    cos_sg2 = Field(cos_sg2, _origin_['cos_sg2'], (True, True, False))
+    sin_sg3 = Field(sin_sg3, _origin_['sin_sg3'], (True, True, False))
+    cos_sg3 = Field(cos_sg3, _origin_['cos_sg3'], (True, True, False))
+    sin_sg4 = Field(sin_sg4, _origin_['sin_sg4'], (True, True, False))
+    cos_sg4 = Field(cos_sg4, _origin_['cos_sg4'], (True, True, False))
+    
+    fy1_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fy1_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fy_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fy_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fy2_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fy2_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        fy1_gen_1[i:I, j:J, k:K] = np.where((vtc[i:I, j + 1:J + 1, k:K] > np.float64(0.0)), delp[i:I, j:J, k:K], delp[i:I, j + 1:J + 1, k:K])
+        fy_gen_1[i:I, j:J, k:K] = np.where((vtc[i:I, j + 1:J + 1, k:K] > np.float64(0.0)), pt[i:I, j:J, k:K], pt[i:I, j + 1:J + 1, k:K])
+        fy2_gen_1[i:I, j:J, k:K] = np.where((vtc[i:I, j + 1:J + 1, k:K] > np.float64(0.0)), w[i:I, j:J, k:K], w[i:I, j + 1:J + 1, k:K])
+        fy1_gen_1[i:I, j:J, k:K] = (vtc[i:I, j + 1:J + 1, k:K] * fy1_gen_1[i:I, j:J, k:K])
+        fy_gen_1[i:I, j:J, k:K] = (fy1_gen_1[i:I, j:J, k:K] * fy_gen_1[i:I, j:J, k:K])
+        fy2_gen_1[i:I, j:J, k:K] = (fy1_gen_1[i:I, j:J, k:K] * fy2_gen_1[i:I, j:J, k:K])
+        fy1_gen_0[i:I, j:J, k:K] = np.where((vtc[i:I, j:J, k:K] > np.float64(0.0)), delp[i:I, j - 1:J - 1, k:K], delp[i:I, j:J, k:K])
+        fy_gen_0[i:I, j:J, k:K] = np.where((vtc[i:I, j:J, k:K] > np.float64(0.0)), pt[i:I, j - 1:J - 1, k:K], pt[i:I, j:J, k:K])
+        fy2_gen_0[i:I, j:J, k:K] = np.where((vtc[i:I, j:J, k:K] > np.float64(0.0)), w[i:I, j - 1:J - 1, k:K], w[i:I, j:J, k:K])
+        fy1_gen_0[i:I, j:J, k:K] = (vtc[i:I, j:J, k:K] * fy1_gen_0[i:I, j:J, k:K])
+        fy_gen_0[i:I, j:J, k:K] = (fy1_gen_0[i:I, j:J, k:K] * fy_gen_0[i:I, j:J, k:K])
+        fy2_gen_0[i:I, j:J, k:K] = (fy1_gen_0[i:I, j:J, k:K] * fy2_gen_0[i:I, j:J, k:K])
+        delpc[i:I, j:J, k:K] = (delp[i:I, j:J, k:K] + ((((fx1[i:I, j:J, k:K] - fx1[i + 1:I + 1, j:J, k:K]) + fy1_gen_0[i:I, j:J, k:K]) - fy1_gen_1[i:I, j:J, k:K]) * rarea[i:I, j:J]))
+        ptc[i:I, j:J, k:K] = (((pt[i:I, j:J, k:K] * delp[i:I, j:J, k:K]) + ((((fx[i:I, j:J, k:K] - fx[i + 1:I + 1, j:J, k:K]) + fy_gen_0[i:I, j:J, k:K]) - fy_gen_1[i:I, j:J, k:K]) * rarea[i:I, j:J])) / delpc[i:I, j:J, k:K])
+        wc[i:I, j:J, k:K] = (((w[i:I, j:J, k:K] * delp[i:I, j:J, k:K]) + ((((fx2[i:I, j:J, k:K] - fx2[i + 1:I + 1, j:J, k:K]) + fy2_gen_0[i:I, j:J, k:K]) - fy2_gen_1[i:I, j:J, k:K]) * rarea[i:I, j:J])) / delpc[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        ke[i:I, j:J, k:K] = np.where((ua[i:I, j:J, k:K] > np.float64(0.0)), uc[i:I, j:J, k:K], uc[i + 1:I + 1, j:J, k:K])
+        vort[i:I, j:J, k:K] = np.where((va[i:I, j:J, k:K] > np.float64(0.0)), vc[i:I, j:J, k:K], vc[i:I, j + 1:J + 1, k:K])
+        vort[i:I, j:j + 1, k:K] = np.where((va[i:I, j:j + 1, k:K] <= np.float64(0.0)), ((vort[i:I, j:j + 1, k:K] * sin_sg4[i:I, j:j + 1]) + (u[i:I, j + 1:j + 2, k:K] * cos_sg4[i:I, j:j + 1])), vort[i:I, j:j + 1, k:K])
+        vort[i:I, J - 2:J - 1, k:K] = np.where((va[i:I, J - 2:J - 1, k:K] <= np.float64(0.0)), ((vort[i:I, J - 2:J - 1, k:K] * sin_sg4[i:I, J - 2:J - 1]) + (u[i:I, J - 1:J, k:K] * cos_sg4[i:I, J - 2:J - 1])), vort[i:I, J - 2:J - 1, k:K])
+        vort[i:I, j + 1:j + 2, k:K] = np.where((va[i:I, j + 1:j + 2, k:K] > np.float64(0.0)), ((vort[i:I, j + 1:j + 2, k:K] * sin_sg2[i:I, j + 1:j + 2]) + (u[i:I, j + 1:j + 2, k:K] * cos_sg2[i:I, j + 1:j + 2])), vort[i:I, j + 1:j + 2, k:K])
+        vort[i:I, J - 1:J, k:K] = np.where((va[i:I, J - 1:J, k:K] > np.float64(0.0)), ((vort[i:I, J - 1:J, k:K] * sin_sg2[i:I, J - 1:J]) + (u[i:I, J - 1:J, k:K] * cos_sg2[i:I, J - 1:J])), vort[i:I, J - 1:J, k:K])
+        ke[I - 2:I - 1, j:J, k:K] = np.where((ua[I - 2:I - 1, j:J, k:K] <= np.float64(0.0)), ((ke[I - 2:I - 1, j:J, k:K] * sin_sg3[I - 2:I - 1, j:J]) + (v[I - 1:I, j:J, k:K] * cos_sg3[I - 2:I - 1, j:J])), ke[I - 2:I - 1, j:J, k:K])
+        ke[i:i + 1, j:J, k:K] = np.where((ua[i:i + 1, j:J, k:K] <= np.float64(0.0)), ((ke[i:i + 1, j:J, k:K] * sin_sg3[i:i + 1, j:J]) + (v[i + 1:i + 2, j:J, k:K] * cos_sg3[i:i + 1, j:J])), ke[i:i + 1, j:J, k:K])
+        ke[I - 1:I, j:J, k:K] = np.where((ua[I - 1:I, j:J, k:K] > np.float64(0.0)), ((ke[I - 1:I, j:J, k:K] * sin_sg1[I - 1:I, j:J]) + (v[I - 1:I, j:J, k:K] * cos_sg1[I - 1:I, j:J])), ke[I - 1:I, j:J, k:K])
+        ke[i + 1:i + 2, j:J, k:K] = np.where((ua[i + 1:i + 2, j:J, k:K] > np.float64(0.0)), ((ke[i + 1:i + 2, j:J, k:K] * sin_sg1[i + 1:i + 2, j:J]) + (v[i + 1:i + 2, j:J, k:K] * cos_sg1[i + 1:i + 2, j:J])), ke[i + 1:i + 2, j:J, k:K])
+        ke[i:I, j:J, k:K] = ((np.float64(0.5) * dt2) * ((ua[i:I, j:J, k:K] * ke[i:I, j:J, k:K]) + (va[i:I, j:J, k:K] * vort[i:I, j:J, k:K])))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,169 @@
+
+
+import pathlib
+import time
+
+import numpy as np
+from numpy import dtype
+from gt4py.cartesian.stencil_object import StencilObject
+import pathlib
+from gt4py.cartesian.utils import make_module_from_file
+computation = make_module_from_file("m_computation__numpy_f0ca8ac8bc", pathlib.Path(__file__).parent / "m_computation__numpy_f0ca8ac8bc.py")
+
+from gt4py.cartesian.definitions import AccessKind, Boundary, CartesianSpace
+from gt4py.cartesian.stencil_object import DomainInfo, FieldInfo, ParameterInfo
+
+
+
+class transportdelp_update_vorticity_and_kineticenergy____numpy_f0ca8ac8bc(StencilObject):
+    """
+    Transport delp then update vorticity and kinetic energy
+
+steps delpc, ptc, wc.
+Diagnostically computes ke, vorticity for the start of the timestep
+
+Args:
+    delp (in): what is transported
+    pt (in): pressure
+    utc (???): x-velocity on C-grid
+    vtc (in): y-velocity on C-grid
+    w (in): z-velocity on C-grid
+    rarea (in): inverse gridcell area
+    delpc (out): updated delp
+    ptc (out): updated pt
+    wc (out): updated w
+    ke (out): kinetic energy, computed with an upstream bias to avoid an instability
+    vort (out): vorticity
+    ua (in): u wind on A-grid
+    va (in): v wind on A-grid
+    uc (in): u wind on C-grid
+    vc (in): v wind on C-grid
+    u (in): u wind on D-grid
+    v (in): v wind on D-grid
+    fx (in):
+    fx1 (in):
+    fx2 (in):
+    sin_sg1 (in):
+    cos_sg1 (in):
+    sin_sg2 (in):
+    cos_sg2 (in):
+    sin_sg3 (in):
+    cos_sg3 (in):
+    sin_sg4 (in):
+    cos_sg4 (in):
+    dt2 (in): length of half a timestep
+
+    The callable interface is the same of the stencil definition function,
+    with some extra keyword arguments. Check :class:`gt4py.StencilObject`
+    for the full specification.
+    """
+
+    _gt_backend_ = "numpy"
+
+    _gt_source_ = {}
+
+    _gt_domain_info_ = DomainInfo(parallel_axes=('I', 'J'), sequential_axis='K', min_sequential_axis_size=0, ndim=3)
+
+    _gt_field_info_ = {'delp': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (1, 1), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'pt': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (1, 1), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'utc': FieldInfo(access=AccessKind.NONE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'vtc': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 1), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'w': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (1, 1), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'rarea': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'delpc': FieldInfo(access=AccessKind.WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'ptc': FieldInfo(access=AccessKind.WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'wc': FieldInfo(access=AccessKind.WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'ke': FieldInfo(access=AccessKind.WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'vort': FieldInfo(access=AccessKind.WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'ua': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'va': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'uc': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 1), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'vc': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 1), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'u': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'v': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'fx': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 1), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'fx1': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 1), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'fx2': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 1), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'sin_sg1': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'cos_sg1': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'sin_sg2': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'cos_sg2': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'sin_sg3': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'cos_sg3': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'sin_sg4': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'cos_sg4': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64'))}
+
+    _gt_parameter_info_ = {'dt2': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64'))}
+
+    _gt_constants_ = {}
+
+    _gt_options_ = {'name': 'transportdelp_update_vorticity_and_kineticenergy', 'module': 'pace.fv3core.stencils.c_sw', 'format_source': False, 'backend_opts': {}, 'rebuild': False, 'raise_if_not_cached': False, 'cache_settings': {}, '_impl_opts': {}}
+
+    @property
+    def backend(self):
+        return type(self)._gt_backend_
+
+    @property
+    def source(self):
+        return type(self)._gt_source_
+
+    @property
+    def domain_info(self):
+        return type(self)._gt_domain_info_
+
+    @property
+    def field_info(self) -> dict:
+        return type(self)._gt_field_info_
+
+    @property
+    def parameter_info(self) -> dict:
+        return type(self)._gt_parameter_info_
+
+    @property
+    def constants(self) -> dict:
+        return type(self)._gt_constants_
+
+    @property
+    def options(self) -> dict:
+        return type(self)._gt_options_
+
+    def __call__(
+        self, delp, pt, utc, vtc, w, rarea, delpc, ptc, wc, ke, vort, ua, va, uc, vc, u, v, fx, fx1, fx2, sin_sg1, cos_sg1, sin_sg2, cos_sg2, sin_sg3, cos_sg3, sin_sg4, cos_sg4, dt2, domain=None, origin=None, validate_args=True, exec_info=None
+    ):
+        if exec_info is not None:
+            exec_info["call_start_time"] = time.perf_counter()
+
+        field_args=dict( vc=vc,  wc=wc,  uc=uc,  v=v,  delpc=delpc,  ke=ke,  rarea=rarea,  w=w,  utc=utc,  vort=vort,  u=u,  fx=fx,  fx1=fx1,  delp=delp,  cos_sg3=cos_sg3,  cos_sg2=cos_sg2,  fx2=fx2,  cos_sg4=cos_sg4,  ua=ua,  sin_sg3=sin_sg3,  ptc=ptc,  cos_sg1=cos_sg1,  sin_sg4=sin_sg4,  sin_sg1=sin_sg1,  va=va,  sin_sg2=sin_sg2,  pt=pt,  vtc=vtc)
+        parameter_args=dict( dt2=dt2)
+        # assert that all required values have been provided
+
+
+        self._call_run(
+            field_args=field_args,
+            parameter_args=parameter_args,
+            domain=domain,
+            origin=origin,
+            validate_args=validate_args,
+            exec_info=exec_info,
+        )
+
+
+        if exec_info is not None:
+            exec_info["call_end_time"] = time.perf_counter()
+
+            if exec_info.setdefault("__aggregate_data", False):
+                stencil_info = exec_info.setdefault("transportdelp_update_vorticity_and_kineticenergy____numpy_f0ca8ac8bc", {})
+
+                # Update performance counters
+                stencil_info["call_start_time"] = exec_info["call_start_time"]
+                stencil_info["call_end_time"] = exec_info["call_end_time"]
+                stencil_info["call_time"] = (
+                    stencil_info["call_end_time"]
+                    - stencil_info["call_start_time"]
+                )
+                stencil_info["total_call_time"] = (
+                    stencil_info.get("total_call_time", 0.0)
+                    + stencil_info["call_time"]
+                )
+                stencil_info["ncalls"] = (
+                    stencil_info.get("ncalls", 0) + 1
+                )
+                stencil_info["run_time"] = (
+                    exec_info["run_end_time"]
+                    - exec_info["run_start_time"]
+                )
+                stencil_info["total_run_time"] = (
+                    stencil_info.get("total_run_time", 0.0)
+                    + stencil_info["run_time"]
+                )
+                if "run_cpp_start_time" in exec_info:
+                    stencil_info["run_cpp_time"] = (
+                        exec_info["run_cpp_end_time"]
+                        - exec_info["run_cpp_start_time"]
+                    )
+                    stencil_info["total_run_cpp_time"] = (
+                        stencil_info.get("total_run_cpp_time", 0.0)
+                        + stencil_info["run_cpp_time"]
+                    )
+
+    def run(self, _domain_, _origin_, exec_info, *,vc, wc, uc, v, delpc, ke, rarea, w, utc, vort, u, fx, fx1, delp, cos_sg3, cos_sg2, fx2, cos_sg4, ua, sin_sg3, ptc, cos_sg1, sin_sg4, sin_sg1, va, sin_sg2, pt, vtc,dt2):
+        if exec_info is not None:
+            exec_info["domain"] = _domain_
+            exec_info["origin"] = _origin_
+            exec_info["run_start_time"] = time.perf_counter()
+        computation.run(delp=delp, pt=pt, vtc=vtc, w=w, rarea=rarea, delpc=delpc, ptc=ptc, wc=wc, ke=ke, vort=vort, ua=ua, va=va, uc=uc, vc=vc, u=u, v=v, fx=fx, fx1=fx1, fx2=fx2, sin_sg1=sin_sg1, cos_sg1=cos_sg1, sin_sg2=sin_sg2, cos_sg2=cos_sg2, sin_sg3=sin_sg3, cos_sg3=cos_sg3, sin_sg4=sin_sg4, cos_sg4=cos_sg4, dt2=dt2, _domain_=_domain_, _origin_=_origin_)
+        if exec_info is not None:
+            exec_info["run_end_time"] = time.perf_counter()
\ No newline at end of file
@@ -0,0 +1,128 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, ua, uc, utc, utmp, v, sin_sg1, sin_sg3, cosa_u, rsin_u, dxa, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    ua = Field(ua, _origin_['ua'], (True, True, True))
+    uc = Field(uc, _origin_['uc'], (True, True, True))
+    utc = Field(utc, _origin_['utc'], (True, True, True))
+    utmp = Field(utmp, _origin_['utmp'], (True, True, True))
+    v = Field(v, _origin_['v'], (True, True, True))
+    sin_sg1 = Field(sin_sg1, _origin_['sin_sg1'], (True, True, False))
+    sin_sg3 = Field(sin_sg3, _origin_['sin_sg3'], (True, True, False))
+    cosa_u = Field(cosa_u, _origin_['cosa_u'], (True, True, False))
+    rsin_u = Field(rsin_u, _origin_['rsin_u'], (True, True, False))
+    dxa = Field(dxa, _origin_['dxa'], (True, True, False))
+    
+    t2__55f_39_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    n1__55f_39_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t1__55f_39_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t2__55f_22_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    n2__55f_22_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    n1__55f_22_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t1__55f_22_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    n2__55f_39_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        uc[i + 2:i + 3, j + 2:J - 2, k:K] = (((np.float64(-0.14285714285714285) * utmp[i:i + 1, j + 2:J - 2, k:K]) + (np.float64(0.7857142857142857) * utmp[i + 1:i + 2, j + 2:J - 2, k:K])) + (np.float64(0.35714285714285715) * utmp[i + 2:i + 3, j + 2:J - 2, k:K]))
+        t1__55f_22_18_gen_0[i + 3:i + 4, j + 2:J - 2, k:K] = (dxa[i + 1:i + 2, j + 2:J - 2] + dxa[i + 2:i + 3, j + 2:J - 2])
+        t2__55f_22_18_gen_0[i + 3:i + 4, j + 2:J - 2, k:K] = (dxa[i + 3:i + 4, j + 2:J - 2] + dxa[i + 4:i + 5, j + 2:J - 2])
+        n1__55f_22_18_gen_0[i + 3:i + 4, j + 2:J - 2, k:K] = (((t1__55f_22_18_gen_0[i + 3:i + 4, j + 2:J - 2, k:K] + dxa[i + 2:i + 3, j + 2:J - 2]) * ua[i + 2:i + 3, j + 2:J - 2, k:K]) - (dxa[i + 2:i + 3, j + 2:J - 2] * ua[i + 1:i + 2, j + 2:J - 2, k:K]))
+        n2__55f_22_18_gen_0[i + 3:i + 4, j + 2:J - 2, k:K] = (((t1__55f_22_18_gen_0[i + 3:i + 4, j + 2:J - 2, k:K] + dxa[i + 3:i + 4, j + 2:J - 2]) * ua[i + 3:i + 4, j + 2:J - 2, k:K]) - (dxa[i + 3:i + 4, j + 2:J - 2] * ua[i + 4:i + 5, j + 2:J - 2, k:K]))
+        utc[i + 3:i + 4, j + 2:J - 2, k:K] = (np.float64(0.5) * ((n1__55f_22_18_gen_0[i + 3:i + 4, j + 2:J - 2, k:K] / t1__55f_22_18_gen_0[i + 3:i + 4, j + 2:J - 2, k:K]) + (n2__55f_22_18_gen_0[i + 3:i + 4, j + 2:J - 2, k:K] / t2__55f_22_18_gen_0[i + 3:i + 4, j + 2:J - 2, k:K])))
+        uc[i + 3:i + 4, j + 2:J - 2, k:K] = np.where((utc[i + 3:i + 4, j + 2:J - 2, k:K] > np.float64(np.int64(0))), (utc[i + 3:i + 4, j + 2:J - 2, k:K] * sin_sg3[i + 2:i + 3, j + 2:J - 2]), (utc[i + 3:i + 4, j + 2:J - 2, k:K] * sin_sg1[i + 3:i + 4, j + 2:J - 2]))
+        uc[i + 4:i + 5, j + 2:J - 2, k:K] = (((np.float64(-0.14285714285714285) * utmp[i + 5:i + 6, j + 2:J - 2, k:K]) + (np.float64(0.7857142857142857) * utmp[i + 4:i + 5, j + 2:J - 2, k:K])) + (np.float64(0.35714285714285715) * utmp[i + 3:i + 4, j + 2:J - 2, k:K]))
+        utc[i + 2:i + 3, j + 2:J - 2, k:K] = ((uc[i + 2:i + 3, j + 2:J - 2, k:K] - (v[i + 2:i + 3, j + 2:J - 2, k:K] * cosa_u[i + 2:i + 3, j + 2:J - 2])) * rsin_u[i + 2:i + 3, j + 2:J - 2])
+        utc[i + 4:i + 5, j + 2:J - 2, k:K] = ((uc[i + 4:i + 5, j + 2:J - 2, k:K] - (v[i + 4:i + 5, j + 2:J - 2, k:K] * cosa_u[i + 4:i + 5, j + 2:J - 2])) * rsin_u[i + 4:i + 5, j + 2:J - 2])
+        uc[I - 4:I - 3, j + 2:J - 2, k:K] = (((np.float64(-0.14285714285714285) * utmp[I - 6:I - 5, j + 2:J - 2, k:K]) + (np.float64(0.7857142857142857) * utmp[I - 5:I - 4, j + 2:J - 2, k:K])) + (np.float64(0.35714285714285715) * utmp[I - 4:I - 3, j + 2:J - 2, k:K]))
+        t1__55f_39_18_gen_0[I - 3:I - 2, j + 2:J - 2, k:K] = (dxa[I - 5:I - 4, j + 2:J - 2] + dxa[I - 4:I - 3, j + 2:J - 2])
+        t2__55f_39_18_gen_0[I - 3:I - 2, j + 2:J - 2, k:K] = (dxa[I - 3:I - 2, j + 2:J - 2] + dxa[I - 2:I - 1, j + 2:J - 2])
+        n1__55f_39_18_gen_0[I - 3:I - 2, j + 2:J - 2, k:K] = (((t1__55f_39_18_gen_0[I - 3:I - 2, j + 2:J - 2, k:K] + dxa[I - 4:I - 3, j + 2:J - 2]) * ua[I - 4:I - 3, j + 2:J - 2, k:K]) - (dxa[I - 4:I - 3, j + 2:J - 2] * ua[I - 5:I - 4, j + 2:J - 2, k:K]))
+        n2__55f_39_18_gen_0[I - 3:I - 2, j + 2:J - 2, k:K] = (((t1__55f_39_18_gen_0[I - 3:I - 2, j + 2:J - 2, k:K] + dxa[I - 3:I - 2, j + 2:J - 2]) * ua[I - 3:I - 2, j + 2:J - 2, k:K]) - (dxa[I - 3:I - 2, j + 2:J - 2] * ua[I - 2:I - 1, j + 2:J - 2, k:K]))
+        utc[I - 3:I - 2, j + 2:J - 2, k:K] = (np.float64(0.5) * ((n1__55f_39_18_gen_0[I - 3:I - 2, j + 2:J - 2, k:K] / t1__55f_39_18_gen_0[I - 3:I - 2, j + 2:J - 2, k:K]) + (n2__55f_39_18_gen_0[I - 3:I - 2, j + 2:J - 2, k:K] / t2__55f_39_18_gen_0[I - 3:I - 2, j + 2:J - 2, k:K])))
+        uc[I - 3:I - 2, j + 2:J - 2, k:K] = np.where((utc[I - 3:I - 2, j + 2:J - 2, k:K] > np.float64(np.int64(0))), (utc[I - 3:I - 2, j + 2:J - 2, k:K] * sin_sg3[I - 4:I - 3, j + 2:J - 2]), (utc[I - 3:I - 2, j + 2:J - 2, k:K] * sin_sg1[I - 3:I - 2, j + 2:J - 2]))
+        uc[I - 2:I - 1, j + 2:J - 2, k:K] = (((np.float64(-0.14285714285714285) * utmp[I - 1:I, j + 2:J - 2, k:K]) + (np.float64(0.7857142857142857) * utmp[I - 2:I - 1, j + 2:J - 2, k:K])) + (np.float64(0.35714285714285715) * utmp[I - 3:I - 2, j + 2:J - 2, k:K]))
+        utc[I - 4:I - 3, j + 2:J - 2, k:K] = ((uc[I - 4:I - 3, j + 2:J - 2, k:K] - (v[I - 4:I - 3, j + 2:J - 2, k:K] * cosa_u[I - 4:I - 3, j + 2:J - 2])) * rsin_u[I - 4:I - 3, j + 2:J - 2])
+        utc[I - 2:I - 1, j + 2:J - 2, k:K] = ((uc[I - 2:I - 1, j + 2:J - 2, k:K] - (v[I - 2:I - 1, j + 2:J - 2, k:K] * cosa_u[I - 2:I - 1, j + 2:J - 2])) * rsin_u[I - 2:I - 1, j + 2:J - 2])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
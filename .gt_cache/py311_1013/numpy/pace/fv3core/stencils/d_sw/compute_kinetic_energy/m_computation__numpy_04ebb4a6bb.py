@@ -0,0 +1,310 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, vc, uc, cosa, rsina, v, vc_contra, u, uc_contra, dx, rdx, dy, rdy, dt_kinetic_energy_on_cell_corners, dt, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    vc = Field(vc, _origin_['vc'], (True, True, True))
+    uc = Field(uc, _origin_['uc'], (True, True, True))
+    cosa = Field(cosa, _origin_['cosa'], (True, True, False))
+    rsina = Field(rsina, _origin_['rsina'], (True, True, False))
+    v = Field(v, _origin_['v'], (True, True, True))
+    vc_contra = Field(vc_contra, _origin_['vc_contra'], (True, True, True))
+    u = Field(u, _origin_['u'], (True, True, True))
+    uc_contra = Field(uc_contra, _origin_['uc_contra'], (True, True, True))
+    dx = Field(dx, _origin_['dx'], (True, True, False))
+    rdx = Field(rdx, _origin_['rdx'], (True, True, False))
+    dy = Field(dy, _origin_['dy'], (True, True, False))
+    rdy = Field(rdy, _origin_['rdy'], (True, True, False))
+    dt_kinetic_energy_on_cell_corners = Field(dt_kinetic_energy_on_cell_corners, _origin_['dt_kinetic_energy_on_cell_corners'], (True, True, True))
+    
+    ub_contra = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vb_contra = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    v_on_cell_corners__edd_31_13__af5_43_21 = Field.empty((_dI_ + 0, _dJ_ + 2, _dK_), np.float64, (0, 1, 0))
+    bl__af5_43_21 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    br__af5_43_21 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    b0__af5_43_21 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    u_on_cell_corners__edd_31_13__96f_44_21 = Field.empty((_dI_ + 2, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    bl__96f_44_21 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    br__96f_44_21 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    b0__96f_44_21 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    ub_contra__852_40_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vb_cov__852_40_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ub_cov__852_40_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vb_contra__852_40_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    al__936_16_28__edd_31_13__af5_43_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 2, _dK_), np.float64, (0, 1, 0))
+    br__edd_31_13__af5_43_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    bl__edd_31_13__af5_43_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    al__c1c_16_28__edd_31_13__96f_44_21_gen_0 = Field.empty((_dI_ + 2, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    bl__edd_31_13__96f_44_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    br__edd_31_13__96f_44_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    cfl__af5_43_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013245083152_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    fx0__af5_43_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ret__992_34_10__af5_43_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    smt5__10c_37_25__af5_43_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    smt5__10c_37_25__af5_43_21_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    advection_mask__10c_37_25__af5_43_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    advected_v_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__b10_40_11__af5_43_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    advection_mask__af5_43_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013251568912_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    ret__18c_34_10__96f_44_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cfl__96f_44_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fx0__96f_44_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013232144144_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    smt5__0ec_37_25__96f_44_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    smt5__0ec_37_25__96f_44_21_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dt6__642_7_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013234357456_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    io2__642_11_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    io1__642_7_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    jo1__642_9_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    jo1__642_7_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    RETURN_VALUE__bf0_40_11__96f_44_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    io1__642_11_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    advection_mask__0ec_37_25__96f_44_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vsign__642_11_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    jo1__642_13_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    io1__642_9_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    io2__642_9_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    advection_mask__96f_44_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    io2__642_7_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    io1__642_13_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    io2__642_13_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    vsign__642_7_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    dt6__642_9_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dt6__642_11_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ke__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    jo1__642_11_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    vsign__642_9_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    dt6__642_13_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vsign__642_13_13__0f7_51_44_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    advected_u_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        ub_cov__852_40_31_gen_0[i:I, j:J, k:K] = (np.float64(0.5) * (uc[i:I, j - 1:J - 1, k:K] + uc[i:I, j:J, k:K]))
+        vb_cov__852_40_31_gen_0[i:I, j:J, k:K] = (np.float64(0.5) * (vc[i - 1:I - 1, j:J, k:K] + vc[i:I, j:J, k:K]))
+        ub_contra__852_40_31_gen_0[i:I, j:J, k:K] = ((ub_cov__852_40_31_gen_0[i:I, j:J, k:K] - (vb_cov__852_40_31_gen_0[i:I, j:J, k:K] * cosa[i:I, j:J])) * rsina[i:I, j:J])
+        vb_contra__852_40_31_gen_0[i:I, j:J, k:K] = ((vb_cov__852_40_31_gen_0[i:I, j:J, k:K] - (ub_cov__852_40_31_gen_0[i:I, j:J, k:K] * cosa[i:I, j:J])) * rsina[i:I, j:J])
+        ub_contra__852_40_31_gen_0[i:I, j:j + 1, k:K] = (np.float64(0.25) * (((-(uc_contra[i:I, j - 2:j - 1, k:K])) + (np.float64(3.0) * (uc_contra[i:I, j - 1:j, k:K] + uc_contra[i:I, j:j + 1, k:K]))) - uc_contra[i:I, j + 1:j + 2, k:K]))
+        ub_contra__852_40_31_gen_0[i:I, J - 1:J, k:K] = (np.float64(0.25) * (((-(uc_contra[i:I, J - 3:J - 2, k:K])) + (np.float64(3.0) * (uc_contra[i:I, J - 2:J - 1, k:K] + uc_contra[i:I, J - 1:J, k:K]))) - uc_contra[i:I, J:J + 1, k:K]))
+        ub_contra__852_40_31_gen_0[i:i + 1, j:J, k:K] = (np.float64(0.5) * (uc_contra[i:i + 1, j - 1:J - 1, k:K] + uc_contra[i:i + 1, j:J, k:K]))
+        ub_contra__852_40_31_gen_0[I - 1:I, j:J, k:K] = (np.float64(0.5) * (uc_contra[I - 1:I, j - 1:J - 1, k:K] + uc_contra[I - 1:I, j:J, k:K]))
+        vb_contra__852_40_31_gen_0[i:i + 1, j:J, k:K] = (np.float64(0.25) * (((-(vc_contra[i - 2:i - 1, j:J, k:K])) + (np.float64(3.0) * (vc_contra[i - 1:i, j:J, k:K] + vc_contra[i:i + 1, j:J, k:K]))) - vc_contra[i + 1:i + 2, j:J, k:K]))
+        vb_contra__852_40_31_gen_0[I - 1:I, j:J, k:K] = (np.float64(0.25) * (((-(vc_contra[I - 3:I - 2, j:J, k:K])) + (np.float64(3.0) * (vc_contra[I - 2:I - 1, j:J, k:K] + vc_contra[I - 1:I, j:J, k:K]))) - vc_contra[I:I + 1, j:J, k:K]))
+        vb_contra__852_40_31_gen_0[i:I, j:j + 1, k:K] = (np.float64(0.5) * (vc_contra[i - 1:I - 1, j:j + 1, k:K] + vc_contra[i:I, j:j + 1, k:K]))
+        vb_contra__852_40_31_gen_0[i:I, J - 1:J, k:K] = (np.float64(0.5) * (vc_contra[i - 1:I - 1, J - 1:J, k:K] + vc_contra[i:I, J - 1:J, k:K]))
+        ub_contra[i:I, j:J, k:K] = ub_contra__852_40_31_gen_0[i:I, j:J, k:K]
+        vb_contra[i:I, j:J, k:K] = vb_contra__852_40_31_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 1, _dJ_ + 1
+
+        al__936_16_28__edd_31_13__af5_43_21_gen_0[i:I, j:J, k:K] = ((np.float64(0.5833333333333334) * (v[i:I, j - 1:J - 1, k:K] + v[i:I, j:J, k:K])) + (np.float64(-0.08333333333333333) * (v[i:I, j - 2:J - 2, k:K] + v[i:I, j + 1:J + 1, k:K])))
+        al__936_16_28__edd_31_13__af5_43_21_gen_0[i:I, j:j + 1, k:K] = (((np.float64(-0.14285714285714285) * v[i:I, j - 2:j - 1, k:K]) + (np.float64(0.7857142857142857) * v[i:I, j - 1:j, k:K])) + (np.float64(0.35714285714285715) * v[i:I, j:j + 1, k:K]))
+        al__936_16_28__edd_31_13__af5_43_21_gen_0[i:I, J - 3:J - 2, k:K] = (((np.float64(-0.14285714285714285) * v[i:I, J - 5:J - 4, k:K]) + (np.float64(0.7857142857142857) * v[i:I, J - 4:J - 3, k:K])) + (np.float64(0.35714285714285715) * v[i:I, J - 3:J - 2, k:K]))
+        al__936_16_28__edd_31_13__af5_43_21_gen_0[i:I, j + 1:j + 2, k:K] = (np.float64(0.5) * ((((((np.float64(2.0) * dy[i:I, j:j + 1]) + dy[i:I, j - 1:j]) * v[i:I, j:j + 1, k:K]) - (dy[i:I, j:j + 1] * v[i:I, j - 1:j, k:K])) / (dy[i:I, j - 1:j] + dy[i:I, j:j + 1])) + (((((np.float64(2.0) * dy[i:I, j + 1:j + 2]) + dy[i:I, j + 2:j + 3]) * v[i:I, j + 1:j + 2, k:K]) - (dy[i:I, j + 1:j + 2] * v[i:I, j + 2:j + 3, k:K])) / (dy[i:I, j + 1:j + 2] + dy[i:I, j + 2:j + 3]))))
+        al__936_16_28__edd_31_13__af5_43_21_gen_0[i:I, J - 2:J - 1, k:K] = (np.float64(0.5) * ((((((np.float64(2.0) * dy[i:I, J - 3:J - 2]) + dy[i:I, J - 4:J - 3]) * v[i:I, J - 3:J - 2, k:K]) - (dy[i:I, J - 3:J - 2] * v[i:I, J - 4:J - 3, k:K])) / (dy[i:I, J - 4:J - 3] + dy[i:I, J - 3:J - 2])) + (((((np.float64(2.0) * dy[i:I, J - 2:J - 1]) + dy[i:I, J - 1:J]) * v[i:I, J - 2:J - 1, k:K]) - (dy[i:I, J - 2:J - 1] * v[i:I, J - 1:J, k:K])) / (dy[i:I, J - 2:J - 1] + dy[i:I, J - 1:J]))))
+        al__936_16_28__edd_31_13__af5_43_21_gen_0[i:I, j + 2:j + 3, k:K] = (((np.float64(0.35714285714285715) * v[i:I, j + 1:j + 2, k:K]) + (np.float64(0.7857142857142857) * v[i:I, j + 2:j + 3, k:K])) + (np.float64(-0.14285714285714285) * v[i:I, j + 3:j + 4, k:K]))
+        al__936_16_28__edd_31_13__af5_43_21_gen_0[i:I, J - 1:J, k:K] = (((np.float64(0.35714285714285715) * v[i:I, J - 2:J - 1, k:K]) + (np.float64(0.7857142857142857) * v[i:I, J - 1:J, k:K])) + (np.float64(-0.14285714285714285) * v[i:I, J:J + 1, k:K]))
+        v_on_cell_corners__edd_31_13__af5_43_21[i:I, j:J, k:K] = al__936_16_28__edd_31_13__af5_43_21_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 1, _dJ_ + 0
+
+        bl__edd_31_13__af5_43_21_gen_0[i:I, j:J, k:K] = (v_on_cell_corners__edd_31_13__af5_43_21[i:I, j:J, k:K] - v[i:I, j:J, k:K])
+        br__edd_31_13__af5_43_21_gen_0[i:I, j:J, k:K] = (v_on_cell_corners__edd_31_13__af5_43_21[i:I, j + 1:J + 1, k:K] - v[i:I, j:J, k:K])
+        bl__edd_31_13__af5_43_21_gen_0[i:i + 1, j:j + 2, k:K] = np.float64(0.0)
+        br__edd_31_13__af5_43_21_gen_0[i:i + 1, j:j + 2, k:K] = np.float64(0.0)
+        bl__edd_31_13__af5_43_21_gen_0[I - 1:I, j:j + 2, k:K] = np.float64(0.0)
+        br__edd_31_13__af5_43_21_gen_0[I - 1:I, j:j + 2, k:K] = np.float64(0.0)
+        bl__edd_31_13__af5_43_21_gen_0[i:i + 1, J - 2:J, k:K] = np.float64(0.0)
+        br__edd_31_13__af5_43_21_gen_0[i:i + 1, J - 2:J, k:K] = np.float64(0.0)
+        bl__edd_31_13__af5_43_21_gen_0[I - 1:I, J - 2:J, k:K] = np.float64(0.0)
+        br__edd_31_13__af5_43_21_gen_0[I - 1:I, J - 2:J, k:K] = np.float64(0.0)
+        bl__af5_43_21[i:I, j:J, k:K] = bl__edd_31_13__af5_43_21_gen_0[i:I, j:J, k:K]
+        br__af5_43_21[i:I, j:J, k:K] = br__edd_31_13__af5_43_21_gen_0[i:I, j:J, k:K]
+        b0__af5_43_21[i:I, j:J, k:K] = (bl__af5_43_21[i:I, j:J, k:K] + br__af5_43_21[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+
+        # --- begin horizontal block --
+        i, I = _di_ - 1, _dI_ + 1
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        al__c1c_16_28__edd_31_13__96f_44_21_gen_0[i:I, j:J, k:K] = ((np.float64(0.5833333333333334) * (u[i - 1:I - 1, j:J, k:K] + u[i:I, j:J, k:K])) + (np.float64(-0.08333333333333333) * (u[i - 2:I - 2, j:J, k:K] + u[i + 1:I + 1, j:J, k:K])))
+        al__c1c_16_28__edd_31_13__96f_44_21_gen_0[i:i + 1, j:J, k:K] = (((np.float64(-0.14285714285714285) * u[i - 2:i - 1, j:J, k:K]) + (np.float64(0.7857142857142857) * u[i - 1:i, j:J, k:K])) + (np.float64(0.35714285714285715) * u[i:i + 1, j:J, k:K]))
+        al__c1c_16_28__edd_31_13__96f_44_21_gen_0[I - 3:I - 2, j:J, k:K] = (((np.float64(-0.14285714285714285) * u[I - 5:I - 4, j:J, k:K]) + (np.float64(0.7857142857142857) * u[I - 4:I - 3, j:J, k:K])) + (np.float64(0.35714285714285715) * u[I - 3:I - 2, j:J, k:K]))
+        al__c1c_16_28__edd_31_13__96f_44_21_gen_0[i + 1:i + 2, j:J, k:K] = (np.float64(0.5) * ((((((np.float64(2.0) * dx[i:i + 1, j:J]) + dx[i - 1:i, j:J]) * u[i:i + 1, j:J, k:K]) - (dx[i:i + 1, j:J] * u[i - 1:i, j:J, k:K])) / (dx[i - 1:i, j:J] + dx[i:i + 1, j:J])) + (((((np.float64(2.0) * dx[i + 1:i + 2, j:J]) + dx[i + 2:i + 3, j:J]) * u[i + 1:i + 2, j:J, k:K]) - (dx[i + 1:i + 2, j:J] * u[i + 2:i + 3, j:J, k:K])) / (dx[i + 1:i + 2, j:J] + dx[i + 2:i + 3, j:J]))))
+        al__c1c_16_28__edd_31_13__96f_44_21_gen_0[I - 2:I - 1, j:J, k:K] = (np.float64(0.5) * ((((((np.float64(2.0) * dx[I - 3:I - 2, j:J]) + dx[I - 4:I - 3, j:J]) * u[I - 3:I - 2, j:J, k:K]) - (dx[I - 3:I - 2, j:J] * u[I - 4:I - 3, j:J, k:K])) / (dx[I - 4:I - 3, j:J] + dx[I - 3:I - 2, j:J])) + (((((np.float64(2.0) * dx[I - 2:I - 1, j:J]) + dx[I - 1:I, j:J]) * u[I - 2:I - 1, j:J, k:K]) - (dx[I - 2:I - 1, j:J] * u[I - 1:I, j:J, k:K])) / (dx[I - 2:I - 1, j:J] + dx[I - 1:I, j:J]))))
+        al__c1c_16_28__edd_31_13__96f_44_21_gen_0[i + 2:i + 3, j:J, k:K] = (((np.float64(0.35714285714285715) * u[i + 1:i + 2, j:J, k:K]) + (np.float64(0.7857142857142857) * u[i + 2:i + 3, j:J, k:K])) + (np.float64(-0.14285714285714285) * u[i + 3:i + 4, j:J, k:K]))
+        al__c1c_16_28__edd_31_13__96f_44_21_gen_0[I - 1:I, j:J, k:K] = (((np.float64(0.35714285714285715) * u[I - 2:I - 1, j:J, k:K]) + (np.float64(0.7857142857142857) * u[I - 1:I, j:J, k:K])) + (np.float64(-0.14285714285714285) * u[I:I + 1, j:J, k:K]))
+        u_on_cell_corners__edd_31_13__96f_44_21[i:I, j:J, k:K] = al__c1c_16_28__edd_31_13__96f_44_21_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+
+        # --- begin horizontal block --
+        i, I = _di_ - 1, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        bl__edd_31_13__96f_44_21_gen_0[i:I, j:J, k:K] = (u_on_cell_corners__edd_31_13__96f_44_21[i:I, j:J, k:K] - u[i:I, j:J, k:K])
+        br__edd_31_13__96f_44_21_gen_0[i:I, j:J, k:K] = (u_on_cell_corners__edd_31_13__96f_44_21[i + 1:I + 1, j:J, k:K] - u[i:I, j:J, k:K])
+        bl__edd_31_13__96f_44_21_gen_0[i:i + 2, j:j + 1, k:K] = np.float64(0.0)
+        br__edd_31_13__96f_44_21_gen_0[i:i + 2, j:j + 1, k:K] = np.float64(0.0)
+        bl__edd_31_13__96f_44_21_gen_0[i:i + 2, J - 1:J, k:K] = np.float64(0.0)
+        br__edd_31_13__96f_44_21_gen_0[i:i + 2, J - 1:J, k:K] = np.float64(0.0)
+        bl__edd_31_13__96f_44_21_gen_0[I - 2:I, j:j + 1, k:K] = np.float64(0.0)
+        br__edd_31_13__96f_44_21_gen_0[I - 2:I, j:j + 1, k:K] = np.float64(0.0)
+        bl__edd_31_13__96f_44_21_gen_0[I - 2:I, J - 1:J, k:K] = np.float64(0.0)
+        br__edd_31_13__96f_44_21_gen_0[I - 2:I, J - 1:J, k:K] = np.float64(0.0)
+        bl__96f_44_21[i:I, j:J, k:K] = bl__edd_31_13__96f_44_21_gen_0[i:I, j:J, k:K]
+        br__96f_44_21[i:I, j:J, k:K] = br__edd_31_13__96f_44_21_gen_0[i:I, j:J, k:K]
+        b0__96f_44_21[i:I, j:J, k:K] = (bl__96f_44_21[i:I, j:J, k:K] + br__96f_44_21[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        smt5__0ec_37_25__96f_44_21_gen_1[i:I, j:J, k:K] = ((np.float64(3.0) * np.abs(b0__96f_44_21[i:I, j:J, k:K])) < np.abs((bl__96f_44_21[i:I, j:J, k:K] - br__96f_44_21[i:I, j:J, k:K])))
+        smt5__0ec_37_25__96f_44_21_gen_0[i:I, j:J, k:K] = ((np.float64(3.0) * np.abs(b0__96f_44_21[i - 1:I - 1, j:J, k:K])) < np.abs((bl__96f_44_21[i - 1:I - 1, j:J, k:K] - br__96f_44_21[i - 1:I - 1, j:J, k:K])))
+        cfl__96f_44_21_gen_0[i:I, j:J, k:K] = np.where((ub_contra[i:I, j:J, k:K] > np.float64(np.int64(0))), ((ub_contra[i:I, j:J, k:K] * dt) * rdx[i - 1:I - 1, j:J]), ((ub_contra[i:I, j:J, k:K] * dt) * rdx[i:I, j:J]))
+        mask_140013232144144_gen_0[i:I, j:J, k:K] = (cfl__96f_44_21_gen_0[i:I, j:J, k:K] > np.float64(0.0))
+        ret__18c_34_10__96f_44_21_gen_0[i:I, j:J, k:K] = np.where(mask_140013232144144_gen_0[i:I, j:J, k:K], ((np.float64(1.0) - cfl__96f_44_21_gen_0[i:I, j:J, k:K]) * (br__96f_44_21[i - 1:I - 1, j:J, k:K] - (cfl__96f_44_21_gen_0[i:I, j:J, k:K] * b0__96f_44_21[i - 1:I - 1, j:J, k:K]))), ret__18c_34_10__96f_44_21_gen_0[i:I, j:J, k:K])
+        ret__18c_34_10__96f_44_21_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013232144144_gen_0[i:I, j:J, k:K])), ((np.float64(1.0) + cfl__96f_44_21_gen_0[i:I, j:J, k:K]) * (bl__96f_44_21[i:I, j:J, k:K] + (cfl__96f_44_21_gen_0[i:I, j:J, k:K] * b0__96f_44_21[i:I, j:J, k:K]))), ret__18c_34_10__96f_44_21_gen_0[i:I, j:J, k:K])
+        fx0__96f_44_21_gen_0[i:I, j:J, k:K] = ret__18c_34_10__96f_44_21_gen_0[i:I, j:J, k:K]
+        smt5__10c_37_25__af5_43_21_gen_1[i:I, j:J, k:K] = ((np.float64(3.0) * np.abs(b0__af5_43_21[i:I, j - 1:J - 1, k:K])) < np.abs((bl__af5_43_21[i:I, j - 1:J - 1, k:K] - br__af5_43_21[i:I, j - 1:J - 1, k:K])))
+        smt5__10c_37_25__af5_43_21_gen_0[i:I, j:J, k:K] = ((np.float64(3.0) * np.abs(b0__af5_43_21[i:I, j:J, k:K])) < np.abs((bl__af5_43_21[i:I, j:J, k:K] - br__af5_43_21[i:I, j:J, k:K])))
+        cfl__af5_43_21_gen_0[i:I, j:J, k:K] = np.where((vb_contra[i:I, j:J, k:K] > np.float64(np.int64(0))), ((vb_contra[i:I, j:J, k:K] * dt) * rdy[i:I, j - 1:J - 1]), ((vb_contra[i:I, j:J, k:K] * dt) * rdy[i:I, j:J]))
+        mask_140013245083152_gen_0[i:I, j:J, k:K] = (cfl__af5_43_21_gen_0[i:I, j:J, k:K] > np.float64(0.0))
+        ret__992_34_10__af5_43_21_gen_0[i:I, j:J, k:K] = np.where(mask_140013245083152_gen_0[i:I, j:J, k:K], ((np.float64(1.0) - cfl__af5_43_21_gen_0[i:I, j:J, k:K]) * (br__af5_43_21[i:I, j - 1:J - 1, k:K] - (cfl__af5_43_21_gen_0[i:I, j:J, k:K] * b0__af5_43_21[i:I, j - 1:J - 1, k:K]))), ret__992_34_10__af5_43_21_gen_0[i:I, j:J, k:K])
+        ret__992_34_10__af5_43_21_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013245083152_gen_0[i:I, j:J, k:K])), ((np.float64(1.0) + cfl__af5_43_21_gen_0[i:I, j:J, k:K]) * (bl__af5_43_21[i:I, j:J, k:K] + (cfl__af5_43_21_gen_0[i:I, j:J, k:K] * b0__af5_43_21[i:I, j:J, k:K]))), ret__992_34_10__af5_43_21_gen_0[i:I, j:J, k:K])
+        fx0__af5_43_21_gen_0[i:I, j:J, k:K] = ret__992_34_10__af5_43_21_gen_0[i:I, j:J, k:K]
+        mask_140013251568912_gen_0[i:I, j:J, k:K] = np.bitwise_or(smt5__10c_37_25__af5_43_21_gen_1[i:I, j:J, k:K], smt5__10c_37_25__af5_43_21_gen_0[i:I, j:J, k:K])
+        advection_mask__10c_37_25__af5_43_21_gen_0[i:I, j:J, k:K] = np.where(mask_140013251568912_gen_0[i:I, j:J, k:K], np.float64(1.0), advection_mask__10c_37_25__af5_43_21_gen_0[i:I, j:J, k:K])
+        advection_mask__10c_37_25__af5_43_21_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013251568912_gen_0[i:I, j:J, k:K])), np.float64(0.0), advection_mask__10c_37_25__af5_43_21_gen_0[i:I, j:J, k:K])
+        advection_mask__af5_43_21_gen_0[i:I, j:J, k:K] = advection_mask__10c_37_25__af5_43_21_gen_0[i:I, j:J, k:K]
+        RETURN_VALUE__b10_40_11__af5_43_21_gen_0[i:I, j:J, k:K] = np.where((vb_contra[i:I, j:J, k:K] > np.float64(0.0)), (v[i:I, j - 1:J - 1, k:K] + (fx0__af5_43_21_gen_0[i:I, j:J, k:K] * advection_mask__af5_43_21_gen_0[i:I, j:J, k:K])), (v[i:I, j:J, k:K] + (fx0__af5_43_21_gen_0[i:I, j:J, k:K] * advection_mask__af5_43_21_gen_0[i:I, j:J, k:K])))
+        advected_v_gen_0[i:I, j:J, k:K] = RETURN_VALUE__b10_40_11__af5_43_21_gen_0[i:I, j:J, k:K]
+        mask_140013234357456_gen_0[i:I, j:J, k:K] = np.bitwise_or(smt5__0ec_37_25__96f_44_21_gen_0[i:I, j:J, k:K], smt5__0ec_37_25__96f_44_21_gen_1[i:I, j:J, k:K])
+        advection_mask__0ec_37_25__96f_44_21_gen_0[i:I, j:J, k:K] = np.where(mask_140013234357456_gen_0[i:I, j:J, k:K], np.float64(1.0), advection_mask__0ec_37_25__96f_44_21_gen_0[i:I, j:J, k:K])
+        advection_mask__0ec_37_25__96f_44_21_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013234357456_gen_0[i:I, j:J, k:K])), np.float64(0.0), advection_mask__0ec_37_25__96f_44_21_gen_0[i:I, j:J, k:K])
+        advection_mask__96f_44_21_gen_0[i:I, j:J, k:K] = advection_mask__0ec_37_25__96f_44_21_gen_0[i:I, j:J, k:K]
+        RETURN_VALUE__bf0_40_11__96f_44_21_gen_0[i:I, j:J, k:K] = np.where((ub_contra[i:I, j:J, k:K] > np.float64(0.0)), (u[i - 1:I - 1, j:J, k:K] + (fx0__96f_44_21_gen_0[i:I, j:J, k:K] * advection_mask__96f_44_21_gen_0[i:I, j:J, k:K])), (u[i:I, j:J, k:K] + (fx0__96f_44_21_gen_0[i:I, j:J, k:K] * advection_mask__96f_44_21_gen_0[i:I, j:J, k:K])))
+        advected_u_gen_0[i:I, j:J, k:K] = RETURN_VALUE__bf0_40_11__96f_44_21_gen_0[i:I, j:J, k:K]
+        dt_kinetic_energy_on_cell_corners[i:I, j:J, k:K] = ((np.float64(0.5) * dt) * ((ub_contra[i:I, j:J, k:K] * advected_u_gen_0[i:I, j:J, k:K]) + (vb_contra[i:I, j:J, k:K] * advected_v_gen_0[i:I, j:J, k:K])))
+        ke__0f7_51_44_gen_0[i:I, j:J, k:K] = dt_kinetic_energy_on_cell_corners[i:I, j:J, k:K]
+        io1__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K] = np.int64(0)
+        jo1__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K] = np.int64(0)
+        io2__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K] = (-(np.int64(1)))
+        vsign__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K] = np.int64(1)
+        dt6__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K] = (dt / np.float64(6.0))
+        ke__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K] = (dt6__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K] * ((((uc_contra[i:i + 1, j:j + 1, k:K] + uc_contra[i:i + 1, j - 1:j, k:K]) * (((io1__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K] + np.int64(1)).astype(np.float64) * u[i:i + 1, j:j + 1, k:K]) - (io1__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K].astype(np.float64) * u[i - 1:i, j:j + 1, k:K]))) + ((vc_contra[i:i + 1, j:j + 1, k:K] + vc_contra[i - 1:i, j:j + 1, k:K]) * (((jo1__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K] + np.int64(1)).astype(np.float64) * v[i:i + 1, j:j + 1, k:K]) - (jo1__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K].astype(np.float64) * v[i:i + 1, j - 1:j, k:K])))) + (((((jo1__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K] + np.int64(1)).astype(np.float64) * uc_contra[i:i + 1, j:j + 1, k:K]) - (jo1__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K].astype(np.float64) * uc_contra[i:i + 1, j - 1:j, k:K])) + (vsign__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K].astype(np.float64) * (((io1__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K] + np.int64(1)).astype(np.float64) * vc_contra[i:i + 1, j:j + 1, k:K]) - (io1__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K].astype(np.float64) * vc_contra[i - 1:i, j:j + 1, k:K])))) * (((io2__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K] + np.int64(1)).astype(np.float64) * u[i:i + 1, j:j + 1, k:K]) - (io2__642_7_13__0f7_51_44_gen_0[i:i + 1, j:j + 1, k:K].astype(np.float64) * u[i - 1:i, j:j + 1, k:K])))))
+        io1__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K] = (-(np.int64(1)))
+        jo1__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K] = np.int64(0)
+        io2__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K] = np.int64(0)
+        vsign__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K] = (-(np.int64(1)))
+        dt6__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K] = (dt / np.float64(6.0))
+        ke__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K] = (dt6__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K] * ((((uc_contra[I - 1:I, j:j + 1, k:K] + uc_contra[I - 1:I, j - 1:j, k:K]) * (((io1__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K] + np.int64(1)).astype(np.float64) * u[I - 1:I, j:j + 1, k:K]) - (io1__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K].astype(np.float64) * u[I - 2:I - 1, j:j + 1, k:K]))) + ((vc_contra[I - 1:I, j:j + 1, k:K] + vc_contra[I - 2:I - 1, j:j + 1, k:K]) * (((jo1__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K] + np.int64(1)).astype(np.float64) * v[I - 1:I, j:j + 1, k:K]) - (jo1__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K].astype(np.float64) * v[I - 1:I, j - 1:j, k:K])))) + (((((jo1__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K] + np.int64(1)).astype(np.float64) * uc_contra[I - 1:I, j:j + 1, k:K]) - (jo1__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K].astype(np.float64) * uc_contra[I - 1:I, j - 1:j, k:K])) + (vsign__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K].astype(np.float64) * (((io1__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K] + np.int64(1)).astype(np.float64) * vc_contra[I - 1:I, j:j + 1, k:K]) - (io1__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K].astype(np.float64) * vc_contra[I - 2:I - 1, j:j + 1, k:K])))) * (((io2__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K] + np.int64(1)).astype(np.float64) * u[I - 1:I, j:j + 1, k:K]) - (io2__642_9_13__0f7_51_44_gen_0[I - 1:I, j:j + 1, k:K].astype(np.float64) * u[I - 2:I - 1, j:j + 1, k:K])))))
+        io1__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K] = (-(np.int64(1)))
+        jo1__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K] = (-(np.int64(1)))
+        io2__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K] = np.int64(0)
+        vsign__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K] = np.int64(1)
+        dt6__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K] = (dt / np.float64(6.0))
+        ke__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K] = (dt6__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K] * ((((uc_contra[I - 1:I, J - 1:J, k:K] + uc_contra[I - 1:I, J - 2:J - 1, k:K]) * (((io1__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K] + np.int64(1)).astype(np.float64) * u[I - 1:I, J - 1:J, k:K]) - (io1__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K].astype(np.float64) * u[I - 2:I - 1, J - 1:J, k:K]))) + ((vc_contra[I - 1:I, J - 1:J, k:K] + vc_contra[I - 2:I - 1, J - 1:J, k:K]) * (((jo1__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K] + np.int64(1)).astype(np.float64) * v[I - 1:I, J - 1:J, k:K]) - (jo1__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K].astype(np.float64) * v[I - 1:I, J - 2:J - 1, k:K])))) + (((((jo1__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K] + np.int64(1)).astype(np.float64) * uc_contra[I - 1:I, J - 1:J, k:K]) - (jo1__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K].astype(np.float64) * uc_contra[I - 1:I, J - 2:J - 1, k:K])) + (vsign__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K].astype(np.float64) * (((io1__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K] + np.int64(1)).astype(np.float64) * vc_contra[I - 1:I, J - 1:J, k:K]) - (io1__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K].astype(np.float64) * vc_contra[I - 2:I - 1, J - 1:J, k:K])))) * (((io2__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K] + np.int64(1)).astype(np.float64) * u[I - 1:I, J - 1:J, k:K]) - (io2__642_11_13__0f7_51_44_gen_0[I - 1:I, J - 1:J, k:K].astype(np.float64) * u[I - 2:I - 1, J - 1:J, k:K])))))
+        io1__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K] = np.int64(0)
+        jo1__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K] = (-(np.int64(1)))
+        io2__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K] = (-(np.int64(1)))
+        vsign__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K] = (-(np.int64(1)))
+        dt6__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K] = (dt / np.float64(6.0))
+        ke__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K] = (dt6__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K] * ((((uc_contra[i:i + 1, J - 1:J, k:K] + uc_contra[i:i + 1, J - 2:J - 1, k:K]) * (((io1__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K] + np.int64(1)).astype(np.float64) * u[i:i + 1, J - 1:J, k:K]) - (io1__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K].astype(np.float64) * u[i - 1:i, J - 1:J, k:K]))) + ((vc_contra[i:i + 1, J - 1:J, k:K] + vc_contra[i - 1:i, J - 1:J, k:K]) * (((jo1__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K] + np.int64(1)).astype(np.float64) * v[i:i + 1, J - 1:J, k:K]) - (jo1__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K].astype(np.float64) * v[i:i + 1, J - 2:J - 1, k:K])))) + (((((jo1__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K] + np.int64(1)).astype(np.float64) * uc_contra[i:i + 1, J - 1:J, k:K]) - (jo1__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K].astype(np.float64) * uc_contra[i:i + 1, J - 2:J - 1, k:K])) + (vsign__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K].astype(np.float64) * (((io1__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K] + np.int64(1)).astype(np.float64) * vc_contra[i:i + 1, J - 1:J, k:K]) - (io1__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K].astype(np.float64) * vc_contra[i - 1:i, J - 1:J, k:K])))) * (((io2__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K] + np.int64(1)).astype(np.float64) * u[i:i + 1, J - 1:J, k:K]) - (io2__642_13_13__0f7_51_44_gen_0[i:i + 1, J - 1:J, k:K].astype(np.float64) * u[i - 1:i, J - 1:J, k:K])))))
+        dt_kinetic_energy_on_cell_corners[i:I, j:J, k:K] = ke__0f7_51_44_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,152 @@
+
+
+import pathlib
+import time
+
+import numpy as np
+from numpy import dtype
+from gt4py.cartesian.stencil_object import StencilObject
+import pathlib
+from gt4py.cartesian.utils import make_module_from_file
+computation = make_module_from_file("m_computation__numpy_04ebb4a6bb", pathlib.Path(__file__).parent / "m_computation__numpy_04ebb4a6bb.py")
+
+from gt4py.cartesian.definitions import AccessKind, Boundary, CartesianSpace
+from gt4py.cartesian.stencil_object import DomainInfo, FieldInfo, ParameterInfo
+
+
+
+class compute_kinetic_energy____numpy_04ebb4a6bb(StencilObject):
+    """
+    Args:
+    vc (in): y-wind on c-grid
+    uc (in): x-wind on c-grid
+    cosa (in):
+    rsina (in):
+    v (in): y-wind on d-grid
+    vc_contra (in): contravariant y-wind on c-grid
+    u (in): x-wind on d-grid
+    uc_contra (in): contravariant x-wind on c-grid
+    dx (in):
+    dxa (in):
+    rdx (in):
+    dy (in):
+    dya (in):
+    rdy (in):
+    dt_kinetic_energy_on_cell_corners (out): kinetic energy on cell corners,
+        as defined in FV3 documentation by equation 6.3, multiplied by dt
+    dt: timestep
+
+    The callable interface is the same of the stencil definition function,
+    with some extra keyword arguments. Check :class:`gt4py.StencilObject`
+    for the full specification.
+    """
+
+    _gt_backend_ = "numpy"
+
+    _gt_source_ = {}
+
+    _gt_domain_info_ = DomainInfo(parallel_axes=('I', 'J'), sequential_axis='K', min_sequential_axis_size=0, ndim=3)
+
+    _gt_field_info_ = {'vc': FieldInfo(access=AccessKind.READ, boundary=Boundary(((1, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'uc': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (1, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'cosa': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'rsina': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'v': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (3, 2), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'vc_contra': FieldInfo(access=AccessKind.READ, boundary=Boundary(((2, 1), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'u': FieldInfo(access=AccessKind.READ, boundary=Boundary(((3, 2), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'uc_contra': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (2, 1), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'dx': FieldInfo(access=AccessKind.READ, boundary=Boundary(((2, 1), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'dxa': FieldInfo(access=AccessKind.NONE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'rdx': FieldInfo(access=AccessKind.READ, boundary=Boundary(((1, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'dy': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (2, 1), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'dya': FieldInfo(access=AccessKind.NONE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'rdy': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (1, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'dt_kinetic_energy_on_cell_corners': FieldInfo(access=AccessKind.WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64'))}
+
+    _gt_parameter_info_ = {'dt': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64'))}
+
+    _gt_constants_ = {}
+
+    _gt_options_ = {'name': 'compute_kinetic_energy', 'module': 'pace.fv3core.stencils.d_sw', 'format_source': False, 'backend_opts': {}, 'rebuild': False, 'raise_if_not_cached': False, 'cache_settings': {}, '_impl_opts': {}}
+
+    @property
+    def backend(self):
+        return type(self)._gt_backend_
+
+    @property
+    def source(self):
+        return type(self)._gt_source_
+
+    @property
+    def domain_info(self):
+        return type(self)._gt_domain_info_
+
+    @property
+    def field_info(self) -> dict:
+        return type(self)._gt_field_info_
+
+    @property
+    def parameter_info(self) -> dict:
+        return type(self)._gt_parameter_info_
+
+    @property
+    def constants(self) -> dict:
+        return type(self)._gt_constants_
+
+    @property
+    def options(self) -> dict:
+        return type(self)._gt_options_
+
+    def __call__(
+        self, vc, uc, cosa, rsina, v, vc_contra, u, uc_contra, dx, dxa, rdx, dy, dya, rdy, dt_kinetic_energy_on_cell_corners, dt, domain=None, origin=None, validate_args=True, exec_info=None
+    ):
+        if exec_info is not None:
+            exec_info["call_start_time"] = time.perf_counter()
+
+        field_args=dict( rsina=rsina,  dx=dx,  rdy=rdy,  dxa=dxa,  dt_kinetic_energy_on_cell_corners=dt_kinetic_energy_on_cell_corners,  vc=vc,  dya=dya,  vc_contra=vc_contra,  rdx=rdx,  cosa=cosa,  u=u,  uc_contra=uc_contra,  dy=dy,  uc=uc,  v=v)
+        parameter_args=dict( dt=dt)
+        # assert that all required values have been provided
+
+
+        self._call_run(
+            field_args=field_args,
+            parameter_args=parameter_args,
+            domain=domain,
+            origin=origin,
+            validate_args=validate_args,
+            exec_info=exec_info,
+        )
+
+
+        if exec_info is not None:
+            exec_info["call_end_time"] = time.perf_counter()
+
+            if exec_info.setdefault("__aggregate_data", False):
+                stencil_info = exec_info.setdefault("compute_kinetic_energy____numpy_04ebb4a6bb", {})
+
+                # Update performance counters
+                stencil_info["call_start_time"] = exec_info["call_start_time"]
+                stencil_info["call_end_time"] = exec_info["call_end_time"]
+                stencil_info["call_time"] = (
+                    stencil_info["call_end_time"]
+                    - stencil_info["call_start_time"]
+                )
+                stencil_info["total_call_time"] = (
+                    stencil_info.get("total_call_time", 0.0)
+                    + stencil_info["call_time"]
+                )
+                stencil_info["ncalls"] = (
+                    stencil_info.get("ncalls", 0) + 1
+                )
+                stencil_info["run_time"] = (
+                    exec_info["run_end_time"]
+                    - exec_info["run_start_time"]
+                )
+                stencil_info["total_run_time"] = (
+                    stencil_info.get("total_run_time", 0.0)
+                    + stencil_info["run_time"]
+                )
+                if "run_cpp_start_time" in exec_info:
+                    stencil_info["run_cpp_time"] = (
+                        exec_info["run_cpp_end_time"]
+                        - exec_info["run_cpp_start_time"]
+                    )
+                    stencil_info["total_run_cpp_time"] = (
+                        stencil_info.get("total_run_cpp_time", 0.0)
+                        + stencil_info["run_cpp_time"]
+                    )
+
+    def run(self, _domain_, _origin_, exec_info, *,rsina, dx, rdy, dxa, dt_kinetic_energy_on_cell_corners, vc, dya, vc_contra, rdx, cosa, u, uc_contra, dy, uc, v,dt):
+        if exec_info is not None:
+            exec_info["domain"] = _domain_
+            exec_info["origin"] = _origin_
+            exec_info["run_start_time"] = time.perf_counter()
+        computation.run(vc=vc, uc=uc, cosa=cosa, rsina=rsina, v=v, vc_contra=vc_contra, u=u, uc_contra=uc_contra, dx=dx, rdx=rdx, dy=dy, rdy=rdy, dt_kinetic_energy_on_cell_corners=dt_kinetic_energy_on_cell_corners, dt=dt, _domain_=_domain_, _origin_=_origin_)
+        if exec_info is not None:
+            exec_info["run_end_time"] = time.perf_counter()
\ No newline at end of file
@@ -0,0 +1,142 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, vort_x_delta, vort_y_delta, ut, vt, u, v, delp, rsin2, cosa_s, rdx, rdy, heat_source, heat_source_total, kinetic_energy_fraction_to_damp, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    vort_x_delta = Field(vort_x_delta, _origin_['vort_x_delta'], (True, True, True))
+    vort_y_delta = Field(vort_y_delta, _origin_['vort_y_delta'], (True, True, True))
+    ut = Field(ut, _origin_['ut'], (True, True, True))
+    vt = Field(vt, _origin_['vt'], (True, True, True))
+    u = Field(u, _origin_['u'], (True, True, True))
+    v = Field(v, _origin_['v'], (True, True, True))
+    delp = Field(delp, _origin_['delp'], (True, True, True))
+    rsin2 = Field(rsin2, _origin_['rsin2'], (True, True, False))
+    cosa_s = Field(cosa_s, _origin_['cosa_s'], (True, True, False))
+    rdx = Field(rdx, _origin_['rdx'], (True, True, False))
+    rdy = Field(rdy, _origin_['rdy'], (True, True, False))
+    heat_source = Field(heat_source, _origin_['heat_source'], (True, True, True))
+    heat_source_total = Field(heat_source_total, _origin_['heat_source_total'], (True, True, True))
+    kinetic_energy_fraction_to_damp = Field(kinetic_energy_fraction_to_damp, _origin_['kinetic_energy_fraction_to_damp'], (False, False, True))
+    
+    ubt_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ubt_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fy_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fy_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    gy_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    gy_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    gx_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    gx_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vbt_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vbt_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fx_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fx_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    u2_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    du2_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    v2_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dampterm_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013234866640_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dv2_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        vbt_gen_1[i:I, j:J, k:K] = ((vort_y_delta[i:I, j:J, k:K] - ut[i:I, j:J, k:K]) * rdy[i:I, j:J])
+        fx_gen_1[i:I, j:J, k:K] = (v[i:I, j:J, k:K] * rdy[i:I, j:J])
+        gx_gen_1[i:I, j:J, k:K] = (fx_gen_1[i:I, j:J, k:K] * vbt_gen_1[i:I, j:J, k:K])
+        vbt_gen_0[i:I, j:J, k:K] = ((vort_y_delta[i + 1:I + 1, j:J, k:K] - ut[i + 1:I + 1, j:J, k:K]) * rdy[i + 1:I + 1, j:J])
+        fx_gen_0[i:I, j:J, k:K] = (v[i + 1:I + 1, j:J, k:K] * rdy[i + 1:I + 1, j:J])
+        gx_gen_0[i:I, j:J, k:K] = (fx_gen_0[i:I, j:J, k:K] * vbt_gen_0[i:I, j:J, k:K])
+        ubt_gen_1[i:I, j:J, k:K] = ((vort_x_delta[i:I, j + 1:J + 1, k:K] + vt[i:I, j + 1:J + 1, k:K]) * rdx[i:I, j + 1:J + 1])
+        fy_gen_1[i:I, j:J, k:K] = (u[i:I, j + 1:J + 1, k:K] * rdx[i:I, j + 1:J + 1])
+        gy_gen_1[i:I, j:J, k:K] = (fy_gen_1[i:I, j:J, k:K] * ubt_gen_1[i:I, j:J, k:K])
+        ubt_gen_0[i:I, j:J, k:K] = ((vort_x_delta[i:I, j:J, k:K] + vt[i:I, j:J, k:K]) * rdx[i:I, j:J])
+        fy_gen_0[i:I, j:J, k:K] = (u[i:I, j:J, k:K] * rdx[i:I, j:J])
+        gy_gen_0[i:I, j:J, k:K] = (fy_gen_0[i:I, j:J, k:K] * ubt_gen_0[i:I, j:J, k:K])
+        mask_140013234866640_gen_0[i:I, j:J, k:K] = np.bitwise_or((kinetic_energy_fraction_to_damp[k:K] > np.float64(1e-05)), bool(bool(False)))
+        u2_gen_0[i:I, j:J, k:K] = np.where(mask_140013234866640_gen_0[i:I, j:J, k:K], (fy_gen_0[i:I, j:J, k:K] + fy_gen_1[i:I, j:J, k:K]), u2_gen_0[i:I, j:J, k:K])
+        du2_gen_0[i:I, j:J, k:K] = np.where(mask_140013234866640_gen_0[i:I, j:J, k:K], (ubt_gen_0[i:I, j:J, k:K] + ubt_gen_1[i:I, j:J, k:K]), du2_gen_0[i:I, j:J, k:K])
+        v2_gen_0[i:I, j:J, k:K] = np.where(mask_140013234866640_gen_0[i:I, j:J, k:K], (fx_gen_1[i:I, j:J, k:K] + fx_gen_0[i:I, j:J, k:K]), v2_gen_0[i:I, j:J, k:K])
+        dv2_gen_0[i:I, j:J, k:K] = np.where(mask_140013234866640_gen_0[i:I, j:J, k:K], (vbt_gen_1[i:I, j:J, k:K] + vbt_gen_0[i:I, j:J, k:K]), dv2_gen_0[i:I, j:J, k:K])
+        dampterm_gen_0[i:I, j:J, k:K] = np.where(mask_140013234866640_gen_0[i:I, j:J, k:K], ((rsin2[i:I, j:J] * np.float64(0.25)) * ((((((ubt_gen_0[i:I, j:J, k:K] * ubt_gen_0[i:I, j:J, k:K]) + (ubt_gen_1[i:I, j:J, k:K] * ubt_gen_1[i:I, j:J, k:K])) + (vbt_gen_1[i:I, j:J, k:K] * vbt_gen_1[i:I, j:J, k:K])) + (vbt_gen_0[i:I, j:J, k:K] * vbt_gen_0[i:I, j:J, k:K])) + (np.float64(2.0) * (((gy_gen_0[i:I, j:J, k:K] + gy_gen_1[i:I, j:J, k:K]) + gx_gen_1[i:I, j:J, k:K]) + gx_gen_0[i:I, j:J, k:K]))) - (cosa_s[i:I, j:J] * (((u2_gen_0[i:I, j:J, k:K] * dv2_gen_0[i:I, j:J, k:K]) + (v2_gen_0[i:I, j:J, k:K] * du2_gen_0[i:I, j:J, k:K])) + (du2_gen_0[i:I, j:J, k:K] * dv2_gen_0[i:I, j:J, k:K]))))), dampterm_gen_0[i:I, j:J, k:K])
+        heat_source[i:I, j:J, k:K] = np.where(mask_140013234866640_gen_0[i:I, j:J, k:K], (delp[i:I, j:J, k:K] * (heat_source[i:I, j:J, k:K] - (kinetic_energy_fraction_to_damp[k:K] * dampterm_gen_0[i:I, j:J, k:K]))), heat_source[i:I, j:J, k:K])
+        heat_source_total[i:I - 1, j:J - 1, k:K] = (heat_source_total[i:I - 1, j:J - 1, k:K] + heat_source[i:I - 1, j:J - 1, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
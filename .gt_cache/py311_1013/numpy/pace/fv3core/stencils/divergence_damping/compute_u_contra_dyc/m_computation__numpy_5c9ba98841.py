@@ -0,0 +1,106 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, u, va, vc, cosa_v, sina_v, dyc, sin_sg2, sin_sg4, u_contra_dyc, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    u = Field(u, _origin_['u'], (True, True, True))
+    va = Field(va, _origin_['va'], (True, True, True))
+    vc = Field(vc, _origin_['vc'], (True, True, True))
+    cosa_v = Field(cosa_v, _origin_['cosa_v'], (True, True, False))
+    sina_v = Field(sina_v, _origin_['sina_v'], (True, True, False))
+    dyc = Field(dyc, _origin_['dyc'], (True, True, False))
+    sin_sg2 = Field(sin_sg2, _origin_['sin_sg2'], (True, True, False))
+    sin_sg4 = Field(sin_sg4, _origin_['sin_sg4'], (True, True, False))
+    u_contra_dyc = Field(u_contra_dyc, _origin_['u_contra_dyc'], (True, True, True))
+    
+    u_contra_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vc_from_va_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        vc_from_va_gen_0[i:I, j:J, k:K] = (np.float64(0.5) * (va[i:I, j - 1:J - 1, k:K] + va[i:I, j:J, k:K]))
+        u_contra_gen_0[i:I, j:J, k:K] = ((u[i:I, j:J, k:K] - (vc_from_va_gen_0[i:I, j:J, k:K] * cosa_v[i:I, j:J])) * sina_v[i:I, j:J])
+        u_contra_gen_0[i:I, j:j + 1, k:K] = np.where((vc[i:I, j:j + 1, k:K] > np.float64(np.int64(0))), (u[i:I, j:j + 1, k:K] * sin_sg4[i:I, j - 1:j]), (u[i:I, j:j + 1, k:K] * sin_sg2[i:I, j:j + 1]))
+        u_contra_gen_0[i:I, J - 1:J, k:K] = np.where((vc[i:I, J - 1:J, k:K] > np.float64(np.int64(0))), (u[i:I, J - 1:J, k:K] * sin_sg4[i:I, J - 2:J - 1]), (u[i:I, J - 1:J, k:K] * sin_sg2[i:I, J - 1:J]))
+        u_contra_dyc[i:I, j:J, k:K] = (u_contra_gen_0[i:I, j:J, k:K] * dyc[i:I, j:J])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
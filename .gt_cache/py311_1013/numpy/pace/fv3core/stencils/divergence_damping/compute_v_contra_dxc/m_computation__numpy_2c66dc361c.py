@@ -0,0 +1,106 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, v, ua, cosa_u, sina_u, dxc, v_contra_dxc, uc, sin_sg3, sin_sg1, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    v = Field(v, _origin_['v'], (True, True, True))
+    ua = Field(ua, _origin_['ua'], (True, True, True))
+    cosa_u = Field(cosa_u, _origin_['cosa_u'], (True, True, False))
+    sina_u = Field(sina_u, _origin_['sina_u'], (True, True, False))
+    dxc = Field(dxc, _origin_['dxc'], (True, True, False))
+    v_contra_dxc = Field(v_contra_dxc, _origin_['v_contra_dxc'], (True, True, True))
+    uc = Field(uc, _origin_['uc'], (True, True, True))
+    sin_sg3 = Field(sin_sg3, _origin_['sin_sg3'], (True, True, False))
+    sin_sg1 = Field(sin_sg1, _origin_['sin_sg1'], (True, True, False))
+    
+    uc_from_ua_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    v_contra_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        uc_from_ua_gen_0[i:I, j:J, k:K] = (np.float64(0.5) * (ua[i - 1:I - 1, j:J, k:K] + ua[i:I, j:J, k:K]))
+        v_contra_gen_0[i:I, j:J, k:K] = ((v[i:I, j:J, k:K] - (uc_from_ua_gen_0[i:I, j:J, k:K] * cosa_u[i:I, j:J])) * sina_u[i:I, j:J])
+        v_contra_gen_0[i:i + 1, j:J, k:K] = np.where((uc[i:i + 1, j:J, k:K] > np.float64(np.int64(0))), (v[i:i + 1, j:J, k:K] * sin_sg3[i - 1:i, j:J]), (v[i:i + 1, j:J, k:K] * sin_sg1[i:i + 1, j:J]))
+        v_contra_gen_0[I - 1:I, j:J, k:K] = np.where((uc[I - 1:I, j:J, k:K] > np.float64(np.int64(0))), (v[I - 1:I, j:J, k:K] * sin_sg3[I - 2:I - 1, j:J]), (v[I - 1:I, j:J, k:K] * sin_sg1[I - 1:I, j:J]))
+        v_contra_dxc[i:I, j:J, k:K] = (v_contra_gen_0[i:I, j:J, k:K] * dxc[i:I, j:J])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
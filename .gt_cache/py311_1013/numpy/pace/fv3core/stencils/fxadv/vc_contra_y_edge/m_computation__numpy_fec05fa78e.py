@@ -0,0 +1,108 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, vc, cosa_v, uc_contra, vc_contra, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    vc = Field(vc, _origin_['vc'], (True, True, True))
+    cosa_v = Field(cosa_v, _origin_['cosa_v'], (True, True, False))
+    uc_contra = Field(uc_contra, _origin_['uc_contra'], (True, True, True))
+    vc_contra = Field(vc_contra, _origin_['vc_contra'], (True, True, True))
+    
+    vtmp_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    u_contra_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    rsin2__b5e_39_24_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        vtmp_gen_0[i:I, j:J, k:K] = vc_contra[i:I, j:J, k:K]
+        u_contra_gen_0[i + 2:i + 4, j + 3:J - 2, k:K] = (np.float64(0.25) * (((uc_contra[i + 2:i + 4, j + 2:J - 3, k:K] + uc_contra[i + 3:i + 5, j + 2:J - 3, k:K]) + uc_contra[i + 2:i + 4, j + 3:J - 2, k:K]) + uc_contra[i + 3:i + 5, j + 3:J - 2, k:K]))
+        rsin2__b5e_39_24_gen_0[i + 2:i + 4, j + 3:J - 2, k:K] = np.float64(1.0)
+        vc_contra[i + 2:i + 4, j + 3:J - 2, k:K] = ((vc[i + 2:i + 4, j + 3:J - 2, k:K] - (u_contra_gen_0[i + 2:i + 4, j + 3:J - 2, k:K] * cosa_v[i + 2:i + 4, j + 3:J - 2])) * rsin2__b5e_39_24_gen_0[i + 2:i + 4, j + 3:J - 2, k:K])
+        u_contra_gen_0[I - 4:I - 2, j + 3:J - 2, k:K] = (np.float64(0.25) * (((uc_contra[I - 4:I - 2, j + 2:J - 3, k:K] + uc_contra[I - 3:I - 1, j + 2:J - 3, k:K]) + uc_contra[I - 4:I - 2, j + 3:J - 2, k:K]) + uc_contra[I - 3:I - 1, j + 3:J - 2, k:K]))
+        rsin2__b5e_39_24_gen_0[I - 4:I - 2, j + 3:J - 2, k:K] = np.float64(1.0)
+        vc_contra[I - 4:I - 2, j + 3:J - 2, k:K] = ((vc[I - 4:I - 2, j + 3:J - 2, k:K] - (u_contra_gen_0[I - 4:I - 2, j + 3:J - 2, k:K] * cosa_v[I - 4:I - 2, j + 3:J - 2])) * rsin2__b5e_39_24_gen_0[I - 4:I - 2, j + 3:J - 2, k:K])
+        vc_contra[i + 2:i + 4, j + 3:j + 5, k:K] = vtmp_gen_0[i + 2:i + 4, j + 3:j + 5, k:K]
+        vc_contra[I - 4:I - 2, j + 3:j + 5, k:K] = vtmp_gen_0[I - 4:I - 2, j + 3:j + 5, k:K]
+        vc_contra[i + 2:i + 4, J - 4:J - 2, k:K] = vtmp_gen_0[i + 2:i + 4, J - 4:J - 2, k:K]
+        vc_contra[I - 4:I - 2, J - 4:J - 2, k:K] = vtmp_gen_0[I - 4:I - 2, J - 4:J - 2, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,121 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, qvapor, qliquid, qrain, qsnow, qice, qgraupel, q_con, gz, cvm, pkz, pt, cappa, delp, delz, r_vir, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    qvapor = Field(qvapor, _origin_['qvapor'], (True, True, True))
+    qliquid = Field(qliquid, _origin_['qliquid'], (True, True, True))
+    qrain = Field(qrain, _origin_['qrain'], (True, True, True))
+    qsnow = Field(qsnow, _origin_['qsnow'], (True, True, True))
+    qice = Field(qice, _origin_['qice'], (True, True, True))
+    qgraupel = Field(qgraupel, _origin_['qgraupel'], (True, True, True))
+    q_con = Field(q_con, _origin_['q_con'], (True, True, True))
+    gz = Field(gz, _origin_['gz'], (True, True, True))
+    cvm = Field(cvm, _origin_['cvm'], (True, True, True))
+    pkz = Field(pkz, _origin_['pkz'], (True, True, True))
+    pt = Field(pt, _origin_['pt'], (True, True, True))
+    cappa = Field(cappa, _origin_['cappa'], (True, True, True))
+    delp = Field(delp, _origin_['delp'], (True, True, True))
+    delz = Field(delz, _origin_['delz'], (True, True, True))
+    
+    qs__d1f_38_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cappa__752_42_16_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    gz__d1f_38_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm__7bd_13_10__d1f_38_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm__d1f_38_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ql__d1f_38_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        ql__d1f_38_18_gen_0[i:I, j:J, k:K] = (qliquid[i:I, j:J, k:K] + qrain[i:I, j:J, k:K])
+        qs__d1f_38_18_gen_0[i:I, j:J, k:K] = ((qice[i:I, j:J, k:K] + qsnow[i:I, j:J, k:K]) + qgraupel[i:I, j:J, k:K])
+        gz__d1f_38_18_gen_0[i:I, j:J, k:K] = (ql__d1f_38_18_gen_0[i:I, j:J, k:K] + qs__d1f_38_18_gen_0[i:I, j:J, k:K])
+        cvm__7bd_13_10__d1f_38_18_gen_0[i:I, j:J, k:K] = (((((np.float64(1.0) - (qvapor[i:I, j:J, k:K] + gz__d1f_38_18_gen_0[i:I, j:J, k:K])) * np.float64(717.55)) + (qvapor[i:I, j:J, k:K] * np.float64(1384.5))) + (ql__d1f_38_18_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (qs__d1f_38_18_gen_0[i:I, j:J, k:K] * np.float64(1972.0)))
+        cvm__d1f_38_18_gen_0[i:I, j:J, k:K] = cvm__7bd_13_10__d1f_38_18_gen_0[i:I, j:J, k:K]
+        cvm[i:I, j:J, k:K] = cvm__d1f_38_18_gen_0[i:I, j:J, k:K]
+        gz[i:I, j:J, k:K] = gz__d1f_38_18_gen_0[i:I, j:J, k:K]
+        q_con[i:I, j:J, k:K] = gz[i:I, j:J, k:K]
+        cappa__752_42_16_gen_0[i:I, j:J, k:K] = (np.float64(287.05) / (np.float64(287.05) + (cvm[i:I, j:J, k:K] / (np.float64(1.0) + (r_vir * qvapor[i:I, j:J, k:K])))))
+        cappa[i:I, j:J, k:K] = cappa__752_42_16_gen_0[i:I, j:J, k:K]
+        pkz[i:I, j:J, k:K] = np.exp((cappa[i:I, j:J, k:K] * np.log((((np.float64(-29.270953893531434) * delp[i:I, j:J, k:K]) / delz[i:I, j:J, k:K]) * pt[i:I, j:J, k:K]))))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
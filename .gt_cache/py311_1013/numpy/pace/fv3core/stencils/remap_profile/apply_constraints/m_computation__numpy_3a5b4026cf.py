@@ -0,0 +1,218 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, q, gam, a4_1, a4_2, a4_3, extm, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    q = Field(q, _origin_['q'], (True, True, True))
+    gam = Field(gam, _origin_['gam'], (True, True, True))
+    a4_1 = Field(a4_1, _origin_['a4_1'], (True, True, True))
+    a4_2 = Field(a4_2, _origin_['a4_2'], (True, True, True))
+    a4_3 = Field(a4_3, _origin_['a4_3'], (True, True, True))
+    extm = Field(extm, _origin_['extm'], (True, True, True))
+    
+    tmp = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp2 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    a4_1_0_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013225572240_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_140013227174992_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_140013226149008_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_140013231391312_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_140013225289744_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_140013224940688_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_140013232135376_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_140013228973200_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_140013222524752_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_140013229598672_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_140013225471056_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        a4_1_0_gen_0[i:I, j:J, k:K] = a4_1[i:I, j:J, k - 1:K - 1]
+        tmp[i:I, j:J, k:K] = np.where((a4_1_0_gen_0[i:I, j:J, k:K] > a4_1[i:I, j:J, k:K]), a4_1_0_gen_0[i:I, j:J, k:K], a4_1[i:I, j:J, k:K])
+        tmp2[i:I, j:J, k:K] = np.where((a4_1_0_gen_0[i:I, j:J, k:K] < a4_1[i:I, j:J, k:K]), a4_1_0_gen_0[i:I, j:J, k:K], a4_1[i:I, j:J, k:K])
+        gam[i:I, j:J, k:K] = (a4_1[i:I, j:J, k:K] - a4_1_0_gen_0[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dk_ + 2
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_140013225572240_gen_0[i:I, j:J, k:K] = (q[i:I, j:J, k:K] >= tmp[i:I, j:J, k:K])
+        q[i:I, j:J, k:K] = np.where(mask_140013225572240_gen_0[i:I, j:J, k:K], tmp[i:I, j:J, k:K], q[i:I, j:J, k:K])
+        mask_140013227174992_gen_0[i:I, j:J, k:K] = (q[i:I, j:J, k:K] <= tmp2[i:I, j:J, k:K])
+        q[i:I, j:J, k:K] = np.where(mask_140013227174992_gen_0[i:I, j:J, k:K], tmp2[i:I, j:J, k:K], q[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 2, _dK_ - 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_140013231391312_gen_0[i:I, j:J, k_:k_ + 1] = ((gam[i:I, j:J, k_ - 1:k_] * gam[i:I, j:J, k_ + 1:k_ + 2]) > np.float64(np.int64(0)))
+            mask_140013228973200_gen_0[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_:k_ + 1] >= tmp[i:I, j:J, k_:k_ + 1])
+            q[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_140013231391312_gen_0[i:I, j:J, k_:k_ + 1], mask_140013228973200_gen_0[i:I, j:J, k_:k_ + 1]), tmp[i:I, j:J, k_:k_ + 1], q[i:I, j:J, k_:k_ + 1])
+            mask_140013226149008_gen_0[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_:k_ + 1] <= tmp2[i:I, j:J, k_:k_ + 1])
+            q[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_140013231391312_gen_0[i:I, j:J, k_:k_ + 1], mask_140013226149008_gen_0[i:I, j:J, k_:k_ + 1]), tmp2[i:I, j:J, k_:k_ + 1], q[i:I, j:J, k_:k_ + 1])
+            mask_140013224940688_gen_0[i:I, j:J, k_:k_ + 1] = (gam[i:I, j:J, k_ - 1:k_] > np.float64(np.int64(0)))
+            mask_140013222524752_gen_0[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_:k_ + 1] <= tmp2[i:I, j:J, k_:k_ + 1])
+            q[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013231391312_gen_0[i:I, j:J, k_:k_ + 1])), mask_140013224940688_gen_0[i:I, j:J, k_:k_ + 1]), mask_140013222524752_gen_0[i:I, j:J, k_:k_ + 1]), tmp2[i:I, j:J, k_:k_ + 1], q[i:I, j:J, k_:k_ + 1])
+            mask_140013232135376_gen_0[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_:k_ + 1] >= tmp[i:I, j:J, k_:k_ + 1])
+            q[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013231391312_gen_0[i:I, j:J, k_:k_ + 1])), (np.bitwise_not(mask_140013224940688_gen_0[i:I, j:J, k_:k_ + 1]))), mask_140013232135376_gen_0[i:I, j:J, k_:k_ + 1]), tmp[i:I, j:J, k_:k_ + 1], q[i:I, j:J, k_:k_ + 1])
+            mask_140013225289744_gen_0[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_:k_ + 1] < np.float64(0.0))
+            q[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013231391312_gen_0[i:I, j:J, k_:k_ + 1])), (np.bitwise_not(mask_140013224940688_gen_0[i:I, j:J, k_:k_ + 1]))), mask_140013225289744_gen_0[i:I, j:J, k_:k_ + 1]), np.float64(0.0), q[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_140013225471056_gen_0[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_:k_ + 1] >= tmp[i:I, j:J, k_:k_ + 1])
+            q[i:I, j:J, k_:k_ + 1] = np.where(mask_140013225471056_gen_0[i:I, j:J, k_:k_ + 1], tmp[i:I, j:J, k_:k_ + 1], q[i:I, j:J, k_:k_ + 1])
+            mask_140013229598672_gen_0[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_:k_ + 1] <= tmp2[i:I, j:J, k_:k_ + 1])
+            q[i:I, j:J, k_:k_ + 1] = np.where(mask_140013229598672_gen_0[i:I, j:J, k_:k_ + 1], tmp2[i:I, j:J, k_:k_ + 1], q[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        a4_2[i:I, j:J, k:K] = q[i:I, j:J, k:K]
+        a4_3[i:I, j:J, k:K] = q[i:I, j:J, k + 1:K + 1]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        extm[i:I, j:J, k:K] = (((a4_2[i:I, j:J, k:K] - a4_1[i:I, j:J, k:K]) * (a4_3[i:I, j:J, k:K] - a4_1[i:I, j:J, k:K])) > np.float64(0.0))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        extm[i:I, j:J, k:K] = ((gam[i:I, j:J, k:K] * gam[i:I, j:J, k + 1:K + 1]) < np.float64(0.0))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        extm[i:I, j:J, k:K] = (((a4_2[i:I, j:J, k:K] - a4_1[i:I, j:J, k:K]) * (a4_3[i:I, j:J, k:K] - a4_1[i:I, j:J, k:K])) > np.float64(0.0))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,3440 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, qv, ql, qi, qr, qs, cappa, qg, pt, dp, delz, te0, q_con, qa, area, hs, pkz, sdt, zvir, fac_i2s, do_qa, consv_te, c_air, c_vap, mdt, fac_r2g, fac_smlt, fac_l2r, fac_imlt, d0_vap, lv00, fac_v2l, fac_l2v, last_step, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    qv = Field(qv, _origin_['qv'], (True, True, True))
+    ql = Field(ql, _origin_['ql'], (True, True, True))
+    qi = Field(qi, _origin_['qi'], (True, True, True))
+    qr = Field(qr, _origin_['qr'], (True, True, True))
+    qs = Field(qs, _origin_['qs'], (True, True, True))
+    cappa = Field(cappa, _origin_['cappa'], (True, True, True))
+    qg = Field(qg, _origin_['qg'], (True, True, True))
+    pt = Field(pt, _origin_['pt'], (True, True, True))
+    dp = Field(dp, _origin_['dp'], (True, True, True))
+    delz = Field(delz, _origin_['delz'], (True, True, True))
+    te0 = Field(te0, _origin_['te0'], (True, True, True))
+    q_con = Field(q_con, _origin_['q_con'], (True, True, True))
+    qa = Field(qa, _origin_['qa'], (True, True, True))
+    area = Field(area, _origin_['area'], (True, True, False))
+    hs = Field(hs, _origin_['hs'], (True, True, False))
+    pkz = Field(pkz, _origin_['pkz'], (True, True, True))
+    
+    delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    qr__d52_236_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dimmin_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    rqi_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013215175952_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013214068048_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_4_13__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmpmax__782_4_14__caa_138_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ql__570_179_38_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qv__570_160_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    factor__360_3_13__638_158_26_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi__a5e_4_16__2b3_145_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ap1__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    diff__73d_3_17__36e_3_10__753_3_27__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qs_mlt__4d6_219_45_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm__6ab_188_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_sol__ca8_195_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ql__caa_138_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    tem0__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    z__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    sink__1ae_214_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi__a5e_4_16__2b3_296_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it__04d_320_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013206052496_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_140013223152272_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    t__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qstar_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__ab0_4_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    desw__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm__ca8_195_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des22__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t0_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013204618128_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013228243344_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pt1__1ae_214_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem__ab0_4_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013198607824_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013206558864_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_3_17__36e_3_10__04d_320_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013206275088_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    table2_m1__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    i__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    desw__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qi__6ab_188_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pt1__ca8_195_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    b__73d_3_17__36e_3_10__753_3_27__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_minus_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013217819472_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tmp__1ae_214_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhl__2b3_164_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013191634576_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__ab0_4_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    denom__23f_8_18__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013192522256_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    sink__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    i__d48_21_15__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    b__73d_3_17__36e_3_10__753_3_27__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    factor__638_177_30_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dq__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013193567696_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    factor__638_158_26_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t_m1__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    b__73d_27_14__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    desw_p1__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    i__d48_32_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    table2_p1__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    denom__23f_8_18__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_166_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tin_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm__8e3_140_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_4_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    factmp__bc6_129_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    es__23f_8_18__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icp2__2b3_145_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013205480720_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    wqsat__23f_8_18__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013213758736_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem__ab0_4_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__73d_3_17__36e_3_10__04d_320_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    src__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhl_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013210052816_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    i__343_26_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem__ab0_3_8__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dqsdt_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013215821584_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    i__d48_29_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    tem__ab0_3_8__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    z__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    desw__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2_p1__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013206226320_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    lhi__a5e_4_16__2b3_239_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    wqs1_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    mask_140013210072848_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dq2dt_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pt1__bc6_129_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013193661392_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    es__973_5_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__ab0_4_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dimqs__4d6_219_45_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_4_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    desw_p1__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi__2b3_183_35_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icp2__a5e_217_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icp2__2b3_164_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icp2__a5e_4_16__2b3_164_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_liq_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013220993360_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    diff__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013199697744_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it__753_3_27__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013206187344_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013201904784_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi__2b3_145_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    z__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_plus_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_13__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013207376912_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    rainfac__1ae_214_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dtmp__8e3_140_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t_m1__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013190166096_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    table2__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_13__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013192070672_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    pt1__8e3_140_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qv__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_13__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    denom__23f_8_18__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    tem__ab0_4_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    icp2__2b3_183_35_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_liq__ca8_195_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013226091152_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_140013205517008_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dq0_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    desw__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    b__73d_58_21__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi__a5e_217_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    desw__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    factor__360_3_13__638_177_30_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    i__d48_29_15__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qs__4d6_219_45_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tablew__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp__5bf_135_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    z__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013213843344_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_liq__bc6_129_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__ab0_4_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmpmax__782_8_14__caa_138_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    wqsat__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem__ab0_3_8__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    exptc_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__ab0_4_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dq_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    qim_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2_p1__d99_4_22__753_3_27__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qi_lim__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qpz_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sink__6ab_188_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__73d_166_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013218493200_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013190358288_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    table2_m1__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ap1__753_3_27__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi__a5e_4_16__2b3_164_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    desw__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013192519056_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    q_liq__570_179_38_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    src__0be_4_10__638_158_26_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhl__958_3_16__2b3_239_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qi_crt__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp__caa_138_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qg__1ae_214_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dtmp__4d6_219_45_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    lhi__2b3_164_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__ab0_4_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2__753_3_27__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    wqsat_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_13__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icp2__a5e_4_16__2b3_145_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem__ab0_4_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__973_5_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013203304784_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    ql0_max__d52_236_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013204851472_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__ab0_4_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    src__638_177_30_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013192120336_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    i__d48_18_15__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    diff_ice_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm__570_160_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_3_17__36e_3_10__753_3_27__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_3_8__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_3_8__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhl__958_3_16__2b3_164_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_sol__1ae_214_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t_m1__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013217786640_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    i__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    z__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013219921680_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_liq__570_160_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem__ab0_3_13__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013204210704_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    wqsat__23f_8_18__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qi__bc6_129_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013208086992_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013192064272_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    table2__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    z__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2_p1__753_3_27__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_146_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013202236496_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi__a5e_133_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    es__973_5_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t_m1__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    i__d48_18_15__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    qi__ca8_195_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013201943888_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    i__d48_32_15__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    table2__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013219918480_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    i__343_13_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm__570_179_38_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_sol__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcp2__2b3_164_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhl__958_3_16__2b3_183_35_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013204973264_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pt1__570_179_38_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcp2_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    i__343_13_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    z__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tablew__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it__d99_4_22__753_3_27__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013193077776_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem__ab0_4_13__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tcp2_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_4_13__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__ab0_4_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013207171600_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_13__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013202326224_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icp2__a5e_4_16__2b3_296_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it__753_3_27__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ap1__36e_3_10__753_3_27__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    table__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icp2__a5e_212_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    wqsat__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icp2__a5e_116_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    es__23f_8_18__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013206725840_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    table2__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qi__8e3_140_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sink__8e3_140_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013207054096_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tem__ab0_3_8__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013191636432_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013207722192_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    b__73d_3_17__36e_3_10__753_3_27__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp__4d6_219_45_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhl__2b3_296_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ql__d52_236_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    pt1__570_160_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__ab0_4_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_13__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_58_21__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi__a5e_116_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013206726608_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ap1__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icp2__a5e_4_16__2b3_239_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_sol__8e3_140_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_3_17__36e_3_10__753_3_27__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2_p1__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dqdt__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    lhi__a5e_212_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    desw2__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013216367888_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcp2__958_3_16__2b3_145_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013206662160_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013220997072_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    cvm__4d6_219_45_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    a__73d_146_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013209319120_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi__2b3_296_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ap1__753_3_27__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pt1__6ab_188_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcp2__2b3_183_35_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013191068752_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t_m1__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qi_gen__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dtmp__1ae_214_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icp2__a5e_133_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhl__958_3_16__2b3_296_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mindw_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    z__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    q_liq__4d6_219_45_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qi__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dbl_sqrt_area_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2__d99_4_22__753_3_27__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    iqs2_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qs__5bf_135_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t_m1__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ap1__36e_3_10__753_3_27__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sink__4d6_219_45_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013205830160_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_sol__bc6_129_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ql__ca8_195_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2__753_3_27__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ap1__04d_320_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcp2__2b3_145_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2_p1__753_3_27__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    pt1_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013191118032_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013204430672_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tcp3_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_cond_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_27_14__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm__bc6_129_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2_p1__753_3_27__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013206824400_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    q_sol__6ab_188_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tablew__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__73d_3_17__36e_3_10__753_3_27__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lh__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t_m1__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__ab0_4_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t_m1__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icp2__a5e_192_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_13__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    b__73d_3_17__36e_3_10__04d_320_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    lhi__2b3_239_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qg__5bf_135_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sink_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dqdt__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013215558864_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhl__2b3_183_35_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013213832848_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    src__638_158_26_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013208482640_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2__d99_4_22__753_3_27__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tc__ca8_195_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013203953872_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    desw__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pidep__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013202462096_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    lhl__958_3_16__2b3_145_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013204608592_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    den_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013190981072_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    z__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem__ab0_4_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sink__ca8_195_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    z__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem__ab0_3_8__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013206864464_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_13__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcp2__2b3_239_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dqdt__23f_8_18__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013193902224_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    des2__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_sol_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_13__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ap1__36e_3_10__753_3_27__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013207206096_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    i__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    mask_140013227215248_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icp2_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pt1__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    mintmp_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013204219920_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi__a5e_4_16__2b3_183_35_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    z__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    adj_fac_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem__ab0_4_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013221345680_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcp2__958_3_16__2b3_296_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icp2__2b3_239_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    i__343_26_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_liq__6ab_188_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013192881168_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    cvm__1ae_214_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem__ab0_3_8__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_6_12__4d6_219_45_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    desw__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    a__73d_166_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_3_8__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013205437136_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    src_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013199724112_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    diff__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qr__1ae_214_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013198620816_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013206060816_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    it__d99_4_22__753_3_27__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    rh_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    wqsat__23f_8_18__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013204976784_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    i__343_13_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    i__d48_21_15__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    hvar_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcp2__958_3_16__2b3_164_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ql__570_160_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    expsubl_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ql__6ab_188_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    es__23f_8_18__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_liq__8e3_140_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhl__2b3_239_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ql__4d6_219_45_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__73d_3_17__36e_3_10__753_3_27__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_3_13__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_26_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    mask_140013192053072_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dqdt__23f_8_18__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    snowfac__4d6_219_45_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    maxtmp_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ql__8e3_140_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ap1__753_3_27__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dw_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    iqs1_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2_p1__d99_4_22__753_3_27__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem__ab0_4_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013182694224_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__ab0_4_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    des2__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icp2__2b3_296_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013205696528_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    table__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem__ab0_4_13__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dtmp__6ab_188_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it__d99_4_22__753_3_27__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2_p1__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcp2__958_3_16__2b3_239_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013192161808_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013192672272_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    i__343_13_15__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2_p1__d99_4_22__753_3_27__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013190039184_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    factor_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013208314960_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013192278864_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_140013192054928_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    icp2__a5e_4_16__2b3_183_35_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pt1__4d6_219_45_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhl__2b3_145_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    desw__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_sol__4d6_219_45_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013206284880_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    des2_p1__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__343_13_15__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t_m1__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcp2__958_3_16__2b3_183_35_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_liq__1ae_214_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ql__bc6_129_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    desw2__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2__753_3_27__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__73d_3_17__36e_3_10__753_3_27__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013217913552_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem__ab0_3_8__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi__a5e_192_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013202966736_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    i__343_26_15__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013193846416_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    i__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    desw__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    wqsat__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qr__caa_138_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dqdt__23f_8_18__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013205381584_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_12_16__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013203483536_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dqdt__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013215821840_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmpmax__782_7_14__5bf_135_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__ab0_4_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it2__d99_4_22__753_3_27__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ap1_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t_m1__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    src__0be_4_10__638_177_30_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_6_17__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mc_air_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t_m1__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013193691856_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_7_14__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sink__bc6_129_41_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_p1__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcp2__2b3_296_31_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tem0__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__ab0_4_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013207744848_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_18_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_32_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    maxtmp__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_29_15__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__ab0_4_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__73d_146_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sink__d52_236_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    table2_p1__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013206315664_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_140013225299024_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    i__d48_21_15__918_3_13__183_322_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    mask_140013204683536_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ap1__36e_3_10__04d_320_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__973_5_11__803_321_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    it__753_3_27__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8c8_4_11__ab0_4_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ap1__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    table2_m1__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_5_11__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qr__4d6_219_45_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    delta_heat_capacity__265_3_11__8c5_30_20__918_4_13__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_6_12__a8e_237_22_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qv__570_179_38_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013182564432_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dimtmp__651_247_34_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        q_liq_gen_0[i:I, j:J, k:K] = (ql[i:I, j:J, k:K] + qr[i:I, j:J, k:K])
+        q_sol_gen_0[i:I, j:J, k:K] = ((qi[i:I, j:J, k:K] + qs[i:I, j:J, k:K]) + qg[i:I, j:J, k:K])
+        qpz_gen_0[i:I, j:J, k:K] = (q_liq_gen_0[i:I, j:J, k:K] + q_sol_gen_0[i:I, j:J, k:K])
+        pt1_gen_0[i:I, j:J, k:K] = (pt[i:I, j:J, k:K] / ((np.float64(1.0) + (zvir * qv[i:I, j:J, k:K])) * (np.float64(1.0) - qpz_gen_0[i:I, j:J, k:K])))
+        t0_gen_0[i:I, j:J, k:K] = pt1_gen_0[i:I, j:J, k:K]
+        qpz_gen_0[i:I, j:J, k:K] = (qpz_gen_0[i:I, j:J, k:K] + qv[i:I, j:J, k:K])
+        den_gen_0[i:I, j:J, k:K] = ((-(dp[i:I, j:J, k:K])) / (np.float64(9.80665) * delz[i:I, j:J, k:K]))
+        mc_air_gen_0[i:I, j:J, k:K] = ((np.float64(1.0) - qpz_gen_0[i:I, j:J, k:K]) * c_air)
+        cvm_gen_0[i:I, j:J, k:K] = (((mc_air_gen_0[i:I, j:J, k:K] + (qv[i:I, j:J, k:K] * c_vap)) + (q_liq_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol_gen_0[i:I, j:J, k:K] * np.float64(1972.0)))
+        lhi__a5e_116_20_gen_0[i:I, j:J, k:K] = (np.float64(-271059.66000000003) + (np.float64(2213.5) * pt1_gen_0[i:I, j:J, k:K]))
+        icp2__a5e_116_20_gen_0[i:I, j:J, k:K] = (lhi__a5e_116_20_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K])
+        lhi_gen_0[i:I, j:J, k:K] = lhi__a5e_116_20_gen_0[i:I, j:J, k:K]
+        icp2_gen_0[i:I, j:J, k:K] = icp2__a5e_116_20_gen_0[i:I, j:J, k:K]
+        te0[i:I, j:J, k:K] = np.where(consv_te, ((-(cvm_gen_0[i:I, j:J, k:K])) * t0_gen_0[i:I, j:J, k:K]), te0[i:I, j:J, k:K])
+        mask_140013182564432_gen_0[i:I, j:J, k:K] = (qi[i:I, j:J, k:K] < np.float64(0.0))
+        qs[i:I, j:J, k:K] = np.where(mask_140013182564432_gen_0[i:I, j:J, k:K], (qs[i:I, j:J, k:K] + qi[i:I, j:J, k:K]), qs[i:I, j:J, k:K])
+        qi[i:I, j:J, k:K] = np.where(mask_140013182564432_gen_0[i:I, j:J, k:K], np.float64(0.0), qi[i:I, j:J, k:K])
+        qi__bc6_129_41_gen_0[i:I, j:J, k:K] = qi[i:I, j:J, k:K]
+        ql__bc6_129_41_gen_0[i:I, j:J, k:K] = ql[i:I, j:J, k:K]
+        q_liq__bc6_129_41_gen_0[i:I, j:J, k:K] = q_liq_gen_0[i:I, j:J, k:K]
+        q_sol__bc6_129_41_gen_0[i:I, j:J, k:K] = q_sol_gen_0[i:I, j:J, k:K]
+        pt1__bc6_129_41_gen_0[i:I, j:J, k:K] = pt1_gen_0[i:I, j:J, k:K]
+        cvm__bc6_129_41_gen_0[i:I, j:J, k:K] = cvm_gen_0[i:I, j:J, k:K]
+        mask_140013182694224_gen_0[i:I, j:J, k:K] = np.bitwise_and((qi__bc6_129_41_gen_0[i:I, j:J, k:K] > np.float64(1e-08)), (pt1__bc6_129_41_gen_0[i:I, j:J, k:K] > np.float64(273.16)))
+        factmp__bc6_129_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013182694224_gen_0[i:I, j:J, k:K], ((fac_imlt * (pt1__bc6_129_41_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / icp2_gen_0[i:I, j:J, k:K]), factmp__bc6_129_41_gen_0[i:I, j:J, k:K])
+        sink__bc6_129_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013182694224_gen_0[i:I, j:J, k:K], np.where((qi__bc6_129_41_gen_0[i:I, j:J, k:K] < factmp__bc6_129_41_gen_0[i:I, j:J, k:K]), qi__bc6_129_41_gen_0[i:I, j:J, k:K], factmp__bc6_129_41_gen_0[i:I, j:J, k:K]), sink__bc6_129_41_gen_0[i:I, j:J, k:K])
+        qi__bc6_129_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013182694224_gen_0[i:I, j:J, k:K], (qi__bc6_129_41_gen_0[i:I, j:J, k:K] - sink__bc6_129_41_gen_0[i:I, j:J, k:K]), qi__bc6_129_41_gen_0[i:I, j:J, k:K])
+        ql__bc6_129_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013182694224_gen_0[i:I, j:J, k:K], (ql__bc6_129_41_gen_0[i:I, j:J, k:K] + sink__bc6_129_41_gen_0[i:I, j:J, k:K]), ql__bc6_129_41_gen_0[i:I, j:J, k:K])
+        q_liq__bc6_129_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013182694224_gen_0[i:I, j:J, k:K], (q_liq__bc6_129_41_gen_0[i:I, j:J, k:K] + sink__bc6_129_41_gen_0[i:I, j:J, k:K]), q_liq__bc6_129_41_gen_0[i:I, j:J, k:K])
+        q_sol__bc6_129_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013182694224_gen_0[i:I, j:J, k:K], (q_sol__bc6_129_41_gen_0[i:I, j:J, k:K] - sink__bc6_129_41_gen_0[i:I, j:J, k:K]), q_sol__bc6_129_41_gen_0[i:I, j:J, k:K])
+        cvm__bc6_129_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013182694224_gen_0[i:I, j:J, k:K], (((mc_air_gen_0[i:I, j:J, k:K] + (qv[i:I, j:J, k:K] * c_vap)) + (q_liq__bc6_129_41_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__bc6_129_41_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__bc6_129_41_gen_0[i:I, j:J, k:K])
+        sink__bc6_129_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013182694224_gen_0[i:I, j:J, k:K], (-(sink__bc6_129_41_gen_0[i:I, j:J, k:K])), sink__bc6_129_41_gen_0[i:I, j:J, k:K])
+        pt1__bc6_129_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013182694224_gen_0[i:I, j:J, k:K], (pt1__bc6_129_41_gen_0[i:I, j:J, k:K] + ((sink__bc6_129_41_gen_0[i:I, j:J, k:K] * lhi_gen_0[i:I, j:J, k:K]) / cvm__bc6_129_41_gen_0[i:I, j:J, k:K])), pt1__bc6_129_41_gen_0[i:I, j:J, k:K])
+        qi[i:I, j:J, k:K] = qi__bc6_129_41_gen_0[i:I, j:J, k:K]
+        ql[i:I, j:J, k:K] = ql__bc6_129_41_gen_0[i:I, j:J, k:K]
+        q_liq_gen_0[i:I, j:J, k:K] = q_liq__bc6_129_41_gen_0[i:I, j:J, k:K]
+        q_sol_gen_0[i:I, j:J, k:K] = q_sol__bc6_129_41_gen_0[i:I, j:J, k:K]
+        cvm_gen_0[i:I, j:J, k:K] = cvm__bc6_129_41_gen_0[i:I, j:J, k:K]
+        pt1_gen_0[i:I, j:J, k:K] = pt1__bc6_129_41_gen_0[i:I, j:J, k:K]
+        lhi__a5e_133_20_gen_0[i:I, j:J, k:K] = (np.float64(-271059.66000000003) + (np.float64(2213.5) * pt1_gen_0[i:I, j:J, k:K]))
+        icp2__a5e_133_20_gen_0[i:I, j:J, k:K] = (lhi__a5e_133_20_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K])
+        lhi_gen_0[i:I, j:J, k:K] = lhi__a5e_133_20_gen_0[i:I, j:J, k:K]
+        icp2_gen_0[i:I, j:J, k:K] = icp2__a5e_133_20_gen_0[i:I, j:J, k:K]
+        qs__5bf_135_17_gen_0[i:I, j:J, k:K] = qs[i:I, j:J, k:K]
+        qg__5bf_135_17_gen_0[i:I, j:J, k:K] = qg[i:I, j:J, k:K]
+        mask_140013204976784_gen_0[i:I, j:J, k:K] = (qs__5bf_135_17_gen_0[i:I, j:J, k:K] < np.float64(0.0))
+        qg__5bf_135_17_gen_0[i:I, j:J, k:K] = np.where(mask_140013204976784_gen_0[i:I, j:J, k:K], (qg__5bf_135_17_gen_0[i:I, j:J, k:K] + qs__5bf_135_17_gen_0[i:I, j:J, k:K]), qg__5bf_135_17_gen_0[i:I, j:J, k:K])
+        qs__5bf_135_17_gen_0[i:I, j:J, k:K] = np.where(mask_140013204976784_gen_0[i:I, j:J, k:K], np.float64(0.0), qs__5bf_135_17_gen_0[i:I, j:J, k:K])
+        mask_140013203304784_gen_0[i:I, j:J, k:K] = (qg__5bf_135_17_gen_0[i:I, j:J, k:K] < np.float64(0.0))
+        tmpmax__782_7_14__5bf_135_17_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_140013204976784_gen_0[i:I, j:J, k:K])), mask_140013203304784_gen_0[i:I, j:J, k:K]), np.maximum(qs__5bf_135_17_gen_0[i:I, j:J, k:K], np.float64(0.0)), tmpmax__782_7_14__5bf_135_17_gen_0[i:I, j:J, k:K])
+        tmp__5bf_135_17_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_140013204976784_gen_0[i:I, j:J, k:K])), mask_140013203304784_gen_0[i:I, j:J, k:K]), np.minimum((-(qg__5bf_135_17_gen_0[i:I, j:J, k:K])), tmpmax__782_7_14__5bf_135_17_gen_0[i:I, j:J, k:K]), tmp__5bf_135_17_gen_0[i:I, j:J, k:K])
+        qg__5bf_135_17_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_140013204976784_gen_0[i:I, j:J, k:K])), mask_140013203304784_gen_0[i:I, j:J, k:K]), (qg__5bf_135_17_gen_0[i:I, j:J, k:K] + tmp__5bf_135_17_gen_0[i:I, j:J, k:K]), qg__5bf_135_17_gen_0[i:I, j:J, k:K])
+        qs__5bf_135_17_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_140013204976784_gen_0[i:I, j:J, k:K])), mask_140013203304784_gen_0[i:I, j:J, k:K]), (qs__5bf_135_17_gen_0[i:I, j:J, k:K] - tmp__5bf_135_17_gen_0[i:I, j:J, k:K]), qs__5bf_135_17_gen_0[i:I, j:J, k:K])
+        qs[i:I, j:J, k:K] = qs__5bf_135_17_gen_0[i:I, j:J, k:K]
+        qg[i:I, j:J, k:K] = qg__5bf_135_17_gen_0[i:I, j:J, k:K]
+        ql__caa_138_17_gen_0[i:I, j:J, k:K] = ql[i:I, j:J, k:K]
+        qr__caa_138_17_gen_0[i:I, j:J, k:K] = qr[i:I, j:J, k:K]
+        mask_140013204973264_gen_0[i:I, j:J, k:K] = (ql__caa_138_17_gen_0[i:I, j:J, k:K] < np.float64(0.0))
+        tmpmax__782_4_14__caa_138_17_gen_0[i:I, j:J, k:K] = np.where(mask_140013204973264_gen_0[i:I, j:J, k:K], np.maximum(qr__caa_138_17_gen_0[i:I, j:J, k:K], np.float64(0.0)), tmpmax__782_4_14__caa_138_17_gen_0[i:I, j:J, k:K])
+        tmp__caa_138_17_gen_0[i:I, j:J, k:K] = np.where(mask_140013204973264_gen_0[i:I, j:J, k:K], np.minimum((-(ql__caa_138_17_gen_0[i:I, j:J, k:K])), tmpmax__782_4_14__caa_138_17_gen_0[i:I, j:J, k:K]), tmp__caa_138_17_gen_0[i:I, j:J, k:K])
+        ql__caa_138_17_gen_0[i:I, j:J, k:K] = np.where(mask_140013204973264_gen_0[i:I, j:J, k:K], (ql__caa_138_17_gen_0[i:I, j:J, k:K] + tmp__caa_138_17_gen_0[i:I, j:J, k:K]), ql__caa_138_17_gen_0[i:I, j:J, k:K])
+        qr__caa_138_17_gen_0[i:I, j:J, k:K] = np.where(mask_140013204973264_gen_0[i:I, j:J, k:K], (qr__caa_138_17_gen_0[i:I, j:J, k:K] - tmp__caa_138_17_gen_0[i:I, j:J, k:K]), qr__caa_138_17_gen_0[i:I, j:J, k:K])
+        mask_140013201904784_gen_0[i:I, j:J, k:K] = (qr__caa_138_17_gen_0[i:I, j:J, k:K] < np.float64(0.0))
+        tmpmax__782_8_14__caa_138_17_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_140013204973264_gen_0[i:I, j:J, k:K])), mask_140013201904784_gen_0[i:I, j:J, k:K]), np.maximum(ql__caa_138_17_gen_0[i:I, j:J, k:K], np.float64(0.0)), tmpmax__782_8_14__caa_138_17_gen_0[i:I, j:J, k:K])
+        tmp__caa_138_17_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_140013204973264_gen_0[i:I, j:J, k:K])), mask_140013201904784_gen_0[i:I, j:J, k:K]), np.minimum((-(qr__caa_138_17_gen_0[i:I, j:J, k:K])), tmpmax__782_8_14__caa_138_17_gen_0[i:I, j:J, k:K]), tmp__caa_138_17_gen_0[i:I, j:J, k:K])
+        ql__caa_138_17_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_140013204973264_gen_0[i:I, j:J, k:K])), mask_140013201904784_gen_0[i:I, j:J, k:K]), (ql__caa_138_17_gen_0[i:I, j:J, k:K] - tmp__caa_138_17_gen_0[i:I, j:J, k:K]), ql__caa_138_17_gen_0[i:I, j:J, k:K])
+        qr__caa_138_17_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_140013204973264_gen_0[i:I, j:J, k:K])), mask_140013201904784_gen_0[i:I, j:J, k:K]), (qr__caa_138_17_gen_0[i:I, j:J, k:K] + tmp__caa_138_17_gen_0[i:I, j:J, k:K]), qr__caa_138_17_gen_0[i:I, j:J, k:K])
+        ql[i:I, j:J, k:K] = ql__caa_138_17_gen_0[i:I, j:J, k:K]
+        qr[i:I, j:J, k:K] = qr__caa_138_17_gen_0[i:I, j:J, k:K]
+        ql__8e3_140_41_gen_0[i:I, j:J, k:K] = ql[i:I, j:J, k:K]
+        qi__8e3_140_41_gen_0[i:I, j:J, k:K] = qi[i:I, j:J, k:K]
+        q_liq__8e3_140_41_gen_0[i:I, j:J, k:K] = q_liq_gen_0[i:I, j:J, k:K]
+        q_sol__8e3_140_41_gen_0[i:I, j:J, k:K] = q_sol_gen_0[i:I, j:J, k:K]
+        pt1__8e3_140_41_gen_0[i:I, j:J, k:K] = pt1_gen_0[i:I, j:J, k:K]
+        cvm__8e3_140_41_gen_0[i:I, j:J, k:K] = cvm_gen_0[i:I, j:J, k:K]
+        dtmp__8e3_140_41_gen_0[i:I, j:J, k:K] = ((np.float64(273.16) - np.float64(48.0)) - pt1__8e3_140_41_gen_0[i:I, j:J, k:K])
+        mask_140013202236496_gen_0[i:I, j:J, k:K] = np.bitwise_and((ql__8e3_140_41_gen_0[i:I, j:J, k:K] > np.float64(0.0)), (dtmp__8e3_140_41_gen_0[i:I, j:J, k:K] > np.float64(0.0)))
+        sink__8e3_140_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013202236496_gen_0[i:I, j:J, k:K], np.minimum(ql__8e3_140_41_gen_0[i:I, j:J, k:K], (dtmp__8e3_140_41_gen_0[i:I, j:J, k:K] / icp2_gen_0[i:I, j:J, k:K])), sink__8e3_140_41_gen_0[i:I, j:J, k:K])
+        ql__8e3_140_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013202236496_gen_0[i:I, j:J, k:K], (ql__8e3_140_41_gen_0[i:I, j:J, k:K] - sink__8e3_140_41_gen_0[i:I, j:J, k:K]), ql__8e3_140_41_gen_0[i:I, j:J, k:K])
+        qi__8e3_140_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013202236496_gen_0[i:I, j:J, k:K], (qi__8e3_140_41_gen_0[i:I, j:J, k:K] + sink__8e3_140_41_gen_0[i:I, j:J, k:K]), qi__8e3_140_41_gen_0[i:I, j:J, k:K])
+        q_liq__8e3_140_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013202236496_gen_0[i:I, j:J, k:K], (q_liq__8e3_140_41_gen_0[i:I, j:J, k:K] - sink__8e3_140_41_gen_0[i:I, j:J, k:K]), q_liq__8e3_140_41_gen_0[i:I, j:J, k:K])
+        q_sol__8e3_140_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013202236496_gen_0[i:I, j:J, k:K], (q_sol__8e3_140_41_gen_0[i:I, j:J, k:K] + sink__8e3_140_41_gen_0[i:I, j:J, k:K]), q_sol__8e3_140_41_gen_0[i:I, j:J, k:K])
+        cvm__8e3_140_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013202236496_gen_0[i:I, j:J, k:K], (((mc_air_gen_0[i:I, j:J, k:K] + (qv[i:I, j:J, k:K] * c_vap)) + (q_liq__8e3_140_41_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__8e3_140_41_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__8e3_140_41_gen_0[i:I, j:J, k:K])
+        pt1__8e3_140_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013202236496_gen_0[i:I, j:J, k:K], (pt1__8e3_140_41_gen_0[i:I, j:J, k:K] + ((sink__8e3_140_41_gen_0[i:I, j:J, k:K] * lhi_gen_0[i:I, j:J, k:K]) / cvm__8e3_140_41_gen_0[i:I, j:J, k:K])), pt1__8e3_140_41_gen_0[i:I, j:J, k:K])
+        ql[i:I, j:J, k:K] = ql__8e3_140_41_gen_0[i:I, j:J, k:K]
+        qi[i:I, j:J, k:K] = qi__8e3_140_41_gen_0[i:I, j:J, k:K]
+        q_liq_gen_0[i:I, j:J, k:K] = q_liq__8e3_140_41_gen_0[i:I, j:J, k:K]
+        q_sol_gen_0[i:I, j:J, k:K] = q_sol__8e3_140_41_gen_0[i:I, j:J, k:K]
+        cvm_gen_0[i:I, j:J, k:K] = cvm__8e3_140_41_gen_0[i:I, j:J, k:K]
+        pt1_gen_0[i:I, j:J, k:K] = pt1__8e3_140_41_gen_0[i:I, j:J, k:K]
+        b__73d_3_17__36e_3_10__753_3_27__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(113.16000000000003)
+        diff__73d_3_17__36e_3_10__753_3_27__116_143_23_gen_0[i:I, j:J, k:K] = np.where(((pt1_gen_0[i:I, j:J, k:K] - b__73d_3_17__36e_3_10__753_3_27__116_143_23_gen_0[i:I, j:J, k:K]) > np.float64(np.int64(0))), (pt1_gen_0[i:I, j:J, k:K] - b__73d_3_17__36e_3_10__753_3_27__116_143_23_gen_0[i:I, j:J, k:K]), np.float64(np.int64(0)))
+        RETURN_VALUE__73d_3_17__36e_3_10__753_3_27__116_143_23_gen_0[i:I, j:J, k:K] = diff__73d_3_17__36e_3_10__753_3_27__116_143_23_gen_0[i:I, j:J, k:K]
+        ap1__36e_3_10__753_3_27__116_143_23_gen_0[i:I, j:J, k:K] = ((np.float64(10.0) * RETURN_VALUE__73d_3_17__36e_3_10__753_3_27__116_143_23_gen_0[i:I, j:J, k:K]) + np.float64(1.0))
+        ap1__753_3_27__116_143_23_gen_0[i:I, j:J, k:K] = (np.minimum(ap1__36e_3_10__753_3_27__116_143_23_gen_0[i:I, j:J, k:K], np.float64(np.int64(2621))) - np.float64(np.int64(1)))
+        it__d99_4_22__753_3_27__116_143_23_gen_0[i:I, j:J, k:K] = np.floor(ap1__753_3_27__116_143_23_gen_0[i:I, j:J, k:K])
+        it2__d99_4_22__753_3_27__116_143_23_gen_0[i:I, j:J, k:K] = np.floor((ap1__753_3_27__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(0.5)))
+        it2_p1__d99_4_22__753_3_27__116_143_23_gen_0[i:I, j:J, k:K] = (it2__d99_4_22__753_3_27__116_143_23_gen_0[i:I, j:J, k:K] + np.float64(np.int64(1)))
+        it__753_3_27__116_143_23_gen_0[i:I, j:J, k:K] = it__d99_4_22__753_3_27__116_143_23_gen_0[i:I, j:J, k:K]
+        it2__753_3_27__116_143_23_gen_0[i:I, j:J, k:K] = it2__d99_4_22__753_3_27__116_143_23_gen_0[i:I, j:J, k:K]
+        it2_p1__753_3_27__116_143_23_gen_0[i:I, j:J, k:K] = it2_p1__d99_4_22__753_3_27__116_143_23_gen_0[i:I, j:J, k:K]
+        ap1__116_143_23_gen_0[i:I, j:J, k:K] = ap1__753_3_27__116_143_23_gen_0[i:I, j:J, k:K]
+        it__116_143_23_gen_0[i:I, j:J, k:K] = it__753_3_27__116_143_23_gen_0[i:I, j:J, k:K]
+        it2__116_143_23_gen_0[i:I, j:J, k:K] = it2__753_3_27__116_143_23_gen_0[i:I, j:J, k:K]
+        it2_p1__116_143_23_gen_0[i:I, j:J, k:K] = it2_p1__753_3_27__116_143_23_gen_0[i:I, j:J, k:K]
+        tem__ab0_4_13__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(113.16000000000003) + (np.float64(0.1) * it__116_143_23_gen_0[i:I, j:J, k:K]))
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_13__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(-2339.5)
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_13__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(3139057.8200000003)
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_13__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_13__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_4_13__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_4_13__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_4_13__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_13__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5))))
+        RETURN_VALUE__8c8_4_11__ab0_4_13__116_143_23_gen_0[i:I, j:J, k:K] = RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_13__116_143_23_gen_0[i:I, j:J, k:K]
+        tablew__116_143_23_gen_0[i:I, j:J, k:K] = RETURN_VALUE__8c8_4_11__ab0_4_13__116_143_23_gen_0[i:I, j:J, k:K]
+        tem__ab0_3_8__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(113.16000000000003) + (np.float64(0.1) * it__116_143_23_gen_0[i:I, j:J, k:K]))
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(-2339.5)
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(3139057.8200000003)
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_3_8__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_3_8__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_3_8__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5))))
+        RETURN_VALUE__8c8_4_11__ab0_3_8__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K]
+        t__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = RETURN_VALUE__8c8_4_11__ab0_3_8__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K]
+        i__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = (it__116_143_23_gen_0[i:I, j:J, k:K] + np.float64(np.int64(1)))
+        tem__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(113.16000000000003) + (np.float64(0.1) * i__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K]))
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(-2339.5)
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(3139057.8200000003)
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5))))
+        RETURN_VALUE__8c8_4_11__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K]
+        RETURN_VALUE__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = RETURN_VALUE__8c8_4_11__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K]
+        diff__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = (RETURN_VALUE__ab0_4_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - t__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        z__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(0.0)
+        desw__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.maximum(z__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K], diff__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = desw__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K]
+        mask_140013204618128_gen_0[i:I, j:J, k:K] = (it__116_143_23_gen_0[i:I, j:J, k:K] == np.float64((np.int64(2621) - np.int64(1))))
+        i__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013204618128_gen_0[i:I, j:J, k:K], (it__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1))), i__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013204618128_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        mask_140013205517008_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013205517008_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013205517008_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013205517008_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013205517008_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013205517008_gen_0[i:I, j:J, k:K]))), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013205517008_gen_0[i:I, j:J, k:K]))), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013205517008_gen_0[i:I, j:J, k:K]))), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013205517008_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        mask_140013202966736_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])) * table__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])), table__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), np.int64(1598), i__d48_18_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), np.int64(1600), i__d48_21_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013202966736_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        mask_140013204608592_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), np.int64(1599), i__d48_29_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), np.int64(1601), i__d48_32_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204618128_gen_0[i:I, j:J, k:K], mask_140013204608592_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        t_m1__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013204618128_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K], t_m1__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        diff__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013204618128_gen_0[i:I, j:J, k:K], (t__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] - t_m1__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K]), diff__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013204618128_gen_0[i:I, j:J, k:K], np.maximum(z__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K], diff__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K]), des2__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K])
+        desw__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K] = des2__0a3_7_11__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K]
+        desw__116_143_23_gen_0[i:I, j:J, k:K] = desw__85c_5_11__116_143_23_gen_0[i:I, j:J, k:K]
+        tem__ab0_3_8__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(113.16000000000003) + (np.float64(0.1) * it2__116_143_23_gen_0[i:I, j:J, k:K]))
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(-2339.5)
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(3139057.8200000003)
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_3_8__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_3_8__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_3_8__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5))))
+        RETURN_VALUE__8c8_4_11__ab0_3_8__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K]
+        t__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = RETURN_VALUE__8c8_4_11__ab0_3_8__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K]
+        i__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = (it2__116_143_23_gen_0[i:I, j:J, k:K] + np.float64(np.int64(1)))
+        tem__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(113.16000000000003) + (np.float64(0.1) * i__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K]))
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(-2339.5)
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(3139057.8200000003)
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5))))
+        RETURN_VALUE__8c8_4_11__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K]
+        RETURN_VALUE__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = RETURN_VALUE__8c8_4_11__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K]
+        diff__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = (RETURN_VALUE__ab0_4_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - t__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        z__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(0.0)
+        desw__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.maximum(z__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K], diff__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = desw__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K]
+        mask_140013206060816_gen_0[i:I, j:J, k:K] = (it2__116_143_23_gen_0[i:I, j:J, k:K] == np.float64((np.int64(2621) - np.int64(1))))
+        i__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013206060816_gen_0[i:I, j:J, k:K], (it2__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1))), i__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013206060816_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        mask_140013205381584_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013205381584_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013205381584_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013205381584_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013205381584_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013205381584_gen_0[i:I, j:J, k:K]))), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013205381584_gen_0[i:I, j:J, k:K]))), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013205381584_gen_0[i:I, j:J, k:K]))), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013205381584_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        mask_140013202326224_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])) * table__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])), table__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), np.int64(1598), i__d48_18_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), np.int64(1600), i__d48_21_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013202326224_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        mask_140013203483536_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), np.int64(1599), i__d48_29_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), np.int64(1601), i__d48_32_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206060816_gen_0[i:I, j:J, k:K], mask_140013203483536_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        t_m1__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013206060816_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K], t_m1__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        diff__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013206060816_gen_0[i:I, j:J, k:K], (t__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] - t_m1__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K]), diff__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013206060816_gen_0[i:I, j:J, k:K], np.maximum(z__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K], diff__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K]), des2__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K])
+        desw__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K] = des2__0a3_7_11__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K]
+        desw2__116_143_23_gen_0[i:I, j:J, k:K] = desw__85c_6_12__116_143_23_gen_0[i:I, j:J, k:K]
+        tem__ab0_3_8__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(113.16000000000003) + (np.float64(0.1) * it2_p1__116_143_23_gen_0[i:I, j:J, k:K]))
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(-2339.5)
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(3139057.8200000003)
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_3_8__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_3_8__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_3_8__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5))))
+        RETURN_VALUE__8c8_4_11__ab0_3_8__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K]
+        t__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = RETURN_VALUE__8c8_4_11__ab0_3_8__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K]
+        i__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = (it2_p1__116_143_23_gen_0[i:I, j:J, k:K] + np.float64(np.int64(1)))
+        tem__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(113.16000000000003) + (np.float64(0.1) * i__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K]))
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(-2339.5)
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(3139057.8200000003)
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5))))
+        RETURN_VALUE__8c8_4_11__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K]
+        RETURN_VALUE__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = RETURN_VALUE__8c8_4_11__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K]
+        diff__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = (RETURN_VALUE__ab0_4_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - t__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        z__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.float64(0.0)
+        desw__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.maximum(z__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K], diff__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = desw__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K]
+        mask_140013204683536_gen_0[i:I, j:J, k:K] = (it2_p1__116_143_23_gen_0[i:I, j:J, k:K] == np.float64((np.int64(2621) - np.int64(1))))
+        i__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013204683536_gen_0[i:I, j:J, k:K], (it2_p1__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1))), i__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013204683536_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        mask_140013206052496_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206052496_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206052496_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206052496_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206052496_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013206052496_gen_0[i:I, j:J, k:K]))), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013206052496_gen_0[i:I, j:J, k:K]))), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013206052496_gen_0[i:I, j:J, k:K]))), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013206052496_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        mask_140013206187344_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])) * table__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])), table__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), np.int64(1598), i__d48_18_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), np.int64(1600), i__d48_21_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206187344_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        mask_140013206284880_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), np.int64(1599), i__d48_29_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), np.int64(1601), i__d48_32_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204683536_gen_0[i:I, j:J, k:K], mask_140013206284880_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        t_m1__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013204683536_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K], t_m1__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        diff__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013204683536_gen_0[i:I, j:J, k:K], (t__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] - t_m1__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K]), diff__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = np.where(mask_140013204683536_gen_0[i:I, j:J, k:K], np.maximum(z__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K], diff__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K]), des2__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K])
+        desw__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K] = des2__0a3_7_11__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K]
+        desw_p1__116_143_23_gen_0[i:I, j:J, k:K] = desw__85c_7_14__116_143_23_gen_0[i:I, j:J, k:K]
+        es__23f_8_18__116_143_23_gen_0[i:I, j:J, k:K] = (tablew__116_143_23_gen_0[i:I, j:J, k:K] + ((ap1__116_143_23_gen_0[i:I, j:J, k:K] - it__116_143_23_gen_0[i:I, j:J, k:K]) * desw__116_143_23_gen_0[i:I, j:J, k:K]))
+        denom__23f_8_18__116_143_23_gen_0[i:I, j:J, k:K] = ((np.float64(461.5) * pt1_gen_0[i:I, j:J, k:K]) * den_gen_0[i:I, j:J, k:K])
+        wqsat__23f_8_18__116_143_23_gen_0[i:I, j:J, k:K] = (es__23f_8_18__116_143_23_gen_0[i:I, j:J, k:K] / denom__23f_8_18__116_143_23_gen_0[i:I, j:J, k:K])
+        dqdt__23f_8_18__116_143_23_gen_0[i:I, j:J, k:K] = (np.float64(10.0) * (desw2__116_143_23_gen_0[i:I, j:J, k:K] + ((ap1__116_143_23_gen_0[i:I, j:J, k:K] - it2__116_143_23_gen_0[i:I, j:J, k:K]) * (desw_p1__116_143_23_gen_0[i:I, j:J, k:K] - desw2__116_143_23_gen_0[i:I, j:J, k:K]))))
+        dqdt__23f_8_18__116_143_23_gen_0[i:I, j:J, k:K] = (dqdt__23f_8_18__116_143_23_gen_0[i:I, j:J, k:K] / denom__23f_8_18__116_143_23_gen_0[i:I, j:J, k:K])
+        wqsat__116_143_23_gen_0[i:I, j:J, k:K] = wqsat__23f_8_18__116_143_23_gen_0[i:I, j:J, k:K]
+        dqdt__116_143_23_gen_0[i:I, j:J, k:K] = dqdt__23f_8_18__116_143_23_gen_0[i:I, j:J, k:K]
+        wqsat_gen_0[i:I, j:J, k:K] = wqsat__116_143_23_gen_0[i:I, j:J, k:K]
+        dq2dt_gen_0[i:I, j:J, k:K] = dqdt__116_143_23_gen_0[i:I, j:J, k:K]
+        lhl__958_3_16__2b3_145_31_gen_0[i:I, j:J, k:K] = (lv00 + (d0_vap * pt1_gen_0[i:I, j:J, k:K]))
+        lcp2__958_3_16__2b3_145_31_gen_0[i:I, j:J, k:K] = (lhl__958_3_16__2b3_145_31_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K])
+        lhl__2b3_145_31_gen_0[i:I, j:J, k:K] = lhl__958_3_16__2b3_145_31_gen_0[i:I, j:J, k:K]
+        lcp2__2b3_145_31_gen_0[i:I, j:J, k:K] = lcp2__958_3_16__2b3_145_31_gen_0[i:I, j:J, k:K]
+        lhi__a5e_4_16__2b3_145_31_gen_0[i:I, j:J, k:K] = (np.float64(-271059.66000000003) + (np.float64(2213.5) * pt1_gen_0[i:I, j:J, k:K]))
+        icp2__a5e_4_16__2b3_145_31_gen_0[i:I, j:J, k:K] = (lhi__a5e_4_16__2b3_145_31_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K])
+        lhi__2b3_145_31_gen_0[i:I, j:J, k:K] = lhi__a5e_4_16__2b3_145_31_gen_0[i:I, j:J, k:K]
+        icp2__2b3_145_31_gen_0[i:I, j:J, k:K] = icp2__a5e_4_16__2b3_145_31_gen_0[i:I, j:J, k:K]
+        lhl_gen_0[i:I, j:J, k:K] = lhl__2b3_145_31_gen_0[i:I, j:J, k:K]
+        lhi_gen_0[i:I, j:J, k:K] = lhi__2b3_145_31_gen_0[i:I, j:J, k:K]
+        lcp2_gen_0[i:I, j:J, k:K] = lcp2__2b3_145_31_gen_0[i:I, j:J, k:K]
+        icp2_gen_0[i:I, j:J, k:K] = icp2__2b3_145_31_gen_0[i:I, j:J, k:K]
+        a__73d_146_19_gen_0[i:I, j:J, k:K] = np.float64(273.16)
+        diff__73d_146_19_gen_0[i:I, j:J, k:K] = np.where(((a__73d_146_19_gen_0[i:I, j:J, k:K] - pt1_gen_0[i:I, j:J, k:K]) > np.float64(np.int64(0))), (a__73d_146_19_gen_0[i:I, j:J, k:K] - pt1_gen_0[i:I, j:J, k:K]), np.float64(np.int64(0)))
+        RETURN_VALUE__73d_146_19_gen_0[i:I, j:J, k:K] = diff__73d_146_19_gen_0[i:I, j:J, k:K]
+        diff_ice_gen_0[i:I, j:J, k:K] = (RETURN_VALUE__73d_146_19_gen_0[i:I, j:J, k:K] / np.float64(48.0))
+        dimmin_gen_0[i:I, j:J, k:K] = np.minimum(np.float64(1.0), diff_ice_gen_0[i:I, j:J, k:K])
+        tcp3_gen_0[i:I, j:J, k:K] = (lcp2_gen_0[i:I, j:J, k:K] + (icp2_gen_0[i:I, j:J, k:K] * dimmin_gen_0[i:I, j:J, k:K]))
+        dq0_gen_0[i:I, j:J, k:K] = ((qv[i:I, j:J, k:K] - wqsat_gen_0[i:I, j:J, k:K]) / (np.float64(1.0) + (tcp3_gen_0[i:I, j:J, k:K] * dq2dt_gen_0[i:I, j:J, k:K])))
+        mask_140013193077776_gen_0[i:I, j:J, k:K] = (dq0_gen_0[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        src_gen_0[i:I, j:J, k:K] = np.where(mask_140013193077776_gen_0[i:I, j:J, k:K], np.minimum((np.float64(0.9) * dq0_gen_0[i:I, j:J, k:K]), np.maximum((np.float64(0.001) - ql[i:I, j:J, k:K]), (fac_v2l * dq0_gen_0[i:I, j:J, k:K]))), src_gen_0[i:I, j:J, k:K])
+        factor__360_3_13__638_158_26_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013193077776_gen_0[i:I, j:J, k:K])), (-(np.minimum(np.float64(np.int64(1)), ((fac_l2v * np.float64(10.0)) * (np.float64(1.0) - (qv[i:I, j:J, k:K] / wqsat_gen_0[i:I, j:J, k:K])))))), factor__360_3_13__638_158_26_gen_0[i:I, j:J, k:K])
+        factor__638_158_26_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013193077776_gen_0[i:I, j:J, k:K])), factor__360_3_13__638_158_26_gen_0[i:I, j:J, k:K], factor__638_158_26_gen_0[i:I, j:J, k:K])
+        src__0be_4_10__638_158_26_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013193077776_gen_0[i:I, j:J, k:K])), (-(np.minimum(ql[i:I, j:J, k:K], (factor__638_158_26_gen_0[i:I, j:J, k:K] * dq0_gen_0[i:I, j:J, k:K])))), src__0be_4_10__638_158_26_gen_0[i:I, j:J, k:K])
+        src__638_158_26_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013193077776_gen_0[i:I, j:J, k:K])), src__0be_4_10__638_158_26_gen_0[i:I, j:J, k:K], src__638_158_26_gen_0[i:I, j:J, k:K])
+        factor_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013193077776_gen_0[i:I, j:J, k:K])), factor__638_158_26_gen_0[i:I, j:J, k:K], factor_gen_0[i:I, j:J, k:K])
+        src_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013193077776_gen_0[i:I, j:J, k:K])), src__638_158_26_gen_0[i:I, j:J, k:K], src_gen_0[i:I, j:J, k:K])
+        pt1__570_160_34_gen_0[i:I, j:J, k:K] = pt1_gen_0[i:I, j:J, k:K]
+        qv__570_160_34_gen_0[i:I, j:J, k:K] = qv[i:I, j:J, k:K]
+        ql__570_160_34_gen_0[i:I, j:J, k:K] = ql[i:I, j:J, k:K]
+        q_liq__570_160_34_gen_0[i:I, j:J, k:K] = q_liq_gen_0[i:I, j:J, k:K]
+        qv__570_160_34_gen_0[i:I, j:J, k:K] = (qv__570_160_34_gen_0[i:I, j:J, k:K] - src_gen_0[i:I, j:J, k:K])
+        ql__570_160_34_gen_0[i:I, j:J, k:K] = (ql__570_160_34_gen_0[i:I, j:J, k:K] + src_gen_0[i:I, j:J, k:K])
+        q_liq__570_160_34_gen_0[i:I, j:J, k:K] = (q_liq__570_160_34_gen_0[i:I, j:J, k:K] + src_gen_0[i:I, j:J, k:K])
+        cvm__570_160_34_gen_0[i:I, j:J, k:K] = (((mc_air_gen_0[i:I, j:J, k:K] + (qv__570_160_34_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__570_160_34_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol_gen_0[i:I, j:J, k:K] * np.float64(1972.0)))
+        pt1__570_160_34_gen_0[i:I, j:J, k:K] = (pt1__570_160_34_gen_0[i:I, j:J, k:K] + ((src_gen_0[i:I, j:J, k:K] * lhl_gen_0[i:I, j:J, k:K]) / cvm__570_160_34_gen_0[i:I, j:J, k:K]))
+        qv[i:I, j:J, k:K] = qv__570_160_34_gen_0[i:I, j:J, k:K]
+        ql[i:I, j:J, k:K] = ql__570_160_34_gen_0[i:I, j:J, k:K]
+        q_liq_gen_0[i:I, j:J, k:K] = q_liq__570_160_34_gen_0[i:I, j:J, k:K]
+        cvm_gen_0[i:I, j:J, k:K] = cvm__570_160_34_gen_0[i:I, j:J, k:K]
+        pt1_gen_0[i:I, j:J, k:K] = pt1__570_160_34_gen_0[i:I, j:J, k:K]
+        lhl__958_3_16__2b3_164_31_gen_0[i:I, j:J, k:K] = (lv00 + (d0_vap * pt1_gen_0[i:I, j:J, k:K]))
+        lcp2__958_3_16__2b3_164_31_gen_0[i:I, j:J, k:K] = (lhl__958_3_16__2b3_164_31_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K])
+        lhl__2b3_164_31_gen_0[i:I, j:J, k:K] = lhl__958_3_16__2b3_164_31_gen_0[i:I, j:J, k:K]
+        lcp2__2b3_164_31_gen_0[i:I, j:J, k:K] = lcp2__958_3_16__2b3_164_31_gen_0[i:I, j:J, k:K]
+        lhi__a5e_4_16__2b3_164_31_gen_0[i:I, j:J, k:K] = (np.float64(-271059.66000000003) + (np.float64(2213.5) * pt1_gen_0[i:I, j:J, k:K]))
+        icp2__a5e_4_16__2b3_164_31_gen_0[i:I, j:J, k:K] = (lhi__a5e_4_16__2b3_164_31_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K])
+        lhi__2b3_164_31_gen_0[i:I, j:J, k:K] = lhi__a5e_4_16__2b3_164_31_gen_0[i:I, j:J, k:K]
+        icp2__2b3_164_31_gen_0[i:I, j:J, k:K] = icp2__a5e_4_16__2b3_164_31_gen_0[i:I, j:J, k:K]
+        lhl_gen_0[i:I, j:J, k:K] = lhl__2b3_164_31_gen_0[i:I, j:J, k:K]
+        lhi_gen_0[i:I, j:J, k:K] = lhi__2b3_164_31_gen_0[i:I, j:J, k:K]
+        lcp2_gen_0[i:I, j:J, k:K] = lcp2__2b3_164_31_gen_0[i:I, j:J, k:K]
+        icp2_gen_0[i:I, j:J, k:K] = icp2__2b3_164_31_gen_0[i:I, j:J, k:K]
+        a__73d_166_19_gen_0[i:I, j:J, k:K] = np.float64(273.16)
+        diff__73d_166_19_gen_0[i:I, j:J, k:K] = np.where(((a__73d_166_19_gen_0[i:I, j:J, k:K] - pt1_gen_0[i:I, j:J, k:K]) > np.float64(np.int64(0))), (a__73d_166_19_gen_0[i:I, j:J, k:K] - pt1_gen_0[i:I, j:J, k:K]), np.float64(np.int64(0)))
+        RETURN_VALUE__73d_166_19_gen_0[i:I, j:J, k:K] = diff__73d_166_19_gen_0[i:I, j:J, k:K]
+        diff_ice_gen_0[i:I, j:J, k:K] = (RETURN_VALUE__73d_166_19_gen_0[i:I, j:J, k:K] / np.float64(48.0))
+        dimmin_gen_0[i:I, j:J, k:K] = np.minimum(np.float64(1.0), diff_ice_gen_0[i:I, j:J, k:K])
+        tcp3_gen_0[i:I, j:J, k:K] = (lcp2_gen_0[i:I, j:J, k:K] + (icp2_gen_0[i:I, j:J, k:K] * dimmin_gen_0[i:I, j:J, k:K]))
+        b__73d_3_17__36e_3_10__753_3_27__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(113.16000000000003), b__73d_3_17__36e_3_10__753_3_27__116_171_27_gen_0[i:I, j:J, k:K])
+        diff__73d_3_17__36e_3_10__753_3_27__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.where(((pt1_gen_0[i:I, j:J, k:K] - b__73d_3_17__36e_3_10__753_3_27__116_171_27_gen_0[i:I, j:J, k:K]) > np.float64(np.int64(0))), (pt1_gen_0[i:I, j:J, k:K] - b__73d_3_17__36e_3_10__753_3_27__116_171_27_gen_0[i:I, j:J, k:K]), np.float64(np.int64(0))), diff__73d_3_17__36e_3_10__753_3_27__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__73d_3_17__36e_3_10__753_3_27__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, diff__73d_3_17__36e_3_10__753_3_27__116_171_27_gen_0[i:I, j:J, k:K], RETURN_VALUE__73d_3_17__36e_3_10__753_3_27__116_171_27_gen_0[i:I, j:J, k:K])
+        ap1__36e_3_10__753_3_27__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, ((np.float64(10.0) * RETURN_VALUE__73d_3_17__36e_3_10__753_3_27__116_171_27_gen_0[i:I, j:J, k:K]) + np.float64(1.0)), ap1__36e_3_10__753_3_27__116_171_27_gen_0[i:I, j:J, k:K])
+        ap1__753_3_27__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.minimum(ap1__36e_3_10__753_3_27__116_171_27_gen_0[i:I, j:J, k:K], np.float64(np.int64(2621))) - np.float64(np.int64(1))), ap1__753_3_27__116_171_27_gen_0[i:I, j:J, k:K])
+        it__d99_4_22__753_3_27__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.floor(ap1__753_3_27__116_171_27_gen_0[i:I, j:J, k:K]), it__d99_4_22__753_3_27__116_171_27_gen_0[i:I, j:J, k:K])
+        it2__d99_4_22__753_3_27__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.floor((ap1__753_3_27__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(0.5))), it2__d99_4_22__753_3_27__116_171_27_gen_0[i:I, j:J, k:K])
+        it2_p1__d99_4_22__753_3_27__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (it2__d99_4_22__753_3_27__116_171_27_gen_0[i:I, j:J, k:K] + np.float64(np.int64(1))), it2_p1__d99_4_22__753_3_27__116_171_27_gen_0[i:I, j:J, k:K])
+        it__753_3_27__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, it__d99_4_22__753_3_27__116_171_27_gen_0[i:I, j:J, k:K], it__753_3_27__116_171_27_gen_0[i:I, j:J, k:K])
+        it2__753_3_27__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, it2__d99_4_22__753_3_27__116_171_27_gen_0[i:I, j:J, k:K], it2__753_3_27__116_171_27_gen_0[i:I, j:J, k:K])
+        it2_p1__753_3_27__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, it2_p1__d99_4_22__753_3_27__116_171_27_gen_0[i:I, j:J, k:K], it2_p1__753_3_27__116_171_27_gen_0[i:I, j:J, k:K])
+        ap1__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, ap1__753_3_27__116_171_27_gen_0[i:I, j:J, k:K], ap1__116_171_27_gen_0[i:I, j:J, k:K])
+        it__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, it__753_3_27__116_171_27_gen_0[i:I, j:J, k:K], it__116_171_27_gen_0[i:I, j:J, k:K])
+        it2__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, it2__753_3_27__116_171_27_gen_0[i:I, j:J, k:K], it2__116_171_27_gen_0[i:I, j:J, k:K])
+        it2_p1__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, it2_p1__753_3_27__116_171_27_gen_0[i:I, j:J, k:K], it2_p1__116_171_27_gen_0[i:I, j:J, k:K])
+        tem__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(113.16000000000003) + (np.float64(0.1) * it__116_171_27_gen_0[i:I, j:J, k:K])), tem__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_4_11__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_4_11__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K])
+        tablew__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, RETURN_VALUE__8c8_4_11__ab0_4_13__116_171_27_gen_0[i:I, j:J, k:K], tablew__116_171_27_gen_0[i:I, j:J, k:K])
+        tem__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(113.16000000000003) + (np.float64(0.1) * it__116_171_27_gen_0[i:I, j:J, k:K])), tem__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        t__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, RETURN_VALUE__8c8_4_11__ab0_3_8__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], t__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        i__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (it__116_171_27_gen_0[i:I, j:J, k:K] + np.float64(np.int64(1))), i__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        tem__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(113.16000000000003) + (np.float64(0.1) * i__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])), tem__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, RETURN_VALUE__8c8_4_11__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], RETURN_VALUE__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        diff__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (RETURN_VALUE__ab0_4_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - t__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K]), diff__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        z__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(0.0), z__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        desw__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.maximum(z__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], diff__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K]), desw__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, desw__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], des2__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        mask_140013192519056_gen_0[i:I, j:J, k:K] = (it__116_171_27_gen_0[i:I, j:J, k:K] == np.float64((np.int64(2621) - np.int64(1))))
+        i__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), (it__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1))), i__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        mask_140013192522256_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013192522256_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013192522256_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013192522256_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013192522256_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013192522256_gen_0[i:I, j:J, k:K]))), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013192522256_gen_0[i:I, j:J, k:K]))), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013192522256_gen_0[i:I, j:J, k:K]))), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013192522256_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        mask_140013206275088_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])) * table__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])), table__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), np.int64(1598), i__d48_18_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), np.int64(1600), i__d48_21_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013206275088_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        mask_140013207206096_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), np.int64(1599), i__d48_29_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), np.int64(1601), i__d48_32_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), mask_140013207206096_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        t_m1__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), table2__918_4_15__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], t_m1__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        diff__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), (t__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] - t_m1__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K]), diff__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013192519056_gen_0[i:I, j:J, k:K]), np.maximum(z__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], diff__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K]), des2__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        desw__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, des2__0a3_7_11__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], desw__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K])
+        desw__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, desw__85c_5_11__116_171_27_gen_0[i:I, j:J, k:K], desw__116_171_27_gen_0[i:I, j:J, k:K])
+        tem__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(113.16000000000003) + (np.float64(0.1) * it2__116_171_27_gen_0[i:I, j:J, k:K])), tem__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        t__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, RETURN_VALUE__8c8_4_11__ab0_3_8__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], t__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        i__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (it2__116_171_27_gen_0[i:I, j:J, k:K] + np.float64(np.int64(1))), i__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        tem__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(113.16000000000003) + (np.float64(0.1) * i__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])), tem__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, RETURN_VALUE__8c8_4_11__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], RETURN_VALUE__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        diff__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (RETURN_VALUE__ab0_4_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - t__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K]), diff__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        z__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(0.0), z__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        desw__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.maximum(z__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], diff__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K]), desw__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, desw__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], des2__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        mask_140013216367888_gen_0[i:I, j:J, k:K] = (it2__116_171_27_gen_0[i:I, j:J, k:K] == np.float64((np.int64(2621) - np.int64(1))))
+        i__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), (it2__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1))), i__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        mask_140013193661392_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193661392_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193661392_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193661392_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193661392_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013193661392_gen_0[i:I, j:J, k:K]))), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013193661392_gen_0[i:I, j:J, k:K]))), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013193661392_gen_0[i:I, j:J, k:K]))), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013193661392_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        mask_140013193846416_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])) * table__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])), table__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), np.int64(1598), i__d48_18_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), np.int64(1600), i__d48_21_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013193846416_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        mask_140013191068752_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), np.int64(1599), i__d48_29_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), np.int64(1601), i__d48_32_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), mask_140013191068752_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        t_m1__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), table2__918_4_15__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], t_m1__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        diff__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), (t__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] - t_m1__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K]), diff__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013216367888_gen_0[i:I, j:J, k:K]), np.maximum(z__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], diff__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K]), des2__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        desw__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, des2__0a3_7_11__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], desw__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K])
+        desw2__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, desw__85c_6_12__116_171_27_gen_0[i:I, j:J, k:K], desw2__116_171_27_gen_0[i:I, j:J, k:K])
+        tem__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(113.16000000000003) + (np.float64(0.1) * it2_p1__116_171_27_gen_0[i:I, j:J, k:K])), tem__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        t__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, RETURN_VALUE__8c8_4_11__ab0_3_8__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], t__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        i__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (it2_p1__116_171_27_gen_0[i:I, j:J, k:K] + np.float64(np.int64(1))), i__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        tem__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(113.16000000000003) + (np.float64(0.1) * i__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])), tem__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, RETURN_VALUE__8c8_4_11__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], RETURN_VALUE__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        diff__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (RETURN_VALUE__ab0_4_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - t__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K]), diff__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        z__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(0.0), z__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        desw__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, np.maximum(z__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], diff__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K]), desw__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, desw__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], des2__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        mask_140013203953872_gen_0[i:I, j:J, k:K] = (it2_p1__116_171_27_gen_0[i:I, j:J, k:K] == np.float64((np.int64(2621) - np.int64(1))))
+        i__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), (it2_p1__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1))), i__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        mask_140013207376912_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013207376912_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013207376912_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013207376912_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013207376912_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013207376912_gen_0[i:I, j:J, k:K]))), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013207376912_gen_0[i:I, j:J, k:K]))), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013207376912_gen_0[i:I, j:J, k:K]))), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013207376912_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        mask_140013193567696_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])) * table__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])), table__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), np.int64(1598), i__d48_18_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), np.int64(1600), i__d48_21_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013193567696_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        mask_140013192672272_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), np.int64(1599), i__d48_29_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), np.int64(1601), i__d48_32_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), mask_140013192672272_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        t_m1__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), table2__918_4_15__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], t_m1__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        diff__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), (t__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] - t_m1__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K]), diff__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013203953872_gen_0[i:I, j:J, k:K]), np.maximum(z__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], diff__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K]), des2__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        desw__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, des2__0a3_7_11__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], desw__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K])
+        desw_p1__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, desw__85c_7_14__116_171_27_gen_0[i:I, j:J, k:K], desw_p1__116_171_27_gen_0[i:I, j:J, k:K])
+        es__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (tablew__116_171_27_gen_0[i:I, j:J, k:K] + ((ap1__116_171_27_gen_0[i:I, j:J, k:K] - it__116_171_27_gen_0[i:I, j:J, k:K]) * desw__116_171_27_gen_0[i:I, j:J, k:K])), es__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K])
+        denom__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, ((np.float64(461.5) * pt1_gen_0[i:I, j:J, k:K]) * den_gen_0[i:I, j:J, k:K]), denom__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K])
+        wqsat__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (es__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K] / denom__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K]), wqsat__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K])
+        dqdt__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(10.0) * (desw2__116_171_27_gen_0[i:I, j:J, k:K] + ((ap1__116_171_27_gen_0[i:I, j:J, k:K] - it2__116_171_27_gen_0[i:I, j:J, k:K]) * (desw_p1__116_171_27_gen_0[i:I, j:J, k:K] - desw2__116_171_27_gen_0[i:I, j:J, k:K])))), dqdt__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K])
+        dqdt__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, (dqdt__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K] / denom__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K]), dqdt__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K])
+        wqsat__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, wqsat__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K], wqsat__116_171_27_gen_0[i:I, j:J, k:K])
+        dqdt__116_171_27_gen_0[i:I, j:J, k:K] = np.where(last_step, dqdt__23f_8_18__116_171_27_gen_0[i:I, j:J, k:K], dqdt__116_171_27_gen_0[i:I, j:J, k:K])
+        wqsat_gen_0[i:I, j:J, k:K] = np.where(last_step, wqsat__116_171_27_gen_0[i:I, j:J, k:K], wqsat_gen_0[i:I, j:J, k:K])
+        dq2dt_gen_0[i:I, j:J, k:K] = np.where(last_step, dqdt__116_171_27_gen_0[i:I, j:J, k:K], dq2dt_gen_0[i:I, j:J, k:K])
+        dq0_gen_0[i:I, j:J, k:K] = np.where(last_step, ((qv[i:I, j:J, k:K] - wqsat_gen_0[i:I, j:J, k:K]) / (np.float64(1.0) + (tcp3_gen_0[i:I, j:J, k:K] * dq2dt_gen_0[i:I, j:J, k:K]))), dq0_gen_0[i:I, j:J, k:K])
+        mask_140013215175952_gen_0[i:I, j:J, k:K] = (dq0_gen_0[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        src_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, mask_140013215175952_gen_0[i:I, j:J, k:K]), dq0_gen_0[i:I, j:J, k:K], src_gen_0[i:I, j:J, k:K])
+        factor__360_3_13__638_177_30_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, (np.bitwise_not(mask_140013215175952_gen_0[i:I, j:J, k:K]))), (-(np.minimum(np.float64(np.int64(1)), ((fac_l2v * np.float64(10.0)) * (np.float64(1.0) - (qv[i:I, j:J, k:K] / wqsat_gen_0[i:I, j:J, k:K])))))), factor__360_3_13__638_177_30_gen_0[i:I, j:J, k:K])
+        factor__638_177_30_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, (np.bitwise_not(mask_140013215175952_gen_0[i:I, j:J, k:K]))), factor__360_3_13__638_177_30_gen_0[i:I, j:J, k:K], factor__638_177_30_gen_0[i:I, j:J, k:K])
+        src__0be_4_10__638_177_30_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, (np.bitwise_not(mask_140013215175952_gen_0[i:I, j:J, k:K]))), (-(np.minimum(ql[i:I, j:J, k:K], (factor__638_177_30_gen_0[i:I, j:J, k:K] * dq0_gen_0[i:I, j:J, k:K])))), src__0be_4_10__638_177_30_gen_0[i:I, j:J, k:K])
+        src__638_177_30_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, (np.bitwise_not(mask_140013215175952_gen_0[i:I, j:J, k:K]))), src__0be_4_10__638_177_30_gen_0[i:I, j:J, k:K], src__638_177_30_gen_0[i:I, j:J, k:K])
+        factor_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, (np.bitwise_not(mask_140013215175952_gen_0[i:I, j:J, k:K]))), factor__638_177_30_gen_0[i:I, j:J, k:K], factor_gen_0[i:I, j:J, k:K])
+        src_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(last_step, (np.bitwise_not(mask_140013215175952_gen_0[i:I, j:J, k:K]))), src__638_177_30_gen_0[i:I, j:J, k:K], src_gen_0[i:I, j:J, k:K])
+        pt1__570_179_38_gen_0[i:I, j:J, k:K] = np.where(last_step, pt1_gen_0[i:I, j:J, k:K], pt1__570_179_38_gen_0[i:I, j:J, k:K])
+        qv__570_179_38_gen_0[i:I, j:J, k:K] = np.where(last_step, qv[i:I, j:J, k:K], qv__570_179_38_gen_0[i:I, j:J, k:K])
+        ql__570_179_38_gen_0[i:I, j:J, k:K] = np.where(last_step, ql[i:I, j:J, k:K], ql__570_179_38_gen_0[i:I, j:J, k:K])
+        q_liq__570_179_38_gen_0[i:I, j:J, k:K] = np.where(last_step, q_liq_gen_0[i:I, j:J, k:K], q_liq__570_179_38_gen_0[i:I, j:J, k:K])
+        qv__570_179_38_gen_0[i:I, j:J, k:K] = np.where(last_step, (qv__570_179_38_gen_0[i:I, j:J, k:K] - src_gen_0[i:I, j:J, k:K]), qv__570_179_38_gen_0[i:I, j:J, k:K])
+        ql__570_179_38_gen_0[i:I, j:J, k:K] = np.where(last_step, (ql__570_179_38_gen_0[i:I, j:J, k:K] + src_gen_0[i:I, j:J, k:K]), ql__570_179_38_gen_0[i:I, j:J, k:K])
+        q_liq__570_179_38_gen_0[i:I, j:J, k:K] = np.where(last_step, (q_liq__570_179_38_gen_0[i:I, j:J, k:K] + src_gen_0[i:I, j:J, k:K]), q_liq__570_179_38_gen_0[i:I, j:J, k:K])
+        cvm__570_179_38_gen_0[i:I, j:J, k:K] = np.where(last_step, (((mc_air_gen_0[i:I, j:J, k:K] + (qv__570_179_38_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__570_179_38_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__570_179_38_gen_0[i:I, j:J, k:K])
+        pt1__570_179_38_gen_0[i:I, j:J, k:K] = np.where(last_step, (pt1__570_179_38_gen_0[i:I, j:J, k:K] + ((src_gen_0[i:I, j:J, k:K] * lhl_gen_0[i:I, j:J, k:K]) / cvm__570_179_38_gen_0[i:I, j:J, k:K])), pt1__570_179_38_gen_0[i:I, j:J, k:K])
+        qv[i:I, j:J, k:K] = np.where(last_step, qv__570_179_38_gen_0[i:I, j:J, k:K], qv[i:I, j:J, k:K])
+        ql[i:I, j:J, k:K] = np.where(last_step, ql__570_179_38_gen_0[i:I, j:J, k:K], ql[i:I, j:J, k:K])
+        q_liq_gen_0[i:I, j:J, k:K] = np.where(last_step, q_liq__570_179_38_gen_0[i:I, j:J, k:K], q_liq_gen_0[i:I, j:J, k:K])
+        cvm_gen_0[i:I, j:J, k:K] = np.where(last_step, cvm__570_179_38_gen_0[i:I, j:J, k:K], cvm_gen_0[i:I, j:J, k:K])
+        pt1_gen_0[i:I, j:J, k:K] = np.where(last_step, pt1__570_179_38_gen_0[i:I, j:J, k:K], pt1_gen_0[i:I, j:J, k:K])
+        lhl__958_3_16__2b3_183_35_gen_0[i:I, j:J, k:K] = np.where(last_step, (lv00 + (d0_vap * pt1_gen_0[i:I, j:J, k:K])), lhl__958_3_16__2b3_183_35_gen_0[i:I, j:J, k:K])
+        lcp2__958_3_16__2b3_183_35_gen_0[i:I, j:J, k:K] = np.where(last_step, (lhl__958_3_16__2b3_183_35_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K]), lcp2__958_3_16__2b3_183_35_gen_0[i:I, j:J, k:K])
+        lhl__2b3_183_35_gen_0[i:I, j:J, k:K] = np.where(last_step, lhl__958_3_16__2b3_183_35_gen_0[i:I, j:J, k:K], lhl__2b3_183_35_gen_0[i:I, j:J, k:K])
+        lcp2__2b3_183_35_gen_0[i:I, j:J, k:K] = np.where(last_step, lcp2__958_3_16__2b3_183_35_gen_0[i:I, j:J, k:K], lcp2__2b3_183_35_gen_0[i:I, j:J, k:K])
+        lhi__a5e_4_16__2b3_183_35_gen_0[i:I, j:J, k:K] = np.where(last_step, (np.float64(-271059.66000000003) + (np.float64(2213.5) * pt1_gen_0[i:I, j:J, k:K])), lhi__a5e_4_16__2b3_183_35_gen_0[i:I, j:J, k:K])
+        icp2__a5e_4_16__2b3_183_35_gen_0[i:I, j:J, k:K] = np.where(last_step, (lhi__a5e_4_16__2b3_183_35_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K]), icp2__a5e_4_16__2b3_183_35_gen_0[i:I, j:J, k:K])
+        lhi__2b3_183_35_gen_0[i:I, j:J, k:K] = np.where(last_step, lhi__a5e_4_16__2b3_183_35_gen_0[i:I, j:J, k:K], lhi__2b3_183_35_gen_0[i:I, j:J, k:K])
+        icp2__2b3_183_35_gen_0[i:I, j:J, k:K] = np.where(last_step, icp2__a5e_4_16__2b3_183_35_gen_0[i:I, j:J, k:K], icp2__2b3_183_35_gen_0[i:I, j:J, k:K])
+        lhl_gen_0[i:I, j:J, k:K] = np.where(last_step, lhl__2b3_183_35_gen_0[i:I, j:J, k:K], lhl_gen_0[i:I, j:J, k:K])
+        lhi_gen_0[i:I, j:J, k:K] = np.where(last_step, lhi__2b3_183_35_gen_0[i:I, j:J, k:K], lhi_gen_0[i:I, j:J, k:K])
+        lcp2_gen_0[i:I, j:J, k:K] = np.where(last_step, lcp2__2b3_183_35_gen_0[i:I, j:J, k:K], lcp2_gen_0[i:I, j:J, k:K])
+        icp2_gen_0[i:I, j:J, k:K] = np.where(last_step, icp2__2b3_183_35_gen_0[i:I, j:J, k:K], icp2_gen_0[i:I, j:J, k:K])
+        ql__6ab_188_41_gen_0[i:I, j:J, k:K] = ql[i:I, j:J, k:K]
+        qi__6ab_188_41_gen_0[i:I, j:J, k:K] = qi[i:I, j:J, k:K]
+        q_liq__6ab_188_41_gen_0[i:I, j:J, k:K] = q_liq_gen_0[i:I, j:J, k:K]
+        q_sol__6ab_188_41_gen_0[i:I, j:J, k:K] = q_sol_gen_0[i:I, j:J, k:K]
+        pt1__6ab_188_41_gen_0[i:I, j:J, k:K] = pt1_gen_0[i:I, j:J, k:K]
+        cvm__6ab_188_41_gen_0[i:I, j:J, k:K] = cvm_gen_0[i:I, j:J, k:K]
+        dtmp__6ab_188_41_gen_0[i:I, j:J, k:K] = (np.float64(233.16000000000003) - pt1__6ab_188_41_gen_0[i:I, j:J, k:K])
+        mask_140013201943888_gen_0[i:I, j:J, k:K] = np.bitwise_and((ql__6ab_188_41_gen_0[i:I, j:J, k:K] > np.float64(0.0)), (dtmp__6ab_188_41_gen_0[i:I, j:J, k:K] > np.float64(0.0)))
+        sink__6ab_188_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013201943888_gen_0[i:I, j:J, k:K], np.minimum(ql__6ab_188_41_gen_0[i:I, j:J, k:K], (dtmp__6ab_188_41_gen_0[i:I, j:J, k:K] / icp2_gen_0[i:I, j:J, k:K])), sink__6ab_188_41_gen_0[i:I, j:J, k:K])
+        sink__6ab_188_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013201943888_gen_0[i:I, j:J, k:K], np.minimum(sink__6ab_188_41_gen_0[i:I, j:J, k:K], ((ql__6ab_188_41_gen_0[i:I, j:J, k:K] * dtmp__6ab_188_41_gen_0[i:I, j:J, k:K]) * np.float64(0.125))), sink__6ab_188_41_gen_0[i:I, j:J, k:K])
+        ql__6ab_188_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013201943888_gen_0[i:I, j:J, k:K], (ql__6ab_188_41_gen_0[i:I, j:J, k:K] - sink__6ab_188_41_gen_0[i:I, j:J, k:K]), ql__6ab_188_41_gen_0[i:I, j:J, k:K])
+        qi__6ab_188_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013201943888_gen_0[i:I, j:J, k:K], (qi__6ab_188_41_gen_0[i:I, j:J, k:K] + sink__6ab_188_41_gen_0[i:I, j:J, k:K]), qi__6ab_188_41_gen_0[i:I, j:J, k:K])
+        q_liq__6ab_188_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013201943888_gen_0[i:I, j:J, k:K], (q_liq__6ab_188_41_gen_0[i:I, j:J, k:K] - sink__6ab_188_41_gen_0[i:I, j:J, k:K]), q_liq__6ab_188_41_gen_0[i:I, j:J, k:K])
+        q_sol__6ab_188_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013201943888_gen_0[i:I, j:J, k:K], (q_sol__6ab_188_41_gen_0[i:I, j:J, k:K] + sink__6ab_188_41_gen_0[i:I, j:J, k:K]), q_sol__6ab_188_41_gen_0[i:I, j:J, k:K])
+        cvm__6ab_188_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013201943888_gen_0[i:I, j:J, k:K], (((mc_air_gen_0[i:I, j:J, k:K] + (qv[i:I, j:J, k:K] * c_vap)) + (q_liq__6ab_188_41_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__6ab_188_41_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__6ab_188_41_gen_0[i:I, j:J, k:K])
+        pt1__6ab_188_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013201943888_gen_0[i:I, j:J, k:K], (pt1__6ab_188_41_gen_0[i:I, j:J, k:K] + ((sink__6ab_188_41_gen_0[i:I, j:J, k:K] * lhi_gen_0[i:I, j:J, k:K]) / cvm__6ab_188_41_gen_0[i:I, j:J, k:K])), pt1__6ab_188_41_gen_0[i:I, j:J, k:K])
+        ql[i:I, j:J, k:K] = ql__6ab_188_41_gen_0[i:I, j:J, k:K]
+        qi[i:I, j:J, k:K] = qi__6ab_188_41_gen_0[i:I, j:J, k:K]
+        q_liq_gen_0[i:I, j:J, k:K] = q_liq__6ab_188_41_gen_0[i:I, j:J, k:K]
+        q_sol_gen_0[i:I, j:J, k:K] = q_sol__6ab_188_41_gen_0[i:I, j:J, k:K]
+        cvm_gen_0[i:I, j:J, k:K] = cvm__6ab_188_41_gen_0[i:I, j:J, k:K]
+        pt1_gen_0[i:I, j:J, k:K] = pt1__6ab_188_41_gen_0[i:I, j:J, k:K]
+        lhi__a5e_192_20_gen_0[i:I, j:J, k:K] = (np.float64(-271059.66000000003) + (np.float64(2213.5) * pt1_gen_0[i:I, j:J, k:K]))
+        icp2__a5e_192_20_gen_0[i:I, j:J, k:K] = (lhi__a5e_192_20_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K])
+        lhi_gen_0[i:I, j:J, k:K] = lhi__a5e_192_20_gen_0[i:I, j:J, k:K]
+        icp2_gen_0[i:I, j:J, k:K] = icp2__a5e_192_20_gen_0[i:I, j:J, k:K]
+        exptc_gen_0[i:I, j:J, k:K] = np.exp((np.float64(0.66) * (np.float64(273.15000000000003) - pt1_gen_0[i:I, j:J, k:K])))
+        pt1__ca8_195_41_gen_0[i:I, j:J, k:K] = pt1_gen_0[i:I, j:J, k:K]
+        cvm__ca8_195_41_gen_0[i:I, j:J, k:K] = cvm_gen_0[i:I, j:J, k:K]
+        ql__ca8_195_41_gen_0[i:I, j:J, k:K] = ql[i:I, j:J, k:K]
+        qi__ca8_195_41_gen_0[i:I, j:J, k:K] = qi[i:I, j:J, k:K]
+        q_liq__ca8_195_41_gen_0[i:I, j:J, k:K] = q_liq_gen_0[i:I, j:J, k:K]
+        q_sol__ca8_195_41_gen_0[i:I, j:J, k:K] = q_sol_gen_0[i:I, j:J, k:K]
+        tc__ca8_195_41_gen_0[i:I, j:J, k:K] = (np.float64(273.15000000000003) - pt1__ca8_195_41_gen_0[i:I, j:J, k:K])
+        mask_140013204851472_gen_0[i:I, j:J, k:K] = np.bitwise_and((ql__ca8_195_41_gen_0[i:I, j:J, k:K] > np.float64(0.0)), (tc__ca8_195_41_gen_0[i:I, j:J, k:K] > np.float64(0.0)))
+        sink__ca8_195_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013204851472_gen_0[i:I, j:J, k:K], ((((np.float64(3.3333e-10) * mdt) * (exptc_gen_0[i:I, j:J, k:K] - np.float64(1.0))) * den_gen_0[i:I, j:J, k:K]) * np.power(ql__ca8_195_41_gen_0[i:I, j:J, k:K], np.float64(np.int64(2)))), sink__ca8_195_41_gen_0[i:I, j:J, k:K])
+        sink__ca8_195_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013204851472_gen_0[i:I, j:J, k:K], np.minimum(ql__ca8_195_41_gen_0[i:I, j:J, k:K], sink__ca8_195_41_gen_0[i:I, j:J, k:K]), sink__ca8_195_41_gen_0[i:I, j:J, k:K])
+        sink__ca8_195_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013204851472_gen_0[i:I, j:J, k:K], np.minimum(sink__ca8_195_41_gen_0[i:I, j:J, k:K], (tc__ca8_195_41_gen_0[i:I, j:J, k:K] / icp2_gen_0[i:I, j:J, k:K])), sink__ca8_195_41_gen_0[i:I, j:J, k:K])
+        ql__ca8_195_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013204851472_gen_0[i:I, j:J, k:K], (ql__ca8_195_41_gen_0[i:I, j:J, k:K] - sink__ca8_195_41_gen_0[i:I, j:J, k:K]), ql__ca8_195_41_gen_0[i:I, j:J, k:K])
+        qi__ca8_195_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013204851472_gen_0[i:I, j:J, k:K], (qi__ca8_195_41_gen_0[i:I, j:J, k:K] + sink__ca8_195_41_gen_0[i:I, j:J, k:K]), qi__ca8_195_41_gen_0[i:I, j:J, k:K])
+        q_liq__ca8_195_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013204851472_gen_0[i:I, j:J, k:K], (q_liq__ca8_195_41_gen_0[i:I, j:J, k:K] - sink__ca8_195_41_gen_0[i:I, j:J, k:K]), q_liq__ca8_195_41_gen_0[i:I, j:J, k:K])
+        q_sol__ca8_195_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013204851472_gen_0[i:I, j:J, k:K], (q_sol__ca8_195_41_gen_0[i:I, j:J, k:K] + sink__ca8_195_41_gen_0[i:I, j:J, k:K]), q_sol__ca8_195_41_gen_0[i:I, j:J, k:K])
+        cvm__ca8_195_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013204851472_gen_0[i:I, j:J, k:K], (((mc_air_gen_0[i:I, j:J, k:K] + (qv[i:I, j:J, k:K] * c_vap)) + (q_liq__ca8_195_41_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__ca8_195_41_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__ca8_195_41_gen_0[i:I, j:J, k:K])
+        pt1__ca8_195_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013204851472_gen_0[i:I, j:J, k:K], (pt1__ca8_195_41_gen_0[i:I, j:J, k:K] + ((sink__ca8_195_41_gen_0[i:I, j:J, k:K] * lhi_gen_0[i:I, j:J, k:K]) / cvm__ca8_195_41_gen_0[i:I, j:J, k:K])), pt1__ca8_195_41_gen_0[i:I, j:J, k:K])
+        ql[i:I, j:J, k:K] = ql__ca8_195_41_gen_0[i:I, j:J, k:K]
+        qi[i:I, j:J, k:K] = qi__ca8_195_41_gen_0[i:I, j:J, k:K]
+        q_liq_gen_0[i:I, j:J, k:K] = q_liq__ca8_195_41_gen_0[i:I, j:J, k:K]
+        q_sol_gen_0[i:I, j:J, k:K] = q_sol__ca8_195_41_gen_0[i:I, j:J, k:K]
+        cvm_gen_0[i:I, j:J, k:K] = cvm__ca8_195_41_gen_0[i:I, j:J, k:K]
+        pt1_gen_0[i:I, j:J, k:K] = pt1__ca8_195_41_gen_0[i:I, j:J, k:K]
+        lhi__a5e_212_20_gen_0[i:I, j:J, k:K] = (np.float64(-271059.66000000003) + (np.float64(2213.5) * pt1_gen_0[i:I, j:J, k:K]))
+        icp2__a5e_212_20_gen_0[i:I, j:J, k:K] = (lhi__a5e_212_20_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K])
+        lhi_gen_0[i:I, j:J, k:K] = lhi__a5e_212_20_gen_0[i:I, j:J, k:K]
+        icp2_gen_0[i:I, j:J, k:K] = icp2__a5e_212_20_gen_0[i:I, j:J, k:K]
+        pt1__1ae_214_41_gen_0[i:I, j:J, k:K] = pt1_gen_0[i:I, j:J, k:K]
+        cvm__1ae_214_41_gen_0[i:I, j:J, k:K] = cvm_gen_0[i:I, j:J, k:K]
+        qr__1ae_214_41_gen_0[i:I, j:J, k:K] = qr[i:I, j:J, k:K]
+        qg__1ae_214_41_gen_0[i:I, j:J, k:K] = qg[i:I, j:J, k:K]
+        q_liq__1ae_214_41_gen_0[i:I, j:J, k:K] = q_liq_gen_0[i:I, j:J, k:K]
+        q_sol__1ae_214_41_gen_0[i:I, j:J, k:K] = q_sol_gen_0[i:I, j:J, k:K]
+        dtmp__1ae_214_41_gen_0[i:I, j:J, k:K] = ((np.float64(273.16) - np.float64(0.1)) - pt1__1ae_214_41_gen_0[i:I, j:J, k:K])
+        mask_140013205830160_gen_0[i:I, j:J, k:K] = np.bitwise_and((qr__1ae_214_41_gen_0[i:I, j:J, k:K] > np.float64(1e-07)), (dtmp__1ae_214_41_gen_0[i:I, j:J, k:K] > np.float64(0.0)))
+        rainfac__1ae_214_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013205830160_gen_0[i:I, j:J, k:K], np.power((dtmp__1ae_214_41_gen_0[i:I, j:J, k:K] * np.float64(0.025)), np.float64(np.int64(2))), rainfac__1ae_214_41_gen_0[i:I, j:J, k:K])
+        tmp__1ae_214_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013205830160_gen_0[i:I, j:J, k:K], np.where((np.float64(1.0) < rainfac__1ae_214_41_gen_0[i:I, j:J, k:K]), qr__1ae_214_41_gen_0[i:I, j:J, k:K], (rainfac__1ae_214_41_gen_0[i:I, j:J, k:K] * qr__1ae_214_41_gen_0[i:I, j:J, k:K])), tmp__1ae_214_41_gen_0[i:I, j:J, k:K])
+        sink__1ae_214_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013205830160_gen_0[i:I, j:J, k:K], np.minimum(tmp__1ae_214_41_gen_0[i:I, j:J, k:K], ((fac_r2g * dtmp__1ae_214_41_gen_0[i:I, j:J, k:K]) / icp2_gen_0[i:I, j:J, k:K])), sink__1ae_214_41_gen_0[i:I, j:J, k:K])
+        qr__1ae_214_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013205830160_gen_0[i:I, j:J, k:K], (qr__1ae_214_41_gen_0[i:I, j:J, k:K] - sink__1ae_214_41_gen_0[i:I, j:J, k:K]), qr__1ae_214_41_gen_0[i:I, j:J, k:K])
+        qg__1ae_214_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013205830160_gen_0[i:I, j:J, k:K], (qg__1ae_214_41_gen_0[i:I, j:J, k:K] + sink__1ae_214_41_gen_0[i:I, j:J, k:K]), qg__1ae_214_41_gen_0[i:I, j:J, k:K])
+        q_liq__1ae_214_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013205830160_gen_0[i:I, j:J, k:K], (q_liq__1ae_214_41_gen_0[i:I, j:J, k:K] - sink__1ae_214_41_gen_0[i:I, j:J, k:K]), q_liq__1ae_214_41_gen_0[i:I, j:J, k:K])
+        q_sol__1ae_214_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013205830160_gen_0[i:I, j:J, k:K], (q_sol__1ae_214_41_gen_0[i:I, j:J, k:K] + sink__1ae_214_41_gen_0[i:I, j:J, k:K]), q_sol__1ae_214_41_gen_0[i:I, j:J, k:K])
+        cvm__1ae_214_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013205830160_gen_0[i:I, j:J, k:K], (((mc_air_gen_0[i:I, j:J, k:K] + (qv[i:I, j:J, k:K] * c_vap)) + (q_liq__1ae_214_41_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__1ae_214_41_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__1ae_214_41_gen_0[i:I, j:J, k:K])
+        pt1__1ae_214_41_gen_0[i:I, j:J, k:K] = np.where(mask_140013205830160_gen_0[i:I, j:J, k:K], (pt1__1ae_214_41_gen_0[i:I, j:J, k:K] + ((sink__1ae_214_41_gen_0[i:I, j:J, k:K] * lhi_gen_0[i:I, j:J, k:K]) / cvm__1ae_214_41_gen_0[i:I, j:J, k:K])), pt1__1ae_214_41_gen_0[i:I, j:J, k:K])
+        qr[i:I, j:J, k:K] = qr__1ae_214_41_gen_0[i:I, j:J, k:K]
+        qg[i:I, j:J, k:K] = qg__1ae_214_41_gen_0[i:I, j:J, k:K]
+        q_liq_gen_0[i:I, j:J, k:K] = q_liq__1ae_214_41_gen_0[i:I, j:J, k:K]
+        q_sol_gen_0[i:I, j:J, k:K] = q_sol__1ae_214_41_gen_0[i:I, j:J, k:K]
+        cvm_gen_0[i:I, j:J, k:K] = cvm__1ae_214_41_gen_0[i:I, j:J, k:K]
+        pt1_gen_0[i:I, j:J, k:K] = pt1__1ae_214_41_gen_0[i:I, j:J, k:K]
+        lhi__a5e_217_20_gen_0[i:I, j:J, k:K] = (np.float64(-271059.66000000003) + (np.float64(2213.5) * pt1_gen_0[i:I, j:J, k:K]))
+        icp2__a5e_217_20_gen_0[i:I, j:J, k:K] = (lhi__a5e_217_20_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K])
+        lhi_gen_0[i:I, j:J, k:K] = lhi__a5e_217_20_gen_0[i:I, j:J, k:K]
+        icp2_gen_0[i:I, j:J, k:K] = icp2__a5e_217_20_gen_0[i:I, j:J, k:K]
+        pt1__4d6_219_45_gen_0[i:I, j:J, k:K] = pt1_gen_0[i:I, j:J, k:K]
+        cvm__4d6_219_45_gen_0[i:I, j:J, k:K] = cvm_gen_0[i:I, j:J, k:K]
+        qs__4d6_219_45_gen_0[i:I, j:J, k:K] = qs[i:I, j:J, k:K]
+        ql__4d6_219_45_gen_0[i:I, j:J, k:K] = ql[i:I, j:J, k:K]
+        qr__4d6_219_45_gen_0[i:I, j:J, k:K] = qr[i:I, j:J, k:K]
+        q_liq__4d6_219_45_gen_0[i:I, j:J, k:K] = q_liq_gen_0[i:I, j:J, k:K]
+        q_sol__4d6_219_45_gen_0[i:I, j:J, k:K] = q_sol_gen_0[i:I, j:J, k:K]
+        qs_mlt__4d6_219_45_gen_0[i:I, j:J, k:K] = np.float64(1e-06)
+        dtmp__4d6_219_45_gen_0[i:I, j:J, k:K] = (pt1__4d6_219_45_gen_0[i:I, j:J, k:K] - (np.float64(273.16) + np.float64(0.1)))
+        diff__73d_6_12__4d6_219_45_gen_0[i:I, j:J, k:K] = np.where(((qs_mlt__4d6_219_45_gen_0[i:I, j:J, k:K] - ql__4d6_219_45_gen_0[i:I, j:J, k:K]) > np.float64(np.int64(0))), (qs_mlt__4d6_219_45_gen_0[i:I, j:J, k:K] - ql__4d6_219_45_gen_0[i:I, j:J, k:K]), np.float64(np.int64(0)))
+        dimqs__4d6_219_45_gen_0[i:I, j:J, k:K] = diff__73d_6_12__4d6_219_45_gen_0[i:I, j:J, k:K]
+        mask_140013204219920_gen_0[i:I, j:J, k:K] = np.bitwise_and((qs__4d6_219_45_gen_0[i:I, j:J, k:K] > np.float64(1e-07)), (dtmp__4d6_219_45_gen_0[i:I, j:J, k:K] > np.float64(0.0)))
+        snowfac__4d6_219_45_gen_0[i:I, j:J, k:K] = np.where(mask_140013204219920_gen_0[i:I, j:J, k:K], np.power((dtmp__4d6_219_45_gen_0[i:I, j:J, k:K] * np.float64(0.1)), np.float64(np.int64(2))), snowfac__4d6_219_45_gen_0[i:I, j:J, k:K])
+        tmp__4d6_219_45_gen_0[i:I, j:J, k:K] = np.where(mask_140013204219920_gen_0[i:I, j:J, k:K], np.where((np.float64(1.0) < snowfac__4d6_219_45_gen_0[i:I, j:J, k:K]), qs__4d6_219_45_gen_0[i:I, j:J, k:K], (snowfac__4d6_219_45_gen_0[i:I, j:J, k:K] * qs__4d6_219_45_gen_0[i:I, j:J, k:K])), tmp__4d6_219_45_gen_0[i:I, j:J, k:K])
+        sink__4d6_219_45_gen_0[i:I, j:J, k:K] = np.where(mask_140013204219920_gen_0[i:I, j:J, k:K], np.minimum(tmp__4d6_219_45_gen_0[i:I, j:J, k:K], ((fac_smlt * dtmp__4d6_219_45_gen_0[i:I, j:J, k:K]) / icp2_gen_0[i:I, j:J, k:K])), sink__4d6_219_45_gen_0[i:I, j:J, k:K])
+        tmp__4d6_219_45_gen_0[i:I, j:J, k:K] = np.where(mask_140013204219920_gen_0[i:I, j:J, k:K], np.minimum(sink__4d6_219_45_gen_0[i:I, j:J, k:K], dimqs__4d6_219_45_gen_0[i:I, j:J, k:K]), tmp__4d6_219_45_gen_0[i:I, j:J, k:K])
+        qs__4d6_219_45_gen_0[i:I, j:J, k:K] = np.where(mask_140013204219920_gen_0[i:I, j:J, k:K], (qs__4d6_219_45_gen_0[i:I, j:J, k:K] - sink__4d6_219_45_gen_0[i:I, j:J, k:K]), qs__4d6_219_45_gen_0[i:I, j:J, k:K])
+        ql__4d6_219_45_gen_0[i:I, j:J, k:K] = np.where(mask_140013204219920_gen_0[i:I, j:J, k:K], (ql__4d6_219_45_gen_0[i:I, j:J, k:K] + tmp__4d6_219_45_gen_0[i:I, j:J, k:K]), ql__4d6_219_45_gen_0[i:I, j:J, k:K])
+        qr__4d6_219_45_gen_0[i:I, j:J, k:K] = np.where(mask_140013204219920_gen_0[i:I, j:J, k:K], ((qr__4d6_219_45_gen_0[i:I, j:J, k:K] + sink__4d6_219_45_gen_0[i:I, j:J, k:K]) - tmp__4d6_219_45_gen_0[i:I, j:J, k:K]), qr__4d6_219_45_gen_0[i:I, j:J, k:K])
+        q_liq__4d6_219_45_gen_0[i:I, j:J, k:K] = np.where(mask_140013204219920_gen_0[i:I, j:J, k:K], (q_liq__4d6_219_45_gen_0[i:I, j:J, k:K] + sink__4d6_219_45_gen_0[i:I, j:J, k:K]), q_liq__4d6_219_45_gen_0[i:I, j:J, k:K])
+        q_sol__4d6_219_45_gen_0[i:I, j:J, k:K] = np.where(mask_140013204219920_gen_0[i:I, j:J, k:K], (q_sol__4d6_219_45_gen_0[i:I, j:J, k:K] - sink__4d6_219_45_gen_0[i:I, j:J, k:K]), q_sol__4d6_219_45_gen_0[i:I, j:J, k:K])
+        cvm__4d6_219_45_gen_0[i:I, j:J, k:K] = np.where(mask_140013204219920_gen_0[i:I, j:J, k:K], (((mc_air_gen_0[i:I, j:J, k:K] + (qv[i:I, j:J, k:K] * c_vap)) + (q_liq__4d6_219_45_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__4d6_219_45_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__4d6_219_45_gen_0[i:I, j:J, k:K])
+        pt1__4d6_219_45_gen_0[i:I, j:J, k:K] = np.where(mask_140013204219920_gen_0[i:I, j:J, k:K], (pt1__4d6_219_45_gen_0[i:I, j:J, k:K] - ((sink__4d6_219_45_gen_0[i:I, j:J, k:K] * lhi_gen_0[i:I, j:J, k:K]) / cvm__4d6_219_45_gen_0[i:I, j:J, k:K])), pt1__4d6_219_45_gen_0[i:I, j:J, k:K])
+        qs[i:I, j:J, k:K] = qs__4d6_219_45_gen_0[i:I, j:J, k:K]
+        ql[i:I, j:J, k:K] = ql__4d6_219_45_gen_0[i:I, j:J, k:K]
+        qr[i:I, j:J, k:K] = qr__4d6_219_45_gen_0[i:I, j:J, k:K]
+        q_liq_gen_0[i:I, j:J, k:K] = q_liq__4d6_219_45_gen_0[i:I, j:J, k:K]
+        q_sol_gen_0[i:I, j:J, k:K] = q_sol__4d6_219_45_gen_0[i:I, j:J, k:K]
+        cvm_gen_0[i:I, j:J, k:K] = cvm__4d6_219_45_gen_0[i:I, j:J, k:K]
+        pt1_gen_0[i:I, j:J, k:K] = pt1__4d6_219_45_gen_0[i:I, j:J, k:K]
+        ql__d52_236_17_gen_0[i:I, j:J, k:K] = ql[i:I, j:J, k:K]
+        qr__d52_236_17_gen_0[i:I, j:J, k:K] = qr[i:I, j:J, k:K]
+        ql0_max__d52_236_17_gen_0[i:I, j:J, k:K] = np.float64(0.002)
+        mask_140013217819472_gen_0[i:I, j:J, k:K] = (ql__d52_236_17_gen_0[i:I, j:J, k:K] > ql0_max__d52_236_17_gen_0[i:I, j:J, k:K])
+        sink__d52_236_17_gen_0[i:I, j:J, k:K] = np.where(mask_140013217819472_gen_0[i:I, j:J, k:K], (fac_l2r * (ql__d52_236_17_gen_0[i:I, j:J, k:K] - ql0_max__d52_236_17_gen_0[i:I, j:J, k:K])), sink__d52_236_17_gen_0[i:I, j:J, k:K])
+        qr__d52_236_17_gen_0[i:I, j:J, k:K] = np.where(mask_140013217819472_gen_0[i:I, j:J, k:K], (qr__d52_236_17_gen_0[i:I, j:J, k:K] + sink__d52_236_17_gen_0[i:I, j:J, k:K]), qr__d52_236_17_gen_0[i:I, j:J, k:K])
+        ql__d52_236_17_gen_0[i:I, j:J, k:K] = np.where(mask_140013217819472_gen_0[i:I, j:J, k:K], (ql__d52_236_17_gen_0[i:I, j:J, k:K] - sink__d52_236_17_gen_0[i:I, j:J, k:K]), ql__d52_236_17_gen_0[i:I, j:J, k:K])
+        ql[i:I, j:J, k:K] = ql__d52_236_17_gen_0[i:I, j:J, k:K]
+        qr[i:I, j:J, k:K] = qr__d52_236_17_gen_0[i:I, j:J, k:K]
+        b__73d_3_17__36e_3_10__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K] = np.float64(113.16000000000003)
+        diff__73d_3_17__36e_3_10__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(((pt1_gen_0[i:I, j:J, k:K] - b__73d_3_17__36e_3_10__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K]) > np.float64(np.int64(0))), (pt1_gen_0[i:I, j:J, k:K] - b__73d_3_17__36e_3_10__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K]), np.float64(np.int64(0)))
+        RETURN_VALUE__73d_3_17__36e_3_10__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K] = diff__73d_3_17__36e_3_10__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K]
+        ap1__36e_3_10__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K] = ((np.float64(10.0) * RETURN_VALUE__73d_3_17__36e_3_10__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K]) + np.float64(1.0))
+        ap1__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K] = (np.minimum(ap1__36e_3_10__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K], np.float64(np.int64(2621))) - np.float64(np.int64(1)))
+        it__d99_4_22__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K] = np.floor(ap1__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K])
+        it2__d99_4_22__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K] = np.floor((ap1__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(0.5)))
+        it2_p1__d99_4_22__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K] = (it2__d99_4_22__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K] + np.float64(np.int64(1)))
+        it__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K] = it__d99_4_22__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K]
+        it2__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K] = it2__d99_4_22__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K]
+        it2_p1__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K] = it2_p1__d99_4_22__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K]
+        ap1__a8e_237_22_gen_0[i:I, j:J, k:K] = ap1__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K]
+        it__a8e_237_22_gen_0[i:I, j:J, k:K] = it__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K]
+        it2__a8e_237_22_gen_0[i:I, j:J, k:K] = it2__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K]
+        it2_p1__a8e_237_22_gen_0[i:I, j:J, k:K] = it2_p1__753_3_27__a8e_237_22_gen_0[i:I, j:J, k:K]
+        tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = (np.float64(113.16000000000003) + (np.float64(0.1) * it__a8e_237_22_gen_0[i:I, j:J, k:K]))
+        mask_140013218493200_gen_0[i:I, j:J, k:K] = (it__a8e_237_22_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013218493200_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013218493200_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013218493200_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013218493200_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_6_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013218493200_gen_0[i:I, j:J, k:K])), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013218493200_gen_0[i:I, j:J, k:K])), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013218493200_gen_0[i:I, j:J, k:K])), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013218493200_gen_0[i:I, j:J, k:K])), RETURN_VALUE__265_3_11__8c8_9_17__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013219921680_gen_0[i:I, j:J, k:K] = (it__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_12_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], (it__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_16_12__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])) * table__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])), table__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], np.int64(1598), i__d48_18_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_19_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], np.int64(1600), i__d48_21_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_22_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219921680_gen_0[i:I, j:J, k:K], (np.float64(0.25) * ((table2_m1__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013204210704_gen_0[i:I, j:J, k:K] = (it__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], (it__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_27_16__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], np.int64(1599), i__d48_29_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_30_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], np.int64(1601), i__d48_32_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_33_20__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204210704_gen_0[i:I, j:J, k:K], (np.float64(0.25) * ((table2_m1__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__a8e_237_22_gen_0[i:I, j:J, k:K] = table2__918_4_13__a8e_237_22_gen_0[i:I, j:J, k:K]
+        tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = (np.float64(113.16000000000003) + (np.float64(0.1) * it__a8e_237_22_gen_0[i:I, j:J, k:K]))
+        mask_140013219918480_gen_0[i:I, j:J, k:K] = (it__a8e_237_22_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219918480_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219918480_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219918480_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013219918480_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013219918480_gen_0[i:I, j:J, k:K])), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013219918480_gen_0[i:I, j:J, k:K])), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013219918480_gen_0[i:I, j:J, k:K])), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013219918480_gen_0[i:I, j:J, k:K])), RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013206824400_gen_0[i:I, j:J, k:K] = (it__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], (it__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], (((np.float64(0.05) * (np.float64(273.16) - tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) * table__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), table__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], np.int64(1598), i__d48_18_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], np.int64(1600), i__d48_21_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206824400_gen_0[i:I, j:J, k:K], (np.float64(0.25) * ((table2_m1__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013225299024_gen_0[i:I, j:J, k:K] = (it__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], (it__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], np.int64(1599), i__d48_29_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], np.int64(1601), i__d48_32_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013225299024_gen_0[i:I, j:J, k:K], (np.float64(0.25) * ((table2_m1__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        t__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = table2__918_3_8__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K]
+        i__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = (it__a8e_237_22_gen_0[i:I, j:J, k:K] + np.float64(np.int64(1)))
+        tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K]))
+        mask_140013220997072_gen_0[i:I, j:J, k:K] = (i__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220997072_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220997072_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220997072_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220997072_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013220997072_gen_0[i:I, j:J, k:K])), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013220997072_gen_0[i:I, j:J, k:K])), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013220997072_gen_0[i:I, j:J, k:K])), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013220997072_gen_0[i:I, j:J, k:K])), RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013227215248_gen_0[i:I, j:J, k:K] = (i__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], (i__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) * table__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), table__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], np.int64(1598), i__d48_18_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], np.int64(1600), i__d48_21_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013227215248_gen_0[i:I, j:J, k:K], (np.float64(0.25) * ((table2_m1__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013193691856_gen_0[i:I, j:J, k:K] = (i__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], (i__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], np.int64(1599), i__d48_29_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], np.int64(1601), i__d48_32_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013193691856_gen_0[i:I, j:J, k:K], (np.float64(0.25) * ((table2_m1__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = table2__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K]
+        diff__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = (RETURN_VALUE__918_4_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - t__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        z__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.float64(0.0)
+        des2__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.maximum(z__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], diff__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = des2__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K]
+        mask_140013204430672_gen_0[i:I, j:J, k:K] = (it__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64((np.int64(2621) - np.int64(1))))
+        i__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204430672_gen_0[i:I, j:J, k:K], (it__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1))), i__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204430672_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013210072848_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013210072848_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013210072848_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013210072848_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013210072848_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013210072848_gen_0[i:I, j:J, k:K]))), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013210072848_gen_0[i:I, j:J, k:K]))), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013210072848_gen_0[i:I, j:J, k:K]))), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013210072848_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013207744848_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) * table__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), table__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), np.int64(1598), i__d48_18_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), np.int64(1600), i__d48_21_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207744848_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013207054096_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), np.int64(1599), i__d48_29_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), np.int64(1601), i__d48_32_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013204430672_gen_0[i:I, j:J, k:K], mask_140013207054096_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        t_m1__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204430672_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], t_m1__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        diff__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204430672_gen_0[i:I, j:J, k:K], (t__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] - t_m1__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K]), diff__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013204430672_gen_0[i:I, j:J, k:K], np.maximum(z__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K], diff__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K]), des2__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K])
+        des2__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K] = des2__0a3_7_11__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K]
+        des2__a8e_237_22_gen_0[i:I, j:J, k:K] = des2__964_5_11__a8e_237_22_gen_0[i:I, j:J, k:K]
+        tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = (np.float64(113.16000000000003) + (np.float64(0.1) * it2__a8e_237_22_gen_0[i:I, j:J, k:K]))
+        mask_140013206226320_gen_0[i:I, j:J, k:K] = (it2__a8e_237_22_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206226320_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206226320_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206226320_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206226320_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013206226320_gen_0[i:I, j:J, k:K])), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013206226320_gen_0[i:I, j:J, k:K])), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013206226320_gen_0[i:I, j:J, k:K])), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013206226320_gen_0[i:I, j:J, k:K])), RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013223152272_gen_0[i:I, j:J, k:K] = (it2__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], (it2__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], (((np.float64(0.05) * (np.float64(273.16) - tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) * table__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), table__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], np.int64(1598), i__d48_18_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], np.int64(1600), i__d48_21_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013223152272_gen_0[i:I, j:J, k:K], (np.float64(0.25) * ((table2_m1__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013228243344_gen_0[i:I, j:J, k:K] = (it2__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], (it2__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], np.int64(1599), i__d48_29_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], np.int64(1601), i__d48_32_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013228243344_gen_0[i:I, j:J, k:K], (np.float64(0.25) * ((table2_m1__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        t__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = table2__918_3_8__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K]
+        i__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = (it2__a8e_237_22_gen_0[i:I, j:J, k:K] + np.float64(np.int64(1)))
+        tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K]))
+        mask_140013206315664_gen_0[i:I, j:J, k:K] = (i__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206315664_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206315664_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206315664_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206315664_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013206315664_gen_0[i:I, j:J, k:K])), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013206315664_gen_0[i:I, j:J, k:K])), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013206315664_gen_0[i:I, j:J, k:K])), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013206315664_gen_0[i:I, j:J, k:K])), RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013192161808_gen_0[i:I, j:J, k:K] = (i__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], (i__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) * table__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), table__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], np.int64(1598), i__d48_18_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], np.int64(1600), i__d48_21_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192161808_gen_0[i:I, j:J, k:K], (np.float64(0.25) * ((table2_m1__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013208482640_gen_0[i:I, j:J, k:K] = (i__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], (i__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], np.int64(1599), i__d48_29_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], np.int64(1601), i__d48_32_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208482640_gen_0[i:I, j:J, k:K], (np.float64(0.25) * ((table2_m1__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = table2__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K]
+        diff__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = (RETURN_VALUE__918_4_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - t__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        z__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.float64(0.0)
+        des2__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.maximum(z__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], diff__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = des2__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K]
+        mask_140013208086992_gen_0[i:I, j:J, k:K] = (it2__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64((np.int64(2621) - np.int64(1))))
+        i__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208086992_gen_0[i:I, j:J, k:K], (it2__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1))), i__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208086992_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013215821840_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821840_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821840_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821840_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821840_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013215821840_gen_0[i:I, j:J, k:K]))), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013215821840_gen_0[i:I, j:J, k:K]))), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013215821840_gen_0[i:I, j:J, k:K]))), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013215821840_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013215821584_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) * table__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), table__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), np.int64(1598), i__d48_18_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), np.int64(1600), i__d48_21_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013215821584_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013193902224_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), np.int64(1599), i__d48_29_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), np.int64(1601), i__d48_32_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013208086992_gen_0[i:I, j:J, k:K], mask_140013193902224_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        t_m1__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208086992_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], t_m1__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        diff__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208086992_gen_0[i:I, j:J, k:K], (t__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] - t_m1__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K]), diff__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013208086992_gen_0[i:I, j:J, k:K], np.maximum(z__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K], diff__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K]), des2__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K])
+        des2__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K] = des2__0a3_7_11__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K]
+        des22__a8e_237_22_gen_0[i:I, j:J, k:K] = des2__964_6_12__a8e_237_22_gen_0[i:I, j:J, k:K]
+        tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = (np.float64(113.16000000000003) + (np.float64(0.1) * it2_p1__a8e_237_22_gen_0[i:I, j:J, k:K]))
+        mask_140013190039184_gen_0[i:I, j:J, k:K] = (it2_p1__a8e_237_22_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013190039184_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013190039184_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013190039184_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013190039184_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013190039184_gen_0[i:I, j:J, k:K])), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013190039184_gen_0[i:I, j:J, k:K])), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013190039184_gen_0[i:I, j:J, k:K])), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013190039184_gen_0[i:I, j:J, k:K])), RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013209319120_gen_0[i:I, j:J, k:K] = (it2_p1__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], (it2_p1__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], (((np.float64(0.05) * (np.float64(273.16) - tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) * table__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), table__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], np.int64(1598), i__d48_18_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], np.int64(1600), i__d48_21_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013209319120_gen_0[i:I, j:J, k:K], (np.float64(0.25) * ((table2_m1__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013220993360_gen_0[i:I, j:J, k:K] = (it2_p1__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], (it2_p1__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], np.int64(1599), i__d48_29_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], np.int64(1601), i__d48_32_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013220993360_gen_0[i:I, j:J, k:K], (np.float64(0.25) * ((table2_m1__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        t__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = table2__918_3_8__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K]
+        i__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = (it2_p1__a8e_237_22_gen_0[i:I, j:J, k:K] + np.float64(np.int64(1)))
+        tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K]))
+        mask_140013192070672_gen_0[i:I, j:J, k:K] = (i__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192070672_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192070672_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192070672_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192070672_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013192070672_gen_0[i:I, j:J, k:K])), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013192070672_gen_0[i:I, j:J, k:K])), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013192070672_gen_0[i:I, j:J, k:K])), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013192070672_gen_0[i:I, j:J, k:K])), RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013192278864_gen_0[i:I, j:J, k:K] = (i__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], (i__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) * table__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), table__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], np.int64(1598), i__d48_18_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], np.int64(1600), i__d48_21_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013192278864_gen_0[i:I, j:J, k:K], (np.float64(0.25) * ((table2_m1__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013214068048_gen_0[i:I, j:J, k:K] = (i__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], (i__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], np.int64(1599), i__d48_29_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], np.int64(1601), i__d48_32_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013214068048_gen_0[i:I, j:J, k:K], (np.float64(0.25) * ((table2_m1__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = table2__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K]
+        diff__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = (RETURN_VALUE__918_4_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - t__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        z__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.float64(0.0)
+        des2__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.maximum(z__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], diff__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = des2__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K]
+        mask_140013206864464_gen_0[i:I, j:J, k:K] = (it2_p1__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64((np.int64(2621) - np.int64(1))))
+        i__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206864464_gen_0[i:I, j:J, k:K], (it2_p1__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1))), i__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206864464_gen_0[i:I, j:J, k:K], (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013205437136_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013205437136_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013205437136_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013205437136_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013205437136_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013205437136_gen_0[i:I, j:J, k:K]))), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013205437136_gen_0[i:I, j:J, k:K]))), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013205437136_gen_0[i:I, j:J, k:K]))), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_140013205437136_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013192120336_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) * table__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), table__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), np.int64(1598), i__d48_18_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), np.int64(1600), i__d48_21_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013192120336_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        mask_140013226091152_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), np.int64(1599), i__d48_29_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), np.int64(1601), i__d48_32_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013206864464_gen_0[i:I, j:J, k:K], mask_140013226091152_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        t_m1__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206864464_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], t_m1__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        diff__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206864464_gen_0[i:I, j:J, k:K], (t__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] - t_m1__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K]), diff__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = np.where(mask_140013206864464_gen_0[i:I, j:J, k:K], np.maximum(z__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K], diff__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K]), des2__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K])
+        des2__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K] = des2__0a3_7_11__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K]
+        des2_p1__a8e_237_22_gen_0[i:I, j:J, k:K] = des2__964_7_14__a8e_237_22_gen_0[i:I, j:J, k:K]
+        es__23f_8_18__a8e_237_22_gen_0[i:I, j:J, k:K] = (table2__a8e_237_22_gen_0[i:I, j:J, k:K] + ((ap1__a8e_237_22_gen_0[i:I, j:J, k:K] - it__a8e_237_22_gen_0[i:I, j:J, k:K]) * des2__a8e_237_22_gen_0[i:I, j:J, k:K]))
+        denom__23f_8_18__a8e_237_22_gen_0[i:I, j:J, k:K] = ((np.float64(461.5) * pt1_gen_0[i:I, j:J, k:K]) * den_gen_0[i:I, j:J, k:K])
+        wqsat__23f_8_18__a8e_237_22_gen_0[i:I, j:J, k:K] = (es__23f_8_18__a8e_237_22_gen_0[i:I, j:J, k:K] / denom__23f_8_18__a8e_237_22_gen_0[i:I, j:J, k:K])
+        dqdt__23f_8_18__a8e_237_22_gen_0[i:I, j:J, k:K] = (np.float64(10.0) * (des22__a8e_237_22_gen_0[i:I, j:J, k:K] + ((ap1__a8e_237_22_gen_0[i:I, j:J, k:K] - it2__a8e_237_22_gen_0[i:I, j:J, k:K]) * (des2_p1__a8e_237_22_gen_0[i:I, j:J, k:K] - des22__a8e_237_22_gen_0[i:I, j:J, k:K]))))
+        dqdt__23f_8_18__a8e_237_22_gen_0[i:I, j:J, k:K] = (dqdt__23f_8_18__a8e_237_22_gen_0[i:I, j:J, k:K] / denom__23f_8_18__a8e_237_22_gen_0[i:I, j:J, k:K])
+        wqsat__a8e_237_22_gen_0[i:I, j:J, k:K] = wqsat__23f_8_18__a8e_237_22_gen_0[i:I, j:J, k:K]
+        dqdt__a8e_237_22_gen_0[i:I, j:J, k:K] = dqdt__23f_8_18__a8e_237_22_gen_0[i:I, j:J, k:K]
+        iqs2_gen_0[i:I, j:J, k:K] = wqsat__a8e_237_22_gen_0[i:I, j:J, k:K]
+        dqsdt_gen_0[i:I, j:J, k:K] = dqdt__a8e_237_22_gen_0[i:I, j:J, k:K]
+        expsubl_gen_0[i:I, j:J, k:K] = np.exp((np.float64(0.875) * np.log((qi[i:I, j:J, k:K] * den_gen_0[i:I, j:J, k:K]))))
+        lhl__958_3_16__2b3_239_31_gen_0[i:I, j:J, k:K] = (lv00 + (d0_vap * pt1_gen_0[i:I, j:J, k:K]))
+        lcp2__958_3_16__2b3_239_31_gen_0[i:I, j:J, k:K] = (lhl__958_3_16__2b3_239_31_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K])
+        lhl__2b3_239_31_gen_0[i:I, j:J, k:K] = lhl__958_3_16__2b3_239_31_gen_0[i:I, j:J, k:K]
+        lcp2__2b3_239_31_gen_0[i:I, j:J, k:K] = lcp2__958_3_16__2b3_239_31_gen_0[i:I, j:J, k:K]
+        lhi__a5e_4_16__2b3_239_31_gen_0[i:I, j:J, k:K] = (np.float64(-271059.66000000003) + (np.float64(2213.5) * pt1_gen_0[i:I, j:J, k:K]))
+        icp2__a5e_4_16__2b3_239_31_gen_0[i:I, j:J, k:K] = (lhi__a5e_4_16__2b3_239_31_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K])
+        lhi__2b3_239_31_gen_0[i:I, j:J, k:K] = lhi__a5e_4_16__2b3_239_31_gen_0[i:I, j:J, k:K]
+        icp2__2b3_239_31_gen_0[i:I, j:J, k:K] = icp2__a5e_4_16__2b3_239_31_gen_0[i:I, j:J, k:K]
+        lhl_gen_0[i:I, j:J, k:K] = lhl__2b3_239_31_gen_0[i:I, j:J, k:K]
+        lhi_gen_0[i:I, j:J, k:K] = lhi__2b3_239_31_gen_0[i:I, j:J, k:K]
+        lcp2_gen_0[i:I, j:J, k:K] = lcp2__2b3_239_31_gen_0[i:I, j:J, k:K]
+        icp2_gen_0[i:I, j:J, k:K] = icp2__2b3_239_31_gen_0[i:I, j:J, k:K]
+        tcp2_gen_0[i:I, j:J, k:K] = (lcp2_gen_0[i:I, j:J, k:K] + icp2_gen_0[i:I, j:J, k:K])
+        adj_fac_gen_0[i:I, j:J, k:K] = np.where(last_step, np.float64(1.0), adj_fac_gen_0[i:I, j:J, k:K])
+        adj_fac_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(last_step)), np.float64(0.9), adj_fac_gen_0[i:I, j:J, k:K])
+        pt1__651_247_34_gen_0[i:I, j:J, k:K] = pt1_gen_0[i:I, j:J, k:K]
+        cvm__651_247_34_gen_0[i:I, j:J, k:K] = cvm_gen_0[i:I, j:J, k:K]
+        qv__651_247_34_gen_0[i:I, j:J, k:K] = qv[i:I, j:J, k:K]
+        qi__651_247_34_gen_0[i:I, j:J, k:K] = qi[i:I, j:J, k:K]
+        q_sol__651_247_34_gen_0[i:I, j:J, k:K] = q_sol_gen_0[i:I, j:J, k:K]
+        qi_gen__651_247_34_gen_0[i:I, j:J, k:K] = np.float64(1.82e-06)
+        qi_lim__651_247_34_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        src__651_247_34_gen_0[i:I, j:J, k:K] = np.float64(0.0)
+        mask_140013192064272_gen_0[i:I, j:J, k:K] = (pt1__651_247_34_gen_0[i:I, j:J, k:K] < np.float64(184.0))
+        b__73d_27_14__651_247_34_gen_0[i:I, j:J, k:K] = np.where(mask_140013192064272_gen_0[i:I, j:J, k:K], np.float64(1e-06), b__73d_27_14__651_247_34_gen_0[i:I, j:J, k:K])
+        diff__73d_27_14__651_247_34_gen_0[i:I, j:J, k:K] = np.where(mask_140013192064272_gen_0[i:I, j:J, k:K], np.where(((qv__651_247_34_gen_0[i:I, j:J, k:K] - b__73d_27_14__651_247_34_gen_0[i:I, j:J, k:K]) > np.float64(np.int64(0))), (qv__651_247_34_gen_0[i:I, j:J, k:K] - b__73d_27_14__651_247_34_gen_0[i:I, j:J, k:K]), np.float64(np.int64(0))), diff__73d_27_14__651_247_34_gen_0[i:I, j:J, k:K])
+        src__651_247_34_gen_0[i:I, j:J, k:K] = np.where(mask_140013192064272_gen_0[i:I, j:J, k:K], diff__73d_27_14__651_247_34_gen_0[i:I, j:J, k:K], src__651_247_34_gen_0[i:I, j:J, k:K])
+        mask_140013192053072_gen_0[i:I, j:J, k:K] = (pt1__651_247_34_gen_0[i:I, j:J, k:K] < np.float64(273.15000000000003))
+        dq__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), (qv__651_247_34_gen_0[i:I, j:J, k:K] - iqs2_gen_0[i:I, j:J, k:K]), dq__651_247_34_gen_0[i:I, j:J, k:K])
+        sink__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), ((adj_fac_gen_0[i:I, j:J, k:K] * dq__651_247_34_gen_0[i:I, j:J, k:K]) / (np.float64(1.0) + (tcp2_gen_0[i:I, j:J, k:K] * dqsdt_gen_0[i:I, j:J, k:K]))), sink__651_247_34_gen_0[i:I, j:J, k:K])
+        mask_140013192054928_gen_0[i:I, j:J, k:K] = (qi__651_247_34_gen_0[i:I, j:J, k:K] > np.float64(1e-08))
+        pidep__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), mask_140013192054928_gen_0[i:I, j:J, k:K]), ((((sdt * dq__651_247_34_gen_0[i:I, j:J, k:K]) * np.float64(349138.78)) * expsubl_gen_0[i:I, j:J, k:K]) / ((((iqs2_gen_0[i:I, j:J, k:K] * den_gen_0[i:I, j:J, k:K]) * np.float64(8029175616400.0)) / ((np.float64(0.0243) * np.float64(461.5)) * np.power(pt1__651_247_34_gen_0[i:I, j:J, k:K], np.float64(2.0)))) + np.float64(44247.8))), pidep__651_247_34_gen_0[i:I, j:J, k:K])
+        pidep__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013192054928_gen_0[i:I, j:J, k:K]))), np.float64(0.0), pidep__651_247_34_gen_0[i:I, j:J, k:K])
+        mask_140013215558864_gen_0[i:I, j:J, k:K] = (dq__651_247_34_gen_0[i:I, j:J, k:K] > np.float64(0.0))
+        tmp__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), mask_140013215558864_gen_0[i:I, j:J, k:K]), (np.float64(273.16) - pt1__651_247_34_gen_0[i:I, j:J, k:K]), tmp__651_247_34_gen_0[i:I, j:J, k:K])
+        qi_crt__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), mask_140013215558864_gen_0[i:I, j:J, k:K]), np.where((qi_lim__651_247_34_gen_0[i:I, j:J, k:K] < (np.float64(0.1) * tmp__651_247_34_gen_0[i:I, j:J, k:K])), ((qi_gen__651_247_34_gen_0[i:I, j:J, k:K] * qi_lim__651_247_34_gen_0[i:I, j:J, k:K]) / den_gen_0[i:I, j:J, k:K]), (((qi_gen__651_247_34_gen_0[i:I, j:J, k:K] * np.float64(0.1)) * tmp__651_247_34_gen_0[i:I, j:J, k:K]) / den_gen_0[i:I, j:J, k:K])), qi_crt__651_247_34_gen_0[i:I, j:J, k:K])
+        maxtmp__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), mask_140013215558864_gen_0[i:I, j:J, k:K]), np.where(((qi_crt__651_247_34_gen_0[i:I, j:J, k:K] - qi__651_247_34_gen_0[i:I, j:J, k:K]) > pidep__651_247_34_gen_0[i:I, j:J, k:K]), (qi_crt__651_247_34_gen_0[i:I, j:J, k:K] - qi__651_247_34_gen_0[i:I, j:J, k:K]), pidep__651_247_34_gen_0[i:I, j:J, k:K]), maxtmp__651_247_34_gen_0[i:I, j:J, k:K])
+        src__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), mask_140013215558864_gen_0[i:I, j:J, k:K]), np.where((sink__651_247_34_gen_0[i:I, j:J, k:K] < maxtmp__651_247_34_gen_0[i:I, j:J, k:K]), sink__651_247_34_gen_0[i:I, j:J, k:K], maxtmp__651_247_34_gen_0[i:I, j:J, k:K]), src__651_247_34_gen_0[i:I, j:J, k:K])
+        src__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), mask_140013215558864_gen_0[i:I, j:J, k:K]), np.where((src__651_247_34_gen_0[i:I, j:J, k:K] < (tmp__651_247_34_gen_0[i:I, j:J, k:K] / tcp2_gen_0[i:I, j:J, k:K])), src__651_247_34_gen_0[i:I, j:J, k:K], (tmp__651_247_34_gen_0[i:I, j:J, k:K] / tcp2_gen_0[i:I, j:J, k:K])), src__651_247_34_gen_0[i:I, j:J, k:K])
+        b__73d_58_21__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013215558864_gen_0[i:I, j:J, k:K]))), np.float64(184.0), b__73d_58_21__651_247_34_gen_0[i:I, j:J, k:K])
+        diff__73d_58_21__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013215558864_gen_0[i:I, j:J, k:K]))), np.where(((pt1__651_247_34_gen_0[i:I, j:J, k:K] - b__73d_58_21__651_247_34_gen_0[i:I, j:J, k:K]) > np.float64(np.int64(0))), (pt1__651_247_34_gen_0[i:I, j:J, k:K] - b__73d_58_21__651_247_34_gen_0[i:I, j:J, k:K]), np.float64(np.int64(0))), diff__73d_58_21__651_247_34_gen_0[i:I, j:J, k:K])
+        dimtmp__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013215558864_gen_0[i:I, j:J, k:K]))), diff__73d_58_21__651_247_34_gen_0[i:I, j:J, k:K], dimtmp__651_247_34_gen_0[i:I, j:J, k:K])
+        pidep__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013215558864_gen_0[i:I, j:J, k:K]))), np.where((np.float64(1.0) < (dimtmp__651_247_34_gen_0[i:I, j:J, k:K] * np.float64(0.2))), pidep__651_247_34_gen_0[i:I, j:J, k:K], ((pidep__651_247_34_gen_0[i:I, j:J, k:K] * dimtmp__651_247_34_gen_0[i:I, j:J, k:K]) * np.float64(0.2))), pidep__651_247_34_gen_0[i:I, j:J, k:K])
+        src__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013215558864_gen_0[i:I, j:J, k:K]))), np.where((pidep__651_247_34_gen_0[i:I, j:J, k:K] > sink__651_247_34_gen_0[i:I, j:J, k:K]), pidep__651_247_34_gen_0[i:I, j:J, k:K], sink__651_247_34_gen_0[i:I, j:J, k:K]), src__651_247_34_gen_0[i:I, j:J, k:K])
+        src__651_247_34_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_140013192064272_gen_0[i:I, j:J, k:K])), mask_140013192053072_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013215558864_gen_0[i:I, j:J, k:K]))), np.where((src__651_247_34_gen_0[i:I, j:J, k:K] > (-(qi__651_247_34_gen_0[i:I, j:J, k:K]))), src__651_247_34_gen_0[i:I, j:J, k:K], (-(qi__651_247_34_gen_0[i:I, j:J, k:K]))), src__651_247_34_gen_0[i:I, j:J, k:K])
+        qv__651_247_34_gen_0[i:I, j:J, k:K] = (qv__651_247_34_gen_0[i:I, j:J, k:K] - src__651_247_34_gen_0[i:I, j:J, k:K])
+        qi__651_247_34_gen_0[i:I, j:J, k:K] = (qi__651_247_34_gen_0[i:I, j:J, k:K] + src__651_247_34_gen_0[i:I, j:J, k:K])
+        q_sol__651_247_34_gen_0[i:I, j:J, k:K] = (q_sol__651_247_34_gen_0[i:I, j:J, k:K] + src__651_247_34_gen_0[i:I, j:J, k:K])
+        cvm__651_247_34_gen_0[i:I, j:J, k:K] = (((mc_air_gen_0[i:I, j:J, k:K] + (qv__651_247_34_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__651_247_34_gen_0[i:I, j:J, k:K] * np.float64(1972.0)))
+        lh__651_247_34_gen_0[i:I, j:J, k:K] = (lhl_gen_0[i:I, j:J, k:K] + lhi_gen_0[i:I, j:J, k:K])
+        pt1__651_247_34_gen_0[i:I, j:J, k:K] = (pt1__651_247_34_gen_0[i:I, j:J, k:K] + ((src__651_247_34_gen_0[i:I, j:J, k:K] * lh__651_247_34_gen_0[i:I, j:J, k:K]) / cvm__651_247_34_gen_0[i:I, j:J, k:K]))
+        qv[i:I, j:J, k:K] = qv__651_247_34_gen_0[i:I, j:J, k:K]
+        qi[i:I, j:J, k:K] = qi__651_247_34_gen_0[i:I, j:J, k:K]
+        q_sol_gen_0[i:I, j:J, k:K] = q_sol__651_247_34_gen_0[i:I, j:J, k:K]
+        cvm_gen_0[i:I, j:J, k:K] = cvm__651_247_34_gen_0[i:I, j:J, k:K]
+        pt1_gen_0[i:I, j:J, k:K] = pt1__651_247_34_gen_0[i:I, j:J, k:K]
+        q_con[i:I, j:J, k:K] = (q_liq_gen_0[i:I, j:J, k:K] + q_sol_gen_0[i:I, j:J, k:K])
+        tmp_gen_0[i:I, j:J, k:K] = (np.float64(1.0) + (zvir * qv[i:I, j:J, k:K]))
+        pt[i:I, j:J, k:K] = ((pt1_gen_0[i:I, j:J, k:K] * tmp_gen_0[i:I, j:J, k:K]) * (np.float64(1.0) - q_con[i:I, j:J, k:K]))
+        tmp_gen_0[i:I, j:J, k:K] = (tmp_gen_0[i:I, j:J, k:K] * np.float64(287.05))
+        cappa[i:I, j:J, k:K] = (tmp_gen_0[i:I, j:J, k:K] / (tmp_gen_0[i:I, j:J, k:K] + cvm_gen_0[i:I, j:J, k:K]))
+        mask_140013191118032_gen_0[i:I, j:J, k:K] = (qg[i:I, j:J, k:K] < np.float64(np.int64(0)))
+        maxtmp_gen_0[i:I, j:J, k:K] = np.where(mask_140013191118032_gen_0[i:I, j:J, k:K], np.maximum(np.float64(0.0), qi[i:I, j:J, k:K]), maxtmp_gen_0[i:I, j:J, k:K])
+        mintmp_gen_0[i:I, j:J, k:K] = np.where(mask_140013191118032_gen_0[i:I, j:J, k:K], np.minimum((-(qg[i:I, j:J, k:K])), maxtmp_gen_0[i:I, j:J, k:K]), mintmp_gen_0[i:I, j:J, k:K])
+        qg[i:I, j:J, k:K] = np.where(mask_140013191118032_gen_0[i:I, j:J, k:K], (qg[i:I, j:J, k:K] + mintmp_gen_0[i:I, j:J, k:K]), qg[i:I, j:J, k:K])
+        qi[i:I, j:J, k:K] = np.where(mask_140013191118032_gen_0[i:I, j:J, k:K], (qi[i:I, j:J, k:K] - mintmp_gen_0[i:I, j:J, k:K]), qi[i:I, j:J, k:K])
+        qg[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013191118032_gen_0[i:I, j:J, k:K])), qg[i:I, j:J, k:K], qg[i:I, j:J, k:K])
+        qim_gen_0[i:I, j:J, k:K] = (np.float64(0.0001) / den_gen_0[i:I, j:J, k:K])
+        mask_140013205480720_gen_0[i:I, j:J, k:K] = (qi[i:I, j:J, k:K] > qim_gen_0[i:I, j:J, k:K])
+        sink_gen_0[i:I, j:J, k:K] = np.where(mask_140013205480720_gen_0[i:I, j:J, k:K], (fac_i2s * (qi[i:I, j:J, k:K] - qim_gen_0[i:I, j:J, k:K])), sink_gen_0[i:I, j:J, k:K])
+        qi[i:I, j:J, k:K] = np.where(mask_140013205480720_gen_0[i:I, j:J, k:K], (qi[i:I, j:J, k:K] - sink_gen_0[i:I, j:J, k:K]), qi[i:I, j:J, k:K])
+        qs[i:I, j:J, k:K] = np.where(mask_140013205480720_gen_0[i:I, j:J, k:K], (qs[i:I, j:J, k:K] + sink_gen_0[i:I, j:J, k:K]), qs[i:I, j:J, k:K])
+        te0[i:I, j:J, k:K] = np.where(consv_te, (dp[i:I, j:J, k:K] * (te0[i:I, j:J, k:K] + (cvm_gen_0[i:I, j:J, k:K] * pt1_gen_0[i:I, j:J, k:K]))), te0[i:I, j:J, k:K])
+        cvm_gen_0[i:I, j:J, k:K] = (mc_air_gen_0[i:I, j:J, k:K] + (((qv[i:I, j:J, k:K] + q_liq_gen_0[i:I, j:J, k:K]) + q_sol_gen_0[i:I, j:J, k:K]) * c_vap))
+        lhl__958_3_16__2b3_296_31_gen_0[i:I, j:J, k:K] = (lv00 + (d0_vap * pt1_gen_0[i:I, j:J, k:K]))
+        lcp2__958_3_16__2b3_296_31_gen_0[i:I, j:J, k:K] = (lhl__958_3_16__2b3_296_31_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K])
+        lhl__2b3_296_31_gen_0[i:I, j:J, k:K] = lhl__958_3_16__2b3_296_31_gen_0[i:I, j:J, k:K]
+        lcp2__2b3_296_31_gen_0[i:I, j:J, k:K] = lcp2__958_3_16__2b3_296_31_gen_0[i:I, j:J, k:K]
+        lhi__a5e_4_16__2b3_296_31_gen_0[i:I, j:J, k:K] = (np.float64(-271059.66000000003) + (np.float64(2213.5) * pt1_gen_0[i:I, j:J, k:K]))
+        icp2__a5e_4_16__2b3_296_31_gen_0[i:I, j:J, k:K] = (lhi__a5e_4_16__2b3_296_31_gen_0[i:I, j:J, k:K] / cvm_gen_0[i:I, j:J, k:K])
+        lhi__2b3_296_31_gen_0[i:I, j:J, k:K] = lhi__a5e_4_16__2b3_296_31_gen_0[i:I, j:J, k:K]
+        icp2__2b3_296_31_gen_0[i:I, j:J, k:K] = icp2__a5e_4_16__2b3_296_31_gen_0[i:I, j:J, k:K]
+        lhl_gen_0[i:I, j:J, k:K] = lhl__2b3_296_31_gen_0[i:I, j:J, k:K]
+        lhi_gen_0[i:I, j:J, k:K] = lhi__2b3_296_31_gen_0[i:I, j:J, k:K]
+        lcp2_gen_0[i:I, j:J, k:K] = lcp2__2b3_296_31_gen_0[i:I, j:J, k:K]
+        icp2_gen_0[i:I, j:J, k:K] = icp2__2b3_296_31_gen_0[i:I, j:J, k:K]
+        q_sol_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), bool(bool(True))), bool(bool(True))), ((qi[i:I, j:J, k:K] + qs[i:I, j:J, k:K]) + qg[i:I, j:J, k:K]), q_sol_gen_0[i:I, j:J, k:K])
+        q_sol_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), bool(bool(True))), (np.bitwise_not(bool(bool(True))))), (qi[i:I, j:J, k:K] + qs[i:I, j:J, k:K]), q_sol_gen_0[i:I, j:J, k:K])
+        q_sol_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(bool(bool(True))))), qi[i:I, j:J, k:K], q_sol_gen_0[i:I, j:J, k:K])
+        q_liq_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), bool(bool(True))), (ql[i:I, j:J, k:K] + qr[i:I, j:J, k:K]), q_liq_gen_0[i:I, j:J, k:K])
+        q_liq_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(bool(bool(True))))), ql[i:I, j:J, k:K], q_liq_gen_0[i:I, j:J, k:K])
+        q_cond_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (q_sol_gen_0[i:I, j:J, k:K] + q_liq_gen_0[i:I, j:J, k:K]), q_cond_gen_0[i:I, j:J, k:K])
+        tin_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), bool(bool(False))), pt1_gen_0[i:I, j:J, k:K], tin_gen_0[i:I, j:J, k:K])
+        tin_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(bool(bool(False))))), (pt1_gen_0[i:I, j:J, k:K] - ((lcp2_gen_0[i:I, j:J, k:K] * q_cond_gen_0[i:I, j:J, k:K]) + (icp2_gen_0[i:I, j:J, k:K] * q_sol_gen_0[i:I, j:J, k:K]))), tin_gen_0[i:I, j:J, k:K])
+        b__73d_3_17__36e_3_10__04d_320_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.float64(113.16000000000003), b__73d_3_17__36e_3_10__04d_320_22_gen_0[i:I, j:J, k:K])
+        diff__73d_3_17__36e_3_10__04d_320_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.where(((tin_gen_0[i:I, j:J, k:K] - b__73d_3_17__36e_3_10__04d_320_22_gen_0[i:I, j:J, k:K]) > np.float64(np.int64(0))), (tin_gen_0[i:I, j:J, k:K] - b__73d_3_17__36e_3_10__04d_320_22_gen_0[i:I, j:J, k:K]), np.float64(np.int64(0))), diff__73d_3_17__36e_3_10__04d_320_22_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__73d_3_17__36e_3_10__04d_320_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), diff__73d_3_17__36e_3_10__04d_320_22_gen_0[i:I, j:J, k:K], RETURN_VALUE__73d_3_17__36e_3_10__04d_320_22_gen_0[i:I, j:J, k:K])
+        ap1__36e_3_10__04d_320_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), ((np.float64(10.0) * RETURN_VALUE__73d_3_17__36e_3_10__04d_320_22_gen_0[i:I, j:J, k:K]) + np.float64(1.0)), ap1__36e_3_10__04d_320_22_gen_0[i:I, j:J, k:K])
+        ap1__04d_320_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (np.minimum(ap1__36e_3_10__04d_320_22_gen_0[i:I, j:J, k:K], np.float64(np.int64(2621))) - np.float64(np.int64(1))), ap1__04d_320_22_gen_0[i:I, j:J, k:K])
+        it__04d_320_22_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.floor(ap1__04d_320_22_gen_0[i:I, j:J, k:K]), it__04d_320_22_gen_0[i:I, j:J, k:K])
+        it_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), it__04d_320_22_gen_0[i:I, j:J, k:K], it_gen_0[i:I, j:J, k:K])
+        ap1_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), ap1__04d_320_22_gen_0[i:I, j:J, k:K], ap1_gen_0[i:I, j:J, k:K])
+        tem__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (np.float64(113.16000000000003) + (np.float64(0.1) * it_gen_0[i:I, j:J, k:K])), tem__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_4_11__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_4_11__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K])
+        tablew__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), RETURN_VALUE__8c8_4_11__ab0_3_13__803_321_19_gen_0[i:I, j:J, k:K], tablew__803_321_19_gen_0[i:I, j:J, k:K])
+        tem__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (np.float64(113.16000000000003) + (np.float64(0.1) * it_gen_0[i:I, j:J, k:K])), tem__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), RETURN_VALUE__265_3_11__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        t__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), RETURN_VALUE__8c8_4_11__ab0_3_8__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], t__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        i__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (it_gen_0[i:I, j:J, k:K] + np.float64(np.int64(1))), i__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        tem__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (np.float64(113.16000000000003) + (np.float64(0.1) * i__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])), tem__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.log((tem__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), RETURN_VALUE__265_3_11__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), RETURN_VALUE__8c8_4_11__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], RETURN_VALUE__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        diff__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (RETURN_VALUE__ab0_4_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - t__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K]), diff__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        z__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.float64(0.0), z__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        desw__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.maximum(z__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], diff__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K]), desw__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), desw__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], des2__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        mask_140013208314960_gen_0[i:I, j:J, k:K] = (it_gen_0[i:I, j:J, k:K] == np.float64((np.int64(2621) - np.int64(1))))
+        i__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), (it_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1))), i__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        mask_140013210052816_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013210052816_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013210052816_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013210052816_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013210052816_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013210052816_gen_0[i:I, j:J, k:K]))), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013210052816_gen_0[i:I, j:J, k:K]))), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013210052816_gen_0[i:I, j:J, k:K]))), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013210052816_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        mask_140013207722192_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])) * table__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])), table__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), np.int64(1598), i__d48_18_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), np.int64(1600), i__d48_21_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013207722192_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        mask_140013206558864_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), np.int64(1599), i__d48_29_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), np.int64(1601), i__d48_32_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), mask_140013206558864_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        t_m1__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), table2__918_4_15__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], t_m1__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        diff__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), (t__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] - t_m1__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K]), diff__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013208314960_gen_0[i:I, j:J, k:K]), np.maximum(z__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], diff__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K]), des2__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        desw__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), des2__0a3_7_11__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], desw__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K])
+        desw__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), desw__85c_4_11__803_321_19_gen_0[i:I, j:J, k:K], desw__803_321_19_gen_0[i:I, j:J, k:K])
+        es__973_5_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (tablew__803_321_19_gen_0[i:I, j:J, k:K] + ((ap1_gen_0[i:I, j:J, k:K] - it_gen_0[i:I, j:J, k:K]) * desw__803_321_19_gen_0[i:I, j:J, k:K])), es__973_5_11__803_321_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__973_5_11__803_321_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (es__973_5_11__803_321_19_gen_0[i:I, j:J, k:K] / ((np.float64(461.5) * tin_gen_0[i:I, j:J, k:K]) * den_gen_0[i:I, j:J, k:K])), RETURN_VALUE__973_5_11__803_321_19_gen_0[i:I, j:J, k:K])
+        wqs1_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), RETURN_VALUE__973_5_11__803_321_19_gen_0[i:I, j:J, k:K], wqs1_gen_0[i:I, j:J, k:K])
+        tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (np.float64(113.16000000000003) + (np.float64(0.1) * it_gen_0[i:I, j:J, k:K])), tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        mask_140013213832848_gen_0[i:I, j:J, k:K] = (it_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213832848_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213832848_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213832848_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213832848_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_6_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K], table2__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013213832848_gen_0[i:I, j:J, k:K]))), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013213832848_gen_0[i:I, j:J, k:K]))), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013213832848_gen_0[i:I, j:J, k:K]))), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013213832848_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__265_3_11__8c8_9_17__918_3_13__183_322_19_gen_0[i:I, j:J, k:K], table2__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        mask_140013190981072_gen_0[i:I, j:J, k:K] = (it_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        table__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_12_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K], table__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), (it_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])), tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_16_12__918_3_13__183_322_19_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        table__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), (((np.float64(0.05) * (np.float64(273.16) - tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])) * table__918_3_13__183_322_19_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])), table__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), np.int64(1598), i__d48_18_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_m1__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_19_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K], table2_m1__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), np.int64(1600), i__d48_21_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_p1__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_22_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K], table2_p1__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013190981072_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])) + table2_p1__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])), table2__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        mask_140013207171600_gen_0[i:I, j:J, k:K] = (it_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), (it_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])), tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        table__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_27_16__918_3_13__183_322_19_gen_0[i:I, j:J, k:K], table__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), np.int64(1599), i__d48_29_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_m1__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_30_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K], table2_m1__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), np.int64(1601), i__d48_32_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_3_13__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_p1__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_33_20__918_3_13__183_322_19_gen_0[i:I, j:J, k:K], table2_p1__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013207171600_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_3_13__183_322_19_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])) + table2_p1__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])), table2__918_3_13__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), table2__918_3_13__183_322_19_gen_0[i:I, j:J, k:K], table2__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (np.float64(113.16000000000003) + (np.float64(0.1) * it_gen_0[i:I, j:J, k:K])), tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        mask_140013206726608_gen_0[i:I, j:J, k:K] = (it_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013206726608_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013206726608_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013206726608_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013206726608_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_6_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013206726608_gen_0[i:I, j:J, k:K]))), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013206726608_gen_0[i:I, j:J, k:K]))), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013206726608_gen_0[i:I, j:J, k:K]))), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013206726608_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__265_3_11__8c8_9_17__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        mask_140013213843344_gen_0[i:I, j:J, k:K] = (it_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_12_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), (it_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), (((np.float64(0.05) * (np.float64(273.16) - tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) * table__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), table__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), np.int64(1598), i__d48_18_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_m1__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_19_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2_m1__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), np.int64(1600), i__d48_21_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_p1__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_22_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2_p1__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213843344_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) + table2_p1__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), table2__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        mask_140013221345680_gen_0[i:I, j:J, k:K] = (it_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), (it_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_27_16__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), np.int64(1599), i__d48_29_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_m1__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_30_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2_m1__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), np.int64(1601), i__d48_32_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_p1__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_33_20__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2_p1__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013221345680_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) + table2_p1__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), table2__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        t__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), table2__918_3_8__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], t__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (it_gen_0[i:I, j:J, k:K] + np.float64(np.int64(1))), i__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        mask_140013206725840_gen_0[i:I, j:J, k:K] = (i__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013206725840_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013206725840_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013206725840_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013206725840_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_6_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013206725840_gen_0[i:I, j:J, k:K]))), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013206725840_gen_0[i:I, j:J, k:K]))), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013206725840_gen_0[i:I, j:J, k:K]))), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013206725840_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        mask_140013213758736_gen_0[i:I, j:J, k:K] = (i__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_12_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), (i__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) * table__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), table__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), np.int64(1598), i__d48_18_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_19_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2_m1__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), np.int64(1600), i__d48_21_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_22_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2_p1__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013213758736_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), table2__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        mask_140013199697744_gen_0[i:I, j:J, k:K] = (i__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), (i__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_27_16__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), np.int64(1599), i__d48_29_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_30_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2_m1__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), np.int64(1601), i__d48_32_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_33_20__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2_p1__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013199697744_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), table2__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), table2__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], RETURN_VALUE__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        diff__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (RETURN_VALUE__918_4_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - t__964_4_11__183_322_19_gen_0[i:I, j:J, k:K]), diff__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        z__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.float64(0.0), z__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        des2__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.maximum(z__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], diff__964_4_11__183_322_19_gen_0[i:I, j:J, k:K]), des2__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), des2__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], des2__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        mask_140013192881168_gen_0[i:I, j:J, k:K] = (it_gen_0[i:I, j:J, k:K] == np.float64((np.int64(2621) - np.int64(1))))
+        i__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), (it_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1))), i__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        mask_140013217786640_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] < np.float64(np.int64(1600)))
+        delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013217786640_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013217786640_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013217786640_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013217786640_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_6_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013217786640_gen_0[i:I, j:J, k:K]))), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013217786640_gen_0[i:I, j:J, k:K]))), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013217786640_gen_0[i:I, j:J, k:K]))), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_140013217786640_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__265_3_11__8c8_9_17__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        mask_140013191636432_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1599)))
+        delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_12_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__343_13_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_13_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_13_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), (((np.float64(0.05) * (np.float64(273.16) - tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) * table__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K]) + ((np.float64(0.05) * (tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(253.16))) * RETURN_VALUE__8c8_16_12__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), table__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_18_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), np.int64(1598), i__d48_18_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_18_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_19_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_21_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), np.int64(1600), i__d48_21_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_21_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_22_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013191636432_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        mask_140013190358288_gen_0[i:I, j:J, k:K] = (i__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] == np.float64(np.int64(1600)))
+        i__343_26_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), (i__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(np.int64(1400))), i__343_26_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), (np.float64(253.16) + (np.float64(0.1) * i__343_26_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_27_16__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_29_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), np.int64(1599), i__d48_29_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_29_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), np.float64(-126.0), delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), np.float64(2867998.16), latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_m1__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c5_30_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2_m1__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        i__d48_32_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), np.int64(1601), i__d48_32_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), (np.float64(113.16000000000003) + (np.float64(0.1) * i__d48_32_15__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K].astype(np.float64))), tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), np.float64(-2339.5), delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), np.float64(3139057.8200000003), latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), (np.float64(611.21) * np.exp((((delta_heat_capacity__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.log((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + (((tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / (tem0__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] * np.float64(273.16))) * latent_heat_coefficient__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) / np.float64(461.5)))), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2_p1__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), RETURN_VALUE__265_3_11__8c8_33_20__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], table2_p1__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        table2__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), mask_140013190358288_gen_0[i:I, j:J, k:K]), (np.float64(0.25) * ((table2_m1__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] + (np.float64(2.0) * table__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])) + table2_p1__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])), table2__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        t_m1__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), table2__918_4_15__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], t_m1__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        diff__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), (t__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] - t_m1__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K]), diff__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        des2__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013192881168_gen_0[i:I, j:J, k:K]), np.maximum(z__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], diff__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K]), des2__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        des2__964_4_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), des2__0a3_7_11__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], des2__964_4_11__183_322_19_gen_0[i:I, j:J, k:K])
+        des2__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), des2__964_4_11__183_322_19_gen_0[i:I, j:J, k:K], des2__183_322_19_gen_0[i:I, j:J, k:K])
+        es__973_5_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (table2__183_322_19_gen_0[i:I, j:J, k:K] + ((ap1_gen_0[i:I, j:J, k:K] - it_gen_0[i:I, j:J, k:K]) * des2__183_322_19_gen_0[i:I, j:J, k:K])), es__973_5_11__183_322_19_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__973_5_11__183_322_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (es__973_5_11__183_322_19_gen_0[i:I, j:J, k:K] / ((np.float64(461.5) * tin_gen_0[i:I, j:J, k:K]) * den_gen_0[i:I, j:J, k:K])), RETURN_VALUE__973_5_11__183_322_19_gen_0[i:I, j:J, k:K])
+        iqs1_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), RETURN_VALUE__973_5_11__183_322_19_gen_0[i:I, j:J, k:K], iqs1_gen_0[i:I, j:J, k:K])
+        mask_140013191634576_gen_0[i:I, j:J, k:K] = (tin_gen_0[i:I, j:J, k:K] < np.float64(233.16000000000003))
+        qstar_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013191634576_gen_0[i:I, j:J, k:K]), iqs1_gen_0[i:I, j:J, k:K], qstar_gen_0[i:I, j:J, k:K])
+        mask_140013217913552_gen_0[i:I, j:J, k:K] = (tin_gen_0[i:I, j:J, k:K] >= np.float64(273.16))
+        qstar_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013191634576_gen_0[i:I, j:J, k:K]))), mask_140013217913552_gen_0[i:I, j:J, k:K]), wqs1_gen_0[i:I, j:J, k:K], qstar_gen_0[i:I, j:J, k:K])
+        mask_140013205696528_gen_0[i:I, j:J, k:K] = (q_cond_gen_0[i:I, j:J, k:K] > np.float64(1e-06))
+        rqi_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013191634576_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_140013217913552_gen_0[i:I, j:J, k:K]))), mask_140013205696528_gen_0[i:I, j:J, k:K]), (q_sol_gen_0[i:I, j:J, k:K] / q_cond_gen_0[i:I, j:J, k:K]), rqi_gen_0[i:I, j:J, k:K])
+        rqi_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013191634576_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_140013217913552_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_140013205696528_gen_0[i:I, j:J, k:K]))), ((np.float64(273.16) - tin_gen_0[i:I, j:J, k:K]) / (np.float64(273.16) - np.float64(233.16000000000003))), rqi_gen_0[i:I, j:J, k:K])
+        qstar_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013191634576_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_140013217913552_gen_0[i:I, j:J, k:K]))), ((rqi_gen_0[i:I, j:J, k:K] * iqs1_gen_0[i:I, j:J, k:K]) + ((np.float64(1.0) - rqi_gen_0[i:I, j:J, k:K]) * wqs1_gen_0[i:I, j:J, k:K])), qstar_gen_0[i:I, j:J, k:K])
+        mindw_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.minimum(np.float64(1.0), (np.abs(hs[i:I, j:J]) / (np.float64(10.0) * np.float64(9.80665)))), mindw_gen_0[i:I, j:J, k:K])
+        dw_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (np.float64(0.1) + ((np.float64(0.15) - np.float64(0.1)) * mindw_gen_0[i:I, j:J, k:K])), dw_gen_0[i:I, j:J, k:K])
+        dbl_sqrt_area_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (dw_gen_0[i:I, j:J, k:K] * np.power((np.power(area[i:I, j:J], np.float64(0.5)) / np.float64(100000.0)), np.float64(0.5))), dbl_sqrt_area_gen_0[i:I, j:J, k:K])
+        maxtmp_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.maximum(np.float64(0.01), dbl_sqrt_area_gen_0[i:I, j:J, k:K]), maxtmp_gen_0[i:I, j:J, k:K])
+        hvar_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), np.minimum(np.float64(0.2), maxtmp_gen_0[i:I, j:J, k:K]), hvar_gen_0[i:I, j:J, k:K])
+        rh_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(do_qa, last_step), (qpz_gen_0[i:I, j:J, k:K] / qstar_gen_0[i:I, j:J, k:K]), rh_gen_0[i:I, j:J, k:K])
+        mask_140013198620816_gen_0[i:I, j:J, k:K] = np.bitwise_and((rh_gen_0[i:I, j:J, k:K] > np.float64(0.75)), (qpz_gen_0[i:I, j:J, k:K] > np.float64(1e-08)))
+        dq_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013198620816_gen_0[i:I, j:J, k:K]), (hvar_gen_0[i:I, j:J, k:K] * qpz_gen_0[i:I, j:J, k:K]), dq_gen_0[i:I, j:J, k:K])
+        q_plus_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013198620816_gen_0[i:I, j:J, k:K]), (qpz_gen_0[i:I, j:J, k:K] + dq_gen_0[i:I, j:J, k:K]), q_plus_gen_0[i:I, j:J, k:K])
+        q_minus_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013198620816_gen_0[i:I, j:J, k:K]), (qpz_gen_0[i:I, j:J, k:K] - dq_gen_0[i:I, j:J, k:K]), q_minus_gen_0[i:I, j:J, k:K])
+        mask_140013206662160_gen_0[i:I, j:J, k:K] = (qpz_gen_0[i:I, j:J, k:K] > qstar_gen_0[i:I, j:J, k:K])
+        qa[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013198620816_gen_0[i:I, j:J, k:K]), (np.int64(0) == np.int64(2))), mask_140013206662160_gen_0[i:I, j:J, k:K]), np.float64(1.0), qa[i:I, j:J, k:K])
+        mask_140013198607824_gen_0[i:I, j:J, k:K] = np.bitwise_and((qstar_gen_0[i:I, j:J, k:K] < q_plus_gen_0[i:I, j:J, k:K]), (q_cond_gen_0[i:I, j:J, k:K] > np.float64(1e-08)))
+        qa[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013198620816_gen_0[i:I, j:J, k:K]), (np.int64(0) == np.int64(2))), (np.bitwise_not(mask_140013206662160_gen_0[i:I, j:J, k:K]))), mask_140013198607824_gen_0[i:I, j:J, k:K]), np.minimum(np.float64(1.0), np.power(((q_plus_gen_0[i:I, j:J, k:K] - qstar_gen_0[i:I, j:J, k:K]) / dq_gen_0[i:I, j:J, k:K]), np.float64(np.int64(2)))), qa[i:I, j:J, k:K])
+        qa[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013198620816_gen_0[i:I, j:J, k:K]), (np.int64(0) == np.int64(2))), (np.bitwise_not(mask_140013206662160_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_140013198607824_gen_0[i:I, j:J, k:K]))), np.float64(0.0), qa[i:I, j:J, k:K])
+        mask_140013190166096_gen_0[i:I, j:J, k:K] = (qstar_gen_0[i:I, j:J, k:K] < q_minus_gen_0[i:I, j:J, k:K])
+        qa[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013198620816_gen_0[i:I, j:J, k:K]), (np.bitwise_not((np.int64(0) == np.int64(2))))), mask_140013190166096_gen_0[i:I, j:J, k:K]), np.float64(1.0), qa[i:I, j:J, k:K])
+        mask_140013202462096_gen_0[i:I, j:J, k:K] = (qstar_gen_0[i:I, j:J, k:K] < q_plus_gen_0[i:I, j:J, k:K])
+        qa[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013198620816_gen_0[i:I, j:J, k:K]), (np.bitwise_not((np.int64(0) == np.int64(2))))), (np.bitwise_not(mask_140013190166096_gen_0[i:I, j:J, k:K]))), mask_140013202462096_gen_0[i:I, j:J, k:K]), (np.int64(0) == np.int64(0))), ((q_plus_gen_0[i:I, j:J, k:K] - qstar_gen_0[i:I, j:J, k:K]) / (dq_gen_0[i:I, j:J, k:K] + dq_gen_0[i:I, j:J, k:K])), qa[i:I, j:J, k:K])
+        qa[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013198620816_gen_0[i:I, j:J, k:K]), (np.bitwise_not((np.int64(0) == np.int64(2))))), (np.bitwise_not(mask_140013190166096_gen_0[i:I, j:J, k:K]))), mask_140013202462096_gen_0[i:I, j:J, k:K]), (np.bitwise_not((np.int64(0) == np.int64(0))))), ((q_plus_gen_0[i:I, j:J, k:K] - qstar_gen_0[i:I, j:J, k:K]) / ((np.float64(2.0) * dq_gen_0[i:I, j:J, k:K]) * (np.float64(1.0) - q_cond_gen_0[i:I, j:J, k:K]))), qa[i:I, j:J, k:K])
+        qa[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013198620816_gen_0[i:I, j:J, k:K]), (np.bitwise_not((np.int64(0) == np.int64(2))))), (np.bitwise_not(mask_140013190166096_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_140013202462096_gen_0[i:I, j:J, k:K]))), np.float64(0.0), qa[i:I, j:J, k:K])
+        mask_140013199724112_gen_0[i:I, j:J, k:K] = (q_cond_gen_0[i:I, j:J, k:K] > np.float64(1e-08))
+        qa[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013198620816_gen_0[i:I, j:J, k:K]), (np.bitwise_not((np.int64(0) == np.int64(2))))), (np.bitwise_not(mask_140013190166096_gen_0[i:I, j:J, k:K]))), mask_140013199724112_gen_0[i:I, j:J, k:K]), np.maximum(np.float64(0.05), qa[i:I, j:J, k:K]), qa[i:I, j:J, k:K])
+        qa[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(do_qa, last_step), mask_140013198620816_gen_0[i:I, j:J, k:K]), (np.bitwise_not((np.int64(0) == np.int64(2))))), (np.bitwise_not(mask_140013190166096_gen_0[i:I, j:J, k:K]))), np.minimum(np.float64(np.int64(1)), qa[i:I, j:J, k:K]), qa[i:I, j:J, k:K])
+        qa[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(do_qa, last_step), (np.bitwise_not(mask_140013198620816_gen_0[i:I, j:J, k:K]))), np.float64(0.0), qa[i:I, j:J, k:K])
+        pkz[i:I, j:J, k:K] = np.exp((cappa[i:I, j:J, k:K] * np.log((((np.float64(-29.270953893531434) * dp[i:I, j:J, k:K]) / delz[i:I, j:J, k:K]) * pt[i:I, j:J, k:K]))))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
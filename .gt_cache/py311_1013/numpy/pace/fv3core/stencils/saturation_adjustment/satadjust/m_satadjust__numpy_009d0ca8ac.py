@@ -0,0 +1,173 @@
+
+
+import pathlib
+import time
+
+import numpy as np
+from numpy import dtype
+from gt4py.cartesian.stencil_object import StencilObject
+import pathlib
+from gt4py.cartesian.utils import make_module_from_file
+computation = make_module_from_file("m_computation__numpy_009d0ca8ac", pathlib.Path(__file__).parent / "m_computation__numpy_009d0ca8ac.py")
+
+from gt4py.cartesian.definitions import AccessKind, Boundary, CartesianSpace
+from gt4py.cartesian.stencil_object import DomainInfo, FieldInfo, ParameterInfo
+
+
+
+class satadjust____numpy_009d0ca8ac(StencilObject):
+    """
+    Documented in Zhou, Harris and Chen (2022)
+https://repository.library.noaa.gov/view/noaa/44636.
+
+Args:
+    peln (in):
+    qv (inout):
+    ql (inout):
+    qi (inout):
+    qr (inout):
+    qs (inout):
+    cappa (out):
+    qg (inout):
+    pt (inout):
+    dp (in):
+    delz (inout): If nonhydrostatic delz is only in, not out
+    te0 (out):
+    q_con (out):
+    qa (out):
+    area (in):
+    hs (in):
+    pkz (out):
+    sdt (in):
+    zvir (in): epsilon parameter in virtual temperature
+    fac_i2s (in):
+    do_qa (in): enables the cloud fraction scheme accounting for subgrid
+        variability in cloud fraction
+    consv_te (in):
+    c_air (in):
+    c_vap (in):
+    mdt (in):
+    fac_r2g (in):
+    fac_smlt (in):
+    fac_l2r (in):
+    fac_imlt (in):
+    d0_vap (in): Cvapor - Cliquid, used for Clausius-Clapeyron
+    lv00 (in): latent heating of vaporization, HLV - d0_vap * TICE
+    fac_v2l (in):
+    fac_l2v (in):
+    last_step (in):
+
+    The callable interface is the same of the stencil definition function,
+    with some extra keyword arguments. Check :class:`gt4py.StencilObject`
+    for the full specification.
+    """
+
+    _gt_backend_ = "numpy"
+
+    _gt_source_ = {}
+
+    _gt_domain_info_ = DomainInfo(parallel_axes=('I', 'J'), sequential_axis='K', min_sequential_axis_size=0, ndim=3)
+
+    _gt_field_info_ = {'peln': FieldInfo(access=AccessKind.NONE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'qv': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'ql': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'qi': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'qr': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'qs': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'cappa': FieldInfo(access=AccessKind.WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'qg': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'pt': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'dp': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'delz': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'te0': FieldInfo(access=AccessKind.WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'q_con': FieldInfo(access=AccessKind.WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'qa': FieldInfo(access=AccessKind.WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'area': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'hs': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J'), data_dims=(), dtype=dtype('float64')), 'pkz': FieldInfo(access=AccessKind.WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64'))}
+
+    _gt_parameter_info_ = {'sdt': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'zvir': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'fac_i2s': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'do_qa': ParameterInfo(access=AccessKind.READ, dtype=dtype('bool')), 'consv_te': ParameterInfo(access=AccessKind.READ, dtype=dtype('bool')), 'c_air': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'c_vap': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'mdt': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'fac_r2g': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'fac_smlt': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'fac_l2r': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'fac_imlt': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'd0_vap': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'lv00': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'fac_v2l': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'fac_l2v': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'last_step': ParameterInfo(access=AccessKind.READ, dtype=dtype('bool'))}
+
+    _gt_constants_ = {}
+
+    _gt_options_ = {'name': 'satadjust', 'module': 'pace.fv3core.stencils.saturation_adjustment', 'format_source': False, 'backend_opts': {}, 'rebuild': False, 'raise_if_not_cached': False, 'cache_settings': {}, '_impl_opts': {}}
+
+    @property
+    def backend(self):
+        return type(self)._gt_backend_
+
+    @property
+    def source(self):
+        return type(self)._gt_source_
+
+    @property
+    def domain_info(self):
+        return type(self)._gt_domain_info_
+
+    @property
+    def field_info(self) -> dict:
+        return type(self)._gt_field_info_
+
+    @property
+    def parameter_info(self) -> dict:
+        return type(self)._gt_parameter_info_
+
+    @property
+    def constants(self) -> dict:
+        return type(self)._gt_constants_
+
+    @property
+    def options(self) -> dict:
+        return type(self)._gt_options_
+
+    def __call__(
+        self, peln, qv, ql, qi, qr, qs, cappa, qg, pt, dp, delz, te0, q_con, qa, area, hs, pkz, sdt, zvir, fac_i2s, do_qa, consv_te, c_air, c_vap, mdt, fac_r2g, fac_smlt, fac_l2r, fac_imlt, d0_vap, lv00, fac_v2l, fac_l2v, last_step, domain=None, origin=None, validate_args=True, exec_info=None
+    ):
+        if exec_info is not None:
+            exec_info["call_start_time"] = time.perf_counter()
+
+        field_args=dict( area=area,  ql=ql,  qg=qg,  dp=dp,  qv=qv,  peln=peln,  te0=te0,  qa=qa,  qi=qi,  cappa=cappa,  delz=delz,  pt=pt,  hs=hs,  qr=qr,  pkz=pkz,  q_con=q_con,  qs=qs)
+        parameter_args=dict( c_air=c_air,  fac_imlt=fac_imlt,  fac_smlt=fac_smlt,  fac_v2l=fac_v2l,  c_vap=c_vap,  fac_l2r=fac_l2r,  sdt=sdt,  consv_te=consv_te,  lv00=lv00,  fac_r2g=fac_r2g,  mdt=mdt,  zvir=zvir,  fac_i2s=fac_i2s,  fac_l2v=fac_l2v,  do_qa=do_qa,  d0_vap=d0_vap,  last_step=last_step)
+        # assert that all required values have been provided
+
+
+        self._call_run(
+            field_args=field_args,
+            parameter_args=parameter_args,
+            domain=domain,
+            origin=origin,
+            validate_args=validate_args,
+            exec_info=exec_info,
+        )
+
+
+        if exec_info is not None:
+            exec_info["call_end_time"] = time.perf_counter()
+
+            if exec_info.setdefault("__aggregate_data", False):
+                stencil_info = exec_info.setdefault("satadjust____numpy_009d0ca8ac", {})
+
+                # Update performance counters
+                stencil_info["call_start_time"] = exec_info["call_start_time"]
+                stencil_info["call_end_time"] = exec_info["call_end_time"]
+                stencil_info["call_time"] = (
+                    stencil_info["call_end_time"]
+                    - stencil_info["call_start_time"]
+                )
+                stencil_info["total_call_time"] = (
+                    stencil_info.get("total_call_time", 0.0)
+                    + stencil_info["call_time"]
+                )
+                stencil_info["ncalls"] = (
+                    stencil_info.get("ncalls", 0) + 1
+                )
+                stencil_info["run_time"] = (
+                    exec_info["run_end_time"]
+                    - exec_info["run_start_time"]
+                )
+                stencil_info["total_run_time"] = (
+                    stencil_info.get("total_run_time", 0.0)
+                    + stencil_info["run_time"]
+                )
+                if "run_cpp_start_time" in exec_info:
+                    stencil_info["run_cpp_time"] = (
+                        exec_info["run_cpp_end_time"]
+                        - exec_info["run_cpp_start_time"]
+                    )
+                    stencil_info["total_run_cpp_time"] = (
+                        stencil_info.get("total_run_cpp_time", 0.0)
+                        + stencil_info["run_cpp_time"]
+                    )
+
+    def run(self, _domain_, _origin_, exec_info, *,area, ql, qg, dp, qv, peln, te0, qa, qi, cappa, delz, pt, hs, qr, pkz, q_con, qs,c_air, fac_imlt, fac_smlt, fac_v2l, c_vap, fac_l2r, sdt, consv_te, lv00, fac_r2g, mdt, zvir, fac_i2s, fac_l2v, do_qa, d0_vap, last_step):
+        if exec_info is not None:
+            exec_info["domain"] = _domain_
+            exec_info["origin"] = _origin_
+            exec_info["run_start_time"] = time.perf_counter()
+        computation.run(qv=qv, ql=ql, qi=qi, qr=qr, qs=qs, cappa=cappa, qg=qg, pt=pt, dp=dp, delz=delz, te0=te0, q_con=q_con, qa=qa, area=area, hs=hs, pkz=pkz, sdt=sdt, zvir=zvir, fac_i2s=fac_i2s, do_qa=do_qa, consv_te=consv_te, c_air=c_air, c_vap=c_vap, mdt=mdt, fac_r2g=fac_r2g, fac_smlt=fac_smlt, fac_l2r=fac_l2r, fac_imlt=fac_imlt, d0_vap=d0_vap, lv00=lv00, fac_v2l=fac_v2l, fac_l2v=fac_l2v, last_step=last_step, _domain_=_domain_, _origin_=_origin_)
+        if exec_info is not None:
+            exec_info["run_end_time"] = time.perf_counter()
\ No newline at end of file
@@ -0,0 +1,110 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, cx, cy, dxa, dya, dx, dy, sin_sg1, sin_sg2, sin_sg3, sin_sg4, xfx, yfx, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    cx = Field(cx, _origin_['cx'], (True, True, True))
+    cy = Field(cy, _origin_['cy'], (True, True, True))
+    dxa = Field(dxa, _origin_['dxa'], (True, True, False))
+    dya = Field(dya, _origin_['dya'], (True, True, False))
+    dx = Field(dx, _origin_['dx'], (True, True, False))
+    dy = Field(dy, _origin_['dy'], (True, True, False))
+    sin_sg1 = Field(sin_sg1, _origin_['sin_sg1'], (True, True, False))
+    sin_sg2 = Field(sin_sg2, _origin_['sin_sg2'], (True, True, False))
+    sin_sg3 = Field(sin_sg3, _origin_['sin_sg3'], (True, True, False))
+    sin_sg4 = Field(sin_sg4, _origin_['sin_sg4'], (True, True, False))
+    xfx = Field(xfx, _origin_['xfx'], (True, True, True))
+    yfx = Field(yfx, _origin_['yfx'], (True, True, True))
+    
+    yfx__1b2_32_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    xfx__8ca_31_14_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        xfx__8ca_31_14_gen_0[i:I, j:J, k:K] = xfx[i:I, j:J, k:K]
+        xfx__8ca_31_14_gen_0[i + 3:I - 2, j:J, k:K] = np.where((cx[i + 3:I - 2, j:J, k:K] > np.float64(np.int64(0))), (((cx[i + 3:I - 2, j:J, k:K] * dxa[i + 2:I - 3, j:J]) * dy[i + 3:I - 2, j:J]) * sin_sg3[i + 2:I - 3, j:J]), (((cx[i + 3:I - 2, j:J, k:K] * dxa[i + 3:I - 2, j:J]) * dy[i + 3:I - 2, j:J]) * sin_sg1[i + 3:I - 2, j:J]))
+        xfx[i:I, j:J, k:K] = xfx__8ca_31_14_gen_0[i:I, j:J, k:K]
+        yfx__1b2_32_14_gen_0[i:I, j:J, k:K] = yfx[i:I, j:J, k:K]
+        yfx__1b2_32_14_gen_0[i:I, j + 3:J - 2, k:K] = np.where((cy[i:I, j + 3:J - 2, k:K] > np.float64(np.int64(0))), (((cy[i:I, j + 3:J - 2, k:K] * dya[i:I, j + 2:J - 3]) * dx[i:I, j + 3:J - 2]) * sin_sg4[i:I, j + 2:J - 3]), (((cy[i:I, j + 3:J - 2, k:K] * dya[i:I, j + 3:J - 2]) * dx[i:I, j + 3:J - 2]) * sin_sg2[i:I, j + 3:J - 2]))
+        yfx[i:I, j:J, k:K] = yfx__1b2_32_14_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
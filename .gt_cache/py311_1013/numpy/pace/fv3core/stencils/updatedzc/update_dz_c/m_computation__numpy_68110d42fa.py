@@ -0,0 +1,218 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, dp_ref, zs, area, ut, vt, gz, gz_x, gz_y, ws, dt, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    dp_ref = Field(dp_ref, _origin_['dp_ref'], (False, False, True))
+    zs = Field(zs, _origin_['zs'], (True, True, False))
+    area = Field(area, _origin_['area'], (True, True, False))
+    ut = Field(ut, _origin_['ut'], (True, True, True))
+    vt = Field(vt, _origin_['vt'], (True, True, True))
+    gz = Field(gz, _origin_['gz'], (True, True, True))
+    gz_x = Field(gz_x, _origin_['gz_x'], (True, True, True))
+    gz_y = Field(gz_y, _origin_['gz_y'], (True, True, True))
+    ws = Field(ws, _origin_['ws'], (True, True, False))
+    
+    xfx = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    yfx = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 0, 0))
+    ratio__d15_38_18_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ratio__d15_39_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 0, 0))
+    int_ratio__330_41_18_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    int_ratio__330_42_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 0, 0))
+    ratio__c74_44_18_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ratio__c74_45_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 0, 0))
+    fx__389_48_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fx_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fx_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fy__389_48_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fy_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fy_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    rdt_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    gz_kp1_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 1
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        ratio__d15_38_18_gen_0[i:I, j:J, k:K] = (dp_ref[k:K] / (dp_ref[k:K] + dp_ref[k + 1:K + 1]))
+        xfx[i:I, j:J, k:K] = (ut[i:I, j:J, k:K] + ((ut[i:I, j:J, k:K] - ut[i:I, j:J, k + 1:K + 1]) * ratio__d15_38_18_gen_0[i:I, j:J, k:K]))
+        # --- end horizontal block --
+
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 1
+
+        ratio__d15_39_18_gen_0[i:I, j:J, k:K] = (dp_ref[k:K] / (dp_ref[k:K] + dp_ref[k + 1:K + 1]))
+        yfx[i:I, j:J, k:K] = (vt[i:I, j:J, k:K] + ((vt[i:I, j:J, k:K] - vt[i:I, j:J, k + 1:K + 1]) * ratio__d15_39_18_gen_0[i:I, j:J, k:K]))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 1
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        int_ratio__330_41_18_gen_0[i:I, j:J, k:K] = (np.float64(1.0) / (dp_ref[k - 1:K - 1] + dp_ref[k:K]))
+        xfx[i:I, j:J, k:K] = (((dp_ref[k:K] * ut[i:I, j:J, k - 1:K - 1]) + (dp_ref[k - 1:K - 1] * ut[i:I, j:J, k:K])) * int_ratio__330_41_18_gen_0[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 1
+
+        int_ratio__330_42_18_gen_0[i:I, j:J, k:K] = (np.float64(1.0) / (dp_ref[k - 1:K - 1] + dp_ref[k:K]))
+        yfx[i:I, j:J, k:K] = (((dp_ref[k:K] * vt[i:I, j:J, k - 1:K - 1]) + (dp_ref[k - 1:K - 1] * vt[i:I, j:J, k:K])) * int_ratio__330_42_18_gen_0[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 1
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        ratio__c74_44_18_gen_0[i:I, j:J, k:K] = (dp_ref[k - 1:K - 1] / (dp_ref[k - 2:K - 2] + dp_ref[k - 1:K - 1]))
+        xfx[i:I, j:J, k:K] = (ut[i:I, j:J, k - 1:K - 1] + ((ut[i:I, j:J, k - 1:K - 1] - ut[i:I, j:J, k - 2:K - 2]) * ratio__c74_44_18_gen_0[i:I, j:J, k:K]))
+        # --- end horizontal block --
+
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 1
+
+        ratio__c74_45_18_gen_0[i:I, j:J, k:K] = (dp_ref[k - 1:K - 1] / (dp_ref[k - 2:K - 2] + dp_ref[k - 1:K - 1]))
+        yfx[i:I, j:J, k:K] = (vt[i:I, j:J, k - 1:K - 1] + ((vt[i:I, j:J, k - 1:K - 1] - vt[i:I, j:J, k - 2:K - 2]) * ratio__c74_45_18_gen_0[i:I, j:J, k:K]))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        fy__389_48_17_gen_0[i:I, j:J, k:K] = (yfx[i:I, j + 1:J + 1, k:K] * np.where((yfx[i:I, j + 1:J + 1, k:K] > np.float64(0.0)), gz_y[i:I, j:J, k:K], gz_y[i:I, j + 1:J + 1, k:K]))
+        fy_gen_1[i:I, j:J, k:K] = fy__389_48_17_gen_0[i:I, j:J, k:K]
+        fy__389_48_17_gen_0[i:I, j:J, k:K] = (yfx[i:I, j:J, k:K] * np.where((yfx[i:I, j:J, k:K] > np.float64(0.0)), gz_y[i:I, j - 1:J - 1, k:K], gz_y[i:I, j:J, k:K]))
+        fy_gen_0[i:I, j:J, k:K] = fy__389_48_17_gen_0[i:I, j:J, k:K]
+        fx__389_48_17_gen_0[i:I, j:J, k:K] = (xfx[i:I, j:J, k:K] * np.where((xfx[i:I, j:J, k:K] > np.float64(0.0)), gz_x[i - 1:I - 1, j:J, k:K], gz_x[i:I, j:J, k:K]))
+        fx_gen_1[i:I, j:J, k:K] = fx__389_48_17_gen_0[i:I, j:J, k:K]
+        fx__389_48_17_gen_0[i:I, j:J, k:K] = (xfx[i + 1:I + 1, j:J, k:K] * np.where((xfx[i + 1:I + 1, j:J, k:K] > np.float64(0.0)), gz_x[i:I, j:J, k:K], gz_x[i + 1:I + 1, j:J, k:K]))
+        fx_gen_0[i:I, j:J, k:K] = fx__389_48_17_gen_0[i:I, j:J, k:K]
+        gz[i:I, j:J, k:K] = ((((((gz[i:I, j:J, k:K] * area[i:I, j:J]) + fx_gen_1[i:I, j:J, k:K]) - fx_gen_0[i:I, j:J, k:K]) + fy_gen_0[i:I, j:J, k:K]) - fy_gen_1[i:I, j:J, k:K]) / ((((area[i:I, j:J] + xfx[i:I, j:J, k:K]) - xfx[i + 1:I + 1, j:J, k:K]) + yfx[i:I, j:J, k:K]) - yfx[i:I, j + 1:J + 1, k:K]))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            rdt_gen_0[i:I, j:J, k_:k_ + 1] = (np.float64(1.0) / dt)
+            ws[i:I, j:J] = ((zs[i:I, j:J] - gz[i:I, j:J, k_:k_ + 1]) * rdt_gen_0[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            gz_kp1_gen_0[i:I, j:J, k_:k_ + 1] = (gz[i:I, j:J, k_ + 1:k_ + 2] + np.float64(2.0))
+            gz[i:I, j:J, k_:k_ + 1] = np.where((gz[i:I, j:J, k_:k_ + 1] > gz_kp1_gen_0[i:I, j:J, k_:k_ + 1]), gz[i:I, j:J, k_:k_ + 1], gz_kp1_gen_0[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
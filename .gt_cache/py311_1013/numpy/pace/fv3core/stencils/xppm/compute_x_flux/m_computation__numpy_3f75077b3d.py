@@ -0,0 +1,461 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, q, courant, dxa, xflux, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    q = Field(q, _origin_['q'], (True, True, True))
+    courant = Field(courant, _origin_['courant'], (True, True, True))
+    dxa = Field(dxa, _origin_['dxa'], (True, True, False))
+    xflux = Field(xflux, _origin_['xflux'], (True, True, True))
+    
+    bl__da4_11_13__296_18_21 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    br__da4_11_13__296_18_21 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    bl = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    br = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    b0__804_19_20 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dqr__417_5_9__296_18_21_gen_2 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    a__1c3_6_11__417_5_9__296_18_21_gen_2 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_2 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    xt__417_5_9__296_18_21_gen_2 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    asignb__1c3_6_11__417_5_9__296_18_21_gen_2 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    mask_140013247518992_gen_2 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    dm__296_18_21_gen_2 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dql__417_5_9__296_18_21_gen_2 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dqr__417_5_9__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dqr__417_5_9__296_18_21_gen_1 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    a__1c3_6_11__417_5_9__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    a__1c3_6_11__417_5_9__296_18_21_gen_1 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_1 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    xt__417_5_9__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    xt__417_5_9__296_18_21_gen_1 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    asignb__1c3_6_11__417_5_9__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    asignb__1c3_6_11__417_5_9__296_18_21_gen_1 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    mask_140013247518992_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    mask_140013247518992_gen_1 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    dm__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dm__296_18_21_gen_1 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dql__417_5_9__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dql__417_5_9__296_18_21_gen_1 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    al__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    al__296_18_21_gen_1 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    xt__e43_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    RETURN_VALUE__1c3_4_16__e43_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    bl__e43_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    br__e43_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    asignb__1c3_5_9__e43_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    a__1c3_5_9__e43_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    mask_140013246531024_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    asignb__1c3_4_16__e43_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    mask_140013251658896_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    a__1c3_4_16__e43_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    br__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    bl__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dqr__417_5_9__296_18_21_gen_3 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    a__1c3_6_11__417_5_9__296_18_21_gen_3 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_3 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    xt__417_5_9__296_18_21_gen_3 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    asignb__1c3_6_11__417_5_9__296_18_21_gen_3 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    mask_140013247518992_gen_3 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    dm__296_18_21_gen_3 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dql__417_5_9__296_18_21_gen_3 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    al__296_18_21_gen_3 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    al__296_18_21_gen_2 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dm__296_18_21_gen_4 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    xt__417_5_9__296_18_21_gen_4 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dm__296_18_21_gen_5 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_4 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    asignb__1c3_6_11__417_5_9__296_18_21_gen_4 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dqr__417_5_9__296_18_21_gen_4 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    mask_140013247518992_gen_4 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    a__1c3_6_11__417_5_9__296_18_21_gen_4 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    mask_140013247518992_gen_5 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    a__1c3_6_11__417_5_9__296_18_21_gen_5 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dqr__417_5_9__296_18_21_gen_5 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    asignb__1c3_6_11__417_5_9__296_18_21_gen_5 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dql__417_5_9__296_18_21_gen_4 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dql__417_5_9__296_18_21_gen_5 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_5 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    xt__417_5_9__296_18_21_gen_5 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    al_ip1__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    asignb__1c3_14_18__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dm_right_end__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    xt__11a_45_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    a__1c3_14_18__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    a__1c3_43_22__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    a6da__4cc_16_17__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    minq__11a_45_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    maxq__11a_16_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    da1__4cc_16_17__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    mask_140013244977808_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    mask_140013246285008_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    maxq__090_54_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    mask_140013247512144_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    mask_140013253676624_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    asignb__1c3_43_22__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dm_left__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    minq__090_54_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    xt_bl__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    mask_140013248121808_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    xt__11a_16_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    maxq__11a_45_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    mask_140013246667600_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    dqr__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    minq__11a_16_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    mask_140013249420752_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    da2__4cc_16_17__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dm_right__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    mask_140013253674896_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    asignb__1c3_53_23__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dm_left_end__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    a__1c3_24_19__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    dql__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    xt_br__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    maxq__090_26_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    minq__090_26_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    xt__090_26_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    al__4cc_16_17__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    xt__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    mask_140013246408784_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    mask_140013244874448_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), bool, (1, 0, 0))
+    xt__090_54_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    asignb__1c3_24_19__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    a__1c3_53_23__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    ar__4cc_16_17__296_18_21_gen_0 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    br__296_18_21_gen_1 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    bl__296_18_21_gen_1 = Field.empty((_dI_ + 1, _dJ_ + 0, _dK_), np.float64, (1, 0, 0))
+    RETURN_VALUE__238_7_11__804_19_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask__238_7_11__804_19_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fx1__804_19_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_140013247969808_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    ret__0ed_6_10__804_19_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 1, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        xt__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (np.float64(0.25) * (q[i + 1:I + 1, j:J, k:K] - q[i - 1:I - 1, j:J, k:K]))
+        dqr__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j:J, k:K], q[i - 1:I - 1, j:J, k:K]), q[i + 1:I + 1, j:J, k:K]) - q[i:I, j:J, k:K])
+        dql__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (q[i:I, j:J, k:K] - np.minimum(np.minimum(q[i:I, j:J, k:K], q[i - 1:I - 1, j:J, k:K]), q[i + 1:I + 1, j:J, k:K]))
+        a__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(xt__417_5_9__296_18_21_gen_1[i:I, j:J, k:K]), dqr__417_5_9__296_18_21_gen_1[i:I, j:J, k:K]), dql__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.abs(a__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        mask_140013247518992_gen_1[i:I, j:J, k:K] = (xt__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.where(mask_140013247518992_gen_1[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013247518992_gen_1[i:I, j:J, k:K])), (-(asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])), asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K]
+        dm__296_18_21_gen_1[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K]
+        xt__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (np.float64(0.25) * (q[i:I, j:J, k:K] - q[i - 2:I - 2, j:J, k:K]))
+        dqr__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i - 1:I - 1, j:J, k:K], q[i - 2:I - 2, j:J, k:K]), q[i:I, j:J, k:K]) - q[i - 1:I - 1, j:J, k:K])
+        dql__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (q[i - 1:I - 1, j:J, k:K] - np.minimum(np.minimum(q[i - 1:I - 1, j:J, k:K], q[i - 2:I - 2, j:J, k:K]), q[i:I, j:J, k:K]))
+        a__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(xt__417_5_9__296_18_21_gen_0[i:I, j:J, k:K]), dqr__417_5_9__296_18_21_gen_0[i:I, j:J, k:K]), dql__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.abs(a__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        mask_140013247518992_gen_0[i:I, j:J, k:K] = (xt__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.where(mask_140013247518992_gen_0[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013247518992_gen_0[i:I, j:J, k:K])), (-(asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])), asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K]
+        dm__296_18_21_gen_0[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K]
+        al__296_18_21_gen_1[i:I, j:J, k:K] = ((np.float64(0.5) * (q[i - 1:I - 1, j:J, k:K] + q[i:I, j:J, k:K])) + ((np.float64(1.0) / np.float64(3.0)) * (dm__296_18_21_gen_0[i:I, j:J, k:K] - dm__296_18_21_gen_1[i:I, j:J, k:K])))
+        xt__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (np.float64(0.25) * (q[i + 2:I + 2, j:J, k:K] - q[i:I, j:J, k:K]))
+        dqr__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i + 1:I + 1, j:J, k:K], q[i:I, j:J, k:K]), q[i + 2:I + 2, j:J, k:K]) - q[i + 1:I + 1, j:J, k:K])
+        dql__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (q[i + 1:I + 1, j:J, k:K] - np.minimum(np.minimum(q[i + 1:I + 1, j:J, k:K], q[i:I, j:J, k:K]), q[i + 2:I + 2, j:J, k:K]))
+        a__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(xt__417_5_9__296_18_21_gen_1[i:I, j:J, k:K]), dqr__417_5_9__296_18_21_gen_1[i:I, j:J, k:K]), dql__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.abs(a__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        mask_140013247518992_gen_1[i:I, j:J, k:K] = (xt__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.where(mask_140013247518992_gen_1[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013247518992_gen_1[i:I, j:J, k:K])), (-(asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])), asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K]
+        dm__296_18_21_gen_1[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K]
+        xt__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (np.float64(0.25) * (q[i + 1:I + 1, j:J, k:K] - q[i - 1:I - 1, j:J, k:K]))
+        dqr__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j:J, k:K], q[i - 1:I - 1, j:J, k:K]), q[i + 1:I + 1, j:J, k:K]) - q[i:I, j:J, k:K])
+        dql__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (q[i:I, j:J, k:K] - np.minimum(np.minimum(q[i:I, j:J, k:K], q[i - 1:I - 1, j:J, k:K]), q[i + 1:I + 1, j:J, k:K]))
+        a__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(xt__417_5_9__296_18_21_gen_0[i:I, j:J, k:K]), dqr__417_5_9__296_18_21_gen_0[i:I, j:J, k:K]), dql__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.abs(a__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        mask_140013247518992_gen_0[i:I, j:J, k:K] = (xt__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.where(mask_140013247518992_gen_0[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013247518992_gen_0[i:I, j:J, k:K])), (-(asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])), asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K]
+        dm__296_18_21_gen_0[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K]
+        al__296_18_21_gen_0[i:I, j:J, k:K] = ((np.float64(0.5) * (q[i:I, j:J, k:K] + q[i + 1:I + 1, j:J, k:K])) + ((np.float64(1.0) / np.float64(3.0)) * (dm__296_18_21_gen_0[i:I, j:J, k:K] - dm__296_18_21_gen_1[i:I, j:J, k:K])))
+        xt__417_5_9__296_18_21_gen_2[i:I, j:J, k:K] = (np.float64(0.25) * (q[i + 1:I + 1, j:J, k:K] - q[i - 1:I - 1, j:J, k:K]))
+        dqr__417_5_9__296_18_21_gen_2[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j:J, k:K], q[i - 1:I - 1, j:J, k:K]), q[i + 1:I + 1, j:J, k:K]) - q[i:I, j:J, k:K])
+        dql__417_5_9__296_18_21_gen_2[i:I, j:J, k:K] = (q[i:I, j:J, k:K] - np.minimum(np.minimum(q[i:I, j:J, k:K], q[i - 1:I - 1, j:J, k:K]), q[i + 1:I + 1, j:J, k:K]))
+        a__1c3_6_11__417_5_9__296_18_21_gen_2[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(xt__417_5_9__296_18_21_gen_2[i:I, j:J, k:K]), dqr__417_5_9__296_18_21_gen_2[i:I, j:J, k:K]), dql__417_5_9__296_18_21_gen_2[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_2[i:I, j:J, k:K] = np.abs(a__1c3_6_11__417_5_9__296_18_21_gen_2[i:I, j:J, k:K])
+        mask_140013247518992_gen_2[i:I, j:J, k:K] = (xt__417_5_9__296_18_21_gen_2[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_2[i:I, j:J, k:K] = np.where(mask_140013247518992_gen_2[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_2[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_2[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_2[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013247518992_gen_2[i:I, j:J, k:K])), (-(asignb__1c3_6_11__417_5_9__296_18_21_gen_2[i:I, j:J, k:K])), asignb__1c3_6_11__417_5_9__296_18_21_gen_2[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_2[i:I, j:J, k:K] = asignb__1c3_6_11__417_5_9__296_18_21_gen_2[i:I, j:J, k:K]
+        dm__296_18_21_gen_2[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_2[i:I, j:J, k:K]
+        xt__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K] = (np.float64(2.0) * dm__296_18_21_gen_2[i:I, j:J, k:K])
+        a__1c3_4_16__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.minimum(np.abs(xt__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K]), np.abs((al__296_18_21_gen_1[i:I, j:J, k:K] - q[i:I, j:J, k:K])))
+        asignb__1c3_4_16__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.abs(a__1c3_4_16__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K])
+        mask_140013246531024_gen_0[i:I, j:J, k:K] = (xt__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_4_16__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.where(mask_140013246531024_gen_0[i:I, j:J, k:K], asignb__1c3_4_16__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K], asignb__1c3_4_16__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_4_16__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013246531024_gen_0[i:I, j:J, k:K])), (-(asignb__1c3_4_16__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K])), asignb__1c3_4_16__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_4_16__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K] = asignb__1c3_4_16__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K]
+        bl__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K] = ((-(np.float64(1.0))) * RETURN_VALUE__1c3_4_16__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K])
+        a__1c3_5_9__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.minimum(np.abs(xt__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K]), np.abs((al__296_18_21_gen_0[i:I, j:J, k:K] - q[i:I, j:J, k:K])))
+        asignb__1c3_5_9__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.abs(a__1c3_5_9__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K])
+        mask_140013251658896_gen_0[i:I, j:J, k:K] = (xt__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_5_9__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.where(mask_140013251658896_gen_0[i:I, j:J, k:K], asignb__1c3_5_9__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K], asignb__1c3_5_9__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_5_9__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013251658896_gen_0[i:I, j:J, k:K])), (-(asignb__1c3_5_9__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K])), asignb__1c3_5_9__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K])
+        br__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K] = asignb__1c3_5_9__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K]
+        bl__296_18_21_gen_0[i:I, j:J, k:K] = bl__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K]
+        br__296_18_21_gen_0[i:I, j:J, k:K] = br__e43_10_13__296_18_21_gen_0[i:I, j:J, k:K]
+        bl__da4_11_13__296_18_21[i:I, j:J, k:K] = bl__296_18_21_gen_0[i:I, j:J, k:K]
+        br__da4_11_13__296_18_21[i:I, j:J, k:K] = br__296_18_21_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+
+        # --- begin horizontal block --
+        i, I = _di_ - 1, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        xt__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (np.float64(0.25) * (q[i + 2:I + 2, j:J, k:K] - q[i:I, j:J, k:K]))
+        dqr__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i + 1:I + 1, j:J, k:K], q[i:I, j:J, k:K]), q[i + 2:I + 2, j:J, k:K]) - q[i + 1:I + 1, j:J, k:K])
+        dql__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (q[i + 1:I + 1, j:J, k:K] - np.minimum(np.minimum(q[i + 1:I + 1, j:J, k:K], q[i:I, j:J, k:K]), q[i + 2:I + 2, j:J, k:K]))
+        a__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(xt__417_5_9__296_18_21_gen_1[i:I, j:J, k:K]), dqr__417_5_9__296_18_21_gen_1[i:I, j:J, k:K]), dql__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.abs(a__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        mask_140013247518992_gen_1[i:I, j:J, k:K] = (xt__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.where(mask_140013247518992_gen_1[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013247518992_gen_1[i:I, j:J, k:K])), (-(asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])), asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K] = asignb__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K]
+        dm__296_18_21_gen_1[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_1[i:I, j:J, k:K]
+        xt__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (np.float64(0.25) * (q[i + 1:I + 1, j:J, k:K] - q[i - 1:I - 1, j:J, k:K]))
+        dqr__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j:J, k:K], q[i - 1:I - 1, j:J, k:K]), q[i + 1:I + 1, j:J, k:K]) - q[i:I, j:J, k:K])
+        dql__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (q[i:I, j:J, k:K] - np.minimum(np.minimum(q[i:I, j:J, k:K], q[i - 1:I - 1, j:J, k:K]), q[i + 1:I + 1, j:J, k:K]))
+        a__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(xt__417_5_9__296_18_21_gen_0[i:I, j:J, k:K]), dqr__417_5_9__296_18_21_gen_0[i:I, j:J, k:K]), dql__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.abs(a__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        mask_140013247518992_gen_0[i:I, j:J, k:K] = (xt__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.where(mask_140013247518992_gen_0[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013247518992_gen_0[i:I, j:J, k:K])), (-(asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])), asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K] = asignb__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K]
+        dm__296_18_21_gen_0[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_0[i:I, j:J, k:K]
+        al__296_18_21_gen_2[i:I, j:J, k:K] = ((np.float64(0.5) * (q[i:I, j:J, k:K] + q[i + 1:I + 1, j:J, k:K])) + ((np.float64(1.0) / np.float64(3.0)) * (dm__296_18_21_gen_0[i:I, j:J, k:K] - dm__296_18_21_gen_1[i:I, j:J, k:K])))
+        al_ip1__da4_11_13__296_18_21_gen_0[i:I, j:J, k:K] = al__296_18_21_gen_2[i:I, j:J, k:K]
+        xt__417_5_9__296_18_21_gen_5[i:I, j:J, k:K] = (np.float64(0.25) * (q[i + 1:I + 1, j:J, k:K] - q[i - 1:I - 1, j:J, k:K]))
+        dqr__417_5_9__296_18_21_gen_5[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j:J, k:K], q[i - 1:I - 1, j:J, k:K]), q[i + 1:I + 1, j:J, k:K]) - q[i:I, j:J, k:K])
+        dql__417_5_9__296_18_21_gen_5[i:I, j:J, k:K] = (q[i:I, j:J, k:K] - np.minimum(np.minimum(q[i:I, j:J, k:K], q[i - 1:I - 1, j:J, k:K]), q[i + 1:I + 1, j:J, k:K]))
+        a__1c3_6_11__417_5_9__296_18_21_gen_4[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(xt__417_5_9__296_18_21_gen_5[i:I, j:J, k:K]), dqr__417_5_9__296_18_21_gen_5[i:I, j:J, k:K]), dql__417_5_9__296_18_21_gen_5[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_4[i:I, j:J, k:K] = np.abs(a__1c3_6_11__417_5_9__296_18_21_gen_4[i:I, j:J, k:K])
+        mask_140013247518992_gen_5[i:I, j:J, k:K] = (xt__417_5_9__296_18_21_gen_5[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_4[i:I, j:J, k:K] = np.where(mask_140013247518992_gen_5[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_4[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_4[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_4[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013247518992_gen_5[i:I, j:J, k:K])), (-(asignb__1c3_6_11__417_5_9__296_18_21_gen_4[i:I, j:J, k:K])), asignb__1c3_6_11__417_5_9__296_18_21_gen_4[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_5[i:I, j:J, k:K] = asignb__1c3_6_11__417_5_9__296_18_21_gen_4[i:I, j:J, k:K]
+        dm__296_18_21_gen_4[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_5[i:I, j:J, k:K]
+        xt__417_5_9__296_18_21_gen_4[i:I, j:J, k:K] = (np.float64(0.25) * (q[i:I, j:J, k:K] - q[i - 2:I - 2, j:J, k:K]))
+        dqr__417_5_9__296_18_21_gen_4[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i - 1:I - 1, j:J, k:K], q[i - 2:I - 2, j:J, k:K]), q[i:I, j:J, k:K]) - q[i - 1:I - 1, j:J, k:K])
+        dql__417_5_9__296_18_21_gen_4[i:I, j:J, k:K] = (q[i - 1:I - 1, j:J, k:K] - np.minimum(np.minimum(q[i - 1:I - 1, j:J, k:K], q[i - 2:I - 2, j:J, k:K]), q[i:I, j:J, k:K]))
+        a__1c3_6_11__417_5_9__296_18_21_gen_5[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(xt__417_5_9__296_18_21_gen_4[i:I, j:J, k:K]), dqr__417_5_9__296_18_21_gen_4[i:I, j:J, k:K]), dql__417_5_9__296_18_21_gen_4[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_5[i:I, j:J, k:K] = np.abs(a__1c3_6_11__417_5_9__296_18_21_gen_5[i:I, j:J, k:K])
+        mask_140013247518992_gen_4[i:I, j:J, k:K] = (xt__417_5_9__296_18_21_gen_4[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_5[i:I, j:J, k:K] = np.where(mask_140013247518992_gen_4[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_5[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_5[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_5[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013247518992_gen_4[i:I, j:J, k:K])), (-(asignb__1c3_6_11__417_5_9__296_18_21_gen_5[i:I, j:J, k:K])), asignb__1c3_6_11__417_5_9__296_18_21_gen_5[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_4[i:I, j:J, k:K] = asignb__1c3_6_11__417_5_9__296_18_21_gen_5[i:I, j:J, k:K]
+        dm__296_18_21_gen_5[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_4[i:I, j:J, k:K]
+        al__296_18_21_gen_3[i:I, j:J, k:K] = ((np.float64(0.5) * (q[i - 1:I - 1, j:J, k:K] + q[i:I, j:J, k:K])) + ((np.float64(1.0) / np.float64(3.0)) * (dm__296_18_21_gen_5[i:I, j:J, k:K] - dm__296_18_21_gen_4[i:I, j:J, k:K])))
+        xt__417_5_9__296_18_21_gen_3[i:I, j:J, k:K] = (np.float64(0.25) * (q[i + 1:I + 1, j:J, k:K] - q[i - 1:I - 1, j:J, k:K]))
+        dqr__417_5_9__296_18_21_gen_3[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j:J, k:K], q[i - 1:I - 1, j:J, k:K]), q[i + 1:I + 1, j:J, k:K]) - q[i:I, j:J, k:K])
+        dql__417_5_9__296_18_21_gen_3[i:I, j:J, k:K] = (q[i:I, j:J, k:K] - np.minimum(np.minimum(q[i:I, j:J, k:K], q[i - 1:I - 1, j:J, k:K]), q[i + 1:I + 1, j:J, k:K]))
+        a__1c3_6_11__417_5_9__296_18_21_gen_3[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(xt__417_5_9__296_18_21_gen_3[i:I, j:J, k:K]), dqr__417_5_9__296_18_21_gen_3[i:I, j:J, k:K]), dql__417_5_9__296_18_21_gen_3[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_3[i:I, j:J, k:K] = np.abs(a__1c3_6_11__417_5_9__296_18_21_gen_3[i:I, j:J, k:K])
+        mask_140013247518992_gen_3[i:I, j:J, k:K] = (xt__417_5_9__296_18_21_gen_3[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_3[i:I, j:J, k:K] = np.where(mask_140013247518992_gen_3[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_3[i:I, j:J, k:K], asignb__1c3_6_11__417_5_9__296_18_21_gen_3[i:I, j:J, k:K])
+        asignb__1c3_6_11__417_5_9__296_18_21_gen_3[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013247518992_gen_3[i:I, j:J, k:K])), (-(asignb__1c3_6_11__417_5_9__296_18_21_gen_3[i:I, j:J, k:K])), asignb__1c3_6_11__417_5_9__296_18_21_gen_3[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_3[i:I, j:J, k:K] = asignb__1c3_6_11__417_5_9__296_18_21_gen_3[i:I, j:J, k:K]
+        dm__296_18_21_gen_3[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__417_5_9__296_18_21_gen_3[i:I, j:J, k:K]
+        xt__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] = (np.float64(0.25) * (q[i:i + 1, j:J, k:K] - q[i - 2:i - 1, j:J, k:K]))
+        dqr__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] = (np.maximum(np.maximum(q[i - 1:i, j:J, k:K], q[i - 2:i - 1, j:J, k:K]), q[i:i + 1, j:J, k:K]) - q[i - 1:i, j:J, k:K])
+        dql__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] = (q[i - 1:i, j:J, k:K] - np.minimum(np.minimum(q[i - 1:i, j:J, k:K], q[i - 2:i - 1, j:J, k:K]), q[i:i + 1, j:J, k:K]))
+        a__1c3_14_18__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] = np.minimum(np.minimum(np.abs(xt__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K]), dqr__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K]), dql__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K])
+        asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] = np.abs(a__1c3_14_18__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K])
+        mask_140013246408784_gen_0[i:i + 1, j:J, k:K] = (xt__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] = np.where(mask_140013246408784_gen_0[i:i + 1, j:J, k:K], asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K], asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K])
+        asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] = np.where((np.bitwise_not(mask_140013246408784_gen_0[i:i + 1, j:J, k:K])), (-(asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K])), asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K])
+        dm_left__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] = asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K]
+        xt_bl__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] = (((np.float64(0.5714285714285714) * dm_left__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K]) + (np.float64(0.7857142857142857) * (q[i - 1:i, j:J, k:K] - q[i:i + 1, j:J, k:K]))) + q[i:i + 1, j:J, k:K])
+        xt__11a_16_16__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] = (np.float64(0.5) * ((((((np.float64(2.0) * dxa[i:i + 1, j:J]) + dxa[i - 1:i, j:J]) * q[i:i + 1, j:J, k:K]) - (dxa[i:i + 1, j:J] * q[i - 1:i, j:J, k:K])) / (dxa[i - 1:i, j:J] + dxa[i:i + 1, j:J])) + (((((np.float64(2.0) * dxa[i + 1:i + 2, j:J]) + dxa[i + 2:i + 3, j:J]) * q[i + 1:i + 2, j:J, k:K]) - (dxa[i + 1:i + 2, j:J] * q[i + 2:i + 3, j:J, k:K])) / (dxa[i + 1:i + 2, j:J] + dxa[i + 2:i + 3, j:J]))))
+        minq__11a_16_16__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] = np.minimum(np.minimum(np.minimum(q[i - 1:i, j:J, k:K], q[i:i + 1, j:J, k:K]), q[i + 1:i + 2, j:J, k:K]), q[i + 2:i + 3, j:J, k:K])
+        maxq__11a_16_16__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] = np.maximum(np.maximum(np.maximum(q[i - 1:i, j:J, k:K], q[i:i + 1, j:J, k:K]), q[i + 1:i + 2, j:J, k:K]), q[i + 2:i + 3, j:J, k:K])
+        xt__11a_16_16__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] = np.minimum(np.maximum(xt__11a_16_16__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K], minq__11a_16_16__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K]), maxq__11a_16_16__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K])
+        xt_br__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K] = xt__11a_16_16__da4_11_13__296_18_21_gen_0[i:i + 1, j:J, k:K]
+        xt__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = (np.float64(0.25) * (q[i + 3:i + 4, j:J, k:K] - q[i + 1:i + 2, j:J, k:K]))
+        dqr__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = (np.maximum(np.maximum(q[i + 2:i + 3, j:J, k:K], q[i + 1:i + 2, j:J, k:K]), q[i + 3:i + 4, j:J, k:K]) - q[i + 2:i + 3, j:J, k:K])
+        dql__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = (q[i + 2:i + 3, j:J, k:K] - np.minimum(np.minimum(q[i + 2:i + 3, j:J, k:K], q[i + 1:i + 2, j:J, k:K]), q[i + 3:i + 4, j:J, k:K]))
+        a__1c3_24_19__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = np.minimum(np.minimum(np.abs(xt__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K]), dqr__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K]), dql__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K])
+        asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = np.abs(a__1c3_24_19__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K])
+        mask_140013248121808_gen_0[i + 1:i + 2, j:J, k:K] = (xt__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = np.where(mask_140013248121808_gen_0[i + 1:i + 2, j:J, k:K], asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K], asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K])
+        asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = np.where((np.bitwise_not(mask_140013248121808_gen_0[i + 1:i + 2, j:J, k:K])), (-(asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K])), asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K])
+        dm_right__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K]
+        xt_bl__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = (((np.float64(0.5714285714285714) * dm_left__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K]) + (np.float64(0.7857142857142857) * (q[i:i + 1, j:J, k:K] - q[i + 1:i + 2, j:J, k:K]))) + q[i + 1:i + 2, j:J, k:K])
+        xt__090_26_16__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = (np.float64(0.5) * ((((((np.float64(2.0) * dxa[i:i + 1, j:J]) + dxa[i - 1:i, j:J]) * q[i:i + 1, j:J, k:K]) - (dxa[i:i + 1, j:J] * q[i - 1:i, j:J, k:K])) / (dxa[i - 1:i, j:J] + dxa[i:i + 1, j:J])) + (((((np.float64(2.0) * dxa[i + 1:i + 2, j:J]) + dxa[i + 2:i + 3, j:J]) * q[i + 1:i + 2, j:J, k:K]) - (dxa[i + 1:i + 2, j:J] * q[i + 2:i + 3, j:J, k:K])) / (dxa[i + 1:i + 2, j:J] + dxa[i + 2:i + 3, j:J]))))
+        minq__090_26_16__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = np.minimum(np.minimum(np.minimum(q[i - 1:i, j:J, k:K], q[i:i + 1, j:J, k:K]), q[i + 1:i + 2, j:J, k:K]), q[i + 2:i + 3, j:J, k:K])
+        maxq__090_26_16__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = np.maximum(np.maximum(np.maximum(q[i - 1:i, j:J, k:K], q[i:i + 1, j:J, k:K]), q[i + 1:i + 2, j:J, k:K]), q[i + 2:i + 3, j:J, k:K])
+        xt__090_26_16__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = np.minimum(np.maximum(xt__090_26_16__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K], minq__090_26_16__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K]), maxq__090_26_16__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K])
+        xt_bl__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = xt__090_26_16__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K]
+        xt_br__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K] = (((np.float64(0.21428571428571427) * q[i + 1:i + 2, j:J, k:K]) + (np.float64(0.7857142857142857) * q[i + 2:i + 3, j:J, k:K])) - (np.float64(0.5714285714285714) * dm_right__da4_11_13__296_18_21_gen_0[i + 1:i + 2, j:J, k:K]))
+        xt_bl__da4_11_13__296_18_21_gen_0[i + 2:i + 3, j:J, k:K] = (((np.float64(0.21428571428571427) * q[i + 1:i + 2, j:J, k:K]) + (np.float64(0.7857142857142857) * q[i + 2:i + 3, j:J, k:K])) - (np.float64(0.5714285714285714) * dm__296_18_21_gen_3[i + 2:i + 3, j:J, k:K]))
+        xt_br__da4_11_13__296_18_21_gen_0[i + 2:i + 3, j:J, k:K] = al_ip1__da4_11_13__296_18_21_gen_0[i + 2:i + 3, j:J, k:K]
+        xt_bl__da4_11_13__296_18_21_gen_0[I - 3:I - 2, j:J, k:K] = al__296_18_21_gen_3[I - 3:I - 2, j:J, k:K]
+        xt_br__da4_11_13__296_18_21_gen_0[I - 3:I - 2, j:J, k:K] = (((np.float64(0.21428571428571427) * q[I - 2:I - 1, j:J, k:K]) + (np.float64(0.7857142857142857) * q[I - 3:I - 2, j:J, k:K])) + (np.float64(0.5714285714285714) * dm__296_18_21_gen_3[I - 3:I - 2, j:J, k:K]))
+        xt__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] = (np.float64(0.25) * (q[I - 2:I - 1, j:J, k:K] - q[I - 4:I - 3, j:J, k:K]))
+        dqr__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] = (np.maximum(np.maximum(q[I - 3:I - 2, j:J, k:K], q[I - 4:I - 3, j:J, k:K]), q[I - 2:I - 1, j:J, k:K]) - q[I - 3:I - 2, j:J, k:K])
+        dql__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] = (q[I - 3:I - 2, j:J, k:K] - np.minimum(np.minimum(q[I - 3:I - 2, j:J, k:K], q[I - 4:I - 3, j:J, k:K]), q[I - 2:I - 1, j:J, k:K]))
+        a__1c3_43_22__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] = np.minimum(np.minimum(np.abs(xt__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K]), dqr__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K]), dql__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K])
+        asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] = np.abs(a__1c3_43_22__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K])
+        mask_140013247512144_gen_0[I - 2:I - 1, j:J, k:K] = (xt__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] = np.where(mask_140013247512144_gen_0[I - 2:I - 1, j:J, k:K], asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K], asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K])
+        asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] = np.where((np.bitwise_not(mask_140013247512144_gen_0[I - 2:I - 1, j:J, k:K])), (-(asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K])), asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K])
+        dm_left_end__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] = asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K]
+        xt_bl__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] = (((np.float64(0.21428571428571427) * q[I - 2:I - 1, j:J, k:K]) + (np.float64(0.7857142857142857) * q[I - 3:I - 2, j:J, k:K])) + (np.float64(0.5714285714285714) * dm_left_end__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K]))
+        xt__11a_45_16__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] = (np.float64(0.5) * ((((((np.float64(2.0) * dxa[I - 2:I - 1, j:J]) + dxa[I - 3:I - 2, j:J]) * q[I - 2:I - 1, j:J, k:K]) - (dxa[I - 2:I - 1, j:J] * q[I - 3:I - 2, j:J, k:K])) / (dxa[I - 3:I - 2, j:J] + dxa[I - 2:I - 1, j:J])) + (((((np.float64(2.0) * dxa[I - 1:I, j:J]) + dxa[I:I + 1, j:J]) * q[I - 1:I, j:J, k:K]) - (dxa[I - 1:I, j:J] * q[I:I + 1, j:J, k:K])) / (dxa[I - 1:I, j:J] + dxa[I:I + 1, j:J]))))
+        minq__11a_45_16__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] = np.minimum(np.minimum(np.minimum(q[I - 3:I - 2, j:J, k:K], q[I - 2:I - 1, j:J, k:K]), q[I - 1:I, j:J, k:K]), q[I:I + 1, j:J, k:K])
+        maxq__11a_45_16__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] = np.maximum(np.maximum(np.maximum(q[I - 3:I - 2, j:J, k:K], q[I - 2:I - 1, j:J, k:K]), q[I - 1:I, j:J, k:K]), q[I:I + 1, j:J, k:K])
+        xt__11a_45_16__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] = np.minimum(np.maximum(xt__11a_45_16__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K], minq__11a_45_16__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K]), maxq__11a_45_16__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K])
+        xt_br__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K] = xt__11a_45_16__da4_11_13__296_18_21_gen_0[I - 2:I - 1, j:J, k:K]
+        xt__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] = (np.float64(0.25) * (q[I + 1:I + 2, j:J, k:K] - q[I - 1:I, j:J, k:K]))
+        dqr__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] = (np.maximum(np.maximum(q[I:I + 1, j:J, k:K], q[I - 1:I, j:J, k:K]), q[I + 1:I + 2, j:J, k:K]) - q[I:I + 1, j:J, k:K])
+        dql__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] = (q[I:I + 1, j:J, k:K] - np.minimum(np.minimum(q[I:I + 1, j:J, k:K], q[I - 1:I, j:J, k:K]), q[I + 1:I + 2, j:J, k:K]))
+        a__1c3_53_23__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] = np.minimum(np.minimum(np.abs(xt__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K]), dqr__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K]), dql__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K])
+        asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] = np.abs(a__1c3_53_23__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K])
+        mask_140013244977808_gen_0[I - 1:I, j:J, k:K] = (xt__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] = np.where(mask_140013244977808_gen_0[I - 1:I, j:J, k:K], asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K], asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K])
+        asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013244977808_gen_0[I - 1:I, j:J, k:K])), (-(asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K])), asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K])
+        dm_right_end__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] = asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K]
+        xt__090_54_16__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] = (np.float64(0.5) * ((((((np.float64(2.0) * dxa[I - 2:I - 1, j:J]) + dxa[I - 3:I - 2, j:J]) * q[I - 2:I - 1, j:J, k:K]) - (dxa[I - 2:I - 1, j:J] * q[I - 3:I - 2, j:J, k:K])) / (dxa[I - 3:I - 2, j:J] + dxa[I - 2:I - 1, j:J])) + (((((np.float64(2.0) * dxa[I - 1:I, j:J]) + dxa[I:I + 1, j:J]) * q[I - 1:I, j:J, k:K]) - (dxa[I - 1:I, j:J] * q[I:I + 1, j:J, k:K])) / (dxa[I - 1:I, j:J] + dxa[I:I + 1, j:J]))))
+        minq__090_54_16__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] = np.minimum(np.minimum(np.minimum(q[I - 3:I - 2, j:J, k:K], q[I - 2:I - 1, j:J, k:K]), q[I - 1:I, j:J, k:K]), q[I:I + 1, j:J, k:K])
+        maxq__090_54_16__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] = np.maximum(np.maximum(np.maximum(q[I - 3:I - 2, j:J, k:K], q[I - 2:I - 1, j:J, k:K]), q[I - 1:I, j:J, k:K]), q[I:I + 1, j:J, k:K])
+        xt__090_54_16__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] = np.minimum(np.maximum(xt__090_54_16__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K], minq__090_54_16__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K]), maxq__090_54_16__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K])
+        xt_bl__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] = xt__090_54_16__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K]
+        xt_br__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K] = (((np.float64(0.7857142857142857) * (q[I:I + 1, j:J, k:K] - q[I - 1:I, j:J, k:K])) - (np.float64(0.5714285714285714) * dm_right_end__da4_11_13__296_18_21_gen_0[I - 1:I, j:J, k:K])) + q[I - 1:I, j:J, k:K])
+        bl__da4_11_13__296_18_21[i:i + 3, j:J, k:K] = (xt_bl__da4_11_13__296_18_21_gen_0[i:i + 3, j:J, k:K] - q[i:i + 3, j:J, k:K])
+        br__da4_11_13__296_18_21[i:i + 3, j:J, k:K] = (xt_br__da4_11_13__296_18_21_gen_0[i:i + 3, j:J, k:K] - q[i:i + 3, j:J, k:K])
+        bl__da4_11_13__296_18_21[I - 3:I, j:J, k:K] = (xt_bl__da4_11_13__296_18_21_gen_0[I - 3:I, j:J, k:K] - q[I - 3:I, j:J, k:K])
+        br__da4_11_13__296_18_21[I - 3:I, j:J, k:K] = (xt_br__da4_11_13__296_18_21_gen_0[I - 3:I, j:J, k:K] - q[I - 3:I, j:J, k:K])
+        bl__296_18_21_gen_1[i:I, j:J, k:K] = bl__da4_11_13__296_18_21[i:I, j:J, k:K]
+        br__296_18_21_gen_1[i:I, j:J, k:K] = br__da4_11_13__296_18_21[i:I, j:J, k:K]
+        al__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K] = bl__296_18_21_gen_1[i:i + 3, j:J, k:K]
+        ar__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K] = br__296_18_21_gen_1[i:i + 3, j:J, k:K]
+        mask_140013249420752_gen_0[i:i + 3, j:J, k:K] = ((al__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K] * ar__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K]) < np.float64(0.0))
+        da1__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K] = np.where(mask_140013249420752_gen_0[i:i + 3, j:J, k:K], (al__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K] - ar__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K]), da1__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K])
+        da2__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K] = np.where(mask_140013249420752_gen_0[i:i + 3, j:J, k:K], np.power(da1__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K], np.float64(np.int64(2))), da2__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K])
+        a6da__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K] = np.where(mask_140013249420752_gen_0[i:i + 3, j:J, k:K], ((np.float64(3.0) * (al__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K] + ar__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K])) * da1__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K]), a6da__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K])
+        mask_140013246667600_gen_0[i:i + 3, j:J, k:K] = (a6da__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K] < (-(da2__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K])))
+        ar__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K] = np.where(np.bitwise_and(mask_140013249420752_gen_0[i:i + 3, j:J, k:K], mask_140013246667600_gen_0[i:i + 3, j:J, k:K]), ((-(np.float64(2.0))) * al__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K]), ar__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K])
+        mask_140013244874448_gen_0[i:i + 3, j:J, k:K] = (a6da__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K] > da2__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K])
+        al__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_140013249420752_gen_0[i:i + 3, j:J, k:K], (np.bitwise_not(mask_140013246667600_gen_0[i:i + 3, j:J, k:K]))), mask_140013244874448_gen_0[i:i + 3, j:J, k:K]), ((-(np.float64(2.0))) * ar__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K]), al__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K])
+        al__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K] = np.where((np.bitwise_not(mask_140013249420752_gen_0[i:i + 3, j:J, k:K])), np.float64(0.0), al__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K])
+        ar__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K] = np.where((np.bitwise_not(mask_140013249420752_gen_0[i:i + 3, j:J, k:K])), np.float64(0.0), ar__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K])
+        bl__296_18_21_gen_1[i:i + 3, j:J, k:K] = al__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K]
+        br__296_18_21_gen_1[i:i + 3, j:J, k:K] = ar__4cc_16_17__296_18_21_gen_0[i:i + 3, j:J, k:K]
+        al__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K] = bl__296_18_21_gen_1[I - 3:I, j:J, k:K]
+        ar__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K] = br__296_18_21_gen_1[I - 3:I, j:J, k:K]
+        mask_140013246285008_gen_0[I - 3:I, j:J, k:K] = ((al__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K] * ar__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K]) < np.float64(0.0))
+        da1__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K] = np.where(mask_140013246285008_gen_0[I - 3:I, j:J, k:K], (al__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K] - ar__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K]), da1__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K])
+        da2__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K] = np.where(mask_140013246285008_gen_0[I - 3:I, j:J, k:K], np.power(da1__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K], np.float64(np.int64(2))), da2__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K])
+        a6da__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K] = np.where(mask_140013246285008_gen_0[I - 3:I, j:J, k:K], ((np.float64(3.0) * (al__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K] + ar__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K])) * da1__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K]), a6da__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K])
+        mask_140013253674896_gen_0[I - 3:I, j:J, k:K] = (a6da__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K] < (-(da2__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K])))
+        ar__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K] = np.where(np.bitwise_and(mask_140013246285008_gen_0[I - 3:I, j:J, k:K], mask_140013253674896_gen_0[I - 3:I, j:J, k:K]), ((-(np.float64(2.0))) * al__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K]), ar__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K])
+        mask_140013253676624_gen_0[I - 3:I, j:J, k:K] = (a6da__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K] > da2__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K])
+        al__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_140013246285008_gen_0[I - 3:I, j:J, k:K], (np.bitwise_not(mask_140013253674896_gen_0[I - 3:I, j:J, k:K]))), mask_140013253676624_gen_0[I - 3:I, j:J, k:K]), ((-(np.float64(2.0))) * ar__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K]), al__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K])
+        al__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013246285008_gen_0[I - 3:I, j:J, k:K])), np.float64(0.0), al__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K])
+        ar__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013246285008_gen_0[I - 3:I, j:J, k:K])), np.float64(0.0), ar__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K])
+        bl__296_18_21_gen_1[I - 3:I, j:J, k:K] = al__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K]
+        br__296_18_21_gen_1[I - 3:I, j:J, k:K] = ar__4cc_16_17__296_18_21_gen_0[I - 3:I, j:J, k:K]
+        bl[i:I, j:J, k:K] = bl__296_18_21_gen_1[i:I, j:J, k:K]
+        br[i:I, j:J, k:K] = br__296_18_21_gen_1[i:I, j:J, k:K]
+        b0__804_19_20[i:I, j:J, k:K] = (bl[i:I, j:J, k:K] + br[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_140013247969808_gen_0[i:I, j:J, k:K] = (courant[i:I, j:J, k:K] > np.float64(0.0))
+        ret__0ed_6_10__804_19_20_gen_0[i:I, j:J, k:K] = np.where(mask_140013247969808_gen_0[i:I, j:J, k:K], ((np.float64(1.0) - courant[i:I, j:J, k:K]) * (br[i - 1:I - 1, j:J, k:K] - (courant[i:I, j:J, k:K] * b0__804_19_20[i - 1:I - 1, j:J, k:K]))), ret__0ed_6_10__804_19_20_gen_0[i:I, j:J, k:K])
+        ret__0ed_6_10__804_19_20_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_140013247969808_gen_0[i:I, j:J, k:K])), ((np.float64(1.0) + courant[i:I, j:J, k:K]) * (bl[i:I, j:J, k:K] + (courant[i:I, j:J, k:K] * b0__804_19_20[i:I, j:J, k:K]))), ret__0ed_6_10__804_19_20_gen_0[i:I, j:J, k:K])
+        fx1__804_19_20_gen_0[i:I, j:J, k:K] = ret__0ed_6_10__804_19_20_gen_0[i:I, j:J, k:K]
+        mask__238_7_11__804_19_20_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        RETURN_VALUE__238_7_11__804_19_20_gen_0[i:I, j:J, k:K] = np.where((courant[i:I, j:J, k:K] > np.float64(0.0)), (q[i - 1:I - 1, j:J, k:K] + (fx1__804_19_20_gen_0[i:I, j:J, k:K] * mask__238_7_11__804_19_20_gen_0[i:I, j:J, k:K])), (q[i:I, j:J, k:K] + (fx1__804_19_20_gen_0[i:I, j:J, k:K] * mask__238_7_11__804_19_20_gen_0[i:I, j:J, k:K])))
+        xflux[i:I, j:J, k:K] = RETURN_VALUE__238_7_11__804_19_20_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,135 @@
+
+
+import pathlib
+import time
+
+import numpy as np
+from numpy import dtype
+from gt4py.cartesian.stencil_object import StencilObject
+import pathlib
+from gt4py.cartesian.utils import make_module_from_file
+computation = make_module_from_file("m_computation__numpy_30aa0d518b", pathlib.Path(__file__).parent / "m_computation__numpy_30aa0d518b.py")
+
+from gt4py.cartesian.definitions import AccessKind, Boundary, CartesianSpace
+from gt4py.cartesian.stencil_object import DomainInfo, FieldInfo, ParameterInfo
+
+
+
+class icloud____numpy_30aa0d518b(StencilObject):
+    """
+    
+
+    The callable interface is the same of the stencil definition function,
+    with some extra keyword arguments. Check :class:`gt4py.StencilObject`
+    for the full specification.
+    """
+
+    _gt_backend_ = "numpy"
+
+    _gt_source_ = {}
+
+    _gt_domain_info_ = DomainInfo(parallel_axes=('I', 'J'), sequential_axis='K', min_sequential_axis_size=2, ndim=3)
+
+    _gt_field_info_ = {'h_var': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'rh_adj': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'rh_rain': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'qaz': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'qgz': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'qiz': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'qlz': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'qrz': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'qsz': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'qvz': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'tz': FieldInfo(access=AccessKind.READ_WRITE, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'den': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'denfac': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'p1': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'vtgz': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'vtrz': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64')), 'vtsz': FieldInfo(access=AccessKind.READ, boundary=Boundary(((0, 0), (0, 0), (0, 0))), axes=('I', 'J', 'K'), data_dims=(), dtype=dtype('float64'))}
+
+    _gt_parameter_info_ = {'c_air': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'c_vap': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'd0_vap': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'lv00': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cracs': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'csacr': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cgacr': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cgacs': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'acco_00': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'acco_01': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'acco_02': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'acco_03': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'acco_10': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'acco_11': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'acco_12': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'acco_13': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'acco_20': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'acco_21': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'acco_22': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'acco_23': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'csacw': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'csaci': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cgacw': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cgaci': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cracw': ParameterInfo(access=AccessKind.NONE, dtype=dtype('float64')), 'cssub_0': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cssub_1': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cssub_2': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cssub_3': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cssub_4': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cgfr_0': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cgfr_1': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'csmlt_0': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'csmlt_1': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'csmlt_2': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'csmlt_3': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'csmlt_4': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cgmlt_0': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cgmlt_1': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cgmlt_2': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cgmlt_3': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'cgmlt_4': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'ces0': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'dts': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'rdts': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'fac_i2s': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'fac_g2v': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'fac_v2g': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'fac_imlt': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64')), 'fac_l2v': ParameterInfo(access=AccessKind.READ, dtype=dtype('float64'))}
+
+    _gt_constants_ = {}
+
+    _gt_options_ = {'name': 'icloud', 'module': 'pace.physics.stencils.microphysics', 'format_source': False, 'backend_opts': {}, 'rebuild': False, 'raise_if_not_cached': False, 'cache_settings': {}, '_impl_opts': {}}
+
+    @property
+    def backend(self):
+        return type(self)._gt_backend_
+
+    @property
+    def source(self):
+        return type(self)._gt_source_
+
+    @property
+    def domain_info(self):
+        return type(self)._gt_domain_info_
+
+    @property
+    def field_info(self) -> dict:
+        return type(self)._gt_field_info_
+
+    @property
+    def parameter_info(self) -> dict:
+        return type(self)._gt_parameter_info_
+
+    @property
+    def constants(self) -> dict:
+        return type(self)._gt_constants_
+
+    @property
+    def options(self) -> dict:
+        return type(self)._gt_options_
+
+    def __call__(
+        self, h_var, rh_adj, rh_rain, qaz, qgz, qiz, qlz, qrz, qsz, qvz, tz, den, denfac, p1, vtgz, vtrz, vtsz, c_air, c_vap, d0_vap, lv00, cracs, csacr, cgacr, cgacs, acco_00, acco_01, acco_02, acco_03, acco_10, acco_11, acco_12, acco_13, acco_20, acco_21, acco_22, acco_23, csacw, csaci, cgacw, cgaci, cracw, cssub_0, cssub_1, cssub_2, cssub_3, cssub_4, cgfr_0, cgfr_1, csmlt_0, csmlt_1, csmlt_2, csmlt_3, csmlt_4, cgmlt_0, cgmlt_1, cgmlt_2, cgmlt_3, cgmlt_4, ces0, dts, rdts, fac_i2s, fac_g2v, fac_v2g, fac_imlt, fac_l2v, domain=None, origin=None, validate_args=True, exec_info=None
+    ):
+        if exec_info is not None:
+            exec_info["call_start_time"] = time.perf_counter()
+
+        field_args=dict( qlz=qlz,  rh_rain=rh_rain,  den=den,  vtrz=vtrz,  qrz=qrz,  qgz=qgz,  rh_adj=rh_adj,  qaz=qaz,  qsz=qsz,  qvz=qvz,  tz=tz,  h_var=h_var,  denfac=denfac,  qiz=qiz,  vtgz=vtgz,  p1=p1,  vtsz=vtsz)
+        parameter_args=dict( cssub_3=cssub_3,  csaci=csaci,  lv00=lv00,  acco_12=acco_12,  ces0=ces0,  fac_l2v=fac_l2v,  acco_00=acco_00,  cgmlt_4=cgmlt_4,  cssub_2=cssub_2,  acco_10=acco_10,  acco_01=acco_01,  cssub_4=cssub_4,  acco_20=acco_20,  acco_11=acco_11,  cssub_0=cssub_0,  cgmlt_0=cgmlt_0,  cgaci=cgaci,  cgacs=cgacs,  cracs=cracs,  csmlt_1=csmlt_1,  fac_i2s=fac_i2s,  csmlt_2=csmlt_2,  csmlt_4=csmlt_4,  csacw=csacw,  acco_03=acco_03,  csacr=csacr,  d0_vap=d0_vap,  c_air=c_air,  rdts=rdts,  fac_v2g=fac_v2g,  fac_imlt=fac_imlt,  fac_g2v=fac_g2v,  dts=dts,  cracw=cracw,  acco_21=acco_21,  cgacr=cgacr,  cgmlt_2=cgmlt_2,  cgmlt_3=cgmlt_3,  cssub_1=cssub_1,  csmlt_0=csmlt_0,  acco_22=acco_22,  c_vap=c_vap,  cgacw=cgacw,  cgmlt_1=cgmlt_1,  csmlt_3=csmlt_3,  cgfr_1=cgfr_1,  acco_23=acco_23,  acco_02=acco_02,  acco_13=acco_13,  cgfr_0=cgfr_0)
+        # assert that all required values have been provided
+
+
+        self._call_run(
+            field_args=field_args,
+            parameter_args=parameter_args,
+            domain=domain,
+            origin=origin,
+            validate_args=validate_args,
+            exec_info=exec_info,
+        )
+
+
+        if exec_info is not None:
+            exec_info["call_end_time"] = time.perf_counter()
+
+            if exec_info.setdefault("__aggregate_data", False):
+                stencil_info = exec_info.setdefault("icloud____numpy_30aa0d518b", {})
+
+                # Update performance counters
+                stencil_info["call_start_time"] = exec_info["call_start_time"]
+                stencil_info["call_end_time"] = exec_info["call_end_time"]
+                stencil_info["call_time"] = (
+                    stencil_info["call_end_time"]
+                    - stencil_info["call_start_time"]
+                )
+                stencil_info["total_call_time"] = (
+                    stencil_info.get("total_call_time", 0.0)
+                    + stencil_info["call_time"]
+                )
+                stencil_info["ncalls"] = (
+                    stencil_info.get("ncalls", 0) + 1
+                )
+                stencil_info["run_time"] = (
+                    exec_info["run_end_time"]
+                    - exec_info["run_start_time"]
+                )
+                stencil_info["total_run_time"] = (
+                    stencil_info.get("total_run_time", 0.0)
+                    + stencil_info["run_time"]
+                )
+                if "run_cpp_start_time" in exec_info:
+                    stencil_info["run_cpp_time"] = (
+                        exec_info["run_cpp_end_time"]
+                        - exec_info["run_cpp_start_time"]
+                    )
+                    stencil_info["total_run_cpp_time"] = (
+                        stencil_info.get("total_run_cpp_time", 0.0)
+                        + stencil_info["run_cpp_time"]
+                    )
+
+    def run(self, _domain_, _origin_, exec_info, *,qlz, rh_rain, den, vtrz, qrz, qgz, rh_adj, qaz, qsz, qvz, tz, h_var, denfac, qiz, vtgz, p1, vtsz,cssub_3, csaci, lv00, acco_12, ces0, fac_l2v, acco_00, cgmlt_4, cssub_2, acco_10, acco_01, cssub_4, acco_20, acco_11, cssub_0, cgmlt_0, cgaci, cgacs, cracs, csmlt_1, fac_i2s, csmlt_2, csmlt_4, csacw, acco_03, csacr, d0_vap, c_air, rdts, fac_v2g, fac_imlt, fac_g2v, dts, cracw, acco_21, cgacr, cgmlt_2, cgmlt_3, cssub_1, csmlt_0, acco_22, c_vap, cgacw, cgmlt_1, csmlt_3, cgfr_1, acco_23, acco_02, acco_13, cgfr_0):
+        if exec_info is not None:
+            exec_info["domain"] = _domain_
+            exec_info["origin"] = _origin_
+            exec_info["run_start_time"] = time.perf_counter()
+        computation.run(h_var=h_var, rh_adj=rh_adj, rh_rain=rh_rain, qaz=qaz, qgz=qgz, qiz=qiz, qlz=qlz, qrz=qrz, qsz=qsz, qvz=qvz, tz=tz, den=den, denfac=denfac, p1=p1, vtgz=vtgz, vtrz=vtrz, vtsz=vtsz, c_air=c_air, c_vap=c_vap, d0_vap=d0_vap, lv00=lv00, cracs=cracs, csacr=csacr, cgacr=cgacr, cgacs=cgacs, acco_00=acco_00, acco_01=acco_01, acco_02=acco_02, acco_03=acco_03, acco_10=acco_10, acco_11=acco_11, acco_12=acco_12, acco_13=acco_13, acco_20=acco_20, acco_21=acco_21, acco_22=acco_22, acco_23=acco_23, csacw=csacw, csaci=csaci, cgacw=cgacw, cgaci=cgaci, cssub_0=cssub_0, cssub_1=cssub_1, cssub_2=cssub_2, cssub_3=cssub_3, cssub_4=cssub_4, cgfr_0=cgfr_0, cgfr_1=cgfr_1, csmlt_0=csmlt_0, csmlt_1=csmlt_1, csmlt_2=csmlt_2, csmlt_3=csmlt_3, csmlt_4=csmlt_4, cgmlt_0=cgmlt_0, cgmlt_1=cgmlt_1, cgmlt_2=cgmlt_2, cgmlt_3=cgmlt_3, cgmlt_4=cgmlt_4, ces0=ces0, dts=dts, rdts=rdts, fac_i2s=fac_i2s, fac_g2v=fac_g2v, fac_v2g=fac_v2g, fac_imlt=fac_imlt, fac_l2v=fac_l2v, _domain_=_domain_, _origin_=_origin_)
+        if exec_info is not None:
+            exec_info["run_end_time"] = time.perf_counter()
\ No newline at end of file
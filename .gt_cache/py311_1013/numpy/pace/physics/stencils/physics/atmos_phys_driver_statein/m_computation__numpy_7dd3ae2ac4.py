@@ -0,0 +1,265 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, prsik, phii, prsi, delz, delp, qvapor, qliquid, qrain, qice, qsnow, qgraupel, qo3mr, qsgs_tke, pt, dm, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    prsik = Field(prsik, _origin_['prsik'], (True, True, True))
+    phii = Field(phii, _origin_['phii'], (True, True, True))
+    prsi = Field(prsi, _origin_['prsi'], (True, True, True))
+    delz = Field(delz, _origin_['delz'], (True, True, True))
+    delp = Field(delp, _origin_['delp'], (True, True, True))
+    qvapor = Field(qvapor, _origin_['qvapor'], (True, True, True))
+    qliquid = Field(qliquid, _origin_['qliquid'], (True, True, True))
+    qrain = Field(qrain, _origin_['qrain'], (True, True, True))
+    qice = Field(qice, _origin_['qice'], (True, True, True))
+    qsnow = Field(qsnow, _origin_['qsnow'], (True, True, True))
+    qgraupel = Field(qgraupel, _origin_['qgraupel'], (True, True, True))
+    qo3mr = Field(qo3mr, _origin_['qo3mr'], (True, True, True))
+    qsgs_tke = Field(qsgs_tke, _origin_['qsgs_tke'], (True, True, True))
+    pt = Field(pt, _origin_['pt'], (True, True, True))
+    dm = Field(dm, _origin_['dm'], (True, True, True))
+    
+    rTv_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qgrs_rad_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qmin_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            phii[i:I, j:J, k_:k_ + 1] = np.float64(0.0)
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            phii[i:I, j:J, k_:k_ + 1] = (phii[i:I, j:J, k_ + 1:k_ + 2] - (delz[i:I, j:J, k_:k_ + 1] * np.float64(9.80665)))
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        prsik[i:I, j:J, k:K] = np.float64(1e+25)
+        qvapor[i:I, j:J, k:K] = (qvapor[i:I, j:J, k:K] * delp[i:I, j:J, k:K])
+        qliquid[i:I, j:J, k:K] = (qliquid[i:I, j:J, k:K] * delp[i:I, j:J, k:K])
+        qrain[i:I, j:J, k:K] = (qrain[i:I, j:J, k:K] * delp[i:I, j:J, k:K])
+        qice[i:I, j:J, k:K] = (qice[i:I, j:J, k:K] * delp[i:I, j:J, k:K])
+        qsnow[i:I, j:J, k:K] = (qsnow[i:I, j:J, k:K] * delp[i:I, j:J, k:K])
+        qgraupel[i:I, j:J, k:K] = (qgraupel[i:I, j:J, k:K] * delp[i:I, j:J, k:K])
+        qo3mr[i:I, j:J, k:K] = (qo3mr[i:I, j:J, k:K] * delp[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        delp[i:I, j:J, k:K] = np.where((np.int64(6) == np.int64(6)), (((((delp[i:I, j:J, k:K] - qliquid[i:I, j:J, k:K]) - qrain[i:I, j:J, k:K]) - qice[i:I, j:J, k:K]) - qsnow[i:I, j:J, k:K]) - qgraupel[i:I, j:J, k:K]), delp[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        prsi[i:I, j:J, k:K] = np.float64(300.0)
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            prsi[i:I, j:J, k_:k_ + 1] = (prsi[i:I, j:J, k_ - 1:k_] + delp[i:I, j:J, k_ - 1:k_])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        prsik[i:I, j:J, k:K] = np.log(prsi[i:I, j:J, k:K])
+        qvapor[i:I, j:J, k:K] = (qvapor[i:I, j:J, k:K] / delp[i:I, j:J, k:K])
+        qliquid[i:I, j:J, k:K] = (qliquid[i:I, j:J, k:K] / delp[i:I, j:J, k:K])
+        qrain[i:I, j:J, k:K] = (qrain[i:I, j:J, k:K] / delp[i:I, j:J, k:K])
+        qice[i:I, j:J, k:K] = (qice[i:I, j:J, k:K] / delp[i:I, j:J, k:K])
+        qsnow[i:I, j:J, k:K] = (qsnow[i:I, j:J, k:K] / delp[i:I, j:J, k:K])
+        qgraupel[i:I, j:J, k:K] = (qgraupel[i:I, j:J, k:K] / delp[i:I, j:J, k:K])
+        qo3mr[i:I, j:J, k:K] = (qo3mr[i:I, j:J, k:K] / delp[i:I, j:J, k:K])
+        qsgs_tke[i:I, j:J, k:K] = (qsgs_tke[i:I, j:J, k:K] / delp[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        prsik[i:I, j:J, k:K] = np.log(prsi[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        prsik[i:I, j:J, k:K] = np.log(np.float64(300.0))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        qmin_gen_0[i:I, j:J, k:K] = np.float64(1e-10)
+        qgrs_rad_gen_0[i:I, j:J, k:K] = np.maximum(qmin_gen_0[i:I, j:J, k:K], qvapor[i:I, j:J, k:K])
+        rTv_gen_0[i:I, j:J, k:K] = ((np.float64(287.05) * pt[i:I, j:J, k:K]) * (np.float64(1.0) + (np.float64(0.6077338442780003) * qgrs_rad_gen_0[i:I, j:J, k:K])))
+        dm[i:I, j:J, k:K] = delp[i:I, j:J, k:K]
+        delp[i:I, j:J, k:K] = ((dm[i:I, j:J, k:K] * rTv_gen_0[i:I, j:J, k:K]) / (phii[i:I, j:J, k:K] - phii[i:I, j:J, k + 1:K + 1]))
+        delp[i:I, j:J, k:K] = np.minimum(delp[i:I, j:J, k:K], (prsi[i:I, j:J, k + 1:K + 1] - (np.float64(0.01) * dm[i:I, j:J, k:K])))
+        delp[i:I, j:J, k:K] = np.maximum(delp[i:I, j:J, k:K], (prsi[i:I, j:J, k:K] + (np.float64(0.01) * dm[i:I, j:J, k:K])))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        prsik[i:I, j:J, k:K] = (np.exp((np.float64(0.2857356161656381) * prsik[i:I, j:J, k:K])) * np.float64(0.03726678425536853))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        prsik[i:I, j:J, k:K] = np.float64(0.19016197847268326)
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
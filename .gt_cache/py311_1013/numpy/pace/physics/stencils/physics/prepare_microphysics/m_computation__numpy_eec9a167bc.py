@@ -0,0 +1,131 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, dz, phii, wmp, omga, qvapor, pt, delp, u_dt, v_dt, pt_dt, qv_dt, ql_dt, qr_dt, qi_dt, qs_dt, qg_dt, qa_dt, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    dz = Field(dz, _origin_['dz'], (True, True, True))
+    phii = Field(phii, _origin_['phii'], (True, True, True))
+    wmp = Field(wmp, _origin_['wmp'], (True, True, True))
+    omga = Field(omga, _origin_['omga'], (True, True, True))
+    qvapor = Field(qvapor, _origin_['qvapor'], (True, True, True))
+    pt = Field(pt, _origin_['pt'], (True, True, True))
+    delp = Field(delp, _origin_['delp'], (True, True, True))
+    u_dt = Field(u_dt, _origin_['u_dt'], (True, True, True))
+    v_dt = Field(v_dt, _origin_['v_dt'], (True, True, True))
+    pt_dt = Field(pt_dt, _origin_['pt_dt'], (True, True, True))
+    qv_dt = Field(qv_dt, _origin_['qv_dt'], (True, True, True))
+    ql_dt = Field(ql_dt, _origin_['ql_dt'], (True, True, True))
+    qr_dt = Field(qr_dt, _origin_['qr_dt'], (True, True, True))
+    qi_dt = Field(qi_dt, _origin_['qi_dt'], (True, True, True))
+    qs_dt = Field(qs_dt, _origin_['qs_dt'], (True, True, True))
+    qg_dt = Field(qg_dt, _origin_['qg_dt'], (True, True, True))
+    qa_dt = Field(qa_dt, _origin_['qa_dt'], (True, True, True))
+    
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            dz[i:I, j:J, k_:k_ + 1] = ((phii[i:I, j:J, k_ + 1:k_ + 2] - phii[i:I, j:J, k_:k_ + 1]) * np.float64(0.10197162129779283))
+            wmp[i:I, j:J, k_:k_ + 1] = (((((-(omga[i:I, j:J, k_:k_ + 1])) * (np.float64(1.0) + (np.float64(0.6077338442780003) * qvapor[i:I, j:J, k_:k_ + 1]))) * pt[i:I, j:J, k_:k_ + 1]) / delp[i:I, j:J, k_:k_ + 1]) * (np.float64(287.05) * np.float64(0.10197162129779283)))
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        u_dt[i:I, j:J, k:K] = np.float64(0.0)
+        v_dt[i:I, j:J, k:K] = np.float64(0.0)
+        pt_dt[i:I, j:J, k:K] = np.float64(0.0)
+        qv_dt[i:I, j:J, k:K] = np.float64(0.0)
+        ql_dt[i:I, j:J, k:K] = np.float64(0.0)
+        qr_dt[i:I, j:J, k:K] = np.float64(0.0)
+        qi_dt[i:I, j:J, k:K] = np.float64(0.0)
+        qs_dt[i:I, j:J, k:K] = np.float64(0.0)
+        qg_dt[i:I, j:J, k:K] = np.float64(0.0)
+        qa_dt[i:I, j:J, k:K] = np.float64(0.0)
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,130 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, qvapor, qliquid, qrain, qice, qsnow, qgraupel, qcld, pt, ua, va, qv_dt, ql_dt, qr_dt, qi_dt, qs_dt, qg_dt, qa_dt, pt_dt, udt, vdt, physics_updated_specific_humidity, physics_updated_qliquid, physics_updated_qrain, physics_updated_qice, physics_updated_qsnow, physics_updated_qgraupel, physics_updated_cloud_fraction, physics_updated_pt, physics_updated_ua, physics_updated_va, dt, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    qvapor = Field(qvapor, _origin_['qvapor'], (True, True, True))
+    qliquid = Field(qliquid, _origin_['qliquid'], (True, True, True))
+    qrain = Field(qrain, _origin_['qrain'], (True, True, True))
+    qice = Field(qice, _origin_['qice'], (True, True, True))
+    qsnow = Field(qsnow, _origin_['qsnow'], (True, True, True))
+    qgraupel = Field(qgraupel, _origin_['qgraupel'], (True, True, True))
+    qcld = Field(qcld, _origin_['qcld'], (True, True, True))
+    pt = Field(pt, _origin_['pt'], (True, True, True))
+    ua = Field(ua, _origin_['ua'], (True, True, True))
+    va = Field(va, _origin_['va'], (True, True, True))
+    qv_dt = Field(qv_dt, _origin_['qv_dt'], (True, True, True))
+    ql_dt = Field(ql_dt, _origin_['ql_dt'], (True, True, True))
+    qr_dt = Field(qr_dt, _origin_['qr_dt'], (True, True, True))
+    qi_dt = Field(qi_dt, _origin_['qi_dt'], (True, True, True))
+    qs_dt = Field(qs_dt, _origin_['qs_dt'], (True, True, True))
+    qg_dt = Field(qg_dt, _origin_['qg_dt'], (True, True, True))
+    qa_dt = Field(qa_dt, _origin_['qa_dt'], (True, True, True))
+    pt_dt = Field(pt_dt, _origin_['pt_dt'], (True, True, True))
+    udt = Field(udt, _origin_['udt'], (True, True, True))
+    vdt = Field(vdt, _origin_['vdt'], (True, True, True))
+    physics_updated_specific_humidity = Field(physics_updated_specific_humidity, _origin_['physics_updated_specific_humidity'], (True, True, True))
+    physics_updated_qliquid = Field(physics_updated_qliquid, _origin_['physics_updated_qliquid'], (True, True, True))
+    physics_updated_qrain = Field(physics_updated_qrain, _origin_['physics_updated_qrain'], (True, True, True))
+    physics_updated_qice = Field(physics_updated_qice, _origin_['physics_updated_qice'], (True, True, True))
+    physics_updated_qsnow = Field(physics_updated_qsnow, _origin_['physics_updated_qsnow'], (True, True, True))
+    physics_updated_qgraupel = Field(physics_updated_qgraupel, _origin_['physics_updated_qgraupel'], (True, True, True))
+    physics_updated_cloud_fraction = Field(physics_updated_cloud_fraction, _origin_['physics_updated_cloud_fraction'], (True, True, True))
+    physics_updated_pt = Field(physics_updated_pt, _origin_['physics_updated_pt'], (True, True, True))
+    physics_updated_ua = Field(physics_updated_ua, _origin_['physics_updated_ua'], (True, True, True))
+    physics_updated_va = Field(physics_updated_va, _origin_['physics_updated_va'], (True, True, True))
+    
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        physics_updated_specific_humidity[i:I, j:J, k:K] = (qvapor[i:I, j:J, k:K] + (qv_dt[i:I, j:J, k:K] * dt))
+        physics_updated_qliquid[i:I, j:J, k:K] = (qliquid[i:I, j:J, k:K] + (ql_dt[i:I, j:J, k:K] * dt))
+        physics_updated_qrain[i:I, j:J, k:K] = (qrain[i:I, j:J, k:K] + (qr_dt[i:I, j:J, k:K] * dt))
+        physics_updated_qice[i:I, j:J, k:K] = (qice[i:I, j:J, k:K] + (qi_dt[i:I, j:J, k:K] * dt))
+        physics_updated_qsnow[i:I, j:J, k:K] = (qsnow[i:I, j:J, k:K] + (qs_dt[i:I, j:J, k:K] * dt))
+        physics_updated_qgraupel[i:I, j:J, k:K] = (qgraupel[i:I, j:J, k:K] + (qg_dt[i:I, j:J, k:K] * dt))
+        physics_updated_cloud_fraction[i:I, j:J, k:K] = (qcld[i:I, j:J, k:K] + (qa_dt[i:I, j:J, k:K] * dt))
+        physics_updated_pt[i:I, j:J, k:K] = (pt[i:I, j:J, k:K] + (pt_dt[i:I, j:J, k:K] * dt))
+        physics_updated_ua[i:I, j:J, k:K] = (ua[i:I, j:J, k:K] + (udt[i:I, j:J, k:K] * dt))
+        physics_updated_va[i:I, j:J, k:K] = (va[i:I, j:J, k:K] + (vdt[i:I, j:J, k:K] * dt))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
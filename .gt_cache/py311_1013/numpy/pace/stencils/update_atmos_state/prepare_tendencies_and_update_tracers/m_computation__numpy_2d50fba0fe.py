@@ -0,0 +1,143 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, u_dt, v_dt, pt_dt, u_t1, v_t1, physics_updated_pt, physics_updated_specific_humidity, physics_updated_qliquid, physics_updated_qrain, physics_updated_qsnow, physics_updated_qice, physics_updated_qgraupel, u_t0, v_t0, pt_t0, qvapor_t0, qliquid_t0, qrain_t0, qsnow_t0, qice_t0, qgraupel_t0, prsi, delp, rdt, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    u_dt = Field(u_dt, _origin_['u_dt'], (True, True, True))
+    v_dt = Field(v_dt, _origin_['v_dt'], (True, True, True))
+    pt_dt = Field(pt_dt, _origin_['pt_dt'], (True, True, True))
+    u_t1 = Field(u_t1, _origin_['u_t1'], (True, True, True))
+    v_t1 = Field(v_t1, _origin_['v_t1'], (True, True, True))
+    physics_updated_pt = Field(physics_updated_pt, _origin_['physics_updated_pt'], (True, True, True))
+    physics_updated_specific_humidity = Field(physics_updated_specific_humidity, _origin_['physics_updated_specific_humidity'], (True, True, True))
+    physics_updated_qliquid = Field(physics_updated_qliquid, _origin_['physics_updated_qliquid'], (True, True, True))
+    physics_updated_qrain = Field(physics_updated_qrain, _origin_['physics_updated_qrain'], (True, True, True))
+    physics_updated_qsnow = Field(physics_updated_qsnow, _origin_['physics_updated_qsnow'], (True, True, True))
+    physics_updated_qice = Field(physics_updated_qice, _origin_['physics_updated_qice'], (True, True, True))
+    physics_updated_qgraupel = Field(physics_updated_qgraupel, _origin_['physics_updated_qgraupel'], (True, True, True))
+    u_t0 = Field(u_t0, _origin_['u_t0'], (True, True, True))
+    v_t0 = Field(v_t0, _origin_['v_t0'], (True, True, True))
+    pt_t0 = Field(pt_t0, _origin_['pt_t0'], (True, True, True))
+    qvapor_t0 = Field(qvapor_t0, _origin_['qvapor_t0'], (True, True, True))
+    qliquid_t0 = Field(qliquid_t0, _origin_['qliquid_t0'], (True, True, True))
+    qrain_t0 = Field(qrain_t0, _origin_['qrain_t0'], (True, True, True))
+    qsnow_t0 = Field(qsnow_t0, _origin_['qsnow_t0'], (True, True, True))
+    qice_t0 = Field(qice_t0, _origin_['qice_t0'], (True, True, True))
+    qgraupel_t0 = Field(qgraupel_t0, _origin_['qgraupel_t0'], (True, True, True))
+    prsi = Field(prsi, _origin_['prsi'], (True, True, True))
+    delp = Field(delp, _origin_['delp'], (True, True, True))
+    
+    qwat_qs_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dp_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qwat_qv_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qwat_qg_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qwat_qi_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qt_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_sum_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qwat_ql_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q0_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qwat_qr_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        u_dt[i:I, j:J, k:K] = (u_dt[i:I, j:J, k:K] + ((u_t1[i:I, j:J, k:K] - u_t0[i:I, j:J, k:K]) * rdt))
+        v_dt[i:I, j:J, k:K] = (v_dt[i:I, j:J, k:K] + ((v_t1[i:I, j:J, k:K] - v_t0[i:I, j:J, k:K]) * rdt))
+        pt_dt[i:I, j:J, k:K] = (pt_dt[i:I, j:J, k:K] + ((physics_updated_pt[i:I, j:J, k:K] - pt_t0[i:I, j:J, k:K]) * rdt))
+        dp_gen_0[i:I, j:J, k:K] = (prsi[i:I, j:J, k + 1:K + 1] - prsi[i:I, j:J, k:K])
+        qwat_qv_gen_0[i:I, j:J, k:K] = (dp_gen_0[i:I, j:J, k:K] * physics_updated_specific_humidity[i:I, j:J, k:K])
+        qwat_ql_gen_0[i:I, j:J, k:K] = (dp_gen_0[i:I, j:J, k:K] * physics_updated_qliquid[i:I, j:J, k:K])
+        qwat_qr_gen_0[i:I, j:J, k:K] = (dp_gen_0[i:I, j:J, k:K] * physics_updated_qrain[i:I, j:J, k:K])
+        qwat_qs_gen_0[i:I, j:J, k:K] = (dp_gen_0[i:I, j:J, k:K] * physics_updated_qsnow[i:I, j:J, k:K])
+        qwat_qi_gen_0[i:I, j:J, k:K] = (dp_gen_0[i:I, j:J, k:K] * physics_updated_qice[i:I, j:J, k:K])
+        qwat_qg_gen_0[i:I, j:J, k:K] = (dp_gen_0[i:I, j:J, k:K] * physics_updated_qgraupel[i:I, j:J, k:K])
+        qt_gen_0[i:I, j:J, k:K] = (((((qwat_qv_gen_0[i:I, j:J, k:K] + qwat_ql_gen_0[i:I, j:J, k:K]) + qwat_qr_gen_0[i:I, j:J, k:K]) + qwat_qs_gen_0[i:I, j:J, k:K]) + qwat_qi_gen_0[i:I, j:J, k:K]) + qwat_qg_gen_0[i:I, j:J, k:K])
+        q_sum_gen_0[i:I, j:J, k:K] = (((((qvapor_t0[i:I, j:J, k:K] + qliquid_t0[i:I, j:J, k:K]) + qrain_t0[i:I, j:J, k:K]) + qsnow_t0[i:I, j:J, k:K]) + qice_t0[i:I, j:J, k:K]) + qgraupel_t0[i:I, j:J, k:K])
+        q0_gen_0[i:I, j:J, k:K] = ((delp[i:I, j:J, k:K] * (np.float64(1.0) - q_sum_gen_0[i:I, j:J, k:K])) + qt_gen_0[i:I, j:J, k:K])
+        delp[i:I, j:J, k:K] = q0_gen_0[i:I, j:J, k:K]
+        qvapor_t0[i:I, j:J, k:K] = (qwat_qv_gen_0[i:I, j:J, k:K] / q0_gen_0[i:I, j:J, k:K])
+        qliquid_t0[i:I, j:J, k:K] = (qwat_ql_gen_0[i:I, j:J, k:K] / q0_gen_0[i:I, j:J, k:K])
+        qrain_t0[i:I, j:J, k:K] = (qwat_qr_gen_0[i:I, j:J, k:K] / q0_gen_0[i:I, j:J, k:K])
+        qsnow_t0[i:I, j:J, k:K] = (qwat_qs_gen_0[i:I, j:J, k:K] / q0_gen_0[i:I, j:J, k:K])
+        qice_t0[i:I, j:J, k:K] = (qwat_qi_gen_0[i:I, j:J, k:K] / q0_gen_0[i:I, j:J, k:K])
+        qgraupel_t0[i:I, j:J, k:K] = (qwat_qg_gen_0[i:I, j:J, k:K] / q0_gen_0[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
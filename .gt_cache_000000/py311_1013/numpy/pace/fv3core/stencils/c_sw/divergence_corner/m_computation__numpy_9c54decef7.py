@@ -0,0 +1,151 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, u, v, ua, va, dxc, dyc, sin_sg1, sin_sg2, sin_sg3, sin_sg4, cos_sg1, cos_sg2, cos_sg3, cos_sg4, rarea_c, divg_d, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    u = Field(u, _origin_['u'], (True, True, True))
+    v = Field(v, _origin_['v'], (True, True, True))
+    ua = Field(ua, _origin_['ua'], (True, True, True))
+    va = Field(va, _origin_['va'], (True, True, True))
+    dxc = Field(dxc, _origin_['dxc'], (True, True, False))
+    dyc = Field(dyc, _origin_['dyc'], (True, True, False))
+    sin_sg1 = Field(sin_sg1, _origin_['sin_sg1'], (True, True, False))
+    sin_sg2 = Field(sin_sg2, _origin_['sin_sg2'], (True, True, False))
+    sin_sg3 = Field(sin_sg3, _origin_['sin_sg3'], (True, True, False))
+    sin_sg4 = Field(sin_sg4, _origin_['sin_sg4'], (True, True, False))
+    cos_sg1 = Field(cos_sg1, _origin_['cos_sg1'], (True, True, False))
+    cos_sg2 = Field(cos_sg2, _origin_['cos_sg2'], (True, True, False))
+    cos_sg3 = Field(cos_sg3, _origin_['cos_sg3'], (True, True, False))
+    cos_sg4 = Field(cos_sg4, _origin_['cos_sg4'], (True, True, False))
+    rarea_c = Field(rarea_c, _origin_['rarea_c'], (True, True, False))
+    divg_d = Field(divg_d, _origin_['divg_d'], (True, True, True))
+    
+    uf_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    uf_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vf_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vf_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vf1_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    uf1_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vf0_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    uf0_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        vf_gen_1[i:I, j:J, k:K] = ((((v[i:I, j - 1:J - 1, k:K] - ((np.float64(0.25) * (ua[i - 1:I - 1, j - 1:J - 1, k:K] + ua[i:I, j - 1:J - 1, k:K])) * (cos_sg3[i - 1:I - 1, j - 1:J - 1] + cos_sg1[i:I, j - 1:J - 1]))) * dxc[i:I, j - 1:J - 1]) * np.float64(0.5)) * (sin_sg3[i - 1:I - 1, j - 1:J - 1] + sin_sg1[i:I, j - 1:J - 1]))
+        vf_gen_0[i:I, j:J, k:K] = ((((v[i:I, j:J, k:K] - ((np.float64(0.25) * (ua[i - 1:I - 1, j:J, k:K] + ua[i:I, j:J, k:K])) * (cos_sg3[i - 1:I - 1, j:J] + cos_sg1[i:I, j:J]))) * dxc[i:I, j:J]) * np.float64(0.5)) * (sin_sg3[i - 1:I - 1, j:J] + sin_sg1[i:I, j:J]))
+        uf_gen_1[i:I, j:J, k:K] = ((((u[i:I, j:J, k:K] - ((np.float64(0.25) * (va[i:I, j - 1:J - 1, k:K] + va[i:I, j:J, k:K])) * (cos_sg4[i:I, j - 1:J - 1] + cos_sg2[i:I, j:J]))) * dyc[i:I, j:J]) * np.float64(0.5)) * (sin_sg4[i:I, j - 1:J - 1] + sin_sg2[i:I, j:J]))
+        uf_gen_0[i:I, j:J, k:K] = ((((u[i - 1:I - 1, j:J, k:K] - ((np.float64(0.25) * (va[i - 1:I - 1, j - 1:J - 1, k:K] + va[i - 1:I - 1, j:J, k:K])) * (cos_sg4[i - 1:I - 1, j - 1:J - 1] + cos_sg2[i - 1:I - 1, j:J]))) * dyc[i - 1:I - 1, j:J]) * np.float64(0.5)) * (sin_sg4[i - 1:I - 1, j - 1:J - 1] + sin_sg2[i - 1:I - 1, j:J]))
+        divg_d[i:I, j:J, k:K] = ((((vf_gen_1[i:I, j:J, k:K] - vf_gen_0[i:I, j:J, k:K]) + uf_gen_0[i:I, j:J, k:K]) - uf_gen_1[i:I, j:J, k:K]) * rarea_c[i:I, j:J])
+        vf0_gen_0[i:i + 1, j:J, k:K] = (((v[i:i + 1, j:J, k:K] * dxc[i:i + 1, j:J]) * np.float64(0.5)) * (sin_sg3[i - 1:i, j:J] + sin_sg1[i:i + 1, j:J]))
+        vf1_gen_0[i:i + 1, j:J, k:K] = (((v[i:i + 1, j - 1:J - 1, k:K] * dxc[i:i + 1, j - 1:J - 1]) * np.float64(0.5)) * (sin_sg3[i - 1:i, j - 1:J - 1] + sin_sg1[i:i + 1, j - 1:J - 1]))
+        uf1_gen_0[i:i + 1, j:J, k:K] = ((((u[i - 1:i, j:J, k:K] - ((np.float64(0.25) * (va[i - 1:i, j - 1:J - 1, k:K] + va[i - 1:i, j:J, k:K])) * (cos_sg4[i - 1:i, j - 1:J - 1] + cos_sg2[i - 1:i, j:J]))) * dyc[i - 1:i, j:J]) * np.float64(0.5)) * (sin_sg4[i - 1:i, j - 1:J - 1] + sin_sg2[i - 1:i, j:J]))
+        divg_d[i:i + 1, j:J, k:K] = ((((vf1_gen_0[i:i + 1, j:J, k:K] - vf0_gen_0[i:i + 1, j:J, k:K]) + uf1_gen_0[i:i + 1, j:J, k:K]) - uf_gen_1[i:i + 1, j:J, k:K]) * rarea_c[i:i + 1, j:J])
+        vf0_gen_0[I - 1:I, j:J, k:K] = (((v[I - 1:I, j:J, k:K] * dxc[I - 1:I, j:J]) * np.float64(0.5)) * (sin_sg3[I - 2:I - 1, j:J] + sin_sg1[I - 1:I, j:J]))
+        vf1_gen_0[I - 1:I, j:J, k:K] = (((v[I - 1:I, j - 1:J - 1, k:K] * dxc[I - 1:I, j - 1:J - 1]) * np.float64(0.5)) * (sin_sg3[I - 2:I - 1, j - 1:J - 1] + sin_sg1[I - 1:I, j - 1:J - 1]))
+        uf1_gen_0[I - 1:I, j:J, k:K] = ((((u[I - 2:I - 1, j:J, k:K] - ((np.float64(0.25) * (va[I - 2:I - 1, j - 1:J - 1, k:K] + va[I - 2:I - 1, j:J, k:K])) * (cos_sg4[I - 2:I - 1, j - 1:J - 1] + cos_sg2[I - 2:I - 1, j:J]))) * dyc[I - 2:I - 1, j:J]) * np.float64(0.5)) * (sin_sg4[I - 2:I - 1, j - 1:J - 1] + sin_sg2[I - 2:I - 1, j:J]))
+        divg_d[I - 1:I, j:J, k:K] = ((((vf1_gen_0[I - 1:I, j:J, k:K] - vf0_gen_0[I - 1:I, j:J, k:K]) + uf1_gen_0[I - 1:I, j:J, k:K]) - uf_gen_1[I - 1:I, j:J, k:K]) * rarea_c[I - 1:I, j:J])
+        uf0_gen_0[i:I, j:j + 1, k:K] = (((u[i:I, j:j + 1, k:K] * dyc[i:I, j:j + 1]) * np.float64(0.5)) * (sin_sg4[i:I, j - 1:j] + sin_sg2[i:I, j:j + 1]))
+        uf1_gen_0[i:I, j:j + 1, k:K] = (((u[i - 1:I - 1, j:j + 1, k:K] * dyc[i - 1:I - 1, j:j + 1]) * np.float64(0.5)) * (sin_sg4[i - 1:I - 1, j - 1:j] + sin_sg2[i - 1:I - 1, j:j + 1]))
+        vf1_gen_0[i:I, j:j + 1, k:K] = ((((v[i:I, j - 1:j, k:K] - ((np.float64(0.25) * (ua[i - 1:I - 1, j - 1:j, k:K] + ua[i:I, j - 1:j, k:K])) * (cos_sg3[i - 1:I - 1, j - 1:j] + cos_sg1[i:I, j - 1:j]))) * dxc[i:I, j - 1:j]) * np.float64(0.5)) * (sin_sg3[i - 1:I - 1, j - 1:j] + sin_sg1[i:I, j - 1:j]))
+        divg_d[i:I, j:j + 1, k:K] = ((((vf1_gen_0[i:I, j:j + 1, k:K] - vf_gen_0[i:I, j:j + 1, k:K]) + uf1_gen_0[i:I, j:j + 1, k:K]) - uf0_gen_0[i:I, j:j + 1, k:K]) * rarea_c[i:I, j:j + 1])
+        uf0_gen_0[i:I, J - 1:J, k:K] = (((u[i:I, J - 1:J, k:K] * dyc[i:I, J - 1:J]) * np.float64(0.5)) * (sin_sg4[i:I, J - 2:J - 1] + sin_sg2[i:I, J - 1:J]))
+        uf1_gen_0[i:I, J - 1:J, k:K] = (((u[i - 1:I - 1, J - 1:J, k:K] * dyc[i - 1:I - 1, J - 1:J]) * np.float64(0.5)) * (sin_sg4[i - 1:I - 1, J - 2:J - 1] + sin_sg2[i - 1:I - 1, J - 1:J]))
+        vf1_gen_0[i:I, J - 1:J, k:K] = ((((v[i:I, J - 2:J - 1, k:K] - ((np.float64(0.25) * (ua[i - 1:I - 1, J - 2:J - 1, k:K] + ua[i:I, J - 2:J - 1, k:K])) * (cos_sg3[i - 1:I - 1, J - 2:J - 1] + cos_sg1[i:I, J - 2:J - 1]))) * dxc[i:I, J - 2:J - 1]) * np.float64(0.5)) * (sin_sg3[i - 1:I - 1, J - 2:J - 1] + sin_sg1[i:I, J - 2:J - 1]))
+        divg_d[i:I, J - 1:J, k:K] = ((((vf1_gen_0[i:I, J - 1:J, k:K] - vf_gen_0[i:I, J - 1:J, k:K]) + uf1_gen_0[i:I, J - 1:J, k:K]) - uf0_gen_0[i:I, J - 1:J, k:K]) * rarea_c[i:I, J - 1:J])
+        uf1_gen_0[i:i + 1, j:j + 1, k:K] = (((u[i - 1:i, j:j + 1, k:K] * dyc[i - 1:i, j:j + 1]) * np.float64(0.5)) * (sin_sg4[i - 1:i, j - 1:j] + sin_sg2[i - 1:i, j:j + 1]))
+        vf0_gen_0[i:i + 1, j:j + 1, k:K] = (((v[i:i + 1, j:j + 1, k:K] * dxc[i:i + 1, j:j + 1]) * np.float64(0.5)) * (sin_sg3[i - 1:i, j:j + 1] + sin_sg1[i:i + 1, j:j + 1]))
+        uf0_gen_0[i:i + 1, j:j + 1, k:K] = (((u[i:i + 1, j:j + 1, k:K] * dyc[i:i + 1, j:j + 1]) * np.float64(0.5)) * (sin_sg4[i:i + 1, j - 1:j] + sin_sg2[i:i + 1, j:j + 1]))
+        divg_d[i:i + 1, j:j + 1, k:K] = ((((-(vf0_gen_0[i:i + 1, j:j + 1, k:K])) + uf1_gen_0[i:i + 1, j:j + 1, k:K]) - uf0_gen_0[i:i + 1, j:j + 1, k:K]) * rarea_c[i:i + 1, j:j + 1])
+        uf1_gen_0[I - 1:I, j:j + 1, k:K] = (((u[I - 2:I - 1, j:j + 1, k:K] * dyc[I - 2:I - 1, j:j + 1]) * np.float64(0.5)) * (sin_sg4[I - 2:I - 1, j - 1:j] + sin_sg2[I - 2:I - 1, j:j + 1]))
+        vf0_gen_0[I - 1:I, j:j + 1, k:K] = (((v[I - 1:I, j:j + 1, k:K] * dxc[I - 1:I, j:j + 1]) * np.float64(0.5)) * (sin_sg3[I - 2:I - 1, j:j + 1] + sin_sg1[I - 1:I, j:j + 1]))
+        uf0_gen_0[I - 1:I, j:j + 1, k:K] = (((u[I - 1:I, j:j + 1, k:K] * dyc[I - 1:I, j:j + 1]) * np.float64(0.5)) * (sin_sg4[I - 1:I, j - 1:j] + sin_sg2[I - 1:I, j:j + 1]))
+        divg_d[I - 1:I, j:j + 1, k:K] = ((((-(vf0_gen_0[I - 1:I, j:j + 1, k:K])) + uf1_gen_0[I - 1:I, j:j + 1, k:K]) - uf0_gen_0[I - 1:I, j:j + 1, k:K]) * rarea_c[I - 1:I, j:j + 1])
+        vf1_gen_0[I - 1:I, J - 1:J, k:K] = (((v[I - 1:I, J - 2:J - 1, k:K] * dxc[I - 1:I, J - 2:J - 1]) * np.float64(0.5)) * (sin_sg3[I - 2:I - 1, J - 2:J - 1] + sin_sg1[I - 1:I, J - 2:J - 1]))
+        uf1_gen_0[I - 1:I, J - 1:J, k:K] = (((u[I - 2:I - 1, J - 1:J, k:K] * dyc[I - 2:I - 1, J - 1:J]) * np.float64(0.5)) * (sin_sg4[I - 2:I - 1, J - 2:J - 1] + sin_sg2[I - 2:I - 1, J - 1:J]))
+        uf0_gen_0[I - 1:I, J - 1:J, k:K] = (((u[I - 1:I, J - 1:J, k:K] * dyc[I - 1:I, J - 1:J]) * np.float64(0.5)) * (sin_sg4[I - 1:I, J - 2:J - 1] + sin_sg2[I - 1:I, J - 1:J]))
+        divg_d[I - 1:I, J - 1:J, k:K] = (((vf1_gen_0[I - 1:I, J - 1:J, k:K] + uf1_gen_0[I - 1:I, J - 1:J, k:K]) - uf0_gen_0[I - 1:I, J - 1:J, k:K]) * rarea_c[I - 1:I, J - 1:J])
+        vf1_gen_0[i:i + 1, J - 1:J, k:K] = (((v[i:i + 1, J - 2:J - 1, k:K] * dxc[i:i + 1, J - 2:J - 1]) * np.float64(0.5)) * (sin_sg3[i - 1:i, J - 2:J - 1] + sin_sg1[i:i + 1, J - 2:J - 1]))
+        uf1_gen_0[i:i + 1, J - 1:J, k:K] = (((u[i - 1:i, J - 1:J, k:K] * dyc[i - 1:i, J - 1:J]) * np.float64(0.5)) * (sin_sg4[i - 1:i, J - 2:J - 1] + sin_sg2[i - 1:i, J - 1:J]))
+        uf0_gen_0[i:i + 1, J - 1:J, k:K] = (((u[i:i + 1, J - 1:J, k:K] * dyc[i:i + 1, J - 1:J]) * np.float64(0.5)) * (sin_sg4[i:i + 1, J - 2:J - 1] + sin_sg2[i:i + 1, J - 1:J]))
+        divg_d[i:i + 1, J - 1:J, k:K] = (((vf1_gen_0[i:i + 1, J - 1:J, k:K] + uf1_gen_0[i:i + 1, J - 1:J, k:K]) - uf0_gen_0[i:i + 1, J - 1:J, k:K]) * rarea_c[i:i + 1, J - 1:J])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,159 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, delp_in, pt_in, w_in, delp_out, pt_out, w_out, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    delp_in = Field(delp_in, _origin_['delp_in'], (True, True, True))
+    pt_in = Field(pt_in, _origin_['pt_in'], (True, True, True))
+    w_in = Field(w_in, _origin_['w_in'], (True, True, True))
+    delp_out = Field(delp_out, _origin_['delp_out'], (True, True, True))
+    pt_out = Field(pt_out, _origin_['pt_out'], (True, True, True))
+    w_out = Field(w_out, _origin_['w_out'], (True, True, True))
+    
+    se_mult__49c_6_11__e1d_23_16_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sw_mult__49c_6_11__e1d_21_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sw_mult__49c_6_11__e1d_22_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    se_mult__49c_6_11__e1d_22_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q__49c_6_11__e1d_22_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__49c_6_11__e1d_23_16_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q__49c_6_11__e1d_23_16_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    nw_mult__49c_6_11__e1d_22_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    se_mult__49c_6_11__e1d_21_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q__49c_6_11__e1d_21_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__49c_6_11__e1d_21_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ne_mult__49c_6_11__e1d_22_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__49c_6_11__e1d_22_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sw_mult__49c_6_11__e1d_23_16_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ne_mult__49c_6_11__e1d_21_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    nw_mult__49c_6_11__e1d_23_16_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ne_mult__49c_6_11__e1d_23_16_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    nw_mult__49c_6_11__e1d_21_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        q__49c_6_11__e1d_21_19_gen_0[i:I, j:J, k:K] = delp_in[i:I, j:J, k:K]
+        sw_mult__49c_6_11__e1d_21_19_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        se_mult__49c_6_11__e1d_21_19_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        nw_mult__49c_6_11__e1d_21_19_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        ne_mult__49c_6_11__e1d_21_19_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        q__49c_6_11__e1d_21_19_gen_0[i + 2:i + 3, j + 2:j + 3, k:K] = (sw_mult__49c_6_11__e1d_21_19_gen_0[i + 2:i + 3, j + 2:j + 3, k:K] * delp_in[i + 2:i + 3, j + 3:j + 4, k:K])
+        q__49c_6_11__e1d_21_19_gen_0[i + 1:i + 2, j + 2:j + 3, k:K] = (sw_mult__49c_6_11__e1d_21_19_gen_0[i + 1:i + 2, j + 2:j + 3, k:K] * delp_in[i + 2:i + 3, j + 4:j + 5, k:K])
+        q__49c_6_11__e1d_21_19_gen_0[I - 3:I - 2, j + 2:j + 3, k:K] = (se_mult__49c_6_11__e1d_21_19_gen_0[I - 3:I - 2, j + 2:j + 3, k:K] * delp_in[I - 3:I - 2, j + 3:j + 4, k:K])
+        q__49c_6_11__e1d_21_19_gen_0[I - 2:I - 1, j + 2:j + 3, k:K] = (se_mult__49c_6_11__e1d_21_19_gen_0[I - 2:I - 1, j + 2:j + 3, k:K] * delp_in[I - 3:I - 2, j + 4:j + 5, k:K])
+        q__49c_6_11__e1d_21_19_gen_0[i + 2:i + 3, J - 3:J - 2, k:K] = (nw_mult__49c_6_11__e1d_21_19_gen_0[i + 2:i + 3, J - 3:J - 2, k:K] * delp_in[i + 2:i + 3, J - 4:J - 3, k:K])
+        q__49c_6_11__e1d_21_19_gen_0[i + 1:i + 2, J - 3:J - 2, k:K] = (nw_mult__49c_6_11__e1d_21_19_gen_0[i + 1:i + 2, J - 3:J - 2, k:K] * delp_in[i + 2:i + 3, J - 5:J - 4, k:K])
+        q__49c_6_11__e1d_21_19_gen_0[I - 3:I - 2, J - 3:J - 2, k:K] = (ne_mult__49c_6_11__e1d_21_19_gen_0[I - 3:I - 2, J - 3:J - 2, k:K] * delp_in[I - 3:I - 2, J - 4:J - 3, k:K])
+        q__49c_6_11__e1d_21_19_gen_0[I - 2:I - 1, J - 3:J - 2, k:K] = (ne_mult__49c_6_11__e1d_21_19_gen_0[I - 2:I - 1, J - 3:J - 2, k:K] * delp_in[I - 3:I - 2, J - 5:J - 4, k:K])
+        RETURN_VALUE__49c_6_11__e1d_21_19_gen_0[i:I, j:J, k:K] = q__49c_6_11__e1d_21_19_gen_0[i:I, j:J, k:K]
+        delp_out[i:I, j:J, k:K] = RETURN_VALUE__49c_6_11__e1d_21_19_gen_0[i:I, j:J, k:K]
+        q__49c_6_11__e1d_22_17_gen_0[i:I, j:J, k:K] = pt_in[i:I, j:J, k:K]
+        sw_mult__49c_6_11__e1d_22_17_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        se_mult__49c_6_11__e1d_22_17_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        nw_mult__49c_6_11__e1d_22_17_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        ne_mult__49c_6_11__e1d_22_17_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        q__49c_6_11__e1d_22_17_gen_0[i + 2:i + 3, j + 2:j + 3, k:K] = (sw_mult__49c_6_11__e1d_22_17_gen_0[i + 2:i + 3, j + 2:j + 3, k:K] * pt_in[i + 2:i + 3, j + 3:j + 4, k:K])
+        q__49c_6_11__e1d_22_17_gen_0[i + 1:i + 2, j + 2:j + 3, k:K] = (sw_mult__49c_6_11__e1d_22_17_gen_0[i + 1:i + 2, j + 2:j + 3, k:K] * pt_in[i + 2:i + 3, j + 4:j + 5, k:K])
+        q__49c_6_11__e1d_22_17_gen_0[I - 3:I - 2, j + 2:j + 3, k:K] = (se_mult__49c_6_11__e1d_22_17_gen_0[I - 3:I - 2, j + 2:j + 3, k:K] * pt_in[I - 3:I - 2, j + 3:j + 4, k:K])
+        q__49c_6_11__e1d_22_17_gen_0[I - 2:I - 1, j + 2:j + 3, k:K] = (se_mult__49c_6_11__e1d_22_17_gen_0[I - 2:I - 1, j + 2:j + 3, k:K] * pt_in[I - 3:I - 2, j + 4:j + 5, k:K])
+        q__49c_6_11__e1d_22_17_gen_0[i + 2:i + 3, J - 3:J - 2, k:K] = (nw_mult__49c_6_11__e1d_22_17_gen_0[i + 2:i + 3, J - 3:J - 2, k:K] * pt_in[i + 2:i + 3, J - 4:J - 3, k:K])
+        q__49c_6_11__e1d_22_17_gen_0[i + 1:i + 2, J - 3:J - 2, k:K] = (nw_mult__49c_6_11__e1d_22_17_gen_0[i + 1:i + 2, J - 3:J - 2, k:K] * pt_in[i + 2:i + 3, J - 5:J - 4, k:K])
+        q__49c_6_11__e1d_22_17_gen_0[I - 3:I - 2, J - 3:J - 2, k:K] = (ne_mult__49c_6_11__e1d_22_17_gen_0[I - 3:I - 2, J - 3:J - 2, k:K] * pt_in[I - 3:I - 2, J - 4:J - 3, k:K])
+        q__49c_6_11__e1d_22_17_gen_0[I - 2:I - 1, J - 3:J - 2, k:K] = (ne_mult__49c_6_11__e1d_22_17_gen_0[I - 2:I - 1, J - 3:J - 2, k:K] * pt_in[I - 3:I - 2, J - 5:J - 4, k:K])
+        RETURN_VALUE__49c_6_11__e1d_22_17_gen_0[i:I, j:J, k:K] = q__49c_6_11__e1d_22_17_gen_0[i:I, j:J, k:K]
+        pt_out[i:I, j:J, k:K] = RETURN_VALUE__49c_6_11__e1d_22_17_gen_0[i:I, j:J, k:K]
+        q__49c_6_11__e1d_23_16_gen_0[i:I, j:J, k:K] = w_in[i:I, j:J, k:K]
+        sw_mult__49c_6_11__e1d_23_16_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        se_mult__49c_6_11__e1d_23_16_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        nw_mult__49c_6_11__e1d_23_16_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        ne_mult__49c_6_11__e1d_23_16_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        q__49c_6_11__e1d_23_16_gen_0[i + 2:i + 3, j + 2:j + 3, k:K] = (sw_mult__49c_6_11__e1d_23_16_gen_0[i + 2:i + 3, j + 2:j + 3, k:K] * w_in[i + 2:i + 3, j + 3:j + 4, k:K])
+        q__49c_6_11__e1d_23_16_gen_0[i + 1:i + 2, j + 2:j + 3, k:K] = (sw_mult__49c_6_11__e1d_23_16_gen_0[i + 1:i + 2, j + 2:j + 3, k:K] * w_in[i + 2:i + 3, j + 4:j + 5, k:K])
+        q__49c_6_11__e1d_23_16_gen_0[I - 3:I - 2, j + 2:j + 3, k:K] = (se_mult__49c_6_11__e1d_23_16_gen_0[I - 3:I - 2, j + 2:j + 3, k:K] * w_in[I - 3:I - 2, j + 3:j + 4, k:K])
+        q__49c_6_11__e1d_23_16_gen_0[I - 2:I - 1, j + 2:j + 3, k:K] = (se_mult__49c_6_11__e1d_23_16_gen_0[I - 2:I - 1, j + 2:j + 3, k:K] * w_in[I - 3:I - 2, j + 4:j + 5, k:K])
+        q__49c_6_11__e1d_23_16_gen_0[i + 2:i + 3, J - 3:J - 2, k:K] = (nw_mult__49c_6_11__e1d_23_16_gen_0[i + 2:i + 3, J - 3:J - 2, k:K] * w_in[i + 2:i + 3, J - 4:J - 3, k:K])
+        q__49c_6_11__e1d_23_16_gen_0[i + 1:i + 2, J - 3:J - 2, k:K] = (nw_mult__49c_6_11__e1d_23_16_gen_0[i + 1:i + 2, J - 3:J - 2, k:K] * w_in[i + 2:i + 3, J - 5:J - 4, k:K])
+        q__49c_6_11__e1d_23_16_gen_0[I - 3:I - 2, J - 3:J - 2, k:K] = (ne_mult__49c_6_11__e1d_23_16_gen_0[I - 3:I - 2, J - 3:J - 2, k:K] * w_in[I - 3:I - 2, J - 4:J - 3, k:K])
+        q__49c_6_11__e1d_23_16_gen_0[I - 2:I - 1, J - 3:J - 2, k:K] = (ne_mult__49c_6_11__e1d_23_16_gen_0[I - 2:I - 1, J - 3:J - 2, k:K] * w_in[I - 3:I - 2, J - 5:J - 4, k:K])
+        RETURN_VALUE__49c_6_11__e1d_23_16_gen_0[i:I, j:J, k:K] = q__49c_6_11__e1d_23_16_gen_0[i:I, j:J, k:K]
+        w_out[i:I, j:J, k:K] = RETURN_VALUE__49c_6_11__e1d_23_16_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,130 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, va, vc, vtc, vtmp, u, sin_sg2, sin_sg4, cosa_v, rsin_v, dya, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    va = Field(va, _origin_['va'], (True, True, True))
+    vc = Field(vc, _origin_['vc'], (True, True, True))
+    vtc = Field(vtc, _origin_['vtc'], (True, True, True))
+    vtmp = Field(vtmp, _origin_['vtmp'], (True, True, True))
+    u = Field(u, _origin_['u'], (True, True, True))
+    sin_sg2 = Field(sin_sg2, _origin_['sin_sg2'], (True, True, False))
+    sin_sg4 = Field(sin_sg4, _origin_['sin_sg4'], (True, True, False))
+    cosa_v = Field(cosa_v, _origin_['cosa_v'], (True, True, False))
+    rsin_v = Field(rsin_v, _origin_['rsin_v'], (True, True, False))
+    dya = Field(dya, _origin_['dya'], (True, True, False))
+    
+    n1__d06_28_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    n1__d06_40_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t2__d06_28_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t1__d06_40_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    n2__d06_28_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    n2__d06_40_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t1__d06_28_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t2__d06_40_18_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        vc[i + 2:I - 2, j + 2:J - 1, k:K] = ((np.float64(-0.0625) * (vtmp[i + 2:I - 2, j:J - 3, k:K] + vtmp[i + 2:I - 2, j + 3:J, k:K])) + (np.float64(0.5625) * (vtmp[i + 2:I - 2, j + 1:J - 2, k:K] + vtmp[i + 2:I - 2, j + 2:J - 1, k:K])))
+        vtc[i + 2:I - 2, j + 2:J - 1, k:K] = ((vc[i + 2:I - 2, j + 2:J - 1, k:K] - (u[i + 2:I - 2, j + 2:J - 1, k:K] * cosa_v[i + 2:I - 2, j + 2:J - 1])) * rsin_v[i + 2:I - 2, j + 2:J - 1])
+        vc[i + 2:I - 2, j + 2:j + 3, k:K] = (((np.float64(-0.14285714285714285) * vtmp[i + 2:I - 2, j:j + 1, k:K]) + (np.float64(0.7857142857142857) * vtmp[i + 2:I - 2, j + 1:j + 2, k:K])) + (np.float64(0.35714285714285715) * vtmp[i + 2:I - 2, j + 2:j + 3, k:K]))
+        vtc[i + 2:I - 2, j + 2:j + 3, k:K] = ((vc[i + 2:I - 2, j + 2:j + 3, k:K] - (u[i + 2:I - 2, j + 2:j + 3, k:K] * cosa_v[i + 2:I - 2, j + 2:j + 3])) * rsin_v[i + 2:I - 2, j + 2:j + 3])
+        t1__d06_28_18_gen_0[i + 2:I - 2, j + 3:j + 4, k:K] = (dya[i + 2:I - 2, j + 1:j + 2] + dya[i + 2:I - 2, j + 2:j + 3])
+        t2__d06_28_18_gen_0[i + 2:I - 2, j + 3:j + 4, k:K] = (dya[i + 2:I - 2, j + 3:j + 4] + dya[i + 2:I - 2, j + 4:j + 5])
+        n1__d06_28_18_gen_0[i + 2:I - 2, j + 3:j + 4, k:K] = (((t1__d06_28_18_gen_0[i + 2:I - 2, j + 3:j + 4, k:K] + dya[i + 2:I - 2, j + 2:j + 3]) * va[i + 2:I - 2, j + 2:j + 3, k:K]) - (dya[i + 2:I - 2, j + 2:j + 3] * va[i + 2:I - 2, j + 1:j + 2, k:K]))
+        n2__d06_28_18_gen_0[i + 2:I - 2, j + 3:j + 4, k:K] = (((t1__d06_28_18_gen_0[i + 2:I - 2, j + 3:j + 4, k:K] + dya[i + 2:I - 2, j + 3:j + 4]) * va[i + 2:I - 2, j + 3:j + 4, k:K]) - (dya[i + 2:I - 2, j + 3:j + 4] * va[i + 2:I - 2, j + 4:j + 5, k:K]))
+        vtc[i + 2:I - 2, j + 3:j + 4, k:K] = (np.float64(0.5) * ((n1__d06_28_18_gen_0[i + 2:I - 2, j + 3:j + 4, k:K] / t1__d06_28_18_gen_0[i + 2:I - 2, j + 3:j + 4, k:K]) + (n2__d06_28_18_gen_0[i + 2:I - 2, j + 3:j + 4, k:K] / t2__d06_28_18_gen_0[i + 2:I - 2, j + 3:j + 4, k:K])))
+        vc[i + 2:I - 2, j + 3:j + 4, k:K] = np.where((vtc[i + 2:I - 2, j + 3:j + 4, k:K] > np.float64(np.int64(0))), (vtc[i + 2:I - 2, j + 3:j + 4, k:K] * sin_sg4[i + 2:I - 2, j + 2:j + 3]), (vtc[i + 2:I - 2, j + 3:j + 4, k:K] * sin_sg2[i + 2:I - 2, j + 3:j + 4]))
+        vc[i + 2:I - 2, j + 4:j + 5, k:K] = (((np.float64(-0.14285714285714285) * vtmp[i + 2:I - 2, j + 5:j + 6, k:K]) + (np.float64(0.7857142857142857) * vtmp[i + 2:I - 2, j + 4:j + 5, k:K])) + (np.float64(0.35714285714285715) * vtmp[i + 2:I - 2, j + 3:j + 4, k:K]))
+        vtc[i + 2:I - 2, j + 4:j + 5, k:K] = ((vc[i + 2:I - 2, j + 4:j + 5, k:K] - (u[i + 2:I - 2, j + 4:j + 5, k:K] * cosa_v[i + 2:I - 2, j + 4:j + 5])) * rsin_v[i + 2:I - 2, j + 4:j + 5])
+        vc[i + 2:I - 2, J - 4:J - 3, k:K] = (((np.float64(-0.14285714285714285) * vtmp[i + 2:I - 2, J - 6:J - 5, k:K]) + (np.float64(0.7857142857142857) * vtmp[i + 2:I - 2, J - 5:J - 4, k:K])) + (np.float64(0.35714285714285715) * vtmp[i + 2:I - 2, J - 4:J - 3, k:K]))
+        vtc[i + 2:I - 2, J - 4:J - 3, k:K] = ((vc[i + 2:I - 2, J - 4:J - 3, k:K] - (u[i + 2:I - 2, J - 4:J - 3, k:K] * cosa_v[i + 2:I - 2, J - 4:J - 3])) * rsin_v[i + 2:I - 2, J - 4:J - 3])
+        t1__d06_40_18_gen_0[i + 2:I - 2, J - 3:J - 2, k:K] = (dya[i + 2:I - 2, J - 5:J - 4] + dya[i + 2:I - 2, J - 4:J - 3])
+        t2__d06_40_18_gen_0[i + 2:I - 2, J - 3:J - 2, k:K] = (dya[i + 2:I - 2, J - 3:J - 2] + dya[i + 2:I - 2, J - 2:J - 1])
+        n1__d06_40_18_gen_0[i + 2:I - 2, J - 3:J - 2, k:K] = (((t1__d06_40_18_gen_0[i + 2:I - 2, J - 3:J - 2, k:K] + dya[i + 2:I - 2, J - 4:J - 3]) * va[i + 2:I - 2, J - 4:J - 3, k:K]) - (dya[i + 2:I - 2, J - 4:J - 3] * va[i + 2:I - 2, J - 5:J - 4, k:K]))
+        n2__d06_40_18_gen_0[i + 2:I - 2, J - 3:J - 2, k:K] = (((t1__d06_40_18_gen_0[i + 2:I - 2, J - 3:J - 2, k:K] + dya[i + 2:I - 2, J - 3:J - 2]) * va[i + 2:I - 2, J - 3:J - 2, k:K]) - (dya[i + 2:I - 2, J - 3:J - 2] * va[i + 2:I - 2, J - 2:J - 1, k:K]))
+        vtc[i + 2:I - 2, J - 3:J - 2, k:K] = (np.float64(0.5) * ((n1__d06_40_18_gen_0[i + 2:I - 2, J - 3:J - 2, k:K] / t1__d06_40_18_gen_0[i + 2:I - 2, J - 3:J - 2, k:K]) + (n2__d06_40_18_gen_0[i + 2:I - 2, J - 3:J - 2, k:K] / t2__d06_40_18_gen_0[i + 2:I - 2, J - 3:J - 2, k:K])))
+        vc[i + 2:I - 2, J - 3:J - 2, k:K] = np.where((vtc[i + 2:I - 2, J - 3:J - 2, k:K] > np.float64(np.int64(0))), (vtc[i + 2:I - 2, J - 3:J - 2, k:K] * sin_sg4[i + 2:I - 2, J - 4:J - 3]), (vtc[i + 2:I - 2, J - 3:J - 2, k:K] * sin_sg2[i + 2:I - 2, J - 3:J - 2]))
+        vc[i + 2:I - 2, J - 2:J - 1, k:K] = (((np.float64(-0.14285714285714285) * vtmp[i + 2:I - 2, J - 1:J, k:K]) + (np.float64(0.7857142857142857) * vtmp[i + 2:I - 2, J - 2:J - 1, k:K])) + (np.float64(0.35714285714285715) * vtmp[i + 2:I - 2, J - 3:J - 2, k:K]))
+        vtc[i + 2:I - 2, J - 2:J - 1, k:K] = ((vc[i + 2:I - 2, J - 2:J - 1, k:K] - (u[i + 2:I - 2, J - 2:J - 1, k:K] * cosa_v[i + 2:I - 2, J - 2:J - 1])) * rsin_v[i + 2:I - 2, J - 2:J - 1])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
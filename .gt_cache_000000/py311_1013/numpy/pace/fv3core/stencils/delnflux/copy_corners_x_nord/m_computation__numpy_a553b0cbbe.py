@@ -0,0 +1,175 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, q_in, q_out, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    q_in = Field(q_in, _origin_['q_in'], (True, True, True))
+    q_out = Field(q_out, _origin_['q_out'], (True, True, True))
+    
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 2, _dk_ + 3
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        q_out[i:i + 1, j:j + 1, k:K] = q_in[i:i + 1, j + 5:j + 6, k:K]
+        q_out[I - 1:I, j:j + 1, k:K] = q_in[I - 1:I, j + 5:j + 6, k:K]
+        q_out[i + 1:i + 2, j:j + 1, k:K] = q_in[i:i + 1, j + 4:j + 5, k:K]
+        q_out[I - 1:I, j + 1:j + 2, k:K] = q_in[I - 2:I - 1, j + 5:j + 6, k:K]
+        q_out[i + 2:i + 3, j:j + 1, k:K] = q_in[i:i + 1, j + 3:j + 4, k:K]
+        q_out[I - 1:I, j + 2:j + 3, k:K] = q_in[I - 3:I - 2, j + 5:j + 6, k:K]
+        q_out[i:i + 1, j + 1:j + 2, k:K] = q_in[i + 1:i + 2, j + 5:j + 6, k:K]
+        q_out[I - 2:I - 1, j:j + 1, k:K] = q_in[I - 1:I, j + 4:j + 5, k:K]
+        q_out[i + 1:i + 2, j + 1:j + 2, k:K] = q_in[i + 1:i + 2, j + 4:j + 5, k:K]
+        q_out[I - 2:I - 1, j + 1:j + 2, k:K] = q_in[I - 2:I - 1, j + 4:j + 5, k:K]
+        q_out[i + 2:i + 3, j + 1:j + 2, k:K] = q_in[i + 1:i + 2, j + 3:j + 4, k:K]
+        q_out[I - 2:I - 1, j + 2:j + 3, k:K] = q_in[I - 3:I - 2, j + 4:j + 5, k:K]
+        q_out[i:i + 1, j + 2:j + 3, k:K] = q_in[i + 2:i + 3, j + 5:j + 6, k:K]
+        q_out[I - 3:I - 2, j:j + 1, k:K] = q_in[I - 1:I, j + 3:j + 4, k:K]
+        q_out[i + 1:i + 2, j + 2:j + 3, k:K] = q_in[i + 2:i + 3, j + 4:j + 5, k:K]
+        q_out[I - 3:I - 2, j + 1:j + 2, k:K] = q_in[I - 2:I - 1, j + 3:j + 4, k:K]
+        q_out[i + 2:i + 3, j + 2:j + 3, k:K] = q_in[i + 2:i + 3, j + 3:j + 4, k:K]
+        q_out[I - 3:I - 2, j + 2:j + 3, k:K] = q_in[I - 3:I - 2, j + 3:j + 4, k:K]
+        q_out[i:i + 1, J - 3:J - 2, k:K] = q_in[i + 2:i + 3, J - 6:J - 5, k:K]
+        q_out[I - 3:I - 2, J - 1:J, k:K] = q_in[I - 1:I, J - 4:J - 3, k:K]
+        q_out[i + 1:i + 2, J - 3:J - 2, k:K] = q_in[i + 2:i + 3, J - 5:J - 4, k:K]
+        q_out[I - 3:I - 2, J - 2:J - 1, k:K] = q_in[I - 2:I - 1, J - 4:J - 3, k:K]
+        q_out[i + 2:i + 3, J - 3:J - 2, k:K] = q_in[i + 2:i + 3, J - 4:J - 3, k:K]
+        q_out[I - 3:I - 2, J - 3:J - 2, k:K] = q_in[I - 3:I - 2, J - 4:J - 3, k:K]
+        q_out[i:i + 1, J - 2:J - 1, k:K] = q_in[i + 1:i + 2, J - 6:J - 5, k:K]
+        q_out[I - 2:I - 1, J - 1:J, k:K] = q_in[I - 1:I, J - 5:J - 4, k:K]
+        q_out[i + 1:i + 2, J - 2:J - 1, k:K] = q_in[i + 1:i + 2, J - 5:J - 4, k:K]
+        q_out[I - 2:I - 1, J - 2:J - 1, k:K] = q_in[I - 2:I - 1, J - 5:J - 4, k:K]
+        q_out[i + 2:i + 3, J - 2:J - 1, k:K] = q_in[i + 1:i + 2, J - 4:J - 3, k:K]
+        q_out[I - 2:I - 1, J - 3:J - 2, k:K] = q_in[I - 3:I - 2, J - 5:J - 4, k:K]
+        q_out[i:i + 1, J - 1:J, k:K] = q_in[i:i + 1, J - 6:J - 5, k:K]
+        q_out[I - 1:I, J - 1:J, k:K] = q_in[I - 1:I, J - 6:J - 5, k:K]
+        q_out[i + 1:i + 2, J - 1:J, k:K] = q_in[i:i + 1, J - 5:J - 4, k:K]
+        q_out[I - 1:I, J - 2:J - 1, k:K] = q_in[I - 2:I - 1, J - 6:J - 5, k:K]
+        q_out[i + 2:i + 3, J - 1:J, k:K] = q_in[i:i + 1, J - 4:J - 3, k:K]
+        q_out[I - 1:I, J - 3:J - 2, k:K] = q_in[I - 3:I - 2, J - 6:J - 5, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 3, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        q_out[i:i + 1, j:j + 1, k:K] = q_in[i:i + 1, j + 5:j + 6, k:K]
+        q_out[I - 1:I, j:j + 1, k:K] = q_in[I - 1:I, j + 5:j + 6, k:K]
+        q_out[i + 1:i + 2, j:j + 1, k:K] = q_in[i:i + 1, j + 4:j + 5, k:K]
+        q_out[I - 1:I, j + 1:j + 2, k:K] = q_in[I - 2:I - 1, j + 5:j + 6, k:K]
+        q_out[i + 2:i + 3, j:j + 1, k:K] = q_in[i:i + 1, j + 3:j + 4, k:K]
+        q_out[I - 1:I, j + 2:j + 3, k:K] = q_in[I - 3:I - 2, j + 5:j + 6, k:K]
+        q_out[i:i + 1, j + 1:j + 2, k:K] = q_in[i + 1:i + 2, j + 5:j + 6, k:K]
+        q_out[I - 2:I - 1, j:j + 1, k:K] = q_in[I - 1:I, j + 4:j + 5, k:K]
+        q_out[i + 1:i + 2, j + 1:j + 2, k:K] = q_in[i + 1:i + 2, j + 4:j + 5, k:K]
+        q_out[I - 2:I - 1, j + 1:j + 2, k:K] = q_in[I - 2:I - 1, j + 4:j + 5, k:K]
+        q_out[i + 2:i + 3, j + 1:j + 2, k:K] = q_in[i + 1:i + 2, j + 3:j + 4, k:K]
+        q_out[I - 2:I - 1, j + 2:j + 3, k:K] = q_in[I - 3:I - 2, j + 4:j + 5, k:K]
+        q_out[i:i + 1, j + 2:j + 3, k:K] = q_in[i + 2:i + 3, j + 5:j + 6, k:K]
+        q_out[I - 3:I - 2, j:j + 1, k:K] = q_in[I - 1:I, j + 3:j + 4, k:K]
+        q_out[i + 1:i + 2, j + 2:j + 3, k:K] = q_in[i + 2:i + 3, j + 4:j + 5, k:K]
+        q_out[I - 3:I - 2, j + 1:j + 2, k:K] = q_in[I - 2:I - 1, j + 3:j + 4, k:K]
+        q_out[i + 2:i + 3, j + 2:j + 3, k:K] = q_in[i + 2:i + 3, j + 3:j + 4, k:K]
+        q_out[I - 3:I - 2, j + 2:j + 3, k:K] = q_in[I - 3:I - 2, j + 3:j + 4, k:K]
+        q_out[i:i + 1, J - 3:J - 2, k:K] = q_in[i + 2:i + 3, J - 6:J - 5, k:K]
+        q_out[I - 3:I - 2, J - 1:J, k:K] = q_in[I - 1:I, J - 4:J - 3, k:K]
+        q_out[i + 1:i + 2, J - 3:J - 2, k:K] = q_in[i + 2:i + 3, J - 5:J - 4, k:K]
+        q_out[I - 3:I - 2, J - 2:J - 1, k:K] = q_in[I - 2:I - 1, J - 4:J - 3, k:K]
+        q_out[i + 2:i + 3, J - 3:J - 2, k:K] = q_in[i + 2:i + 3, J - 4:J - 3, k:K]
+        q_out[I - 3:I - 2, J - 3:J - 2, k:K] = q_in[I - 3:I - 2, J - 4:J - 3, k:K]
+        q_out[i:i + 1, J - 2:J - 1, k:K] = q_in[i + 1:i + 2, J - 6:J - 5, k:K]
+        q_out[I - 2:I - 1, J - 1:J, k:K] = q_in[I - 1:I, J - 5:J - 4, k:K]
+        q_out[i + 1:i + 2, J - 2:J - 1, k:K] = q_in[i + 1:i + 2, J - 5:J - 4, k:K]
+        q_out[I - 2:I - 1, J - 2:J - 1, k:K] = q_in[I - 2:I - 1, J - 5:J - 4, k:K]
+        q_out[i + 2:i + 3, J - 2:J - 1, k:K] = q_in[i + 1:i + 2, J - 4:J - 3, k:K]
+        q_out[I - 2:I - 1, J - 3:J - 2, k:K] = q_in[I - 3:I - 2, J - 5:J - 4, k:K]
+        q_out[i:i + 1, J - 1:J, k:K] = q_in[i:i + 1, J - 6:J - 5, k:K]
+        q_out[I - 1:I, J - 1:J, k:K] = q_in[I - 1:I, J - 6:J - 5, k:K]
+        q_out[i + 1:i + 2, J - 1:J, k:K] = q_in[i:i + 1, J - 5:J - 4, k:K]
+        q_out[I - 1:I, J - 2:J - 1, k:K] = q_in[I - 2:I - 1, J - 6:J - 5, k:K]
+        q_out[i + 2:i + 3, J - 1:J, k:K] = q_in[i:i + 1, J - 4:J - 3, k:K]
+        q_out[I - 1:I, J - 3:J - 2, k:K] = q_in[I - 3:I - 2, J - 6:J - 5, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,266 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, q, dp, zfix, sum0, sum1, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    q = Field(q, _origin_['q'], (True, True, True))
+    dp = Field(dp, _origin_['dp'], (True, True, True))
+    zfix = Field(zfix, _origin_['zfix'], (True, True, False))
+    sum0 = Field(sum0, _origin_['sum0'], (True, True, False))
+    sum1 = Field(sum1, _origin_['sum1'], (True, True, False))
+    
+    lower_fix = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    upper_fix = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dm = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dm_pos = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629027495824_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629032885392_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dq_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629032351312_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629030914128_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629030438992_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629032109648_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629027616400_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629035150288_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629020091984_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qup_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qly_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dup_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629021723600_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    fac_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629027280656_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            zfix[i:I, j:J] = np.int64(0)
+            sum0[i:I, j:J] = np.float64(0.0)
+            sum1[i:I, j:J] = np.float64(0.0)
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        lower_fix[i:I, j:J, k:K] = np.float64(0.0)
+        upper_fix[i:I, j:J, k:K] = np.float64(0.0)
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dk_ + 2
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629027495824_gen_0[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_ - 1:k_] < np.float64(0.0))
+            q[i:I, j:J, k_:k_ + 1] = np.where(mask_139629027495824_gen_0[i:I, j:J, k_:k_ + 1], (q[i:I, j:J, k_:k_ + 1] + ((q[i:I, j:J, k_ - 1:k_] * dp[i:I, j:J, k_ - 1:k_]) / dp[i:I, j:J, k_:k_ + 1])), q[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629032885392_gen_0[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_:k_ + 1] < np.float64(np.int64(0)))
+            q[i:I, j:J, k_:k_ + 1] = np.where(mask_139629032885392_gen_0[i:I, j:J, k_:k_ + 1], np.float64(np.int64(0)), q[i:I, j:J, k_:k_ + 1])
+            dm[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_:k_ + 1] * dp[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629030914128_gen_0[i:I, j:J, k_:k_ + 1] = (lower_fix[i:I, j:J, k_ - 1:k_] != np.float64(0.0))
+            q[i:I, j:J, k_:k_ + 1] = np.where(mask_139629030914128_gen_0[i:I, j:J, k_:k_ + 1], (q[i:I, j:J, k_:k_ + 1] - (lower_fix[i:I, j:J, k_ - 1:k_] / dp[i:I, j:J, k_:k_ + 1])), q[i:I, j:J, k_:k_ + 1])
+            mask_139629030438992_gen_0[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_:k_ + 1] < np.float64(0.0))
+            zfix[i:I, j:J] = np.where(mask_139629030438992_gen_0[i:I, j:J, k_:k_ + 1], (zfix[i:I, j:J] + np.int64(1)), zfix[i:I, j:J])
+            mask_139629032351312_gen_0[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_ - 1:k_] > np.float64(0.0))
+            dq_gen_0[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629030438992_gen_0[i:I, j:J, k_:k_ + 1], mask_139629032351312_gen_0[i:I, j:J, k_:k_ + 1]), np.where(((q[i:I, j:J, k_ - 1:k_] * dp[i:I, j:J, k_ - 1:k_]) < (-((q[i:I, j:J, k_:k_ + 1] * dp[i:I, j:J, k_:k_ + 1])))), (q[i:I, j:J, k_ - 1:k_] * dp[i:I, j:J, k_ - 1:k_]), (-((q[i:I, j:J, k_:k_ + 1] * dp[i:I, j:J, k_:k_ + 1])))), dq_gen_0[i:I, j:J, k_:k_ + 1])
+            q[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629030438992_gen_0[i:I, j:J, k_:k_ + 1], mask_139629032351312_gen_0[i:I, j:J, k_:k_ + 1]), (q[i:I, j:J, k_:k_ + 1] + (dq_gen_0[i:I, j:J, k_:k_ + 1] / dp[i:I, j:J, k_:k_ + 1])), q[i:I, j:J, k_:k_ + 1])
+            upper_fix[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629030438992_gen_0[i:I, j:J, k_:k_ + 1], mask_139629032351312_gen_0[i:I, j:J, k_:k_ + 1]), dq_gen_0[i:I, j:J, k_:k_ + 1], upper_fix[i:I, j:J, k_:k_ + 1])
+            mask_139629032109648_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((q[i:I, j:J, k_:k_ + 1] < np.float64(0.0)), (q[i:I, j:J, k_ + 1:k_ + 2] > np.float64(0.0)))
+            dq_gen_0[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629030438992_gen_0[i:I, j:J, k_:k_ + 1], mask_139629032109648_gen_0[i:I, j:J, k_:k_ + 1]), np.where(((q[i:I, j:J, k_ + 1:k_ + 2] * dp[i:I, j:J, k_ + 1:k_ + 2]) < (-((q[i:I, j:J, k_:k_ + 1] * dp[i:I, j:J, k_:k_ + 1])))), (q[i:I, j:J, k_ + 1:k_ + 2] * dp[i:I, j:J, k_ + 1:k_ + 2]), (-((q[i:I, j:J, k_:k_ + 1] * dp[i:I, j:J, k_:k_ + 1])))), dq_gen_0[i:I, j:J, k_:k_ + 1])
+            q[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629030438992_gen_0[i:I, j:J, k_:k_ + 1], mask_139629032109648_gen_0[i:I, j:J, k_:k_ + 1]), (q[i:I, j:J, k_:k_ + 1] + (dq_gen_0[i:I, j:J, k_:k_ + 1] / dp[i:I, j:J, k_:k_ + 1])), q[i:I, j:J, k_:k_ + 1])
+            lower_fix[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629030438992_gen_0[i:I, j:J, k_:k_ + 1], mask_139629032109648_gen_0[i:I, j:J, k_:k_ + 1]), dq_gen_0[i:I, j:J, k_:k_ + 1], lower_fix[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629027616400_gen_0[i:I, j:J, k:K] = (upper_fix[i:I, j:J, k + 1:K + 1] != np.float64(0.0))
+        q[i:I, j:J, k:K] = np.where(mask_139629027616400_gen_0[i:I, j:J, k:K], (q[i:I, j:J, k:K] - (upper_fix[i:I, j:J, k + 1:K + 1] / dp[i:I, j:J, k:K])), q[i:I, j:J, k:K])
+        dm[i:I, j:J, k:K] = (q[i:I, j:J, k:K] * dp[i:I, j:J, k:K])
+        dm_pos[i:I, j:J, k:K] = np.where((dm[i:I, j:J, k:K] > np.float64(0.0)), dm[i:I, j:J, k:K], np.float64(0.0))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629020091984_gen_0[i:I, j:J, k_:k_ + 1] = (lower_fix[i:I, j:J, k_ - 1:k_] != np.float64(0.0))
+            q[i:I, j:J, k_:k_ + 1] = np.where(mask_139629020091984_gen_0[i:I, j:J, k_:k_ + 1], (q[i:I, j:J, k_:k_ + 1] - (lower_fix[i:I, j:J, k_ - 1:k_] / dp[i:I, j:J, k_:k_ + 1])), q[i:I, j:J, k_:k_ + 1])
+            qup_gen_0[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_ - 1:k_] * dp[i:I, j:J, k_ - 1:k_])
+            qly_gen_0[i:I, j:J, k_:k_ + 1] = ((-(q[i:I, j:J, k_:k_ + 1])) * dp[i:I, j:J, k_:k_ + 1])
+            dup_gen_0[i:I, j:J, k_:k_ + 1] = np.where((qup_gen_0[i:I, j:J, k_:k_ + 1] < qly_gen_0[i:I, j:J, k_:k_ + 1]), qup_gen_0[i:I, j:J, k_:k_ + 1], qly_gen_0[i:I, j:J, k_:k_ + 1])
+            mask_139629035150288_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((q[i:I, j:J, k_:k_ + 1] < np.float64(0.0)), (q[i:I, j:J, k_ - 1:k_] > np.float64(0.0)))
+            zfix[i:I, j:J] = np.where(mask_139629035150288_gen_0[i:I, j:J, k_:k_ + 1], (zfix[i:I, j:J] + np.int64(1)), zfix[i:I, j:J])
+            q[i:I, j:J, k_:k_ + 1] = np.where(mask_139629035150288_gen_0[i:I, j:J, k_:k_ + 1], (q[i:I, j:J, k_:k_ + 1] + (dup_gen_0[i:I, j:J, k_:k_ + 1] / dp[i:I, j:J, k_:k_ + 1])), q[i:I, j:J, k_:k_ + 1])
+            upper_fix[i:I, j:J, k_:k_ + 1] = np.where(mask_139629035150288_gen_0[i:I, j:J, k_:k_ + 1], dup_gen_0[i:I, j:J, k_:k_ + 1], upper_fix[i:I, j:J, k_:k_ + 1])
+            dm[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_:k_ + 1] * dp[i:I, j:J, k_:k_ + 1])
+            dm_pos[i:I, j:J, k_:k_ + 1] = np.where((dm[i:I, j:J, k_:k_ + 1] > np.float64(0.0)), dm[i:I, j:J, k_:k_ + 1], np.float64(0.0))
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 2, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629021723600_gen_0[i:I, j:J, k:K] = (upper_fix[i:I, j:J, k + 1:K + 1] != np.float64(0.0))
+        q[i:I, j:J, k:K] = np.where(mask_139629021723600_gen_0[i:I, j:J, k:K], (q[i:I, j:J, k:K] - (upper_fix[i:I, j:J, k + 1:K + 1] / dp[i:I, j:J, k:K])), q[i:I, j:J, k:K])
+        dm[i:I, j:J, k:K] = np.where(mask_139629021723600_gen_0[i:I, j:J, k:K], (q[i:I, j:J, k:K] * dp[i:I, j:J, k:K]), dm[i:I, j:J, k:K])
+        dm_pos[i:I, j:J, k:K] = np.where(mask_139629021723600_gen_0[i:I, j:J, k:K], np.where((dm[i:I, j:J, k:K] > np.float64(0.0)), dm[i:I, j:J, k:K], np.float64(0.0)), dm_pos[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            sum0[i:I, j:J] = (sum0[i:I, j:J] + dm[i:I, j:J, k_:k_ + 1])
+            sum1[i:I, j:J] = (sum1[i:I, j:J] + dm_pos[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        fac_gen_0[i:I, j:J, k:K] = np.where((sum0[i:I, j:J] > np.float64(0.0)), (sum0[i:I, j:J] / sum1[i:I, j:J]), np.float64(0.0))
+        mask_139629027280656_gen_0[i:I, j:J, k:K] = np.bitwise_and((zfix[i:I, j:J] > np.int64(0)), (fac_gen_0[i:I, j:J, k:K] > np.float64(0.0)))
+        q[i:I, j:J, k:K] = np.where(mask_139629027280656_gen_0[i:I, j:J, k:K], np.where((((fac_gen_0[i:I, j:J, k:K] * dm[i:I, j:J, k:K]) / dp[i:I, j:J, k:K]) > np.float64(0.0)), ((fac_gen_0[i:I, j:J, k:K] * dm[i:I, j:J, k:K]) / dp[i:I, j:J, k:K]), np.float64(0.0)), q[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
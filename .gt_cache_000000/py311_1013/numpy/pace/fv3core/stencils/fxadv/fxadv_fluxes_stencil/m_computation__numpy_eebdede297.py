@@ -0,0 +1,116 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, sin_sg1, sin_sg2, sin_sg3, sin_sg4, rdxa, rdya, dy, dx, crx, cry, x_area_flux, y_area_flux, uc_contra, vc_contra, dt, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    sin_sg1 = Field(sin_sg1, _origin_['sin_sg1'], (True, True, False))
+    sin_sg2 = Field(sin_sg2, _origin_['sin_sg2'], (True, True, False))
+    sin_sg3 = Field(sin_sg3, _origin_['sin_sg3'], (True, True, False))
+    sin_sg4 = Field(sin_sg4, _origin_['sin_sg4'], (True, True, False))
+    rdxa = Field(rdxa, _origin_['rdxa'], (True, True, False))
+    rdya = Field(rdya, _origin_['rdya'], (True, True, False))
+    dy = Field(dy, _origin_['dy'], (True, True, False))
+    dx = Field(dx, _origin_['dx'], (True, True, False))
+    crx = Field(crx, _origin_['crx'], (True, True, True))
+    cry = Field(cry, _origin_['cry'], (True, True, True))
+    x_area_flux = Field(x_area_flux, _origin_['x_area_flux'], (True, True, True))
+    y_area_flux = Field(y_area_flux, _origin_['y_area_flux'], (True, True, True))
+    uc_contra = Field(uc_contra, _origin_['uc_contra'], (True, True, True))
+    vc_contra = Field(vc_contra, _origin_['vc_contra'], (True, True, True))
+    
+    mask_139629264226768_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629034325904_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629264226768_gen_0[i + 3:I - 2, j:J, k:K] = (uc_contra[i + 3:I - 2, j:J, k:K] > np.float64(np.int64(0)))
+        crx[i + 3:I - 2, j:J, k:K] = np.where(mask_139629264226768_gen_0[i + 3:I - 2, j:J, k:K], ((dt * uc_contra[i + 3:I - 2, j:J, k:K]) * rdxa[i + 2:I - 3, j:J]), crx[i + 3:I - 2, j:J, k:K])
+        x_area_flux[i + 3:I - 2, j:J, k:K] = np.where(mask_139629264226768_gen_0[i + 3:I - 2, j:J, k:K], (((dy[i + 3:I - 2, j:J] * dt) * uc_contra[i + 3:I - 2, j:J, k:K]) * sin_sg3[i + 2:I - 3, j:J]), x_area_flux[i + 3:I - 2, j:J, k:K])
+        crx[i + 3:I - 2, j:J, k:K] = np.where((np.bitwise_not(mask_139629264226768_gen_0[i + 3:I - 2, j:J, k:K])), ((dt * uc_contra[i + 3:I - 2, j:J, k:K]) * rdxa[i + 3:I - 2, j:J]), crx[i + 3:I - 2, j:J, k:K])
+        x_area_flux[i + 3:I - 2, j:J, k:K] = np.where((np.bitwise_not(mask_139629264226768_gen_0[i + 3:I - 2, j:J, k:K])), (((dy[i + 3:I - 2, j:J] * dt) * uc_contra[i + 3:I - 2, j:J, k:K]) * sin_sg1[i + 3:I - 2, j:J]), x_area_flux[i + 3:I - 2, j:J, k:K])
+        mask_139629034325904_gen_0[i:I, j + 3:J - 2, k:K] = (vc_contra[i:I, j + 3:J - 2, k:K] > np.float64(np.int64(0)))
+        cry[i:I, j + 3:J - 2, k:K] = np.where(mask_139629034325904_gen_0[i:I, j + 3:J - 2, k:K], ((dt * vc_contra[i:I, j + 3:J - 2, k:K]) * rdya[i:I, j + 2:J - 3]), cry[i:I, j + 3:J - 2, k:K])
+        y_area_flux[i:I, j + 3:J - 2, k:K] = np.where(mask_139629034325904_gen_0[i:I, j + 3:J - 2, k:K], (((dx[i:I, j + 3:J - 2] * dt) * vc_contra[i:I, j + 3:J - 2, k:K]) * sin_sg4[i:I, j + 2:J - 3]), y_area_flux[i:I, j + 3:J - 2, k:K])
+        cry[i:I, j + 3:J - 2, k:K] = np.where((np.bitwise_not(mask_139629034325904_gen_0[i:I, j + 3:J - 2, k:K])), ((dt * vc_contra[i:I, j + 3:J - 2, k:K]) * rdya[i:I, j + 3:J - 2]), cry[i:I, j + 3:J - 2, k:K])
+        y_area_flux[i:I, j + 3:J - 2, k:K] = np.where((np.bitwise_not(mask_139629034325904_gen_0[i:I, j + 3:J - 2, k:K])), (((dx[i:I, j + 3:J - 2] * dt) * vc_contra[i:I, j + 3:J - 2, k:K]) * sin_sg2[i:I, j + 3:J - 2]), y_area_flux[i:I, j + 3:J - 2, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,123 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, q, pe1, pe2, q4_1, q4_2, q4_3, q4_4, dp1, lev, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    q = Field(q, _origin_['q'], (True, True, True))
+    pe1 = Field(pe1, _origin_['pe1'], (True, True, True))
+    pe2 = Field(pe2, _origin_['pe2'], (True, True, True))
+    q4_1 = Field(q4_1, _origin_['q4_1'], (True, True, True))
+    q4_2 = Field(q4_2, _origin_['q4_2'], (True, True, True))
+    q4_3 = Field(q4_3, _origin_['q4_3'], (True, True, True))
+    q4_4 = Field(q4_4, _origin_['q4_4'], (True, True, True))
+    dp1 = Field(dp1, _origin_['dp1'], (True, True, True))
+    lev = Field(lev, _origin_['lev'], (True, True, False))
+    
+    qsum_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pl_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    esl_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pr_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dp_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629023096400_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+        for k_ in range(k, K):
+
+            lk = k_
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            pl_gen_0[i:I, j:J, k_:k_ + 1] = ((pe2[i:I, j:J, k_:k_ + 1] - pe1[i:I, j:J, lk + lev[i:I, j:J]]) / dp1[i:I, j:J, lk + lev[i:I, j:J]])
+            mask_139629023096400_gen_0[i:I, j:J, k_:k_ + 1] = (pe2[i:I, j:J, k_ + 1:k_ + 2] <= pe1[i:I, j:J, lk + (lev[i:I, j:J] + np.int64(1))])
+            pr_gen_0[i:I, j:J, k_:k_ + 1] = np.where(mask_139629023096400_gen_0[i:I, j:J, k_:k_ + 1], ((pe2[i:I, j:J, k_ + 1:k_ + 2] - pe1[i:I, j:J, lk + lev[i:I, j:J]]) / dp1[i:I, j:J, lk + lev[i:I, j:J]]), pr_gen_0[i:I, j:J, k_:k_ + 1])
+            q[i:I, j:J, k_:k_ + 1] = np.where(mask_139629023096400_gen_0[i:I, j:J, k_:k_ + 1], ((q4_2[i:I, j:J, lk + lev[i:I, j:J]] + ((np.float64(0.5) * ((q4_4[i:I, j:J, lk + lev[i:I, j:J]] + q4_3[i:I, j:J, lk + lev[i:I, j:J]]) - q4_2[i:I, j:J, lk + lev[i:I, j:J]])) * (pr_gen_0[i:I, j:J, k_:k_ + 1] + pl_gen_0[i:I, j:J, k_:k_ + 1]))) - (((q4_4[i:I, j:J, lk + lev[i:I, j:J]] * np.float64(1.0)) / np.float64(3.0)) * ((pr_gen_0[i:I, j:J, k_:k_ + 1] * (pr_gen_0[i:I, j:J, k_:k_ + 1] + pl_gen_0[i:I, j:J, k_:k_ + 1])) + (pl_gen_0[i:I, j:J, k_:k_ + 1] * pl_gen_0[i:I, j:J, k_:k_ + 1])))), q[i:I, j:J, k_:k_ + 1])
+            qsum_gen_0[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629023096400_gen_0[i:I, j:J, k_:k_ + 1])), ((pe1[i:I, j:J, lk + (lev[i:I, j:J] + np.int64(1))] - pe2[i:I, j:J, k_:k_ + 1]) * ((q4_2[i:I, j:J, lk + lev[i:I, j:J]] + ((np.float64(0.5) * ((q4_4[i:I, j:J, lk + lev[i:I, j:J]] + q4_3[i:I, j:J, lk + lev[i:I, j:J]]) - q4_2[i:I, j:J, lk + lev[i:I, j:J]])) * (np.float64(1.0) + pl_gen_0[i:I, j:J, k_:k_ + 1]))) - (((q4_4[i:I, j:J, lk + lev[i:I, j:J]] * np.float64(1.0)) / np.float64(3.0)) * (np.float64(1.0) + (pl_gen_0[i:I, j:J, k_:k_ + 1] * (np.float64(1.0) + pl_gen_0[i:I, j:J, k_:k_ + 1])))))), qsum_gen_0[i:I, j:J, k_:k_ + 1])
+            lev[i:I, j:J] = np.where((np.bitwise_not(mask_139629023096400_gen_0[i:I, j:J, k_:k_ + 1])), (lev[i:I, j:J] + np.int64(1)), lev[i:I, j:J])
+            while np.any(np.bitwise_and((np.bitwise_not(mask_139629023096400_gen_0[i:I, j:J, k_:k_ + 1])), (pe1[i:I, j:J, lk + (lev[i:I, j:J] + np.int64(1))] < pe2[i:I, j:J, k_ + 1:k_ + 2]))):
+                qsum_gen_0[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and((np.bitwise_not(mask_139629023096400_gen_0[i:I, j:J, k_:k_ + 1])), np.bitwise_and((np.bitwise_not(mask_139629023096400_gen_0[i:I, j:J, k_:k_ + 1])), (pe1[i:I, j:J, lk + (lev[i:I, j:J] + np.int64(1))] < pe2[i:I, j:J, k_ + 1:k_ + 2]))), (qsum_gen_0[i:I, j:J, k_:k_ + 1] + (dp1[i:I, j:J, lk + lev[i:I, j:J]] * q4_1[i:I, j:J, lk + lev[i:I, j:J]])), qsum_gen_0[i:I, j:J, k_:k_ + 1])
+                lev[i:I, j:J] = np.where(np.bitwise_and((np.bitwise_not(mask_139629023096400_gen_0[i:I, j:J, k_:k_ + 1])), np.bitwise_and((np.bitwise_not(mask_139629023096400_gen_0[i:I, j:J, k_:k_ + 1])), (pe1[i:I, j:J, lk + (lev[i:I, j:J] + np.int64(1))] < pe2[i:I, j:J, k_ + 1:k_ + 2]))), (lev[i:I, j:J] + np.int64(1)), lev[i:I, j:J])
+                
+            dp_gen_0[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629023096400_gen_0[i:I, j:J, k_:k_ + 1])), (pe2[i:I, j:J, k_ + 1:k_ + 2] - pe1[i:I, j:J, lk + lev[i:I, j:J]]), dp_gen_0[i:I, j:J, k_:k_ + 1])
+            esl_gen_0[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629023096400_gen_0[i:I, j:J, k_:k_ + 1])), (dp_gen_0[i:I, j:J, k_:k_ + 1] / dp1[i:I, j:J, lk + lev[i:I, j:J]]), esl_gen_0[i:I, j:J, k_:k_ + 1])
+            qsum_gen_0[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629023096400_gen_0[i:I, j:J, k_:k_ + 1])), (qsum_gen_0[i:I, j:J, k_:k_ + 1] + (dp_gen_0[i:I, j:J, k_:k_ + 1] * (q4_2[i:I, j:J, lk + lev[i:I, j:J]] + ((np.float64(0.5) * esl_gen_0[i:I, j:J, k_:k_ + 1]) * ((q4_3[i:I, j:J, lk + lev[i:I, j:J]] - q4_2[i:I, j:J, lk + lev[i:I, j:J]]) + (q4_4[i:I, j:J, lk + lev[i:I, j:J]] * (np.float64(1.0) - ((np.float64(2.0) / np.float64(3.0)) * esl_gen_0[i:I, j:J, k_:k_ + 1])))))))), qsum_gen_0[i:I, j:J, k_:k_ + 1])
+            q[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629023096400_gen_0[i:I, j:J, k_:k_ + 1])), (qsum_gen_0[i:I, j:J, k_:k_ + 1] / (pe2[i:I, j:J, k_ + 1:k_ + 2] - pe2[i:I, j:J, k_:k_ + 1])), q[i:I, j:J, k_:k_ + 1])
+            lev[i:I, j:J] = (lev[i:I, j:J] - np.int64(1))
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,149 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, q, dp, sum1, sum2, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    q = Field(q, _origin_['q'], (True, True, True))
+    dp = Field(dp, _origin_['dp'], (True, True, True))
+    sum1 = Field(sum1, _origin_['sum1'], (True, True, False))
+    sum2 = Field(sum2, _origin_['sum2'], (True, True, False))
+    
+    mask_139629030211088_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629032141904_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dq_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629023062224_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dq_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            sum1[i:I, j:J] = np.float64(0.0)
+            sum2[i:I, j:J] = np.float64(0.0)
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629030211088_gen_0[i:I, j:J, k_:k_ + 1] = (q[i:I, j:J, k_:k_ + 1] > np.float64(np.int64(0)))
+            sum1[i:I, j:J] = np.where(mask_139629030211088_gen_0[i:I, j:J, k_:k_ + 1], (sum1[i:I, j:J] + (q[i:I, j:J, k_:k_ + 1] * dp[i:I, j:J, k_:k_ + 1])), sum1[i:I, j:J])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629032141904_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((q[i:I, j:J, k_:k_ + 1] < np.float64(0.0)), (sum1[i:I, j:J] >= np.float64(np.int64(0))))
+            dq_gen_0[i:I, j:J, k_:k_ + 1] = np.where(mask_139629032141904_gen_0[i:I, j:J, k_:k_ + 1], np.where((sum1[i:I, j:J] < ((-(q[i:I, j:J, k_:k_ + 1])) * dp[i:I, j:J, k_:k_ + 1])), sum1[i:I, j:J], ((-(q[i:I, j:J, k_:k_ + 1])) * dp[i:I, j:J, k_:k_ + 1])), dq_gen_0[i:I, j:J, k_:k_ + 1])
+            sum1[i:I, j:J] = np.where(mask_139629032141904_gen_0[i:I, j:J, k_:k_ + 1], (sum1[i:I, j:J] - dq_gen_0[i:I, j:J, k_:k_ + 1]), sum1[i:I, j:J])
+            sum2[i:I, j:J] = np.where(mask_139629032141904_gen_0[i:I, j:J, k_:k_ + 1], (sum2[i:I, j:J] + dq_gen_0[i:I, j:J, k_:k_ + 1]), sum2[i:I, j:J])
+            q[i:I, j:J, k_:k_ + 1] = np.where(mask_139629032141904_gen_0[i:I, j:J, k_:k_ + 1], (q[i:I, j:J, k_:k_ + 1] + (dq_gen_0[i:I, j:J, k_:k_ + 1] / dp[i:I, j:J, k_:k_ + 1])), q[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629023062224_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((q[i:I, j:J, k_:k_ + 1] > np.float64(0.0)), np.bitwise_and((sum1[i:I, j:J] >= np.float64(1e-12)), (sum2[i:I, j:J] > np.float64(np.int64(0)))))
+            dq_gen_1[i:I, j:J, k_:k_ + 1] = np.where(mask_139629023062224_gen_0[i:I, j:J, k_:k_ + 1], np.where((sum2[i:I, j:J] < (q[i:I, j:J, k_:k_ + 1] * dp[i:I, j:J, k_:k_ + 1])), sum2[i:I, j:J], (q[i:I, j:J, k_:k_ + 1] * dp[i:I, j:J, k_:k_ + 1])), dq_gen_1[i:I, j:J, k_:k_ + 1])
+            sum2[i:I, j:J] = np.where(mask_139629023062224_gen_0[i:I, j:J, k_:k_ + 1], (sum2[i:I, j:J] - dq_gen_1[i:I, j:J, k_:k_ + 1]), sum2[i:I, j:J])
+            q[i:I, j:J, k_:k_ + 1] = np.where(mask_139629023062224_gen_0[i:I, j:J, k_:k_ + 1], (q[i:I, j:J, k_:k_ + 1] - (dq_gen_1[i:I, j:J, k_:k_ + 1] / dp[i:I, j:J, k_:k_ + 1])), q[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
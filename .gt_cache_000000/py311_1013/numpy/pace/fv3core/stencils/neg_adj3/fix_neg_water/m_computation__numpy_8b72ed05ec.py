@@ -0,0 +1,235 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, pt, qvapor, qliquid, qrain, qsnow, qice, qgraupel, lv00, d0_vap, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    pt = Field(pt, _origin_['pt'], (True, True, True))
+    qvapor = Field(qvapor, _origin_['qvapor'], (True, True, True))
+    qliquid = Field(qliquid, _origin_['qliquid'], (True, True, True))
+    qrain = Field(qrain, _origin_['qrain'], (True, True, True))
+    qsnow = Field(qsnow, _origin_['qsnow'], (True, True, True))
+    qice = Field(qice, _origin_['qice'], (True, True, True))
+    qgraupel = Field(qgraupel, _origin_['qgraupel'], (True, True, True))
+    
+    dq__839_34_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qsum__6f1_37_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_sol_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dq1__6f1_37_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629028539536_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    pos_qgraupel__6f1_37_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629030272592_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629031606800_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qsum__839_34_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cpm_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pt__839_34_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629028286416_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629030123920_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qrain_tmp__6f1_37_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629032357776_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qrain__6f1_37_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629030829648_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    q_liq_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcpk_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629034671376_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dq_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qliquid__839_34_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629024616656_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qsnow__6f1_37_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629029650000_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qvapor__839_34_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pt__6f1_37_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qice__839_34_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qliquid__6f1_37_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qsnow__839_34_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icpk_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dq__6f1_37_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qgraupel__839_34_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629028146896_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qgraupel__6f1_37_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629028578000_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qvapor__6f1_37_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qice__6f1_37_60_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629027495376_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        q_liq_gen_0[i:I, j:J, k:K] = np.where((np.float64(0.0) > (qliquid[i:I, j:J, k:K] + qrain[i:I, j:J, k:K])), np.float64(0.0), (qliquid[i:I, j:J, k:K] + qrain[i:I, j:J, k:K]))
+        q_sol_gen_0[i:I, j:J, k:K] = np.where((np.float64(0.0) > (qice[i:I, j:J, k:K] + qsnow[i:I, j:J, k:K])), np.float64(0.0), (qice[i:I, j:J, k:K] + qsnow[i:I, j:J, k:K]))
+        cpm_gen_0[i:I, j:J, k:K] = (((((np.float64(1.0) - ((qvapor[i:I, j:J, k:K] + q_liq_gen_0[i:I, j:J, k:K]) + q_sol_gen_0[i:I, j:J, k:K])) * np.float64(717.55)) + (qvapor[i:I, j:J, k:K] * np.float64(1384.5))) + (q_liq_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol_gen_0[i:I, j:J, k:K] * np.float64(1972.0)))
+        lcpk_gen_0[i:I, j:J, k:K] = ((lv00 + (d0_vap * pt[i:I, j:J, k:K])) / cpm_gen_0[i:I, j:J, k:K])
+        icpk_gen_0[i:I, j:J, k:K] = ((np.float64(-271059.66000000003) + (np.float64(2213.5) * pt[i:I, j:J, k:K])) / cpm_gen_0[i:I, j:J, k:K])
+        dq_gen_0[i:I, j:J, k:K] = np.float64(0.0)
+        qvapor__839_34_60_gen_0[i:I, j:J, k:K] = qvapor[i:I, j:J, k:K]
+        qice__839_34_60_gen_0[i:I, j:J, k:K] = qice[i:I, j:J, k:K]
+        qsnow__839_34_60_gen_0[i:I, j:J, k:K] = qsnow[i:I, j:J, k:K]
+        qgraupel__839_34_60_gen_0[i:I, j:J, k:K] = qgraupel[i:I, j:J, k:K]
+        qliquid__839_34_60_gen_0[i:I, j:J, k:K] = qliquid[i:I, j:J, k:K]
+        pt__839_34_60_gen_0[i:I, j:J, k:K] = pt[i:I, j:J, k:K]
+        dq__839_34_60_gen_0[i:I, j:J, k:K] = dq_gen_0[i:I, j:J, k:K]
+        qsum__839_34_60_gen_0[i:I, j:J, k:K] = (qice__839_34_60_gen_0[i:I, j:J, k:K] + qsnow__839_34_60_gen_0[i:I, j:J, k:K])
+        mask_139629028539536_gen_0[i:I, j:J, k:K] = (qsum__839_34_60_gen_0[i:I, j:J, k:K] > np.float64(0.0))
+        mask_139629028578000_gen_0[i:I, j:J, k:K] = (qice__839_34_60_gen_0[i:I, j:J, k:K] < np.float64(0.0))
+        qice__839_34_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629028539536_gen_0[i:I, j:J, k:K], mask_139629028578000_gen_0[i:I, j:J, k:K]), np.float64(0.0), qice__839_34_60_gen_0[i:I, j:J, k:K])
+        qsnow__839_34_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629028539536_gen_0[i:I, j:J, k:K], mask_139629028578000_gen_0[i:I, j:J, k:K]), qsum__839_34_60_gen_0[i:I, j:J, k:K], qsnow__839_34_60_gen_0[i:I, j:J, k:K])
+        mask_139629030829648_gen_0[i:I, j:J, k:K] = (qsnow__839_34_60_gen_0[i:I, j:J, k:K] < np.float64(0.0))
+        qsnow__839_34_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629028539536_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629028578000_gen_0[i:I, j:J, k:K]))), mask_139629030829648_gen_0[i:I, j:J, k:K]), np.float64(0.0), qsnow__839_34_60_gen_0[i:I, j:J, k:K])
+        qice__839_34_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629028539536_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629028578000_gen_0[i:I, j:J, k:K]))), mask_139629030829648_gen_0[i:I, j:J, k:K]), qsum__839_34_60_gen_0[i:I, j:J, k:K], qice__839_34_60_gen_0[i:I, j:J, k:K])
+        qice__839_34_60_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629028539536_gen_0[i:I, j:J, k:K])), np.float64(0.0), qice__839_34_60_gen_0[i:I, j:J, k:K])
+        qsnow__839_34_60_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629028539536_gen_0[i:I, j:J, k:K])), np.float64(0.0), qsnow__839_34_60_gen_0[i:I, j:J, k:K])
+        qgraupel__839_34_60_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629028539536_gen_0[i:I, j:J, k:K])), (qgraupel__839_34_60_gen_0[i:I, j:J, k:K] + qsum__839_34_60_gen_0[i:I, j:J, k:K]), qgraupel__839_34_60_gen_0[i:I, j:J, k:K])
+        mask_139629034671376_gen_0[i:I, j:J, k:K] = (qgraupel__839_34_60_gen_0[i:I, j:J, k:K] < np.float64(0.0))
+        dq__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629034671376_gen_0[i:I, j:J, k:K], np.where((qsnow__839_34_60_gen_0[i:I, j:J, k:K] < (-(qgraupel__839_34_60_gen_0[i:I, j:J, k:K]))), qsnow__839_34_60_gen_0[i:I, j:J, k:K], (-(qgraupel__839_34_60_gen_0[i:I, j:J, k:K]))), dq__839_34_60_gen_0[i:I, j:J, k:K])
+        qsnow__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629034671376_gen_0[i:I, j:J, k:K], (qsnow__839_34_60_gen_0[i:I, j:J, k:K] - dq__839_34_60_gen_0[i:I, j:J, k:K]), qsnow__839_34_60_gen_0[i:I, j:J, k:K])
+        qgraupel__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629034671376_gen_0[i:I, j:J, k:K], (qgraupel__839_34_60_gen_0[i:I, j:J, k:K] + dq__839_34_60_gen_0[i:I, j:J, k:K]), qgraupel__839_34_60_gen_0[i:I, j:J, k:K])
+        mask_139629027495376_gen_0[i:I, j:J, k:K] = (qgraupel__839_34_60_gen_0[i:I, j:J, k:K] < np.float64(0.0))
+        dq__839_34_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629034671376_gen_0[i:I, j:J, k:K], mask_139629027495376_gen_0[i:I, j:J, k:K]), np.where((qice__839_34_60_gen_0[i:I, j:J, k:K] < (-(qgraupel__839_34_60_gen_0[i:I, j:J, k:K]))), qice__839_34_60_gen_0[i:I, j:J, k:K], (-(qgraupel__839_34_60_gen_0[i:I, j:J, k:K]))), dq__839_34_60_gen_0[i:I, j:J, k:K])
+        qice__839_34_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629034671376_gen_0[i:I, j:J, k:K], mask_139629027495376_gen_0[i:I, j:J, k:K]), (qice__839_34_60_gen_0[i:I, j:J, k:K] - dq__839_34_60_gen_0[i:I, j:J, k:K]), qice__839_34_60_gen_0[i:I, j:J, k:K])
+        qgraupel__839_34_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629034671376_gen_0[i:I, j:J, k:K], mask_139629027495376_gen_0[i:I, j:J, k:K]), (qgraupel__839_34_60_gen_0[i:I, j:J, k:K] + dq__839_34_60_gen_0[i:I, j:J, k:K]), qgraupel__839_34_60_gen_0[i:I, j:J, k:K])
+        mask_139629028286416_gen_0[i:I, j:J, k:K] = np.bitwise_and((qgraupel__839_34_60_gen_0[i:I, j:J, k:K] < np.float64(0.0)), (qrain[i:I, j:J, k:K] > np.float64(0.0)))
+        dq__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629028286416_gen_0[i:I, j:J, k:K], np.where((qrain[i:I, j:J, k:K] < (-(qgraupel__839_34_60_gen_0[i:I, j:J, k:K]))), qrain[i:I, j:J, k:K], (-(qgraupel__839_34_60_gen_0[i:I, j:J, k:K]))), dq__839_34_60_gen_0[i:I, j:J, k:K])
+        qgraupel__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629028286416_gen_0[i:I, j:J, k:K], (qgraupel__839_34_60_gen_0[i:I, j:J, k:K] + dq__839_34_60_gen_0[i:I, j:J, k:K]), qgraupel__839_34_60_gen_0[i:I, j:J, k:K])
+        qliquid__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629028286416_gen_0[i:I, j:J, k:K], (qliquid__839_34_60_gen_0[i:I, j:J, k:K] - dq__839_34_60_gen_0[i:I, j:J, k:K]), qliquid__839_34_60_gen_0[i:I, j:J, k:K])
+        pt__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629028286416_gen_0[i:I, j:J, k:K], (pt__839_34_60_gen_0[i:I, j:J, k:K] + (dq__839_34_60_gen_0[i:I, j:J, k:K] * icpk_gen_0[i:I, j:J, k:K])), pt__839_34_60_gen_0[i:I, j:J, k:K])
+        mask_139629029650000_gen_0[i:I, j:J, k:K] = np.bitwise_and((qgraupel__839_34_60_gen_0[i:I, j:J, k:K] < np.float64(0.0)), (qliquid__839_34_60_gen_0[i:I, j:J, k:K] > np.float64(0.0)))
+        dq__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629029650000_gen_0[i:I, j:J, k:K], np.where((qliquid__839_34_60_gen_0[i:I, j:J, k:K] < (-(qgraupel__839_34_60_gen_0[i:I, j:J, k:K]))), qliquid__839_34_60_gen_0[i:I, j:J, k:K], (-(qgraupel__839_34_60_gen_0[i:I, j:J, k:K]))), dq__839_34_60_gen_0[i:I, j:J, k:K])
+        qgraupel__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629029650000_gen_0[i:I, j:J, k:K], (qgraupel__839_34_60_gen_0[i:I, j:J, k:K] + dq__839_34_60_gen_0[i:I, j:J, k:K]), qgraupel__839_34_60_gen_0[i:I, j:J, k:K])
+        qliquid__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629029650000_gen_0[i:I, j:J, k:K], (qliquid__839_34_60_gen_0[i:I, j:J, k:K] - dq__839_34_60_gen_0[i:I, j:J, k:K]), qliquid__839_34_60_gen_0[i:I, j:J, k:K])
+        pt__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629029650000_gen_0[i:I, j:J, k:K], (pt__839_34_60_gen_0[i:I, j:J, k:K] + (dq__839_34_60_gen_0[i:I, j:J, k:K] * icpk_gen_0[i:I, j:J, k:K])), pt__839_34_60_gen_0[i:I, j:J, k:K])
+        mask_139629024616656_gen_0[i:I, j:J, k:K] = np.bitwise_and((qgraupel__839_34_60_gen_0[i:I, j:J, k:K] < np.float64(0.0)), (qvapor__839_34_60_gen_0[i:I, j:J, k:K] > np.float64(0.0)))
+        dq__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629024616656_gen_0[i:I, j:J, k:K], np.where(((np.float64(0.999) * qvapor__839_34_60_gen_0[i:I, j:J, k:K]) < (-(qgraupel__839_34_60_gen_0[i:I, j:J, k:K]))), (np.float64(0.999) * qvapor__839_34_60_gen_0[i:I, j:J, k:K]), (-(qgraupel__839_34_60_gen_0[i:I, j:J, k:K]))), dq__839_34_60_gen_0[i:I, j:J, k:K])
+        qgraupel__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629024616656_gen_0[i:I, j:J, k:K], (qgraupel__839_34_60_gen_0[i:I, j:J, k:K] + dq__839_34_60_gen_0[i:I, j:J, k:K]), qgraupel__839_34_60_gen_0[i:I, j:J, k:K])
+        qvapor__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629024616656_gen_0[i:I, j:J, k:K], (qvapor__839_34_60_gen_0[i:I, j:J, k:K] - dq__839_34_60_gen_0[i:I, j:J, k:K]), qvapor__839_34_60_gen_0[i:I, j:J, k:K])
+        pt__839_34_60_gen_0[i:I, j:J, k:K] = np.where(mask_139629024616656_gen_0[i:I, j:J, k:K], (pt__839_34_60_gen_0[i:I, j:J, k:K] + (dq__839_34_60_gen_0[i:I, j:J, k:K] * (icpk_gen_0[i:I, j:J, k:K] + lcpk_gen_0[i:I, j:J, k:K]))), pt__839_34_60_gen_0[i:I, j:J, k:K])
+        qvapor[i:I, j:J, k:K] = qvapor__839_34_60_gen_0[i:I, j:J, k:K]
+        qice[i:I, j:J, k:K] = qice__839_34_60_gen_0[i:I, j:J, k:K]
+        qsnow[i:I, j:J, k:K] = qsnow__839_34_60_gen_0[i:I, j:J, k:K]
+        qgraupel[i:I, j:J, k:K] = qgraupel__839_34_60_gen_0[i:I, j:J, k:K]
+        qrain[i:I, j:J, k:K] = qrain[i:I, j:J, k:K]
+        qliquid[i:I, j:J, k:K] = qliquid__839_34_60_gen_0[i:I, j:J, k:K]
+        pt[i:I, j:J, k:K] = pt__839_34_60_gen_0[i:I, j:J, k:K]
+        qvapor__6f1_37_60_gen_0[i:I, j:J, k:K] = qvapor[i:I, j:J, k:K]
+        qice__6f1_37_60_gen_0[i:I, j:J, k:K] = qice[i:I, j:J, k:K]
+        qsnow__6f1_37_60_gen_0[i:I, j:J, k:K] = qsnow[i:I, j:J, k:K]
+        qgraupel__6f1_37_60_gen_0[i:I, j:J, k:K] = qgraupel[i:I, j:J, k:K]
+        qrain__6f1_37_60_gen_0[i:I, j:J, k:K] = qrain[i:I, j:J, k:K]
+        qliquid__6f1_37_60_gen_0[i:I, j:J, k:K] = qliquid[i:I, j:J, k:K]
+        pt__6f1_37_60_gen_0[i:I, j:J, k:K] = pt[i:I, j:J, k:K]
+        dq__6f1_37_60_gen_0[i:I, j:J, k:K] = dq_gen_0[i:I, j:J, k:K]
+        qsum__6f1_37_60_gen_0[i:I, j:J, k:K] = (qliquid__6f1_37_60_gen_0[i:I, j:J, k:K] + qrain__6f1_37_60_gen_0[i:I, j:J, k:K])
+        pos_qgraupel__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where((np.float64(0.0) > qgraupel__6f1_37_60_gen_0[i:I, j:J, k:K]), np.float64(0.0), qgraupel__6f1_37_60_gen_0[i:I, j:J, k:K])
+        qrain_tmp__6f1_37_60_gen_0[i:I, j:J, k:K] = np.float64(0.0)
+        dq1__6f1_37_60_gen_0[i:I, j:J, k:K] = np.float64(0.0)
+        mask_139629032357776_gen_0[i:I, j:J, k:K] = (qsum__6f1_37_60_gen_0[i:I, j:J, k:K] > np.float64(0.0))
+        mask_139629028146896_gen_0[i:I, j:J, k:K] = (qrain__6f1_37_60_gen_0[i:I, j:J, k:K] < np.float64(0.0))
+        qrain__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629032357776_gen_0[i:I, j:J, k:K], mask_139629028146896_gen_0[i:I, j:J, k:K]), np.float64(0.0), qrain__6f1_37_60_gen_0[i:I, j:J, k:K])
+        qliquid__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629032357776_gen_0[i:I, j:J, k:K], mask_139629028146896_gen_0[i:I, j:J, k:K]), qsum__6f1_37_60_gen_0[i:I, j:J, k:K], qliquid__6f1_37_60_gen_0[i:I, j:J, k:K])
+        mask_139629030272592_gen_0[i:I, j:J, k:K] = (qliquid__6f1_37_60_gen_0[i:I, j:J, k:K] < np.float64(0.0))
+        qliquid__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629032357776_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629028146896_gen_0[i:I, j:J, k:K]))), mask_139629030272592_gen_0[i:I, j:J, k:K]), np.float64(0.0), qliquid__6f1_37_60_gen_0[i:I, j:J, k:K])
+        qrain__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629032357776_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629028146896_gen_0[i:I, j:J, k:K]))), mask_139629030272592_gen_0[i:I, j:J, k:K]), qsum__6f1_37_60_gen_0[i:I, j:J, k:K], qrain__6f1_37_60_gen_0[i:I, j:J, k:K])
+        qliquid__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), np.float64(0.0), qliquid__6f1_37_60_gen_0[i:I, j:J, k:K])
+        qrain_tmp__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), qsum__6f1_37_60_gen_0[i:I, j:J, k:K], qrain_tmp__6f1_37_60_gen_0[i:I, j:J, k:K])
+        dq__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), np.where((pos_qgraupel__6f1_37_60_gen_0[i:I, j:J, k:K] < (-(qrain_tmp__6f1_37_60_gen_0[i:I, j:J, k:K]))), pos_qgraupel__6f1_37_60_gen_0[i:I, j:J, k:K], (-(qrain_tmp__6f1_37_60_gen_0[i:I, j:J, k:K]))), dq__6f1_37_60_gen_0[i:I, j:J, k:K])
+        qrain_tmp__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), (qrain_tmp__6f1_37_60_gen_0[i:I, j:J, k:K] + dq__6f1_37_60_gen_0[i:I, j:J, k:K]), qrain_tmp__6f1_37_60_gen_0[i:I, j:J, k:K])
+        qgraupel__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), (qgraupel__6f1_37_60_gen_0[i:I, j:J, k:K] - dq__6f1_37_60_gen_0[i:I, j:J, k:K]), qgraupel__6f1_37_60_gen_0[i:I, j:J, k:K])
+        pt__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), (pt__6f1_37_60_gen_0[i:I, j:J, k:K] - (dq__6f1_37_60_gen_0[i:I, j:J, k:K] * icpk_gen_0[i:I, j:J, k:K])), pt__6f1_37_60_gen_0[i:I, j:J, k:K])
+        mask_139629031606800_gen_0[i:I, j:J, k:K] = (qrain__6f1_37_60_gen_0[i:I, j:J, k:K] < np.float64(0.0))
+        dq__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), mask_139629031606800_gen_0[i:I, j:J, k:K]), np.where(((qice__6f1_37_60_gen_0[i:I, j:J, k:K] + qsnow__6f1_37_60_gen_0[i:I, j:J, k:K]) < (-(qrain_tmp__6f1_37_60_gen_0[i:I, j:J, k:K]))), (qice__6f1_37_60_gen_0[i:I, j:J, k:K] + qsnow__6f1_37_60_gen_0[i:I, j:J, k:K]), (-(qrain_tmp__6f1_37_60_gen_0[i:I, j:J, k:K]))), dq__6f1_37_60_gen_0[i:I, j:J, k:K])
+        qrain_tmp__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), mask_139629031606800_gen_0[i:I, j:J, k:K]), (qrain_tmp__6f1_37_60_gen_0[i:I, j:J, k:K] + dq__6f1_37_60_gen_0[i:I, j:J, k:K]), qrain_tmp__6f1_37_60_gen_0[i:I, j:J, k:K])
+        dq1__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), mask_139629031606800_gen_0[i:I, j:J, k:K]), np.where((dq__6f1_37_60_gen_0[i:I, j:J, k:K] < qsnow__6f1_37_60_gen_0[i:I, j:J, k:K]), dq__6f1_37_60_gen_0[i:I, j:J, k:K], qsnow__6f1_37_60_gen_0[i:I, j:J, k:K]), dq1__6f1_37_60_gen_0[i:I, j:J, k:K])
+        qsnow__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), mask_139629031606800_gen_0[i:I, j:J, k:K]), (qsnow__6f1_37_60_gen_0[i:I, j:J, k:K] - dq1__6f1_37_60_gen_0[i:I, j:J, k:K]), qsnow__6f1_37_60_gen_0[i:I, j:J, k:K])
+        qice__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), mask_139629031606800_gen_0[i:I, j:J, k:K]), ((qice__6f1_37_60_gen_0[i:I, j:J, k:K] + dq1__6f1_37_60_gen_0[i:I, j:J, k:K]) - dq__6f1_37_60_gen_0[i:I, j:J, k:K]), qice__6f1_37_60_gen_0[i:I, j:J, k:K])
+        pt__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), mask_139629031606800_gen_0[i:I, j:J, k:K]), (pt__6f1_37_60_gen_0[i:I, j:J, k:K] - (dq__6f1_37_60_gen_0[i:I, j:J, k:K] * icpk_gen_0[i:I, j:J, k:K])), pt__6f1_37_60_gen_0[i:I, j:J, k:K])
+        qrain__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), qrain_tmp__6f1_37_60_gen_0[i:I, j:J, k:K], qrain__6f1_37_60_gen_0[i:I, j:J, k:K])
+        mask_139629030123920_gen_0[i:I, j:J, k:K] = np.bitwise_and((qrain__6f1_37_60_gen_0[i:I, j:J, k:K] < np.float64(0.0)), (qvapor__6f1_37_60_gen_0[i:I, j:J, k:K] > np.float64(0.0)))
+        dq__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), mask_139629030123920_gen_0[i:I, j:J, k:K]), np.where(((np.float64(0.999) * qvapor__6f1_37_60_gen_0[i:I, j:J, k:K]) < (-(qrain__6f1_37_60_gen_0[i:I, j:J, k:K]))), (np.float64(0.999) * qvapor__6f1_37_60_gen_0[i:I, j:J, k:K]), (-(qrain__6f1_37_60_gen_0[i:I, j:J, k:K]))), dq__6f1_37_60_gen_0[i:I, j:J, k:K])
+        qvapor__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), mask_139629030123920_gen_0[i:I, j:J, k:K]), (qvapor__6f1_37_60_gen_0[i:I, j:J, k:K] - dq__6f1_37_60_gen_0[i:I, j:J, k:K]), qvapor__6f1_37_60_gen_0[i:I, j:J, k:K])
+        qrain__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), mask_139629030123920_gen_0[i:I, j:J, k:K]), (qrain__6f1_37_60_gen_0[i:I, j:J, k:K] + dq__6f1_37_60_gen_0[i:I, j:J, k:K]), qrain__6f1_37_60_gen_0[i:I, j:J, k:K])
+        pt__6f1_37_60_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629032357776_gen_0[i:I, j:J, k:K])), mask_139629030123920_gen_0[i:I, j:J, k:K]), (pt__6f1_37_60_gen_0[i:I, j:J, k:K] + (dq__6f1_37_60_gen_0[i:I, j:J, k:K] * lcpk_gen_0[i:I, j:J, k:K])), pt__6f1_37_60_gen_0[i:I, j:J, k:K])
+        qvapor[i:I, j:J, k:K] = qvapor__6f1_37_60_gen_0[i:I, j:J, k:K]
+        qice[i:I, j:J, k:K] = qice__6f1_37_60_gen_0[i:I, j:J, k:K]
+        qsnow[i:I, j:J, k:K] = qsnow__6f1_37_60_gen_0[i:I, j:J, k:K]
+        qgraupel[i:I, j:J, k:K] = qgraupel__6f1_37_60_gen_0[i:I, j:J, k:K]
+        qrain[i:I, j:J, k:K] = qrain__6f1_37_60_gen_0[i:I, j:J, k:K]
+        qliquid[i:I, j:J, k:K] = qliquid__6f1_37_60_gen_0[i:I, j:J, k:K]
+        pt[i:I, j:J, k:K] = pt__6f1_37_60_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,100 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, u, wk, wk1, gz, pk3, pp, rdx, dt, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    u = Field(u, _origin_['u'], (True, True, True))
+    wk = Field(wk, _origin_['wk'], (True, True, True))
+    wk1 = Field(wk1, _origin_['wk1'], (True, True, True))
+    gz = Field(gz, _origin_['gz'], (True, True, True))
+    pk3 = Field(pk3, _origin_['pk3'], (True, True, True))
+    pp = Field(pp, _origin_['pp'], (True, True, True))
+    rdx = Field(rdx, _origin_['rdx'], (True, True, False))
+    
+    du_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        du_gen_0[i:I, j:J, k:K] = ((dt / (wk[i:I, j:J, k:K] + wk[i + 1:I + 1, j:J, k:K])) * (((gz[i:I, j:J, k + 1:K + 1] - gz[i + 1:I + 1, j:J, k:K]) * (pk3[i + 1:I + 1, j:J, k + 1:K + 1] - pk3[i:I, j:J, k:K])) + ((gz[i:I, j:J, k:K] - gz[i + 1:I + 1, j:J, k + 1:K + 1]) * (pk3[i:I, j:J, k + 1:K + 1] - pk3[i + 1:I + 1, j:J, k:K]))))
+        u[i:I, j:J, k:K] = (((u[i:I, j:J, k:K] + du_gen_0[i:I, j:J, k:K]) + ((dt / (wk1[i:I, j:J, k:K] + wk1[i + 1:I + 1, j:J, k:K])) * (((gz[i:I, j:J, k + 1:K + 1] - gz[i + 1:I + 1, j:J, k:K]) * (pp[i + 1:I + 1, j:J, k + 1:K + 1] - pp[i:I, j:J, k:K])) + ((gz[i:I, j:J, k:K] - gz[i + 1:I + 1, j:J, k + 1:K + 1]) * (pp[i:I, j:J, k + 1:K + 1] - pp[i + 1:I + 1, j:J, k:K]))))) * rdx[i:I, j:J])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
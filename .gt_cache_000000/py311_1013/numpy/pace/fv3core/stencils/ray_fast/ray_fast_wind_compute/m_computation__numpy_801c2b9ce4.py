@@ -0,0 +1,298 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, u, v, w, delta_p_ref, pfull, dt, ptop, rf_cutoff_nudge, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    u = Field(u, _origin_['u'], (True, True, True))
+    v = Field(v, _origin_['v'], (True, True, True))
+    w = Field(w, _origin_['w'], (True, True, True))
+    delta_p_ref = Field(delta_p_ref, _origin_['delta_p_ref'], (False, False, True))
+    pfull = Field(pfull, _origin_['pfull'], (False, False, True))
+    
+    rf = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p_ref = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dmdir = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    rffvals__205_32_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    rf_cutoff__205_32_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tau0__205_32_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629264180560_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629038678096_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629033127056_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629033120272_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629037325520_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629037122960_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__37d_58_29_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629035233680_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629036056528_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629025668816_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__37d_80_29_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629032730192_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629032727056_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629036149648_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629031423120_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629264180560_gen_0[i:I, j:J, k:K] = (pfull[k:K] < np.float64(3000.0))
+        rf_cutoff__205_32_17_gen_0[i:I, j:J, k:K] = np.where(mask_139629264180560_gen_0[i:I, j:J, k:K], np.float64(3000.0), rf_cutoff__205_32_17_gen_0[i:I, j:J, k:K])
+        tau0__205_32_17_gen_0[i:I, j:J, k:K] = np.where(mask_139629264180560_gen_0[i:I, j:J, k:K], (np.float64(10.0) * np.float64(86400.0)), tau0__205_32_17_gen_0[i:I, j:J, k:K])
+        rffvals__205_32_17_gen_0[i:I, j:J, k:K] = np.where(mask_139629264180560_gen_0[i:I, j:J, k:K], ((dt / tau0__205_32_17_gen_0[i:I, j:J, k:K]) * np.power(np.sin((((np.float64(0.5) * np.float64(3.141592653589793)) * np.log((rf_cutoff__205_32_17_gen_0[i:I, j:J, k:K] / pfull[k:K]))) / np.log((rf_cutoff__205_32_17_gen_0[i:I, j:J, k:K] / ptop)))), np.float64(np.int64(2)))), rffvals__205_32_17_gen_0[i:I, j:J, k:K])
+        rffvals__205_32_17_gen_0[i:I, j:J, k:K] = np.where(mask_139629264180560_gen_0[i:I, j:J, k:K], (np.float64(1.0) / (np.float64(1.0) + rffvals__205_32_17_gen_0[i:I, j:J, k:K])), rffvals__205_32_17_gen_0[i:I, j:J, k:K])
+        rf[i:I, j:J, k:K] = np.where(mask_139629264180560_gen_0[i:I, j:J, k:K], rffvals__205_32_17_gen_0[i:I, j:J, k:K], rf[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629038678096_gen_0[i:I, j:J, k_:k_ + 1] = (pfull[k_:k_ + 1] < rf_cutoff_nudge)
+            p_ref[i:I, j:J, k_:k_ + 1] = np.where(mask_139629038678096_gen_0[i:I, j:J, k_:k_ + 1], delta_p_ref[k_:k_ + 1], p_ref[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            p_ref[i:I, j:J, k_:k_ + 1] = p_ref[i:I, j:J, k_ - 1:k_]
+            mask_139629033127056_gen_0[i:I, j:J, k_:k_ + 1] = (pfull[k_:k_ + 1] < rf_cutoff_nudge)
+            p_ref[i:I, j:J, k_:k_ + 1] = np.where(mask_139629033127056_gen_0[i:I, j:J, k_:k_ + 1], (p_ref[i:I, j:J, k_:k_ + 1] + delta_p_ref[k_:k_ + 1]), p_ref[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629033120272_gen_0[i:I, j:J, k_:k_ + 1] = (pfull[k_:k_ + 1] < rf_cutoff_nudge)
+            p_ref[i:I, j:J, k_:k_ + 1] = np.where(mask_139629033120272_gen_0[i:I, j:J, k_:k_ + 1], p_ref[i:I, j:J, k_ + 1:k_ + 2], p_ref[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629037325520_gen_0[i:I - 1, j:J, k_:k_ + 1] = (pfull[k_:k_ + 1] < np.float64(3000.0))
+            dmdir[i:I - 1, j:J, k_:k_ + 1] = np.where(mask_139629037325520_gen_0[i:I - 1, j:J, k_:k_ + 1], (((np.float64(1.0) - rf[i:I - 1, j:J, k_:k_ + 1]) * delta_p_ref[k_:k_ + 1]) * u[i:I - 1, j:J, k_:k_ + 1]), dmdir[i:I - 1, j:J, k_:k_ + 1])
+            u[i:I - 1, j:J, k_:k_ + 1] = np.where(mask_139629037325520_gen_0[i:I - 1, j:J, k_:k_ + 1], (u[i:I - 1, j:J, k_:k_ + 1] * rf[i:I - 1, j:J, k_:k_ + 1]), u[i:I - 1, j:J, k_:k_ + 1])
+            p_ref[i:I - 1, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629037325520_gen_0[i:I - 1, j:J, k_:k_ + 1])), np.float64(np.int64(0)), p_ref[i:I - 1, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            dmdir[i:I - 1, j:J, k_:k_ + 1] = dmdir[i:I - 1, j:J, k_ - 1:k_]
+            mask_139629037122960_gen_0[i:I - 1, j:J, k_:k_ + 1] = (pfull[k_:k_ + 1] < np.float64(3000.0))
+            RETURN_VALUE__37d_58_29_gen_0[i:I - 1, j:J, k_:k_ + 1] = np.where(mask_139629037122960_gen_0[i:I - 1, j:J, k_:k_ + 1], (((np.float64(1.0) - rf[i:I - 1, j:J, k_:k_ + 1]) * delta_p_ref[k_:k_ + 1]) * u[i:I - 1, j:J, k_:k_ + 1]), RETURN_VALUE__37d_58_29_gen_0[i:I - 1, j:J, k_:k_ + 1])
+            dmdir[i:I - 1, j:J, k_:k_ + 1] = np.where(mask_139629037122960_gen_0[i:I - 1, j:J, k_:k_ + 1], (dmdir[i:I - 1, j:J, k_:k_ + 1] + RETURN_VALUE__37d_58_29_gen_0[i:I - 1, j:J, k_:k_ + 1]), dmdir[i:I - 1, j:J, k_:k_ + 1])
+            u[i:I - 1, j:J, k_:k_ + 1] = np.where(mask_139629037122960_gen_0[i:I - 1, j:J, k_:k_ + 1], (u[i:I - 1, j:J, k_:k_ + 1] * rf[i:I - 1, j:J, k_:k_ + 1]), u[i:I - 1, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629035233680_gen_0[i:I, j:J, k_:k_ + 1] = (pfull[k_:k_ + 1] < np.float64(3000.0))
+            dmdir[i:I, j:J, k_:k_ + 1] = np.where(mask_139629035233680_gen_0[i:I, j:J, k_:k_ + 1], dmdir[i:I, j:J, k_ + 1:k_ + 2], dmdir[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629036056528_gen_0[i:I - 1, j:J, k:K] = (pfull[k:K] < rf_cutoff_nudge)
+        u[i:I - 1, j:J, k:K] = np.where(mask_139629036056528_gen_0[i:I - 1, j:J, k:K], (u[i:I - 1, j:J, k:K] + (dmdir[i:I - 1, j:J, k:K] / p_ref[i:I - 1, j:J, k:K])), u[i:I - 1, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629025668816_gen_0[i:I, j:J - 1, k_:k_ + 1] = (pfull[k_:k_ + 1] < np.float64(3000.0))
+            dmdir[i:I, j:J - 1, k_:k_ + 1] = np.where(mask_139629025668816_gen_0[i:I, j:J - 1, k_:k_ + 1], (((np.float64(1.0) - rf[i:I, j:J - 1, k_:k_ + 1]) * delta_p_ref[k_:k_ + 1]) * v[i:I, j:J - 1, k_:k_ + 1]), dmdir[i:I, j:J - 1, k_:k_ + 1])
+            v[i:I, j:J - 1, k_:k_ + 1] = np.where(mask_139629025668816_gen_0[i:I, j:J - 1, k_:k_ + 1], (v[i:I, j:J - 1, k_:k_ + 1] * rf[i:I, j:J - 1, k_:k_ + 1]), v[i:I, j:J - 1, k_:k_ + 1])
+            p_ref[i:I, j:J - 1, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629025668816_gen_0[i:I, j:J - 1, k_:k_ + 1])), np.float64(np.int64(0)), p_ref[i:I, j:J - 1, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            dmdir[i:I, j:J - 1, k_:k_ + 1] = dmdir[i:I, j:J - 1, k_ - 1:k_]
+            mask_139629032730192_gen_0[i:I, j:J - 1, k_:k_ + 1] = (pfull[k_:k_ + 1] < np.float64(3000.0))
+            RETURN_VALUE__37d_80_29_gen_0[i:I, j:J - 1, k_:k_ + 1] = np.where(mask_139629032730192_gen_0[i:I, j:J - 1, k_:k_ + 1], (((np.float64(1.0) - rf[i:I, j:J - 1, k_:k_ + 1]) * delta_p_ref[k_:k_ + 1]) * v[i:I, j:J - 1, k_:k_ + 1]), RETURN_VALUE__37d_80_29_gen_0[i:I, j:J - 1, k_:k_ + 1])
+            dmdir[i:I, j:J - 1, k_:k_ + 1] = np.where(mask_139629032730192_gen_0[i:I, j:J - 1, k_:k_ + 1], (dmdir[i:I, j:J - 1, k_:k_ + 1] + RETURN_VALUE__37d_80_29_gen_0[i:I, j:J - 1, k_:k_ + 1]), dmdir[i:I, j:J - 1, k_:k_ + 1])
+            v[i:I, j:J - 1, k_:k_ + 1] = np.where(mask_139629032730192_gen_0[i:I, j:J - 1, k_:k_ + 1], (v[i:I, j:J - 1, k_:k_ + 1] * rf[i:I, j:J - 1, k_:k_ + 1]), v[i:I, j:J - 1, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629032727056_gen_0[i:I, j:J, k_:k_ + 1] = (pfull[k_:k_ + 1] < np.float64(3000.0))
+            dmdir[i:I, j:J, k_:k_ + 1] = np.where(mask_139629032727056_gen_0[i:I, j:J, k_:k_ + 1], dmdir[i:I, j:J, k_ + 1:k_ + 2], dmdir[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629036149648_gen_0[i:I, j:J - 1, k:K] = (pfull[k:K] < rf_cutoff_nudge)
+        v[i:I, j:J - 1, k:K] = np.where(mask_139629036149648_gen_0[i:I, j:J - 1, k:K], (v[i:I, j:J - 1, k:K] + (dmdir[i:I, j:J - 1, k:K] / p_ref[i:I, j:J - 1, k:K])), v[i:I, j:J - 1, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629031423120_gen_0[i:I - 1, j:J - 1, k:K] = (pfull[k:K] < np.float64(3000.0))
+        w[i:I - 1, j:J - 1, k:K] = np.where(mask_139629031423120_gen_0[i:I - 1, j:J - 1, k:K], (w[i:I - 1, j:J - 1, k:K] * rf[i:I - 1, j:J - 1, k:K]), w[i:I - 1, j:J - 1, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,167 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, delp, cappa, pe, pe_init, delta_mass, zh, q_con, p_interface, log_p_interface, pk3, gamma, dz, p_gas, ptop, peln1, ptk, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    delp = Field(delp, _origin_['delp'], (True, True, True))
+    cappa = Field(cappa, _origin_['cappa'], (True, True, True))
+    pe = Field(pe, _origin_['pe'], (True, True, True))
+    pe_init = Field(pe_init, _origin_['pe_init'], (True, True, True))
+    delta_mass = Field(delta_mass, _origin_['delta_mass'], (True, True, True))
+    zh = Field(zh, _origin_['zh'], (True, True, True))
+    q_con = Field(q_con, _origin_['q_con'], (True, True, True))
+    p_interface = Field(p_interface, _origin_['p_interface'], (True, True, True))
+    log_p_interface = Field(log_p_interface, _origin_['log_p_interface'], (True, True, True))
+    pk3 = Field(pk3, _origin_['pk3'], (True, True, True))
+    gamma = Field(gamma, _origin_['gamma'], (True, True, True))
+    dz = Field(dz, _origin_['dz'], (True, True, True))
+    p_gas = Field(p_gas, _origin_['p_gas'], (True, True, True))
+    
+    p_interface_gas = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    log_p_interface_gas = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        delta_mass[i:I, j:J, k:K] = delp[i:I, j:J, k:K]
+        pe_init[i:I, j:J, k:K] = pe[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            p_interface[i:I, j:J, k_:k_ + 1] = ptop
+            log_p_interface[i:I, j:J, k_:k_ + 1] = peln1
+            pk3[i:I, j:J, k_:k_ + 1] = ptk
+            p_interface_gas[i:I, j:J, k_:k_ + 1] = ptop
+            log_p_interface_gas[i:I, j:J, k_:k_ + 1] = peln1
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            p_interface[i:I, j:J, k_:k_ + 1] = (p_interface[i:I, j:J, k_ - 1:k_] + delta_mass[i:I, j:J, k_ - 1:k_])
+            log_p_interface[i:I, j:J, k_:k_ + 1] = np.log(p_interface[i:I, j:J, k_:k_ + 1])
+            p_interface_gas[i:I, j:J, k_:k_ + 1] = (p_interface_gas[i:I, j:J, k_ - 1:k_] + (delta_mass[i:I, j:J, k_ - 1:k_] * (np.float64(1.0) - q_con[i:I, j:J, k_ - 1:k_])))
+            log_p_interface_gas[i:I, j:J, k_:k_ + 1] = np.log(p_interface_gas[i:I, j:J, k_:k_ + 1])
+            pk3[i:I, j:J, k_:k_ + 1] = np.exp((np.float64(0.2857356161656381) * log_p_interface[i:I, j:J, k_:k_ + 1]))
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        gamma[i:I, j:J, k:K] = (np.float64(1.0) / (np.float64(1.0) - cappa[i:I, j:J, k:K]))
+        delta_mass[i:I, j:J, k:K] = (delta_mass[i:I, j:J, k:K] * np.float64(0.10197162129779283))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        p_gas[i:I, j:J, k:K] = ((p_interface_gas[i:I, j:J, k + 1:K + 1] - p_interface_gas[i:I, j:J, k:K]) / (log_p_interface_gas[i:I, j:J, k + 1:K + 1] - log_p_interface_gas[i:I, j:J, k:K]))
+        dz[i:I, j:J, k:K] = (zh[i:I, j:J, k + 1:K + 1] - zh[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,380 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, w, delta_mass, gamma, dz, potential_temperature, pm, pe, pem, ws, cp3, dt, t1g, rdt, p_fac, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    w = Field(w, _origin_['w'], (True, True, True))
+    delta_mass = Field(delta_mass, _origin_['delta_mass'], (True, True, True))
+    gamma = Field(gamma, _origin_['gamma'], (True, True, True))
+    dz = Field(dz, _origin_['dz'], (True, True, True))
+    potential_temperature = Field(potential_temperature, _origin_['potential_temperature'], (True, True, True))
+    pm = Field(pm, _origin_['pm'], (True, True, True))
+    pe = Field(pe, _origin_['pe'], (True, True, True))
+    pem = Field(pem, _origin_['pem'], (True, True, True))
+    ws = Field(ws, _origin_['ws'], (True, True, False))
+    cp3 = Field(cp3, _origin_['cp3'], (True, True, True))
+    
+    w1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    g_rat = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    bb = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dd = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    bet = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pp = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    gam = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    aa = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    p1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    maxp_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        pe[i:I, j:J, k:K] = (np.exp((gamma[i:I, j:J, k:K] * np.log(((((-(delta_mass[i:I, j:J, k:K])) / dz[i:I, j:J, k:K]) * np.float64(287.05)) * potential_temperature[i:I, j:J, k:K])))) - pm[i:I, j:J, k:K])
+        w1[i:I, j:J, k:K] = w[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 2
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            g_rat[i:I, j:J, k_:k_ + 1] = (delta_mass[i:I, j:J, k_:k_ + 1] / delta_mass[i:I, j:J, k_ + 1:k_ + 2])
+            bb[i:I, j:J, k_:k_ + 1] = (np.float64(2.0) * (np.float64(1.0) + g_rat[i:I, j:J, k_:k_ + 1]))
+            dd[i:I, j:J, k_:k_ + 1] = (np.float64(3.0) * (pe[i:I, j:J, k_:k_ + 1] + (g_rat[i:I, j:J, k_:k_ + 1] * pe[i:I, j:J, k_ + 1:k_ + 2])))
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 2, _dK_ - 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            bb[i:I, j:J, k_:k_ + 1] = np.float64(2.0)
+            dd[i:I, j:J, k_:k_ + 1] = (np.float64(3.0) * pe[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            bet[i:I, j:J, k_:k_ + 1] = bb[i:I, j:J, k_:k_ + 1]
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            bet[i:I, j:J, k_:k_ + 1] = bet[i:I, j:J, k_ - 1:k_]
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        pp[i:I, j:J, k:K] = np.float64(0.0)
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dk_ + 2
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        pp[i:I, j:J, k:K] = (dd[i:I, j:J, k - 1:K - 1] / bet[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            gam[i:I, j:J, k_:k_ + 1] = (g_rat[i:I, j:J, k_ - 1:k_] / bet[i:I, j:J, k_ - 1:k_])
+            bet[i:I, j:J, k_:k_ + 1] = (bb[i:I, j:J, k_:k_ + 1] - gam[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 2, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            pp[i:I, j:J, k_:k_ + 1] = ((dd[i:I, j:J, k_ - 1:k_] - pp[i:I, j:J, k_ - 1:k_]) / bet[i:I, j:J, k_ - 1:k_])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            pp[i:I, j:J, k_:k_ + 1] = (pp[i:I, j:J, k_:k_ + 1] - (gam[i:I, j:J, k_:k_ + 1] * pp[i:I, j:J, k_ + 1:k_ + 2]))
+            aa[i:I, j:J, k_:k_ + 1] = ((((t1g * np.float64(0.5)) * (gamma[i:I, j:J, k_ - 1:k_] + gamma[i:I, j:J, k_:k_ + 1])) / (dz[i:I, j:J, k_ - 1:k_] + dz[i:I, j:J, k_:k_ + 1])) * (pem[i:I, j:J, k_:k_ + 1] + pp[i:I, j:J, k_:k_ + 1]))
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            bet[i:I, j:J, k_:k_ + 1] = (delta_mass[i:I, j:J, k_:k_ + 1] - aa[i:I, j:J, k_ + 1:k_ + 2])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            bet[i:I, j:J, k_:k_ + 1] = bet[i:I, j:J, k_ - 1:k_]
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            w[i:I, j:J, k_:k_ + 1] = (((delta_mass[i:I, j:J, k_:k_ + 1] * w1[i:I, j:J, k_:k_ + 1]) + (dt * pp[i:I, j:J, k_ + 1:k_ + 2])) / bet[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 2
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            gam[i:I, j:J, k_:k_ + 1] = (aa[i:I, j:J, k_:k_ + 1] / bet[i:I, j:J, k_ - 1:k_])
+            bet[i:I, j:J, k_:k_ + 1] = (delta_mass[i:I, j:J, k_:k_ + 1] - ((aa[i:I, j:J, k_:k_ + 1] + aa[i:I, j:J, k_ + 1:k_ + 2]) + (aa[i:I, j:J, k_:k_ + 1] * gam[i:I, j:J, k_:k_ + 1])))
+            w[i:I, j:J, k_:k_ + 1] = ((((delta_mass[i:I, j:J, k_:k_ + 1] * w1[i:I, j:J, k_:k_ + 1]) + (dt * (pp[i:I, j:J, k_ + 1:k_ + 2] - pp[i:I, j:J, k_:k_ + 1]))) - (aa[i:I, j:J, k_:k_ + 1] * w[i:I, j:J, k_ - 1:k_])) / bet[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 2, _dK_ - 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            p1[i:I, j:J, k_:k_ + 1] = (((t1g * gamma[i:I, j:J, k_:k_ + 1]) / dz[i:I, j:J, k_:k_ + 1]) * (pem[i:I, j:J, k_ + 1:k_ + 2] + pp[i:I, j:J, k_ + 1:k_ + 2]))
+            gam[i:I, j:J, k_:k_ + 1] = (aa[i:I, j:J, k_:k_ + 1] / bet[i:I, j:J, k_ - 1:k_])
+            bet[i:I, j:J, k_:k_ + 1] = (delta_mass[i:I, j:J, k_:k_ + 1] - ((aa[i:I, j:J, k_:k_ + 1] + p1[i:I, j:J, k_:k_ + 1]) + (aa[i:I, j:J, k_:k_ + 1] * gam[i:I, j:J, k_:k_ + 1])))
+            w[i:I, j:J, k_:k_ + 1] = (((((delta_mass[i:I, j:J, k_:k_ + 1] * w1[i:I, j:J, k_:k_ + 1]) + (dt * (pp[i:I, j:J, k_ + 1:k_ + 2] - pp[i:I, j:J, k_:k_ + 1]))) - (p1[i:I, j:J, k_:k_ + 1] * ws[i:I, j:J])) - (aa[i:I, j:J, k_:k_ + 1] * w[i:I, j:J, k_ - 1:k_])) / bet[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 2
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            w[i:I, j:J, k_:k_ + 1] = (w[i:I, j:J, k_:k_ + 1] - (gam[i:I, j:J, k_ + 1:k_ + 2] * w[i:I, j:J, k_ + 1:k_ + 2]))
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            pe[i:I, j:J, k_:k_ + 1] = np.float64(0.0)
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            pe[i:I, j:J, k_:k_ + 1] = (pe[i:I, j:J, k_ - 1:k_] + ((delta_mass[i:I, j:J, k_ - 1:k_] * (w[i:I, j:J, k_ - 1:k_] - w1[i:I, j:J, k_ - 1:k_])) * rdt))
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 2, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            p1[i:I, j:J, k_:k_ + 1] = (((pe[i:I, j:J, k_:k_ + 1] + (np.float64(2.0) * pe[i:I, j:J, k_ + 1:k_ + 2])) * np.float64(1.0)) / np.float64(3.0))
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 2
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            p1[i:I, j:J, k_:k_ + 1] = (((((pe[i:I, j:J, k_:k_ + 1] + (bb[i:I, j:J, k_:k_ + 1] * pe[i:I, j:J, k_ + 1:k_ + 2])) + (g_rat[i:I, j:J, k_:k_ + 1] * pe[i:I, j:J, k_ + 2:k_ + 3])) * np.float64(1.0)) / np.float64(3.0)) - (g_rat[i:I, j:J, k_:k_ + 1] * p1[i:I, j:J, k_ + 1:k_ + 2]))
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        maxp_gen_0[i:I, j:J, k:K] = np.where(((p_fac * delta_mass[i:I, j:J, k:K]) > (p1[i:I, j:J, k:K] + pm[i:I, j:J, k:K])), (p_fac * pm[i:I, j:J, k:K]), (p1[i:I, j:J, k:K] + pm[i:I, j:J, k:K]))
+        dz[i:I, j:J, k:K] = ((((-(delta_mass[i:I, j:J, k:K])) * np.float64(287.05)) * potential_temperature[i:I, j:J, k:K]) * np.exp(((cp3[i:I, j:J, k:K] - np.float64(1.0)) * np.log(maxp_gen_0[i:I, j:J, k:K]))))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,144 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, q_center, q_interface, gk, beta, gamma, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    q_center = Field(q_center, _origin_['q_center'], (True, True, True))
+    q_interface = Field(q_interface, _origin_['q_interface'], (True, True, True))
+    gk = Field(gk, _origin_['gk'], (False, False, True))
+    beta = Field(beta, _origin_['beta'], (False, False, True))
+    gamma = Field(gamma, _origin_['gamma'], (False, False, True))
+    
+    xt1_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    xt2_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    a_bot_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    xt1_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            xt1_gen_0[i:I, j:J, k_:k_ + 1] = ((np.float64(2.0) * gk[k_:k_ + 1]) * (gk[k_:k_ + 1] + np.float64(1.0)))
+            q_interface[i:I, j:J, k_:k_ + 1] = (((xt1_gen_0[i:I, j:J, k_:k_ + 1] * q_center[i:I, j:J, k_:k_ + 1]) + q_center[i:I, j:J, k_ + 1:k_ + 2]) / beta[k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            q_interface[i:I, j:J, k_:k_ + 1] = (((np.float64(3.0) * (q_center[i:I, j:J, k_ - 1:k_] + (gk[k_:k_ + 1] * q_center[i:I, j:J, k_:k_ + 1]))) - q_interface[i:I, j:J, k_ - 1:k_]) / beta[k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            a_bot_gen_0[i:I, j:J, k_:k_ + 1] = (np.float64(1.0) + (gk[k_ - 1:k_] * (gk[k_ - 1:k_] + np.float64(1.5))))
+            xt1_gen_1[i:I, j:J, k_:k_ + 1] = ((np.float64(2.0) * gk[k_ - 1:k_]) * (gk[k_ - 1:k_] + np.float64(1.0)))
+            xt2_gen_0[i:I, j:J, k_:k_ + 1] = ((gk[k_ - 1:k_] * (gk[k_ - 1:k_] + np.float64(0.5))) - (a_bot_gen_0[i:I, j:J, k_:k_ + 1] * gamma[k_ - 1:k_]))
+            q_interface[i:I, j:J, k_:k_ + 1] = ((((xt1_gen_1[i:I, j:J, k_:k_ + 1] * q_center[i:I, j:J, k_ - 1:k_]) + q_center[i:I, j:J, k_ - 2:k_ - 1]) - (a_bot_gen_0[i:I, j:J, k_:k_ + 1] * q_interface[i:I, j:J, k_ - 1:k_])) / xt2_gen_0[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            q_interface[i:I, j:J, k_:k_ + 1] = (q_interface[i:I, j:J, k_:k_ + 1] - (gamma[k_:k_ + 1] * q_interface[i:I, j:J, k_ + 1:k_ + 2]))
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
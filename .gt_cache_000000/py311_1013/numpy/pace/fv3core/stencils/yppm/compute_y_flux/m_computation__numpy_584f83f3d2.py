@@ -0,0 +1,461 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, q, courant, dya, yflux, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    q = Field(q, _origin_['q'], (True, True, True))
+    courant = Field(courant, _origin_['courant'], (True, True, True))
+    dya = Field(dya, _origin_['dya'], (True, True, False))
+    yflux = Field(yflux, _origin_['yflux'], (True, True, True))
+    
+    bl__da4_11_13__296_18_21 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    br__da4_11_13__296_18_21 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    bl = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    br = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    b0__804_19_20 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    a__1c3_6_11__65d_5_9__296_18_21_gen_2 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_2 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629047634576_gen_2 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    asignb__1c3_6_11__65d_5_9__296_18_21_gen_2 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dm__296_18_21_gen_2 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    yt__65d_5_9__296_18_21_gen_2 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dql__65d_5_9__296_18_21_gen_2 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dqr__65d_5_9__296_18_21_gen_2 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    a__1c3_6_11__65d_5_9__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    a__1c3_6_11__65d_5_9__296_18_21_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629047634576_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    mask_139629047634576_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    asignb__1c3_6_11__65d_5_9__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    asignb__1c3_6_11__65d_5_9__296_18_21_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dm__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dm__296_18_21_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    yt__65d_5_9__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    yt__65d_5_9__296_18_21_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dql__65d_5_9__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dql__65d_5_9__296_18_21_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dqr__65d_5_9__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dqr__65d_5_9__296_18_21_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    al__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    al__296_18_21_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    RETURN_VALUE__1c3_4_16__796_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    br__796_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    a__1c3_4_16__796_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    asignb__1c3_4_16__796_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629047643344_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    asignb__1c3_5_9__796_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    a__1c3_5_9__796_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    bl__796_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629049170768_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    yt__796_10_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    br__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    bl__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    a__1c3_6_11__65d_5_9__296_18_21_gen_3 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_3 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629047634576_gen_3 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    asignb__1c3_6_11__65d_5_9__296_18_21_gen_3 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dm__296_18_21_gen_3 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    yt__65d_5_9__296_18_21_gen_3 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dql__65d_5_9__296_18_21_gen_3 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dqr__65d_5_9__296_18_21_gen_3 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    al__296_18_21_gen_3 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    al__296_18_21_gen_2 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_4 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629047634576_gen_4 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    yt__65d_5_9__296_18_21_gen_4 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    asignb__1c3_6_11__65d_5_9__296_18_21_gen_4 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    a__1c3_6_11__65d_5_9__296_18_21_gen_4 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dql__65d_5_9__296_18_21_gen_4 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_5 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dqr__65d_5_9__296_18_21_gen_4 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dm__296_18_21_gen_4 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    asignb__1c3_6_11__65d_5_9__296_18_21_gen_5 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    yt__65d_5_9__296_18_21_gen_5 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    a__1c3_6_11__65d_5_9__296_18_21_gen_5 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dql__65d_5_9__296_18_21_gen_5 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dqr__65d_5_9__296_18_21_gen_5 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629047634576_gen_5 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    dm__296_18_21_gen_5 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    al_ip1__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    maxq__5dd_45_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    yt__5dd_16_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    maxq__100_26_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629049234256_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    yt__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    maxq__5dd_16_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    asignb__1c3_53_23__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    da1__4cc_16_17__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    a__1c3_43_22__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629254350160_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    yt_br__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    yt_bl__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629047929104_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    dm_left_end__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    da2__4cc_16_17__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    a6da__4cc_16_17__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    a__1c3_53_23__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    minq__100_54_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629051170064_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    mask_139629049199312_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    yt__5dd_45_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629049179344_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    asignb__1c3_43_22__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    minq__5dd_45_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    minq__5dd_16_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    yt__100_54_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dqr__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dm_left__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    asignb__1c3_24_19__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    ar__4cc_16_17__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dql__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    al__4cc_16_17__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629049196496_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    yt__100_26_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    minq__100_26_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dm_right_end__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    a__1c3_14_18__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    dm_right__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    maxq__100_54_16__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    a__1c3_24_19__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629047890064_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    asignb__1c3_14_18__da4_11_13__296_18_21_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629047649616_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    mask_139629047805264_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), bool, (0, 1, 0))
+    br__296_18_21_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    bl__296_18_21_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 1, _dK_), np.float64, (0, 1, 0))
+    mask_139629254737040_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__238_7_11__804_19_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    fx1__804_19_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask__238_7_11__804_19_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ret__0ed_6_10__804_19_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 1, _dJ_ + 0
+
+        yt__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (np.float64(0.25) * (q[i:I, j + 1:J + 1, k:K] - q[i:I, j - 1:J - 1, k:K]))
+        dqr__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j:J, k:K], q[i:I, j - 1:J - 1, k:K]), q[i:I, j + 1:J + 1, k:K]) - q[i:I, j:J, k:K])
+        dql__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (q[i:I, j:J, k:K] - np.minimum(np.minimum(q[i:I, j:J, k:K], q[i:I, j - 1:J - 1, k:K]), q[i:I, j + 1:J + 1, k:K]))
+        a__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(yt__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K]), dqr__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K]), dql__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.abs(a__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        mask_139629047634576_gen_1[i:I, j:J, k:K] = (yt__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.where(mask_139629047634576_gen_1[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629047634576_gen_1[i:I, j:J, k:K])), (-(asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])), asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K]
+        dm__296_18_21_gen_1[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K]
+        yt__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (np.float64(0.25) * (q[i:I, j + 2:J + 2, k:K] - q[i:I, j:J, k:K]))
+        dqr__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j + 1:J + 1, k:K], q[i:I, j:J, k:K]), q[i:I, j + 2:J + 2, k:K]) - q[i:I, j + 1:J + 1, k:K])
+        dql__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (q[i:I, j + 1:J + 1, k:K] - np.minimum(np.minimum(q[i:I, j + 1:J + 1, k:K], q[i:I, j:J, k:K]), q[i:I, j + 2:J + 2, k:K]))
+        a__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(yt__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K]), dqr__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K]), dql__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.abs(a__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        mask_139629047634576_gen_0[i:I, j:J, k:K] = (yt__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.where(mask_139629047634576_gen_0[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629047634576_gen_0[i:I, j:J, k:K])), (-(asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])), asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K]
+        dm__296_18_21_gen_0[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K]
+        al__296_18_21_gen_1[i:I, j:J, k:K] = ((np.float64(0.5) * (q[i:I, j:J, k:K] + q[i:I, j + 1:J + 1, k:K])) + ((np.float64(1.0) / np.float64(3.0)) * (dm__296_18_21_gen_1[i:I, j:J, k:K] - dm__296_18_21_gen_0[i:I, j:J, k:K])))
+        yt__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (np.float64(0.25) * (q[i:I, j:J, k:K] - q[i:I, j - 2:J - 2, k:K]))
+        dqr__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j - 1:J - 1, k:K], q[i:I, j - 2:J - 2, k:K]), q[i:I, j:J, k:K]) - q[i:I, j - 1:J - 1, k:K])
+        dql__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (q[i:I, j - 1:J - 1, k:K] - np.minimum(np.minimum(q[i:I, j - 1:J - 1, k:K], q[i:I, j - 2:J - 2, k:K]), q[i:I, j:J, k:K]))
+        a__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(yt__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K]), dqr__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K]), dql__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.abs(a__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        mask_139629047634576_gen_1[i:I, j:J, k:K] = (yt__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.where(mask_139629047634576_gen_1[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629047634576_gen_1[i:I, j:J, k:K])), (-(asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])), asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K]
+        dm__296_18_21_gen_1[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K]
+        yt__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (np.float64(0.25) * (q[i:I, j + 1:J + 1, k:K] - q[i:I, j - 1:J - 1, k:K]))
+        dqr__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j:J, k:K], q[i:I, j - 1:J - 1, k:K]), q[i:I, j + 1:J + 1, k:K]) - q[i:I, j:J, k:K])
+        dql__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (q[i:I, j:J, k:K] - np.minimum(np.minimum(q[i:I, j:J, k:K], q[i:I, j - 1:J - 1, k:K]), q[i:I, j + 1:J + 1, k:K]))
+        a__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(yt__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K]), dqr__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K]), dql__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.abs(a__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        mask_139629047634576_gen_0[i:I, j:J, k:K] = (yt__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.where(mask_139629047634576_gen_0[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629047634576_gen_0[i:I, j:J, k:K])), (-(asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])), asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K]
+        dm__296_18_21_gen_0[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K]
+        al__296_18_21_gen_0[i:I, j:J, k:K] = ((np.float64(0.5) * (q[i:I, j - 1:J - 1, k:K] + q[i:I, j:J, k:K])) + ((np.float64(1.0) / np.float64(3.0)) * (dm__296_18_21_gen_1[i:I, j:J, k:K] - dm__296_18_21_gen_0[i:I, j:J, k:K])))
+        yt__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K] = (np.float64(0.25) * (q[i:I, j + 1:J + 1, k:K] - q[i:I, j - 1:J - 1, k:K]))
+        dqr__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j:J, k:K], q[i:I, j - 1:J - 1, k:K]), q[i:I, j + 1:J + 1, k:K]) - q[i:I, j:J, k:K])
+        dql__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K] = (q[i:I, j:J, k:K] - np.minimum(np.minimum(q[i:I, j:J, k:K], q[i:I, j - 1:J - 1, k:K]), q[i:I, j + 1:J + 1, k:K]))
+        a__1c3_6_11__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(yt__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K]), dqr__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K]), dql__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K] = np.abs(a__1c3_6_11__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K])
+        mask_139629047634576_gen_2[i:I, j:J, k:K] = (yt__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K] = np.where(mask_139629047634576_gen_2[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629047634576_gen_2[i:I, j:J, k:K])), (-(asignb__1c3_6_11__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K])), asignb__1c3_6_11__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K] = asignb__1c3_6_11__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K]
+        dm__296_18_21_gen_2[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_2[i:I, j:J, k:K]
+        yt__796_10_13__296_18_21_gen_0[i:I, j:J, k:K] = (np.float64(2.0) * dm__296_18_21_gen_2[i:I, j:J, k:K])
+        a__1c3_4_16__796_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.minimum(np.abs(yt__796_10_13__296_18_21_gen_0[i:I, j:J, k:K]), np.abs((al__296_18_21_gen_0[i:I, j:J, k:K] - q[i:I, j:J, k:K])))
+        asignb__1c3_4_16__796_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.abs(a__1c3_4_16__796_10_13__296_18_21_gen_0[i:I, j:J, k:K])
+        mask_139629047643344_gen_0[i:I, j:J, k:K] = (yt__796_10_13__296_18_21_gen_0[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_4_16__796_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.where(mask_139629047643344_gen_0[i:I, j:J, k:K], asignb__1c3_4_16__796_10_13__296_18_21_gen_0[i:I, j:J, k:K], asignb__1c3_4_16__796_10_13__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_4_16__796_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629047643344_gen_0[i:I, j:J, k:K])), (-(asignb__1c3_4_16__796_10_13__296_18_21_gen_0[i:I, j:J, k:K])), asignb__1c3_4_16__796_10_13__296_18_21_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_4_16__796_10_13__296_18_21_gen_0[i:I, j:J, k:K] = asignb__1c3_4_16__796_10_13__296_18_21_gen_0[i:I, j:J, k:K]
+        bl__796_10_13__296_18_21_gen_0[i:I, j:J, k:K] = ((-(np.float64(1.0))) * RETURN_VALUE__1c3_4_16__796_10_13__296_18_21_gen_0[i:I, j:J, k:K])
+        a__1c3_5_9__796_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.minimum(np.abs(yt__796_10_13__296_18_21_gen_0[i:I, j:J, k:K]), np.abs((al__296_18_21_gen_1[i:I, j:J, k:K] - q[i:I, j:J, k:K])))
+        asignb__1c3_5_9__796_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.abs(a__1c3_5_9__796_10_13__296_18_21_gen_0[i:I, j:J, k:K])
+        mask_139629049170768_gen_0[i:I, j:J, k:K] = (yt__796_10_13__296_18_21_gen_0[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_5_9__796_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.where(mask_139629049170768_gen_0[i:I, j:J, k:K], asignb__1c3_5_9__796_10_13__296_18_21_gen_0[i:I, j:J, k:K], asignb__1c3_5_9__796_10_13__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_5_9__796_10_13__296_18_21_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629049170768_gen_0[i:I, j:J, k:K])), (-(asignb__1c3_5_9__796_10_13__296_18_21_gen_0[i:I, j:J, k:K])), asignb__1c3_5_9__796_10_13__296_18_21_gen_0[i:I, j:J, k:K])
+        br__796_10_13__296_18_21_gen_0[i:I, j:J, k:K] = asignb__1c3_5_9__796_10_13__296_18_21_gen_0[i:I, j:J, k:K]
+        bl__296_18_21_gen_0[i:I, j:J, k:K] = bl__796_10_13__296_18_21_gen_0[i:I, j:J, k:K]
+        br__296_18_21_gen_0[i:I, j:J, k:K] = br__796_10_13__296_18_21_gen_0[i:I, j:J, k:K]
+        bl__da4_11_13__296_18_21[i:I, j:J, k:K] = bl__296_18_21_gen_0[i:I, j:J, k:K]
+        br__da4_11_13__296_18_21[i:I, j:J, k:K] = br__296_18_21_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 1, _dJ_ + 0
+
+        yt__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (np.float64(0.25) * (q[i:I, j + 1:J + 1, k:K] - q[i:I, j - 1:J - 1, k:K]))
+        dqr__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j:J, k:K], q[i:I, j - 1:J - 1, k:K]), q[i:I, j + 1:J + 1, k:K]) - q[i:I, j:J, k:K])
+        dql__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = (q[i:I, j:J, k:K] - np.minimum(np.minimum(q[i:I, j:J, k:K], q[i:I, j - 1:J - 1, k:K]), q[i:I, j + 1:J + 1, k:K]))
+        a__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(yt__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K]), dqr__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K]), dql__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.abs(a__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        mask_139629047634576_gen_1[i:I, j:J, k:K] = (yt__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.where(mask_139629047634576_gen_1[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629047634576_gen_1[i:I, j:J, k:K])), (-(asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])), asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K] = asignb__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K]
+        dm__296_18_21_gen_1[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_1[i:I, j:J, k:K]
+        yt__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (np.float64(0.25) * (q[i:I, j + 2:J + 2, k:K] - q[i:I, j:J, k:K]))
+        dqr__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j + 1:J + 1, k:K], q[i:I, j:J, k:K]), q[i:I, j + 2:J + 2, k:K]) - q[i:I, j + 1:J + 1, k:K])
+        dql__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = (q[i:I, j + 1:J + 1, k:K] - np.minimum(np.minimum(q[i:I, j + 1:J + 1, k:K], q[i:I, j:J, k:K]), q[i:I, j + 2:J + 2, k:K]))
+        a__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(yt__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K]), dqr__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K]), dql__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.abs(a__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        mask_139629047634576_gen_0[i:I, j:J, k:K] = (yt__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.where(mask_139629047634576_gen_0[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629047634576_gen_0[i:I, j:J, k:K])), (-(asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])), asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K] = asignb__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K]
+        dm__296_18_21_gen_0[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_0[i:I, j:J, k:K]
+        al__296_18_21_gen_2[i:I, j:J, k:K] = ((np.float64(0.5) * (q[i:I, j:J, k:K] + q[i:I, j + 1:J + 1, k:K])) + ((np.float64(1.0) / np.float64(3.0)) * (dm__296_18_21_gen_1[i:I, j:J, k:K] - dm__296_18_21_gen_0[i:I, j:J, k:K])))
+        al_ip1__da4_11_13__296_18_21_gen_0[i:I, j:J, k:K] = al__296_18_21_gen_2[i:I, j:J, k:K]
+        yt__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K] = (np.float64(0.25) * (q[i:I, j:J, k:K] - q[i:I, j - 2:J - 2, k:K]))
+        dqr__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j - 1:J - 1, k:K], q[i:I, j - 2:J - 2, k:K]), q[i:I, j:J, k:K]) - q[i:I, j - 1:J - 1, k:K])
+        dql__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K] = (q[i:I, j - 1:J - 1, k:K] - np.minimum(np.minimum(q[i:I, j - 1:J - 1, k:K], q[i:I, j - 2:J - 2, k:K]), q[i:I, j:J, k:K]))
+        a__1c3_6_11__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(yt__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K]), dqr__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K]), dql__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K] = np.abs(a__1c3_6_11__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K])
+        mask_139629047634576_gen_4[i:I, j:J, k:K] = (yt__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K] = np.where(mask_139629047634576_gen_4[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629047634576_gen_4[i:I, j:J, k:K])), (-(asignb__1c3_6_11__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K])), asignb__1c3_6_11__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K] = asignb__1c3_6_11__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K]
+        dm__296_18_21_gen_4[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K]
+        yt__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K] = (np.float64(0.25) * (q[i:I, j + 1:J + 1, k:K] - q[i:I, j - 1:J - 1, k:K]))
+        dqr__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j:J, k:K], q[i:I, j - 1:J - 1, k:K]), q[i:I, j + 1:J + 1, k:K]) - q[i:I, j:J, k:K])
+        dql__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K] = (q[i:I, j:J, k:K] - np.minimum(np.minimum(q[i:I, j:J, k:K], q[i:I, j - 1:J - 1, k:K]), q[i:I, j + 1:J + 1, k:K]))
+        a__1c3_6_11__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(yt__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K]), dqr__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K]), dql__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K] = np.abs(a__1c3_6_11__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K])
+        mask_139629047634576_gen_5[i:I, j:J, k:K] = (yt__65d_5_9__296_18_21_gen_4[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K] = np.where(mask_139629047634576_gen_5[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629047634576_gen_5[i:I, j:J, k:K])), (-(asignb__1c3_6_11__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K])), asignb__1c3_6_11__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K] = asignb__1c3_6_11__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K]
+        dm__296_18_21_gen_5[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_5[i:I, j:J, k:K]
+        al__296_18_21_gen_3[i:I, j:J, k:K] = ((np.float64(0.5) * (q[i:I, j - 1:J - 1, k:K] + q[i:I, j:J, k:K])) + ((np.float64(1.0) / np.float64(3.0)) * (dm__296_18_21_gen_4[i:I, j:J, k:K] - dm__296_18_21_gen_5[i:I, j:J, k:K])))
+        yt__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K] = (np.float64(0.25) * (q[i:I, j + 1:J + 1, k:K] - q[i:I, j - 1:J - 1, k:K]))
+        dqr__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K] = (np.maximum(np.maximum(q[i:I, j:J, k:K], q[i:I, j - 1:J - 1, k:K]), q[i:I, j + 1:J + 1, k:K]) - q[i:I, j:J, k:K])
+        dql__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K] = (q[i:I, j:J, k:K] - np.minimum(np.minimum(q[i:I, j:J, k:K], q[i:I, j - 1:J - 1, k:K]), q[i:I, j + 1:J + 1, k:K]))
+        a__1c3_6_11__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K] = np.minimum(np.minimum(np.abs(yt__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K]), dqr__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K]), dql__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K] = np.abs(a__1c3_6_11__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K])
+        mask_139629047634576_gen_3[i:I, j:J, k:K] = (yt__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K] = np.where(mask_139629047634576_gen_3[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K], asignb__1c3_6_11__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K])
+        asignb__1c3_6_11__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629047634576_gen_3[i:I, j:J, k:K])), (-(asignb__1c3_6_11__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K])), asignb__1c3_6_11__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K])
+        RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K] = asignb__1c3_6_11__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K]
+        dm__296_18_21_gen_3[i:I, j:J, k:K] = RETURN_VALUE__1c3_6_11__65d_5_9__296_18_21_gen_3[i:I, j:J, k:K]
+        yt__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] = (np.float64(0.25) * (q[i:I, j:j + 1, k:K] - q[i:I, j - 2:j - 1, k:K]))
+        dqr__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] = (np.maximum(np.maximum(q[i:I, j - 1:j, k:K], q[i:I, j - 2:j - 1, k:K]), q[i:I, j:j + 1, k:K]) - q[i:I, j - 1:j, k:K])
+        dql__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] = (q[i:I, j - 1:j, k:K] - np.minimum(np.minimum(q[i:I, j - 1:j, k:K], q[i:I, j - 2:j - 1, k:K]), q[i:I, j:j + 1, k:K]))
+        a__1c3_14_18__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] = np.minimum(np.minimum(np.abs(yt__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K]), dqr__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K]), dql__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K])
+        asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] = np.abs(a__1c3_14_18__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K])
+        mask_139629047649616_gen_0[i:I, j:j + 1, k:K] = (yt__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] = np.where(mask_139629047649616_gen_0[i:I, j:j + 1, k:K], asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K], asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K])
+        asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] = np.where((np.bitwise_not(mask_139629047649616_gen_0[i:I, j:j + 1, k:K])), (-(asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K])), asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K])
+        dm_left__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] = asignb__1c3_14_18__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K]
+        yt_bl__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] = (((np.float64(0.5714285714285714) * dm_left__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K]) + (np.float64(0.7857142857142857) * (q[i:I, j - 1:j, k:K] - q[i:I, j:j + 1, k:K]))) + q[i:I, j:j + 1, k:K])
+        yt__5dd_16_16__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] = (np.float64(0.5) * ((((((np.float64(2.0) * dya[i:I, j:j + 1]) + dya[i:I, j - 1:j]) * q[i:I, j:j + 1, k:K]) - (dya[i:I, j:j + 1] * q[i:I, j - 1:j, k:K])) / (dya[i:I, j - 1:j] + dya[i:I, j:j + 1])) + (((((np.float64(2.0) * dya[i:I, j + 1:j + 2]) + dya[i:I, j + 2:j + 3]) * q[i:I, j + 1:j + 2, k:K]) - (dya[i:I, j + 1:j + 2] * q[i:I, j + 2:j + 3, k:K])) / (dya[i:I, j + 1:j + 2] + dya[i:I, j + 2:j + 3]))))
+        minq__5dd_16_16__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] = np.minimum(np.minimum(np.minimum(q[i:I, j - 1:j, k:K], q[i:I, j:j + 1, k:K]), q[i:I, j + 1:j + 2, k:K]), q[i:I, j + 2:j + 3, k:K])
+        maxq__5dd_16_16__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] = np.maximum(np.maximum(np.maximum(q[i:I, j - 1:j, k:K], q[i:I, j:j + 1, k:K]), q[i:I, j + 1:j + 2, k:K]), q[i:I, j + 2:j + 3, k:K])
+        yt__5dd_16_16__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] = np.minimum(np.maximum(yt__5dd_16_16__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K], minq__5dd_16_16__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K]), maxq__5dd_16_16__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K])
+        yt_br__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K] = yt__5dd_16_16__da4_11_13__296_18_21_gen_0[i:I, j:j + 1, k:K]
+        yt__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = (np.float64(0.25) * (q[i:I, j + 3:j + 4, k:K] - q[i:I, j + 1:j + 2, k:K]))
+        dqr__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = (np.maximum(np.maximum(q[i:I, j + 2:j + 3, k:K], q[i:I, j + 1:j + 2, k:K]), q[i:I, j + 3:j + 4, k:K]) - q[i:I, j + 2:j + 3, k:K])
+        dql__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = (q[i:I, j + 2:j + 3, k:K] - np.minimum(np.minimum(q[i:I, j + 2:j + 3, k:K], q[i:I, j + 1:j + 2, k:K]), q[i:I, j + 3:j + 4, k:K]))
+        a__1c3_24_19__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = np.minimum(np.minimum(np.abs(yt__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K]), dqr__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K]), dql__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K])
+        asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = np.abs(a__1c3_24_19__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K])
+        mask_139629049179344_gen_0[i:I, j + 1:j + 2, k:K] = (yt__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = np.where(mask_139629049179344_gen_0[i:I, j + 1:j + 2, k:K], asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K], asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K])
+        asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = np.where((np.bitwise_not(mask_139629049179344_gen_0[i:I, j + 1:j + 2, k:K])), (-(asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K])), asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K])
+        dm_right__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = asignb__1c3_24_19__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K]
+        yt_bl__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = (((np.float64(0.5714285714285714) * dm_left__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K]) + (np.float64(0.7857142857142857) * (q[i:I, j:j + 1, k:K] - q[i:I, j + 1:j + 2, k:K]))) + q[i:I, j + 1:j + 2, k:K])
+        yt__100_26_16__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = (np.float64(0.5) * ((((((np.float64(2.0) * dya[i:I, j:j + 1]) + dya[i:I, j - 1:j]) * q[i:I, j:j + 1, k:K]) - (dya[i:I, j:j + 1] * q[i:I, j - 1:j, k:K])) / (dya[i:I, j - 1:j] + dya[i:I, j:j + 1])) + (((((np.float64(2.0) * dya[i:I, j + 1:j + 2]) + dya[i:I, j + 2:j + 3]) * q[i:I, j + 1:j + 2, k:K]) - (dya[i:I, j + 1:j + 2] * q[i:I, j + 2:j + 3, k:K])) / (dya[i:I, j + 1:j + 2] + dya[i:I, j + 2:j + 3]))))
+        minq__100_26_16__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = np.minimum(np.minimum(np.minimum(q[i:I, j - 1:j, k:K], q[i:I, j:j + 1, k:K]), q[i:I, j + 1:j + 2, k:K]), q[i:I, j + 2:j + 3, k:K])
+        maxq__100_26_16__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = np.maximum(np.maximum(np.maximum(q[i:I, j - 1:j, k:K], q[i:I, j:j + 1, k:K]), q[i:I, j + 1:j + 2, k:K]), q[i:I, j + 2:j + 3, k:K])
+        yt__100_26_16__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = np.minimum(np.maximum(yt__100_26_16__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K], minq__100_26_16__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K]), maxq__100_26_16__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K])
+        yt_bl__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = yt__100_26_16__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K]
+        yt_br__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K] = (((np.float64(0.21428571428571427) * q[i:I, j + 1:j + 2, k:K]) + (np.float64(0.7857142857142857) * q[i:I, j + 2:j + 3, k:K])) - (np.float64(0.5714285714285714) * dm_right__da4_11_13__296_18_21_gen_0[i:I, j + 1:j + 2, k:K]))
+        yt_bl__da4_11_13__296_18_21_gen_0[i:I, j + 2:j + 3, k:K] = (((np.float64(0.21428571428571427) * q[i:I, j + 1:j + 2, k:K]) + (np.float64(0.7857142857142857) * q[i:I, j + 2:j + 3, k:K])) - (np.float64(0.5714285714285714) * dm__296_18_21_gen_3[i:I, j + 2:j + 3, k:K]))
+        yt_br__da4_11_13__296_18_21_gen_0[i:I, j + 2:j + 3, k:K] = al_ip1__da4_11_13__296_18_21_gen_0[i:I, j + 2:j + 3, k:K]
+        yt_bl__da4_11_13__296_18_21_gen_0[i:I, J - 3:J - 2, k:K] = al__296_18_21_gen_3[i:I, J - 3:J - 2, k:K]
+        yt_br__da4_11_13__296_18_21_gen_0[i:I, J - 3:J - 2, k:K] = (((np.float64(0.21428571428571427) * q[i:I, J - 2:J - 1, k:K]) + (np.float64(0.7857142857142857) * q[i:I, J - 3:J - 2, k:K])) + (np.float64(0.5714285714285714) * dm__296_18_21_gen_3[i:I, J - 3:J - 2, k:K]))
+        yt__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] = (np.float64(0.25) * (q[i:I, J - 2:J - 1, k:K] - q[i:I, J - 4:J - 3, k:K]))
+        dqr__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] = (np.maximum(np.maximum(q[i:I, J - 3:J - 2, k:K], q[i:I, J - 4:J - 3, k:K]), q[i:I, J - 2:J - 1, k:K]) - q[i:I, J - 3:J - 2, k:K])
+        dql__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] = (q[i:I, J - 3:J - 2, k:K] - np.minimum(np.minimum(q[i:I, J - 3:J - 2, k:K], q[i:I, J - 4:J - 3, k:K]), q[i:I, J - 2:J - 1, k:K]))
+        a__1c3_43_22__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] = np.minimum(np.minimum(np.abs(yt__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K]), dqr__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K]), dql__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K])
+        asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] = np.abs(a__1c3_43_22__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K])
+        mask_139629049196496_gen_0[i:I, J - 2:J - 1, k:K] = (yt__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] = np.where(mask_139629049196496_gen_0[i:I, J - 2:J - 1, k:K], asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K], asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K])
+        asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] = np.where((np.bitwise_not(mask_139629049196496_gen_0[i:I, J - 2:J - 1, k:K])), (-(asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K])), asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K])
+        dm_left_end__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] = asignb__1c3_43_22__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K]
+        yt_bl__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] = (((np.float64(0.21428571428571427) * q[i:I, J - 2:J - 1, k:K]) + (np.float64(0.7857142857142857) * q[i:I, J - 3:J - 2, k:K])) + (np.float64(0.5714285714285714) * dm_left_end__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K]))
+        yt__5dd_45_16__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] = (np.float64(0.5) * ((((((np.float64(2.0) * dya[i:I, J - 2:J - 1]) + dya[i:I, J - 3:J - 2]) * q[i:I, J - 2:J - 1, k:K]) - (dya[i:I, J - 2:J - 1] * q[i:I, J - 3:J - 2, k:K])) / (dya[i:I, J - 3:J - 2] + dya[i:I, J - 2:J - 1])) + (((((np.float64(2.0) * dya[i:I, J - 1:J]) + dya[i:I, J:J + 1]) * q[i:I, J - 1:J, k:K]) - (dya[i:I, J - 1:J] * q[i:I, J:J + 1, k:K])) / (dya[i:I, J - 1:J] + dya[i:I, J:J + 1]))))
+        minq__5dd_45_16__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] = np.minimum(np.minimum(np.minimum(q[i:I, J - 3:J - 2, k:K], q[i:I, J - 2:J - 1, k:K]), q[i:I, J - 1:J, k:K]), q[i:I, J:J + 1, k:K])
+        maxq__5dd_45_16__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] = np.maximum(np.maximum(np.maximum(q[i:I, J - 3:J - 2, k:K], q[i:I, J - 2:J - 1, k:K]), q[i:I, J - 1:J, k:K]), q[i:I, J:J + 1, k:K])
+        yt__5dd_45_16__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] = np.minimum(np.maximum(yt__5dd_45_16__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K], minq__5dd_45_16__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K]), maxq__5dd_45_16__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K])
+        yt_br__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K] = yt__5dd_45_16__da4_11_13__296_18_21_gen_0[i:I, J - 2:J - 1, k:K]
+        yt__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] = (np.float64(0.25) * (q[i:I, J + 1:J + 2, k:K] - q[i:I, J - 1:J, k:K]))
+        dqr__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] = (np.maximum(np.maximum(q[i:I, J:J + 1, k:K], q[i:I, J - 1:J, k:K]), q[i:I, J + 1:J + 2, k:K]) - q[i:I, J:J + 1, k:K])
+        dql__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] = (q[i:I, J:J + 1, k:K] - np.minimum(np.minimum(q[i:I, J:J + 1, k:K], q[i:I, J - 1:J, k:K]), q[i:I, J + 1:J + 2, k:K]))
+        a__1c3_53_23__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] = np.minimum(np.minimum(np.abs(yt__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K]), dqr__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K]), dql__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K])
+        asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] = np.abs(a__1c3_53_23__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K])
+        mask_139629047929104_gen_0[i:I, J - 1:J, k:K] = (yt__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] > np.float64(np.int64(0)))
+        asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] = np.where(mask_139629047929104_gen_0[i:I, J - 1:J, k:K], asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K], asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K])
+        asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] = np.where((np.bitwise_not(mask_139629047929104_gen_0[i:I, J - 1:J, k:K])), (-(asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K])), asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K])
+        dm_right_end__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] = asignb__1c3_53_23__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K]
+        yt__100_54_16__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] = (np.float64(0.5) * ((((((np.float64(2.0) * dya[i:I, J - 2:J - 1]) + dya[i:I, J - 3:J - 2]) * q[i:I, J - 2:J - 1, k:K]) - (dya[i:I, J - 2:J - 1] * q[i:I, J - 3:J - 2, k:K])) / (dya[i:I, J - 3:J - 2] + dya[i:I, J - 2:J - 1])) + (((((np.float64(2.0) * dya[i:I, J - 1:J]) + dya[i:I, J:J + 1]) * q[i:I, J - 1:J, k:K]) - (dya[i:I, J - 1:J] * q[i:I, J:J + 1, k:K])) / (dya[i:I, J - 1:J] + dya[i:I, J:J + 1]))))
+        minq__100_54_16__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] = np.minimum(np.minimum(np.minimum(q[i:I, J - 3:J - 2, k:K], q[i:I, J - 2:J - 1, k:K]), q[i:I, J - 1:J, k:K]), q[i:I, J:J + 1, k:K])
+        maxq__100_54_16__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] = np.maximum(np.maximum(np.maximum(q[i:I, J - 3:J - 2, k:K], q[i:I, J - 2:J - 1, k:K]), q[i:I, J - 1:J, k:K]), q[i:I, J:J + 1, k:K])
+        yt__100_54_16__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] = np.minimum(np.maximum(yt__100_54_16__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K], minq__100_54_16__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K]), maxq__100_54_16__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K])
+        yt_bl__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] = yt__100_54_16__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K]
+        yt_br__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K] = (((np.float64(0.7857142857142857) * (q[i:I, J:J + 1, k:K] - q[i:I, J - 1:J, k:K])) - (np.float64(0.5714285714285714) * dm_right_end__da4_11_13__296_18_21_gen_0[i:I, J - 1:J, k:K])) + q[i:I, J - 1:J, k:K])
+        bl__da4_11_13__296_18_21[i:I, j:j + 3, k:K] = (yt_bl__da4_11_13__296_18_21_gen_0[i:I, j:j + 3, k:K] - q[i:I, j:j + 3, k:K])
+        br__da4_11_13__296_18_21[i:I, j:j + 3, k:K] = (yt_br__da4_11_13__296_18_21_gen_0[i:I, j:j + 3, k:K] - q[i:I, j:j + 3, k:K])
+        bl__da4_11_13__296_18_21[i:I, J - 3:J, k:K] = (yt_bl__da4_11_13__296_18_21_gen_0[i:I, J - 3:J, k:K] - q[i:I, J - 3:J, k:K])
+        br__da4_11_13__296_18_21[i:I, J - 3:J, k:K] = (yt_br__da4_11_13__296_18_21_gen_0[i:I, J - 3:J, k:K] - q[i:I, J - 3:J, k:K])
+        bl__296_18_21_gen_1[i:I, j:J, k:K] = bl__da4_11_13__296_18_21[i:I, j:J, k:K]
+        br__296_18_21_gen_1[i:I, j:J, k:K] = br__da4_11_13__296_18_21[i:I, j:J, k:K]
+        al__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K] = bl__296_18_21_gen_1[i:I, j:j + 3, k:K]
+        ar__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K] = br__296_18_21_gen_1[i:I, j:j + 3, k:K]
+        mask_139629047890064_gen_0[i:I, j:j + 3, k:K] = ((al__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K] * ar__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K]) < np.float64(0.0))
+        da1__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K] = np.where(mask_139629047890064_gen_0[i:I, j:j + 3, k:K], (al__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K] - ar__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K]), da1__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K])
+        da2__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K] = np.where(mask_139629047890064_gen_0[i:I, j:j + 3, k:K], np.power(da1__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K], np.float64(np.int64(2))), da2__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K])
+        a6da__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K] = np.where(mask_139629047890064_gen_0[i:I, j:j + 3, k:K], ((np.float64(3.0) * (al__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K] + ar__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K])) * da1__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K]), a6da__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K])
+        mask_139629049199312_gen_0[i:I, j:j + 3, k:K] = (a6da__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K] < (-(da2__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K])))
+        ar__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K] = np.where(np.bitwise_and(mask_139629047890064_gen_0[i:I, j:j + 3, k:K], mask_139629049199312_gen_0[i:I, j:j + 3, k:K]), ((-(np.float64(2.0))) * al__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K]), ar__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K])
+        mask_139629254350160_gen_0[i:I, j:j + 3, k:K] = (a6da__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K] > da2__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K])
+        al__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629047890064_gen_0[i:I, j:j + 3, k:K], (np.bitwise_not(mask_139629049199312_gen_0[i:I, j:j + 3, k:K]))), mask_139629254350160_gen_0[i:I, j:j + 3, k:K]), ((-(np.float64(2.0))) * ar__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K]), al__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K])
+        al__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K] = np.where((np.bitwise_not(mask_139629047890064_gen_0[i:I, j:j + 3, k:K])), np.float64(0.0), al__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K])
+        ar__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K] = np.where((np.bitwise_not(mask_139629047890064_gen_0[i:I, j:j + 3, k:K])), np.float64(0.0), ar__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K])
+        bl__296_18_21_gen_1[i:I, j:j + 3, k:K] = al__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K]
+        br__296_18_21_gen_1[i:I, j:j + 3, k:K] = ar__4cc_16_17__296_18_21_gen_0[i:I, j:j + 3, k:K]
+        al__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K] = bl__296_18_21_gen_1[i:I, J - 3:J, k:K]
+        ar__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K] = br__296_18_21_gen_1[i:I, J - 3:J, k:K]
+        mask_139629047805264_gen_0[i:I, J - 3:J, k:K] = ((al__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K] * ar__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K]) < np.float64(0.0))
+        da1__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K] = np.where(mask_139629047805264_gen_0[i:I, J - 3:J, k:K], (al__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K] - ar__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K]), da1__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K])
+        da2__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K] = np.where(mask_139629047805264_gen_0[i:I, J - 3:J, k:K], np.power(da1__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K], np.float64(np.int64(2))), da2__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K])
+        a6da__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K] = np.where(mask_139629047805264_gen_0[i:I, J - 3:J, k:K], ((np.float64(3.0) * (al__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K] + ar__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K])) * da1__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K]), a6da__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K])
+        mask_139629049234256_gen_0[i:I, J - 3:J, k:K] = (a6da__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K] < (-(da2__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K])))
+        ar__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K] = np.where(np.bitwise_and(mask_139629047805264_gen_0[i:I, J - 3:J, k:K], mask_139629049234256_gen_0[i:I, J - 3:J, k:K]), ((-(np.float64(2.0))) * al__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K]), ar__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K])
+        mask_139629051170064_gen_0[i:I, J - 3:J, k:K] = (a6da__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K] > da2__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K])
+        al__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629047805264_gen_0[i:I, J - 3:J, k:K], (np.bitwise_not(mask_139629049234256_gen_0[i:I, J - 3:J, k:K]))), mask_139629051170064_gen_0[i:I, J - 3:J, k:K]), ((-(np.float64(2.0))) * ar__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K]), al__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K])
+        al__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K] = np.where((np.bitwise_not(mask_139629047805264_gen_0[i:I, J - 3:J, k:K])), np.float64(0.0), al__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K])
+        ar__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K] = np.where((np.bitwise_not(mask_139629047805264_gen_0[i:I, J - 3:J, k:K])), np.float64(0.0), ar__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K])
+        bl__296_18_21_gen_1[i:I, J - 3:J, k:K] = al__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K]
+        br__296_18_21_gen_1[i:I, J - 3:J, k:K] = ar__4cc_16_17__296_18_21_gen_0[i:I, J - 3:J, k:K]
+        bl[i:I, j:J, k:K] = bl__296_18_21_gen_1[i:I, j:J, k:K]
+        br[i:I, j:J, k:K] = br__296_18_21_gen_1[i:I, j:J, k:K]
+        b0__804_19_20[i:I, j:J, k:K] = (bl[i:I, j:J, k:K] + br[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629254737040_gen_0[i:I, j:J, k:K] = (courant[i:I, j:J, k:K] > np.float64(0.0))
+        ret__0ed_6_10__804_19_20_gen_0[i:I, j:J, k:K] = np.where(mask_139629254737040_gen_0[i:I, j:J, k:K], ((np.float64(1.0) - courant[i:I, j:J, k:K]) * (br[i:I, j - 1:J - 1, k:K] - (courant[i:I, j:J, k:K] * b0__804_19_20[i:I, j - 1:J - 1, k:K]))), ret__0ed_6_10__804_19_20_gen_0[i:I, j:J, k:K])
+        ret__0ed_6_10__804_19_20_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629254737040_gen_0[i:I, j:J, k:K])), ((np.float64(1.0) + courant[i:I, j:J, k:K]) * (bl[i:I, j:J, k:K] + (courant[i:I, j:J, k:K] * b0__804_19_20[i:I, j:J, k:K]))), ret__0ed_6_10__804_19_20_gen_0[i:I, j:J, k:K])
+        fx1__804_19_20_gen_0[i:I, j:J, k:K] = ret__0ed_6_10__804_19_20_gen_0[i:I, j:J, k:K]
+        mask__238_7_11__804_19_20_gen_0[i:I, j:J, k:K] = np.float64(1.0)
+        RETURN_VALUE__238_7_11__804_19_20_gen_0[i:I, j:J, k:K] = np.where((courant[i:I, j:J, k:K] > np.float64(0.0)), (q[i:I, j - 1:J - 1, k:K] + (fx1__804_19_20_gen_0[i:I, j:J, k:K] * mask__238_7_11__804_19_20_gen_0[i:I, j:J, k:K])), (q[i:I, j:J, k:K] + (fx1__804_19_20_gen_0[i:I, j:J, k:K] * mask__238_7_11__804_19_20_gen_0[i:I, j:J, k:K])))
+        yflux[i:I, j:J, k:K] = RETURN_VALUE__238_7_11__804_19_20_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
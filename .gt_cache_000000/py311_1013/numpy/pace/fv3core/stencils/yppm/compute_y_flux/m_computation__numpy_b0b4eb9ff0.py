@@ -0,0 +1,144 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, q, courant, dya, yflux, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    q = Field(q, _origin_['q'], (True, True, True))
+    courant = Field(courant, _origin_['courant'], (True, True, True))
+    dya = Field(dya, _origin_['dya'], (True, True, False))
+    yflux = Field(yflux, _origin_['yflux'], (True, True, True))
+    
+    al = Field.empty((_dI_ + 0, _dJ_ + 2, _dK_), np.float64, (0, 1, 0))
+    al__3be_15_17_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 2, _dK_), np.float64, (0, 1, 0))
+    b0__e56_16_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    b0__e56_16_20_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    br__e56_16_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    br__e56_16_20_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    smt5__f2d_7_21__e56_16_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    smt5__f2d_7_21__e56_16_20_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    bl__e56_16_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    bl__e56_16_20_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ret__0ed_8_10__e56_16_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__238_9_11__e56_16_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629047017040_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    advection_mask__e56_16_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    advection_mask__f2d_7_21__e56_16_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629045489808_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    fx1__e56_16_20_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 1, _dJ_ + 1
+
+        al__3be_15_17_gen_0[i:I, j:J, k:K] = ((np.float64(0.5833333333333334) * (q[i:I, j - 1:J - 1, k:K] + q[i:I, j:J, k:K])) + (np.float64(-0.08333333333333333) * (q[i:I, j - 2:J - 2, k:K] + q[i:I, j + 1:J + 1, k:K])))
+        al__3be_15_17_gen_0[i:I, j:j + 1, k:K] = (((np.float64(-0.14285714285714285) * q[i:I, j - 2:j - 1, k:K]) + (np.float64(0.7857142857142857) * q[i:I, j - 1:j, k:K])) + (np.float64(0.35714285714285715) * q[i:I, j:j + 1, k:K]))
+        al__3be_15_17_gen_0[i:I, J - 3:J - 2, k:K] = (((np.float64(-0.14285714285714285) * q[i:I, J - 5:J - 4, k:K]) + (np.float64(0.7857142857142857) * q[i:I, J - 4:J - 3, k:K])) + (np.float64(0.35714285714285715) * q[i:I, J - 3:J - 2, k:K]))
+        al__3be_15_17_gen_0[i:I, j + 1:j + 2, k:K] = (np.float64(0.5) * ((((((np.float64(2.0) * dya[i:I, j:j + 1]) + dya[i:I, j - 1:j]) * q[i:I, j:j + 1, k:K]) - (dya[i:I, j:j + 1] * q[i:I, j - 1:j, k:K])) / (dya[i:I, j - 1:j] + dya[i:I, j:j + 1])) + (((((np.float64(2.0) * dya[i:I, j + 1:j + 2]) + dya[i:I, j + 2:j + 3]) * q[i:I, j + 1:j + 2, k:K]) - (dya[i:I, j + 1:j + 2] * q[i:I, j + 2:j + 3, k:K])) / (dya[i:I, j + 1:j + 2] + dya[i:I, j + 2:j + 3]))))
+        al__3be_15_17_gen_0[i:I, J - 2:J - 1, k:K] = (np.float64(0.5) * ((((((np.float64(2.0) * dya[i:I, J - 3:J - 2]) + dya[i:I, J - 4:J - 3]) * q[i:I, J - 3:J - 2, k:K]) - (dya[i:I, J - 3:J - 2] * q[i:I, J - 4:J - 3, k:K])) / (dya[i:I, J - 4:J - 3] + dya[i:I, J - 3:J - 2])) + (((((np.float64(2.0) * dya[i:I, J - 2:J - 1]) + dya[i:I, J - 1:J]) * q[i:I, J - 2:J - 1, k:K]) - (dya[i:I, J - 2:J - 1] * q[i:I, J - 1:J, k:K])) / (dya[i:I, J - 2:J - 1] + dya[i:I, J - 1:J]))))
+        al__3be_15_17_gen_0[i:I, j + 2:j + 3, k:K] = (((np.float64(0.35714285714285715) * q[i:I, j + 1:j + 2, k:K]) + (np.float64(0.7857142857142857) * q[i:I, j + 2:j + 3, k:K])) + (np.float64(-0.14285714285714285) * q[i:I, j + 3:j + 4, k:K]))
+        al__3be_15_17_gen_0[i:I, J - 1:J, k:K] = (((np.float64(0.35714285714285715) * q[i:I, J - 2:J - 1, k:K]) + (np.float64(0.7857142857142857) * q[i:I, J - 1:J, k:K])) + (np.float64(-0.14285714285714285) * q[i:I, J:J + 1, k:K]))
+        al[i:I, j:J, k:K] = al__3be_15_17_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        bl__e56_16_20_gen_1[i:I, j:J, k:K] = (al[i:I, j - 1:J - 1, k:K] - q[i:I, j - 1:J - 1, k:K])
+        br__e56_16_20_gen_1[i:I, j:J, k:K] = (al[i:I, j:J, k:K] - q[i:I, j - 1:J - 1, k:K])
+        b0__e56_16_20_gen_1[i:I, j:J, k:K] = (bl__e56_16_20_gen_1[i:I, j:J, k:K] + br__e56_16_20_gen_1[i:I, j:J, k:K])
+        smt5__f2d_7_21__e56_16_20_gen_1[i:I, j:J, k:K] = ((np.float64(3.0) * np.abs(b0__e56_16_20_gen_1[i:I, j:J, k:K])) < np.abs((bl__e56_16_20_gen_1[i:I, j:J, k:K] - br__e56_16_20_gen_1[i:I, j:J, k:K])))
+        bl__e56_16_20_gen_0[i:I, j:J, k:K] = (al[i:I, j:J, k:K] - q[i:I, j:J, k:K])
+        br__e56_16_20_gen_0[i:I, j:J, k:K] = (al[i:I, j + 1:J + 1, k:K] - q[i:I, j:J, k:K])
+        b0__e56_16_20_gen_0[i:I, j:J, k:K] = (bl__e56_16_20_gen_0[i:I, j:J, k:K] + br__e56_16_20_gen_0[i:I, j:J, k:K])
+        smt5__f2d_7_21__e56_16_20_gen_0[i:I, j:J, k:K] = ((np.float64(3.0) * np.abs(b0__e56_16_20_gen_0[i:I, j:J, k:K])) < np.abs((bl__e56_16_20_gen_0[i:I, j:J, k:K] - br__e56_16_20_gen_0[i:I, j:J, k:K])))
+        mask_139629047017040_gen_0[i:I, j:J, k:K] = np.bitwise_or(smt5__f2d_7_21__e56_16_20_gen_1[i:I, j:J, k:K], smt5__f2d_7_21__e56_16_20_gen_0[i:I, j:J, k:K])
+        advection_mask__f2d_7_21__e56_16_20_gen_0[i:I, j:J, k:K] = np.where(mask_139629047017040_gen_0[i:I, j:J, k:K], np.float64(1.0), advection_mask__f2d_7_21__e56_16_20_gen_0[i:I, j:J, k:K])
+        advection_mask__f2d_7_21__e56_16_20_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629047017040_gen_0[i:I, j:J, k:K])), np.float64(0.0), advection_mask__f2d_7_21__e56_16_20_gen_0[i:I, j:J, k:K])
+        advection_mask__e56_16_20_gen_0[i:I, j:J, k:K] = advection_mask__f2d_7_21__e56_16_20_gen_0[i:I, j:J, k:K]
+        mask_139629045489808_gen_0[i:I, j:J, k:K] = (courant[i:I, j:J, k:K] > np.float64(0.0))
+        ret__0ed_8_10__e56_16_20_gen_0[i:I, j:J, k:K] = np.where(mask_139629045489808_gen_0[i:I, j:J, k:K], ((np.float64(1.0) - courant[i:I, j:J, k:K]) * (br__e56_16_20_gen_1[i:I, j:J, k:K] - (courant[i:I, j:J, k:K] * b0__e56_16_20_gen_1[i:I, j:J, k:K]))), ret__0ed_8_10__e56_16_20_gen_0[i:I, j:J, k:K])
+        ret__0ed_8_10__e56_16_20_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(mask_139629045489808_gen_0[i:I, j:J, k:K])), ((np.float64(1.0) + courant[i:I, j:J, k:K]) * (bl__e56_16_20_gen_0[i:I, j:J, k:K] + (courant[i:I, j:J, k:K] * b0__e56_16_20_gen_0[i:I, j:J, k:K]))), ret__0ed_8_10__e56_16_20_gen_0[i:I, j:J, k:K])
+        fx1__e56_16_20_gen_0[i:I, j:J, k:K] = ret__0ed_8_10__e56_16_20_gen_0[i:I, j:J, k:K]
+        RETURN_VALUE__238_9_11__e56_16_20_gen_0[i:I, j:J, k:K] = np.where((courant[i:I, j:J, k:K] > np.float64(0.0)), (q[i:I, j - 1:J - 1, k:K] + (fx1__e56_16_20_gen_0[i:I, j:J, k:K] * advection_mask__e56_16_20_gen_0[i:I, j:J, k:K])), (q[i:I, j:J, k:K] + (fx1__e56_16_20_gen_0[i:I, j:J, k:K] * advection_mask__e56_16_20_gen_0[i:I, j:J, k:K])))
+        yflux[i:I, j:J, k:K] = RETURN_VALUE__238_9_11__e56_16_20_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,361 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, land, area, h_var, rh_adj, rh_rain, graupel, ice, rain, snow, qa, qg, qi, ql, qn, qr, qs, qv, pt, delp, dz, qgz, qiz, qlz, qrz, qsz, qvz, tz, qi_dt, qs_dt, uin, vin, qa0, qg0, qi0, ql0, qr0, qs0, qv0, t0, dp0, den0, dz0, u0, v0, dp1, p1, m1, u1, v1, ccn, c_praut, c_air, c_vap, d0_vap, lv00, dt_in, rdt, cpaut, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    land = Field(land, _origin_['land'], (True, True, False))
+    area = Field(area, _origin_['area'], (True, True, False))
+    h_var = Field(h_var, _origin_['h_var'], (True, True, True))
+    rh_adj = Field(rh_adj, _origin_['rh_adj'], (True, True, True))
+    rh_rain = Field(rh_rain, _origin_['rh_rain'], (True, True, True))
+    graupel = Field(graupel, _origin_['graupel'], (True, True, True))
+    ice = Field(ice, _origin_['ice'], (True, True, True))
+    rain = Field(rain, _origin_['rain'], (True, True, True))
+    snow = Field(snow, _origin_['snow'], (True, True, True))
+    qa = Field(qa, _origin_['qa'], (True, True, True))
+    qg = Field(qg, _origin_['qg'], (True, True, True))
+    qi = Field(qi, _origin_['qi'], (True, True, True))
+    ql = Field(ql, _origin_['ql'], (True, True, True))
+    qn = Field(qn, _origin_['qn'], (True, True, True))
+    qr = Field(qr, _origin_['qr'], (True, True, True))
+    qs = Field(qs, _origin_['qs'], (True, True, True))
+    qv = Field(qv, _origin_['qv'], (True, True, True))
+    pt = Field(pt, _origin_['pt'], (True, True, True))
+    delp = Field(delp, _origin_['delp'], (True, True, True))
+    dz = Field(dz, _origin_['dz'], (True, True, True))
+    qgz = Field(qgz, _origin_['qgz'], (True, True, True))
+    qiz = Field(qiz, _origin_['qiz'], (True, True, True))
+    qlz = Field(qlz, _origin_['qlz'], (True, True, True))
+    qrz = Field(qrz, _origin_['qrz'], (True, True, True))
+    qsz = Field(qsz, _origin_['qsz'], (True, True, True))
+    qvz = Field(qvz, _origin_['qvz'], (True, True, True))
+    tz = Field(tz, _origin_['tz'], (True, True, True))
+    qi_dt = Field(qi_dt, _origin_['qi_dt'], (True, True, True))
+    qs_dt = Field(qs_dt, _origin_['qs_dt'], (True, True, True))
+    uin = Field(uin, _origin_['uin'], (True, True, True))
+    vin = Field(vin, _origin_['vin'], (True, True, True))
+    qa0 = Field(qa0, _origin_['qa0'], (True, True, True))
+    qg0 = Field(qg0, _origin_['qg0'], (True, True, True))
+    qi0 = Field(qi0, _origin_['qi0'], (True, True, True))
+    ql0 = Field(ql0, _origin_['ql0'], (True, True, True))
+    qr0 = Field(qr0, _origin_['qr0'], (True, True, True))
+    qs0 = Field(qs0, _origin_['qs0'], (True, True, True))
+    qv0 = Field(qv0, _origin_['qv0'], (True, True, True))
+    t0 = Field(t0, _origin_['t0'], (True, True, True))
+    dp0 = Field(dp0, _origin_['dp0'], (True, True, True))
+    den0 = Field(den0, _origin_['den0'], (True, True, True))
+    dz0 = Field(dz0, _origin_['dz0'], (True, True, True))
+    u0 = Field(u0, _origin_['u0'], (True, True, True))
+    v0 = Field(v0, _origin_['v0'], (True, True, True))
+    dp1 = Field(dp1, _origin_['dp1'], (True, True, True))
+    p1 = Field(p1, _origin_['p1'], (True, True, True))
+    m1 = Field(m1, _origin_['m1'], (True, True, True))
+    u1 = Field(u1, _origin_['u1'], (True, True, True))
+    v1 = Field(v1, _origin_['v1'], (True, True, True))
+    ccn = Field(ccn, _origin_['ccn'], (True, True, True))
+    c_praut = Field(c_praut, _origin_['c_praut'], (True, True, True))
+    
+    flag = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    dq = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dqi_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    omq_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qin_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qio_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629022455056_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    t_ocean_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629006963472_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629004753616_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628990053072_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    icpk_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629006388368_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    t_land_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628984450448_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    s_leng_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcpk_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629036155280_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629014814416_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629022149200_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629007382736_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629005175312_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628995503824_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        graupel[i:I, j:J, k:K] = np.float64(0.0)
+        rain[i:I, j:J, k:K] = np.float64(0.0)
+        snow[i:I, j:J, k:K] = np.float64(0.0)
+        ice[i:I, j:J, k:K] = np.float64(0.0)
+        qio_gen_0[i:I, j:J, k:K] = np.where(bool(bool(False)), (qi[i:I, j:J, k:K] - (dt_in * qi_dt[i:I, j:J, k:K])), qio_gen_0[i:I, j:J, k:K])
+        qin_gen_0[i:I, j:J, k:K] = np.where(bool(bool(False)), np.maximum(qio_gen_0[i:I, j:J, k:K], np.float64(0.0001)), qin_gen_0[i:I, j:J, k:K])
+        mask_139629022455056_gen_0[i:I, j:J, k:K] = (qi[i:I, j:J, k:K] > qin_gen_0[i:I, j:J, k:K])
+        qs[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(False)), mask_139629022455056_gen_0[i:I, j:J, k:K]), ((qs[i:I, j:J, k:K] + qi[i:I, j:J, k:K]) - qin_gen_0[i:I, j:J, k:K]), qs[i:I, j:J, k:K])
+        qi[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(False)), mask_139629022455056_gen_0[i:I, j:J, k:K]), qin_gen_0[i:I, j:J, k:K], qi[i:I, j:J, k:K])
+        dqi_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(False)), mask_139629022455056_gen_0[i:I, j:J, k:K]), ((qin_gen_0[i:I, j:J, k:K] - qio_gen_0[i:I, j:J, k:K]) * rdt), dqi_gen_0[i:I, j:J, k:K])
+        qs_dt[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(False)), mask_139629022455056_gen_0[i:I, j:J, k:K]), ((qs_dt[i:I, j:J, k:K] + qi_dt[i:I, j:J, k:K]) - dqi_gen_0[i:I, j:J, k:K]), qs_dt[i:I, j:J, k:K])
+        qi_dt[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(False)), mask_139629022455056_gen_0[i:I, j:J, k:K]), dqi_gen_0[i:I, j:J, k:K], qi_dt[i:I, j:J, k:K])
+        qiz[i:I, j:J, k:K] = qi[i:I, j:J, k:K]
+        qsz[i:I, j:J, k:K] = qs[i:I, j:J, k:K]
+        t0[i:I, j:J, k:K] = pt[i:I, j:J, k:K]
+        tz[i:I, j:J, k:K] = t0[i:I, j:J, k:K]
+        dp1[i:I, j:J, k:K] = delp[i:I, j:J, k:K]
+        dp0[i:I, j:J, k:K] = dp1[i:I, j:J, k:K]
+        qvz[i:I, j:J, k:K] = qv[i:I, j:J, k:K]
+        qlz[i:I, j:J, k:K] = ql[i:I, j:J, k:K]
+        qrz[i:I, j:J, k:K] = qr[i:I, j:J, k:K]
+        qgz[i:I, j:J, k:K] = qg[i:I, j:J, k:K]
+        dp1[i:I, j:J, k:K] = (dp1[i:I, j:J, k:K] * (np.float64(1.0) - qvz[i:I, j:J, k:K]))
+        omq_gen_0[i:I, j:J, k:K] = (dp0[i:I, j:J, k:K] / dp1[i:I, j:J, k:K])
+        qvz[i:I, j:J, k:K] = (qvz[i:I, j:J, k:K] * omq_gen_0[i:I, j:J, k:K])
+        qlz[i:I, j:J, k:K] = (qlz[i:I, j:J, k:K] * omq_gen_0[i:I, j:J, k:K])
+        qrz[i:I, j:J, k:K] = (qrz[i:I, j:J, k:K] * omq_gen_0[i:I, j:J, k:K])
+        qiz[i:I, j:J, k:K] = (qiz[i:I, j:J, k:K] * omq_gen_0[i:I, j:J, k:K])
+        qsz[i:I, j:J, k:K] = (qsz[i:I, j:J, k:K] * omq_gen_0[i:I, j:J, k:K])
+        qgz[i:I, j:J, k:K] = (qgz[i:I, j:J, k:K] * omq_gen_0[i:I, j:J, k:K])
+        qa0[i:I, j:J, k:K] = qa[i:I, j:J, k:K]
+        dz0[i:I, j:J, k:K] = dz[i:I, j:J, k:K]
+        den0[i:I, j:J, k:K] = ((-(dp1[i:I, j:J, k:K])) / (np.float64(9.80665) * dz0[i:I, j:J, k:K]))
+        p1[i:I, j:J, k:K] = ((den0[i:I, j:J, k:K] * np.float64(287.05)) * t0[i:I, j:J, k:K])
+        qv0[i:I, j:J, k:K] = qvz[i:I, j:J, k:K]
+        ql0[i:I, j:J, k:K] = qlz[i:I, j:J, k:K]
+        qr0[i:I, j:J, k:K] = qrz[i:I, j:J, k:K]
+        qi0[i:I, j:J, k:K] = qiz[i:I, j:J, k:K]
+        qs0[i:I, j:J, k:K] = qsz[i:I, j:J, k:K]
+        qg0[i:I, j:J, k:K] = qgz[i:I, j:J, k:K]
+        m1[i:I, j:J, k:K] = np.float64(0.0)
+        u0[i:I, j:J, k:K] = uin[i:I, j:J, k:K]
+        v0[i:I, j:J, k:K] = vin[i:I, j:J, k:K]
+        u1[i:I, j:J, k:K] = u0[i:I, j:J, k:K]
+        v1[i:I, j:J, k:K] = v0[i:I, j:J, k:K]
+        ccn[i:I, j:J, k:K] = np.where(bool(bool(False)), (qn[i:I, j:J, k:K] * np.float64(1000000.0)), ccn[i:I, j:J, k:K])
+        c_praut[i:I, j:J, k:K] = np.where(bool(bool(False)), (cpaut * np.power((ccn[i:I, j:J, k:K] * np.float64(1000.0)), ((-(np.float64(1.0))) / np.float64(3.0)))), c_praut[i:I, j:J, k:K])
+        ccn[i:I, j:J, k:K] = np.where((np.bitwise_not(bool(bool(False)))), (((np.float64(300.0) * land[i:I, j:J]) + (np.float64(100.0) * (np.float64(1.0) - land[i:I, j:J]))) * np.float64(1000000.0)), ccn[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            ccn[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and((np.bitwise_not(bool(bool(False)))), bool(bool(True))), (((ccn[i:I, j:J, k_:k_ + 1] * np.float64(287.05)) * tz[i:I, j:J, k_:k_ + 1]) / p1[i:I, j:J, k_:k_ + 1]), ccn[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            ccn[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and((np.bitwise_not(bool(bool(False)))), bool(bool(True))), ccn[i:I, j:J, k_ + 1:k_ + 2], ccn[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        c_praut[i:I, j:J, k:K] = np.where((np.bitwise_not(bool(bool(False)))), (cpaut * np.power((ccn[i:I, j:J, k:K] * np.float64(1000.0)), ((-(np.float64(1.0))) / np.float64(3.0)))), c_praut[i:I, j:J, k:K])
+        s_leng_gen_0[i:I, j:J, k:K] = np.sqrt(np.sqrt((area[i:I, j:J] * np.float64(1e-10))))
+        t_land_gen_0[i:I, j:J, k:K] = (np.float64(0.15) * s_leng_gen_0[i:I, j:J, k:K])
+        t_ocean_gen_0[i:I, j:J, k:K] = (np.float64(0.1) * s_leng_gen_0[i:I, j:J, k:K])
+        h_var[i:I, j:J, k:K] = ((t_land_gen_0[i:I, j:J, k:K] * land[i:I, j:J]) + (t_ocean_gen_0[i:I, j:J, k:K] * (np.float64(1.0) - land[i:I, j:J])))
+        h_var[i:I, j:J, k:K] = np.minimum(np.float64(0.2), np.maximum(np.float64(0.01), h_var[i:I, j:J, k:K]))
+        rh_adj[i:I, j:J, k:K] = ((np.float64(1.0) - h_var[i:I, j:J, k:K]) - np.float64(0.2))
+        rh_rain[i:I, j:J, k:K] = np.maximum(np.float64(0.35), (rh_adj[i:I, j:J, k:K] - np.float64(0.3)))
+        cvm_gen_0[i:I, j:J, k:K] = np.where(bool(bool(True)), (((c_air + (qvz[i:I, j:J, k:K] * c_vap)) + ((qrz[i:I, j:J, k:K] + qlz[i:I, j:J, k:K]) * np.float64(4185.5))) + (((qiz[i:I, j:J, k:K] + qsz[i:I, j:J, k:K]) + qgz[i:I, j:J, k:K]) * np.float64(1972.0))), cvm_gen_0[i:I, j:J, k:K])
+        lcpk_gen_0[i:I, j:J, k:K] = np.where(bool(bool(True)), ((lv00 + (d0_vap * tz[i:I, j:J, k:K])) / cvm_gen_0[i:I, j:J, k:K]), lcpk_gen_0[i:I, j:J, k:K])
+        icpk_gen_0[i:I, j:J, k:K] = np.where(bool(bool(True)), ((np.float64(-271059.66000000003) + (np.float64(2213.5) * tz[i:I, j:J, k:K])) / cvm_gen_0[i:I, j:J, k:K]), icpk_gen_0[i:I, j:J, k:K])
+        mask_139629006388368_gen_0[i:I, j:J, k:K] = (qiz[i:I, j:J, k:K] < np.float64(0.0))
+        qsz[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(True)), mask_139629006388368_gen_0[i:I, j:J, k:K]), (qsz[i:I, j:J, k:K] + qiz[i:I, j:J, k:K]), qsz[i:I, j:J, k:K])
+        qiz[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(True)), mask_139629006388368_gen_0[i:I, j:J, k:K]), np.float64(0.0), qiz[i:I, j:J, k:K])
+        mask_139628990053072_gen_0[i:I, j:J, k:K] = (qsz[i:I, j:J, k:K] < np.float64(0.0))
+        qgz[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(True)), mask_139628990053072_gen_0[i:I, j:J, k:K]), (qgz[i:I, j:J, k:K] + qsz[i:I, j:J, k:K]), qgz[i:I, j:J, k:K])
+        qsz[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(True)), mask_139628990053072_gen_0[i:I, j:J, k:K]), np.float64(0.0), qsz[i:I, j:J, k:K])
+        mask_139629006963472_gen_0[i:I, j:J, k:K] = (qgz[i:I, j:J, k:K] < np.float64(0.0))
+        qrz[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(True)), mask_139629006963472_gen_0[i:I, j:J, k:K]), (qrz[i:I, j:J, k:K] + qgz[i:I, j:J, k:K]), qrz[i:I, j:J, k:K])
+        tz[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(True)), mask_139629006963472_gen_0[i:I, j:J, k:K]), (tz[i:I, j:J, k:K] - (qgz[i:I, j:J, k:K] * icpk_gen_0[i:I, j:J, k:K])), tz[i:I, j:J, k:K])
+        qgz[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(True)), mask_139629006963472_gen_0[i:I, j:J, k:K]), np.float64(0.0), qgz[i:I, j:J, k:K])
+        mask_139629004753616_gen_0[i:I, j:J, k:K] = (qrz[i:I, j:J, k:K] < np.float64(0.0))
+        qlz[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(True)), mask_139629004753616_gen_0[i:I, j:J, k:K]), (qlz[i:I, j:J, k:K] + qrz[i:I, j:J, k:K]), qlz[i:I, j:J, k:K])
+        qrz[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(True)), mask_139629004753616_gen_0[i:I, j:J, k:K]), np.float64(0.0), qrz[i:I, j:J, k:K])
+        mask_139628984450448_gen_0[i:I, j:J, k:K] = (qlz[i:I, j:J, k:K] < np.float64(0.0))
+        qvz[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(True)), mask_139628984450448_gen_0[i:I, j:J, k:K]), (qvz[i:I, j:J, k:K] + qlz[i:I, j:J, k:K]), qvz[i:I, j:J, k:K])
+        tz[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(True)), mask_139628984450448_gen_0[i:I, j:J, k:K]), (tz[i:I, j:J, k:K] - (qlz[i:I, j:J, k:K] * lcpk_gen_0[i:I, j:J, k:K])), tz[i:I, j:J, k:K])
+        qlz[i:I, j:J, k:K] = np.where(np.bitwise_and(bool(bool(True)), mask_139628984450448_gen_0[i:I, j:J, k:K]), np.float64(0.0), qlz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629036155280_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and(bool(bool(True)), (qvz[i:I, j:J, k_ - 1:k_] < np.float64(0.0)))
+            qvz[i:I, j:J, k_:k_ + 1] = np.where(mask_139629036155280_gen_0[i:I, j:J, k_:k_ + 1], (qvz[i:I, j:J, k_:k_ + 1] + ((qvz[i:I, j:J, k_ - 1:k_] * dp1[i:I, j:J, k_ - 1:k_]) / dp1[i:I, j:J, k_:k_ + 1])), qvz[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629014814416_gen_0[i:I, j:J, k:K] = np.bitwise_and(bool(bool(True)), (qvz[i:I, j:J, k:K] < np.float64(0.0)))
+        qvz[i:I, j:J, k:K] = np.where(mask_139629014814416_gen_0[i:I, j:J, k:K], np.float64(0.0), qvz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 2, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        flag[i:I, j:J, k:K] = np.int64(0)
+        mask_139629022149200_gen_0[i:I, j:J, k:K] = np.bitwise_and(bool(bool(True)), np.bitwise_and((qvz[i:I, j:J, k + 1:K + 1] < np.float64(0.0)), (qvz[i:I, j:J, k:K] > np.float64(0.0))))
+        dq[i:I, j:J, k:K] = np.where(mask_139629022149200_gen_0[i:I, j:J, k:K], np.minimum(((-(qvz[i:I, j:J, k + 1:K + 1])) * dp1[i:I, j:J, k + 1:K + 1]), (qvz[i:I, j:J, k:K] * dp1[i:I, j:J, k:K])), dq[i:I, j:J, k:K])
+        flag[i:I, j:J, k:K] = np.where(mask_139629022149200_gen_0[i:I, j:J, k:K], np.int64(1), flag[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        flag[i:I, j:J, k:K] = np.int64(0)
+        mask_139629007382736_gen_0[i:I, j:J, k:K] = np.bitwise_and(bool(bool(True)), np.bitwise_and((qvz[i:I, j:J, k:K] < np.float64(0.0)), (qvz[i:I, j:J, k - 1:K - 1] > np.float64(0.0))))
+        dq[i:I, j:J, k:K] = np.where(mask_139629007382736_gen_0[i:I, j:J, k:K], np.minimum(((-(qvz[i:I, j:J, k:K])) * dp1[i:I, j:J, k:K]), (qvz[i:I, j:J, k - 1:K - 1] * dp1[i:I, j:J, k - 1:K - 1])), dq[i:I, j:J, k:K])
+        flag[i:I, j:J, k:K] = np.where(mask_139629007382736_gen_0[i:I, j:J, k:K], np.int64(1), flag[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 2, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629005175312_gen_0[i:I, j:J, k:K] = (flag[i:I, j:J, k:K] == np.int64(1))
+        qvz[i:I, j:J, k:K] = np.where(mask_139629005175312_gen_0[i:I, j:J, k:K], (qvz[i:I, j:J, k:K] - (dq[i:I, j:J, k:K] / dp1[i:I, j:J, k:K])), qvz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628995503824_gen_0[i:I, j:J, k:K] = (flag[i:I, j:J, k:K] == np.int64(1))
+        qvz[i:I, j:J, k:K] = np.where(mask_139628995503824_gen_0[i:I, j:J, k:K], (qvz[i:I, j:J, k:K] + (dq[i:I, j:J, k:K] / dp1[i:I, j:J, k:K])), qvz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,173 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, graupel, ice, rain, snow, qaz, qgz, qiz, qlz, qrz, qsz, qvz, tz, udt, vdt, qa_dt, qg_dt, qi_dt, ql_dt, qr_dt, qs_dt, qv_dt, pt_dt, qa0, qg0, qi0, ql0, qr0, qs0, qv0, t0, dp0, u0, v0, dp1, u1, v1, m1, ntimes, c_air, c_vap, rdt, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    graupel = Field(graupel, _origin_['graupel'], (True, True, True))
+    ice = Field(ice, _origin_['ice'], (True, True, True))
+    rain = Field(rain, _origin_['rain'], (True, True, True))
+    snow = Field(snow, _origin_['snow'], (True, True, True))
+    qaz = Field(qaz, _origin_['qaz'], (True, True, True))
+    qgz = Field(qgz, _origin_['qgz'], (True, True, True))
+    qiz = Field(qiz, _origin_['qiz'], (True, True, True))
+    qlz = Field(qlz, _origin_['qlz'], (True, True, True))
+    qrz = Field(qrz, _origin_['qrz'], (True, True, True))
+    qsz = Field(qsz, _origin_['qsz'], (True, True, True))
+    qvz = Field(qvz, _origin_['qvz'], (True, True, True))
+    tz = Field(tz, _origin_['tz'], (True, True, True))
+    udt = Field(udt, _origin_['udt'], (True, True, True))
+    vdt = Field(vdt, _origin_['vdt'], (True, True, True))
+    qa_dt = Field(qa_dt, _origin_['qa_dt'], (True, True, True))
+    qg_dt = Field(qg_dt, _origin_['qg_dt'], (True, True, True))
+    qi_dt = Field(qi_dt, _origin_['qi_dt'], (True, True, True))
+    ql_dt = Field(ql_dt, _origin_['ql_dt'], (True, True, True))
+    qr_dt = Field(qr_dt, _origin_['qr_dt'], (True, True, True))
+    qs_dt = Field(qs_dt, _origin_['qs_dt'], (True, True, True))
+    qv_dt = Field(qv_dt, _origin_['qv_dt'], (True, True, True))
+    pt_dt = Field(pt_dt, _origin_['pt_dt'], (True, True, True))
+    qa0 = Field(qa0, _origin_['qa0'], (True, True, True))
+    qg0 = Field(qg0, _origin_['qg0'], (True, True, True))
+    qi0 = Field(qi0, _origin_['qi0'], (True, True, True))
+    ql0 = Field(ql0, _origin_['ql0'], (True, True, True))
+    qr0 = Field(qr0, _origin_['qr0'], (True, True, True))
+    qs0 = Field(qs0, _origin_['qs0'], (True, True, True))
+    qv0 = Field(qv0, _origin_['qv0'], (True, True, True))
+    t0 = Field(t0, _origin_['t0'], (True, True, True))
+    dp0 = Field(dp0, _origin_['dp0'], (True, True, True))
+    u0 = Field(u0, _origin_['u0'], (True, True, True))
+    v0 = Field(v0, _origin_['v0'], (True, True, True))
+    dp1 = Field(dp1, _origin_['dp1'], (True, True, True))
+    u1 = Field(u1, _origin_['u1'], (True, True, True))
+    v1 = Field(v1, _origin_['v1'], (True, True, True))
+    m1 = Field(m1, _origin_['m1'], (True, True, True))
+    
+    cvm_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    omq_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    convt_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            u1[i:I, j:J, k_:k_ + 1] = np.where(bool(bool(True)), (((dp0[i:I, j:J, k_:k_ + 1] * u1[i:I, j:J, k_:k_ + 1]) + (m1[i:I, j:J, k_ - 1:k_] * u1[i:I, j:J, k_ - 1:k_])) / (dp0[i:I, j:J, k_:k_ + 1] + m1[i:I, j:J, k_ - 1:k_])), u1[i:I, j:J, k_:k_ + 1])
+            v1[i:I, j:J, k_:k_ + 1] = np.where(bool(bool(True)), (((dp0[i:I, j:J, k_:k_ + 1] * v1[i:I, j:J, k_:k_ + 1]) + (m1[i:I, j:J, k_ - 1:k_] * v1[i:I, j:J, k_ - 1:k_])) / (dp0[i:I, j:J, k_:k_ + 1] + m1[i:I, j:J, k_ - 1:k_])), v1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        udt[i:I, j:J, k:K] = np.where(bool(bool(True)), (udt[i:I, j:J, k:K] + ((u1[i:I, j:J, k:K] - u0[i:I, j:J, k:K]) * rdt)), udt[i:I, j:J, k:K])
+        vdt[i:I, j:J, k:K] = np.where(bool(bool(True)), (vdt[i:I, j:J, k:K] + ((v1[i:I, j:J, k:K] - v0[i:I, j:J, k:K]) * rdt)), vdt[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        omq_gen_0[i:I, j:J, k:K] = (dp1[i:I, j:J, k:K] / dp0[i:I, j:J, k:K])
+        qv_dt[i:I, j:J, k:K] = (qv_dt[i:I, j:J, k:K] + ((rdt * (qvz[i:I, j:J, k:K] - qv0[i:I, j:J, k:K])) * omq_gen_0[i:I, j:J, k:K]))
+        ql_dt[i:I, j:J, k:K] = (ql_dt[i:I, j:J, k:K] + ((rdt * (qlz[i:I, j:J, k:K] - ql0[i:I, j:J, k:K])) * omq_gen_0[i:I, j:J, k:K]))
+        qr_dt[i:I, j:J, k:K] = (qr_dt[i:I, j:J, k:K] + ((rdt * (qrz[i:I, j:J, k:K] - qr0[i:I, j:J, k:K])) * omq_gen_0[i:I, j:J, k:K]))
+        qi_dt[i:I, j:J, k:K] = (qi_dt[i:I, j:J, k:K] + ((rdt * (qiz[i:I, j:J, k:K] - qi0[i:I, j:J, k:K])) * omq_gen_0[i:I, j:J, k:K]))
+        qs_dt[i:I, j:J, k:K] = (qs_dt[i:I, j:J, k:K] + ((rdt * (qsz[i:I, j:J, k:K] - qs0[i:I, j:J, k:K])) * omq_gen_0[i:I, j:J, k:K]))
+        qg_dt[i:I, j:J, k:K] = (qg_dt[i:I, j:J, k:K] + ((rdt * (qgz[i:I, j:J, k:K] - qg0[i:I, j:J, k:K])) * omq_gen_0[i:I, j:J, k:K]))
+        cvm_gen_0[i:I, j:J, k:K] = (((c_air + (qvz[i:I, j:J, k:K] * c_vap)) + ((qrz[i:I, j:J, k:K] + qlz[i:I, j:J, k:K]) * np.float64(4185.5))) + (((qiz[i:I, j:J, k:K] + qsz[i:I, j:J, k:K]) + qgz[i:I, j:J, k:K]) * np.float64(1972.0)))
+        pt_dt[i:I, j:J, k:K] = (pt_dt[i:I, j:J, k:K] + (((rdt * (tz[i:I, j:J, k:K] - t0[i:I, j:J, k:K])) * cvm_gen_0[i:I, j:J, k:K]) / np.float64(1004.6)))
+        qa_dt[i:I, j:J, k:K] = np.where(bool(bool(True)), np.float64(0.0), qa_dt[i:I, j:J, k:K])
+        qa_dt[i:I, j:J, k:K] = np.where((np.bitwise_not(bool(bool(True)))), (qa_dt[i:I, j:J, k:K] + (rdt * ((qaz[i:I, j:J, k:K] / np.float64(ntimes)) - qa0[i:I, j:J, k:K]))), qa_dt[i:I, j:J, k:K])
+        convt_gen_0[i:I, j:J, k:K] = ((np.float64(86400.0) * rdt) * np.float64(0.10197162129779283))
+        rain[i:I, j:J, k:K] = (rain[i:I, j:J, k:K] * convt_gen_0[i:I, j:J, k:K])
+        snow[i:I, j:J, k:K] = (snow[i:I, j:J, k:K] * convt_gen_0[i:I, j:J, k:K])
+        ice[i:I, j:J, k:K] = (ice[i:I, j:J, k:K] * convt_gen_0[i:I, j:J, k:K])
+        graupel[i:I, j:J, k:K] = (graupel[i:I, j:J, k:K] * convt_gen_0[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
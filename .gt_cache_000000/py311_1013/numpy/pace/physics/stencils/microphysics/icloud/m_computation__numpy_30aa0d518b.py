@@ -0,0 +1,922 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, h_var, rh_adj, rh_rain, qaz, qgz, qiz, qlz, qrz, qsz, qvz, tz, den, denfac, p1, vtgz, vtrz, vtsz, c_air, c_vap, d0_vap, lv00, cracs, csacr, cgacr, cgacs, acco_00, acco_01, acco_02, acco_03, acco_10, acco_11, acco_12, acco_13, acco_20, acco_21, acco_22, acco_23, csacw, csaci, cgacw, cgaci, cssub_0, cssub_1, cssub_2, cssub_3, cssub_4, cgfr_0, cgfr_1, csmlt_0, csmlt_1, csmlt_2, csmlt_3, csmlt_4, cgmlt_0, cgmlt_1, cgmlt_2, cgmlt_3, cgmlt_4, ces0, dts, rdts, fac_i2s, fac_g2v, fac_v2g, fac_imlt, fac_l2v, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    h_var = Field(h_var, _origin_['h_var'], (True, True, True))
+    rh_adj = Field(rh_adj, _origin_['rh_adj'], (True, True, True))
+    rh_rain = Field(rh_rain, _origin_['rh_rain'], (True, True, True))
+    qaz = Field(qaz, _origin_['qaz'], (True, True, True))
+    qgz = Field(qgz, _origin_['qgz'], (True, True, True))
+    qiz = Field(qiz, _origin_['qiz'], (True, True, True))
+    qlz = Field(qlz, _origin_['qlz'], (True, True, True))
+    qrz = Field(qrz, _origin_['qrz'], (True, True, True))
+    qsz = Field(qsz, _origin_['qsz'], (True, True, True))
+    qvz = Field(qvz, _origin_['qvz'], (True, True, True))
+    tz = Field(tz, _origin_['tz'], (True, True, True))
+    den = Field(den, _origin_['den'], (True, True, True))
+    denfac = Field(denfac, _origin_['denfac'], (True, True, True))
+    p1 = Field(p1, _origin_['p1'], (True, True, True))
+    vtgz = Field(vtgz, _origin_['vtgz'], (True, True, True))
+    vtrz = Field(vtrz, _origin_['vtrz'], (True, True, True))
+    vtsz = Field(vtsz, _origin_['vtsz'], (True, True, True))
+    
+    q_liq = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_sol = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    di = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dq = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628989114448_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    t_wfr_tmp_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629002121168_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    diff__b8e_93_28_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icpk_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    factor_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    x__b8e_93_28_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dtmp_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__b8e_93_28_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sink_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    melt_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qi_crt_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__b8e_114_28_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__b8e_114_28_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628992835536_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628990416400_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dtmp__edf_199_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tz__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629011377168_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    q_minus__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    psmlt__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dqs0__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    psacr__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_cond__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_277_53__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pidep__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pgacw__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t1__bfb_115_28__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_plus__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qsm__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629015458960_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628983027408_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629009376080_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    diff__73d_357_36__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628987703312_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tmp__4f4_418_30__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629005103440_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629012305744_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__73d_146_32__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_81_42__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    y__73d_331_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qaz__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t1__bfb_343_33__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    evap__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    factor__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    factor__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp__4f4_95_27__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629009645392_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629009648336_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628983033680_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    cvm__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__f5d_128_20__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dtmp__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629012518288_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628989564304_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qsw__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629008587344_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    x__73d_392_35__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_392_35__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628999439632_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tmp__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp__d4a_355_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qgz__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icpk__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629018286608_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tmp__edf_199_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__73d_357_36__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tz__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628990234320_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tmp__d4a_107_29__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629017685008_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    sink__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_sol__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629009140816_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    t_wfr__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tin__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    s2__bfb_343_33__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629009018064_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    pssub__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    psacw__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tsq__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628989349456_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__bfb_171_24__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qsrho__f5d_128_20__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dq__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qrz__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_liq__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629004043856_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    s1__bfb_110_24__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628989959376_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    q_liq__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    s1__bfb_381_26__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    s2__bfb_381_26__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628987710928_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629002167824_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    x__73d_146_32__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pgsub__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    psaut__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tc__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t1__bfb_381_26__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qlz__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629002212368_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    s2__bfb_171_24__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629012319696_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628998968720_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__bfb_110_24__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    s2__bfb_115_28__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__73d_54_34__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qgz__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628990789456_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qlz__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628989566736_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    t1__bfb_295_34__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ta__86b_41_18__4f4_418_30__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629015465232_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qsi__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ta__86b_41_18__4f4_95_27__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pracs__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    x__73d_61_19__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tcp3__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__73d_236_49__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628989526288_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    pgmlt__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629018791312_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629009227024_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    rh__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    psaci__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dwsdt__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__73d_277_53__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628990463952_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629018575696_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629015155920_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qi_crt__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ta__86b_41_18__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628990114576_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628984509200_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    icpk__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628983741904_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qsz__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629012518672_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qstar__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp__4f4_408_32__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628988903632_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qden__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629002166992_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qiz__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ta__86b_41_18__4f4_408_32__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t_wfr_tmp__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_146_32__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    s1__bfb_295_34__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629009284560_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__73d_81_42__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    di__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__bfb_381_26__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629003432016_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qden__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qvz__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tc__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcpk__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628998481296_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    pgfr__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    s1__bfb_115_28__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__4f4_95_27__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp__edf_310_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qsz__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    x__73d_357_36__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qpz__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628987708432_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qiz__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pgaci__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_61_19__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    pgacr__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    s1__bfb_171_24__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qim__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    y__73d_236_49__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628990567440_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    s2__bfb_110_24__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629009798736_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dtmp__edf_261_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_plus__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629009566864_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qvz__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628985090960_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    t1__bfb_110_24__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dq__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628992899728_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629012313488_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629003894352_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    s2__bfb_295_34__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    rqi__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629002217360_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    ta__86b_41_18__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__bfb_295_34__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__73d_392_35__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_sol__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629008890320_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    diff__73d_236_49__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qrz__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    x__73d_81_42__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628981919760_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qaz__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628990565904_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    s1__bfb_343_33__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628989333776_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    sink__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dtmp__edf_310_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp__edf_261_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__73d_331_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_331_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628993019792_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dq0__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628990232784_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__bfb_343_33__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628998411216_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    y__73d_277_53__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629003731088_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tcpk__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629004036816_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tmp__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__73d_54_34__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629017750800_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dt_pisub__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dqsdt__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629010027472_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629002486544_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629017299856_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628991819152_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    lhl__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629010332944_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628998484432_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    t1__bfb_171_24__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    RETURN_VALUE__8ed_186_30__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    x__73d_54_34__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629009134096_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    ta__86b_41_18__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629003724944_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        lhi_gen_0[i:I, j:J, k:K] = (np.float64(-271059.66000000003) + (np.float64(2213.5) * tz[i:I, j:J, k:K]))
+        q_liq[i:I, j:J, k:K] = (qlz[i:I, j:J, k:K] + qrz[i:I, j:J, k:K])
+        q_sol[i:I, j:J, k:K] = ((qiz[i:I, j:J, k:K] + qsz[i:I, j:J, k:K]) + qgz[i:I, j:J, k:K])
+        cvm[i:I, j:J, k:K] = (((c_air + (qvz[i:I, j:J, k:K] * c_vap)) + (q_liq[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol[i:I, j:J, k:K] * np.float64(1972.0)))
+        icpk_gen_0[i:I, j:J, k:K] = (lhi_gen_0[i:I, j:J, k:K] / cvm[i:I, j:J, k:K])
+        t_wfr_tmp_gen_0[i:I, j:J, k:K] = np.float64(233.16000000000003)
+        mask_139629002121168_gen_0[i:I, j:J, k:K] = np.bitwise_and((tz[i:I, j:J, k:K] > np.float64(273.16)), (qiz[i:I, j:J, k:K] > np.float64(1e-12)))
+        melt_gen_0[i:I, j:J, k:K] = np.where(mask_139629002121168_gen_0[i:I, j:J, k:K], np.minimum(qiz[i:I, j:J, k:K], ((fac_imlt * (tz[i:I, j:J, k:K] - np.float64(273.16))) / icpk_gen_0[i:I, j:J, k:K])), melt_gen_0[i:I, j:J, k:K])
+        x__b8e_93_28_gen_0[i:I, j:J, k:K] = np.where(mask_139629002121168_gen_0[i:I, j:J, k:K], np.float64(0.002), x__b8e_93_28_gen_0[i:I, j:J, k:K])
+        diff__b8e_93_28_gen_0[i:I, j:J, k:K] = np.where(mask_139629002121168_gen_0[i:I, j:J, k:K], (x__b8e_93_28_gen_0[i:I, j:J, k:K] - qlz[i:I, j:J, k:K]), diff__b8e_93_28_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__b8e_93_28_gen_0[i:I, j:J, k:K] = np.where(mask_139629002121168_gen_0[i:I, j:J, k:K], np.where((diff__b8e_93_28_gen_0[i:I, j:J, k:K] > np.float64(0.0)), diff__b8e_93_28_gen_0[i:I, j:J, k:K], np.float64(0.0)), RETURN_VALUE__b8e_93_28_gen_0[i:I, j:J, k:K])
+        tmp_gen_0[i:I, j:J, k:K] = np.where(mask_139629002121168_gen_0[i:I, j:J, k:K], np.minimum(melt_gen_0[i:I, j:J, k:K], RETURN_VALUE__b8e_93_28_gen_0[i:I, j:J, k:K]), tmp_gen_0[i:I, j:J, k:K])
+        qlz[i:I, j:J, k:K] = np.where(mask_139629002121168_gen_0[i:I, j:J, k:K], (qlz[i:I, j:J, k:K] + tmp_gen_0[i:I, j:J, k:K]), qlz[i:I, j:J, k:K])
+        qrz[i:I, j:J, k:K] = np.where(mask_139629002121168_gen_0[i:I, j:J, k:K], ((qrz[i:I, j:J, k:K] + melt_gen_0[i:I, j:J, k:K]) - tmp_gen_0[i:I, j:J, k:K]), qrz[i:I, j:J, k:K])
+        qiz[i:I, j:J, k:K] = np.where(mask_139629002121168_gen_0[i:I, j:J, k:K], (qiz[i:I, j:J, k:K] - melt_gen_0[i:I, j:J, k:K]), qiz[i:I, j:J, k:K])
+        q_liq[i:I, j:J, k:K] = np.where(mask_139629002121168_gen_0[i:I, j:J, k:K], (q_liq[i:I, j:J, k:K] + melt_gen_0[i:I, j:J, k:K]), q_liq[i:I, j:J, k:K])
+        q_sol[i:I, j:J, k:K] = np.where(mask_139629002121168_gen_0[i:I, j:J, k:K], (q_sol[i:I, j:J, k:K] - melt_gen_0[i:I, j:J, k:K]), q_sol[i:I, j:J, k:K])
+        cvm[i:I, j:J, k:K] = np.where(mask_139629002121168_gen_0[i:I, j:J, k:K], (((c_air + (qvz[i:I, j:J, k:K] * c_vap)) + (q_liq[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol[i:I, j:J, k:K] * np.float64(1972.0))), cvm[i:I, j:J, k:K])
+        tz[i:I, j:J, k:K] = np.where(mask_139629002121168_gen_0[i:I, j:J, k:K], (tz[i:I, j:J, k:K] - ((melt_gen_0[i:I, j:J, k:K] * lhi_gen_0[i:I, j:J, k:K]) / cvm[i:I, j:J, k:K])), tz[i:I, j:J, k:K])
+        mask_139628989114448_gen_0[i:I, j:J, k:K] = np.bitwise_and((tz[i:I, j:J, k:K] < np.float64(233.16000000000003)), (qlz[i:I, j:J, k:K] > np.float64(1e-12)))
+        dtmp_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629002121168_gen_0[i:I, j:J, k:K])), mask_139628989114448_gen_0[i:I, j:J, k:K]), (t_wfr_tmp_gen_0[i:I, j:J, k:K] - tz[i:I, j:J, k:K]), dtmp_gen_0[i:I, j:J, k:K])
+        factor_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629002121168_gen_0[i:I, j:J, k:K])), mask_139628989114448_gen_0[i:I, j:J, k:K]), np.minimum(np.float64(1.0), (dtmp_gen_0[i:I, j:J, k:K] / np.float64(8.0))), factor_gen_0[i:I, j:J, k:K])
+        sink_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629002121168_gen_0[i:I, j:J, k:K])), mask_139628989114448_gen_0[i:I, j:J, k:K]), np.minimum((qlz[i:I, j:J, k:K] * factor_gen_0[i:I, j:J, k:K]), (dtmp_gen_0[i:I, j:J, k:K] / icpk_gen_0[i:I, j:J, k:K])), sink_gen_0[i:I, j:J, k:K])
+        qi_crt_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629002121168_gen_0[i:I, j:J, k:K])), mask_139628989114448_gen_0[i:I, j:J, k:K]), ((np.float64(1.82e-06) * np.minimum(np.float64(1.0), (np.float64(0.1) * (np.float64(273.16) - tz[i:I, j:J, k:K])))) / den[i:I, j:J, k:K]), qi_crt_gen_0[i:I, j:J, k:K])
+        diff__b8e_114_28_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629002121168_gen_0[i:I, j:J, k:K])), mask_139628989114448_gen_0[i:I, j:J, k:K]), (qi_crt_gen_0[i:I, j:J, k:K] - qiz[i:I, j:J, k:K]), diff__b8e_114_28_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__b8e_114_28_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629002121168_gen_0[i:I, j:J, k:K])), mask_139628989114448_gen_0[i:I, j:J, k:K]), np.where((diff__b8e_114_28_gen_0[i:I, j:J, k:K] > np.float64(0.0)), diff__b8e_114_28_gen_0[i:I, j:J, k:K], np.float64(0.0)), RETURN_VALUE__b8e_114_28_gen_0[i:I, j:J, k:K])
+        tmp_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629002121168_gen_0[i:I, j:J, k:K])), mask_139628989114448_gen_0[i:I, j:J, k:K]), np.minimum(sink_gen_0[i:I, j:J, k:K], RETURN_VALUE__b8e_114_28_gen_0[i:I, j:J, k:K]), tmp_gen_0[i:I, j:J, k:K])
+        qlz[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629002121168_gen_0[i:I, j:J, k:K])), mask_139628989114448_gen_0[i:I, j:J, k:K]), (qlz[i:I, j:J, k:K] - sink_gen_0[i:I, j:J, k:K]), qlz[i:I, j:J, k:K])
+        qsz[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629002121168_gen_0[i:I, j:J, k:K])), mask_139628989114448_gen_0[i:I, j:J, k:K]), ((qsz[i:I, j:J, k:K] + sink_gen_0[i:I, j:J, k:K]) - tmp_gen_0[i:I, j:J, k:K]), qsz[i:I, j:J, k:K])
+        qiz[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629002121168_gen_0[i:I, j:J, k:K])), mask_139628989114448_gen_0[i:I, j:J, k:K]), (qiz[i:I, j:J, k:K] + tmp_gen_0[i:I, j:J, k:K]), qiz[i:I, j:J, k:K])
+        q_liq[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629002121168_gen_0[i:I, j:J, k:K])), mask_139628989114448_gen_0[i:I, j:J, k:K]), (q_liq[i:I, j:J, k:K] - sink_gen_0[i:I, j:J, k:K]), q_liq[i:I, j:J, k:K])
+        q_sol[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629002121168_gen_0[i:I, j:J, k:K])), mask_139628989114448_gen_0[i:I, j:J, k:K]), (q_sol[i:I, j:J, k:K] + sink_gen_0[i:I, j:J, k:K]), q_sol[i:I, j:J, k:K])
+        cvm[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629002121168_gen_0[i:I, j:J, k:K])), mask_139628989114448_gen_0[i:I, j:J, k:K]), (((c_air + (qvz[i:I, j:J, k:K] * c_vap)) + (q_liq[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol[i:I, j:J, k:K] * np.float64(1972.0))), cvm[i:I, j:J, k:K])
+        tz[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629002121168_gen_0[i:I, j:J, k:K])), mask_139628989114448_gen_0[i:I, j:J, k:K]), (tz[i:I, j:J, k:K] + ((sink_gen_0[i:I, j:J, k:K] * lhi_gen_0[i:I, j:J, k:K]) / cvm[i:I, j:J, k:K])), tz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            di[i:I, j:J, k_:k_ + 1] = np.where(bool(bool(True)), np.float64(0.0), di[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            dq[i:I, j:J, k_:k_ + 1] = np.where(bool(bool(True)), (np.float64(0.5) * (qiz[i:I, j:J, k_:k_ + 1] - qiz[i:I, j:J, k_ - 1:k_])), dq[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        di[i:I, j:J, k:K] = np.where(bool(bool(True)), (np.float64(0.5) * np.minimum(np.abs((dq[i:I, j:J, k:K] + dq[i:I, j:J, k + 1:K + 1])), (np.float64(0.5) * qiz[i:I, j:J, k:K]))), di[i:I, j:J, k:K])
+        mask_139628990416400_gen_0[i:I, j:J, k:K] = ((dq[i:I, j:J, k:K] * dq[i:I, j:J, k + 1:K + 1]) <= np.float64(0.0))
+        mask_139628992835536_gen_0[i:I, j:J, k:K] = (dq[i:I, j:J, k:K] > np.float64(0.0))
+        di[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(bool(bool(True)), mask_139628990416400_gen_0[i:I, j:J, k:K]), mask_139628992835536_gen_0[i:I, j:J, k:K]), np.minimum(di[i:I, j:J, k:K], np.minimum(dq[i:I, j:J, k:K], (-(dq[i:I, j:J, k + 1:K + 1])))), di[i:I, j:J, k:K])
+        di[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(bool(bool(True)), mask_139628990416400_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628992835536_gen_0[i:I, j:J, k:K]))), np.float64(0.0), di[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        di[i:I, j:J, k:K] = np.where(bool(bool(True)), np.float64(0.0), di[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        di[i:I, j:J, k:K] = np.where(bool(bool(True)), np.maximum(di[i:I, j:J, k:K], np.maximum(np.float64(1e-20), (h_var[i:I, j:J, k:K] * qiz[i:I, j:J, k:K]))), di[i:I, j:J, k:K])
+        di[i:I, j:J, k:K] = np.where((np.bitwise_not(bool(bool(True)))), np.maximum(np.float64(1e-20), (h_var[i:I, j:J, k:K] * qiz[i:I, j:J, k:K])), di[i:I, j:J, k:K])
+        t_wfr__6d9_175_48_gen_0[i:I, j:J, k:K] = np.float64(233.16000000000003)
+        qaz__6d9_175_48_gen_0[i:I, j:J, k:K] = qaz[i:I, j:J, k:K]
+        qgz__6d9_175_48_gen_0[i:I, j:J, k:K] = qgz[i:I, j:J, k:K]
+        qiz__6d9_175_48_gen_0[i:I, j:J, k:K] = qiz[i:I, j:J, k:K]
+        qlz__6d9_175_48_gen_0[i:I, j:J, k:K] = qlz[i:I, j:J, k:K]
+        qrz__6d9_175_48_gen_0[i:I, j:J, k:K] = qrz[i:I, j:J, k:K]
+        qsz__6d9_175_48_gen_0[i:I, j:J, k:K] = qsz[i:I, j:J, k:K]
+        qvz__6d9_175_48_gen_0[i:I, j:J, k:K] = qvz[i:I, j:J, k:K]
+        tz__6d9_175_48_gen_0[i:I, j:J, k:K] = tz[i:I, j:J, k:K]
+        di__6d9_175_48_gen_0[i:I, j:J, k:K] = di[i:I, j:J, k:K]
+        q_liq__6d9_175_48_gen_0[i:I, j:J, k:K] = q_liq[i:I, j:J, k:K]
+        q_sol__6d9_175_48_gen_0[i:I, j:J, k:K] = q_sol[i:I, j:J, k:K]
+        cvm__6d9_175_48_gen_0[i:I, j:J, k:K] = cvm[i:I, j:J, k:K]
+        lhi__6d9_175_48_gen_0[i:I, j:J, k:K] = (np.float64(-271059.66000000003) + (np.float64(2213.5) * tz__6d9_175_48_gen_0[i:I, j:J, k:K]))
+        icpk__6d9_175_48_gen_0[i:I, j:J, k:K] = (lhi__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628989526288_gen_0[i:I, j:J, k:K] = (p1[i:I, j:J, k:K] >= np.float64(100.0))
+        pgacr__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(mask_139628989526288_gen_0[i:I, j:J, k:K], np.float64(0.0), pgacr__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgacw__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(mask_139628989526288_gen_0[i:I, j:J, k:K], np.float64(0.0), pgacw__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tc__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(mask_139628989526288_gen_0[i:I, j:J, k:K], (tz__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16)), tc__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628990232784_gen_0[i:I, j:J, k:K] = (tc__6d9_175_48_gen_0[i:I, j:J, k:K] >= np.float64(0.0))
+        dqs0__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), ((ces0 / p1[i:I, j:J, k:K]) - qvz__6d9_175_48_gen_0[i:I, j:J, k:K]), dqs0__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628990234320_gen_0[i:I, j:J, k:K] = (qsz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-12))
+        mask_139629002166992_gen_0[i:I, j:J, k:K] = (qlz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-08))
+        factor__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), mask_139629002166992_gen_0[i:I, j:J, k:K]), ((denfac[i:I, j:J, k:K] * csacw) * np.exp((np.float64(0.8125) * np.log((qsz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K]))))), factor__6d9_175_48_gen_0[i:I, j:J, k:K])
+        psacw__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), mask_139629002166992_gen_0[i:I, j:J, k:K]), ((factor__6d9_175_48_gen_0[i:I, j:J, k:K] / (np.float64(1.0) + (dts * factor__6d9_175_48_gen_0[i:I, j:J, k:K]))) * qlz__6d9_175_48_gen_0[i:I, j:J, k:K]), psacw__6d9_175_48_gen_0[i:I, j:J, k:K])
+        psacw__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629002166992_gen_0[i:I, j:J, k:K]))), np.float64(0.0), psacw__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629003894352_gen_0[i:I, j:J, k:K] = (qrz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-08))
+        t1__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), mask_139629003894352_gen_0[i:I, j:J, k:K]), np.sqrt((qrz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K])), t1__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K])
+        s1__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), mask_139629003894352_gen_0[i:I, j:J, k:K]), np.sqrt((qsz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K])), s1__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K])
+        s2__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), mask_139629003894352_gen_0[i:I, j:J, k:K]), np.sqrt(s1__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K]), s2__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), mask_139629003894352_gen_0[i:I, j:J, k:K]), ((((csacr * np.abs((vtsz[i:I, j:J, k:K] - vtrz[i:I, j:J, k:K]))) * qrz__6d9_175_48_gen_0[i:I, j:J, k:K]) * s2__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K]) * (((acco_01 * t1__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K]) + ((acco_11 * np.sqrt(t1__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K])) * s2__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K])) + (acco_21 * s1__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K])
+        psacr__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), mask_139629003894352_gen_0[i:I, j:J, k:K]), np.minimum(RETURN_VALUE__bfb_110_24__6d9_175_48_gen_0[i:I, j:J, k:K], (qrz__6d9_175_48_gen_0[i:I, j:J, k:K] * rdts)), psacr__6d9_175_48_gen_0[i:I, j:J, k:K])
+        t1__bfb_115_28__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), mask_139629003894352_gen_0[i:I, j:J, k:K]), np.sqrt((qsz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K])), t1__bfb_115_28__6d9_175_48_gen_0[i:I, j:J, k:K])
+        s1__bfb_115_28__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), mask_139629003894352_gen_0[i:I, j:J, k:K]), np.sqrt((qrz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K])), s1__bfb_115_28__6d9_175_48_gen_0[i:I, j:J, k:K])
+        s2__bfb_115_28__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), mask_139629003894352_gen_0[i:I, j:J, k:K]), np.sqrt(s1__bfb_115_28__6d9_175_48_gen_0[i:I, j:J, k:K]), s2__bfb_115_28__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pracs__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), mask_139629003894352_gen_0[i:I, j:J, k:K]), ((((cracs * np.abs((vtrz[i:I, j:J, k:K] - vtsz[i:I, j:J, k:K]))) * qsz__6d9_175_48_gen_0[i:I, j:J, k:K]) * s2__bfb_115_28__6d9_175_48_gen_0[i:I, j:J, k:K]) * (((acco_00 * t1__bfb_115_28__6d9_175_48_gen_0[i:I, j:J, k:K]) + ((acco_10 * np.sqrt(t1__bfb_115_28__6d9_175_48_gen_0[i:I, j:J, k:K])) * s2__bfb_115_28__6d9_175_48_gen_0[i:I, j:J, k:K])) + (acco_20 * s1__bfb_115_28__6d9_175_48_gen_0[i:I, j:J, k:K]))), pracs__6d9_175_48_gen_0[i:I, j:J, k:K])
+        psacr__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629003894352_gen_0[i:I, j:J, k:K]))), np.float64(0.0), psacr__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pracs__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629003894352_gen_0[i:I, j:J, k:K]))), np.float64(0.0), pracs__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qsrho__f5d_128_20__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), (qsz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K]), qsrho__f5d_128_20__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__f5d_128_20__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), (((((csmlt_0 * tc__6d9_175_48_gen_0[i:I, j:J, k:K]) / den[i:I, j:J, k:K]) - (csmlt_1 * dqs0__6d9_175_48_gen_0[i:I, j:J, k:K])) * ((csmlt_2 * np.sqrt(qsrho__f5d_128_20__6d9_175_48_gen_0[i:I, j:J, k:K])) + ((csmlt_3 * np.power(qsrho__f5d_128_20__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(0.65625))) * np.sqrt(denfac[i:I, j:J, k:K])))) + ((csmlt_4 * tc__6d9_175_48_gen_0[i:I, j:J, k:K]) * (psacw__6d9_175_48_gen_0[i:I, j:J, k:K] + psacr__6d9_175_48_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__f5d_128_20__6d9_175_48_gen_0[i:I, j:J, k:K])
+        psmlt__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), np.maximum(np.float64(0.0), RETURN_VALUE__f5d_128_20__6d9_175_48_gen_0[i:I, j:J, k:K]), psmlt__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), np.minimum(qsz__6d9_175_48_gen_0[i:I, j:J, k:K], np.minimum((dts * (psmlt__6d9_175_48_gen_0[i:I, j:J, k:K] + pracs__6d9_175_48_gen_0[i:I, j:J, k:K])), (tc__6d9_175_48_gen_0[i:I, j:J, k:K] / icpk__6d9_175_48_gen_0[i:I, j:J, k:K]))), sink__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qsz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), (qsz__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__6d9_175_48_gen_0[i:I, j:J, k:K]), qsz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        x__73d_146_32__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), np.float64(1e-06), x__73d_146_32__6d9_175_48_gen_0[i:I, j:J, k:K])
+        diff__73d_146_32__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), (x__73d_146_32__6d9_175_48_gen_0[i:I, j:J, k:K] - qlz__6d9_175_48_gen_0[i:I, j:J, k:K]), diff__73d_146_32__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__73d_146_32__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), np.where((diff__73d_146_32__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0)), diff__73d_146_32__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(0.0)), RETURN_VALUE__73d_146_32__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), np.minimum(sink__6d9_175_48_gen_0[i:I, j:J, k:K], RETURN_VALUE__73d_146_32__6d9_175_48_gen_0[i:I, j:J, k:K]), tmp__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qlz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), (qlz__6d9_175_48_gen_0[i:I, j:J, k:K] + tmp__6d9_175_48_gen_0[i:I, j:J, k:K]), qlz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qrz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), ((qrz__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__6d9_175_48_gen_0[i:I, j:J, k:K]) - tmp__6d9_175_48_gen_0[i:I, j:J, k:K]), qrz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_liq__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), (q_liq__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__6d9_175_48_gen_0[i:I, j:J, k:K]), q_liq__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_sol__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), (q_sol__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__6d9_175_48_gen_0[i:I, j:J, k:K]), q_sol__6d9_175_48_gen_0[i:I, j:J, k:K])
+        cvm__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), (((c_air + (qvz__6d9_175_48_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), (tz__6d9_175_48_gen_0[i:I, j:J, k:K] - ((sink__6d9_175_48_gen_0[i:I, j:J, k:K] * lhi__6d9_175_48_gen_0[i:I, j:J, k:K]) / cvm__6d9_175_48_gen_0[i:I, j:J, k:K])), tz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tc__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139628990234320_gen_0[i:I, j:J, k:K]), (tz__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16)), tc__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lhi__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), (np.float64(-271059.66000000003) + (np.float64(2213.5) * tz__6d9_175_48_gen_0[i:I, j:J, k:K])), lhi__6d9_175_48_gen_0[i:I, j:J, k:K])
+        icpk__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), (lhi__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__6d9_175_48_gen_0[i:I, j:J, k:K]), icpk__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629009566864_gen_0[i:I, j:J, k:K] = np.bitwise_and((qgz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-12)), (tc__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0)))
+        mask_139629010027472_gen_0[i:I, j:J, k:K] = (qrz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-08))
+        t1__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), mask_139629010027472_gen_0[i:I, j:J, k:K]), np.sqrt((qrz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K])), t1__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K])
+        s1__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), mask_139629010027472_gen_0[i:I, j:J, k:K]), np.sqrt((qgz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K])), s1__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K])
+        s2__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), mask_139629010027472_gen_0[i:I, j:J, k:K]), np.sqrt(s1__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K]), s2__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), mask_139629010027472_gen_0[i:I, j:J, k:K]), ((((cgacr * np.abs((vtgz[i:I, j:J, k:K] - vtrz[i:I, j:J, k:K]))) * qrz__6d9_175_48_gen_0[i:I, j:J, k:K]) * s2__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K]) * (((acco_02 * t1__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K]) + ((acco_12 * np.sqrt(t1__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K])) * s2__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K])) + (acco_22 * s1__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgacr__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), mask_139629010027472_gen_0[i:I, j:J, k:K]), np.minimum(RETURN_VALUE__bfb_171_24__6d9_175_48_gen_0[i:I, j:J, k:K], (rdts * qrz__6d9_175_48_gen_0[i:I, j:J, k:K])), pgacr__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qden__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), (qgz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K]), qden__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628989333776_gen_0[i:I, j:J, k:K] = (qlz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-08))
+        factor__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), mask_139628989333776_gen_0[i:I, j:J, k:K]), ((cgacw * qden__6d9_175_48_gen_0[i:I, j:J, k:K]) / np.sqrt((den[i:I, j:J, k:K] * np.sqrt(np.sqrt(qden__6d9_175_48_gen_0[i:I, j:J, k:K]))))), factor__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgacw__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), mask_139628989333776_gen_0[i:I, j:J, k:K]), ((factor__6d9_175_48_gen_0[i:I, j:J, k:K] / (np.float64(1.0) + (dts * factor__6d9_175_48_gen_0[i:I, j:J, k:K]))) * qlz__6d9_175_48_gen_0[i:I, j:J, k:K]), pgacw__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__8ed_186_30__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), (((((cgmlt_0 * tc__6d9_175_48_gen_0[i:I, j:J, k:K]) / den[i:I, j:J, k:K]) - (cgmlt_1 * dqs0__6d9_175_48_gen_0[i:I, j:J, k:K])) * ((cgmlt_2 * np.sqrt(qden__6d9_175_48_gen_0[i:I, j:J, k:K])) + ((cgmlt_3 * np.power(qden__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(0.6875))) / np.power(den[i:I, j:J, k:K], np.float64(0.25))))) + ((cgmlt_4 * tc__6d9_175_48_gen_0[i:I, j:J, k:K]) * (pgacw__6d9_175_48_gen_0[i:I, j:J, k:K] + pgacr__6d9_175_48_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__8ed_186_30__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgmlt__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), (dts * RETURN_VALUE__8ed_186_30__6d9_175_48_gen_0[i:I, j:J, k:K]), pgmlt__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgmlt__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), np.minimum(np.maximum(np.float64(0.0), pgmlt__6d9_175_48_gen_0[i:I, j:J, k:K]), np.minimum(qgz__6d9_175_48_gen_0[i:I, j:J, k:K], (tc__6d9_175_48_gen_0[i:I, j:J, k:K] / icpk__6d9_175_48_gen_0[i:I, j:J, k:K]))), pgmlt__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qgz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), (qgz__6d9_175_48_gen_0[i:I, j:J, k:K] - pgmlt__6d9_175_48_gen_0[i:I, j:J, k:K]), qgz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qrz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), (qrz__6d9_175_48_gen_0[i:I, j:J, k:K] + pgmlt__6d9_175_48_gen_0[i:I, j:J, k:K]), qrz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_liq__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), (q_liq__6d9_175_48_gen_0[i:I, j:J, k:K] + pgmlt__6d9_175_48_gen_0[i:I, j:J, k:K]), q_liq__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_sol__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), (q_sol__6d9_175_48_gen_0[i:I, j:J, k:K] - pgmlt__6d9_175_48_gen_0[i:I, j:J, k:K]), q_sol__6d9_175_48_gen_0[i:I, j:J, k:K])
+        cvm__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), (((c_air + (qvz__6d9_175_48_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], mask_139628990232784_gen_0[i:I, j:J, k:K]), mask_139629009566864_gen_0[i:I, j:J, k:K]), (tz__6d9_175_48_gen_0[i:I, j:J, k:K] - ((pgmlt__6d9_175_48_gen_0[i:I, j:J, k:K] * lhi__6d9_175_48_gen_0[i:I, j:J, k:K]) / cvm__6d9_175_48_gen_0[i:I, j:J, k:K])), tz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629011377168_gen_0[i:I, j:J, k:K] = (qiz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(3e-07))
+        mask_139629018286608_gen_0[i:I, j:J, k:K] = (qsz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-07))
+        factor__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), mask_139629018286608_gen_0[i:I, j:J, k:K]), (((dts * denfac[i:I, j:J, k:K]) * csaci) * np.exp(((np.float64(0.05) * tc__6d9_175_48_gen_0[i:I, j:J, k:K]) + (np.float64(0.8125) * np.log((qsz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K])))))), factor__6d9_175_48_gen_0[i:I, j:J, k:K])
+        psaci__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), mask_139629018286608_gen_0[i:I, j:J, k:K]), ((factor__6d9_175_48_gen_0[i:I, j:J, k:K] / (np.float64(1.0) + factor__6d9_175_48_gen_0[i:I, j:J, k:K])) * qiz__6d9_175_48_gen_0[i:I, j:J, k:K]), psaci__6d9_175_48_gen_0[i:I, j:J, k:K])
+        psaci__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629018286608_gen_0[i:I, j:J, k:K]))), np.float64(0.0), psaci__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qim__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), (np.float64(8e-05) / den[i:I, j:J, k:K]), qim__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), bool(bool(False))), fac_i2s, tmp__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(False))))), (fac_i2s * np.exp((np.float64(0.025) * tc__6d9_175_48_gen_0[i:I, j:J, k:K]))), tmp__6d9_175_48_gen_0[i:I, j:J, k:K])
+        di__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), np.maximum(di__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(1e-08)), di__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_plus__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), (qiz__6d9_175_48_gen_0[i:I, j:J, k:K] + di__6d9_175_48_gen_0[i:I, j:J, k:K]), q_plus__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628990463952_gen_0[i:I, j:J, k:K] = (q_plus__6d9_175_48_gen_0[i:I, j:J, k:K] > (qim__6d9_175_48_gen_0[i:I, j:J, k:K] + np.float64(1e-08)))
+        mask_139628998968720_gen_0[i:I, j:J, k:K] = (qim__6d9_175_48_gen_0[i:I, j:J, k:K] > (qiz__6d9_175_48_gen_0[i:I, j:J, k:K] - di__6d9_175_48_gen_0[i:I, j:J, k:K]))
+        dq__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), mask_139628990463952_gen_0[i:I, j:J, k:K]), mask_139628998968720_gen_0[i:I, j:J, k:K]), ((np.float64(0.25) * np.power((q_plus__6d9_175_48_gen_0[i:I, j:J, k:K] - qim__6d9_175_48_gen_0[i:I, j:J, k:K]), np.float64(np.int64(2)))) / di__6d9_175_48_gen_0[i:I, j:J, k:K]), dq__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dq__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), mask_139628990463952_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628998968720_gen_0[i:I, j:J, k:K]))), (qiz__6d9_175_48_gen_0[i:I, j:J, k:K] - qim__6d9_175_48_gen_0[i:I, j:J, k:K]), dq__6d9_175_48_gen_0[i:I, j:J, k:K])
+        psaut__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), mask_139628990463952_gen_0[i:I, j:J, k:K]), (tmp__6d9_175_48_gen_0[i:I, j:J, k:K] * dq__6d9_175_48_gen_0[i:I, j:J, k:K]), psaut__6d9_175_48_gen_0[i:I, j:J, k:K])
+        psaut__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628990463952_gen_0[i:I, j:J, k:K]))), np.float64(0.0), psaut__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), np.minimum((np.float64(0.75) * qiz__6d9_175_48_gen_0[i:I, j:J, k:K]), (psaci__6d9_175_48_gen_0[i:I, j:J, k:K] + psaut__6d9_175_48_gen_0[i:I, j:J, k:K])), sink__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qiz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), (qiz__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__6d9_175_48_gen_0[i:I, j:J, k:K]), qiz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qsz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), (qsz__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__6d9_175_48_gen_0[i:I, j:J, k:K]), qsz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629012518672_gen_0[i:I, j:J, k:K] = (qgz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-06))
+        factor__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), mask_139629012518672_gen_0[i:I, j:J, k:K]), (((dts * cgaci) * np.sqrt(den[i:I, j:J, k:K])) * qgz__6d9_175_48_gen_0[i:I, j:J, k:K]), factor__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgaci__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), mask_139629012518672_gen_0[i:I, j:J, k:K]), ((factor__6d9_175_48_gen_0[i:I, j:J, k:K] / (np.float64(1.0) + factor__6d9_175_48_gen_0[i:I, j:J, k:K])) * qiz__6d9_175_48_gen_0[i:I, j:J, k:K]), pgaci__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qiz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), mask_139629012518672_gen_0[i:I, j:J, k:K]), (qiz__6d9_175_48_gen_0[i:I, j:J, k:K] - pgaci__6d9_175_48_gen_0[i:I, j:J, k:K]), qiz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qgz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629011377168_gen_0[i:I, j:J, k:K]), mask_139629012518672_gen_0[i:I, j:J, k:K]), (qgz__6d9_175_48_gen_0[i:I, j:J, k:K] + pgaci__6d9_175_48_gen_0[i:I, j:J, k:K]), qgz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tc__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), (tz__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16)), tc__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628998411216_gen_0[i:I, j:J, k:K] = np.bitwise_and((qrz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-07)), (tc__6d9_175_48_gen_0[i:I, j:J, k:K] < np.float64(0.0)))
+        mask_139629005103440_gen_0[i:I, j:J, k:K] = (qsz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-07))
+        t1__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), mask_139629005103440_gen_0[i:I, j:J, k:K]), np.sqrt((qrz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K])), t1__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K])
+        s1__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), mask_139629005103440_gen_0[i:I, j:J, k:K]), np.sqrt((qsz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K])), s1__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K])
+        s2__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), mask_139629005103440_gen_0[i:I, j:J, k:K]), np.sqrt(s1__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K]), s2__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), mask_139629005103440_gen_0[i:I, j:J, k:K]), ((((csacr * np.abs((vtsz[i:I, j:J, k:K] - vtrz[i:I, j:J, k:K]))) * qrz__6d9_175_48_gen_0[i:I, j:J, k:K]) * s2__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K]) * (((acco_01 * t1__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K]) + ((acco_11 * np.sqrt(t1__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K])) * s2__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K])) + (acco_21 * s1__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K])
+        psacr__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), mask_139629005103440_gen_0[i:I, j:J, k:K]), (dts * RETURN_VALUE__bfb_295_34__6d9_175_48_gen_0[i:I, j:J, k:K]), psacr__6d9_175_48_gen_0[i:I, j:J, k:K])
+        psacr__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629005103440_gen_0[i:I, j:J, k:K]))), np.float64(0.0), psacr__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgfr__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), ((((dts * cgfr_0) / den[i:I, j:J, k:K]) * (np.exp(((-(cgfr_1)) * tc__6d9_175_48_gen_0[i:I, j:J, k:K])) - np.float64(1.0))) * np.exp((np.float64(1.75) * np.log((qrz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K]))))), pgfr__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), (psacr__6d9_175_48_gen_0[i:I, j:J, k:K] + pgfr__6d9_175_48_gen_0[i:I, j:J, k:K]), sink__6d9_175_48_gen_0[i:I, j:J, k:K])
+        factor__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), (np.minimum(sink__6d9_175_48_gen_0[i:I, j:J, k:K], np.minimum(qrz__6d9_175_48_gen_0[i:I, j:J, k:K], ((-(tc__6d9_175_48_gen_0[i:I, j:J, k:K])) / icpk__6d9_175_48_gen_0[i:I, j:J, k:K]))) / np.maximum(sink__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(1e-08))), factor__6d9_175_48_gen_0[i:I, j:J, k:K])
+        psacr__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), (factor__6d9_175_48_gen_0[i:I, j:J, k:K] * psacr__6d9_175_48_gen_0[i:I, j:J, k:K]), psacr__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgfr__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), (factor__6d9_175_48_gen_0[i:I, j:J, k:K] * pgfr__6d9_175_48_gen_0[i:I, j:J, k:K]), pgfr__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), (psacr__6d9_175_48_gen_0[i:I, j:J, k:K] + pgfr__6d9_175_48_gen_0[i:I, j:J, k:K]), sink__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qrz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), (qrz__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__6d9_175_48_gen_0[i:I, j:J, k:K]), qrz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qsz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), (qsz__6d9_175_48_gen_0[i:I, j:J, k:K] + psacr__6d9_175_48_gen_0[i:I, j:J, k:K]), qsz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qgz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), (qgz__6d9_175_48_gen_0[i:I, j:J, k:K] + pgfr__6d9_175_48_gen_0[i:I, j:J, k:K]), qgz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_liq__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), (q_liq__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__6d9_175_48_gen_0[i:I, j:J, k:K]), q_liq__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_sol__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), (q_sol__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__6d9_175_48_gen_0[i:I, j:J, k:K]), q_sol__6d9_175_48_gen_0[i:I, j:J, k:K])
+        cvm__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), (((c_air + (qvz__6d9_175_48_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628998411216_gen_0[i:I, j:J, k:K]), (tz__6d9_175_48_gen_0[i:I, j:J, k:K] + ((sink__6d9_175_48_gen_0[i:I, j:J, k:K] * lhi__6d9_175_48_gen_0[i:I, j:J, k:K]) / cvm__6d9_175_48_gen_0[i:I, j:J, k:K])), tz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lhi__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), (np.float64(-271059.66000000003) + (np.float64(2213.5) * tz__6d9_175_48_gen_0[i:I, j:J, k:K])), lhi__6d9_175_48_gen_0[i:I, j:J, k:K])
+        icpk__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), (lhi__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__6d9_175_48_gen_0[i:I, j:J, k:K]), icpk__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628985090960_gen_0[i:I, j:J, k:K] = (qsz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-07))
+        mask_139628990565904_gen_0[i:I, j:J, k:K] = (qgz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-08))
+        t1__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628985090960_gen_0[i:I, j:J, k:K]), mask_139628990565904_gen_0[i:I, j:J, k:K]), np.sqrt((qsz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K])), t1__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K])
+        s1__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628985090960_gen_0[i:I, j:J, k:K]), mask_139628990565904_gen_0[i:I, j:J, k:K]), np.sqrt((qgz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K])), s1__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K])
+        s2__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628985090960_gen_0[i:I, j:J, k:K]), mask_139628990565904_gen_0[i:I, j:J, k:K]), np.sqrt(s1__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K]), s2__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628985090960_gen_0[i:I, j:J, k:K]), mask_139628990565904_gen_0[i:I, j:J, k:K]), ((((cgacs * np.abs((vtgz[i:I, j:J, k:K] - vtsz[i:I, j:J, k:K]))) * qsz__6d9_175_48_gen_0[i:I, j:J, k:K]) * s2__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K]) * (((acco_03 * t1__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K]) + ((acco_13 * np.sqrt(t1__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K])) * s2__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K])) + (acco_23 * s1__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628985090960_gen_0[i:I, j:J, k:K]), mask_139628990565904_gen_0[i:I, j:J, k:K]), (dts * RETURN_VALUE__bfb_343_33__6d9_175_48_gen_0[i:I, j:J, k:K]), sink__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628985090960_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628990565904_gen_0[i:I, j:J, k:K]))), np.float64(0.0), sink__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qsm__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628985090960_gen_0[i:I, j:J, k:K]), (np.float64(0.003) / den[i:I, j:J, k:K]), qsm__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629004036816_gen_0[i:I, j:J, k:K] = (qsz__6d9_175_48_gen_0[i:I, j:J, k:K] > qsm__6d9_175_48_gen_0[i:I, j:J, k:K])
+        factor__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628985090960_gen_0[i:I, j:J, k:K]), mask_139629004036816_gen_0[i:I, j:J, k:K]), ((dts * np.float64(0.001)) * np.exp((np.float64(0.09) * (tz__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))))), factor__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628985090960_gen_0[i:I, j:J, k:K]), mask_139629004036816_gen_0[i:I, j:J, k:K]), (sink__6d9_175_48_gen_0[i:I, j:J, k:K] + ((factor__6d9_175_48_gen_0[i:I, j:J, k:K] / (np.float64(1.0) + factor__6d9_175_48_gen_0[i:I, j:J, k:K])) * (qsz__6d9_175_48_gen_0[i:I, j:J, k:K] - qsm__6d9_175_48_gen_0[i:I, j:J, k:K]))), sink__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628985090960_gen_0[i:I, j:J, k:K]), np.minimum(qsz__6d9_175_48_gen_0[i:I, j:J, k:K], sink__6d9_175_48_gen_0[i:I, j:J, k:K]), sink__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qsz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628985090960_gen_0[i:I, j:J, k:K]), (qsz__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__6d9_175_48_gen_0[i:I, j:J, k:K]), qsz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qgz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139628985090960_gen_0[i:I, j:J, k:K]), (qgz__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__6d9_175_48_gen_0[i:I, j:J, k:K]), qgz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629002486544_gen_0[i:I, j:J, k:K] = np.bitwise_and((qgz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-07)), (tz__6d9_175_48_gen_0[i:I, j:J, k:K] < np.float64(273.15000000000003)))
+        mask_139629012518288_gen_0[i:I, j:J, k:K] = (qlz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-06))
+        qden__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), mask_139629012518288_gen_0[i:I, j:J, k:K]), (qgz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K]), qden__6d9_175_48_gen_0[i:I, j:J, k:K])
+        factor__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), mask_139629012518288_gen_0[i:I, j:J, k:K]), (((dts * cgacw) * qden__6d9_175_48_gen_0[i:I, j:J, k:K]) / np.sqrt((den[i:I, j:J, k:K] * np.sqrt(np.sqrt(qden__6d9_175_48_gen_0[i:I, j:J, k:K]))))), factor__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgacw__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), mask_139629012518288_gen_0[i:I, j:J, k:K]), ((factor__6d9_175_48_gen_0[i:I, j:J, k:K] / (np.float64(1.0) + factor__6d9_175_48_gen_0[i:I, j:J, k:K])) * qlz__6d9_175_48_gen_0[i:I, j:J, k:K]), pgacw__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgacw__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629012518288_gen_0[i:I, j:J, k:K]))), np.float64(0.0), pgacw__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628988903632_gen_0[i:I, j:J, k:K] = (qrz__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-06))
+        t1__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), mask_139628988903632_gen_0[i:I, j:J, k:K]), np.sqrt((qrz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K])), t1__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K])
+        s1__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), mask_139628988903632_gen_0[i:I, j:J, k:K]), np.sqrt((qgz__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K])), s1__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K])
+        s2__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), mask_139628988903632_gen_0[i:I, j:J, k:K]), np.sqrt(s1__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K]), s2__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), mask_139628988903632_gen_0[i:I, j:J, k:K]), ((((cgacr * np.abs((vtgz[i:I, j:J, k:K] - vtrz[i:I, j:J, k:K]))) * qrz__6d9_175_48_gen_0[i:I, j:J, k:K]) * s2__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K]) * (((acco_02 * t1__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K]) + ((acco_12 * np.sqrt(t1__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K])) * s2__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K])) + (acco_22 * s1__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K]))), RETURN_VALUE__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgacr__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), mask_139628988903632_gen_0[i:I, j:J, k:K]), np.minimum((dts * RETURN_VALUE__bfb_381_26__6d9_175_48_gen_0[i:I, j:J, k:K]), qrz__6d9_175_48_gen_0[i:I, j:J, k:K]), pgacr__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgacr__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628988903632_gen_0[i:I, j:J, k:K]))), np.float64(0.0), pgacr__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (pgacr__6d9_175_48_gen_0[i:I, j:J, k:K] + pgacw__6d9_175_48_gen_0[i:I, j:J, k:K]), sink__6d9_175_48_gen_0[i:I, j:J, k:K])
+        x__73d_392_35__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), np.float64(273.16), x__73d_392_35__6d9_175_48_gen_0[i:I, j:J, k:K])
+        diff__73d_392_35__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (x__73d_392_35__6d9_175_48_gen_0[i:I, j:J, k:K] - tz__6d9_175_48_gen_0[i:I, j:J, k:K]), diff__73d_392_35__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__73d_392_35__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), np.where((diff__73d_392_35__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0)), diff__73d_392_35__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(0.0)), RETURN_VALUE__73d_392_35__6d9_175_48_gen_0[i:I, j:J, k:K])
+        factor__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (np.minimum(sink__6d9_175_48_gen_0[i:I, j:J, k:K], (RETURN_VALUE__73d_392_35__6d9_175_48_gen_0[i:I, j:J, k:K] / icpk__6d9_175_48_gen_0[i:I, j:J, k:K])) / np.maximum(sink__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(1e-08))), factor__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgacr__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (factor__6d9_175_48_gen_0[i:I, j:J, k:K] * pgacr__6d9_175_48_gen_0[i:I, j:J, k:K]), pgacr__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgacw__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (factor__6d9_175_48_gen_0[i:I, j:J, k:K] * pgacw__6d9_175_48_gen_0[i:I, j:J, k:K]), pgacw__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (pgacr__6d9_175_48_gen_0[i:I, j:J, k:K] + pgacw__6d9_175_48_gen_0[i:I, j:J, k:K]), sink__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qgz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (qgz__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__6d9_175_48_gen_0[i:I, j:J, k:K]), qgz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qrz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (qrz__6d9_175_48_gen_0[i:I, j:J, k:K] - pgacr__6d9_175_48_gen_0[i:I, j:J, k:K]), qrz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qlz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (qlz__6d9_175_48_gen_0[i:I, j:J, k:K] - pgacw__6d9_175_48_gen_0[i:I, j:J, k:K]), qlz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_liq__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (q_liq__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__6d9_175_48_gen_0[i:I, j:J, k:K]), q_liq__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_sol__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (q_sol__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__6d9_175_48_gen_0[i:I, j:J, k:K]), q_sol__6d9_175_48_gen_0[i:I, j:J, k:K])
+        cvm__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (((c_air + (qvz__6d9_175_48_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tz__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628989526288_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139628990232784_gen_0[i:I, j:J, k:K]))), mask_139629002486544_gen_0[i:I, j:J, k:K]), (tz__6d9_175_48_gen_0[i:I, j:J, k:K] + ((sink__6d9_175_48_gen_0[i:I, j:J, k:K] * lhi__6d9_175_48_gen_0[i:I, j:J, k:K]) / cvm__6d9_175_48_gen_0[i:I, j:J, k:K])), tz__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qaz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = qaz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qgz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = qgz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = qiz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = qlz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qrz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = qrz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qsz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = qsz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = qvz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = tz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = (lv00 + (d0_vap * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))
+        lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = (np.float64(-271059.66000000003) + (np.float64(2213.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))
+        q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = (qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + qrz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = ((qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + qsz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) + qgz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = (((c_air + (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(1972.0)))
+        lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = (lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = (lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = (lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        x__73d_54_34__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.float64(273.16)
+        diff__73d_54_34__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = (x__73d_54_34__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__73d_54_34__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where((diff__73d_54_34__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0)), diff__73d_54_34__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(0.0))
+        tcp3__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = (lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + (icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.minimum(np.float64(1.0), (RETURN_VALUE__73d_54_34__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / (np.float64(273.16) - t_wfr__6d9_175_48_gen_0[i:I, j:J, k:K])))))
+        mask_139629018575696_gen_0[i:I, j:J, k:K] = (p1[i:I, j:J, k:K] >= np.float64(100.0))
+        mask_139629009140816_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] < np.float64(178.0))
+        x__73d_61_19__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], mask_139629009140816_gen_0[i:I, j:J, k:K]), np.float64(1e-07), x__73d_61_19__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        diff__73d_61_19__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], mask_139629009140816_gen_0[i:I, j:J, k:K]), (x__73d_61_19__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), diff__73d_61_19__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], mask_139629009140816_gen_0[i:I, j:J, k:K]), np.where((diff__73d_61_19__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0)), diff__73d_61_19__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(0.0)), sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], mask_139629009140816_gen_0[i:I, j:J, k:K]), (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], mask_139629009140816_gen_0[i:I, j:J, k:K]), (qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], mask_139629009140816_gen_0[i:I, j:J, k:K]), (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], mask_139629009140816_gen_0[i:I, j:J, k:K]), (((c_air + (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], mask_139629009140816_gen_0[i:I, j:J, k:K]), (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + ((sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])) / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qaz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], mask_139629009140816_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (qaz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + np.float64(1.0)), qaz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), (lv00 + (d0_vap * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), (np.float64(-271059.66000000003) + (np.float64(2213.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), (lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), (lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), (lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        x__73d_81_42__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), np.float64(273.16), x__73d_81_42__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        diff__73d_81_42__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), (x__73d_81_42__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), diff__73d_81_42__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__73d_81_42__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), np.where((diff__73d_81_42__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0)), diff__73d_81_42__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(0.0)), RETURN_VALUE__73d_81_42__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tcp3__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), (lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + (icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.minimum(np.float64(1.0), (RETURN_VALUE__73d_81_42__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / (np.float64(273.16) - t_wfr__6d9_175_48_gen_0[i:I, j:J, k:K]))))), tcp3__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qpz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), ((qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) + qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qpz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - (((lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])) + (lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])) / (((c_air + (qpz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * c_vap)) + (qrz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + ((qsz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + qgz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * np.float64(1972.0))))), tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628990114576_gen_0[i:I, j:J, k:K] = (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > (np.float64(184.0) + np.float64(6.0)))
+        mask_139629018791312_gen_0[i:I, j:J, k:K] = (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] < np.float64(273.16))
+        mask_139629004043856_gen_0[i:I, j:J, k:K] = (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] >= np.float64(113.16000000000003))
+        tmp__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628990114576_gen_0[i:I, j:J, k:K]), mask_139629018791312_gen_0[i:I, j:J, k:K]), mask_139629004043856_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-126.0) * np.log((tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(2867998.16) * (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628990114576_gen_0[i:I, j:J, k:K]), mask_139629018791312_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629004043856_gen_0[i:I, j:J, k:K]))), ((np.float64(611.21) * np.exp((((np.float64(-126.0) * np.log((np.float64(1.0) - (np.float64(160.0) / np.float64(273.16))))) - ((np.float64(2867998.16) * np.float64(160.0)) / (np.float64(113.16000000000003) * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * np.float64(113.16000000000003)) * den[i:I, j:J, k:K])), tmp__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629015465232_gen_0[i:I, j:J, k:K] = (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] <= (np.float64(273.16) + np.float64(102.0)))
+        tmp__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628990114576_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629018791312_gen_0[i:I, j:J, k:K]))), mask_139629015465232_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        ta__86b_41_18__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628990114576_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629018791312_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139629015465232_gen_0[i:I, j:J, k:K]))), (np.float64(273.16) + np.float64(102.0)), ta__86b_41_18__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628990114576_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629018791312_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139629015465232_gen_0[i:I, j:J, k:K]))), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((ta__86b_41_18__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (ta__86b_41_18__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (ta__86b_41_18__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * ta__86b_41_18__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628990114576_gen_0[i:I, j:J, k:K]), tmp__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], RETURN_VALUE__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        rh__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628990114576_gen_0[i:I, j:J, k:K]), (qpz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / RETURN_VALUE__4f4_95_27__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), rh__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629015458960_gen_0[i:I, j:J, k:K] = (rh__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] < rh_adj[i:I, j:J, k:K])
+        tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628990114576_gen_0[i:I, j:J, k:K]), mask_139629015458960_gen_0[i:I, j:J, k:K]), tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628990114576_gen_0[i:I, j:J, k:K]), mask_139629015458960_gen_0[i:I, j:J, k:K]), qpz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628990114576_gen_0[i:I, j:J, k:K]), mask_139629015458960_gen_0[i:I, j:J, k:K]), np.float64(0.0), qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628990114576_gen_0[i:I, j:J, k:K]), mask_139629015458960_gen_0[i:I, j:J, k:K]), np.float64(0.0), qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628989349456_gen_0[i:I, j:J, k:K] = np.bitwise_or(np.bitwise_and((tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > (np.float64(184.0) + np.float64(6.0))), (rh__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] >= rh_adj[i:I, j:J, k:K])), (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] <= (np.float64(184.0) + np.float64(6.0))))
+        tmp__d4a_107_29__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__d4a_107_29__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qsw__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), tmp__d4a_107_29__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], qsw__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dwsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), ((tmp__d4a_107_29__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (np.float64(-2339.5) + (np.float64(3139057.8200000003) / tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))) / (np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), dwsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dq0__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (qsw__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), dq0__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629009645392_gen_0[i:I, j:J, k:K] = (dq0__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0))
+        factor__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009645392_gen_0[i:I, j:J, k:K]), np.minimum(np.float64(1.0), (fac_l2v * ((np.float64(10.0) * dq0__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) / qsw__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))), factor__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        evap__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009645392_gen_0[i:I, j:J, k:K]), np.minimum(qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], ((factor__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * dq0__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) / (np.float64(1.0) + (tcp3__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * dwsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])))), evap__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        evap__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629009645392_gen_0[i:I, j:J, k:K]))), (dq0__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / (np.float64(1.0) + (tcp3__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * dwsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))), evap__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + evap__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - evap__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - evap__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (((c_air + (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - ((evap__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.float64(-271059.66000000003) + (np.float64(2213.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dtmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (t_wfr__6d9_175_48_gen_0[i:I, j:J, k:K] - tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), dtmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629009284560_gen_0[i:I, j:J, k:K] = np.bitwise_and((dtmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0)), (qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-12)))
+        sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009284560_gen_0[i:I, j:J, k:K]), np.minimum(qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], np.minimum(((qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * dtmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * np.float64(0.125)), (dtmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))), sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009284560_gen_0[i:I, j:J, k:K]), (qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009284560_gen_0[i:I, j:J, k:K]), (qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009284560_gen_0[i:I, j:J, k:K]), (q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009284560_gen_0[i:I, j:J, k:K]), (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009284560_gen_0[i:I, j:J, k:K]), (((c_air + (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009284560_gen_0[i:I, j:J, k:K]), (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + ((sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.float64(-271059.66000000003) + (np.float64(2213.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dt_pisub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), bool(bool(True))), (np.float64(0.5) * dts), dt_pisub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dt_pisub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), dts, dt_pisub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tc__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (np.float64(273.16) - tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), tc__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629009134096_gen_0[i:I, j:J, k:K] = np.bitwise_and((qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-08)), (tc__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0)))
+        sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139629009134096_gen_0[i:I, j:J, k:K]), (((((np.float64(3.3333e-10) * dts) * (np.exp((np.float64(0.66) * tc__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])) - np.float64(1.0))) * den[i:I, j:J, k:K]) * qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139629009134096_gen_0[i:I, j:J, k:K]), np.minimum(qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], np.minimum((tc__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139629009134096_gen_0[i:I, j:J, k:K]), (qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139629009134096_gen_0[i:I, j:J, k:K]), (qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139629009134096_gen_0[i:I, j:J, k:K]), (q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139629009134096_gen_0[i:I, j:J, k:K]), (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139629009134096_gen_0[i:I, j:J, k:K]), (((c_air + (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139629009134096_gen_0[i:I, j:J, k:K]), (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + ((sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lv00 + (d0_vap * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.float64(-271059.66000000003) + (np.float64(2213.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629009648336_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] < np.float64(273.16))
+        mask_139629015155920_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] < np.float64(273.16))
+        mask_139629003724944_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] >= np.float64(113.16000000000003))
+        tmp__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), mask_139629015155920_gen_0[i:I, j:J, k:K]), mask_139629003724944_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-126.0) * np.log((tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(2867998.16) * (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), mask_139629015155920_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629003724944_gen_0[i:I, j:J, k:K]))), ((np.float64(611.21) * np.exp((((np.float64(-126.0) * np.log((np.float64(1.0) - (np.float64(160.0) / np.float64(273.16))))) - ((np.float64(2867998.16) * np.float64(160.0)) / (np.float64(113.16000000000003) * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * np.float64(113.16000000000003)) * den[i:I, j:J, k:K])), tmp__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629008587344_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] <= (np.float64(273.16) + np.float64(102.0)))
+        tmp__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629015155920_gen_0[i:I, j:J, k:K]))), mask_139629008587344_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        ta__86b_41_18__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629015155920_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139629008587344_gen_0[i:I, j:J, k:K]))), (np.float64(273.16) + np.float64(102.0)), ta__86b_41_18__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629015155920_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139629008587344_gen_0[i:I, j:J, k:K]))), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((ta__86b_41_18__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (ta__86b_41_18__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (ta__86b_41_18__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * ta__86b_41_18__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), tmp__4f4_4_10__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], tmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628998481296_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] < np.float64(273.16))
+        mask_139629003731088_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] >= np.float64(113.16000000000003))
+        dtmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), mask_139628998481296_gen_0[i:I, j:J, k:K]), mask_139629003731088_gen_0[i:I, j:J, k:K]), ((tmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (np.float64(-126.0) + (np.float64(2867998.16) / tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))) / (np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), dtmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dtmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), mask_139628998481296_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629003731088_gen_0[i:I, j:J, k:K]))), ((tmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (np.float64(-126.0) + (np.float64(2867998.16) / np.float64(113.16000000000003)))) / (np.float64(461.5) * np.float64(113.16000000000003))), dtmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628998484432_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] <= (np.float64(273.16) + np.float64(102.0)))
+        dtmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628998481296_gen_0[i:I, j:J, k:K]))), mask_139628998484432_gen_0[i:I, j:J, k:K]), ((tmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (np.float64(-2339.5) + (np.float64(3139057.8200000003) / tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))) / (np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), dtmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dtmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628998481296_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628998484432_gen_0[i:I, j:J, k:K]))), ((tmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (np.float64(-2339.5) + (np.float64(3139057.8200000003) / (np.float64(273.16) + np.float64(102.0))))) / (np.float64(461.5) * (np.float64(273.16) + np.float64(102.0)))), dtmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), tmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dqsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), dtmp__edf_199_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], dqsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / (np.float64(1.0) + (tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * dqsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))), sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628990789456_gen_0[i:I, j:J, k:K] = (qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-08))
+        pidep__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), mask_139628990789456_gen_0[i:I, j:J, k:K]), ((((dt_pisub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * np.float64(349138.78)) * np.exp((np.float64(0.875) * np.log((qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K]))))) / ((((qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K]) * np.float64(8029175616400.0)) / ((np.float64(0.0243) * np.float64(461.5)) * np.power(tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(np.int64(2))))) + np.float64(44247.8))), pidep__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pidep__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628990789456_gen_0[i:I, j:J, k:K]))), np.float64(0.0), pidep__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628981919760_gen_0[i:I, j:J, k:K] = (dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0))
+        tmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), mask_139628981919760_gen_0[i:I, j:J, k:K]), (np.float64(273.16) - tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), tmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qi_crt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), mask_139628981919760_gen_0[i:I, j:J, k:K]), ((np.float64(1.82e-06) * np.minimum(np.float64(1.0), (np.float64(0.1) * tmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))) / den[i:I, j:J, k:K]), qi_crt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), mask_139628981919760_gen_0[i:I, j:J, k:K]), np.minimum(sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], np.minimum(np.maximum((qi_crt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), pidep__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), (tmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))), sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        y__73d_236_49__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628981919760_gen_0[i:I, j:J, k:K]))), np.float64(184.0), y__73d_236_49__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        diff__73d_236_49__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628981919760_gen_0[i:I, j:J, k:K]))), (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - y__73d_236_49__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), diff__73d_236_49__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__73d_236_49__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628981919760_gen_0[i:I, j:J, k:K]))), np.where((diff__73d_236_49__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0)), diff__73d_236_49__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(0.0)), RETURN_VALUE__73d_236_49__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pidep__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628981919760_gen_0[i:I, j:J, k:K]))), (pidep__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.minimum(np.float64(1.0), (RETURN_VALUE__73d_236_49__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(0.2)))), pidep__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628981919760_gen_0[i:I, j:J, k:K]))), np.maximum(pidep__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], np.maximum(sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], (-(qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])))), sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (((c_air + (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629009648336_gen_0[i:I, j:J, k:K]), (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + ((sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])) / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lv00 + (d0_vap * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.float64(-271059.66000000003) + (np.float64(2213.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628987710928_gen_0[i:I, j:J, k:K] = (qsz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-08))
+        mask_139629003432016_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] < np.float64(273.16))
+        mask_139628983033680_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] >= np.float64(113.16000000000003))
+        tmp__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), mask_139629003432016_gen_0[i:I, j:J, k:K]), mask_139628983033680_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-126.0) * np.log((tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(2867998.16) * (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), mask_139629003432016_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628983033680_gen_0[i:I, j:J, k:K]))), ((np.float64(611.21) * np.exp((((np.float64(-126.0) * np.log((np.float64(1.0) - (np.float64(160.0) / np.float64(273.16))))) - ((np.float64(2867998.16) * np.float64(160.0)) / (np.float64(113.16000000000003) * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * np.float64(113.16000000000003)) * den[i:I, j:J, k:K])), tmp__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629012305744_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] <= (np.float64(273.16) + np.float64(102.0)))
+        tmp__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629003432016_gen_0[i:I, j:J, k:K]))), mask_139629012305744_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        ta__86b_41_18__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629003432016_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139629012305744_gen_0[i:I, j:J, k:K]))), (np.float64(273.16) + np.float64(102.0)), ta__86b_41_18__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629003432016_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139629012305744_gen_0[i:I, j:J, k:K]))), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((ta__86b_41_18__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (ta__86b_41_18__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (ta__86b_41_18__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * ta__86b_41_18__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), tmp__4f4_4_10__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], tmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629012319696_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] < np.float64(273.16))
+        mask_139629017685008_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] >= np.float64(113.16000000000003))
+        dtmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), mask_139629012319696_gen_0[i:I, j:J, k:K]), mask_139629017685008_gen_0[i:I, j:J, k:K]), ((tmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (np.float64(-126.0) + (np.float64(2867998.16) / tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))) / (np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), dtmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dtmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), mask_139629012319696_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629017685008_gen_0[i:I, j:J, k:K]))), ((tmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (np.float64(-126.0) + (np.float64(2867998.16) / np.float64(113.16000000000003)))) / (np.float64(461.5) * np.float64(113.16000000000003))), dtmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628987708432_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] <= (np.float64(273.16) + np.float64(102.0)))
+        dtmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629012319696_gen_0[i:I, j:J, k:K]))), mask_139628987708432_gen_0[i:I, j:J, k:K]), ((tmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (np.float64(-2339.5) + (np.float64(3139057.8200000003) / tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))) / (np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), dtmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dtmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629012319696_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628987708432_gen_0[i:I, j:J, k:K]))), ((tmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (np.float64(-2339.5) + (np.float64(3139057.8200000003) / (np.float64(273.16) + np.float64(102.0))))) / (np.float64(461.5) * (np.float64(273.16) + np.float64(102.0)))), dtmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), tmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dqsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), dtmp__edf_261_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], dqsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qden__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (qsz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K]), qden__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), np.exp((np.float64(0.65625) * np.log(qden__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))), tmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tsq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), tsq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), ((qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) / (np.float64(1.0) + (tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * dqsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))), dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (((cssub_0 * tsq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * ((cssub_1 * np.sqrt(qden__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])) + ((cssub_2 * tmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * np.sqrt(denfac[i:I, j:J, k:K])))) / ((cssub_3 * tsq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) + ((cssub_4 * qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K]))), pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (((qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * dts) * pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629012313488_gen_0[i:I, j:J, k:K] = (pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0))
+        y__73d_277_53__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), mask_139629012313488_gen_0[i:I, j:J, k:K]), np.float64(184.0), y__73d_277_53__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        diff__73d_277_53__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), mask_139629012313488_gen_0[i:I, j:J, k:K]), (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - y__73d_277_53__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), diff__73d_277_53__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__73d_277_53__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), mask_139629012313488_gen_0[i:I, j:J, k:K]), np.where((diff__73d_277_53__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0)), diff__73d_277_53__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(0.0)), RETURN_VALUE__73d_277_53__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), mask_139629012313488_gen_0[i:I, j:J, k:K]), np.minimum((pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.minimum(np.float64(1.0), (RETURN_VALUE__73d_277_53__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(0.2)))), qsz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628990567440_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(273.16))
+        pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629012313488_gen_0[i:I, j:J, k:K]))), mask_139628990567440_gen_0[i:I, j:J, k:K]), np.float64(0.0), pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629012313488_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628990567440_gen_0[i:I, j:J, k:K]))), np.maximum(pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], np.maximum(dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], ((tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16)) / tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))), pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qsz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (qsz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qsz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (((c_air + (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139628987710928_gen_0[i:I, j:J, k:K]), (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - ((pssub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])) / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lv00 + (d0_vap * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.float64(-271059.66000000003) + (np.float64(2213.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629002217360_gen_0[i:I, j:J, k:K] = (qgz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-08))
+        mask_139629002212368_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] < np.float64(273.16))
+        mask_139629010332944_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] >= np.float64(113.16000000000003))
+        tmp__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), mask_139629002212368_gen_0[i:I, j:J, k:K]), mask_139629010332944_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-126.0) * np.log((tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(2867998.16) * (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), mask_139629002212368_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629010332944_gen_0[i:I, j:J, k:K]))), ((np.float64(611.21) * np.exp((((np.float64(-126.0) * np.log((np.float64(1.0) - (np.float64(160.0) / np.float64(273.16))))) - ((np.float64(2867998.16) * np.float64(160.0)) / (np.float64(113.16000000000003) * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * np.float64(113.16000000000003)) * den[i:I, j:J, k:K])), tmp__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628992899728_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] <= (np.float64(273.16) + np.float64(102.0)))
+        tmp__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629002212368_gen_0[i:I, j:J, k:K]))), mask_139628992899728_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        ta__86b_41_18__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629002212368_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628992899728_gen_0[i:I, j:J, k:K]))), (np.float64(273.16) + np.float64(102.0)), ta__86b_41_18__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629002212368_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628992899728_gen_0[i:I, j:J, k:K]))), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((ta__86b_41_18__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (ta__86b_41_18__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (ta__86b_41_18__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * ta__86b_41_18__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), tmp__4f4_4_10__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], tmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628993019792_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] < np.float64(273.16))
+        mask_139629002167824_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] >= np.float64(113.16000000000003))
+        dtmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), mask_139628993019792_gen_0[i:I, j:J, k:K]), mask_139629002167824_gen_0[i:I, j:J, k:K]), ((tmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (np.float64(-126.0) + (np.float64(2867998.16) / tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))) / (np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), dtmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dtmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), mask_139628993019792_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629002167824_gen_0[i:I, j:J, k:K]))), ((tmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (np.float64(-126.0) + (np.float64(2867998.16) / np.float64(113.16000000000003)))) / (np.float64(461.5) * np.float64(113.16000000000003))), dtmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628983027408_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] <= (np.float64(273.16) + np.float64(102.0)))
+        dtmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628993019792_gen_0[i:I, j:J, k:K]))), mask_139628983027408_gen_0[i:I, j:J, k:K]), ((tmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (np.float64(-2339.5) + (np.float64(3139057.8200000003) / tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))) / (np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), dtmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dtmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628993019792_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628983027408_gen_0[i:I, j:J, k:K]))), ((tmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (np.float64(-2339.5) + (np.float64(3139057.8200000003) / (np.float64(273.16) + np.float64(102.0))))) / (np.float64(461.5) * (np.float64(273.16) + np.float64(102.0)))), dtmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), tmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dqsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), dtmp__edf_310_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], dqsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), ((qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) / (np.float64(1.0) + (tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * dqsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))), dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (((qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) - np.float64(1.0)) * qgz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629009376080_gen_0[i:I, j:J, k:K] = (pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0))
+        mask_139629009227024_gen_0[i:I, j:J, k:K] = (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(273.16))
+        pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), mask_139629009376080_gen_0[i:I, j:J, k:K]), mask_139629009227024_gen_0[i:I, j:J, k:K]), np.float64(0.0), pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), mask_139629009376080_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629009227024_gen_0[i:I, j:J, k:K]))), np.minimum(np.minimum((fac_v2g * pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), (np.float64(0.2) * dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), np.minimum((qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + qrz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), ((np.float64(273.16) - tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) / tcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))), pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        y__73d_331_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629009376080_gen_0[i:I, j:J, k:K]))), np.float64(184.0), y__73d_331_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        diff__73d_331_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629009376080_gen_0[i:I, j:J, k:K]))), (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - y__73d_331_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), diff__73d_331_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__73d_331_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629009376080_gen_0[i:I, j:J, k:K]))), np.where((diff__73d_331_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0)), diff__73d_331_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(0.0)), RETURN_VALUE__73d_331_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629009376080_gen_0[i:I, j:J, k:K]))), (np.maximum((fac_g2v * pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * np.minimum(np.float64(1.0), (RETURN_VALUE__73d_331_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(0.1)))), pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qgz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (qgz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qgz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (((c_air + (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629002217360_gen_0[i:I, j:J, k:K]), (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + ((pgsub__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + lhi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])) / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lv00 + (d0_vap * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629008890320_gen_0[i:I, j:J, k:K] = (qrz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-12))
+        tmp__d4a_355_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629008890320_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__d4a_355_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qsw__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629008890320_gen_0[i:I, j:J, k:K]), tmp__d4a_355_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], qsw__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        dqsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629008890320_gen_0[i:I, j:J, k:K]), ((tmp__d4a_355_33__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * (np.float64(-2339.5) + (np.float64(3139057.8200000003) / tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))) / (np.float64(461.5) * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), dqsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        x__73d_357_36__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629008890320_gen_0[i:I, j:J, k:K]), (rh_rain[i:I, j:J, k:K] * qsw__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), x__73d_357_36__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        diff__73d_357_36__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629008890320_gen_0[i:I, j:J, k:K]), (x__73d_357_36__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), diff__73d_357_36__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__73d_357_36__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629008890320_gen_0[i:I, j:J, k:K]), np.where((diff__73d_357_36__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(0.0)), diff__73d_357_36__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], np.float64(0.0)), RETURN_VALUE__73d_357_36__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629008890320_gen_0[i:I, j:J, k:K]), np.minimum(qrz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], (RETURN_VALUE__73d_357_36__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / (np.float64(1.0) + (lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * dqsdt__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])))), sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629008890320_gen_0[i:I, j:J, k:K]), (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qrz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629008890320_gen_0[i:I, j:J, k:K]), (qrz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qrz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629008890320_gen_0[i:I, j:J, k:K]), (q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629008890320_gen_0[i:I, j:J, k:K]), (((c_air + (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), mask_139629008890320_gen_0[i:I, j:J, k:K]), (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - ((sink__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lv00 + (d0_vap * tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (c_air + (((qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) + q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * c_vap)), cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (lhl__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / cvm__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), bool(bool(True))), (qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + qsz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (np.bitwise_not(bool(bool(True))))), qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), bool(bool(True))), (qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + qrz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (np.bitwise_not(bool(bool(True))))), qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_cond__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (q_liq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_cond__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qpz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + q_cond__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), qpz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - ((lcpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * q_cond__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) + (icpk__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))), tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        t_wfr_tmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), t_wfr__6d9_175_48_gen_0[i:I, j:J, k:K], t_wfr_tmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628987703312_gen_0[i:I, j:J, k:K] = (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] <= t_wfr__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628999439632_gen_0[i:I, j:J, k:K] = (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] < np.float64(273.16))
+        mask_139629017299856_gen_0[i:I, j:J, k:K] = (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] >= np.float64(113.16000000000003))
+        tmp__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139628987703312_gen_0[i:I, j:J, k:K]), mask_139628999439632_gen_0[i:I, j:J, k:K]), mask_139629017299856_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-126.0) * np.log((tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(2867998.16) * (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139628987703312_gen_0[i:I, j:J, k:K]), mask_139628999439632_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629017299856_gen_0[i:I, j:J, k:K]))), ((np.float64(611.21) * np.exp((((np.float64(-126.0) * np.log((np.float64(1.0) - (np.float64(160.0) / np.float64(273.16))))) - ((np.float64(2867998.16) * np.float64(160.0)) / (np.float64(113.16000000000003) * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * np.float64(113.16000000000003)) * den[i:I, j:J, k:K])), tmp__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629017750800_gen_0[i:I, j:J, k:K] = (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] <= (np.float64(273.16) + np.float64(102.0)))
+        tmp__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139628987703312_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628999439632_gen_0[i:I, j:J, k:K]))), mask_139629017750800_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        ta__86b_41_18__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139628987703312_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628999439632_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139629017750800_gen_0[i:I, j:J, k:K]))), (np.float64(273.16) + np.float64(102.0)), ta__86b_41_18__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139628987703312_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628999439632_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139629017750800_gen_0[i:I, j:J, k:K]))), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((ta__86b_41_18__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (ta__86b_41_18__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (ta__86b_41_18__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * ta__86b_41_18__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qstar__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139628987703312_gen_0[i:I, j:J, k:K]), tmp__4f4_408_32__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], qstar__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628983741904_gen_0[i:I, j:J, k:K] = (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] >= np.float64(273.16))
+        qstar__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (np.bitwise_not(mask_139628987703312_gen_0[i:I, j:J, k:K]))), mask_139628983741904_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), qstar__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628984509200_gen_0[i:I, j:J, k:K] = (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] < np.float64(273.16))
+        mask_139629009798736_gen_0[i:I, j:J, k:K] = (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] >= np.float64(113.16000000000003))
+        tmp__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (np.bitwise_not(mask_139628987703312_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628983741904_gen_0[i:I, j:J, k:K]))), mask_139628984509200_gen_0[i:I, j:J, k:K]), mask_139629009798736_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-126.0) * np.log((tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(2867998.16) * (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (np.bitwise_not(mask_139628987703312_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628983741904_gen_0[i:I, j:J, k:K]))), mask_139628984509200_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629009798736_gen_0[i:I, j:J, k:K]))), ((np.float64(611.21) * np.exp((((np.float64(-126.0) * np.log((np.float64(1.0) - (np.float64(160.0) / np.float64(273.16))))) - ((np.float64(2867998.16) * np.float64(160.0)) / (np.float64(113.16000000000003) * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * np.float64(113.16000000000003)) * den[i:I, j:J, k:K])), tmp__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628991819152_gen_0[i:I, j:J, k:K] = (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] <= (np.float64(273.16) + np.float64(102.0)))
+        tmp__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (np.bitwise_not(mask_139628987703312_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628983741904_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628984509200_gen_0[i:I, j:J, k:K]))), mask_139628991819152_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        ta__86b_41_18__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (np.bitwise_not(mask_139628987703312_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628983741904_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628984509200_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628991819152_gen_0[i:I, j:J, k:K]))), (np.float64(273.16) + np.float64(102.0)), ta__86b_41_18__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        tmp__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (np.bitwise_not(mask_139628987703312_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628983741904_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628984509200_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628991819152_gen_0[i:I, j:J, k:K]))), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((ta__86b_41_18__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (ta__86b_41_18__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (ta__86b_41_18__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * ta__86b_41_18__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (np.bitwise_not(mask_139628987703312_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628983741904_gen_0[i:I, j:J, k:K]))), tmp__4f4_418_30__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K], qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qsw__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (np.bitwise_not(mask_139628987703312_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628983741904_gen_0[i:I, j:J, k:K]))), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), qsw__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628989959376_gen_0[i:I, j:J, k:K] = (q_cond__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(3e-06))
+        rqi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (np.bitwise_not(mask_139628987703312_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628983741904_gen_0[i:I, j:J, k:K]))), mask_139628989959376_gen_0[i:I, j:J, k:K]), (q_sol__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] / q_cond__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), rqi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        rqi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (np.bitwise_not(mask_139628987703312_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628983741904_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628989959376_gen_0[i:I, j:J, k:K]))), ((np.float64(273.16) - tin__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) / (np.float64(273.16) - t_wfr_tmp__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), rqi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qstar__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), (np.bitwise_not(mask_139628987703312_gen_0[i:I, j:J, k:K]))), (np.bitwise_not(mask_139628983741904_gen_0[i:I, j:J, k:K]))), ((rqi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] * qsi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) + ((np.float64(1.0) - rqi__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) * qsw__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), qstar__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139629009018064_gen_0[i:I, j:J, k:K] = (qpz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(1e-08))
+        dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139629009018064_gen_0[i:I, j:J, k:K]), np.maximum(np.float64(1e-12), (h_var[i:I, j:J, k:K] * qpz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])), dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_plus__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139629009018064_gen_0[i:I, j:J, k:K]), (qpz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_plus__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        q_minus__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139629009018064_gen_0[i:I, j:J, k:K]), (qpz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), q_minus__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628989564304_gen_0[i:I, j:J, k:K] = (qstar__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] < q_minus__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qaz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139629009018064_gen_0[i:I, j:J, k:K]), mask_139628989564304_gen_0[i:I, j:J, k:K]), (qaz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + np.float64(1.0)), qaz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        mask_139628989566736_gen_0[i:I, j:J, k:K] = np.bitwise_and((qstar__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] < q_plus__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]), (q_cond__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] > np.float64(5e-08)))
+        qaz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629018575696_gen_0[i:I, j:J, k:K], (np.bitwise_not(mask_139629009140816_gen_0[i:I, j:J, k:K]))), mask_139628989349456_gen_0[i:I, j:J, k:K]), (np.bitwise_not(bool(bool(True))))), mask_139629009018064_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628989564304_gen_0[i:I, j:J, k:K]))), mask_139628989566736_gen_0[i:I, j:J, k:K]), (qaz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + ((q_plus__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] - qstar__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]) / (dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K] + dq__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]))), qaz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K])
+        qaz__6d9_175_48_gen_0[i:I, j:J, k:K] = qaz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qgz__6d9_175_48_gen_0[i:I, j:J, k:K] = qgz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qiz__6d9_175_48_gen_0[i:I, j:J, k:K] = qiz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qlz__6d9_175_48_gen_0[i:I, j:J, k:K] = qlz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qrz__6d9_175_48_gen_0[i:I, j:J, k:K] = qrz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qsz__6d9_175_48_gen_0[i:I, j:J, k:K] = qsz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qvz__6d9_175_48_gen_0[i:I, j:J, k:K] = qvz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]
+        tz__6d9_175_48_gen_0[i:I, j:J, k:K] = tz__b24_410_44__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qaz[i:I, j:J, k:K] = qaz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qgz[i:I, j:J, k:K] = qgz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qiz[i:I, j:J, k:K] = qiz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qlz[i:I, j:J, k:K] = qlz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qrz[i:I, j:J, k:K] = qrz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qsz[i:I, j:J, k:K] = qsz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        qvz[i:I, j:J, k:K] = qvz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        tz[i:I, j:J, k:K] = tz__6d9_175_48_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
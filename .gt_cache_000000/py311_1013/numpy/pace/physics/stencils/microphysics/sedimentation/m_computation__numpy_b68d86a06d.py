@@ -0,0 +1,1378 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, graupel, ice, rain, snow, qgz, qiz, qlz, qrz, qsz, qvz, tz, den, w, dz1, dp1, vtgz, vtsz, m1_sol, c_air, c_vap, log_10, zs, dts, fac_imlt, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    graupel = Field(graupel, _origin_['graupel'], (True, True, True))
+    ice = Field(ice, _origin_['ice'], (True, True, True))
+    rain = Field(rain, _origin_['rain'], (True, True, True))
+    snow = Field(snow, _origin_['snow'], (True, True, True))
+    qgz = Field(qgz, _origin_['qgz'], (True, True, True))
+    qiz = Field(qiz, _origin_['qiz'], (True, True, True))
+    qlz = Field(qlz, _origin_['qlz'], (True, True, True))
+    qrz = Field(qrz, _origin_['qrz'], (True, True, True))
+    qsz = Field(qsz, _origin_['qsz'], (True, True, True))
+    qvz = Field(qvz, _origin_['qvz'], (True, True, True))
+    tz = Field(tz, _origin_['tz'], (True, True, True))
+    den = Field(den, _origin_['den'], (True, True, True))
+    w = Field(w, _origin_['w'], (True, True, True))
+    dz1 = Field(dz1, _origin_['dz1'], (True, True, True))
+    dp1 = Field(dp1, _origin_['dp1'], (True, True, True))
+    vtgz = Field(vtgz, _origin_['vtgz'], (True, True, True))
+    vtsz = Field(vtsz, _origin_['vtsz'], (True, True, True))
+    m1_sol = Field(m1_sol, _origin_['m1_sol'], (True, True, True))
+    
+    vtiz = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dt5 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhi = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_liq = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_sol = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    icpk = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    stop_k = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    ze = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    zt = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    no_fall = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    i1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    zt_kbot1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dm = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dz = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dd = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qm = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    r1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    s1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    m1_tf = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    g1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dgz = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvn = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    rhof__e64_34_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vts__e64_34_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vtg__e64_34_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629026383184_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629015456400_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629032088464_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    vti__e64_34_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    vi0__e64_34_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tc__e64_34_27_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628977781904_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629030999696_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629017896272_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tc_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629000230672_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    RETURN_VALUE__b8e_87_32_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629019279312_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    x__b8e_87_32_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sink_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    diff__b8e_87_32_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629019273872_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629023827280_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629018615824_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629023303952_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629006693200_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629011670352_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628983948496_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629023725136_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629023226704_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629032330256_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628999475600_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629017332880_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628982046544_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629021806672_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629014453712_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628986560080_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628986553744_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628986792784_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629016732624_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628986786960_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629018269456_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628986782416_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628992578192_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629022541008_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629021253008_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629027940176_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628986783632_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629022538000_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629032333584_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629018085072_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629016838288_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628983482000_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628999765200_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628997146384_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628997436944_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628981974992_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629017128976_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628992590608_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628999767376_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629015871056_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628995496464_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629011181968_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628992818128_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629024904720_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629005197456_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629005208720_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629017905296_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629026723088_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628992578128_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628984898896_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629000014160_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629029530768_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628984905680_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629020290128_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628998539216_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629021083216_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629018844304_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629005202128_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629018842448_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628998979728_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629031074640_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629017101520_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628983135888_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629019004624_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628987482704_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629012204240_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628998533136_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629012196688_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628998981136_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628997140048_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629018512528_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629009923664_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628998536016_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tmp_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        rhof__e64_34_27_gen_0[i:I, j:J, k:K] = np.sqrt(np.minimum(np.float64(10.0), (np.float64(1.2) / den[i:I, j:J, k:K])))
+        vti__e64_34_27_gen_0[i:I, j:J, k:K] = np.where(bool(bool(False)), np.float64(1.0), vti__e64_34_27_gen_0[i:I, j:J, k:K])
+        vi0__e64_34_27_gen_0[i:I, j:J, k:K] = np.where((np.bitwise_not(bool(bool(False)))), (np.float64(0.01) * np.float64(1.0)), vi0__e64_34_27_gen_0[i:I, j:J, k:K])
+        mask_139629026383184_gen_0[i:I, j:J, k:K] = (qiz[i:I, j:J, k:K] < np.float64(1e-08))
+        vti__e64_34_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(bool(bool(False)))), mask_139629026383184_gen_0[i:I, j:J, k:K]), np.float64(1e-05), vti__e64_34_27_gen_0[i:I, j:J, k:K])
+        tc__e64_34_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(bool(bool(False)))), (np.bitwise_not(mask_139629026383184_gen_0[i:I, j:J, k:K]))), (tz[i:I, j:J, k:K] - np.float64(273.16)), tc__e64_34_27_gen_0[i:I, j:J, k:K])
+        vti__e64_34_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(bool(bool(False)))), (np.bitwise_not(mask_139629026383184_gen_0[i:I, j:J, k:K]))), ((((np.float64(3.0) + (np.log((qiz[i:I, j:J, k:K] * den[i:I, j:J, k:K])) / log_10)) * ((tc__e64_34_27_gen_0[i:I, j:J, k:K] * ((np.float64(-4.14122e-05) * tc__e64_34_27_gen_0[i:I, j:J, k:K]) + np.float64(-0.00538922))) + np.float64(-0.0516344))) + (np.float64(0.00216078) * tc__e64_34_27_gen_0[i:I, j:J, k:K])) + np.float64(1.9714)), vti__e64_34_27_gen_0[i:I, j:J, k:K])
+        vti__e64_34_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(bool(bool(False)))), (np.bitwise_not(mask_139629026383184_gen_0[i:I, j:J, k:K]))), ((vi0__e64_34_27_gen_0[i:I, j:J, k:K] * np.exp((log_10 * vti__e64_34_27_gen_0[i:I, j:J, k:K]))) * np.float64(0.8)), vti__e64_34_27_gen_0[i:I, j:J, k:K])
+        vti__e64_34_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(bool(bool(False)))), (np.bitwise_not(mask_139629026383184_gen_0[i:I, j:J, k:K]))), np.minimum(np.float64(1.0), np.maximum(np.float64(1e-05), vti__e64_34_27_gen_0[i:I, j:J, k:K])), vti__e64_34_27_gen_0[i:I, j:J, k:K])
+        vts__e64_34_27_gen_0[i:I, j:J, k:K] = np.where(bool(bool(False)), np.float64(1.0), vts__e64_34_27_gen_0[i:I, j:J, k:K])
+        mask_139629015456400_gen_0[i:I, j:J, k:K] = (qsz[i:I, j:J, k:K] < np.float64(1e-08))
+        vts__e64_34_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(bool(bool(False)))), mask_139629015456400_gen_0[i:I, j:J, k:K]), np.float64(1e-05), vts__e64_34_27_gen_0[i:I, j:J, k:K])
+        vts__e64_34_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(bool(bool(False)))), (np.bitwise_not(mask_139629015456400_gen_0[i:I, j:J, k:K]))), (((np.float64(1.0) * np.float64(6.6280504)) * rhof__e64_34_27_gen_0[i:I, j:J, k:K]) * np.exp((np.float64(0.0625) * np.log(((qsz[i:I, j:J, k:K] * den[i:I, j:J, k:K]) / np.float64(942477796.076938)))))), vts__e64_34_27_gen_0[i:I, j:J, k:K])
+        vts__e64_34_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(bool(bool(False)))), (np.bitwise_not(mask_139629015456400_gen_0[i:I, j:J, k:K]))), np.minimum(np.float64(2.0), np.maximum(np.float64(1e-05), vts__e64_34_27_gen_0[i:I, j:J, k:K])), vts__e64_34_27_gen_0[i:I, j:J, k:K])
+        vtg__e64_34_27_gen_0[i:I, j:J, k:K] = np.where(bool(bool(False)), np.float64(1.0), vtg__e64_34_27_gen_0[i:I, j:J, k:K])
+        mask_139629032088464_gen_0[i:I, j:J, k:K] = (qgz[i:I, j:J, k:K] < np.float64(1e-08))
+        vtg__e64_34_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(bool(bool(False)))), mask_139629032088464_gen_0[i:I, j:J, k:K]), np.float64(1e-05), vtg__e64_34_27_gen_0[i:I, j:J, k:K])
+        vtg__e64_34_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(bool(bool(False)))), (np.bitwise_not(mask_139629032088464_gen_0[i:I, j:J, k:K]))), (((np.float64(1.0) * np.float64(87.2382675)) * rhof__e64_34_27_gen_0[i:I, j:J, k:K]) * np.sqrt(np.sqrt(np.sqrt(((qgz[i:I, j:J, k:K] * den[i:I, j:J, k:K]) / np.float64(5026548245.74367)))))), vtg__e64_34_27_gen_0[i:I, j:J, k:K])
+        vtg__e64_34_27_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(bool(bool(False)))), (np.bitwise_not(mask_139629032088464_gen_0[i:I, j:J, k:K]))), np.minimum(np.float64(16.0), np.maximum(np.float64(1e-05), vtg__e64_34_27_gen_0[i:I, j:J, k:K])), vtg__e64_34_27_gen_0[i:I, j:J, k:K])
+        vtgz[i:I, j:J, k:K] = vtg__e64_34_27_gen_0[i:I, j:J, k:K]
+        vtiz[i:I, j:J, k:K] = vti__e64_34_27_gen_0[i:I, j:J, k:K]
+        vtsz[i:I, j:J, k:K] = vts__e64_34_27_gen_0[i:I, j:J, k:K]
+        dt5[i:I, j:J, k:K] = (np.float64(0.5) * dts)
+        m1_sol[i:I, j:J, k:K] = np.float64(0.0)
+        lhi[i:I, j:J, k:K] = (np.float64(-271059.66000000003) + (np.float64(2213.5) * tz[i:I, j:J, k:K]))
+        q_liq[i:I, j:J, k:K] = (qlz[i:I, j:J, k:K] + qrz[i:I, j:J, k:K])
+        q_sol[i:I, j:J, k:K] = ((qiz[i:I, j:J, k:K] + qsz[i:I, j:J, k:K]) + qgz[i:I, j:J, k:K])
+        cvm[i:I, j:J, k:K] = (((c_air + (qvz[i:I, j:J, k:K] * c_vap)) + (q_liq[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol[i:I, j:J, k:K] * np.float64(1972.0)))
+        icpk[i:I, j:J, k:K] = (lhi[i:I, j:J, k:K] / cvm[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628977781904_gen_0[i:I, j:J, k_:k_ + 1] = (tz[i:I, j:J, k_:k_ + 1] > np.float64(273.16))
+            stop_k[i:I, j:J, k_:k_ + 1] = np.where(mask_139628977781904_gen_0[i:I, j:J, k_:k_ + 1], np.int64(1), stop_k[i:I, j:J, k_:k_ + 1])
+            stop_k[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139628977781904_gen_0[i:I, j:J, k_:k_ + 1])), np.int64(0), stop_k[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629017896272_gen_0[i:I, j:J, k_:k_ + 1] = (stop_k[i:I, j:J, k_ - 1:k_] == np.int64(0))
+            mask_139629030999696_gen_0[i:I, j:J, k_:k_ + 1] = (tz[i:I, j:J, k_:k_ + 1] > np.float64(273.16))
+            stop_k[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629017896272_gen_0[i:I, j:J, k_:k_ + 1], mask_139629030999696_gen_0[i:I, j:J, k_:k_ + 1]), np.int64(1), stop_k[i:I, j:J, k_:k_ + 1])
+            stop_k[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629017896272_gen_0[i:I, j:J, k_:k_ + 1], (np.bitwise_not(mask_139629030999696_gen_0[i:I, j:J, k_:k_ + 1]))), np.int64(0), stop_k[i:I, j:J, k_:k_ + 1])
+            stop_k[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629017896272_gen_0[i:I, j:J, k_:k_ + 1])), np.int64(1), stop_k[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            stop_k[i:I, j:J, k_:k_ + 1] = np.int64(1)
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629019279312_gen_0[i:I, j:J, k:K] = (stop_k[i:I, j:J, k:K] == np.int64(1))
+        tc_gen_0[i:I, j:J, k:K] = np.where(mask_139629019279312_gen_0[i:I, j:J, k:K], (tz[i:I, j:J, k:K] - np.float64(273.16)), tc_gen_0[i:I, j:J, k:K])
+        mask_139629000230672_gen_0[i:I, j:J, k:K] = np.bitwise_and((qiz[i:I, j:J, k:K] > np.float64(1e-12)), (tc_gen_0[i:I, j:J, k:K] > np.float64(0.0)))
+        sink_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629019279312_gen_0[i:I, j:J, k:K], mask_139629000230672_gen_0[i:I, j:J, k:K]), np.minimum(qiz[i:I, j:J, k:K], ((fac_imlt * tc_gen_0[i:I, j:J, k:K]) / icpk[i:I, j:J, k:K])), sink_gen_0[i:I, j:J, k:K])
+        x__b8e_87_32_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629019279312_gen_0[i:I, j:J, k:K], mask_139629000230672_gen_0[i:I, j:J, k:K]), np.float64(0.002), x__b8e_87_32_gen_0[i:I, j:J, k:K])
+        diff__b8e_87_32_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629019279312_gen_0[i:I, j:J, k:K], mask_139629000230672_gen_0[i:I, j:J, k:K]), (x__b8e_87_32_gen_0[i:I, j:J, k:K] - qlz[i:I, j:J, k:K]), diff__b8e_87_32_gen_0[i:I, j:J, k:K])
+        RETURN_VALUE__b8e_87_32_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629019279312_gen_0[i:I, j:J, k:K], mask_139629000230672_gen_0[i:I, j:J, k:K]), np.where((diff__b8e_87_32_gen_0[i:I, j:J, k:K] > np.float64(0.0)), diff__b8e_87_32_gen_0[i:I, j:J, k:K], np.float64(0.0)), RETURN_VALUE__b8e_87_32_gen_0[i:I, j:J, k:K])
+        tmp_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629019279312_gen_0[i:I, j:J, k:K], mask_139629000230672_gen_0[i:I, j:J, k:K]), np.minimum(sink_gen_0[i:I, j:J, k:K], RETURN_VALUE__b8e_87_32_gen_0[i:I, j:J, k:K]), tmp_gen_0[i:I, j:J, k:K])
+        qlz[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629019279312_gen_0[i:I, j:J, k:K], mask_139629000230672_gen_0[i:I, j:J, k:K]), (qlz[i:I, j:J, k:K] + tmp_gen_0[i:I, j:J, k:K]), qlz[i:I, j:J, k:K])
+        qrz[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629019279312_gen_0[i:I, j:J, k:K], mask_139629000230672_gen_0[i:I, j:J, k:K]), ((qrz[i:I, j:J, k:K] + sink_gen_0[i:I, j:J, k:K]) - tmp_gen_0[i:I, j:J, k:K]), qrz[i:I, j:J, k:K])
+        qiz[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629019279312_gen_0[i:I, j:J, k:K], mask_139629000230672_gen_0[i:I, j:J, k:K]), (qiz[i:I, j:J, k:K] - sink_gen_0[i:I, j:J, k:K]), qiz[i:I, j:J, k:K])
+        q_liq[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629019279312_gen_0[i:I, j:J, k:K], mask_139629000230672_gen_0[i:I, j:J, k:K]), (q_liq[i:I, j:J, k:K] + sink_gen_0[i:I, j:J, k:K]), q_liq[i:I, j:J, k:K])
+        q_sol[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629019279312_gen_0[i:I, j:J, k:K], mask_139629000230672_gen_0[i:I, j:J, k:K]), (q_sol[i:I, j:J, k:K] - sink_gen_0[i:I, j:J, k:K]), q_sol[i:I, j:J, k:K])
+        cvm[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629019279312_gen_0[i:I, j:J, k:K], mask_139629000230672_gen_0[i:I, j:J, k:K]), (((c_air + (qvz[i:I, j:J, k:K] * c_vap)) + (q_liq[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol[i:I, j:J, k:K] * np.float64(1972.0))), cvm[i:I, j:J, k:K])
+        tz[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629019279312_gen_0[i:I, j:J, k:K], mask_139629000230672_gen_0[i:I, j:J, k:K]), (tz[i:I, j:J, k:K] - ((sink_gen_0[i:I, j:J, k:K] * lhi[i:I, j:J, k:K]) / cvm[i:I, j:J, k:K])), tz[i:I, j:J, k:K])
+        tc_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629019279312_gen_0[i:I, j:J, k:K], mask_139629000230672_gen_0[i:I, j:J, k:K]), (tz[i:I, j:J, k:K] - np.float64(273.16)), tc_gen_0[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        stop_k[i:I, j:J, k:K] = np.where((dts < np.float64(60.0)), np.int64(0), stop_k[i:I, j:J, k:K])
+        stop_k[i:I, j:J, k:K] = np.int64(0)
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            ze[i:I, j:J, k_:k_ + 1] = (zs - dz1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            ze[i:I, j:J, k_:k_ + 1] = (ze[i:I, j:J, k_ + 1:k_ + 2] - dz1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            ze[i:I, j:J, k_:k_ + 1] = (ze[i:I, j:J, k_ + 1:k_ + 2] - dz1[i:I, j:J, k_:k_ + 1])
+            zt[i:I, j:J, k_:k_ + 1] = ze[i:I, j:J, k_:k_ + 1]
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629019273872_gen_0[i:I, j:J, k:K] = (stop_k[i:I, j:J, k:K] == np.int64(1))
+        lhi[i:I, j:J, k:K] = np.where(mask_139629019273872_gen_0[i:I, j:J, k:K], (np.float64(-271059.66000000003) + (np.float64(2213.5) * tz[i:I, j:J, k:K])), lhi[i:I, j:J, k:K])
+        icpk[i:I, j:J, k:K] = np.where(mask_139629019273872_gen_0[i:I, j:J, k:K], (lhi[i:I, j:J, k:K] / cvm[i:I, j:J, k:K]), icpk[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629023827280_gen_0[i:I, j:J, k_:k_ + 1] = (qiz[i:I, j:J, k_:k_ + 1] > np.float64(1e-08))
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(mask_139629023827280_gen_0[i:I, j:J, k_:k_ + 1], np.int64(0), no_fall[i:I, j:J, k_:k_ + 1])
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629023827280_gen_0[i:I, j:J, k_:k_ + 1])), np.int64(1), no_fall[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629018615824_gen_0[i:I, j:J, k_:k_ + 1] = (no_fall[i:I, j:J, k_ - 1:k_] == np.int64(1))
+            mask_139629023303952_gen_0[i:I, j:J, k_:k_ + 1] = (qiz[i:I, j:J, k_:k_ + 1] > np.float64(1e-08))
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629018615824_gen_0[i:I, j:J, k_:k_ + 1], mask_139629023303952_gen_0[i:I, j:J, k_:k_ + 1]), np.int64(0), no_fall[i:I, j:J, k_:k_ + 1])
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629018615824_gen_0[i:I, j:J, k_:k_ + 1], (np.bitwise_not(mask_139629023303952_gen_0[i:I, j:J, k_:k_ + 1]))), np.int64(1), no_fall[i:I, j:J, k_:k_ + 1])
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629018615824_gen_0[i:I, j:J, k_:k_ + 1])), np.int64(0), no_fall[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629006693200_gen_0[i:I, j:J, k_:k_ + 1] = (no_fall[i:I, j:J, k_ + 1:k_ + 2] == np.int64(0))
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(mask_139629006693200_gen_0[i:I, j:J, k_:k_ + 1], no_fall[i:I, j:J, k_ + 1:k_ + 2], no_fall[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629011670352_gen_0[i:I, j:J, k:K] = np.bitwise_or((np.float64(1.0) < np.float64(1e-05)), (no_fall[i:I, j:J, k:K] == np.int64(1)))
+        i1[i:I, j:J, k:K] = np.where(mask_139629011670352_gen_0[i:I, j:J, k:K], np.float64(0.0), i1[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628983948496_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        zt[i:I, j:J, k:K] = np.where(mask_139628983948496_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - (dt5[i:I, j:J, k:K] * (vtiz[i:I, j:J, k - 1:K - 1] + vtiz[i:I, j:J, k:K]))), zt[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629023725136_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        zt[i:I, j:J, k:K] = np.where(mask_139629023725136_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - (dt5[i:I, j:J, k:K] * (vtiz[i:I, j:J, k - 1:K - 1] + vtiz[i:I, j:J, k:K]))), zt[i:I, j:J, k:K])
+        zt_kbot1[i:I, j:J, k:K] = np.where(mask_139629023725136_gen_0[i:I, j:J, k:K], (zs - (dts * vtiz[i:I, j:J, k:K])), zt_kbot1[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629023226704_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), np.bitwise_and((no_fall[i:I, j:J, k_ - 1:k_] == np.int64(0)), (zt[i:I, j:J, k_:k_ + 1] >= zt[i:I, j:J, k_ - 1:k_])))
+            zt[i:I, j:J, k_:k_ + 1] = np.where(mask_139629023226704_gen_0[i:I, j:J, k_:k_ + 1], (zt[i:I, j:J, k_ - 1:k_] - np.float64(0.01)), zt[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629032330256_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), np.bitwise_and((no_fall[i:I, j:J, k_ - 1:k_] == np.int64(0)), (zt[i:I, j:J, k_:k_ + 1] >= zt[i:I, j:J, k_ - 1:k_])))
+            zt[i:I, j:J, k_:k_ + 1] = np.where(mask_139629032330256_gen_0[i:I, j:J, k_:k_ + 1], (zt[i:I, j:J, k_ - 1:k_] - np.float64(0.01)), zt[i:I, j:J, k_:k_ + 1])
+            mask_139628999475600_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), np.bitwise_and((no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)), (zt_kbot1[i:I, j:J, k_:k_ + 1] >= zt[i:I, j:J, k_:k_ + 1])))
+            zt_kbot1[i:I, j:J, k_:k_ + 1] = np.where(mask_139628999475600_gen_0[i:I, j:J, k_:k_ + 1], (zt[i:I, j:J, k_:k_ + 1] - np.float64(0.01)), zt_kbot1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629017332880_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            zt_kbot1[i:I, j:J, k_:k_ + 1] = np.where(mask_139629017332880_gen_0[i:I, j:J, k_:k_ + 1], (zt_kbot1[i:I, j:J, k_ + 1:k_ + 2] - np.float64(0.01)), zt_kbot1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628982046544_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        dm[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628982046544_gen_0[i:I, j:J, k:K], bool(bool(True))), (dp1[i:I, j:J, k:K] * ((((((np.float64(1.0) + qvz[i:I, j:J, k:K]) + qlz[i:I, j:J, k:K]) + qrz[i:I, j:J, k:K]) + qiz[i:I, j:J, k:K]) + qsz[i:I, j:J, k:K]) + qgz[i:I, j:J, k:K])), dm[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629021806672_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k:K] == np.int64(0))))
+        dz[i:I, j:J, k:K] = np.where(mask_139629021806672_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - ze[i:I, j:J, k + 1:K + 1]), dz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629014453712_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k:K] == np.int64(0))))
+        dz[i:I, j:J, k:K] = np.where(mask_139629014453712_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - zs), dz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628986560080_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k:K] == np.int64(0))))
+        dd[i:I, j:J, k:K] = np.where(mask_139628986560080_gen_0[i:I, j:J, k:K], (dts * vtiz[i:I, j:J, k:K]), dd[i:I, j:J, k:K])
+        qiz[i:I, j:J, k:K] = np.where(mask_139628986560080_gen_0[i:I, j:J, k:K], (qiz[i:I, j:J, k:K] * dp1[i:I, j:J, k:K]), qiz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628986553744_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0))))
+            qm[i:I, j:J, k_:k_ + 1] = np.where(mask_139628986553744_gen_0[i:I, j:J, k_:k_ + 1], (qiz[i:I, j:J, k_:k_ + 1] / (dz[i:I, j:J, k_:k_ + 1] + dd[i:I, j:J, k_:k_ + 1])), qm[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628986792784_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0))))
+            qm[i:I, j:J, k_:k_ + 1] = np.where(mask_139628986792784_gen_0[i:I, j:J, k_:k_ + 1], ((qiz[i:I, j:J, k_:k_ + 1] + (dd[i:I, j:J, k_ - 1:k_] * qm[i:I, j:J, k_ - 1:k_])) / (dz[i:I, j:J, k_:k_ + 1] + dd[i:I, j:J, k_:k_ + 1])), qm[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629016732624_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k:K] == np.int64(0))))
+        qm[i:I, j:J, k:K] = np.where(mask_139629016732624_gen_0[i:I, j:J, k:K], (qm[i:I, j:J, k:K] * dz[i:I, j:J, k:K]), qm[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628986786960_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0))))
+            m1_sol[i:I, j:J, k_:k_ + 1] = np.where(mask_139628986786960_gen_0[i:I, j:J, k_:k_ + 1], (qiz[i:I, j:J, k_:k_ + 1] - qm[i:I, j:J, k_:k_ + 1]), m1_sol[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629018269456_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0))))
+            m1_sol[i:I, j:J, k_:k_ + 1] = np.where(mask_139629018269456_gen_0[i:I, j:J, k_:k_ + 1], ((m1_sol[i:I, j:J, k_ - 1:k_] + qiz[i:I, j:J, k_:k_ + 1]) - qm[i:I, j:J, k_:k_ + 1]), m1_sol[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628986782416_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0))))
+            i1[i:I, j:J, k_:k_ + 1] = np.where(mask_139628986782416_gen_0[i:I, j:J, k_:k_ + 1], m1_sol[i:I, j:J, k_:k_ + 1], i1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628992578192_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0))))
+            i1[i:I, j:J, k_:k_ + 1] = np.where(mask_139628992578192_gen_0[i:I, j:J, k_:k_ + 1], i1[i:I, j:J, k_ + 1:k_ + 2], i1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629022541008_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        qiz[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629022541008_gen_0[i:I, j:J, k:K], (np.bitwise_not(bool(bool(False))))), (qm[i:I, j:J, k:K] / dp1[i:I, j:J, k:K]), qiz[i:I, j:J, k:K])
+        w[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629022541008_gen_0[i:I, j:J, k:K], bool(bool(True))), (((dm[i:I, j:J, k:K] * w[i:I, j:J, k:K]) + (m1_sol[i:I, j:J, k:K] * vtiz[i:I, j:J, k:K])) / (dm[i:I, j:J, k:K] - m1_sol[i:I, j:J, k:K])), w[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629021253008_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.float64(1.0) >= np.float64(1e-05)), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        qiz[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629021253008_gen_0[i:I, j:J, k:K], (np.bitwise_not(bool(bool(False))))), (qm[i:I, j:J, k:K] / dp1[i:I, j:J, k:K]), qiz[i:I, j:J, k:K])
+        w[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629021253008_gen_0[i:I, j:J, k:K], bool(bool(True))), ((((dm[i:I, j:J, k:K] * w[i:I, j:J, k:K]) - (m1_sol[i:I, j:J, k - 1:K - 1] * vtiz[i:I, j:J, k - 1:K - 1])) + (m1_sol[i:I, j:J, k:K] * vtiz[i:I, j:J, k:K])) / ((dm[i:I, j:J, k:K] + m1_sol[i:I, j:J, k - 1:K - 1]) - m1_sol[i:I, j:J, k:K])), w[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629027940176_gen_0[i:I, j:J, k_:k_ + 1] = (qsz[i:I, j:J, k_:k_ + 1] > np.float64(1e-08))
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(mask_139629027940176_gen_0[i:I, j:J, k_:k_ + 1], np.int64(0), no_fall[i:I, j:J, k_:k_ + 1])
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629027940176_gen_0[i:I, j:J, k_:k_ + 1])), np.int64(1), no_fall[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629022538000_gen_0[i:I, j:J, k_:k_ + 1] = (no_fall[i:I, j:J, k_ - 1:k_] == np.int64(1))
+            mask_139628986783632_gen_0[i:I, j:J, k_:k_ + 1] = (qsz[i:I, j:J, k_:k_ + 1] > np.float64(1e-08))
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629022538000_gen_0[i:I, j:J, k_:k_ + 1], mask_139628986783632_gen_0[i:I, j:J, k_:k_ + 1]), np.int64(0), no_fall[i:I, j:J, k_:k_ + 1])
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629022538000_gen_0[i:I, j:J, k_:k_ + 1], (np.bitwise_not(mask_139628986783632_gen_0[i:I, j:J, k_:k_ + 1]))), np.int64(1), no_fall[i:I, j:J, k_:k_ + 1])
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629022538000_gen_0[i:I, j:J, k_:k_ + 1])), np.int64(0), no_fall[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629032333584_gen_0[i:I, j:J, k_:k_ + 1] = (no_fall[i:I, j:J, k_ + 1:k_ + 2] == np.int64(0))
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(mask_139629032333584_gen_0[i:I, j:J, k_:k_ + 1], no_fall[i:I, j:J, k_ + 1:k_ + 2], no_fall[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        r1[i:I, j:J, k:K] = np.float64(0.0)
+        mask_139629018085072_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(1))
+        s1[i:I, j:J, k:K] = np.where(mask_139629018085072_gen_0[i:I, j:J, k:K], np.float64(0.0), s1[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629016838288_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(0))
+        zt[i:I, j:J, k:K] = np.where(mask_139629016838288_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - (dt5[i:I, j:J, k:K] * (vtsz[i:I, j:J, k - 1:K - 1] + vtsz[i:I, j:J, k:K]))), zt[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628983482000_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(0))
+        zt[i:I, j:J, k:K] = np.where(mask_139628983482000_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - (dt5[i:I, j:J, k:K] * (vtsz[i:I, j:J, k - 1:K - 1] + vtsz[i:I, j:J, k:K]))), zt[i:I, j:J, k:K])
+        zt_kbot1[i:I, j:J, k:K] = np.where(mask_139628983482000_gen_0[i:I, j:J, k:K], (zs - (dts * vtsz[i:I, j:J, k:K])), zt_kbot1[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628999765200_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((no_fall[i:I, j:J, k_ - 1:k_] == np.int64(0)), (zt[i:I, j:J, k_:k_ + 1] >= zt[i:I, j:J, k_ - 1:k_]))
+            zt[i:I, j:J, k_:k_ + 1] = np.where(mask_139628999765200_gen_0[i:I, j:J, k_:k_ + 1], (zt[i:I, j:J, k_ - 1:k_] - np.float64(0.01)), zt[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628997436944_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((no_fall[i:I, j:J, k_ - 1:k_] == np.int64(0)), (zt[i:I, j:J, k_:k_ + 1] >= zt[i:I, j:J, k_ - 1:k_]))
+            zt[i:I, j:J, k_:k_ + 1] = np.where(mask_139628997436944_gen_0[i:I, j:J, k_:k_ + 1], (zt[i:I, j:J, k_ - 1:k_] - np.float64(0.01)), zt[i:I, j:J, k_:k_ + 1])
+            mask_139628997146384_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)), (zt_kbot1[i:I, j:J, k_:k_ + 1] >= zt[i:I, j:J, k_:k_ + 1]))
+            zt_kbot1[i:I, j:J, k_:k_ + 1] = np.where(mask_139628997146384_gen_0[i:I, j:J, k_:k_ + 1], (zt[i:I, j:J, k_:k_ + 1] - np.float64(0.01)), zt_kbot1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628981974992_gen_0[i:I, j:J, k_:k_ + 1] = (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0))
+            zt_kbot1[i:I, j:J, k_:k_ + 1] = np.where(mask_139628981974992_gen_0[i:I, j:J, k_:k_ + 1], (zt_kbot1[i:I, j:J, k_ + 1:k_ + 2] - np.float64(0.01)), zt_kbot1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629017128976_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(0))
+        dm[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629017128976_gen_0[i:I, j:J, k:K], bool(bool(True))), (dp1[i:I, j:J, k:K] * ((((((np.float64(1.0) + qvz[i:I, j:J, k:K]) + qlz[i:I, j:J, k:K]) + qrz[i:I, j:J, k:K]) + qiz[i:I, j:J, k:K]) + qsz[i:I, j:J, k:K]) + qgz[i:I, j:J, k:K])), dm[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628992590608_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        dz[i:I, j:J, k:K] = np.where(mask_139628992590608_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - ze[i:I, j:J, k + 1:K + 1]), dz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628999767376_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        dz[i:I, j:J, k:K] = np.where(mask_139628999767376_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - zs), dz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629015871056_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        dd[i:I, j:J, k:K] = np.where(mask_139629015871056_gen_0[i:I, j:J, k:K], (dts * vtsz[i:I, j:J, k:K]), dd[i:I, j:J, k:K])
+        qsz[i:I, j:J, k:K] = np.where(mask_139629015871056_gen_0[i:I, j:J, k:K], (qsz[i:I, j:J, k:K] * dp1[i:I, j:J, k:K]), qsz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628995496464_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            qm[i:I, j:J, k_:k_ + 1] = np.where(mask_139628995496464_gen_0[i:I, j:J, k_:k_ + 1], (qsz[i:I, j:J, k_:k_ + 1] / (dz[i:I, j:J, k_:k_ + 1] + dd[i:I, j:J, k_:k_ + 1])), qm[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629011181968_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            qm[i:I, j:J, k_:k_ + 1] = np.where(mask_139629011181968_gen_0[i:I, j:J, k_:k_ + 1], ((qsz[i:I, j:J, k_:k_ + 1] + (dd[i:I, j:J, k_ - 1:k_] * qm[i:I, j:J, k_ - 1:k_])) / (dz[i:I, j:J, k_:k_ + 1] + dd[i:I, j:J, k_:k_ + 1])), qm[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628992818128_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        qm[i:I, j:J, k:K] = np.where(mask_139628992818128_gen_0[i:I, j:J, k:K], (qm[i:I, j:J, k:K] * dz[i:I, j:J, k:K]), qm[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629024904720_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            m1_tf[i:I, j:J, k_:k_ + 1] = np.where(mask_139629024904720_gen_0[i:I, j:J, k_:k_ + 1], (qsz[i:I, j:J, k_:k_ + 1] - qm[i:I, j:J, k_:k_ + 1]), m1_tf[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629005197456_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            m1_tf[i:I, j:J, k_:k_ + 1] = np.where(mask_139629005197456_gen_0[i:I, j:J, k_:k_ + 1], ((m1_tf[i:I, j:J, k_ - 1:k_] + qsz[i:I, j:J, k_:k_ + 1]) - qm[i:I, j:J, k_:k_ + 1]), m1_tf[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629005208720_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            s1[i:I, j:J, k_:k_ + 1] = np.where(mask_139629005208720_gen_0[i:I, j:J, k_:k_ + 1], m1_tf[i:I, j:J, k_:k_ + 1], s1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629017905296_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            s1[i:I, j:J, k_:k_ + 1] = np.where(mask_139629017905296_gen_0[i:I, j:J, k_:k_ + 1], s1[i:I, j:J, k_ + 1:k_ + 2], s1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629026723088_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(0))
+        qsz[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629026723088_gen_0[i:I, j:J, k:K], (np.bitwise_not(bool(bool(False))))), (qm[i:I, j:J, k:K] / dp1[i:I, j:J, k:K]), qsz[i:I, j:J, k:K])
+        m1_sol[i:I, j:J, k:K] = np.where(mask_139629026723088_gen_0[i:I, j:J, k:K], (m1_sol[i:I, j:J, k:K] + m1_tf[i:I, j:J, k:K]), m1_sol[i:I, j:J, k:K])
+        w[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629026723088_gen_0[i:I, j:J, k:K], bool(bool(True))), (((dm[i:I, j:J, k:K] * w[i:I, j:J, k:K]) + (m1_tf[i:I, j:J, k:K] * vtsz[i:I, j:J, k:K])) / (dm[i:I, j:J, k:K] - m1_tf[i:I, j:J, k:K])), w[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628992578128_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(0))
+        qsz[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628992578128_gen_0[i:I, j:J, k:K], (np.bitwise_not(bool(bool(False))))), (qm[i:I, j:J, k:K] / dp1[i:I, j:J, k:K]), qsz[i:I, j:J, k:K])
+        m1_sol[i:I, j:J, k:K] = np.where(mask_139628992578128_gen_0[i:I, j:J, k:K], (m1_sol[i:I, j:J, k:K] + m1_tf[i:I, j:J, k:K]), m1_sol[i:I, j:J, k:K])
+        w[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628992578128_gen_0[i:I, j:J, k:K], bool(bool(True))), ((((dm[i:I, j:J, k:K] * w[i:I, j:J, k:K]) - (m1_tf[i:I, j:J, k - 1:K - 1] * vtsz[i:I, j:J, k - 1:K - 1])) + (m1_tf[i:I, j:J, k:K] * vtsz[i:I, j:J, k:K])) / ((dm[i:I, j:J, k:K] + m1_tf[i:I, j:J, k - 1:K - 1]) - m1_tf[i:I, j:J, k:K])), w[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628984898896_gen_0[i:I, j:J, k_:k_ + 1] = (qgz[i:I, j:J, k_:k_ + 1] > np.float64(1e-08))
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(mask_139628984898896_gen_0[i:I, j:J, k_:k_ + 1], np.int64(0), no_fall[i:I, j:J, k_:k_ + 1])
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139628984898896_gen_0[i:I, j:J, k_:k_ + 1])), np.int64(1), no_fall[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629000014160_gen_0[i:I, j:J, k_:k_ + 1] = (no_fall[i:I, j:J, k_ - 1:k_] == np.int64(1))
+            mask_139629029530768_gen_0[i:I, j:J, k_:k_ + 1] = (qgz[i:I, j:J, k_:k_ + 1] > np.float64(1e-08))
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629000014160_gen_0[i:I, j:J, k_:k_ + 1], mask_139629029530768_gen_0[i:I, j:J, k_:k_ + 1]), np.int64(0), no_fall[i:I, j:J, k_:k_ + 1])
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629000014160_gen_0[i:I, j:J, k_:k_ + 1], (np.bitwise_not(mask_139629029530768_gen_0[i:I, j:J, k_:k_ + 1]))), np.int64(1), no_fall[i:I, j:J, k_:k_ + 1])
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629000014160_gen_0[i:I, j:J, k_:k_ + 1])), np.int64(0), no_fall[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628984905680_gen_0[i:I, j:J, k_:k_ + 1] = (no_fall[i:I, j:J, k_ + 1:k_ + 2] == np.int64(0))
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(mask_139628984905680_gen_0[i:I, j:J, k_:k_ + 1], no_fall[i:I, j:J, k_ + 1:k_ + 2], no_fall[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629020290128_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(1))
+        g1[i:I, j:J, k:K] = np.where(mask_139629020290128_gen_0[i:I, j:J, k:K], np.float64(0.0), g1[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628998539216_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(0))
+        zt[i:I, j:J, k:K] = np.where(mask_139628998539216_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - (dt5[i:I, j:J, k:K] * (vtgz[i:I, j:J, k - 1:K - 1] + vtgz[i:I, j:J, k:K]))), zt[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629021083216_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(0))
+        zt[i:I, j:J, k:K] = np.where(mask_139629021083216_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - (dt5[i:I, j:J, k:K] * (vtgz[i:I, j:J, k - 1:K - 1] + vtgz[i:I, j:J, k:K]))), zt[i:I, j:J, k:K])
+        zt_kbot1[i:I, j:J, k:K] = np.where(mask_139629021083216_gen_0[i:I, j:J, k:K], (zs - (dts * vtgz[i:I, j:J, k:K])), zt_kbot1[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629018844304_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((no_fall[i:I, j:J, k_ - 1:k_] == np.int64(0)), (zt[i:I, j:J, k_:k_ + 1] >= zt[i:I, j:J, k_ - 1:k_]))
+            zt[i:I, j:J, k_:k_ + 1] = np.where(mask_139629018844304_gen_0[i:I, j:J, k_:k_ + 1], (zt[i:I, j:J, k_ - 1:k_] - np.float64(0.01)), zt[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629018842448_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((no_fall[i:I, j:J, k_ - 1:k_] == np.int64(0)), (zt[i:I, j:J, k_:k_ + 1] >= zt[i:I, j:J, k_ - 1:k_]))
+            zt[i:I, j:J, k_:k_ + 1] = np.where(mask_139629018842448_gen_0[i:I, j:J, k_:k_ + 1], (zt[i:I, j:J, k_ - 1:k_] - np.float64(0.01)), zt[i:I, j:J, k_:k_ + 1])
+            mask_139629005202128_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)), (zt_kbot1[i:I, j:J, k_:k_ + 1] >= zt[i:I, j:J, k_:k_ + 1]))
+            zt_kbot1[i:I, j:J, k_:k_ + 1] = np.where(mask_139629005202128_gen_0[i:I, j:J, k_:k_ + 1], (zt[i:I, j:J, k_:k_ + 1] - np.float64(0.01)), zt_kbot1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628998979728_gen_0[i:I, j:J, k_:k_ + 1] = (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0))
+            zt_kbot1[i:I, j:J, k_:k_ + 1] = np.where(mask_139628998979728_gen_0[i:I, j:J, k_:k_ + 1], (zt_kbot1[i:I, j:J, k_ + 1:k_ + 2] - np.float64(0.01)), zt_kbot1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629031074640_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(0))
+        dm[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629031074640_gen_0[i:I, j:J, k:K], bool(bool(True))), (dp1[i:I, j:J, k:K] * ((((((np.float64(1.0) + qvz[i:I, j:J, k:K]) + qlz[i:I, j:J, k:K]) + qrz[i:I, j:J, k:K]) + qiz[i:I, j:J, k:K]) + qsz[i:I, j:J, k:K]) + qgz[i:I, j:J, k:K])), dm[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629017101520_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        dz[i:I, j:J, k:K] = np.where(mask_139629017101520_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - ze[i:I, j:J, k + 1:K + 1]), dz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628983135888_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        dz[i:I, j:J, k:K] = np.where(mask_139628983135888_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - zs), dz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629019004624_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        dd[i:I, j:J, k:K] = np.where(mask_139629019004624_gen_0[i:I, j:J, k:K], (dts * vtgz[i:I, j:J, k:K]), dd[i:I, j:J, k:K])
+        qgz[i:I, j:J, k:K] = np.where(mask_139629019004624_gen_0[i:I, j:J, k:K], (qgz[i:I, j:J, k:K] * dp1[i:I, j:J, k:K]), qgz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628987482704_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            qm[i:I, j:J, k_:k_ + 1] = np.where(mask_139628987482704_gen_0[i:I, j:J, k_:k_ + 1], (qgz[i:I, j:J, k_:k_ + 1] / (dz[i:I, j:J, k_:k_ + 1] + dd[i:I, j:J, k_:k_ + 1])), qm[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629012204240_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            qm[i:I, j:J, k_:k_ + 1] = np.where(mask_139629012204240_gen_0[i:I, j:J, k_:k_ + 1], ((qgz[i:I, j:J, k_:k_ + 1] + (dd[i:I, j:J, k_ - 1:k_] * qm[i:I, j:J, k_ - 1:k_])) / (dz[i:I, j:J, k_:k_ + 1] + dd[i:I, j:J, k_:k_ + 1])), qm[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628998533136_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        qm[i:I, j:J, k:K] = np.where(mask_139628998533136_gen_0[i:I, j:J, k:K], (qm[i:I, j:J, k:K] * dz[i:I, j:J, k:K]), qm[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629012196688_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            m1_tf[i:I, j:J, k_:k_ + 1] = np.where(mask_139629012196688_gen_0[i:I, j:J, k_:k_ + 1], (qgz[i:I, j:J, k_:k_ + 1] - qm[i:I, j:J, k_:k_ + 1]), m1_tf[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628998981136_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            m1_tf[i:I, j:J, k_:k_ + 1] = np.where(mask_139628998981136_gen_0[i:I, j:J, k_:k_ + 1], ((m1_tf[i:I, j:J, k_ - 1:k_] + qgz[i:I, j:J, k_:k_ + 1]) - qm[i:I, j:J, k_:k_ + 1]), m1_tf[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628997140048_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            g1[i:I, j:J, k_:k_ + 1] = np.where(mask_139628997140048_gen_0[i:I, j:J, k_:k_ + 1], m1_tf[i:I, j:J, k_:k_ + 1], g1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629018512528_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            g1[i:I, j:J, k_:k_ + 1] = np.where(mask_139629018512528_gen_0[i:I, j:J, k_:k_ + 1], g1[i:I, j:J, k_ + 1:k_ + 2], g1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629009923664_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(0))
+        qgz[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629009923664_gen_0[i:I, j:J, k:K], (np.bitwise_not(bool(bool(False))))), (qm[i:I, j:J, k:K] / dp1[i:I, j:J, k:K]), qgz[i:I, j:J, k:K])
+        m1_sol[i:I, j:J, k:K] = np.where(mask_139629009923664_gen_0[i:I, j:J, k:K], (m1_sol[i:I, j:J, k:K] + m1_tf[i:I, j:J, k:K]), m1_sol[i:I, j:J, k:K])
+        w[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629009923664_gen_0[i:I, j:J, k:K], bool(bool(True))), (((dm[i:I, j:J, k:K] * w[i:I, j:J, k:K]) + (m1_tf[i:I, j:J, k:K] * vtgz[i:I, j:J, k:K])) / (dm[i:I, j:J, k:K] - m1_tf[i:I, j:J, k:K])), w[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628998536016_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(0))
+        qgz[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628998536016_gen_0[i:I, j:J, k:K], (np.bitwise_not(bool(bool(False))))), (qm[i:I, j:J, k:K] / dp1[i:I, j:J, k:K]), qgz[i:I, j:J, k:K])
+        m1_sol[i:I, j:J, k:K] = np.where(mask_139628998536016_gen_0[i:I, j:J, k:K], (m1_sol[i:I, j:J, k:K] + m1_tf[i:I, j:J, k:K]), m1_sol[i:I, j:J, k:K])
+        w[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628998536016_gen_0[i:I, j:J, k:K], bool(bool(True))), ((((dm[i:I, j:J, k:K] * w[i:I, j:J, k:K]) - (m1_tf[i:I, j:J, k - 1:K - 1] * vtgz[i:I, j:J, k - 1:K - 1])) + (m1_tf[i:I, j:J, k:K] * vtgz[i:I, j:J, k:K])) / ((dm[i:I, j:J, k:K] + m1_tf[i:I, j:J, k - 1:K - 1]) - m1_tf[i:I, j:J, k:K])), w[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        rain[i:I, j:J, k:K] = (rain[i:I, j:J, k:K] + r1[i:I, j:J, k:K])
+        snow[i:I, j:J, k:K] = (snow[i:I, j:J, k:K] + s1[i:I, j:J, k:K])
+        graupel[i:I, j:J, k:K] = (graupel[i:I, j:J, k:K] + g1[i:I, j:J, k:K])
+        ice[i:I, j:J, k:K] = (ice[i:I, j:J, k:K] + i1[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        dgz[i:I, j:J, k:K] = np.where(bool(bool(False)), (((-(np.float64(0.5))) * np.float64(9.80665)) * dz1[i:I, j:J, k:K]), dgz[i:I, j:J, k:K])
+        cvn[i:I, j:J, k:K] = np.where(bool(bool(False)), (dp1[i:I, j:J, k:K] * (((np.float64(717.55) + (qvz[i:I, j:J, k:K] * np.float64(1384.5))) + ((qrz[i:I, j:J, k:K] + qlz[i:I, j:J, k:K]) * np.float64(4185.5))) + (((qiz[i:I, j:J, k:K] + qsz[i:I, j:J, k:K]) + qgz[i:I, j:J, k:K]) * np.float64(1972.0)))), cvn[i:I, j:J, k:K])
+        tmp_gen_1[i:I, j:J, k:K] = np.where(bool(bool(False)), (cvn[i:I, j:J, k:K] + (m1_sol[i:I, j:J, k:K] * np.float64(1972.0))), tmp_gen_1[i:I, j:J, k:K])
+        tz[i:I, j:J, k:K] = np.where(bool(bool(False)), (tz[i:I, j:J, k:K] + ((m1_sol[i:I, j:J, k:K] * dgz[i:I, j:J, k:K]) / tmp_gen_1[i:I, j:J, k:K])), tz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        dgz[i:I, j:J, k:K] = np.where(bool(bool(False)), (((-(np.float64(0.5))) * np.float64(9.80665)) * dz1[i:I, j:J, k:K]), dgz[i:I, j:J, k:K])
+        cvn[i:I, j:J, k:K] = np.where(bool(bool(False)), (dp1[i:I, j:J, k:K] * (((np.float64(717.55) + (qvz[i:I, j:J, k:K] * np.float64(1384.5))) + ((qrz[i:I, j:J, k:K] + qlz[i:I, j:J, k:K]) * np.float64(4185.5))) + (((qiz[i:I, j:J, k:K] + qsz[i:I, j:J, k:K]) + qgz[i:I, j:J, k:K]) * np.float64(1972.0)))), cvn[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            tz[i:I, j:J, k_:k_ + 1] = np.where(bool(bool(False)), (((((cvn[i:I, j:J, k_:k_ + 1] + (np.float64(1972.0) * (m1_sol[i:I, j:J, k_:k_ + 1] - m1_sol[i:I, j:J, k_ - 1:k_]))) * tz[i:I, j:J, k_:k_ + 1]) + ((m1_sol[i:I, j:J, k_ - 1:k_] * np.float64(1972.0)) * tz[i:I, j:J, k_ - 1:k_])) + (dgz[i:I, j:J, k_:k_ + 1] * (m1_sol[i:I, j:J, k_ - 1:k_] + m1_sol[i:I, j:J, k_:k_ + 1]))) / (cvn[i:I, j:J, k_:k_ + 1] + (np.float64(1972.0) * m1_sol[i:I, j:J, k_:k_ + 1]))), tz[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,862 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, h_var, rain, qgz, qiz, qlz, qrz, qsz, qvz, tz, den, denfac, w, t0, den0, dz0, dz1, dp1, m1, vtrz, ccn, c_praut, m1_sol, is_first, c_air, c_vap, d0_vap, lv00, fac_rc, cracw, crevp_0, crevp_1, crevp_2, crevp_3, crevp_4, so3, dt_rain, zs, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    h_var = Field(h_var, _origin_['h_var'], (True, True, True))
+    rain = Field(rain, _origin_['rain'], (True, True, True))
+    qgz = Field(qgz, _origin_['qgz'], (True, True, True))
+    qiz = Field(qiz, _origin_['qiz'], (True, True, True))
+    qlz = Field(qlz, _origin_['qlz'], (True, True, True))
+    qrz = Field(qrz, _origin_['qrz'], (True, True, True))
+    qsz = Field(qsz, _origin_['qsz'], (True, True, True))
+    qvz = Field(qvz, _origin_['qvz'], (True, True, True))
+    tz = Field(tz, _origin_['tz'], (True, True, True))
+    den = Field(den, _origin_['den'], (True, True, True))
+    denfac = Field(denfac, _origin_['denfac'], (True, True, True))
+    w = Field(w, _origin_['w'], (True, True, True))
+    t0 = Field(t0, _origin_['t0'], (True, True, True))
+    den0 = Field(den0, _origin_['den0'], (True, True, True))
+    dz0 = Field(dz0, _origin_['dz0'], (True, True, True))
+    dz1 = Field(dz1, _origin_['dz1'], (True, True, True))
+    dp1 = Field(dp1, _origin_['dp1'], (True, True, True))
+    m1 = Field(m1, _origin_['m1'], (True, True, True))
+    vtrz = Field(vtrz, _origin_['vtrz'], (True, True, True))
+    ccn = Field(ccn, _origin_['ccn'], (True, True, True))
+    c_praut = Field(c_praut, _origin_['c_praut'], (True, True, True))
+    m1_sol = Field(m1_sol, _origin_['m1_sol'], (True, True, True))
+    
+    dt5 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    m1_rain = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    no_fall = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.int64, (0, 0, 0))
+    r1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ze = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dm = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    zt = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    zt_kbot1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dz = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dd = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qm = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dgz = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvn = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dl = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dq = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629005765776_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629007938000_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629004722896_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629004724432_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qden__f66_103_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629021706896_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    vtrz__f66_103_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629004731152_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    r1__f66_103_19_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629005763856_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629005757008_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dqsdt__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628996873040_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tz__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_plus__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628995582672_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    lcpk__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_liq__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qden__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    evap__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628997718032_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628995580880_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dqh__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_sol__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qpz__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qr__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_minus__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dq__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t2__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qsat__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628995576976_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    ql__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dqv__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tin__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qv__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sink__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhl__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp__d4a_40_22__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t_wfr__39c_122_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628998638288_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628983950416_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628999150480_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628998765968_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628983349520_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628983948624_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628998638608_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628999480016_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628983352016_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629000429520_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628996819088_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628996808528_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628998757648_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629006113680_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628986977360_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629006111376_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628983949648_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629004725392_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628985141008_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    tmp_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629003956176_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628981638800_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629022210064_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    t_wfr__8ee_371_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_minus__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qc__8ee_371_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    evap__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629023225104_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628985864784_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dq__8ee_371_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628998572752_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qc0__8ee_371_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qr__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629000166672_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    q_sol__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lhl__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t_wfr__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qden__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qpz__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dqh__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tmp__d4a_40_22__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qrz__8ee_371_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    cvm__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    ql__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    use_ccn__8ee_371_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629006694864_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qsat__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dq__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qv__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    t2__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sink__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    q_liq__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629000175696_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628997141904_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    q_plus__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    lcpk__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tin__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dqsdt__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sink__8ee_371_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628997814480_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qlz__8ee_371_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dqv__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    tz__39c_342_47_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139629000418448_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139629000355408_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    mask_139628984679120_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qrz__1a5_427_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628985091344_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    dl__1a5_427_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    mask_139628984676752_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    t_wfr__1a5_427_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qc__1a5_427_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    sink__1a5_427_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    use_ccn__1a5_427_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), bool, (0, 0, 0))
+    qlz__1a5_427_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    dq__1a5_427_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    qc0__1a5_427_23_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        dz1[i:I, j:J, k:K] = np.where(np.bitwise_and(is_first, bool(bool(False))), dz0[i:I, j:J, k:K], dz1[i:I, j:J, k:K])
+        den[i:I, j:J, k:K] = np.where(np.bitwise_and(is_first, bool(bool(False))), den0[i:I, j:J, k:K], den[i:I, j:J, k:K])
+        denfac[i:I, j:J, k:K] = np.where(np.bitwise_and(is_first, bool(bool(False))), np.sqrt((np.float64(1.2) / den[i:I, j:J, k:K])), denfac[i:I, j:J, k:K])
+        dz1[i:I, j:J, k:K] = np.where(np.bitwise_and(is_first, (np.bitwise_not(bool(bool(False))))), ((dz0[i:I, j:J, k:K] * tz[i:I, j:J, k:K]) / t0[i:I, j:J, k:K]), dz1[i:I, j:J, k:K])
+        den[i:I, j:J, k:K] = np.where(np.bitwise_and(is_first, (np.bitwise_not(bool(bool(False))))), ((den0[i:I, j:J, k:K] * dz0[i:I, j:J, k:K]) / dz1[i:I, j:J, k:K]), den[i:I, j:J, k:K])
+        denfac[i:I, j:J, k:K] = np.where(np.bitwise_and(is_first, (np.bitwise_not(bool(bool(False))))), np.sqrt((np.float64(1.2) / den[i:I, j:J, k:K])), denfac[i:I, j:J, k:K])
+        dt5[i:I, j:J, k:K] = (np.float64(0.5) * dt_rain)
+        m1_rain[i:I, j:J, k:K] = np.float64(0.0)
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629005765776_gen_0[i:I, j:J, k_:k_ + 1] = (qrz[i:I, j:J, k_:k_ + 1] > np.float64(1e-08))
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(mask_139629005765776_gen_0[i:I, j:J, k_:k_ + 1], np.int64(0), no_fall[i:I, j:J, k_:k_ + 1])
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629005765776_gen_0[i:I, j:J, k_:k_ + 1])), np.int64(1), no_fall[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629007938000_gen_0[i:I, j:J, k_:k_ + 1] = (no_fall[i:I, j:J, k_ - 1:k_] == np.int64(1))
+            mask_139629004722896_gen_0[i:I, j:J, k_:k_ + 1] = (qrz[i:I, j:J, k_:k_ + 1] > np.float64(1e-08))
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629007938000_gen_0[i:I, j:J, k_:k_ + 1], mask_139629004722896_gen_0[i:I, j:J, k_:k_ + 1]), np.int64(0), no_fall[i:I, j:J, k_:k_ + 1])
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(mask_139629007938000_gen_0[i:I, j:J, k_:k_ + 1], (np.bitwise_not(mask_139629004722896_gen_0[i:I, j:J, k_:k_ + 1]))), np.int64(1), no_fall[i:I, j:J, k_:k_ + 1])
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where((np.bitwise_not(mask_139629007938000_gen_0[i:I, j:J, k_:k_ + 1])), np.int64(0), no_fall[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629004724432_gen_0[i:I, j:J, k_:k_ + 1] = (no_fall[i:I, j:J, k_ + 1:k_ + 2] == np.int64(0))
+            no_fall[i:I, j:J, k_:k_ + 1] = np.where(mask_139629004724432_gen_0[i:I, j:J, k_:k_ + 1], no_fall[i:I, j:J, k_ + 1:k_ + 2], no_fall[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629021706896_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(1))
+        vtrz__f66_103_19_gen_0[i:I, j:J, k:K] = np.where(mask_139629021706896_gen_0[i:I, j:J, k:K], np.float64(1e-05), vtrz__f66_103_19_gen_0[i:I, j:J, k:K])
+        r1__f66_103_19_gen_0[i:I, j:J, k:K] = np.where(mask_139629021706896_gen_0[i:I, j:J, k:K], np.float64(0.0), r1__f66_103_19_gen_0[i:I, j:J, k:K])
+        vtrz__f66_103_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629021706896_gen_0[i:I, j:J, k:K])), bool(bool(False))), np.float64(1.0), vtrz__f66_103_19_gen_0[i:I, j:J, k:K])
+        qden__f66_103_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.bitwise_not(mask_139629021706896_gen_0[i:I, j:J, k:K])), (np.bitwise_not(bool(bool(False))))), (qrz[i:I, j:J, k:K] * den[i:I, j:J, k:K]), qden__f66_103_19_gen_0[i:I, j:J, k:K])
+        mask_139629004731152_gen_0[i:I, j:J, k:K] = (qrz[i:I, j:J, k:K] < np.float64(1e-08))
+        vtrz__f66_103_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_139629021706896_gen_0[i:I, j:J, k:K])), (np.bitwise_not(bool(bool(False))))), mask_139629004731152_gen_0[i:I, j:J, k:K]), np.float64(0.001), vtrz__f66_103_19_gen_0[i:I, j:J, k:K])
+        vtrz__f66_103_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_139629021706896_gen_0[i:I, j:J, k:K])), (np.bitwise_not(bool(bool(False))))), (np.bitwise_not(mask_139629004731152_gen_0[i:I, j:J, k:K]))), (((np.float64(1.0) * np.float64(2503.23638966667)) * np.sqrt(np.minimum(np.float64(10.0), (np.float64(1.2) / den[i:I, j:J, k:K])))) * np.exp((np.float64(0.2) * np.log((qden__f66_103_19_gen_0[i:I, j:J, k:K] / np.float64(25132741228.7183)))))), vtrz__f66_103_19_gen_0[i:I, j:J, k:K])
+        vtrz__f66_103_19_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.bitwise_not(mask_139629021706896_gen_0[i:I, j:J, k:K])), (np.bitwise_not(bool(bool(False))))), (np.bitwise_not(mask_139629004731152_gen_0[i:I, j:J, k:K]))), np.minimum(np.float64(16.0), np.maximum(np.float64(0.001), vtrz__f66_103_19_gen_0[i:I, j:J, k:K])), vtrz__f66_103_19_gen_0[i:I, j:J, k:K])
+        vtrz[i:I, j:J, k:K] = vtrz__f66_103_19_gen_0[i:I, j:J, k:K]
+        r1[i:I, j:J, k:K] = r1__f66_103_19_gen_0[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629005763856_gen_0[i:I, j:J, k_:k_ + 1] = (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0))
+            ze[i:I, j:J, k_:k_ + 1] = np.where(mask_139629005763856_gen_0[i:I, j:J, k_:k_ + 1], (zs - dz1[i:I, j:J, k_:k_ + 1]), ze[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629005757008_gen_0[i:I, j:J, k_:k_ + 1] = (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0))
+            ze[i:I, j:J, k_:k_ + 1] = np.where(mask_139629005757008_gen_0[i:I, j:J, k_:k_ + 1], (ze[i:I, j:J, k_ + 1:k_ + 2] - dz1[i:I, j:J, k_:k_ + 1]), ze[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628995580880_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(0))
+        t_wfr__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(mask_139628995580880_gen_0[i:I, j:J, k:K], np.float64(233.16000000000003), t_wfr__39c_122_47_gen_0[i:I, j:J, k:K])
+        ql__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(mask_139628995580880_gen_0[i:I, j:J, k:K], qlz[i:I, j:J, k:K], ql__39c_122_47_gen_0[i:I, j:J, k:K])
+        qr__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(mask_139628995580880_gen_0[i:I, j:J, k:K], qrz[i:I, j:J, k:K], qr__39c_122_47_gen_0[i:I, j:J, k:K])
+        qv__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(mask_139628995580880_gen_0[i:I, j:J, k:K], qvz[i:I, j:J, k:K], qv__39c_122_47_gen_0[i:I, j:J, k:K])
+        tz__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(mask_139628995580880_gen_0[i:I, j:J, k:K], tz[i:I, j:J, k:K], tz__39c_122_47_gen_0[i:I, j:J, k:K])
+        mask_139628995576976_gen_0[i:I, j:J, k:K] = np.bitwise_and((tz__39c_122_47_gen_0[i:I, j:J, k:K] > t_wfr__39c_122_47_gen_0[i:I, j:J, k:K]), (qr__39c_122_47_gen_0[i:I, j:J, k:K] > np.float64(1e-08)))
+        lhl__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), (lv00 + (d0_vap * tz__39c_122_47_gen_0[i:I, j:J, k:K])), lhl__39c_122_47_gen_0[i:I, j:J, k:K])
+        q_liq__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), (ql__39c_122_47_gen_0[i:I, j:J, k:K] + qr__39c_122_47_gen_0[i:I, j:J, k:K]), q_liq__39c_122_47_gen_0[i:I, j:J, k:K])
+        q_sol__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), ((qiz[i:I, j:J, k:K] + qsz[i:I, j:J, k:K]) + qgz[i:I, j:J, k:K]), q_sol__39c_122_47_gen_0[i:I, j:J, k:K])
+        cvm__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), (((c_air + (qv__39c_122_47_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__39c_122_47_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__39c_122_47_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__39c_122_47_gen_0[i:I, j:J, k:K])
+        lcpk__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), (lhl__39c_122_47_gen_0[i:I, j:J, k:K] / cvm__39c_122_47_gen_0[i:I, j:J, k:K]), lcpk__39c_122_47_gen_0[i:I, j:J, k:K])
+        tin__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), (tz__39c_122_47_gen_0[i:I, j:J, k:K] - (lcpk__39c_122_47_gen_0[i:I, j:J, k:K] * ql__39c_122_47_gen_0[i:I, j:J, k:K])), tin__39c_122_47_gen_0[i:I, j:J, k:K])
+        qpz__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), (qv__39c_122_47_gen_0[i:I, j:J, k:K] + ql__39c_122_47_gen_0[i:I, j:J, k:K]), qpz__39c_122_47_gen_0[i:I, j:J, k:K])
+        tmp__d4a_40_22__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((tin__39c_122_47_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (tin__39c_122_47_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tin__39c_122_47_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tin__39c_122_47_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__d4a_40_22__39c_122_47_gen_0[i:I, j:J, k:K])
+        qsat__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), tmp__d4a_40_22__39c_122_47_gen_0[i:I, j:J, k:K], qsat__39c_122_47_gen_0[i:I, j:J, k:K])
+        dqsdt__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), ((tmp__d4a_40_22__39c_122_47_gen_0[i:I, j:J, k:K] * (np.float64(-2339.5) + (np.float64(3139057.8200000003) / tin__39c_122_47_gen_0[i:I, j:J, k:K]))) / (np.float64(461.5) * tin__39c_122_47_gen_0[i:I, j:J, k:K])), dqsdt__39c_122_47_gen_0[i:I, j:J, k:K])
+        dqh__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), np.maximum(ql__39c_122_47_gen_0[i:I, j:J, k:K], (h_var[i:I, j:J, k:K] * np.maximum(qpz__39c_122_47_gen_0[i:I, j:J, k:K], np.float64(1e-12)))), dqh__39c_122_47_gen_0[i:I, j:J, k:K])
+        dqh__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), np.minimum(dqh__39c_122_47_gen_0[i:I, j:J, k:K], (np.float64(0.2) * qpz__39c_122_47_gen_0[i:I, j:J, k:K])), dqh__39c_122_47_gen_0[i:I, j:J, k:K])
+        dqv__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), (qsat__39c_122_47_gen_0[i:I, j:J, k:K] - qv__39c_122_47_gen_0[i:I, j:J, k:K]), dqv__39c_122_47_gen_0[i:I, j:J, k:K])
+        q_minus__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), (qpz__39c_122_47_gen_0[i:I, j:J, k:K] - dqh__39c_122_47_gen_0[i:I, j:J, k:K]), q_minus__39c_122_47_gen_0[i:I, j:J, k:K])
+        q_plus__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), (qpz__39c_122_47_gen_0[i:I, j:J, k:K] + dqh__39c_122_47_gen_0[i:I, j:J, k:K]), q_plus__39c_122_47_gen_0[i:I, j:J, k:K])
+        mask_139628996873040_gen_0[i:I, j:J, k:K] = np.bitwise_and((dqv__39c_122_47_gen_0[i:I, j:J, k:K] > np.float64(1e-20)), (qsat__39c_122_47_gen_0[i:I, j:J, k:K] > q_minus__39c_122_47_gen_0[i:I, j:J, k:K]))
+        mask_139628997718032_gen_0[i:I, j:J, k:K] = (qsat__39c_122_47_gen_0[i:I, j:J, k:K] > q_plus__39c_122_47_gen_0[i:I, j:J, k:K])
+        dq__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628996873040_gen_0[i:I, j:J, k:K]), mask_139628997718032_gen_0[i:I, j:J, k:K]), (qsat__39c_122_47_gen_0[i:I, j:J, k:K] - qpz__39c_122_47_gen_0[i:I, j:J, k:K]), dq__39c_122_47_gen_0[i:I, j:J, k:K])
+        dq__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628996873040_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628997718032_gen_0[i:I, j:J, k:K]))), ((np.float64(0.25) * np.power((q_minus__39c_122_47_gen_0[i:I, j:J, k:K] - qsat__39c_122_47_gen_0[i:I, j:J, k:K]), np.float64(np.int64(2)))) / dqh__39c_122_47_gen_0[i:I, j:J, k:K]), dq__39c_122_47_gen_0[i:I, j:J, k:K])
+        qden__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628996873040_gen_0[i:I, j:J, k:K]), (qr__39c_122_47_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K]), qden__39c_122_47_gen_0[i:I, j:J, k:K])
+        t2__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628996873040_gen_0[i:I, j:J, k:K]), (tin__39c_122_47_gen_0[i:I, j:J, k:K] * tin__39c_122_47_gen_0[i:I, j:J, k:K]), t2__39c_122_47_gen_0[i:I, j:J, k:K])
+        evap__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628996873040_gen_0[i:I, j:J, k:K]), ((((crevp_0 * t2__39c_122_47_gen_0[i:I, j:J, k:K]) * dq__39c_122_47_gen_0[i:I, j:J, k:K]) * ((crevp_1 * np.sqrt(qden__39c_122_47_gen_0[i:I, j:J, k:K])) + (crevp_2 * np.exp((np.float64(0.725) * np.log(qden__39c_122_47_gen_0[i:I, j:J, k:K])))))) / ((crevp_3 * t2__39c_122_47_gen_0[i:I, j:J, k:K]) + ((crevp_4 * qsat__39c_122_47_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K]))), evap__39c_122_47_gen_0[i:I, j:J, k:K])
+        evap__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628996873040_gen_0[i:I, j:J, k:K]), np.minimum(qr__39c_122_47_gen_0[i:I, j:J, k:K], np.minimum((dt5[i:I, j:J, k:K] * evap__39c_122_47_gen_0[i:I, j:J, k:K]), (dqv__39c_122_47_gen_0[i:I, j:J, k:K] / (np.float64(1.0) + (lcpk__39c_122_47_gen_0[i:I, j:J, k:K] * dqsdt__39c_122_47_gen_0[i:I, j:J, k:K]))))), evap__39c_122_47_gen_0[i:I, j:J, k:K])
+        qr__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628996873040_gen_0[i:I, j:J, k:K]), (qr__39c_122_47_gen_0[i:I, j:J, k:K] - evap__39c_122_47_gen_0[i:I, j:J, k:K]), qr__39c_122_47_gen_0[i:I, j:J, k:K])
+        qv__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628996873040_gen_0[i:I, j:J, k:K]), (qv__39c_122_47_gen_0[i:I, j:J, k:K] + evap__39c_122_47_gen_0[i:I, j:J, k:K]), qv__39c_122_47_gen_0[i:I, j:J, k:K])
+        q_liq__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628996873040_gen_0[i:I, j:J, k:K]), (q_liq__39c_122_47_gen_0[i:I, j:J, k:K] - evap__39c_122_47_gen_0[i:I, j:J, k:K]), q_liq__39c_122_47_gen_0[i:I, j:J, k:K])
+        cvm__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628996873040_gen_0[i:I, j:J, k:K]), (((c_air + (qv__39c_122_47_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__39c_122_47_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__39c_122_47_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__39c_122_47_gen_0[i:I, j:J, k:K])
+        tz__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628996873040_gen_0[i:I, j:J, k:K]), (tz__39c_122_47_gen_0[i:I, j:J, k:K] - ((evap__39c_122_47_gen_0[i:I, j:J, k:K] * lhl__39c_122_47_gen_0[i:I, j:J, k:K]) / cvm__39c_122_47_gen_0[i:I, j:J, k:K])), tz__39c_122_47_gen_0[i:I, j:J, k:K])
+        mask_139628995582672_gen_0[i:I, j:J, k:K] = np.bitwise_and((qr__39c_122_47_gen_0[i:I, j:J, k:K] > np.float64(1e-08)), np.bitwise_and((ql__39c_122_47_gen_0[i:I, j:J, k:K] > np.float64(1e-06)), (qsat__39c_122_47_gen_0[i:I, j:J, k:K] < q_minus__39c_122_47_gen_0[i:I, j:J, k:K])))
+        sink__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628995582672_gen_0[i:I, j:J, k:K]), (((dt5[i:I, j:J, k:K] * denfac[i:I, j:J, k:K]) * cracw) * np.exp((np.float64(0.95) * np.log((qr__39c_122_47_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K]))))), sink__39c_122_47_gen_0[i:I, j:J, k:K])
+        sink__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628995582672_gen_0[i:I, j:J, k:K]), ((sink__39c_122_47_gen_0[i:I, j:J, k:K] / (np.float64(1.0) + sink__39c_122_47_gen_0[i:I, j:J, k:K])) * ql__39c_122_47_gen_0[i:I, j:J, k:K]), sink__39c_122_47_gen_0[i:I, j:J, k:K])
+        ql__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628995582672_gen_0[i:I, j:J, k:K]), (ql__39c_122_47_gen_0[i:I, j:J, k:K] - sink__39c_122_47_gen_0[i:I, j:J, k:K]), ql__39c_122_47_gen_0[i:I, j:J, k:K])
+        qr__39c_122_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], mask_139628995576976_gen_0[i:I, j:J, k:K]), mask_139628995582672_gen_0[i:I, j:J, k:K]), (qr__39c_122_47_gen_0[i:I, j:J, k:K] + sink__39c_122_47_gen_0[i:I, j:J, k:K]), qr__39c_122_47_gen_0[i:I, j:J, k:K])
+        qgz[i:I, j:J, k:K] = np.where(mask_139628995580880_gen_0[i:I, j:J, k:K], qgz[i:I, j:J, k:K], qgz[i:I, j:J, k:K])
+        qiz[i:I, j:J, k:K] = np.where(mask_139628995580880_gen_0[i:I, j:J, k:K], qiz[i:I, j:J, k:K], qiz[i:I, j:J, k:K])
+        qlz[i:I, j:J, k:K] = np.where(mask_139628995580880_gen_0[i:I, j:J, k:K], ql__39c_122_47_gen_0[i:I, j:J, k:K], qlz[i:I, j:J, k:K])
+        qrz[i:I, j:J, k:K] = np.where(mask_139628995580880_gen_0[i:I, j:J, k:K], qr__39c_122_47_gen_0[i:I, j:J, k:K], qrz[i:I, j:J, k:K])
+        qsz[i:I, j:J, k:K] = np.where(mask_139628995580880_gen_0[i:I, j:J, k:K], qsz[i:I, j:J, k:K], qsz[i:I, j:J, k:K])
+        qvz[i:I, j:J, k:K] = np.where(mask_139628995580880_gen_0[i:I, j:J, k:K], qv__39c_122_47_gen_0[i:I, j:J, k:K], qvz[i:I, j:J, k:K])
+        tz[i:I, j:J, k:K] = np.where(mask_139628995580880_gen_0[i:I, j:J, k:K], tz__39c_122_47_gen_0[i:I, j:J, k:K], tz[i:I, j:J, k:K])
+        dm[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628995580880_gen_0[i:I, j:J, k:K], bool(bool(True))), (dp1[i:I, j:J, k:K] * ((((((np.float64(1.0) + qvz[i:I, j:J, k:K]) + qlz[i:I, j:J, k:K]) + qrz[i:I, j:J, k:K]) + qiz[i:I, j:J, k:K]) + qsz[i:I, j:J, k:K]) + qgz[i:I, j:J, k:K])), dm[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628998638288_gen_0[i:I, j:J, k:K] = np.bitwise_and(bool(bool(False)), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        zt[i:I, j:J, k:K] = np.where(mask_139628998638288_gen_0[i:I, j:J, k:K], ze[i:I, j:J, k:K], zt[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628983950416_gen_0[i:I, j:J, k:K] = np.bitwise_and(bool(bool(False)), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        zt[i:I, j:J, k:K] = np.where(mask_139628983950416_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - (dt5[i:I, j:J, k:K] * (vtrz[i:I, j:J, k - 1:K - 1] + vtrz[i:I, j:J, k:K]))), zt[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628999150480_gen_0[i:I, j:J, k:K] = np.bitwise_and(bool(bool(False)), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        zt[i:I, j:J, k:K] = np.where(mask_139628999150480_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - (dt5[i:I, j:J, k:K] * (vtrz[i:I, j:J, k - 1:K - 1] + vtrz[i:I, j:J, k:K]))), zt[i:I, j:J, k:K])
+        zt_kbot1[i:I, j:J, k:K] = np.where(mask_139628999150480_gen_0[i:I, j:J, k:K], (zs - (dt_rain * vtrz[i:I, j:J, k:K])), zt_kbot1[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628998765968_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and(bool(bool(False)), np.bitwise_and((no_fall[i:I, j:J, k_ - 1:k_] == np.int64(0)), (zt[i:I, j:J, k_:k_ + 1] >= zt[i:I, j:J, k_ - 1:k_])))
+            zt[i:I, j:J, k_:k_ + 1] = np.where(mask_139628998765968_gen_0[i:I, j:J, k_:k_ + 1], (zt[i:I, j:J, k_ - 1:k_] - np.float64(0.01)), zt[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628983948624_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((no_fall[i:I, j:J, k_ - 1:k_] == np.int64(0)), (zt[i:I, j:J, k_:k_ + 1] >= zt[i:I, j:J, k_ - 1:k_]))
+            zt[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(bool(bool(False)), mask_139628983948624_gen_0[i:I, j:J, k_:k_ + 1]), (zt[i:I, j:J, k_ - 1:k_] - np.float64(0.01)), zt[i:I, j:J, k_:k_ + 1])
+            mask_139628983349520_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)), (zt_kbot1[i:I, j:J, k_:k_ + 1] >= zt[i:I, j:J, k_:k_ + 1]))
+            zt_kbot1[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and(bool(bool(False)), mask_139628983349520_gen_0[i:I, j:J, k_:k_ + 1]), (zt[i:I, j:J, k_:k_ + 1] - np.float64(0.01)), zt_kbot1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628998638608_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and(bool(bool(False)), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            zt_kbot1[i:I, j:J, k_:k_ + 1] = np.where(mask_139628998638608_gen_0[i:I, j:J, k_:k_ + 1], zt_kbot1[i:I, j:J, k_ + 1:k_ + 2], zt_kbot1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628999480016_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        dz[i:I, j:J, k:K] = np.where(mask_139628999480016_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - ze[i:I, j:J, k + 1:K + 1]), dz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628983352016_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        dz[i:I, j:J, k:K] = np.where(mask_139628983352016_gen_0[i:I, j:J, k:K], (ze[i:I, j:J, k:K] - zs), dz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629000429520_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        dd[i:I, j:J, k:K] = np.where(mask_139629000429520_gen_0[i:I, j:J, k:K], (dt_rain * vtrz[i:I, j:J, k:K]), dd[i:I, j:J, k:K])
+        qrz[i:I, j:J, k:K] = np.where(mask_139629000429520_gen_0[i:I, j:J, k:K], (qrz[i:I, j:J, k:K] * dp1[i:I, j:J, k:K]), qrz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628996819088_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            qm[i:I, j:J, k_:k_ + 1] = np.where(mask_139628996819088_gen_0[i:I, j:J, k_:k_ + 1], (qrz[i:I, j:J, k_:k_ + 1] / (dz[i:I, j:J, k_:k_ + 1] + dd[i:I, j:J, k_:k_ + 1])), qm[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628996808528_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            qm[i:I, j:J, k_:k_ + 1] = np.where(mask_139628996808528_gen_0[i:I, j:J, k_:k_ + 1], ((qrz[i:I, j:J, k_:k_ + 1] + (dd[i:I, j:J, k_ - 1:k_] * qm[i:I, j:J, k_ - 1:k_])) / (dz[i:I, j:J, k_:k_ + 1] + dd[i:I, j:J, k_:k_ + 1])), qm[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628998757648_gen_0[i:I, j:J, k:K] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        qm[i:I, j:J, k:K] = np.where(mask_139628998757648_gen_0[i:I, j:J, k:K], (qm[i:I, j:J, k:K] * dz[i:I, j:J, k:K]), qm[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629006113680_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            m1_rain[i:I, j:J, k_:k_ + 1] = np.where(mask_139629006113680_gen_0[i:I, j:J, k_:k_ + 1], (qrz[i:I, j:J, k_:k_ + 1] - qm[i:I, j:J, k_:k_ + 1]), m1_rain[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628986977360_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            m1_rain[i:I, j:J, k_:k_ + 1] = np.where(mask_139628986977360_gen_0[i:I, j:J, k_:k_ + 1], ((m1_rain[i:I, j:J, k_ - 1:k_] + qrz[i:I, j:J, k_:k_ + 1]) - qm[i:I, j:J, k_:k_ + 1]), m1_rain[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629006111376_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            r1[i:I, j:J, k_:k_ + 1] = np.where(mask_139629006111376_gen_0[i:I, j:J, k_:k_ + 1], m1_rain[i:I, j:J, k_:k_ + 1], r1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+        for k_ in range(K-1, k-1, -1):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139628983949648_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and((np.bitwise_not(bool(bool(False)))), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            r1[i:I, j:J, k_:k_ + 1] = np.where(mask_139628983949648_gen_0[i:I, j:J, k_:k_ + 1], r1[i:I, j:J, k_ + 1:k_ + 2], r1[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629004725392_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(0))
+        qrz[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629004725392_gen_0[i:I, j:J, k:K], (np.bitwise_not(bool(bool(False))))), (qm[i:I, j:J, k:K] / dp1[i:I, j:J, k:K]), qrz[i:I, j:J, k:K])
+        w[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629004725392_gen_0[i:I, j:J, k:K], bool(bool(True))), (((dm[i:I, j:J, k:K] * w[i:I, j:J, k:K]) + (m1_rain[i:I, j:J, k:K] * vtrz[i:I, j:J, k:K])) / (dm[i:I, j:J, k:K] - m1_rain[i:I, j:J, k:K])), w[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628985141008_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(0))
+        qrz[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628985141008_gen_0[i:I, j:J, k:K], (np.bitwise_not(bool(bool(False))))), (qm[i:I, j:J, k:K] / dp1[i:I, j:J, k:K]), qrz[i:I, j:J, k:K])
+        w[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139628985141008_gen_0[i:I, j:J, k:K], bool(bool(True))), ((((dm[i:I, j:J, k:K] * w[i:I, j:J, k:K]) - (m1_rain[i:I, j:J, k - 1:K - 1] * vtrz[i:I, j:J, k - 1:K - 1])) + (m1_rain[i:I, j:J, k:K] * vtrz[i:I, j:J, k:K])) / ((dm[i:I, j:J, k:K] + m1_rain[i:I, j:J, k - 1:K - 1]) - m1_rain[i:I, j:J, k:K])), w[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629003956176_gen_0[i:I, j:J, k:K] = np.bitwise_and(bool(bool(False)), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        dgz[i:I, j:J, k:K] = np.where(mask_139629003956176_gen_0[i:I, j:J, k:K], (((-(np.float64(0.5))) * np.float64(9.80665)) * dz1[i:I, j:J, k:K]), dgz[i:I, j:J, k:K])
+        cvn[i:I, j:J, k:K] = np.where(mask_139629003956176_gen_0[i:I, j:J, k:K], (dp1[i:I, j:J, k:K] * (((np.float64(717.55) + (qvz[i:I, j:J, k:K] * np.float64(1384.5))) + ((qrz[i:I, j:J, k:K] + qlz[i:I, j:J, k:K]) * np.float64(4185.5))) + (((qiz[i:I, j:J, k:K] + qsz[i:I, j:J, k:K]) + qgz[i:I, j:J, k:K]) * np.float64(1972.0)))), cvn[i:I, j:J, k:K])
+        tmp_gen_0[i:I, j:J, k:K] = np.where(mask_139629003956176_gen_0[i:I, j:J, k:K], (cvn[i:I, j:J, k:K] + (m1_rain[i:I, j:J, k:K] * np.float64(4185.5))), tmp_gen_0[i:I, j:J, k:K])
+        tz[i:I, j:J, k:K] = np.where(mask_139629003956176_gen_0[i:I, j:J, k:K], (tz[i:I, j:J, k:K] + ((m1_rain[i:I, j:J, k:K] * dgz[i:I, j:J, k:K]) / tmp_gen_0[i:I, j:J, k:K])), tz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139628981638800_gen_0[i:I, j:J, k:K] = np.bitwise_and(bool(bool(False)), (no_fall[i:I, j:J, k:K] == np.int64(0)))
+        dgz[i:I, j:J, k:K] = np.where(mask_139628981638800_gen_0[i:I, j:J, k:K], (((-(np.float64(0.5))) * np.float64(9.80665)) * dz1[i:I, j:J, k:K]), dgz[i:I, j:J, k:K])
+        cvn[i:I, j:J, k:K] = np.where(mask_139628981638800_gen_0[i:I, j:J, k:K], (dp1[i:I, j:J, k:K] * (((np.float64(717.55) + (qvz[i:I, j:J, k:K] * np.float64(1384.5))) + ((qrz[i:I, j:J, k:K] + qlz[i:I, j:J, k:K]) * np.float64(4185.5))) + (((qiz[i:I, j:J, k:K] + qsz[i:I, j:J, k:K]) + qgz[i:I, j:J, k:K]) * np.float64(1972.0)))), cvn[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            mask_139629022210064_gen_0[i:I, j:J, k_:k_ + 1] = np.bitwise_and(bool(bool(False)), (no_fall[i:I, j:J, k_:k_ + 1] == np.int64(0)))
+            tz[i:I, j:J, k_:k_ + 1] = np.where(mask_139629022210064_gen_0[i:I, j:J, k_:k_ + 1], (((((cvn[i:I, j:J, k_:k_ + 1] + (np.float64(4185.5) * (m1_rain[i:I, j:J, k_:k_ + 1] - m1_rain[i:I, j:J, k_ - 1:k_]))) * tz[i:I, j:J, k_:k_ + 1]) + ((m1_rain[i:I, j:J, k_ - 1:k_] * np.float64(4185.5)) * tz[i:I, j:J, k_ - 1:k_])) + (dgz[i:I, j:J, k_:k_ + 1] * (m1_rain[i:I, j:J, k_ - 1:k_] + m1_rain[i:I, j:J, k_:k_ + 1]))) / (cvn[i:I, j:J, k_:k_ + 1] + (np.float64(4185.5) * m1_rain[i:I, j:J, k_:k_ + 1]))), tz[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        mask_139629006694864_gen_0[i:I, j:J, k:K] = (no_fall[i:I, j:J, k:K] == np.int64(0))
+        t_wfr__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(mask_139629006694864_gen_0[i:I, j:J, k:K], np.float64(233.16000000000003), t_wfr__39c_342_47_gen_0[i:I, j:J, k:K])
+        ql__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(mask_139629006694864_gen_0[i:I, j:J, k:K], qlz[i:I, j:J, k:K], ql__39c_342_47_gen_0[i:I, j:J, k:K])
+        qr__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(mask_139629006694864_gen_0[i:I, j:J, k:K], qrz[i:I, j:J, k:K], qr__39c_342_47_gen_0[i:I, j:J, k:K])
+        qv__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(mask_139629006694864_gen_0[i:I, j:J, k:K], qvz[i:I, j:J, k:K], qv__39c_342_47_gen_0[i:I, j:J, k:K])
+        tz__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(mask_139629006694864_gen_0[i:I, j:J, k:K], tz[i:I, j:J, k:K], tz__39c_342_47_gen_0[i:I, j:J, k:K])
+        mask_139629000175696_gen_0[i:I, j:J, k:K] = np.bitwise_and((tz__39c_342_47_gen_0[i:I, j:J, k:K] > t_wfr__39c_342_47_gen_0[i:I, j:J, k:K]), (qr__39c_342_47_gen_0[i:I, j:J, k:K] > np.float64(1e-08)))
+        lhl__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), (lv00 + (d0_vap * tz__39c_342_47_gen_0[i:I, j:J, k:K])), lhl__39c_342_47_gen_0[i:I, j:J, k:K])
+        q_liq__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), (ql__39c_342_47_gen_0[i:I, j:J, k:K] + qr__39c_342_47_gen_0[i:I, j:J, k:K]), q_liq__39c_342_47_gen_0[i:I, j:J, k:K])
+        q_sol__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), ((qiz[i:I, j:J, k:K] + qsz[i:I, j:J, k:K]) + qgz[i:I, j:J, k:K]), q_sol__39c_342_47_gen_0[i:I, j:J, k:K])
+        cvm__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), (((c_air + (qv__39c_342_47_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__39c_342_47_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__39c_342_47_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__39c_342_47_gen_0[i:I, j:J, k:K])
+        lcpk__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), (lhl__39c_342_47_gen_0[i:I, j:J, k:K] / cvm__39c_342_47_gen_0[i:I, j:J, k:K]), lcpk__39c_342_47_gen_0[i:I, j:J, k:K])
+        tin__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), (tz__39c_342_47_gen_0[i:I, j:J, k:K] - (lcpk__39c_342_47_gen_0[i:I, j:J, k:K] * ql__39c_342_47_gen_0[i:I, j:J, k:K])), tin__39c_342_47_gen_0[i:I, j:J, k:K])
+        qpz__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), (qv__39c_342_47_gen_0[i:I, j:J, k:K] + ql__39c_342_47_gen_0[i:I, j:J, k:K]), qpz__39c_342_47_gen_0[i:I, j:J, k:K])
+        tmp__d4a_40_22__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), ((np.float64(611.21) * np.exp((((np.float64(-2339.5) * np.log((tin__39c_342_47_gen_0[i:I, j:J, k:K] / np.float64(273.16)))) + ((np.float64(3139057.8200000003) * (tin__39c_342_47_gen_0[i:I, j:J, k:K] - np.float64(273.16))) / (tin__39c_342_47_gen_0[i:I, j:J, k:K] * np.float64(273.16)))) / np.float64(461.5)))) / ((np.float64(461.5) * tin__39c_342_47_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K])), tmp__d4a_40_22__39c_342_47_gen_0[i:I, j:J, k:K])
+        qsat__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), tmp__d4a_40_22__39c_342_47_gen_0[i:I, j:J, k:K], qsat__39c_342_47_gen_0[i:I, j:J, k:K])
+        dqsdt__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), ((tmp__d4a_40_22__39c_342_47_gen_0[i:I, j:J, k:K] * (np.float64(-2339.5) + (np.float64(3139057.8200000003) / tin__39c_342_47_gen_0[i:I, j:J, k:K]))) / (np.float64(461.5) * tin__39c_342_47_gen_0[i:I, j:J, k:K])), dqsdt__39c_342_47_gen_0[i:I, j:J, k:K])
+        dqh__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), np.maximum(ql__39c_342_47_gen_0[i:I, j:J, k:K], (h_var[i:I, j:J, k:K] * np.maximum(qpz__39c_342_47_gen_0[i:I, j:J, k:K], np.float64(1e-12)))), dqh__39c_342_47_gen_0[i:I, j:J, k:K])
+        dqh__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), np.minimum(dqh__39c_342_47_gen_0[i:I, j:J, k:K], (np.float64(0.2) * qpz__39c_342_47_gen_0[i:I, j:J, k:K])), dqh__39c_342_47_gen_0[i:I, j:J, k:K])
+        dqv__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), (qsat__39c_342_47_gen_0[i:I, j:J, k:K] - qv__39c_342_47_gen_0[i:I, j:J, k:K]), dqv__39c_342_47_gen_0[i:I, j:J, k:K])
+        q_minus__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), (qpz__39c_342_47_gen_0[i:I, j:J, k:K] - dqh__39c_342_47_gen_0[i:I, j:J, k:K]), q_minus__39c_342_47_gen_0[i:I, j:J, k:K])
+        q_plus__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), (qpz__39c_342_47_gen_0[i:I, j:J, k:K] + dqh__39c_342_47_gen_0[i:I, j:J, k:K]), q_plus__39c_342_47_gen_0[i:I, j:J, k:K])
+        mask_139628997814480_gen_0[i:I, j:J, k:K] = np.bitwise_and((dqv__39c_342_47_gen_0[i:I, j:J, k:K] > np.float64(1e-20)), (qsat__39c_342_47_gen_0[i:I, j:J, k:K] > q_minus__39c_342_47_gen_0[i:I, j:J, k:K]))
+        mask_139628997141904_gen_0[i:I, j:J, k:K] = (qsat__39c_342_47_gen_0[i:I, j:J, k:K] > q_plus__39c_342_47_gen_0[i:I, j:J, k:K])
+        dq__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628997814480_gen_0[i:I, j:J, k:K]), mask_139628997141904_gen_0[i:I, j:J, k:K]), (qsat__39c_342_47_gen_0[i:I, j:J, k:K] - qpz__39c_342_47_gen_0[i:I, j:J, k:K]), dq__39c_342_47_gen_0[i:I, j:J, k:K])
+        dq__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628997814480_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628997141904_gen_0[i:I, j:J, k:K]))), ((np.float64(0.25) * np.power((q_minus__39c_342_47_gen_0[i:I, j:J, k:K] - qsat__39c_342_47_gen_0[i:I, j:J, k:K]), np.float64(np.int64(2)))) / dqh__39c_342_47_gen_0[i:I, j:J, k:K]), dq__39c_342_47_gen_0[i:I, j:J, k:K])
+        qden__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628997814480_gen_0[i:I, j:J, k:K]), (qr__39c_342_47_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K]), qden__39c_342_47_gen_0[i:I, j:J, k:K])
+        t2__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628997814480_gen_0[i:I, j:J, k:K]), (tin__39c_342_47_gen_0[i:I, j:J, k:K] * tin__39c_342_47_gen_0[i:I, j:J, k:K]), t2__39c_342_47_gen_0[i:I, j:J, k:K])
+        evap__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628997814480_gen_0[i:I, j:J, k:K]), ((((crevp_0 * t2__39c_342_47_gen_0[i:I, j:J, k:K]) * dq__39c_342_47_gen_0[i:I, j:J, k:K]) * ((crevp_1 * np.sqrt(qden__39c_342_47_gen_0[i:I, j:J, k:K])) + (crevp_2 * np.exp((np.float64(0.725) * np.log(qden__39c_342_47_gen_0[i:I, j:J, k:K])))))) / ((crevp_3 * t2__39c_342_47_gen_0[i:I, j:J, k:K]) + ((crevp_4 * qsat__39c_342_47_gen_0[i:I, j:J, k:K]) * den[i:I, j:J, k:K]))), evap__39c_342_47_gen_0[i:I, j:J, k:K])
+        evap__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628997814480_gen_0[i:I, j:J, k:K]), np.minimum(qr__39c_342_47_gen_0[i:I, j:J, k:K], np.minimum((dt5[i:I, j:J, k:K] * evap__39c_342_47_gen_0[i:I, j:J, k:K]), (dqv__39c_342_47_gen_0[i:I, j:J, k:K] / (np.float64(1.0) + (lcpk__39c_342_47_gen_0[i:I, j:J, k:K] * dqsdt__39c_342_47_gen_0[i:I, j:J, k:K]))))), evap__39c_342_47_gen_0[i:I, j:J, k:K])
+        qr__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628997814480_gen_0[i:I, j:J, k:K]), (qr__39c_342_47_gen_0[i:I, j:J, k:K] - evap__39c_342_47_gen_0[i:I, j:J, k:K]), qr__39c_342_47_gen_0[i:I, j:J, k:K])
+        qv__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628997814480_gen_0[i:I, j:J, k:K]), (qv__39c_342_47_gen_0[i:I, j:J, k:K] + evap__39c_342_47_gen_0[i:I, j:J, k:K]), qv__39c_342_47_gen_0[i:I, j:J, k:K])
+        q_liq__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628997814480_gen_0[i:I, j:J, k:K]), (q_liq__39c_342_47_gen_0[i:I, j:J, k:K] - evap__39c_342_47_gen_0[i:I, j:J, k:K]), q_liq__39c_342_47_gen_0[i:I, j:J, k:K])
+        cvm__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628997814480_gen_0[i:I, j:J, k:K]), (((c_air + (qv__39c_342_47_gen_0[i:I, j:J, k:K] * c_vap)) + (q_liq__39c_342_47_gen_0[i:I, j:J, k:K] * np.float64(4185.5))) + (q_sol__39c_342_47_gen_0[i:I, j:J, k:K] * np.float64(1972.0))), cvm__39c_342_47_gen_0[i:I, j:J, k:K])
+        tz__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628997814480_gen_0[i:I, j:J, k:K]), (tz__39c_342_47_gen_0[i:I, j:J, k:K] - ((evap__39c_342_47_gen_0[i:I, j:J, k:K] * lhl__39c_342_47_gen_0[i:I, j:J, k:K]) / cvm__39c_342_47_gen_0[i:I, j:J, k:K])), tz__39c_342_47_gen_0[i:I, j:J, k:K])
+        mask_139628998572752_gen_0[i:I, j:J, k:K] = np.bitwise_and((qr__39c_342_47_gen_0[i:I, j:J, k:K] > np.float64(1e-08)), np.bitwise_and((ql__39c_342_47_gen_0[i:I, j:J, k:K] > np.float64(1e-06)), (qsat__39c_342_47_gen_0[i:I, j:J, k:K] < q_minus__39c_342_47_gen_0[i:I, j:J, k:K])))
+        sink__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628998572752_gen_0[i:I, j:J, k:K]), (((dt5[i:I, j:J, k:K] * denfac[i:I, j:J, k:K]) * cracw) * np.exp((np.float64(0.95) * np.log((qr__39c_342_47_gen_0[i:I, j:J, k:K] * den[i:I, j:J, k:K]))))), sink__39c_342_47_gen_0[i:I, j:J, k:K])
+        sink__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628998572752_gen_0[i:I, j:J, k:K]), ((sink__39c_342_47_gen_0[i:I, j:J, k:K] / (np.float64(1.0) + sink__39c_342_47_gen_0[i:I, j:J, k:K])) * ql__39c_342_47_gen_0[i:I, j:J, k:K]), sink__39c_342_47_gen_0[i:I, j:J, k:K])
+        ql__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628998572752_gen_0[i:I, j:J, k:K]), (ql__39c_342_47_gen_0[i:I, j:J, k:K] - sink__39c_342_47_gen_0[i:I, j:J, k:K]), ql__39c_342_47_gen_0[i:I, j:J, k:K])
+        qr__39c_342_47_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(mask_139629006694864_gen_0[i:I, j:J, k:K], mask_139629000175696_gen_0[i:I, j:J, k:K]), mask_139628998572752_gen_0[i:I, j:J, k:K]), (qr__39c_342_47_gen_0[i:I, j:J, k:K] + sink__39c_342_47_gen_0[i:I, j:J, k:K]), qr__39c_342_47_gen_0[i:I, j:J, k:K])
+        qgz[i:I, j:J, k:K] = np.where(mask_139629006694864_gen_0[i:I, j:J, k:K], qgz[i:I, j:J, k:K], qgz[i:I, j:J, k:K])
+        qiz[i:I, j:J, k:K] = np.where(mask_139629006694864_gen_0[i:I, j:J, k:K], qiz[i:I, j:J, k:K], qiz[i:I, j:J, k:K])
+        qlz[i:I, j:J, k:K] = np.where(mask_139629006694864_gen_0[i:I, j:J, k:K], ql__39c_342_47_gen_0[i:I, j:J, k:K], qlz[i:I, j:J, k:K])
+        qrz[i:I, j:J, k:K] = np.where(mask_139629006694864_gen_0[i:I, j:J, k:K], qr__39c_342_47_gen_0[i:I, j:J, k:K], qrz[i:I, j:J, k:K])
+        qsz[i:I, j:J, k:K] = np.where(mask_139629006694864_gen_0[i:I, j:J, k:K], qsz[i:I, j:J, k:K], qsz[i:I, j:J, k:K])
+        qvz[i:I, j:J, k:K] = np.where(mask_139629006694864_gen_0[i:I, j:J, k:K], qv__39c_342_47_gen_0[i:I, j:J, k:K], qvz[i:I, j:J, k:K])
+        tz[i:I, j:J, k:K] = np.where(mask_139629006694864_gen_0[i:I, j:J, k:K], tz__39c_342_47_gen_0[i:I, j:J, k:K], tz[i:I, j:J, k:K])
+        use_ccn__8ee_371_23_gen_0[i:I, j:J, k:K] = np.where((np.int64(0) != np.int64(0)), bool(bool(True)), use_ccn__8ee_371_23_gen_0[i:I, j:J, k:K])
+        t_wfr__8ee_371_23_gen_0[i:I, j:J, k:K] = np.where((np.int64(0) != np.int64(0)), np.float64(233.16000000000003), t_wfr__8ee_371_23_gen_0[i:I, j:J, k:K])
+        qlz__8ee_371_23_gen_0[i:I, j:J, k:K] = np.where((np.int64(0) != np.int64(0)), qlz[i:I, j:J, k:K], qlz__8ee_371_23_gen_0[i:I, j:J, k:K])
+        qrz__8ee_371_23_gen_0[i:I, j:J, k:K] = np.where((np.int64(0) != np.int64(0)), qrz[i:I, j:J, k:K], qrz__8ee_371_23_gen_0[i:I, j:J, k:K])
+        qc0__8ee_371_23_gen_0[i:I, j:J, k:K] = np.where((np.int64(0) != np.int64(0)), (fac_rc * ccn[i:I, j:J, k:K]), qc0__8ee_371_23_gen_0[i:I, j:J, k:K])
+        mask_139628985864784_gen_0[i:I, j:J, k:K] = (tz[i:I, j:J, k:K] > t_wfr__8ee_371_23_gen_0[i:I, j:J, k:K])
+        mask_139629023225104_gen_0[i:I, j:J, k:K] = use_ccn__8ee_371_23_gen_0[i:I, j:J, k:K]
+        qc__8ee_371_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.int64(0) != np.int64(0)), mask_139628985864784_gen_0[i:I, j:J, k:K]), mask_139629023225104_gen_0[i:I, j:J, k:K]), qc0__8ee_371_23_gen_0[i:I, j:J, k:K], qc__8ee_371_23_gen_0[i:I, j:J, k:K])
+        qc__8ee_371_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.int64(0) != np.int64(0)), mask_139628985864784_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629023225104_gen_0[i:I, j:J, k:K]))), (qc0__8ee_371_23_gen_0[i:I, j:J, k:K] / den[i:I, j:J, k:K]), qc__8ee_371_23_gen_0[i:I, j:J, k:K])
+        dq__8ee_371_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.int64(0) != np.int64(0)), mask_139628985864784_gen_0[i:I, j:J, k:K]), (qlz__8ee_371_23_gen_0[i:I, j:J, k:K] - qc__8ee_371_23_gen_0[i:I, j:J, k:K]), dq__8ee_371_23_gen_0[i:I, j:J, k:K])
+        mask_139629000166672_gen_0[i:I, j:J, k:K] = (dq__8ee_371_23_gen_0[i:I, j:J, k:K] > np.float64(0.0))
+        sink__8ee_371_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.int64(0) != np.int64(0)), mask_139628985864784_gen_0[i:I, j:J, k:K]), mask_139629000166672_gen_0[i:I, j:J, k:K]), np.minimum(dq__8ee_371_23_gen_0[i:I, j:J, k:K], (((dt_rain * c_praut[i:I, j:J, k:K]) * den[i:I, j:J, k:K]) * np.exp((so3 * np.log(qlz__8ee_371_23_gen_0[i:I, j:J, k:K]))))), sink__8ee_371_23_gen_0[i:I, j:J, k:K])
+        qlz__8ee_371_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.int64(0) != np.int64(0)), mask_139628985864784_gen_0[i:I, j:J, k:K]), mask_139629000166672_gen_0[i:I, j:J, k:K]), (qlz__8ee_371_23_gen_0[i:I, j:J, k:K] - sink__8ee_371_23_gen_0[i:I, j:J, k:K]), qlz__8ee_371_23_gen_0[i:I, j:J, k:K])
+        qrz__8ee_371_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.int64(0) != np.int64(0)), mask_139628985864784_gen_0[i:I, j:J, k:K]), mask_139629000166672_gen_0[i:I, j:J, k:K]), (qrz__8ee_371_23_gen_0[i:I, j:J, k:K] + sink__8ee_371_23_gen_0[i:I, j:J, k:K]), qrz__8ee_371_23_gen_0[i:I, j:J, k:K])
+        qlz[i:I, j:J, k:K] = np.where((np.int64(0) != np.int64(0)), qlz__8ee_371_23_gen_0[i:I, j:J, k:K], qlz[i:I, j:J, k:K])
+        qrz[i:I, j:J, k:K] = np.where((np.int64(0) != np.int64(0)), qrz__8ee_371_23_gen_0[i:I, j:J, k:K], qrz[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dk_ + 1
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            dl[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and((np.int64(0) == np.int64(0)), bool(bool(True))), np.float64(0.0), dl[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_
+        for k_ in range(k, K):
+
+            # --- begin horizontal block --
+            i, I = _di_ - 0, _dI_ + 0
+            j, J = _dj_ - 0, _dJ_ + 0
+
+            dq[i:I, j:J, k_:k_ + 1] = np.where(np.bitwise_and((np.int64(0) == np.int64(0)), bool(bool(True))), (np.float64(0.5) * (qlz[i:I, j:J, k_:k_ + 1] - qlz[i:I, j:J, k_ - 1:k_])), dq[i:I, j:J, k_:k_ + 1])
+            # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_ + 1, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        dl[i:I, j:J, k:K] = np.where(np.bitwise_and((np.int64(0) == np.int64(0)), bool(bool(True))), (np.float64(0.5) * np.minimum(np.abs((dq[i:I, j:J, k:K] + dq[i:I, j:J, k + 1:K + 1])), (np.float64(0.5) * qlz[i:I, j:J, k:K]))), dl[i:I, j:J, k:K])
+        mask_139629000418448_gen_0[i:I, j:J, k:K] = ((dq[i:I, j:J, k:K] * dq[i:I, j:J, k + 1:K + 1]) <= np.float64(0.0))
+        mask_139629000355408_gen_0[i:I, j:J, k:K] = (dq[i:I, j:J, k:K] > np.float64(0.0))
+        dl[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and((np.int64(0) == np.int64(0)), bool(bool(True))), mask_139629000418448_gen_0[i:I, j:J, k:K]), mask_139629000355408_gen_0[i:I, j:J, k:K]), np.minimum(dl[i:I, j:J, k:K], np.minimum(dq[i:I, j:J, k:K], (-(dq[i:I, j:J, k + 1:K + 1])))), dl[i:I, j:J, k:K])
+        dl[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and(np.bitwise_and((np.int64(0) == np.int64(0)), bool(bool(True))), mask_139629000418448_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139629000355408_gen_0[i:I, j:J, k:K]))), np.float64(0.0), dl[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dK_ - 1, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        dl[i:I, j:J, k:K] = np.where(np.bitwise_and((np.int64(0) == np.int64(0)), bool(bool(True))), np.float64(0.0), dl[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        dl[i:I, j:J, k:K] = np.where(np.bitwise_and((np.int64(0) == np.int64(0)), bool(bool(True))), np.maximum(dl[i:I, j:J, k:K], np.maximum(np.float64(1e-20), (h_var[i:I, j:J, k:K] * qlz[i:I, j:J, k:K]))), dl[i:I, j:J, k:K])
+        dl[i:I, j:J, k:K] = np.where(np.bitwise_and((np.int64(0) == np.int64(0)), (np.bitwise_not(bool(bool(True))))), np.maximum(np.float64(1e-20), (h_var[i:I, j:J, k:K] * qlz[i:I, j:J, k:K])), dl[i:I, j:J, k:K])
+        use_ccn__1a5_427_23_gen_0[i:I, j:J, k:K] = np.where((np.int64(0) == np.int64(0)), bool(bool(True)), use_ccn__1a5_427_23_gen_0[i:I, j:J, k:K])
+        t_wfr__1a5_427_23_gen_0[i:I, j:J, k:K] = np.where((np.int64(0) == np.int64(0)), np.float64(233.16000000000003), t_wfr__1a5_427_23_gen_0[i:I, j:J, k:K])
+        qlz__1a5_427_23_gen_0[i:I, j:J, k:K] = np.where((np.int64(0) == np.int64(0)), qlz[i:I, j:J, k:K], qlz__1a5_427_23_gen_0[i:I, j:J, k:K])
+        qrz__1a5_427_23_gen_0[i:I, j:J, k:K] = np.where((np.int64(0) == np.int64(0)), qrz[i:I, j:J, k:K], qrz__1a5_427_23_gen_0[i:I, j:J, k:K])
+        dl__1a5_427_23_gen_0[i:I, j:J, k:K] = np.where((np.int64(0) == np.int64(0)), dl[i:I, j:J, k:K], dl__1a5_427_23_gen_0[i:I, j:J, k:K])
+        qc0__1a5_427_23_gen_0[i:I, j:J, k:K] = np.where((np.int64(0) == np.int64(0)), (fac_rc * ccn[i:I, j:J, k:K]), qc0__1a5_427_23_gen_0[i:I, j:J, k:K])
+        mask_139628984679120_gen_0[i:I, j:J, k:K] = (tz[i:I, j:J, k:K] > (t_wfr__1a5_427_23_gen_0[i:I, j:J, k:K] + np.float64(8.0)))
+        dl__1a5_427_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.int64(0) == np.int64(0)), mask_139628984679120_gen_0[i:I, j:J, k:K]), np.minimum(np.maximum(np.float64(1e-06), dl__1a5_427_23_gen_0[i:I, j:J, k:K]), (np.float64(0.5) * qlz__1a5_427_23_gen_0[i:I, j:J, k:K])), dl__1a5_427_23_gen_0[i:I, j:J, k:K])
+        mask_139628985091344_gen_0[i:I, j:J, k:K] = use_ccn__1a5_427_23_gen_0[i:I, j:J, k:K]
+        qc__1a5_427_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.int64(0) == np.int64(0)), mask_139628984679120_gen_0[i:I, j:J, k:K]), mask_139628985091344_gen_0[i:I, j:J, k:K]), qc0__1a5_427_23_gen_0[i:I, j:J, k:K], qc__1a5_427_23_gen_0[i:I, j:J, k:K])
+        qc__1a5_427_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.int64(0) == np.int64(0)), mask_139628984679120_gen_0[i:I, j:J, k:K]), (np.bitwise_not(mask_139628985091344_gen_0[i:I, j:J, k:K]))), (qc0__1a5_427_23_gen_0[i:I, j:J, k:K] / den[i:I, j:J, k:K]), qc__1a5_427_23_gen_0[i:I, j:J, k:K])
+        dq__1a5_427_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and((np.int64(0) == np.int64(0)), mask_139628984679120_gen_0[i:I, j:J, k:K]), (np.float64(0.5) * ((qlz__1a5_427_23_gen_0[i:I, j:J, k:K] + dl__1a5_427_23_gen_0[i:I, j:J, k:K]) - qc__1a5_427_23_gen_0[i:I, j:J, k:K])), dq__1a5_427_23_gen_0[i:I, j:J, k:K])
+        mask_139628984676752_gen_0[i:I, j:J, k:K] = (dq__1a5_427_23_gen_0[i:I, j:J, k:K] > np.float64(0.0))
+        sink__1a5_427_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.int64(0) == np.int64(0)), mask_139628984679120_gen_0[i:I, j:J, k:K]), mask_139628984676752_gen_0[i:I, j:J, k:K]), ((((np.minimum(np.float64(1.0), (dq__1a5_427_23_gen_0[i:I, j:J, k:K] / dl__1a5_427_23_gen_0[i:I, j:J, k:K])) * dt_rain) * c_praut[i:I, j:J, k:K]) * den[i:I, j:J, k:K]) * np.exp((so3 * np.log(qlz__1a5_427_23_gen_0[i:I, j:J, k:K])))), sink__1a5_427_23_gen_0[i:I, j:J, k:K])
+        qlz__1a5_427_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.int64(0) == np.int64(0)), mask_139628984679120_gen_0[i:I, j:J, k:K]), mask_139628984676752_gen_0[i:I, j:J, k:K]), (qlz__1a5_427_23_gen_0[i:I, j:J, k:K] - sink__1a5_427_23_gen_0[i:I, j:J, k:K]), qlz__1a5_427_23_gen_0[i:I, j:J, k:K])
+        qrz__1a5_427_23_gen_0[i:I, j:J, k:K] = np.where(np.bitwise_and(np.bitwise_and((np.int64(0) == np.int64(0)), mask_139628984679120_gen_0[i:I, j:J, k:K]), mask_139628984676752_gen_0[i:I, j:J, k:K]), (qrz__1a5_427_23_gen_0[i:I, j:J, k:K] + sink__1a5_427_23_gen_0[i:I, j:J, k:K]), qrz__1a5_427_23_gen_0[i:I, j:J, k:K])
+        qlz[i:I, j:J, k:K] = np.where((np.int64(0) == np.int64(0)), qlz__1a5_427_23_gen_0[i:I, j:J, k:K], qlz[i:I, j:J, k:K])
+        qrz[i:I, j:J, k:K] = np.where((np.int64(0) == np.int64(0)), qrz__1a5_427_23_gen_0[i:I, j:J, k:K], qrz[i:I, j:J, k:K])
+        rain[i:I, j:J, k:K] = (rain[i:I, j:J, k:K] + r1[i:I, j:J, k:K])
+        m1[i:I, j:J, k:K] = np.where(is_first, (m1[i:I, j:J, k:K] + m1_rain[i:I, j:J, k:K]), m1[i:I, j:J, k:K])
+        m1[i:I, j:J, k:K] = np.where((np.bitwise_not(is_first)), ((m1[i:I, j:J, k:K] + m1_rain[i:I, j:J, k:K]) + m1_sol[i:I, j:J, k:K]), m1[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,114 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, u, v, dx, dy, a11, a12, a21, a22, ua, va, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    u = Field(u, _origin_['u'], (True, True, True))
+    v = Field(v, _origin_['v'], (True, True, True))
+    dx = Field(dx, _origin_['dx'], (True, True, False))
+    dy = Field(dy, _origin_['dy'], (True, True, False))
+    a11 = Field(a11, _origin_['a11'], (True, True, False))
+    a12 = Field(a12, _origin_['a12'], (True, True, False))
+    a21 = Field(a21, _origin_['a21'], (True, True, False))
+    a22 = Field(a22, _origin_['a22'], (True, True, False))
+    ua = Field(ua, _origin_['ua'], (True, True, True))
+    va = Field(va, _origin_['va'], (True, True, True))
+    
+    vtmp_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    utmp_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        utmp_gen_0[i:I, j:J, k:K] = ((np.float64(-0.125) * (u[i:I, j - 1:J - 1, k:K] + u[i:I, j + 2:J + 2, k:K])) + (np.float64(1.125) * (u[i:I, j:J, k:K] + u[i:I, j + 1:J + 1, k:K])))
+        vtmp_gen_0[i:I, j:J, k:K] = ((np.float64(-0.125) * (v[i - 1:I - 1, j:J, k:K] + v[i + 2:I + 2, j:J, k:K])) + (np.float64(1.125) * (v[i:I, j:J, k:K] + v[i + 1:I + 1, j:J, k:K])))
+        vtmp_gen_0[i:I, j:j + 1, k:K] = ((np.float64(2.0) * ((v[i:I, j:j + 1, k:K] * dy[i:I, j:j + 1]) + (v[i + 1:I + 1, j:j + 1, k:K] * dy[i + 1:I + 1, j:j + 1]))) / (dy[i:I, j:j + 1] + dy[i + 1:I + 1, j:j + 1]))
+        utmp_gen_0[i:I, j:j + 1, k:K] = ((np.float64(2.0) * ((u[i:I, j:j + 1, k:K] * dx[i:I, j:j + 1]) + (u[i:I, j + 1:j + 2, k:K] * dx[i:I, j + 1:j + 2]))) / (dx[i:I, j:j + 1] + dx[i:I, j + 1:j + 2]))
+        vtmp_gen_0[i:I, J - 1:J, k:K] = ((np.float64(2.0) * ((v[i:I, J - 1:J, k:K] * dy[i:I, J - 1:J]) + (v[i + 1:I + 1, J - 1:J, k:K] * dy[i + 1:I + 1, J - 1:J]))) / (dy[i:I, J - 1:J] + dy[i + 1:I + 1, J - 1:J]))
+        utmp_gen_0[i:I, J - 1:J, k:K] = ((np.float64(2.0) * ((u[i:I, J - 1:J, k:K] * dx[i:I, J - 1:J]) + (u[i:I, J:J + 1, k:K] * dx[i:I, J:J + 1]))) / (dx[i:I, J - 1:J] + dx[i:I, J:J + 1]))
+        utmp_gen_0[i:i + 1, j:J, k:K] = ((np.float64(2.0) * ((u[i:i + 1, j:J, k:K] * dx[i:i + 1, j:J]) + (u[i:i + 1, j + 1:J + 1, k:K] * dx[i:i + 1, j + 1:J + 1]))) / (dx[i:i + 1, j:J] + dx[i:i + 1, j + 1:J + 1]))
+        vtmp_gen_0[i:i + 1, j:J, k:K] = ((np.float64(2.0) * ((v[i:i + 1, j:J, k:K] * dy[i:i + 1, j:J]) + (v[i + 1:i + 2, j:J, k:K] * dy[i + 1:i + 2, j:J]))) / (dy[i:i + 1, j:J] + dy[i + 1:i + 2, j:J]))
+        utmp_gen_0[I - 1:I, j:J, k:K] = ((np.float64(2.0) * ((u[I - 1:I, j:J, k:K] * dx[I - 1:I, j:J]) + (u[I - 1:I, j + 1:J + 1, k:K] * dx[I - 1:I, j + 1:J + 1]))) / (dx[I - 1:I, j:J] + dx[I - 1:I, j + 1:J + 1]))
+        vtmp_gen_0[I - 1:I, j:J, k:K] = ((np.float64(2.0) * ((v[I - 1:I, j:J, k:K] * dy[I - 1:I, j:J]) + (v[I:I + 1, j:J, k:K] * dy[I:I + 1, j:J]))) / (dy[I - 1:I, j:J] + dy[I:I + 1, j:J]))
+        ua[i:I, j:J, k:K] = ((a11[i:I, j:J] * utmp_gen_0[i:I, j:J, k:K]) + (a12[i:I, j:J] * vtmp_gen_0[i:I, j:J, k:K]))
+        va[i:I, j:J, k:K] = ((a21[i:I, j:J] * utmp_gen_0[i:I, j:J, k:K]) + (a22[i:I, j:J] * vtmp_gen_0[i:I, j:J, k:K]))
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -0,0 +1,138 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, qvapor_in, qliquid_in, qrain_in, qsnow_in, qice_in, qgraupel_in, qo3mr_in, qsgs_tke_in, qcld_in, pt_in, delp_in, delz_in, ua_in, va_in, w_in, omga_in, qvapor_out, qliquid_out, qrain_out, qsnow_out, qice_out, qgraupel_out, qo3mr_out, qsgs_tke_out, qcld_out, pt_out, delp_out, delz_out, ua_out, va_out, w_out, omga_out, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    qvapor_in = Field(qvapor_in, _origin_['qvapor_in'], (True, True, True))
+    qliquid_in = Field(qliquid_in, _origin_['qliquid_in'], (True, True, True))
+    qrain_in = Field(qrain_in, _origin_['qrain_in'], (True, True, True))
+    qsnow_in = Field(qsnow_in, _origin_['qsnow_in'], (True, True, True))
+    qice_in = Field(qice_in, _origin_['qice_in'], (True, True, True))
+    qgraupel_in = Field(qgraupel_in, _origin_['qgraupel_in'], (True, True, True))
+    qo3mr_in = Field(qo3mr_in, _origin_['qo3mr_in'], (True, True, True))
+    qsgs_tke_in = Field(qsgs_tke_in, _origin_['qsgs_tke_in'], (True, True, True))
+    qcld_in = Field(qcld_in, _origin_['qcld_in'], (True, True, True))
+    pt_in = Field(pt_in, _origin_['pt_in'], (True, True, True))
+    delp_in = Field(delp_in, _origin_['delp_in'], (True, True, True))
+    delz_in = Field(delz_in, _origin_['delz_in'], (True, True, True))
+    ua_in = Field(ua_in, _origin_['ua_in'], (True, True, True))
+    va_in = Field(va_in, _origin_['va_in'], (True, True, True))
+    w_in = Field(w_in, _origin_['w_in'], (True, True, True))
+    omga_in = Field(omga_in, _origin_['omga_in'], (True, True, True))
+    qvapor_out = Field(qvapor_out, _origin_['qvapor_out'], (True, True, True))
+    qliquid_out = Field(qliquid_out, _origin_['qliquid_out'], (True, True, True))
+    qrain_out = Field(qrain_out, _origin_['qrain_out'], (True, True, True))
+    qsnow_out = Field(qsnow_out, _origin_['qsnow_out'], (True, True, True))
+    qice_out = Field(qice_out, _origin_['qice_out'], (True, True, True))
+    qgraupel_out = Field(qgraupel_out, _origin_['qgraupel_out'], (True, True, True))
+    qo3mr_out = Field(qo3mr_out, _origin_['qo3mr_out'], (True, True, True))
+    qsgs_tke_out = Field(qsgs_tke_out, _origin_['qsgs_tke_out'], (True, True, True))
+    qcld_out = Field(qcld_out, _origin_['qcld_out'], (True, True, True))
+    pt_out = Field(pt_out, _origin_['pt_out'], (True, True, True))
+    delp_out = Field(delp_out, _origin_['delp_out'], (True, True, True))
+    delz_out = Field(delz_out, _origin_['delz_out'], (True, True, True))
+    ua_out = Field(ua_out, _origin_['ua_out'], (True, True, True))
+    va_out = Field(va_out, _origin_['va_out'], (True, True, True))
+    w_out = Field(w_out, _origin_['w_out'], (True, True, True))
+    omga_out = Field(omga_out, _origin_['omga_out'], (True, True, True))
+    
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_ - 1
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        qvapor_out[i:I, j:J, k:K] = qvapor_in[i:I, j:J, k:K]
+        qliquid_out[i:I, j:J, k:K] = qliquid_in[i:I, j:J, k:K]
+        qrain_out[i:I, j:J, k:K] = qrain_in[i:I, j:J, k:K]
+        qsnow_out[i:I, j:J, k:K] = qsnow_in[i:I, j:J, k:K]
+        qice_out[i:I, j:J, k:K] = qice_in[i:I, j:J, k:K]
+        qgraupel_out[i:I, j:J, k:K] = qgraupel_in[i:I, j:J, k:K]
+        qo3mr_out[i:I, j:J, k:K] = qo3mr_in[i:I, j:J, k:K]
+        qsgs_tke_out[i:I, j:J, k:K] = qsgs_tke_in[i:I, j:J, k:K]
+        qcld_out[i:I, j:J, k:K] = qcld_in[i:I, j:J, k:K]
+        pt_out[i:I, j:J, k:K] = pt_in[i:I, j:J, k:K]
+        delp_out[i:I, j:J, k:K] = delp_in[i:I, j:J, k:K]
+        delz_out[i:I, j:J, k:K] = delz_in[i:I, j:J, k:K]
+        ua_out[i:I, j:J, k:K] = ua_in[i:I, j:J, k:K]
+        va_out[i:I, j:J, k:K] = va_in[i:I, j:J, k:K]
+        w_out[i:I, j:J, k:K] = w_in[i:I, j:J, k:K]
+        omga_out[i:I, j:J, k:K] = omga_in[i:I, j:J, k:K]
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
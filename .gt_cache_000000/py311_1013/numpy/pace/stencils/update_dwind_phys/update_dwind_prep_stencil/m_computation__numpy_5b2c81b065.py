@@ -0,0 +1,128 @@
+import numbers
+from typing import Tuple
+
+import numpy as np
+import scipy.special
+
+class Field:
+    def __init__(self, field, offsets: Tuple[int, ...], dimensions: Tuple[bool, bool, bool]):
+        ii = iter(range(3))
+        self.idx_to_data = tuple(
+            [next(ii) if has_dim else None for has_dim in dimensions]
+            + list(range(sum(dimensions), len(field.shape)))
+        )
+
+        shape = [field.shape[i] if i is not None else 1 for i in self.idx_to_data]
+        self.field_view = np.reshape(field.data, shape).view(np.ndarray)
+
+        self.offsets = offsets
+
+    @classmethod
+    def empty(cls, shape, dtype, offset):
+        return cls(np.empty(shape, dtype=dtype), offset, (True, True, True))
+
+    def shim_key(self, key):
+        new_args = []
+        if not isinstance(key, tuple):
+            key = (key, )
+        for index in self.idx_to_data:
+            if index is None:
+                new_args.append(slice(None, None))
+            else:
+                idx = key[index]
+                offset = self.offsets[index]
+                if isinstance(idx, slice):
+                    new_args.append(
+                        slice(idx.start + offset, idx.stop + offset, idx.step) if offset else idx
+                    )
+                else:
+                    new_args.append(idx + offset)
+        if not isinstance(new_args[2], (numbers.Integral, slice)):
+            new_args = self.broadcast_and_clip_variable_k(new_args)
+        return tuple(new_args)
+
+    def broadcast_and_clip_variable_k(self, new_args: tuple):
+        assert isinstance(new_args[0], slice) and isinstance(new_args[1], slice)
+        if np.max(new_args[2]) >= self.field_view.shape[2] or np.min(new_args[2]) < 0:
+            new_args[2] = np.clip(new_args[2].copy(), 0, self.field_view.shape[2]-1)
+        new_args[:2] = np.broadcast_arrays(
+            np.expand_dims(
+                np.arange(new_args[0].start, new_args[0].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 0)
+            ),
+            np.expand_dims(
+                np.arange(new_args[1].start, new_args[1].stop),
+                axis=tuple(i for i in range(self.field_view.ndim) if i != 1)
+            ),
+        )
+        return new_args
+
+    def __getitem__(self, key):
+        return self.field_view.__getitem__(self.shim_key(key))
+
+    def __setitem__(self, key, value):
+        return self.field_view.__setitem__(self.shim_key(key), value)
+
+
+def run(*, u_dt, v_dt, vlon1, vlon2, vlon3, vlat1, vlat2, vlat3, ue_1, ue_2, ue_3, ve_1, ve_2, ve_3, _domain_, _origin_):
+
+    # --- begin domain boundary shortcuts ---
+    _di_, _dj_, _dk_ = 0, 0, 0
+    _dI_, _dJ_, _dK_ = _domain_
+    # --- end domain padding ---
+
+    u_dt = Field(u_dt, _origin_['u_dt'], (True, True, True))
+    v_dt = Field(v_dt, _origin_['v_dt'], (True, True, True))
+    vlon1 = Field(vlon1, _origin_['vlon1'], (True, True, False))
+    vlon2 = Field(vlon2, _origin_['vlon2'], (True, True, False))
+    vlon3 = Field(vlon3, _origin_['vlon3'], (True, True, False))
+    vlat1 = Field(vlat1, _origin_['vlat1'], (True, True, False))
+    vlat2 = Field(vlat2, _origin_['vlat2'], (True, True, False))
+    vlat3 = Field(vlat3, _origin_['vlat3'], (True, True, False))
+    ue_1 = Field(ue_1, _origin_['ue_1'], (True, True, True))
+    ue_2 = Field(ue_2, _origin_['ue_2'], (True, True, True))
+    ue_3 = Field(ue_3, _origin_['ue_3'], (True, True, True))
+    ve_1 = Field(ve_1, _origin_['ve_1'], (True, True, True))
+    ve_2 = Field(ve_2, _origin_['ve_2'], (True, True, True))
+    ve_3 = Field(ve_3, _origin_['ve_3'], (True, True, True))
+    
+    v3_2_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    v3_2_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    v3_2_gen_2 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    v3_3_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    v3_3_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    v3_3_gen_2 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    v3_1_gen_0 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    v3_1_gen_1 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    v3_1_gen_2 = Field.empty((_dI_ + 0, _dJ_ + 0, _dK_), np.float64, (0, 0, 0))
+    
+
+    with np.errstate(divide='ignore', over='ignore', under='ignore', invalid='ignore'):
+
+    
+    # --- begin vertical block ---
+        k, K = _dk_, _dK_
+
+        # --- begin horizontal block --
+        i, I = _di_ - 0, _dI_ + 0
+        j, J = _dj_ - 0, _dJ_ + 0
+
+        v3_1_gen_2[i:I, j:J, k:K] = ((u_dt[i:I, j - 1:J - 1, k:K] * vlon1[i:I, j - 1:J - 1]) + (v_dt[i:I, j - 1:J - 1, k:K] * vlat1[i:I, j - 1:J - 1]))
+        v3_2_gen_2[i:I, j:J, k:K] = ((u_dt[i:I, j - 1:J - 1, k:K] * vlon2[i:I, j - 1:J - 1]) + (v_dt[i:I, j - 1:J - 1, k:K] * vlat2[i:I, j - 1:J - 1]))
+        v3_3_gen_2[i:I, j:J, k:K] = ((u_dt[i:I, j - 1:J - 1, k:K] * vlon3[i:I, j - 1:J - 1]) + (v_dt[i:I, j - 1:J - 1, k:K] * vlat3[i:I, j - 1:J - 1]))
+        v3_1_gen_1[i:I, j:J, k:K] = ((u_dt[i:I, j:J, k:K] * vlon1[i:I, j:J]) + (v_dt[i:I, j:J, k:K] * vlat1[i:I, j:J]))
+        v3_2_gen_1[i:I, j:J, k:K] = ((u_dt[i:I, j:J, k:K] * vlon2[i:I, j:J]) + (v_dt[i:I, j:J, k:K] * vlat2[i:I, j:J]))
+        v3_3_gen_1[i:I, j:J, k:K] = ((u_dt[i:I, j:J, k:K] * vlon3[i:I, j:J]) + (v_dt[i:I, j:J, k:K] * vlat3[i:I, j:J]))
+        v3_1_gen_0[i:I, j:J, k:K] = ((u_dt[i - 1:I - 1, j:J, k:K] * vlon1[i - 1:I - 1, j:J]) + (v_dt[i - 1:I - 1, j:J, k:K] * vlat1[i - 1:I - 1, j:J]))
+        v3_2_gen_0[i:I, j:J, k:K] = ((u_dt[i - 1:I - 1, j:J, k:K] * vlon2[i - 1:I - 1, j:J]) + (v_dt[i - 1:I - 1, j:J, k:K] * vlat2[i - 1:I - 1, j:J]))
+        v3_3_gen_0[i:I, j:J, k:K] = ((u_dt[i - 1:I - 1, j:J, k:K] * vlon3[i - 1:I - 1, j:J]) + (v_dt[i - 1:I - 1, j:J, k:K] * vlat3[i - 1:I - 1, j:J]))
+        ue_1[i:I, j:J, k:K] = (v3_1_gen_2[i:I, j:J, k:K] + v3_1_gen_1[i:I, j:J, k:K])
+        ue_2[i:I, j:J, k:K] = (v3_2_gen_2[i:I, j:J, k:K] + v3_2_gen_1[i:I, j:J, k:K])
+        ue_3[i:I, j:J, k:K] = (v3_3_gen_2[i:I, j:J, k:K] + v3_3_gen_1[i:I, j:J, k:K])
+        ve_1[i:I, j:J, k:K] = (v3_1_gen_0[i:I, j:J, k:K] + v3_1_gen_1[i:I, j:J, k:K])
+        ve_2[i:I, j:J, k:K] = (v3_2_gen_0[i:I, j:J, k:K] + v3_2_gen_1[i:I, j:J, k:K])
+        ve_3[i:I, j:J, k:K] = (v3_3_gen_0[i:I, j:J, k:K] + v3_3_gen_1[i:I, j:J, k:K])
+        # --- end horizontal block --
+
+        # --- end vertical block ---
+    
\ No newline at end of file
@@ -1,8 +1,13 @@
 import abc
+import contextlib
 import dataclasses
+import queue
+import threading
 import warnings
 from datetime import datetime, timedelta
-from typing import List, Optional, Union
+from typing import Dict, List, Optional, Union
+
+import numpy as np
 
 import pace.driver
 import pace.dsl
@@ -12,8 +17,9 @@ import pace.util.grid
 from pace.dsl.dace.orchestration import dace_inhibitor
 from pace.fv3core.initialization.dycore_state import DycoreState
 from pace.util.constants import RGRAV
+from pace.util.monitor.convert import to_numpy
 
-from .state import DriverState
+from .state import NETCDF_WRITE_LOCK, DriverState
 
 
 try:
@@ -72,22 +78,55 @@ class DiagnosticsConfig:
         path: directory to save diagnostics if given, otherwise no diagnostics
             will be stored
         output_format: one of "zarr" or "netcdf", be careful when using the "netcdf"
-            format as this requires all diagnostics to be stored in memory on the
-            root rank before saving, which can cause out-of-memory errors if the
-            global data size or number of variables is too large
+            format with the default "chunked" netcdf_mode as this requires all
+            diagnostics to be stored in memory on the root rank before saving,
+            which can cause out-of-memory errors if the global data size or
+            number of variables is too large
         time_chunk_size: number of timesteps stored in each netcdf file, only used if
-            output_format is "netcdf"
+            output_format is "netcdf" and netcdf_mode is "chunked"
+        netcdf_mode: one of "chunked", "streaming" or "per_rank", only used if
+            output_format is "netcdf". "streaming" appends each timestep to one
+            file per tile as soon as it is stored, "per_rank" additionally
+            avoids gathering data by writing one file per rank along with
+            an index file, see pace.util.NetCDFMonitor for details
         names: state variables to save as diagnostics
         derived_names: derived diagnostics to save
         z_select: save a veritcal slice of a 3D state
+        async_write: if True, diagnostics are copied into preallocated host
+            buffers and written by a background thread, so that timestepping
+            overlaps with output. The writer thread communicates on its own
+            duplicate of the communicator. When running on multiple ranks, MPI
+            must be initialized with MPI_THREAD_MULTIPLE support (the mpi4py
+            default)
+        encoding: encoding options for individual diagnostics by name, such as
+            compression, bit rounding or dtype conversion, see
+            pace.util.VariableEncoding
+        default_encoding: encoding options for diagnostics not given in encoding,
+            by default diagnostics are written without any encoding
+        zarr_time_block_size: if given, the time dimension of zarr output is
+            allocated in blocks of this many output times, so that ranks write
+            their own chunks without collective communication except once per
+            block. If the number of output times is known when diagnostics are
+            created, the whole run is allocated up front
+        async_queue_depth: maximum number of diagnostic snapshots waiting to be
+            written when async_write is True, once reached storing blocks
+            until the writer thread catches up
     """
 
     path: Optional[str] = None
     output_format: str = "zarr"
     time_chunk_size: int = 1
+    netcdf_mode: str = "chunked"
     names: List[str] = dataclasses.field(default_factory=list)
     derived_names: List[str] = dataclasses.field(default_factory=list)
     z_select: List[ZSelect] = dataclasses.field(default_factory=list)
+    encoding: Dict[str, pace.util.VariableEncoding] = dataclasses.field(
+        default_factory=dict
+    )
+    default_encoding: Optional[pace.util.VariableEncoding] = None
+    zarr_time_block_size: Optional[int] = None
+    async_write: bool = False
+    async_queue_depth: int = 2
 
     def __post_init__(self):
         if (len(self.names) > 0 or len(self.derived_names) > 0) and self.path is None:
@@ -99,14 +138,34 @@ class DiagnosticsConfig:
                 "output_format must be one of 'zarr' or 'netcdf', "
                 f"got {self.output_format}"
             )
+        if self.netcdf_mode not in pace.util.NetCDFMonitor.MODES:
+            raise ValueError(
+                f"netcdf_mode must be one of {pace.util.NetCDFMonitor.MODES}, "
+                f"got {self.netcdf_mode}"
+            )
+        if self.zarr_time_block_size is not None and self.zarr_time_block_size < 1:
+            raise ValueError(
+                "zarr_time_block_size must be at least 1, "
+                f"got {self.zarr_time_block_size}"
+            )
+        if self.async_queue_depth < 1:
+            raise ValueError(
+                f"async_queue_depth must be at least 1, got {self.async_queue_depth}"
+            )
 
-    def diagnostics_factory(self, communicator: pace.util.Communicator) -> Diagnostics:
+    def diagnostics_factory(
+        self,
+        communicator: pace.util.Communicator,
+        n_output_times: Optional[int] = None,
+    ) -> Diagnostics:
         """
         Create a diagnostics object.
 
         Args:
             communicator: provides global communication e.g. to gather state
                 or to coordinate filesystem access between ranks
+            n_output_times: expected number of times diagnostics will be stored,
+                if known, used to preallocate output
         """
         if self.path is None:
             diagnostics: Diagnostics = NullDiagnostics()
@@ -114,24 +173,39 @@ class DiagnosticsConfig:
             fs = pace.util.get_fs(self.path)
             if not fs.exists(self.path):
                 fs.makedirs(self.path, exist_ok=True)
+            if self.async_write:
+                # the writer thread must not run collectives on the communicator
+                # the main thread uses for halo updates and reductions
+                communicator = _duplicate_communicator(communicator)
             if self.output_format == "zarr":
                 store = zarr_storage.DirectoryStore(path=self.path)
                 monitor: pace.util.Monitor = pace.util.ZarrMonitor(
                     store=store,
                     partitioner=communicator.partitioner,
                     mpi_comm=communicator.comm,
+                    time_block_size=self.zarr_time_block_size,
+                    n_times=n_output_times,
+                    encoding=self.encoding,
+                    default_encoding=self.default_encoding,
                 )
             elif self.output_format == "netcdf":
                 monitor = pace.util.NetCDFMonitor(
                     path=self.path,
                     communicator=communicator,
                     time_chunk_size=self.time_chunk_size,
+                    mode=self.netcdf_mode,
+                    encoding=self.encoding,
+                    default_encoding=self.default_encoding,
                 )
             else:
                 raise ValueError(
                     "output_format must be one of 'zarr' or 'netcdf', "
                     f"got {self.output_format}"
                 )
+            if self.async_write:
+                monitor = AsyncMonitor(
+                    monitor=monitor, queue_depth=self.async_queue_depth
+                )
             diagnostics = MonitorDiagnostics(
                 monitor=monitor,
                 names=self.names,
@@ -161,6 +235,13 @@ class MonitorDiagnostics(Diagnostics):
         self.derived_names = derived_names
         self.z_select = z_select
         self.monitor = monitor
+        if isinstance(monitor, AsyncMonitor):
+            # writes happen in the writer thread, which holds the lock itself
+            self._write_lock: contextlib.AbstractContextManager = (
+                contextlib.nullcontext()
+            )
+        else:
+            self._write_lock = NETCDF_WRITE_LOCK
 
     @dace_inhibitor
     def store(self, time: Union[datetime, timedelta], state: DriverState):
@@ -175,7 +256,8 @@ class MonitorDiagnostics(Diagnostics):
         level_select_state = self._get_z_select_state(state.dycore_state)
         monitor_state.update(derived_state)
         monitor_state.update(level_select_state)
-        self.monitor.store(monitor_state)
+        with self._write_lock:
+            self.monitor.store(monitor_state)
 
     def _get_derived_state(self, state: DriverState):
         output = {}
@@ -205,11 +287,161 @@ class MonitorDiagnostics(Diagnostics):
             "lon_agrid": grid_data.lon_agrid,
             "lat_agrid": grid_data.lat_agrid,
         }
-        for k, v in zarr_grid.items():
-            self.monitor.store_constant({k: v})
+        with self._write_lock:
+            for k, v in zarr_grid.items():
+                self.monitor.store_constant({k: v})
+
+    def cleanup(self):
+        with self._write_lock:
+            self.monitor.cleanup()
+
+
+def _duplicate_communicator(
+    communicator: pace.util.Communicator,
+) -> pace.util.Communicator:
+    """Create a communicator over the same ranks with its own message context.
+
+    Must be called by all ranks of the communicator.
+    """
+    return type(communicator)(
+        communicator.comm.Dup(),
+        communicator.partitioner,
+        force_cpu=communicator._force_cpu,
+        timer=communicator.timer,
+    )
+
+
+class AsyncMonitor:
+    """
+    Monitor which stores states in a background thread.
+
+    States are copied into preallocated host buffers when stored, so the
+    caller is free to modify its quantities as soon as store returns. The
+    wrapped monitor is only ever called from the writer thread, except for
+    store_constant and cleanup which first wait for pending states to be
+    written. The wrapped monitor must not communicate over a communicator
+    used by other threads, as collectives on one communicator cannot be
+    run concurrently. Calls to the wrapped monitor hold NETCDF_WRITE_LOCK, as
+    HDF5 is not thread-safe and restarts may be written from another thread.
+    """
+
+    def __init__(self, monitor: pace.util.Monitor, queue_depth: int = 2):
+        """
+        Args:
+            monitor: monitor used to write states
+            queue_depth: maximum number of states waiting to be written,
+                store blocks when this many states are pending
+        """
+        self.monitor = monitor
+        # one more buffer than the queue depth, as the writer thread holds
+        # a buffer while it is writing
+        self._n_buffers = queue_depth + 1
+        self._free_buffers: "queue.Queue[Dict[str, pace.util.Quantity]]" = queue.Queue()
+        self._pending: "queue.Queue[Optional[dict]]" = queue.Queue(maxsize=queue_depth)
+        self._buffers_initialized = False
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(
+            target=self._write_loop, name="pace-diagnostics-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _init_buffers(self, state: dict):
+        for _ in range(self._n_buffers):
+            buffers = {}
+            for name, quantity in state.items():
+                if name != "time":
+                    buffers[name] = _host_buffer_like(quantity)
+            self._free_buffers.put(buffers)
+        self._buffers_initialized = True
+
+    def _write_loop(self):
+        while True:
+            item = self._pending.get()
+            try:
+                if item is None:
+                    return
+                if self._error is None:
+                    try:
+                        with NETCDF_WRITE_LOCK:
+                            self.monitor.store(item)
+                    except BaseException as err:
+                        self._error = err
+                self._free_buffers.put(
+                    {name: value for name, value in item.items() if name != "time"}
+                )
+            finally:
+                self._pending.task_done()
+
+    def _raise_if_failed(self):
+        if self._error is not None:
+            raise RuntimeError("diagnostics writer thread failed") from self._error
+
+    def store(self, state: dict) -> None:
+        """
+        Copy the state into host buffers and queue it to be written.
+
+        Blocks if queue_depth states are already waiting to be written.
+        """
+        self._raise_if_failed()
+        if not self._buffers_initialized:
+            self._init_buffers(state)
+        buffers = self._free_buffers.get()
+        if set(buffers.keys()) != set(state.keys()).difference(["time"]):
+            self._free_buffers.put(buffers)
+            raise ValueError(
+                "provided state has different keys than the first stored state"
+            )
+        snapshot = {"time": state["time"]}
+        for name, buffer in buffers.items():
+            _copy_to_host_buffer(state[name], buffer)
+            snapshot[name] = buffer
+        self._pending.put(snapshot)
+
+    def flush(self):
+        """Block until all queued states have been written."""
+        self._pending.join()
+        self._raise_if_failed()
+
+    def store_constant(self, state: Dict[str, pace.util.Quantity]) -> None:
+        self.flush()
+        with NETCDF_WRITE_LOCK:
+            self.monitor.store_constant(state)
 
     def cleanup(self):
-        self.monitor.cleanup()
+        if self._thread.is_alive():
+            self._pending.put(None)
+            self._thread.join()
+        try:
+            with NETCDF_WRITE_LOCK:
+                self.monitor.cleanup()
+        finally:
+            # close the files of the wrapped monitor even if a write failed
+            self._raise_if_failed()
+
+
+def _host_buffer_like(quantity: pace.util.Quantity) -> pace.util.Quantity:
+    buffer = pace.util.Quantity(
+        np.empty(quantity.data.shape, dtype=quantity.data.dtype),
+        dims=quantity.dims,
+        units=quantity.units,
+        origin=quantity.origin,
+        extent=quantity.extent,
+    )
+    buffer.update_attrs(quantity.attrs)
+    return buffer
+
+
+def _copy_to_host_buffer(quantity: pace.util.Quantity, buffer: pace.util.Quantity):
+    if quantity.data.shape != buffer.data.shape or quantity.dims != buffer.dims:
+        raise ValueError(
+            f"quantity with dims {quantity.dims} and shape {quantity.data.shape} "
+            f"does not match previously stored dims {buffer.dims} and "
+            f"shape {buffer.data.shape}"
+        )
+    if quantity.np is np:
+        np.copyto(buffer.data, quantity.data)
+    else:
+        buffer.data[:] = to_numpy(quantity.data)
 
 
 class NullDiagnostics(Diagnostics):
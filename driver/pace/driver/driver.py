@@ -32,7 +32,8 @@ from .grid import GeneratedGridConfig, GridInitializerSelector
 from .initialization import InitializerSelector
 from .performance import PerformanceConfig
 from .performance.collector import PerformanceCollector
-from .state import DriverState
+from .restart import IntermediateRestartWriter
+from .state import RESTART_FORMATS, DriverState
 
 
 try:
@@ -83,6 +84,12 @@ class DriverConfig:
             initial state of the model before timestepping
         output_frequency: number of model timesteps between diagnostic timesteps,
             defaults to every timestep
+        safety_check_frequency: number of model timesteps between checks of the
+            state against the safety checker bounds, by default the state
+            is not checked
+        safety_check_sample_stride: if given, safety checks only sample every
+            this many points along each dimension, making frequent checks cheaper
+            at the cost of possibly missing violations
     """
 
     stencil_config: pace.dsl.StencilConfig
@@ -125,6 +132,7 @@ class DriverConfig:
     output_initial_state: bool = False
     output_frequency: int = 1
     safety_check_frequency: Optional[int] = None
+    safety_check_sample_stride: Optional[int] = None
 
     @functools.cached_property
     def timestep(self) -> timedelta:
@@ -149,6 +157,13 @@ class DriverConfig:
             )
         return floor(self.total_time.total_seconds() / self.timestep.total_seconds())
 
+    def n_output_times(self) -> int:
+        """Number of times diagnostics are stored during the simulation."""
+        n_output_times = self.n_timesteps() // self.output_frequency
+        if self.output_initial_state:
+            n_output_times += 1
+        return n_output_times
+
     @functools.cached_property
     def do_dry_convective_adjustment(self) -> bool:
         return self.dycore_config.do_dry_convective_adjustment
@@ -325,13 +340,55 @@ class DriverConfig:
 
 @dataclasses.dataclass()
 class RestartConfig:
+    """
+    Configuration for writing restart files.
+
+    Attributes:
+        save_restart: whether to write a restart at the end of the run
+        intermediate_restart: timesteps after which to write a restart
+        save_intermediate_restart: whether to write intermediate restarts,
+            enabled automatically if intermediate_restart is non-empty
+        restart_format: "netcdf" to write a netCDF dataset per rank, or "binary"
+            to write raw contiguous buffers which are much faster to write and
+            are read back through a memory map; the format is detected
+            automatically when restarting
+        async_intermediate_restart: if True, intermediate restarts are copied to a
+            staging buffer and written in a background thread while the model
+            continues stepping
+        keep_last_intermediate_restarts: if given, only the most recent this many
+            intermediate restart directories are kept
+    """
+
     save_restart: bool = False
     intermediate_restart: List[int] = dataclasses.field(default_factory=list)
     save_intermediate_restart: bool = False
+    restart_format: str = "netcdf"
+    async_intermediate_restart: bool = False
+    keep_last_intermediate_restarts: Optional[int] = None
 
     def __post_init__(self):
         if len(self.intermediate_restart) > 0:
             self.save_intermediate_restart = True
+        if self.restart_format not in RESTART_FORMATS:
+            raise ValueError(
+                f"restart_format must be one of {RESTART_FORMATS}, "
+                f"got {self.restart_format}"
+            )
+        if (
+            self.keep_last_intermediate_restarts is not None
+            and self.keep_last_intermediate_restarts < 1
+        ):
+            raise ValueError(
+                "keep_last_intermediate_restarts must be at least 1, "
+                f"got {self.keep_last_intermediate_restarts}"
+            )
+
+    def get_intermediate_writer(self, rank: int) -> IntermediateRestartWriter:
+        return IntermediateRestartWriter(
+            rank=rank,
+            background=self.async_intermediate_restart,
+            keep_last=self.keep_last_intermediate_restarts,
+        )
 
     def write_final_if_enabled(
         self,
@@ -343,12 +400,20 @@ class RestartConfig:
         restart_path: str,
     ):
         if self.save_restart:
-            state.save_state(comm=comm, restart_path=restart_path)
             if comm.Get_rank() == 0:
-                driver_config.write_for_restart(
+                write_config = functools.partial(
+                    driver_config.write_for_restart,
                     time=time,
                     restart_path=restart_path,
                 )
+            else:
+                write_config = None
+            IntermediateRestartWriter(rank=comm.Get_rank()).write(
+                state,
+                restart_path=restart_path,
+                restart_format=self.restart_format,
+                write_config=write_config,
+            )
 
     def write_intermediate_if_enabled(
         self,
@@ -359,14 +424,25 @@ class RestartConfig:
         time: Union[datetime, timedelta],
         driver_config: DriverConfig,
         restart_path: str,
+        writer: Optional[IntermediateRestartWriter] = None,
     ):
         if self.save_intermediate_restart and step in self.intermediate_restart:
-            state.save_state(comm=comm, restart_path=restart_path)
+            if writer is None:
+                writer = self.get_intermediate_writer(comm.Get_rank())
             if comm.Get_rank() == 0:
-                driver_config.write_for_restart(
+                write_config = functools.partial(
+                    driver_config.write_for_restart,
                     time=time,
                     restart_path=restart_path,
                 )
+            else:
+                write_config = None
+            writer.write(
+                state,
+                restart_path=restart_path,
+                restart_format=self.restart_format,
+                write_config=write_config,
+            )
 
 
 class Driver:
@@ -394,6 +470,7 @@ class Driver:
             self.comm = global_comm
             stencil_compare_comm = None
         self.performance_collector = self.config.performance_config.build(self.comm)
+        self.config.performance_config.configure_buffer_cache(self.comm)
         self.profiler = self.config.performance_config.build_profiler()
         with self.performance_collector.total_timer.clock("initialization"):
             comm_timer = (
@@ -468,60 +545,64 @@ class Driver:
             logger.info("setting up state done")
 
             self._start_time = self.config.initialization.start_time
-            logger.info("setting up dycore object started")
-            self.dycore = fv3core.DynamicalCore(
-                comm=communicator,
-                grid_data=self.state.grid_data,
-                stencil_factory=self.stencil_factory,
-                quantity_factory=self.quantity_factory,
-                damping_coefficients=self.state.damping_coefficients,
-                config=self.config.dycore_config,
-                timestep=self.config.timestep,
-                phis=self.state.dycore_state.phis,
-                state=self.state.dycore_state,
-            )
-            logger.info("setting up dycore object done")
-
-            logger.info("setting up physics object started")
-            if not config.dycore_only and not config.disable_step_physics:
-                self.physics = pace.physics.Physics(
-                    stencil_factory=self.stencil_factory,
-                    quantity_factory=self.quantity_factory,
+            # with compile_workers > 1, stencils are compiled concurrently when
+            # the model components are all constructed
+            with self.stencil_factory.planned_compilation():
+                logger.info("setting up dycore object started")
+                self.dycore = fv3core.DynamicalCore(
+                    comm=communicator,
                     grid_data=self.state.grid_data,
-                    namelist=self.config.physics_config,
-                    active_packages=["microphysics"],
-                )
-            else:
-                # Make sure those are set to None to raise any issues
-                self.physics = None
-            if not config.disable_step_physics:
-                self.dycore_to_physics = update_atmos_state.DycoreToPhysics(
                     stencil_factory=self.stencil_factory,
                     quantity_factory=self.quantity_factory,
-                    dycore_config=self.config.dycore_config,
-                    do_dry_convective_adjust=config.do_dry_convective_adjustment,
-                    dycore_only=self.config.dycore_only,
-                )
-                self.end_of_step_update = update_atmos_state.UpdateAtmosphereState(
-                    stencil_factory=self.stencil_factory,
-                    grid_data=self.state.grid_data,
-                    namelist=self.config.physics_config,
-                    comm=communicator,
-                    grid_info=self.state.driver_grid_data,
+                    damping_coefficients=self.state.damping_coefficients,
+                    config=self.config.dycore_config,
+                    timestep=self.config.timestep,
+                    phis=self.state.dycore_state.phis,
                     state=self.state.dycore_state,
-                    quantity_factory=self.quantity_factory,
-                    dycore_only=self.config.dycore_only,
-                    apply_tendencies=self.config.apply_tendencies,
-                    tendency_state=self.state.tendency_state,
                 )
-            else:
-                # Make sure those are set to None to raise any issues
-                self.dycore_to_physics = None
-                self.end_of_step_update = None
-            logger.info("setting up physics object done")
+                logger.info("setting up dycore object done")
+
+                logger.info("setting up physics object started")
+                if not config.dycore_only and not config.disable_step_physics:
+                    self.physics = pace.physics.Physics(
+                        stencil_factory=self.stencil_factory,
+                        quantity_factory=self.quantity_factory,
+                        grid_data=self.state.grid_data,
+                        namelist=self.config.physics_config,
+                        active_packages=["microphysics"],
+                    )
+                else:
+                    # Make sure those are set to None to raise any issues
+                    self.physics = None
+                if not config.disable_step_physics:
+                    self.dycore_to_physics = update_atmos_state.DycoreToPhysics(
+                        stencil_factory=self.stencil_factory,
+                        quantity_factory=self.quantity_factory,
+                        dycore_config=self.config.dycore_config,
+                        do_dry_convective_adjust=config.do_dry_convective_adjustment,
+                        dycore_only=self.config.dycore_only,
+                    )
+                    self.end_of_step_update = update_atmos_state.UpdateAtmosphereState(
+                        stencil_factory=self.stencil_factory,
+                        grid_data=self.state.grid_data,
+                        namelist=self.config.physics_config,
+                        comm=communicator,
+                        grid_info=self.state.driver_grid_data,
+                        state=self.state.dycore_state,
+                        quantity_factory=self.quantity_factory,
+                        dycore_only=self.config.dycore_only,
+                        apply_tendencies=self.config.apply_tendencies,
+                        tendency_state=self.state.tendency_state,
+                    )
+                else:
+                    # Make sure those are set to None to raise any issues
+                    self.dycore_to_physics = None
+                    self.end_of_step_update = None
+                logger.info("setting up physics object done")
             logger.info("setting up diagnostics factory started")
             self.diagnostics = config.diagnostics_config.diagnostics_factory(
-                communicator=communicator
+                communicator=communicator,
+                n_output_times=self.config.n_output_times(),
             )
             logger.info("setting up diagnostics factory done")
         log_subtile_location(
@@ -531,8 +612,13 @@ class Driver:
             self.diagnostics.store(time=self.time, state=self.state)
 
         self._time_run = self.config.start_time
+        self._restart_writer = self.config.restart_config.get_intermediate_writer(
+            self.comm.Get_rank()
+        )
         logger.info("setting up safety checkers started")
-        self.safety_checker = SafetyChecker()
+        self.safety_checker = SafetyChecker(
+            sample_stride=self.config.safety_check_sample_stride
+        )
         SafetyChecker.register_variable("ua", -200, 200, compute_domain_only=True)
         SafetyChecker.register_variable("va", -200, 200, compute_domain_only=True)
         SafetyChecker.register_variable("delp", -1.0, 4000, compute_domain_only=True)
@@ -560,6 +646,7 @@ class Driver:
             run_mode=original_config.run_mode,
             use_minimal_caching=original_config.use_minimal_caching,
             communicator=communicator,
+            compile_workers=original_config.compile_workers,
         )
         self.config.stencil_config.compilation_config = compilation_config
 
@@ -601,6 +688,7 @@ class Driver:
             time=self.time,
             driver_config=self.config,
             restart_path=f"RESTART_{step}",
+            writer=self._restart_writer,
         )
 
     def _critical_path_step_all(
@@ -662,11 +750,19 @@ class Driver:
             self.config.stencil_config.compilation_config.backend,
             self.config.stencil_config.dace_config.is_dace_orchestrated(),
             self.config.dt_atmos,
+            partitioner=self._get_partitioner(),
+        )
+
+    def _get_partitioner(self) -> pace.util.CubedSpherePartitioner:
+        return pace.util.CubedSpherePartitioner(
+            pace.util.TilePartitioner(self.config.layout)
         )
 
     @dace_inhibitor
     def cleanup(self):
         logger.info("cleaning up driver")
+        self.performance_collector.cleanup()
+        self.config.performance_config.write_buffer_cache_profile(self.comm)
         self.performance_collector.write_out_rank_0(
             self.config.stencil_config.compilation_config.backend,
             self.config.stencil_config.dace_config.is_dace_orchestrated(),
@@ -678,10 +774,15 @@ class Driver:
             >= self.config.performance_config.json_all_rank_threshold
         ):
             self._write_performance_json_output()
+        elif self.config.performance_config.load_imbalance_report:
+            self.performance_collector.write_out_load_imbalance(
+                self._get_partitioner()
+            )
         self.diagnostics.store_grid(
             grid_data=self.state.grid_data,
         )
         self.diagnostics.cleanup()
+        self._restart_writer.wait()
         self.config.restart_config.write_final_if_enabled(
             state=self.state,
             comm=self.comm,
@@ -1,9 +1,14 @@
 import abc
 import dataclasses
+import hashlib
+import json
 import logging
-from typing import ClassVar, Optional, Tuple
+import os
+import tempfile
+from typing import Any, ClassVar, Dict, Mapping, Optional, Tuple
 
 import f90nml
+import numpy as np
 
 import pace.driver
 import pace.dsl
@@ -12,6 +17,7 @@ import pace.stencils
 import pace.util.grid
 from pace.stencils.testing import TranslateGrid
 from pace.util import CubedSphereCommunicator, QuantityFactory
+from pace.util.communicator import to_numpy
 from pace.util.grid import (
     DampingCoefficients,
     DriverGridData,
@@ -32,6 +38,16 @@ from .registry import Registry
 
 logger = logging.getLogger(__name__)
 
+_GRID_CACHE_VERSION = 1
+_GRID_CACHE_GROUPS = {
+    "damping_coefficients": DampingCoefficients,
+    "driver_grid_data": DriverGridData,
+    "horizontal_data": HorizontalGridData,
+    "vertical_data": VerticalGridData,
+    "contravariant_data": ContravariantGridData,
+    "angle_data": AngleGridData,
+}
+
 
 class GridInitializer(abc.ABC):
     @abc.abstractmethod
@@ -88,12 +104,16 @@ class GeneratedGridConfig(GridInitializer):
         lon_target: desired center longitude for refined tile (deg)
         lat_target: desired center latitude for refined tile (deg)
         restart_path: if given, load vertical grid from restart file
+        cache_path: if given, directory in which each rank stores its generated
+            grid data, later runs with the same resolution, layout, stretch
+            parameters and backend load it from there instead of generating it
     """
 
     stretch_factor: Optional[float] = 1.0
     lon_target: Optional[float] = 350.0
     lat_target: Optional[float] = -90.0
     restart_path: Optional[str] = None
+    cache_path: Optional[str] = None
 
     def get_grid(
         self,
@@ -101,6 +121,40 @@ class GeneratedGridConfig(GridInitializer):
         communicator: CubedSphereCommunicator,
     ) -> Tuple[DampingCoefficients, DriverGridData, GridData]:
 
+        grid = None
+        if self.cache_path is not None:
+            cache_filename = self._cache_filename(quantity_factory, communicator)
+            grid = _load_grid_cache(cache_filename, quantity_factory)
+            # generating the grid is collective, so either all ranks load it
+            # from the cache or none do
+            if not all(communicator.comm.allgather(grid is not None)):
+                grid = None
+        if grid is None:
+            grid = self._generate(quantity_factory, communicator)
+            if self.cache_path is not None:
+                _save_grid_cache(
+                    cache_filename,
+                    damping_coefficients=grid[0],
+                    driver_grid_data=grid[1],
+                    **grid[2],
+                )
+        else:
+            logger.info("Loaded grid data from %s", cache_filename)
+        damping_coefficients, driver_grid_data, grid_components = grid
+
+        if self.restart_path is not None:
+            grid_components["vertical_data"] = VerticalGridData.from_restart(
+                self.restart_path, quantity_factory=quantity_factory
+            )
+        grid_data = GridData(**grid_components)
+
+        return damping_coefficients, driver_grid_data, grid_data
+
+    def _generate(
+        self,
+        quantity_factory: QuantityFactory,
+        communicator: CubedSphereCommunicator,
+    ) -> Tuple[DampingCoefficients, DriverGridData, Dict[str, Any]]:
         metric_terms = MetricTerms(
             quantity_factory=quantity_factory, communicator=communicator
         )
@@ -109,26 +163,57 @@ class GeneratedGridConfig(GridInitializer):
                 metric_terms, self.stretch_factor, self.lon_target, self.lat_target
             )
 
-        horizontal_data = HorizontalGridData.new_from_metric_terms(metric_terms)
-        if self.restart_path is not None:
-            vertical_data = VerticalGridData.from_restart(
-                self.restart_path, quantity_factory=quantity_factory
+        grid_components = {
+            "horizontal_data": HorizontalGridData.new_from_metric_terms(metric_terms),
+            "contravariant_data": ContravariantGridData.new_from_metric_terms(
+                metric_terms
+            ),
+            "angle_data": AngleGridData.new_from_metric_terms(metric_terms),
+        }
+        if self.restart_path is None:
+            grid_components["vertical_data"] = VerticalGridData.new_from_metric_terms(
+                metric_terms
             )
-        else:
-            vertical_data = VerticalGridData.new_from_metric_terms(metric_terms)
-        contravariant_data = ContravariantGridData.new_from_metric_terms(metric_terms)
-        angle_data = AngleGridData.new_from_metric_terms(metric_terms)
-        grid_data = GridData(
-            horizontal_data=horizontal_data,
-            vertical_data=vertical_data,
-            contravariant_data=contravariant_data,
-            angle_data=angle_data,
-        )
-
         damping_coefficients = DampingCoefficients.new_from_metric_terms(metric_terms)
         driver_grid_data = DriverGridData.new_from_metric_terms(metric_terms)
 
-        return damping_coefficients, driver_grid_data, grid_data
+        return damping_coefficients, driver_grid_data, grid_components
+
+    def _cache_filename(
+        self,
+        quantity_factory: QuantityFactory,
+        communicator: CubedSphereCommunicator,
+    ) -> str:
+        """
+        Returns the cache file of this rank, in a directory named after a hash
+        of everything the generated grid depends on.
+        """
+        quantity = quantity_factory.empty(
+            dims=[pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_DIM], units="unknown"
+        )
+        nx_tile, ny_tile, nz = communicator.tile.partitioner.global_extent(quantity)
+        stretched = self.stretch_factor != 1
+        key = {
+            "version": _GRID_CACHE_VERSION,
+            "nx_tile": nx_tile,
+            "ny_tile": ny_tile,
+            "nz": nz,
+            "n_halo": quantity_factory.sizer.n_halo,
+            "layout": list(communicator.partitioner.layout),
+            "stretch_factor": self.stretch_factor,
+            # the target is ignored on an unstretched grid
+            "lon_target": self.lon_target if stretched else None,
+            "lat_target": self.lat_target if stretched else None,
+            "backend": quantity.gt4py_backend,
+            # the vertical grid is not cached when it is read from a restart
+            "vertical_grid_from_restart": self.restart_path is not None,
+        }
+        digest = hashlib.sha1(json.dumps(key, sort_keys=True).encode()).hexdigest()
+        return os.path.join(
+            self.cache_path,
+            f"grid_c{nx_tile}_{digest[:12]}",
+            f"rank_{communicator.rank:04d}.npz",
+        )
 
 
 @GridInitializerSelector.register("serialbox")
@@ -220,3 +305,81 @@ def _transform_horizontal_grid(
 
     metric_terms._grid.data[:] = grid.data[:]
     metric_terms._init_agrid()
+
+
+def _save_grid_cache(filename: str, **groups):
+    """
+    Writes grid data to a .npz file, with the metadata needed to rebuild
+    its quantities stored as json alongside the arrays.
+
+    The file is written under a temporary name and then renamed, so an
+    interrupted run never leaves behind a partial cache file.
+    """
+    arrays: Dict[str, np.ndarray] = {}
+    metadata: Dict[str, Dict[str, Any]] = {}
+    for group_name, group in groups.items():
+        metadata[group_name] = {}
+        for field in dataclasses.fields(group):
+            value = getattr(group, field.name)
+            if isinstance(value, pace.util.Quantity):
+                arrays[f"{group_name}.{field.name}"] = to_numpy(value.data)
+                value = {
+                    "dims": list(value.dims),
+                    "units": value.units,
+                    "origin": list(value.origin),
+                    "extent": list(value.extent),
+                }
+            metadata[group_name][field.name] = value
+    dirname = os.path.dirname(filename)
+    os.makedirs(dirname, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=dirname, suffix=".tmp", delete=False) as f:
+        np.savez(f, metadata=np.array(json.dumps(metadata)), **arrays)
+    os.replace(f.name, filename)
+
+
+def _load_grid_cache(
+    filename: str, quantity_factory: QuantityFactory
+) -> Optional[Tuple[DampingCoefficients, DriverGridData, Dict[str, Any]]]:
+    """
+    Reads grid data written by _save_grid_cache, returning None if there
+    is no usable cache file.
+    """
+    if not os.path.isfile(filename):
+        return None
+    backend = quantity_factory.empty(
+        dims=[pace.util.X_DIM, pace.util.Y_DIM], units="unknown"
+    ).gt4py_backend
+    groups = {}
+    try:
+        with np.load(filename) as data:
+            metadata = json.loads(str(data["metadata"]))
+            for group_name, group_metadata in metadata.items():
+                groups[group_name] = _GRID_CACHE_GROUPS[group_name](
+                    **_load_group(
+                        group_metadata, data, prefix=group_name, backend=backend
+                    )
+                )
+    except (OSError, ValueError, KeyError, TypeError) as err:
+        logger.warning("Ignoring unreadable grid cache file %s: %s", filename, err)
+        return None
+    damping_coefficients = groups.pop("damping_coefficients")
+    driver_grid_data = groups.pop("driver_grid_data")
+    return damping_coefficients, driver_grid_data, groups
+
+
+def _load_group(
+    metadata: Mapping[str, Any], data: Mapping[str, np.ndarray], prefix: str, backend
+) -> Dict[str, Any]:
+    fields = {}
+    for name, value in metadata.items():
+        if isinstance(value, dict):
+            value = pace.util.Quantity(
+                data[f"{prefix}.{name}"],
+                dims=value["dims"],
+                units=value["units"],
+                origin=value["origin"],
+                extent=value["extent"],
+                gt4py_backend=backend,
+            )
+        fields[name] = value
+    return fields
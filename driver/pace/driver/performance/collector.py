@@ -1,8 +1,9 @@
 import copy
+import dataclasses
 import os.path
 import subprocess
 from collections.abc import Mapping
-from typing import List, Protocol
+from typing import Dict, List, Optional, Protocol, Tuple
 
 import numpy as np
 
@@ -16,9 +17,14 @@ from pace.driver.performance.report import (
     write_to_timestamped_json,
 )
 from pace.util._optional_imports import cupy as cp
+from pace.util.buffer import BUFFER_CACHE
 from pace.util.utils import GPU_AVAILABLE
 
-from .report import collect_data_and_write_to_file
+from .report import (
+    collect_data_and_write_load_imbalance,
+    collect_data_and_write_to_file,
+)
+from .telemetry import TelemetryWriter
 
 
 class AbstractPerformanceCollector(Protocol):
@@ -33,6 +39,7 @@ class AbstractPerformanceCollector(Protocol):
         backend: str,
         is_orchestrated: bool,
         dt_atmos: float,
+        partitioner: Optional[pace.util.CubedSpherePartitioner] = None,
     ):
         ...
 
@@ -41,6 +48,12 @@ class AbstractPerformanceCollector(Protocol):
     ):
         ...
 
+    def write_out_load_imbalance(self, partitioner: pace.util.CubedSpherePartitioner):
+        ...
+
+    def cleanup(self):
+        ...
+
     @classmethod
     def start_cuda_profiler(cls):
         if GPU_AVAILABLE:
@@ -57,37 +70,121 @@ class AbstractPerformanceCollector(Protocol):
             cp.cuda.nvtx.Mark(message)
 
 
+@dataclasses.dataclass
+class _StepAggregate:
+    """Running aggregate of the timings of each step.
+
+    Attributes:
+        steps: number of steps with timings
+        times: total time of each timer over all steps
+        timed_steps: number of steps in which each timer was clocked
+        hits: total hits of each timer over all steps
+    """
+
+    steps: int = 0
+    times: Dict[str, float] = dataclasses.field(default_factory=dict)
+    timed_steps: Dict[str, int] = dataclasses.field(default_factory=dict)
+    hits: Dict[str, int] = dataclasses.field(default_factory=dict)
+
+    def add(self, times: Mapping[str, float], hits: Mapping[str, int]):
+        if len(hits) > 0:
+            self.steps += 1
+        for name, value in times.items():
+            self.times[name] = self.times.get(name, 0.0) + value
+            self.timed_steps[name] = self.timed_steps.get(name, 0) + 1
+        for name, count in hits.items():
+            self.hits[name] = self.hits.get(name, 0) + count
+
+    def mean_times(self) -> Dict[str, float]:
+        """Mean time per step of each timer, over the steps it was clocked."""
+        return {
+            name: total / self.timed_steps[name] for name, total in self.times.items()
+        }
+
+
 class PerformanceCollector(AbstractPerformanceCollector):
-    def __init__(self, experiment_name: str, comm: pace.util.Comm):
+    """
+    Collects the timings of each step for the performance report.
+
+    If telemetry is given, the timings of each step are streamed to it and only
+    a running aggregate is kept in memory, the performance report then holds the
+    mean time per step of each timer instead of the time of every step.
+    """
+
+    def __init__(
+        self,
+        experiment_name: str,
+        comm: pace.util.Comm,
+        telemetry: Optional[TelemetryWriter] = None,
+        load_imbalance_report: bool = False,
+    ):
         self.times_per_step: List[Mapping[str, float]] = []
         self.hits_per_step: List[Mapping[str, int]] = []
         self.timestep_timer = pace.util.Timer()
         self.total_timer = pace.util.Timer()
         self.experiment_name = experiment_name
         self.comm = comm
+        self.telemetry = telemetry
+        self.load_imbalance_report = load_imbalance_report
+        # only used if telemetry is streamed
+        self._step_aggregate = _StepAggregate()
 
     def collect_performance(self):
         """
         Take the accumulated timings and flush them into a new entry
-        in times_per_step and hits_per_step.
+        in times_per_step and hits_per_step, or into the running aggregate
+        if telemetry is streamed.
         """
-        self.times_per_step.append(self.timestep_timer.times)
-        self.hits_per_step.append(self.timestep_timer.hits)
+        if self.telemetry is None:
+            self.times_per_step.append(self.timestep_timer.times)
+            self.hits_per_step.append(self.timestep_timer.hits)
+        else:
+            self._step_aggregate.add(
+                self.timestep_timer.times, self.timestep_timer.hits
+            )
+            self.telemetry.record(
+                self.timestep_timer.times,
+                self.timestep_timer.hits,
+                buffer_cache=dataclasses.asdict(BUFFER_CACHE.stats),
+            )
         self.timestep_timer.reset()
 
+    def _get_steps(
+        self,
+    ) -> Tuple[int, List[Mapping[str, float]], List[Mapping[str, int]]]:
+        """
+        Returns the number of steps with timings, and the times and hits to
+        report for them, excluding steps without hits.
+        """
+        if self.telemetry is None:
+            hits_per_step = [hits for hits in self.hits_per_step if hits != {}]
+            return len(hits_per_step), list(self.times_per_step), hits_per_step
+        elif self._step_aggregate.steps == 0:
+            return 0, [], []
+        else:
+            return (
+                self._step_aggregate.steps,
+                [self._step_aggregate.mean_times()],
+                [self._step_aggregate.hits],
+            )
+
+    def cleanup(self):
+        """Write any telemetry not yet written to disk."""
+        if self.telemetry is not None:
+            self.telemetry.flush()
+
     def write_out_rank_0(
         self, backend: str, is_orchestrated: bool, dt_atmos: float, sim_status: str
     ):
         if self.comm.Get_rank() == 0:
             git_hash = "None"
-            while {} in self.hits_per_step:
-                self.hits_per_step.remove({})
-            keys = collect_keys_from_data(self.times_per_step)
+            n_steps, times_per_step, hits_per_step = self._get_steps()
+            keys = collect_keys_from_data(times_per_step)
             data: List[float] = []
             timing_info = {}
             for timer_name in keys:
                 data.clear()
-                for data_point in self.times_per_step:
+                for data_point in times_per_step:
                     if timer_name in data_point:
                         data.append(data_point[timer_name])
                 timing_info[timer_name] = TimeReport(
@@ -95,17 +192,18 @@ class PerformanceCollector(AbstractPerformanceCollector):
                 )
             exp_info = get_experiment_info(
                 self.experiment_name,
-                len(self.hits_per_step) - 1,
+                n_steps - 1,
                 backend,
                 git_hash,
                 is_orchestrated,
             )
-            timing_info = gather_hit_counts(self.hits_per_step, timing_info)
+            timing_info = gather_hit_counts(hits_per_step, timing_info)
             report = Report(
                 setup=exp_info,
                 times=timing_info,
                 dt_atmos=dt_atmos,
                 sim_status=sim_status,
+                buffer_cache=dataclasses.asdict(BUFFER_CACHE.stats),
             )
             write_to_timestamped_json(report)
         else:
@@ -116,7 +214,18 @@ class PerformanceCollector(AbstractPerformanceCollector):
         backend: str,
         is_orchestrated: bool,
         dt_atmos: float,
+        partitioner: Optional[pace.util.CubedSpherePartitioner] = None,
     ):
+        """
+        Gather timings from all ranks and write them to a json file on rank 0.
+
+        Args:
+            backend: backend used for the run
+            is_orchestrated: whether the run was orchestrated
+            dt_atmos: atmospheric timestep in seconds
+            partitioner: partitioner of the run, if given and load imbalance
+                reporting is enabled also write a load imbalance report
+        """
         if self.comm.Get_rank() == 0:
             try:
                 driver_path = os.path.dirname(__file__)
@@ -133,23 +242,37 @@ class PerformanceCollector(AbstractPerformanceCollector):
             git_hash = None
         git_hash = self.comm.bcast(git_hash, root=0)
 
-        self.times_per_step.append(self.total_timer.times)
-        self.hits_per_step.append(self.total_timer.hits)
+        n_steps, times_per_step, hits_per_step = self._get_steps()
+        times_per_step.append(self.total_timer.times)
+        if self.total_timer.hits != {}:
+            n_steps += 1
+            hits_per_step.append(self.total_timer.hits)
         self.comm.Barrier()
-        while {} in self.hits_per_step:
-            self.hits_per_step.remove({})
         collect_data_and_write_to_file(
-            len(self.hits_per_step) - 1,
+            n_steps - 1,
             backend,
             is_orchestrated,
             git_hash,
             self.comm,
-            self.hits_per_step,
-            self.times_per_step,
+            hits_per_step,
+            times_per_step,
             self.experiment_name,
             dt_atmos,
+            partitioner=partitioner if self.load_imbalance_report else None,
         )
 
+    def write_out_load_imbalance(self, partitioner: pace.util.CubedSpherePartitioner):
+        """
+        Gather timings from all ranks and write only the load imbalance report
+        on rank 0.
+
+        Args:
+            partitioner: partitioner of the run, to locate slow ranks
+        """
+        _, times_per_step, _ = self._get_steps()
+        times_per_step.append(self.total_timer.times)
+        collect_data_and_write_load_imbalance(self.comm, times_per_step, partitioner)
+
 
 class NullPerformanceCollector(AbstractPerformanceCollector):
     def __init__(self):
@@ -164,6 +287,7 @@ class NullPerformanceCollector(AbstractPerformanceCollector):
         backend: str,
         is_orchestrated: bool,
         dt_atmos: float,
+        partitioner: Optional[pace.util.CubedSpherePartitioner] = None,
     ):
         pass
 
@@ -171,3 +295,9 @@ class NullPerformanceCollector(AbstractPerformanceCollector):
         self, backend: str, is_orchestrated: bool, dt_atmos: float, sim_status: str
     ):
         pass
+
+    def write_out_load_imbalance(self, partitioner: pace.util.CubedSpherePartitioner):
+        pass
+
+    def cleanup(self):
+        pass
@@ -1,13 +1,21 @@
 import dataclasses
+import json
+import os
+from typing import Optional
 
 import pace.util
 from pace.util import NullProfiler, Profiler
+from pace.util.buffer import BUFFER_CACHE
 
 from .collector import (
     AbstractPerformanceCollector,
     NullPerformanceCollector,
     PerformanceCollector,
 )
+from .telemetry import TelemetryWriter
+
+
+BUFFER_CACHE_PROFILE_FILENAME = "buffer_cache_rank{rank:04d}.json"
 
 
 @dataclasses.dataclass
@@ -20,6 +28,22 @@ class PerformanceConfig:
     experiment_name: to be printed in the JSON summary
     json_all_rank_threshold: number of nodes above the full performance
         report for all nodes won't be written (rank 0 is always written)
+    telemetry_path: if given, directory to which per-step timings of each rank
+        and their min/mean/max across ranks are streamed as json lines while
+        the model runs, aggregate with python -m pace.driver.performance.telemetry,
+        the performance report then holds the mean time per step of each timer
+    telemetry_flush_frequency: number of steps between telemetry writes
+    load_imbalance_report: also write a report of the imbalance of each timer
+        across ranks, halo update wait time and the slowest subtiles, written
+        whether or not the all rank performance report is written
+    buffer_cache_max_bytes: if given, largest number of bytes held by cached
+        communication buffers waiting for reuse on each rank, buffers of the
+        least recently used shapes are freed first when it is exceeded
+    buffer_cache_profile_path: if given, directory to which each rank writes
+        the buffers it needed during the run at cleanup
+    buffer_cache_prewarm_path: if given, directory of buffer cache profiles
+        written by a previous run from which each rank allocates its buffers
+        at startup
     """
 
     collect_performance: bool = False
@@ -27,13 +51,54 @@ class PerformanceConfig:
     collect_communication: bool = False
     experiment_name: str = "test"
     json_all_rank_threshold: int = 1000
+    telemetry_path: Optional[str] = None
+    telemetry_flush_frequency: int = 10
+    load_imbalance_report: bool = False
+    buffer_cache_max_bytes: Optional[int] = None
+    buffer_cache_profile_path: Optional[str] = None
+    buffer_cache_prewarm_path: Optional[str] = None
 
     def build(self, comm: pace.util.Comm) -> AbstractPerformanceCollector:
         if self.collect_performance:
-            return PerformanceCollector(experiment_name=self.experiment_name, comm=comm)
+            if self.telemetry_path is not None:
+                telemetry: Optional[TelemetryWriter] = TelemetryWriter(
+                    self.telemetry_path,
+                    comm=comm,
+                    flush_frequency=self.telemetry_flush_frequency,
+                )
+            else:
+                telemetry = None
+            return PerformanceCollector(
+                experiment_name=self.experiment_name,
+                comm=comm,
+                telemetry=telemetry,
+                load_imbalance_report=self.load_imbalance_report,
+            )
         else:
             return NullPerformanceCollector()
 
+    def configure_buffer_cache(self, comm: pace.util.Comm):
+        """Apply the byte budget to the buffer cache and pre-warm it if configured."""
+        BUFFER_CACHE.set_max_bytes(self.buffer_cache_max_bytes)
+        if self.buffer_cache_prewarm_path is not None:
+            filename = os.path.join(
+                self.buffer_cache_prewarm_path,
+                BUFFER_CACHE_PROFILE_FILENAME.format(rank=comm.Get_rank()),
+            )
+            with open(filename, "r") as f:
+                BUFFER_CACHE.prewarm(json.load(f))
+
+    def write_buffer_cache_profile(self, comm: pace.util.Comm):
+        """Write the buffers needed so far by this rank, if configured."""
+        if self.buffer_cache_profile_path is not None:
+            os.makedirs(self.buffer_cache_profile_path, exist_ok=True)
+            filename = os.path.join(
+                self.buffer_cache_profile_path,
+                BUFFER_CACHE_PROFILE_FILENAME.format(rank=comm.Get_rank()),
+            )
+            with open(filename, "w") as f:
+                json.dump(BUFFER_CACHE.profile(), f, indent=4)
+
     def build_profiler(self):
         if self.collect_cProfile:
             return Profiler()
@@ -2,11 +2,18 @@ import copy
 import dataclasses
 import json
 from datetime import datetime
-from typing import Any, Dict, List, Mapping
+from typing import Any, Dict, List, Mapping, Optional, Union
 
 import numpy as np
 
+from pace.util.buffer import BUFFER_CACHE
 from pace.util.comm import Comm
+from pace.util.partitioner import CubedSpherePartitioner
+
+
+# timers clocked by halo updaters when communication is collected
+HALO_WAIT_TIMERS = ("wait",)
+HALO_OVERHEAD_TIMERS = ("pack", "unpack", "Isend", "Irecv")
 
 
 @dataclasses.dataclass
@@ -32,11 +39,167 @@ class Report:
     dt_atmos: float
     sim_status: str = "Finished"
     SYPD: float = 0.0
+    # buffer cache statistics of the reporting rank, or a list of those of
+    # each rank when gathered from all ranks
+    buffer_cache: Optional[Union[dict, List[dict]]] = None
 
     def __post_init__(self):
         self.SYPD = get_sypd(self.times, self.dt_atmos)
 
 
+@dataclasses.dataclass
+class TimerImbalance:
+    """Spread across ranks of the total time spent in a timer.
+
+    Attributes:
+        min: minimum total time of any rank
+        mean: mean total time across ranks
+        max: maximum total time of any rank
+        imbalance: ratio of the maximum to the mean, 1 if perfectly balanced
+        slowest_rank: rank with the maximum total time
+    """
+
+    min: float
+    mean: float
+    max: float
+    imbalance: float
+    slowest_rank: int
+
+
+@dataclasses.dataclass
+class RankLocation:
+    """Total time of a rank and the location of its subtile.
+
+    Attributes:
+        rank: global rank
+        time: total time of the rank
+        tile: index of the tile containing the rank's subtile
+        subtile_y: y-index of the subtile within its tile
+        subtile_x: x-index of the subtile within its tile
+    """
+
+    rank: int
+    time: float
+    tile: int
+    subtile_y: int
+    subtile_x: int
+
+
+@dataclasses.dataclass
+class LoadImbalanceReport:
+    """Load imbalance across ranks.
+
+    Attributes:
+        timers: imbalance of each timer
+        compute: imbalance of the reference timer excluding halo update timers,
+            other timers are not split as halo update timers are not attributed
+            to the timer enclosing the update
+        halo_wait: imbalance of time spent waiting on halo updates
+        halo_overhead: imbalance of time spent packing, unpacking, and
+            starting halo updates
+        slowest_ranks: ranks with the largest reference timer total, slowest first
+        reference_timer: timer used for compute and slowest_ranks
+    """
+
+    timers: Dict[str, TimerImbalance]
+    compute: Optional[TimerImbalance]
+    halo_wait: Optional[TimerImbalance]
+    halo_overhead: Optional[TimerImbalance]
+    slowest_ranks: List[RankLocation]
+    reference_timer: str
+
+
+def get_timer_imbalance(rank_totals: np.ndarray) -> TimerImbalance:
+    """Compute the imbalance of the per-rank total times of a timer."""
+    mean = float(np.mean(rank_totals))
+    return TimerImbalance(
+        min=float(np.min(rank_totals)),
+        mean=mean,
+        max=float(np.max(rank_totals)),
+        imbalance=float(np.max(rank_totals)) / mean if mean > 0 else 1.0,
+        slowest_rank=int(np.argmax(rank_totals)),
+    )
+
+
+def get_load_imbalance(
+    timing_info: Mapping[str, TimeReport],
+    partitioner: CubedSpherePartitioner,
+    reference_timer: str = "mainloop",
+    n_slowest: int = 10,
+) -> LoadImbalanceReport:
+    """Analyze load imbalance of timings gathered from all ranks.
+
+    Args:
+        timing_info: gathered timings, the times of each timer are a list over
+            ranks of lists over steps, as returned by gather_timing_data
+        partitioner: partitioner used for the run, to locate slow ranks
+        reference_timer: timer containing the halo update timers, used to split
+            halo update time from compute and to rank the slowest subtiles
+        n_slowest: number of slowest ranks to report
+
+    Halo update timers are clocked by name regardless of the timer enclosing the
+    update, so their time cannot be attributed to other timers and compute is
+    only split from halo update time for reference_timer. The reference timer
+    should enclose every halo update, as the main loop does.
+
+    Returns:
+        load imbalance report
+    """
+    rank_totals = {
+        name: np.array([np.sum(rank_times) for rank_times in report.times])
+        for name, report in timing_info.items()
+    }
+    n_ranks = len(next(iter(rank_totals.values()))) if rank_totals else 0
+    if n_ranks != partitioner.total_ranks:
+        raise ValueError(
+            f"timings are for {n_ranks} ranks but the partitioner "
+            f"has {partitioner.total_ranks} ranks"
+        )
+
+    def sum_timers(names):
+        present = [rank_totals[name] for name in names if name in rank_totals]
+        if len(present) == 0:
+            return None
+        return np.sum(present, axis=0)
+
+    halo_wait = sum_timers(HALO_WAIT_TIMERS)
+    halo_overhead = sum_timers(HALO_OVERHEAD_TIMERS)
+    if reference_timer in rank_totals:
+        reference = rank_totals[reference_timer]
+        compute = reference.copy()
+        for halo_totals in (halo_wait, halo_overhead):
+            if halo_totals is not None:
+                compute -= halo_totals
+        slowest = np.argsort(reference)[::-1][:n_slowest]
+        slowest_ranks = []
+        for rank in slowest:
+            subtile_y, subtile_x = partitioner.tile.subtile_index(int(rank))
+            slowest_ranks.append(
+                RankLocation(
+                    rank=int(rank),
+                    time=float(reference[rank]),
+                    tile=partitioner.tile_index(int(rank)),
+                    subtile_y=subtile_y,
+                    subtile_x=subtile_x,
+                )
+            )
+    else:
+        compute = None
+        slowest_ranks = []
+    return LoadImbalanceReport(
+        timers={
+            name: get_timer_imbalance(totals) for name, totals in rank_totals.items()
+        },
+        compute=get_timer_imbalance(compute) if compute is not None else None,
+        halo_wait=get_timer_imbalance(halo_wait) if halo_wait is not None else None,
+        halo_overhead=(
+            get_timer_imbalance(halo_overhead) if halo_overhead is not None else None
+        ),
+        slowest_ranks=slowest_ranks,
+        reference_timer=reference_timer,
+    )
+
+
 def get_experiment_info(
     experiment_name: str,
     time_step: int,
@@ -96,9 +259,9 @@ def gather_timing_data(
     return timing_info
 
 
-def write_to_timestamped_json(experiment: Report) -> None:
+def write_to_timestamped_json(experiment, suffix: str = "") -> None:
     now = datetime.now()
-    filename = now.strftime("%Y-%m-%d-%H-%M-%S")
+    filename = now.strftime("%Y-%m-%d-%H-%M-%S") + suffix
     with open(filename + ".json", "w") as outfile:
         json.dump(dataclasses.asdict(experiment), outfile, sort_keys=True, indent=4)
 
@@ -139,17 +302,47 @@ def collect_data_and_write_to_file(
     times_per_step: List,
     experiment_name: str,
     dt_atmos: float,
+    partitioner: Optional[CubedSpherePartitioner] = None,
 ) -> None:
     """
-    collect the gathered data from all the ranks onto rank 0 and write the timing file
+    collect the gathered data from all the ranks onto rank 0 and write the timing file,
+    if a partitioner is given also write a load imbalance report
     """
     is_root = comm.Get_rank() == 0
     timing_info = gather_timing_data(times_per_step, comm)
+    buffer_cache = comm.allgather(dataclasses.asdict(BUFFER_CACHE.stats))
 
     if is_root:
         exp_info = get_experiment_info(
             experiment_name, time_step, backend, git_hash, is_orchestrated
         )
         timing_info = gather_hit_counts(hits_per_step, timing_info)
-        report = Report(setup=exp_info, times=timing_info, dt_atmos=dt_atmos)
+        report = Report(
+            setup=exp_info,
+            times=timing_info,
+            dt_atmos=dt_atmos,
+            buffer_cache=buffer_cache,
+        )
         write_to_timestamped_json(report)
+        if partitioner is not None:
+            write_to_timestamped_json(
+                get_load_imbalance(timing_info, partitioner),
+                suffix="_load_imbalance",
+            )
+
+
+def collect_data_and_write_load_imbalance(
+    comm: Comm,
+    times_per_step: List,
+    partitioner: CubedSpherePartitioner,
+) -> None:
+    """
+    collect the gathered data from all the ranks onto rank 0 and write only the
+    load imbalance report
+    """
+    timing_info = gather_timing_data(times_per_step, comm)
+    if comm.Get_rank() == 0:
+        write_to_timestamped_json(
+            get_load_imbalance(timing_info, partitioner),
+            suffix="_load_imbalance",
+        )
@@ -0,0 +1,253 @@
+import glob
+import json
+import os
+from typing import Any, Dict, List, Mapping, Optional
+
+import click
+import numpy as np
+
+from pace.util.comm import Comm
+
+from .report import collect_keys_from_data
+
+
+RANK_FILENAME = "telemetry_rank{rank:04d}.jsonl"
+SUMMARY_FILENAME = "telemetry_summary.jsonl"
+
+
+class TelemetryWriter:
+    """
+    Streams per-step timings to append-only JSON lines files while a run is
+    ongoing, so timing data survives a killed run and can be inspected live.
+
+    Every rank writes its own timings to telemetry_rank{rank}.jsonl. Each time
+    the buffered steps are flushed, the timings are gathered to rank 0 which
+    appends the minimum, mean and maximum across ranks of each timer, and the
+    rank with the maximum time, to telemetry_summary.jsonl.
+    """
+
+    def __init__(self, path: str, comm: Comm, flush_frequency: int = 10):
+        """
+        Args:
+            path: directory in which to write telemetry files
+            comm: communicator over all ranks, flushing is collective
+            flush_frequency: number of steps to buffer before writing to disk
+        """
+        if flush_frequency < 1:
+            raise ValueError(
+                f"flush_frequency must be at least 1, got {flush_frequency}"
+            )
+        self.path = path
+        self.comm = comm
+        self.flush_frequency = flush_frequency
+        self._rank = comm.Get_rank()
+        self._step = 0
+        self._times: List[Mapping[str, float]] = []
+        self._hits: List[Mapping[str, int]] = []
+        self._buffer_cache: List[Optional[Mapping[str, int]]] = []
+        os.makedirs(path, exist_ok=True)
+
+    def record(
+        self,
+        times: Mapping[str, float],
+        hits: Mapping[str, int],
+        buffer_cache: Optional[Mapping[str, int]] = None,
+    ):
+        """
+        Record the timings of one step, flushing to disk every flush_frequency
+        steps. Must be called on all ranks.
+
+        Args:
+            times: timings of the step
+            hits: hit counts of the step
+            buffer_cache: if given, buffer cache counters and memory accounting
+                at the end of the step, written along with the rank's timings
+        """
+        self._times.append(dict(times))
+        self._hits.append(dict(hits))
+        self._buffer_cache.append(
+            dict(buffer_cache) if buffer_cache is not None else None
+        )
+        if len(self._times) >= self.flush_frequency:
+            self.flush()
+
+    def flush(self):
+        """Write buffered steps to disk. Must be called on all ranks."""
+        # flush_frequency is the same on all ranks, so all ranks agree on
+        # whether there is anything to flush
+        if len(self._times) == 0:
+            return
+        first_step = self._step
+        with open(
+            os.path.join(self.path, RANK_FILENAME.format(rank=self._rank)), "a"
+        ) as f:
+            for i, (times, hits, buffer_cache) in enumerate(
+                zip(self._times, self._hits, self._buffer_cache)
+            ):
+                record = {
+                    "step": first_step + i,
+                    "rank": self._rank,
+                    "times": times,
+                    "hits": hits,
+                }
+                if buffer_cache is not None:
+                    record["buffer_cache"] = buffer_cache
+                f.write(json.dumps(record) + "\n")
+        self._write_summary(first_step)
+        self._step += len(self._times)
+        self._times.clear()
+        self._hits.clear()
+        self._buffer_cache.clear()
+
+    def _write_summary(self, first_step: int):
+        keys = sorted(
+            set().union(*self.comm.allgather(collect_keys_from_data(self._times)))
+        )
+        sendbuf = np.full((len(self._times), len(keys)), np.nan)
+        for i_step, times in enumerate(self._times):
+            for i_key, key in enumerate(keys):
+                sendbuf[i_step, i_key] = times.get(key, np.nan)
+        if self._rank == 0:
+            recvbuf = np.empty((self.comm.Get_size(),) + sendbuf.shape)
+        else:
+            recvbuf = None
+        self.comm.Gather(sendbuf, recvbuf, root=0)
+        if self._rank == 0:
+            summaries = summarize_across_ranks(recvbuf, keys)
+            with open(os.path.join(self.path, SUMMARY_FILENAME), "a") as f:
+                for i, summary in enumerate(summaries):
+                    f.write(json.dumps({"step": first_step + i, **summary}) + "\n")
+
+
+def summarize_across_ranks(
+    times: np.ndarray, keys: List[str]
+) -> List[Dict[str, Dict[str, Any]]]:
+    """
+    Compute statistics across ranks of per-step timings.
+
+    Args:
+        times: timings of shape [n_ranks, n_steps, n_keys], NaN where a timer
+            was not hit on a rank
+        keys: timer names corresponding to the last dimension of times
+
+    Returns:
+        summaries: for each step, the minimum, mean and maximum across ranks of
+            each timer and the rank with the maximum time
+    """
+    summaries = []
+    for i_step in range(times.shape[1]):
+        summary: Dict[str, Dict[str, Any]] = {
+            "min": {},
+            "mean": {},
+            "max": {},
+            "max_rank": {},
+        }
+        for i_key, key in enumerate(keys):
+            values = times[:, i_step, i_key]
+            if np.all(np.isnan(values)):
+                continue
+            summary["min"][key] = float(np.nanmin(values))
+            summary["mean"][key] = float(np.nanmean(values))
+            summary["max"][key] = float(np.nanmax(values))
+            summary["max_rank"][key] = int(np.nanargmax(values))
+        summaries.append(summary)
+    return summaries
+
+
+def read_jsonl(filename: str) -> List[Dict[str, Any]]:
+    """
+    Read records from a JSON lines file, ignoring a truncated final line as
+    left behind by a run killed while writing.
+    """
+    records = []
+    with open(filename, "r") as f:
+        lines = f.readlines()
+    for i, line in enumerate(lines):
+        try:
+            records.append(json.loads(line))
+        except json.JSONDecodeError:
+            if i == len(lines) - 1:
+                break
+            raise
+    return records
+
+
+def aggregate_telemetry(path: str) -> Dict[str, Any]:
+    """
+    Aggregate the per-rank telemetry files written by TelemetryWriter.
+
+    Args:
+        path: directory containing telemetry files
+
+    Returns:
+        aggregate: number of ranks and of steps present on all ranks, and for
+            each timer the per-step minimum, mean and maximum across ranks as well
+            as the total time of each rank
+    """
+    filenames = sorted(glob.glob(os.path.join(path, "telemetry_rank*.jsonl")))
+    if len(filenames) == 0:
+        raise ValueError(f"no telemetry files found in {path}")
+    records_per_rank = [read_jsonl(filename) for filename in filenames]
+    # a killed run may have flushed more steps on some ranks than others
+    n_steps = min(len(records) for records in records_per_rank)
+    keys = sorted(
+        set().union(
+            *[
+                collect_keys_from_data([record["times"] for record in records])
+                for records in records_per_rank
+            ]
+        )
+    )
+    times = np.full((len(records_per_rank), n_steps, len(keys)), np.nan)
+    for i_rank, records in enumerate(records_per_rank):
+        for i_step, record in enumerate(records[:n_steps]):
+            for i_key, key in enumerate(keys):
+                times[i_rank, i_step, i_key] = record["times"].get(key, np.nan)
+    timers = {}
+    for i_key, key in enumerate(keys):
+        values = times[:, :, i_key]
+        timers[key] = {
+            "min": np.nanmin(values, axis=0).tolist(),
+            "mean": np.nanmean(values, axis=0).tolist(),
+            "max": np.nanmax(values, axis=0).tolist(),
+            "rank_total": np.nansum(values, axis=1).tolist(),
+        }
+    return {
+        "ranks": [
+            int(os.path.basename(filename)[len("telemetry_rank") : -len(".jsonl")])
+            for filename in filenames
+        ],
+        "n_steps": n_steps,
+        "timers": timers,
+    }
+
+
+@click.command()
+@click.argument("path", required=True, type=click.Path(exists=True))
+@click.option(
+    "--output",
+    default=None,
+    type=click.Path(),
+    help="write the full per-step aggregate as json to this file",
+)
+def command_line(path: str, output: Optional[str]):
+    """
+    Aggregate per-rank telemetry written to PATH during a run.
+    """
+    aggregate = aggregate_telemetry(path)
+    print(f"{len(aggregate['ranks'])} ranks, {aggregate['n_steps']} steps")
+    print(f"{'timer':<40} {'mean':>10} {'min':>10} {'max':>10} {'slowest rank':>13}")
+    for key, timer in aggregate["timers"].items():
+        slowest_rank = aggregate["ranks"][int(np.argmax(timer["rank_total"]))]
+        print(
+            f"{key:<40} {np.nanmean(timer['mean']):>10.4f} "
+            f"{np.nanmin(timer['min']):>10.4f} {np.nanmax(timer['max']):>10.4f} "
+            f"{slowest_rank:>13}"
+        )
+    if output is not None:
+        with open(output, "w") as f:
+            json.dump(aggregate, f, indent=4)
+
+
+if __name__ == "__main__":
+    command_line()
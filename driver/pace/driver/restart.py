@@ -0,0 +1,185 @@
+import copy
+import dataclasses
+import logging
+import os
+import threading
+from typing import Callable, List, Optional
+
+from .state import (
+    COMPLETE_MARKER,
+    NETCDF_WRITE_LOCK,
+    DriverState,
+    _restart_buffers,
+    _write_complete_marker,
+)
+
+
+logger = logging.getLogger(__name__)
+
+STAGING_DIRECTORY = ".staging_{rank}"
+
+
+def is_restart_complete(restart_path: str, total_ranks: int) -> bool:
+    """
+    Returns True if every rank has finished writing its restart files
+    to restart_path.
+
+    Args:
+        restart_path: restart directory written by IntermediateRestartWriter
+        total_ranks: number of ranks which wrote the restart
+    """
+    return all(
+        os.path.exists(os.path.join(restart_path, COMPLETE_MARKER.format(rank=rank)))
+        for rank in range(total_ranks)
+    )
+
+
+def _copy_state(source: DriverState, target: Optional[DriverState]) -> DriverState:
+    """Copy the restart data of source into target, allocating it if None."""
+    if target is None:
+        return dataclasses.replace(
+            source,
+            dycore_state=copy.deepcopy(source.dycore_state),
+            physics_state=copy.deepcopy(source.physics_state),
+        )
+    for state_name in ("dycore_state", "physics_state"):
+        for (_, _, to_buffer), (_, _, from_buffer) in zip(
+            _restart_buffers(getattr(target, state_name)),
+            _restart_buffers(getattr(source, state_name)),
+        ):
+            to_buffer[:] = from_buffer
+    return target
+
+
+class IntermediateRestartWriter:
+    """
+    Writes restart directories for one rank, optionally in a background thread.
+
+    Files are first written to a staging directory inside the restart directory
+    and moved into place once complete, after which an empty marker file
+    ".restart_complete_{rank}" is written. A restart directory is only valid if
+    all ranks have written their marker, which can be checked with
+    is_restart_complete, so a run stopped mid-write never leaves a restart which
+    looks complete. State files are written holding NETCDF_WRITE_LOCK, as HDF5
+    is not thread-safe and diagnostics may be written from another thread.
+
+    At most one restart is written at a time, writing a new restart first waits
+    for the previous one to finish.
+    """
+
+    def __init__(
+        self, rank: int, background: bool = False, keep_last: Optional[int] = None
+    ):
+        """
+        Args:
+            rank: rank of this process
+            background: if True, copy the state to a staging buffer and write it
+                in a background thread
+            keep_last: if given, after writing a restart remove this rank's files
+                from all but the last keep_last restart directories it wrote
+        """
+        if keep_last is not None and keep_last < 1:
+            raise ValueError(f"keep_last must be at least 1, got {keep_last}")
+        self.rank = rank
+        self.background = background
+        self.keep_last = keep_last
+        self._staged_state: Optional[DriverState] = None
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+        self._written: List[str] = []
+
+    def write(
+        self,
+        state: DriverState,
+        restart_path: str,
+        restart_format: str,
+        write_config: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Write the restart files of this rank to restart_path.
+
+        Args:
+            state: state to write
+            restart_path: restart directory
+            restart_format: format of restart files, see DriverState.save_state
+            write_config: if given, called once the state files are in place to
+                write the configuration for restarting
+        """
+        self.wait()
+        if self.background:
+            self._staged_state = _copy_state(state, self._staged_state)
+            self._thread = threading.Thread(
+                target=self._write_in_thread,
+                args=(self._staged_state, restart_path, restart_format, write_config),
+                name="pace-restart-writer",
+                daemon=True,
+            )
+            self._thread.start()
+        else:
+            self._write(state, restart_path, restart_format, write_config)
+
+    def wait(self):
+        """
+        Block until any restart being written in the background is complete.
+
+        Raises:
+            RuntimeError: if writing the restart failed
+        """
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("background restart write failed") from error
+
+    def _write_in_thread(self, *args):
+        try:
+            self._write(*args)
+        except BaseException as error:
+            self._error = error
+
+    def _write(
+        self,
+        state: DriverState,
+        restart_path: str,
+        restart_format: str,
+        write_config: Optional[Callable[[], None]],
+    ):
+        staging_path = os.path.join(
+            restart_path, STAGING_DIRECTORY.format(rank=self.rank)
+        )
+        with NETCDF_WRITE_LOCK:
+            state._save_state_files(
+                rank=self.rank, restart_path=staging_path, restart_format=restart_format
+            )
+        for fname in os.listdir(staging_path):
+            os.replace(
+                os.path.join(staging_path, fname), os.path.join(restart_path, fname)
+            )
+        os.rmdir(staging_path)
+        if write_config is not None:
+            write_config()
+        _write_complete_marker(restart_path, self.rank)
+        logger.info(f"restart written to {restart_path}")
+        self._written.append(restart_path)
+        if self.keep_last is not None:
+            while len(self._written) > self.keep_last:
+                self._remove(self._written.pop(0))
+
+    def _remove(self, restart_path: str):
+        """Remove the files this rank wrote to restart_path."""
+        os.remove(os.path.join(restart_path, COMPLETE_MARKER.format(rank=self.rank)))
+        suffix = f"_{self.rank}"
+        for fname in os.listdir(restart_path):
+            if os.path.splitext(fname)[0].endswith(suffix):
+                os.remove(os.path.join(restart_path, fname))
+        if self.rank == 0 and os.path.exists(
+            os.path.join(restart_path, "restart.yaml")
+        ):
+            os.remove(os.path.join(restart_path, "restart.yaml"))
+        try:
+            # succeeds only for the last rank to remove its files
+            os.rmdir(restart_path)
+        except OSError:
+            pass
+        logger.info(f"removed restart files in {restart_path} for rank {self.rank}")
@@ -1,5 +1,5 @@
 import logging
-from typing import ClassVar, Dict, Optional
+from typing import ClassVar, Dict, List, Optional, Tuple
 
 import numpy as np
 
@@ -9,6 +9,10 @@ from pace.util.quantity import Quantity
 
 logger = logging.getLogger(__name__)
 
+# size of the blocks in which min and max are reduced together, chosen so a
+# block stays in cache between the two reductions
+_BLOCK_BYTES = 256 * 1024
+
 
 class VariableBounds:
     def __init__(
@@ -22,6 +26,25 @@ class VariableBounds:
         self.compute_domain_only = compute_domain_only
 
 
+def _min_max(array) -> Tuple[float, float]:
+    """Return the minimum and maximum of an array in a single sweep over memory.
+
+    NaN values propagate into both the minimum and maximum.
+    """
+    if not isinstance(array, np.ndarray) or array.ndim == 0 or array.size == 0:
+        # device arrays are reduced whole, blocking would only add launches
+        return array.min(), array.max()
+    row_bytes = max(array[0].size * array.itemsize, 1)
+    n_rows = max(_BLOCK_BYTES // row_bytes, 1)
+    min_value, max_value = np.inf, -np.inf
+    for start in range(0, array.shape[0], n_rows):
+        block = array[start : start + n_rows]
+        # np.minimum/np.maximum propagate NaN, unlike the builtin min and max
+        min_value = np.minimum(min_value, block.min())
+        max_value = np.maximum(max_value, block.max())
+    return min_value, max_value
+
+
 class SafetyChecker:
     """Safety-Checker that checks the state for sanity of variables
 
@@ -33,6 +56,18 @@ class SafetyChecker:
 
     checks: ClassVar[Dict[str, VariableBounds]] = {}
 
+    def __init__(self, sample_stride: Optional[int] = None):
+        """
+        Args:
+            sample_stride (Optional[int], optional): If given, only check every
+                sample_stride-th point along each dimension. This makes frequent
+                checks cheap, at the cost of possibly missing violations at
+                points which are not sampled. Defaults to None, checking all points.
+        """
+        if sample_stride is not None and sample_stride < 1:
+            raise ValueError(f"sample_stride must be at least 1, got {sample_stride}")
+        self.sample_stride = sample_stride
+
     @classmethod
     def register_variable(
         cls,
@@ -67,44 +102,73 @@ class SafetyChecker:
         """Clear all the registered checks"""
         cls.checks.clear()
 
-    def check_state(self, state: DycoreState):
-        """check the given dycore state with all the registered constraints
+    def find_violations(self, state: DycoreState) -> List[str]:
+        """Check the given dycore state with all the registered constraints
 
         Args:
             state (DycoreState): State to check
 
         Raises:
             NotImplementedError: If one of the registered variables are not in the state
-            RuntimeError: If one of the variables exceeds its specified bounds
+
+        Returns:
+            List[str]: a description of every violated constraint, empty if the
+                state satisfies all constraints
         """
+        violations = []
         for variable, variable_bounds in self.checks.items():
             try:
                 var: Quantity = state.__getattribute__(variable)
             except AttributeError:
                 raise NotImplementedError("Variable is not in the state")
             if variable_bounds.compute_domain_only:
-
-                min_value = var.view[:].min()
-                max_value = var.view[:].max()
+                array = var.view[:]
             else:
-                min_value = var.data.min()
-                max_value = var.data.max()
-
+                array = var.data
+            if self.sample_stride is not None:
+                array = array[(slice(None, None, self.sample_stride),) * array.ndim]
+            min_value, max_value = _min_max(array)
+
+            if np.isnan(min_value):
+                # only NaN values in the compute domain are violations, NaN
+                # values in the halo make the bounds checks inconclusive
+                view = var.view[:]
+                if self.sample_stride is not None:
+                    view = view[(slice(None, None, self.sample_stride),) * view.ndim]
+                if variable_bounds.compute_domain_only or np.isnan(_min_max(view)[0]):
+                    violations.append(f"Variable {variable} contains a NaN value")
+                continue
             if (
-                variable_bounds.minimum_value
+                variable_bounds.minimum_value is not None
                 and min_value < variable_bounds.minimum_value
             ):
-                raise RuntimeError(
-                    f"Variable {variable} is outside of its specified bounds: \
-                    {variable_bounds.minimum_value} specified, {min_value} found"
+                violations.append(
+                    f"Variable {variable} is outside of its specified bounds: "
+                    f"{variable_bounds.minimum_value} specified, {min_value} found"
                 )
             if (
-                variable_bounds.maximum_value
+                variable_bounds.maximum_value is not None
                 and max_value > variable_bounds.maximum_value
             ):
-                raise RuntimeError(
-                    f"Variable {variable} is outside of its specified bounds: \
-                    {variable_bounds.maximum_value} specified, {max_value} found"
+                violations.append(
+                    f"Variable {variable} is outside of its specified bounds: "
+                    f"{variable_bounds.maximum_value} specified, {max_value} found"
                 )
-            if np.isnan(var.view[:]).any():
-                raise RuntimeError(f"Variable {variable} contains a NaN value")
+        return violations
+
+    def check_state(self, state: DycoreState):
+        """check the given dycore state with all the registered constraints
+
+        Args:
+            state (DycoreState): State to check
+
+        Raises:
+            NotImplementedError: If one of the registered variables are not in the state
+            RuntimeError: If any of the variables exceeds its specified bounds,
+                listing all violations
+        """
+        violations = self.find_violations(state)
+        for violation in violations:
+            logger.error(violation)
+        if len(violations) > 0:
+            raise RuntimeError("\n".join(violations))
@@ -1,6 +1,11 @@
 import dataclasses
+import json
+import os
+import threading
+import warnings
 from dataclasses import fields
 
+import numpy as np
 import xarray as xr
 
 import pace.dsl.gt4py_utils as gt_utils
@@ -10,6 +15,14 @@ import pace.util.grid
 from pace import fv3core
 
 
+RESTART_FORMATS = ("netcdf", "binary")
+BINARY_RESTART_VERSION = 1
+# written by each rank once its restart files are complete
+COMPLETE_MARKER = ".restart_complete_{rank}"
+# HDF5 is not thread-safe, held by every driver thread writing netCDF files
+NETCDF_WRITE_LOCK = threading.RLock()
+
+
 @dataclasses.dataclass()
 class TendencyState:
     """
@@ -104,11 +117,48 @@ class DriverState:
         )
         return state
 
-    def save_state(self, comm, restart_path: str = "RESTART"):
+    def save_state(
+        self, comm, restart_path: str = "RESTART", restart_format: str = "netcdf"
+    ):
+        """
+        Write the dycore and physics state of this rank to restart files.
+
+        Args:
+            comm: communication object behaving like mpi4py.Comm
+            restart_path: directory in which to write restart files
+            restart_format: one of "netcdf", which writes a netCDF dataset per
+                state, or "binary", which writes each quantity buffer contiguously
+                to a raw file alongside a json header, for fast reads via memmap
+        """
+        rank = comm.Get_rank()
+        with NETCDF_WRITE_LOCK:
+            self._save_state_files(
+                rank=rank,
+                restart_path=restart_path,
+                restart_format=restart_format,
+            )
+        _write_complete_marker(restart_path, rank)
+
+    def _save_state_files(self, rank: int, restart_path: str, restart_format: str):
         from pathlib import Path
 
+        if restart_format not in RESTART_FORMATS:
+            raise ValueError(
+                f"restart_format must be one of {RESTART_FORMATS}, "
+                f"got {restart_format}"
+            )
         Path(restart_path).mkdir(parents=True, exist_ok=True)
-        current_rank = str(comm.Get_rank())
+        current_rank = str(rank)
+        if restart_format == "binary":
+            _write_binary_restart(
+                self.dycore_state,
+                f"{restart_path}/restart_dycore_state_{current_rank}",
+            )
+            _write_binary_restart(
+                self.physics_state,
+                f"{restart_path}/restart_physics_state_{current_rank}",
+            )
+            return
         self.dycore_state.xr_dataset.to_netcdf(
             f"{restart_path}/restart_dycore_state_{current_rank}.nc"
         )
@@ -167,6 +217,94 @@ def _overwrite_state_from_restart(
             )
 
 
+def _restart_buffers(state):
+    """Yield the name, field and data buffer of each Quantity field of state."""
+    for _field in fields(type(state)):
+        if isinstance(_field.type, type) and issubclass(
+            _field.type, pace.util.Quantity
+        ):
+            value = getattr(state, _field.name)
+            if isinstance(value, pace.util.Quantity):
+                value = value.data
+            yield _field.name, _field, value
+
+
+def _write_binary_restart(state, prefix: str):
+    """
+    Write the quantity buffers of a state contiguously to {prefix}.bin, with
+    the offset, shape and dtype of each buffer recorded in {prefix}.json.
+
+    Args:
+        state: state whose Quantity fields are written
+        prefix: path of the restart files without extension
+    """
+    header = {"version": BINARY_RESTART_VERSION, "variables": {}}
+    offset = 0
+    with open(prefix + ".bin", "wb") as f:
+        for name, _field, buffer in _restart_buffers(state):
+            data = np.ascontiguousarray(gt_utils.asarray(buffer))
+            f.write(memoryview(data).cast("B"))
+            header["variables"][name] = {
+                "offset": offset,
+                "shape": list(data.shape),
+                "dtype": data.dtype.str,
+                "units": _field.metadata.get("units", "unknown"),
+            }
+            offset += data.nbytes
+    with open(prefix + ".json", "w") as f:
+        json.dump(header, f)
+
+
+def _overwrite_state_from_binary_restart(
+    path: str,
+    rank: int,
+    state,
+    restart_file_prefix: str,
+):
+    """
+    Args:
+        path: path to restart files
+        rank: current rank number
+        state: an empty state whose buffers are overwritten
+        restart_file_prefix: file prefix name to read
+    """
+    prefix = os.path.join(path, f"{restart_file_prefix}_{rank}")
+    with open(prefix + ".json", "r") as f:
+        header = json.load(f)
+    if header["version"] != BINARY_RESTART_VERSION:
+        raise ValueError(
+            f"binary restart version {header['version']} in {prefix}.json "
+            f"is not supported, expected {BINARY_RESTART_VERSION}"
+        )
+    restart_data = np.memmap(prefix + ".bin", dtype=np.uint8, mode="r")
+    for name, _, buffer in _restart_buffers(state):
+        info = header["variables"][name]
+        dtype = np.dtype(info["dtype"])
+        shape = tuple(info["shape"])
+        if shape != buffer.shape:
+            raise ValueError(
+                f"restart data for {name} has shape {shape}, "
+                f"expected {buffer.shape}"
+            )
+        nbytes = dtype.itemsize * int(np.prod(shape))
+        data = (
+            restart_data[info["offset"] : info["offset"] + nbytes]
+            .view(dtype)
+            .reshape(shape)
+        )
+        if isinstance(buffer, np.ndarray):
+            buffer[:] = data
+        else:
+            buffer[:] = gt_utils.asarray(data, to_type=type(buffer))
+
+
+def _write_complete_marker(restart_path: str, rank: int):
+    """Mark the restart files of rank in restart_path as completely written."""
+    marker = os.path.join(restart_path, COMPLETE_MARKER.format(rank=rank))
+    open(marker + ".tmp", "w").close()
+    os.replace(marker + ".tmp", marker)
+
+
 def _restart_driver_state(
     path: str,
     rank: int,
@@ -182,11 +320,36 @@ def _restart_driver_state(
     is_fortran_restart = any(
         fname.endswith("fv_core.res.nc") for fname in restart_files
     )
+    markers = [
+        os.path.basename(fname)
+        for fname in restart_files
+        if os.path.basename(fname).startswith(COMPLETE_MARKER.format(rank=""))
+    ]
+    # Fortran restarts are not written by pace and have no completion markers
+    if not is_fortran_restart:
+        if len(markers) == 0:
+            warnings.warn(
+                f"restart files in {path} have no completion markers, loading "
+                "them as a restart written before markers were introduced"
+            )
+        elif COMPLETE_MARKER.format(rank=rank) not in markers:
+            raise RuntimeError(
+                f"restart files in {path} for rank {rank} are incomplete, "
+                "the run writing them likely stopped mid-write"
+            )
 
     if is_fortran_restart:
         dycore_state = fv3core.DycoreState.from_fortran_restart(
             quantity_factory=quantity_factory, communicator=communicator, path=path
         )
+    elif fs.exists(os.path.join(path, f"restart_dycore_state_{rank}.json")):
+        dycore_state = fv3core.DycoreState.init_zeros(quantity_factory=quantity_factory)
+        _overwrite_state_from_binary_restart(
+            path,
+            rank,
+            dycore_state,
+            "restart_dycore_state",
+        )
     else:
         dycore_state = fv3core.DycoreState.init_zeros(quantity_factory=quantity_factory)
         _overwrite_state_from_restart(
@@ -0,0 +1,69 @@
+import argparse
+import time
+
+from gt4py.cartesian.gtscript import PARALLEL, computation, interval
+
+import pace.util
+from pace.dsl.dace.dace_config import DaceConfig
+from pace.dsl.stencil import FrozenStencil
+from pace.dsl.stencil_config import CompilationConfig, StencilConfig
+from pace.dsl.typing import FloatField
+
+
+def copy_stencil(q_in: FloatField, q_out: FloatField):
+    with computation(PARALLEL), interval(...):
+        q_out = q_in
+
+
+def time_per_call(function, n_calls):
+    function()
+    start = time.perf_counter()
+    for _ in range(n_calls):
+        function()
+    return (time.perf_counter() - start) / n_calls
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="compare the time per call of a FrozenStencil called with "
+        "quantities and of the same stencil bound to them, on a small subtile "
+        "where dispatch overhead is significant"
+    )
+    parser.add_argument("--backend", type=str, default="numpy")
+    parser.add_argument("--n-points", type=int, default=12)
+    parser.add_argument("--nz", type=int, default=79)
+    parser.add_argument("--n-calls", type=int, default=1000)
+    parser.add_argument("--validate-args", action="store_true")
+    args = parser.parse_args()
+
+    config = StencilConfig(
+        compilation_config=CompilationConfig(
+            backend=args.backend, rebuild=False, validate_args=args.validate_args
+        ),
+        dace_config=DaceConfig(communicator=None, backend=args.backend),
+    )
+    sizer = pace.util.SubtileGridSizer(
+        nx=args.n_points,
+        ny=args.n_points,
+        nz=args.nz,
+        n_halo=3,
+        extra_dim_lengths={},
+    )
+    quantity_factory = pace.util.QuantityFactory.from_backend(
+        sizer, backend=args.backend
+    )
+    dims = [pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_DIM]
+    q_in = quantity_factory.ones(dims, units="m")
+    q_out = quantity_factory.zeros(dims, units="m")
+    stencil = FrozenStencil(
+        copy_stencil,
+        origin=q_in.origin,
+        domain=q_in.extent,
+        stencil_config=config,
+    )
+
+    call_time = time_per_call(lambda: stencil(q_in, q_out), args.n_calls)
+    bound_time = time_per_call(stencil.bind(q_in, q_out), args.n_calls)
+    print(f"call:  {call_time * 1e6:.1f} us per call")
+    print(f"bound: {bound_time * 1e6:.1f} us per call")
+    print(f"overhead removed: {(call_time - bound_time) * 1e6:.1f} us per call")
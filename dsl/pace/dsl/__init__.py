@@ -7,6 +7,7 @@ from .dace.dace_config import DaceConfig, DaCeOrchestration
 from .dace.orchestration import orchestrate, orchestrate_function
 from .stencil import (
     CompilationConfig,
+    CompilePlan,
     FrozenStencil,
     GridIndexing,
     StencilConfig,
@@ -4,6 +4,7 @@ from dace.sdfg import SDFG
 
 import pace.util
 from pace.dsl.dace.dace_config import DaceConfig, DaCeOrchestration
+from pace.util.decomposition import determine_boundary_class
 
 
 ################################################
@@ -33,43 +34,18 @@ def unblock_waiting_tiles(comm, sdfg_path: str) -> None:
 def get_target_rank(rank: int, partitioner: pace.util.CubedSpherePartitioner):
     """From my rank & the current partitioner we determine which
     rank we should read from.
-    For all layout >= 3,3 this presumes build has been done on a
-    3,3 layout."""
-    if partitioner.layout == (1, 1):
-        return 0
-    if partitioner.layout == (2, 2):
-        if partitioner.tile.on_tile_bottom(rank):
-            if partitioner.tile.on_tile_left(rank):
-                return 0  # "00"
-            if partitioner.tile.on_tile_right(rank):
-                return 1  # "10"
-        if partitioner.tile.on_tile_top(rank):
-            if partitioner.tile.on_tile_left(rank):
-                return 2  # "01"
-            if partitioner.tile.on_tile_right(rank):
-                return 3  # "11"
-    else:
-        if partitioner.tile.on_tile_bottom(rank):
-            if partitioner.tile.on_tile_left(rank):
-                return 0  # "00"
-            if partitioner.tile.on_tile_right(rank):
-                return 2  # "20"
-            else:
-                return 1  # "10"
-        if partitioner.tile.on_tile_top(rank):
-            if partitioner.tile.on_tile_left(rank):
-                return 6  # "02"
-            if partitioner.tile.on_tile_right(rank):
-                return 8  # "22"
-            else:
-                return 7  # "12"
-        else:
-            if partitioner.tile.on_tile_left(rank):
-                return 3  # "01"
-            if partitioner.tile.on_tile_right(rank):
-                return 5  # "21"
-            else:
-                return 4  # "11"
+    Ranks are mapped onto their boundary class, which matches the ranks
+    of a build done on the layout capped at 3,3."""
+    return determine_boundary_class(rank, partitioner)
+
+
+def _can_read_layout(layout: Tuple[int, int], build_layout: Tuple[int, int]) -> bool:
+    """A build can be read if it was done on the layout capped at 3,3.
+
+    Caches of a build are named by rank, which only matches the boundary class
+    read at run time if the build layout has at most 3 subtiles along each axis.
+    """
+    return tuple(build_layout) == tuple(min(n_subtiles, 3) for n_subtiles in layout)
 
 
 def build_info_filepath() -> str:
@@ -154,24 +130,17 @@ def get_sdfg_path(
             )
         # Check layout
         build_layout = ast.literal_eval(build_info_file.readline())
-        can_read = True
-        if config.layout == (1, 1) and config.layout != build_layout:
-            can_read = False
-        elif config.layout == (2, 2) and config.layout != build_layout:
-            can_read = False
-        elif (
-            build_layout != (1, 1) and build_layout != (2, 2) and build_layout != (3, 3)
-        ):
-            can_read = False
-        if not can_read:
+        if not _can_read_layout(config.layout, build_layout):
             raise RuntimeError(
                 f"SDFG build for layout {build_layout}, "
                 f"cannot be run with current layout {config.layout}"
             )
         # Check resolution per tile
         build_resolution = ast.literal_eval(build_info_file.readline())
-        if (config.tile_resolution[0] / config.layout[0]) != (
-            build_resolution[0] / build_layout[0]
+        if (config.tile_resolution[0] / config.layout[1]) != (
+            build_resolution[0] / build_layout[1]
+        ) or (config.tile_resolution[1] / config.layout[0]) != (
+            build_resolution[1] / build_layout[0]
         ):
             raise RuntimeError(
                 f"SDFG build for resolution {build_resolution}, "
@@ -1,9 +1,10 @@
 import dataclasses
-from typing import List, Optional
+from typing import List, Optional, Sequence, Tuple
 
 from pace.dsl.dace.orchestration import dace_inhibitor
 from pace.util.communicator import CubedSphereCommunicator
 from pace.util.halo_updater import HaloUpdater
+from pace.util.quantity import Quantity
 
 
 class WrappedHaloUpdater:
@@ -29,30 +30,25 @@ class WrappedHaloUpdater:
         self._qtx_y_names = qty_y_names
         self._comm = comm
 
+    def _get_quantities(self, names: List[str]) -> List[Quantity]:
+        if dataclasses.is_dataclass(self._state):
+            return [self._state.__getattribute__(name) for name in names]
+        elif isinstance(self._state, dict):
+            return [self._state[name] for name in names]
+        else:
+            raise NotImplementedError
+
+    def get_quantities(self) -> Tuple[List[Quantity], Optional[List[Quantity]]]:
+        """Quantities exchanged by the updater, and their y-component for
+        vector updaters."""
+        quantities_x = self._get_quantities(self._qtx_x_names)
+        if self._qtx_y_names is None:
+            return quantities_x, None
+        return quantities_x, self._get_quantities(self._qtx_y_names)
+
     @dace_inhibitor
     def start(self):
-        if self._qtx_y_names is None:
-            if dataclasses.is_dataclass(self._state):
-                self._updater.start(
-                    [self._state.__getattribute__(x) for x in self._qtx_x_names]
-                )
-            elif isinstance(self._state, dict):
-                self._updater.start([self._state[x] for x in self._qtx_x_names])
-            else:
-                raise NotImplementedError
-        else:
-            if dataclasses.is_dataclass(self._state):
-                self._updater.start(
-                    [self._state.__getattribute__(x) for x in self._qtx_x_names],
-                    [self._state.__getattribute__(y) for y in self._qtx_y_names],
-                )
-            elif isinstance(self._state, dict):
-                self._updater.start(
-                    [self._state[x] for x in self._qtx_x_names],
-                    [self._state[y] for y in self._qtx_y_names],
-                )
-            else:
-                raise NotImplementedError
+        self._updater.start(*self.get_quantities())
 
     @dace_inhibitor
     def wait(self):
@@ -71,3 +67,39 @@ class WrappedHaloUpdater:
             self._state.__getattribute__(self._qtx_x_names[0]),
             self._state.__getattribute__(self._qtx_y_names[0]),
         )
+
+
+class WrappedHaloUpdaterBatch:
+    """Wrapping a HaloUpdaterBatch of several wrapped updaters, exchanging
+    their halos with one message per neighbor rank.
+
+    The quantities are looked up on the state of each wrapped updater,
+    as WrappedHaloUpdater does.
+    """
+
+    def __init__(
+        self,
+        updaters: Sequence[WrappedHaloUpdater],
+        comm: CubedSphereCommunicator,
+    ) -> None:
+        self._wrapped_updaters = tuple(updaters)
+        self._batch = comm.get_halo_updater_batch(
+            [updater._updater for updater in self._wrapped_updaters]
+        )
+
+    @dace_inhibitor
+    def start(self):
+        quantities = [updater.get_quantities() for updater in self._wrapped_updaters]
+        self._batch.start(
+            [quantities_x for quantities_x, _ in quantities],
+            [quantities_y for _, quantities_y in quantities],
+        )
+
+    @dace_inhibitor
+    def wait(self):
+        self._batch.wait()
+
+    @dace_inhibitor
+    def update(self):
+        self.start()
+        self.wait()
@@ -1,10 +1,16 @@
+import concurrent.futures
+import contextlib
 import copy
 import dataclasses
+import functools
 import inspect
+import logging
+import multiprocessing
 from typing import (
     Any,
     Callable,
     Dict,
+    Hashable,
     Iterable,
     List,
     Mapping,
@@ -27,7 +33,7 @@ from pace.dsl.dace.orchestration import SDFGConvertible
 from pace.dsl.stencil_config import CompilationConfig, RunMode, StencilConfig
 from pace.dsl.typing import Index3D, cast_to_index3d
 from pace.util import testing
-from pace.util.decomposition import block_waiting_for_compilation, unblock_waiting_tiles
+from pace.util.decomposition import block_waiting_for_compilation, unblock_waiting_ranks
 from pace.util.mpi import MPI
 
 
@@ -37,6 +43,9 @@ except ImportError:
     cp = np
 
 
+logger = logging.getLogger(__name__)
+
+
 def report_difference(args, kwargs, args_copy, kwargs_copy, function_name, gt_id):
     report_head = f"comparing against numpy for func {function_name}, gt_id {gt_id}:"
     report_segments = []
@@ -179,6 +188,7 @@ class CompareToNumpyStencil:
         skip_passes: Optional[Tuple[str, ...]] = None,
         timing_collector: Optional[TimingCollector] = None,
         comm: Optional[pace.util.Comm] = None,
+        compile_plan: Optional["CompilePlan"] = None,
     ):
         self._actual = FrozenStencil(
             func=func,
@@ -189,6 +199,7 @@ class CompareToNumpyStencil:
             skip_passes=skip_passes,
             timing_collector=timing_collector,
             comm=comm,
+            compile_plan=compile_plan,
         )
         compilation_config = CompilationConfig(
             backend="numpy",
@@ -212,6 +223,7 @@ class CompareToNumpyStencil:
             skip_passes=skip_passes,
             timing_collector=timing_collector,
             comm=comm,
+            compile_plan=compile_plan,
         )
         self._func_name = func.__name__
 
@@ -233,6 +245,10 @@ class CompareToNumpyStencil:
             self._actual.stencil_object._gt_id_,
         )
 
+    def bind(self, *args, **kwargs) -> Callable[[], None]:
+        """Return a callable running the stencil on the given arguments."""
+        return functools.partial(self, *args, **kwargs)
+
 
 def _stencil_object_name(stencil_object) -> str:
     """Returns a unique name for each gt4py stencil object, including the hash."""
@@ -285,6 +301,7 @@ class FrozenStencil(SDFGConvertible):
         skip_passes: Tuple[str, ...] = (),
         timing_collector: Optional[TimingCollector] = None,
         comm: Optional[pace.util.Comm] = None,
+        compile_plan: Optional["CompilePlan"] = None,
     ):
         """
         Args:
@@ -297,6 +314,8 @@ class FrozenStencil(SDFGConvertible):
             timing_collector: Optional object that accumulates timings
             comm: if given, inputs and outputs will be compared to the "twin"
                 rank of this rank
+            compile_plan: if given and open, the stencil is registered to it
+                instead of being compiled, and is compiled when the plan is
         """
         if isinstance(origin, tuple):
             origin = cast_to_index3d(origin)
@@ -319,6 +338,7 @@ class FrozenStencil(SDFGConvertible):
             skip_passes=skip_passes, func=func
         )
         self.stencil_object = None
+        self._compile_plan: Optional[CompilePlan] = None
 
         self._argument_names = tuple(inspect.getfullargspec(func).args)
 
@@ -345,29 +365,65 @@ class FrozenStencil(SDFGConvertible):
                 **stencil_kwargs,
                 build_info=(build_info := {}),  # type: ignore
             )
-        else:
-            compilation_config = stencil_config.compilation_config
-            if (
-                compilation_config.use_minimal_caching
-                and not compilation_config.is_compiling
-                and compilation_config.run_mode != RunMode.Run
-            ):
-                block_waiting_for_compilation(MPI.COMM_WORLD, compilation_config)
-
-            self.stencil_object = gtscript.stencil(
-                definition=func,
+            self._set_stencil_object(self.stencil_object, build_info)
+        elif compile_plan is not None and compile_plan.is_open:
+            self._compile_plan = compile_plan
+            compile_plan.register(
+                self,
+                func=func,
                 externals=externals,
-                **stencil_kwargs,
-                build_info=(build_info := {}),
+                stencil_kwargs=stencil_kwargs,
+                skip_passes=skip_passes,
             )
+        else:
+            self._build(func, externals, stencil_kwargs)
 
-            if (
-                compilation_config.use_minimal_caching
-                and compilation_config.is_compiling
-                and compilation_config.run_mode != RunMode.Run
-            ):
-                unblock_waiting_tiles(MPI.COMM_WORLD)
+    def _build(
+        self,
+        func: Callable[..., None],
+        externals: Mapping[str, Any],
+        stencil_kwargs: Mapping[str, Any],
+        build_info: Optional[Dict[str, Any]] = None,
+    ):
+        """Compile or load the gt4py stencil object.
+
+        Args:
+            func: stencil definition function
+            externals: compile-time external variables required by stencil
+            stencil_kwargs: keyword arguments given to gtscript.stencil
+            build_info: if given, replaces the build info reported by gt4py,
+                e.g. when the stencil was compiled elsewhere and is only loaded
+        """
+        compilation_config = self.stencil_config.compilation_config
+        if (
+            compilation_config.use_minimal_caching
+            and not compilation_config.is_compiling
+            and compilation_config.run_mode != RunMode.Run
+        ):
+            block_waiting_for_compilation(MPI.COMM_WORLD, compilation_config)
+
+        stencil_object = gtscript.stencil(
+            definition=func,
+            externals=externals,
+            **stencil_kwargs,
+            build_info=(loaded_build_info := {}),
+        )
+
+        if (
+            compilation_config.use_minimal_caching
+            and compilation_config.is_compiling
+            and compilation_config.run_mode != RunMode.Run
+        ):
+            unblock_waiting_ranks(MPI.COMM_WORLD, compilation_config.waiting_ranks)
+
+        self._set_stencil_object(
+            stencil_object, build_info if build_info is not None else loaded_build_info
+        )
 
+    def _set_stencil_object(self, stencil_object, build_info: Dict[str, Any]):
+        """Set the gt4py stencil object and the call arguments derived from it."""
+        self.stencil_object = stencil_object
+        self._compile_plan = None
         self._timing_collector.build_info[
             _stencil_object_name(self.stencil_object)
         ] = build_info
@@ -385,7 +441,7 @@ class FrozenStencil(SDFGConvertible):
 
         self._written_fields: List[str] = FrozenStencil._get_written_fields(field_info)
 
-        if stencil_config.compilation_config.run_mode == RunMode.Build:
+        if self.stencil_config.compilation_config.run_mode == RunMode.Build:
 
             def nothing_function(*args, **kwargs):
                 pass
@@ -393,6 +449,9 @@ class FrozenStencil(SDFGConvertible):
             setattr(self, "__call__", nothing_function)
 
     def __call__(self, *args, **kwargs) -> None:
+        if self._compile_plan is not None:
+            # called before the plan it is registered to was compiled
+            self._compile_plan.build_stencil(self)
         args_list = list(args)
         _convert_quantities_to_storage(args_list, kwargs)
         args = tuple(args_list)
@@ -433,6 +492,55 @@ class FrozenStencil(SDFGConvertible):
                     f"after calling {self._func_name}"
                 )
 
+    def bind(self, *args, **kwargs) -> Callable[[], None]:
+        """
+        Resolve the arguments of a stencil call once, for repeated calls.
+
+        Quantities are replaced by their data and arguments are arranged as
+        the stencil object expects them, so calling the returned function skips
+        the argument handling done on each call of the stencil. The arrays
+        bound are those of the quantities at the time of binding.
+
+        Args:
+            args: positional arguments, as given when calling the stencil
+            kwargs: keyword arguments, as given when calling the stencil
+
+        Returns:
+            bound_stencil: function without arguments running the stencil
+        """
+        if self._compile_plan is not None:
+            self._compile_plan.build_stencil(self)
+        if (
+            self.comm is not None
+            or self.stencil_config.dace_config.is_dace_orchestrated()
+            or self.stencil_config.compilation_config.run_mode == RunMode.Build
+        ):
+            return functools.partial(self, *args, **kwargs)
+        args_list = list(args)
+        _convert_quantities_to_storage(args_list, kwargs)
+        if self.stencil_config.compilation_config.validate_args:
+            if __debug__ and "origin" in kwargs:
+                raise TypeError("origin cannot be passed to FrozenStencil call")
+            if __debug__ and "domain" in kwargs:
+                raise TypeError("domain cannot be passed to FrozenStencil call")
+            return functools.partial(
+                self.stencil_object,
+                *args_list,
+                **kwargs,
+                origin=self._field_origins,
+                domain=self.domain,
+                validate_args=True,
+                exec_info=self._timing_collector.exec_info,
+            )
+        else:
+            return functools.partial(
+                self.stencil_object.run,
+                **dict(zip(self._argument_names, args_list)),
+                **kwargs,
+                **self._stencil_run_kwargs,
+                exec_info=self._timing_collector.exec_info,
+            )
+
     @classmethod
     def _compute_field_origins(
         cls, field_info_mapping, origin: Union[Index3D, Mapping[str, Tuple[int, ...]]]
@@ -518,6 +626,228 @@ class FrozenStencil(SDFGConvertible):
         )
 
 
+def _canonical_value(value: Any) -> Hashable:
+    """Hashable representation of a value, equal for equal nested containers."""
+    if isinstance(value, Mapping):
+        return tuple(
+            sorted(
+                ((key, _canonical_value(item)) for key, item in value.items()),
+                key=lambda key_item: str(key_item[0]),
+            )
+        )
+    elif isinstance(value, (list, tuple)):
+        return tuple(_canonical_value(item) for item in value)
+    elif isinstance(value, np.ndarray):
+        return (value.dtype.str, value.shape, value.tobytes())
+    elif isinstance(value, np.generic):
+        return (value.dtype.str, value.item())
+    elif isinstance(value, (bool, int, float, str, type(None))):
+        # True, 1 and 1.0 compare equal but may generate different stencils
+        return (type(value).__name__, value)
+    else:
+        # e.g. gtscript axis offsets, which are not hashable but have
+        # a repr identifying their value
+        return (type(value).__qualname__, repr(value))
+
+
+def _initialize_compile_worker(cache_settings: Dict[str, Any], dace_build_folder):
+    """Use the same gt4py and dace caches as the process owning the plan."""
+    gt4py.cartesian.config.cache_settings.update(cache_settings)
+    dace.Config.set("default_build_folder", value=dace_build_folder)
+
+
+def _compile_stencil(
+    func: Callable[..., None],
+    externals: Mapping[str, Any],
+    stencil_kwargs: Mapping[str, Any],
+) -> Dict[str, Any]:
+    """Compile a stencil into the gt4py cache and return its build info."""
+    gtscript.stencil(
+        definition=func,
+        externals=externals,
+        **stencil_kwargs,
+        build_info=(build_info := {}),
+    )
+    return {
+        name: value
+        for name, value in build_info.items()
+        if isinstance(value, (int, float, str))
+    }
+
+
+@dataclasses.dataclass
+class _PlannedStencil:
+    func: Callable[..., None]
+    externals: Mapping[str, Any]
+    stencil_kwargs: Mapping[str, Any]
+    compilation_config: CompilationConfig
+    build_info: Optional[Dict[str, Any]] = None
+    """build info of the worker which compiled the stencil, if any"""
+
+
+class CompilePlan:
+    """
+    Collects stencils to compile them concurrently instead of on construction.
+
+    FrozenStencil objects constructed with an open plan only register their
+    definition, externals and compilation options. `compile` then builds each
+    unique stencil in a pool of processes, which write them to the gt4py cache,
+    and loads the built stencils into the registered FrozenStencil objects.
+
+    A registered stencil called before the plan is compiled is built on the spot.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, mp_context="spawn"):
+        """
+        Args:
+            max_workers: number of processes compiling stencils, by default
+                the number of processors
+            mp_context: multiprocessing start method of the workers, "spawn" by
+                default as forking a process which initialized MPI is not
+                supported by common MPI implementations and can hang
+        """
+        self.max_workers = max_workers
+        self._mp_context = mp_context
+        self._is_open = True
+        self._planned: Dict[Hashable, _PlannedStencil] = {}
+        self._stencils: List[Tuple[FrozenStencil, Hashable]] = []
+
+    @property
+    def is_open(self) -> bool:
+        """whether stencils constructed with this plan are registered to it"""
+        return self._is_open
+
+    @property
+    def n_unique(self) -> int:
+        """number of unique stencils registered"""
+        return len(self._planned)
+
+    def register(
+        self,
+        stencil: FrozenStencil,
+        func: Callable[..., None],
+        externals: Mapping[str, Any],
+        stencil_kwargs: Mapping[str, Any],
+        skip_passes: Sequence[str] = (),
+    ):
+        """Register a stencil to be built when the plan is compiled.
+
+        Args:
+            stencil: stencil to load the built stencil object into
+            func: stencil definition function
+            externals: compile-time external variables required by stencil
+            stencil_kwargs: keyword arguments given to gtscript.stencil
+            skip_passes: compiler passes to skip when building stencil
+        """
+        if not self._is_open:
+            raise RuntimeError("cannot register a stencil to a closed compile plan")
+        # the oir pipeline is determined by skip_passes, and does not compare equal
+        key = (
+            func,
+            _canonical_value(externals),
+            _canonical_value(
+                {
+                    name: value
+                    for name, value in stencil_kwargs.items()
+                    if name != "oir_pipeline"
+                }
+            ),
+            tuple(skip_passes),
+        )
+        if key not in self._planned:
+            self._planned[key] = _PlannedStencil(
+                func=func,
+                externals=externals,
+                stencil_kwargs=stencil_kwargs,
+                compilation_config=stencil.stencil_config.compilation_config,
+            )
+        self._stencils.append((stencil, key))
+
+    def build_stencil(self, stencil: FrozenStencil):
+        """Build a registered stencil now, without waiting for the plan."""
+        for registered, key in self._stencils:
+            if registered is stencil:
+                self._build(stencil, self._planned[key])
+                return
+        raise ValueError("stencil is not registered to this compile plan")
+
+    def close(self):
+        """Stop registering stencils, those registered are built on their first call."""
+        self._is_open = False
+
+    def compile(self):
+        """Compile all unique stencils registered and load them into their stencils."""
+        if not self._is_open:
+            raise RuntimeError("compile plan was already compiled or closed")
+        self.close()
+        to_compile = {}
+        for stencil, key in self._stencils:
+            planned = self._planned[key]
+            if stencil.stencil_object is None and self._is_compiling(
+                planned.compilation_config
+            ):
+                to_compile[key] = planned
+        if len(to_compile) > 1 and self.max_workers != 1:
+            self._compile_in_pool(to_compile)
+        for stencil, key in self._stencils:
+            if stencil.stencil_object is None:
+                self._build(stencil, self._planned[key])
+        self._stencils.clear()
+
+    @staticmethod
+    def _is_compiling(compilation_config: CompilationConfig) -> bool:
+        """Whether this rank compiles stencils rather than loading them."""
+        if compilation_config.run_mode == RunMode.Run:
+            return False
+        return compilation_config.is_compiling or not (
+            compilation_config.use_minimal_caching
+        )
+
+    def _compile_in_pool(self, to_compile: Mapping[Hashable, _PlannedStencil]):
+        logger.info(
+            f"compiling {len(to_compile)} stencils with {self.max_workers} workers"
+        )
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context(self._mp_context),
+            initializer=_initialize_compile_worker,
+            initargs=(
+                dict(gt4py.cartesian.config.cache_settings),
+                dace.Config.get("default_build_folder"),
+            ),
+        ) as executor:
+            futures = {
+                key: executor.submit(
+                    _compile_stencil,
+                    planned.func,
+                    planned.externals,
+                    planned.stencil_kwargs,
+                )
+                for key, planned in to_compile.items()
+            }
+            for key, future in futures.items():
+                try:
+                    to_compile[key].build_info = future.result()
+                except Exception as err:
+                    # e.g. definitions which cannot be pickled
+                    logger.warning(
+                        f"could not compile {to_compile[key].func.__name__} "
+                        f"in a worker process, compiling it on load: {err}"
+                    )
+
+    def _build(self, stencil: FrozenStencil, planned: _PlannedStencil):
+        if planned.build_info is not None:
+            # only load the stencil a worker wrote to the cache
+            stencil._build(
+                planned.func,
+                planned.externals,
+                {**planned.stencil_kwargs, "rebuild": False},
+                build_info=planned.build_info,
+            )
+        else:
+            stencil._build(planned.func, planned.externals, planned.stencil_kwargs)
+
+
 def _convert_quantities_to_storage(args, kwargs):
     for i, arg in enumerate(args):
         try:
@@ -855,6 +1185,28 @@ class GridIndexing:
         return new
 
 
+@dataclasses.dataclass
+class _StencilMemo:
+    """Stencils created by a factory and the factories derived from it."""
+
+    stencils: Dict[Hashable, Union[FrozenStencil, CompareToNumpyStencil]] = (
+        dataclasses.field(default_factory=dict)
+    )
+    hits: Dict[str, int] = dataclasses.field(default_factory=dict)
+    """number of times an existing stencil was returned, per function name"""
+
+    def report(self, name_width: int = 40, delimiter: str = " | ") -> str:
+        outputs = [
+            f"Stencils reused: {sum(self.hits.values())} "
+            f"(of {len(self.stencils)} unique stencils)"
+        ]
+        for name, hits in sorted(
+            self.hits.items(), key=lambda name_hits: name_hits[1], reverse=True
+        ):
+            outputs.append(f"{name.rjust(name_width)}{delimiter}{hits}")
+        return "\n".join(outputs)
+
+
 class StencilFactory:
     """Configurable class which creates stencil objects."""
 
@@ -863,6 +1215,7 @@ class StencilFactory:
         config: StencilConfig,
         grid_indexing: GridIndexing,
         comm: Optional[pace.util.Comm] = None,
+        compile_plan: Optional[CompilePlan] = None,
     ):
         """
         Args:
@@ -871,11 +1224,15 @@ class StencilFactory:
             comm: if given, stencils will compare all data before and after
                 stencil execution to their "pair" rank on the comm. This is very
                 expensive and only used for debugging.
+            compile_plan: if given and open, stencils created are registered to
+                it instead of being compiled on construction
         """
         self.config: StencilConfig = config
         self.grid_indexing: GridIndexing = grid_indexing
         self.timing_collector = TimingCollector()
         self.comm = comm
+        self.compile_plan = compile_plan
+        self._memo = _StencilMemo()
 
     @property
     def backend(self):
@@ -897,12 +1254,26 @@ class StencilFactory:
             stencil_config: container for stencil configuration
             externals: compile-time external variables required by stencil
             skip_passes: compiler passes to skip when building stencil
+
+        Returns:
+            stencil: if the same stencil was already requested from this factory,
+                or a factory derived from it, the stencil created then
         """
+        key = (
+            func,
+            _canonical_value(origin),
+            _canonical_value(domain),
+            _canonical_value(externals if externals is not None else {}),
+            tuple(skip_passes),
+        )
+        if key in self._memo.stencils:
+            self._memo.hits[func.__name__] = self._memo.hits.get(func.__name__, 0) + 1
+            return self._memo.stencils[key]
         if self.config.compare_to_numpy:
             cls: Type = CompareToNumpyStencil
         else:
             cls = FrozenStencil
-        return cls(
+        stencil = cls(
             func=func,
             origin=origin,
             domain=domain,
@@ -911,7 +1282,10 @@ class StencilFactory:
             skip_passes=skip_passes,
             timing_collector=self.timing_collector,
             comm=self.comm,
+            compile_plan=self.compile_plan,
         )
+        self._memo.stencils[key] = stencil
+        return stencil
 
     def from_dims_halo(
         self,
@@ -955,15 +1329,57 @@ class StencilFactory:
         )
 
     def restrict_vertical(self, k_start=0, nk=None) -> "StencilFactory":
-        return StencilFactory(
+        factory = StencilFactory(
             config=self.config,
             grid_indexing=self.grid_indexing.restrict_vertical(k_start=k_start, nk=nk),
             comm=self.comm,
+            compile_plan=self.compile_plan,
         )
+        # stencils are identified by their absolute origin and domain,
+        # so they can be shared with the restricted factory
+        factory._memo = self._memo
+        return factory
+
+    @contextlib.contextmanager
+    def planned_compilation(self, max_workers: Optional[int] = None):
+        """
+        Context in which stencils created by this factory, or factories derived
+        from it, are compiled together in a process pool when the context exits.
+
+        Stencils called within the context are compiled on their first call.
+
+        Args:
+            max_workers: number of processes compiling stencils, by default
+                the compile_workers of the compilation config, stencils are
+                compiled on construction as usual if 1. Workers are spawned
+                rather than forked, so this is safe after MPI initialization.
+
+        Yields:
+            compile_plan: the plan stencils are registered to, None if stencils
+                are compiled on construction or by an enclosing context
+        """
+        if max_workers is None:
+            max_workers = self.config.compilation_config.compile_workers
+        if max_workers == 1 or (
+            self.compile_plan is not None and self.compile_plan.is_open
+        ):
+            yield None
+            return
+        self.compile_plan = CompilePlan(max_workers=max_workers)
+        try:
+            yield self.compile_plan
+            self.compile_plan.compile()
+        finally:
+            if self.compile_plan.is_open:
+                self.compile_plan.close()
+            self.compile_plan = None
 
     def build_report(self, key: str = "build_time", **kwargs) -> str:
-        """Report all stencils built by this factory."""
-        return self.timing_collector.build_report(key, **kwargs)
+        """Report all stencils built by this factory, and how often they were
+        reused instead of built again."""
+        return "\n".join(
+            [self.timing_collector.build_report(key, **kwargs), self._memo.report()]
+        )
 
     def exec_report(self, key: str = "total_run_time", **kwargs) -> str:
         """Report all stencils executed that were built by this factory."""
@@ -8,7 +8,12 @@ from gt4py.cartesian.gtc.passes.oir_pipeline import DefaultPipeline, OirPipeline
 from pace.dsl.dace.dace_config import DaceConfig, DaCeOrchestration
 from pace.dsl.gt4py_utils import is_gpu_backend
 from pace.util.communicator import CubedSphereCommunicator
-from pace.util.decomposition import determine_rank_is_compiling, set_distributed_caches
+from pace.util.decomposition import (
+    determine_boundary_class,
+    determine_compiling_rank,
+    determine_waiting_ranks,
+    set_distributed_caches,
+)
 from pace.util.partitioner import CubedSpherePartitioner
 
 
@@ -36,9 +41,14 @@ class CompilationConfig:
         run_mode: RunMode = RunMode.BuildAndRun,
         use_minimal_caching: bool = False,
         communicator: Optional[CubedSphereCommunicator] = None,
+        compile_workers: int = 1,
     ) -> None:
         if (not ("gpu" in backend or "cuda" in backend)) and device_sync is True:
             raise RuntimeError("Device sync is true on a CPU based backend")
+        if compile_workers < 1:
+            raise ValueError(
+                f"compile_workers must be at least 1, got {compile_workers}"
+            )
         # GT4Py backend args
         self.backend = backend
         self.rebuild = rebuild
@@ -48,86 +58,56 @@ class CompilationConfig:
         # Caching strategy
         self.run_mode = run_mode
         self.use_minimal_caching = use_minimal_caching
+        # Number of processes compiling stencils in StencilFactory.planned_compilation,
+        # spawned rather than forked as forking after MPI initialization can hang
+        self.compile_workers = compile_workers
         (
             self.rank,
             self.size,
             self.compiling_equivalent,
             self.is_compiling,
         ) = self.get_decomposition_info_from_comm(communicator)
+        if communicator and use_minimal_caching:
+            # Ranks owning the same tile edges and corners share a cache
+            self.boundary_class = determine_boundary_class(
+                self.rank, communicator.partitioner
+            )
+            self.waiting_ranks = determine_waiting_ranks(
+                self.rank, communicator.partitioner
+            )
+        else:
+            self.boundary_class = self.compiling_equivalent
+            self.waiting_ranks = ()
         if communicator:
             set_distributed_caches(self)
 
-    def check_communicator(self, communicator: CubedSphereCommunicator) -> None:
-        """Checks that the communicator has a square layout
-
-        Args:
-            communicator (CubedSphereCommunicator): communicator to use
-
-        Raises:
-            RuntimeError: If non-square layout is given
-        """
-        if communicator.partitioner.layout[0] != communicator.partitioner.layout[1]:
-            raise RuntimeError(
-                "Trying to run with a non-square layout is not supported"
-            )
-
     def determine_compiling_equivalent(
         self, rank: int, partitioner: CubedSpherePartitioner
     ) -> int:
         """From my rank & the current partitioner we determine which
-        rank we should read from"""
+        rank we should read from.
+
+        In Run mode this is the boundary class of the rank, matching the ranks
+        of a build on a layout capped at 3x3. Otherwise it is the rank compiling
+        the stencils of the boundary class on the current layout."""
         if self.run_mode == RunMode.Run:
-            if partitioner.layout == (1, 1):
-                return 0
-            elif partitioner.layout == (2, 2):
-                if partitioner.tile.on_tile_bottom(rank):
-                    if partitioner.tile.on_tile_left(rank):
-                        return 0  # "00"
-                    if partitioner.tile.on_tile_right(rank):
-                        return 1  # "10"
-                if partitioner.tile.on_tile_top(rank):
-                    if partitioner.tile.on_tile_left(rank):
-                        return 2  # "01"
-                    if partitioner.tile.on_tile_right(rank):
-                        return 3  # "11"
-            else:
-                if partitioner.tile.on_tile_bottom(rank):
-                    if partitioner.tile.on_tile_left(rank):
-                        return 0  # "00"
-                    if partitioner.tile.on_tile_right(rank):
-                        return 2  # "20"
-                    else:
-                        return 1  # "10"
-                if partitioner.tile.on_tile_top(rank):
-                    if partitioner.tile.on_tile_left(rank):
-                        return 6  # "02"
-                    if partitioner.tile.on_tile_right(rank):
-                        return 8  # "22"
-                    else:
-                        return 7  # "12"
-                else:
-                    if partitioner.tile.on_tile_left(rank):
-                        return 3  # "01"
-                    if partitioner.tile.on_tile_right(rank):
-                        return 5  # "21"
-                    else:
-                        return 4  # "11"
+            return determine_boundary_class(rank, partitioner)
         else:
-            return rank % partitioner.tile.total_ranks
-        raise RuntimeError("Illegal partition specified")
+            return determine_compiling_rank(rank, partitioner)
 
     def get_decomposition_info_from_comm(
         self, communicator: Optional[CubedSphereCommunicator]
     ) -> Tuple[int, int, int, bool]:
         if communicator:
-            self.check_communicator(communicator)
             rank = communicator.rank
             size = communicator.partitioner.total_ranks
             if self.use_minimal_caching:
                 equivalent_compiling_rank = self.determine_compiling_equivalent(
                     rank, communicator.partitioner
                 )
-                is_compiling = determine_rank_is_compiling(rank, size)
+                is_compiling = (
+                    determine_compiling_rank(rank, communicator.partitioner) == rank
+                )
             else:
                 equivalent_compiling_rank = rank
                 is_compiling = True
@@ -147,6 +127,7 @@ class CompilationConfig:
             "device_sync": self.device_sync,
             "run_mode": str(self.run_mode.name),
             "use_minimal_caching": self.use_minimal_caching,
+            "compile_workers": self.compile_workers,
         }
 
     @classmethod
@@ -160,6 +141,7 @@ class CompilationConfig:
             run_mode=RunMode[data.get("run_mode", "BuildAndRun")],
             use_minimal_caching=data.get("use_minimal_caching", False),
             communicator=None,
+            compile_workers=data.get("compile_workers", 1),
         )
         return instance
 
@@ -271,6 +271,9 @@ class DynamicalCoreConfig:
     nf_omega: int = NamelistDefaults.nf_omega
     fv_sg_adj: int = NamelistDefaults.fv_sg_adj
     n_sponge: int = NamelistDefaults.n_sponge
+    # compute the number of tracer substeps from the maximum courant number
+    # instead of always taking 3 substeps
+    adaptive_tracer_substeps: bool = False
     namelist_override: Optional[str] = None
 
     def __post_init__(self):
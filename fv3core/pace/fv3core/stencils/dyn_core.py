@@ -24,7 +24,10 @@ import pace.util
 import pace.util as fv3util
 import pace.util.constants as constants
 from pace.dsl.dace.orchestration import dace_inhibitor, orchestrate
-from pace.dsl.dace.wrapped_halo_exchange import WrappedHaloUpdater
+from pace.dsl.dace.wrapped_halo_exchange import (
+    WrappedHaloUpdater,
+    WrappedHaloUpdaterBatch,
+)
 from pace.dsl.stencil import GridIndexing, StencilFactory
 from pace.dsl.typing import FloatField, FloatFieldIJ
 from pace.fv3core._config import AcousticDynamicsConfig
@@ -288,6 +291,11 @@ class AcousticDynamics:
                 ["u"],
                 ["v"],
             )
+            # started back-to-back before the acoustic loop, so exchanged
+            # together with one message per neighbor rank
+            self.q_con__cappa__delp__pt__u__v = WrappedHaloUpdaterBatch(
+                [self.q_con__cappa, self.delp__pt, self.u__v], comm
+            )
             self.w = WrappedHaloUpdater(
                 comm.get_scalar_halo_updater([full_size_xyz_halo_spec]),
                 state,
@@ -683,10 +691,7 @@ class AcousticDynamics:
         dt2 = 0.5 * dt_acoustic_substep
         n_split = self.config.n_split
         # NOTE: In Fortran model the halo update starts happens in fv_dynamics, not here
-        self._halo_updaters.q_con__cappa.start()
-        self._halo_updaters.delp__pt.start()
-        self._halo_updaters.u__v.start()
-        self._halo_updaters.q_con__cappa.wait()
+        self._halo_updaters.q_con__cappa__delp__pt__u__v.start()
 
         self._zero_data(
             state.mfxd,
@@ -726,7 +731,7 @@ class AcousticDynamics:
                     )
                     self._halo_updaters.gz.start()
             if it == 0:
-                self._halo_updaters.delp__pt.wait()
+                self._halo_updaters.q_con__cappa__delp__pt__u__v.wait()
 
             if it == n_split - 1 and end_step:
                 if self.config.use_old_omega:
@@ -736,7 +741,8 @@ class AcousticDynamics:
                         self._ptop,
                     )
 
-            self._halo_updaters.u__v.wait()
+            if it != 0:
+                self._halo_updaters.u__v.wait()
             if not self.config.hydrostatic:
                 self._halo_updaters.w.wait()
 
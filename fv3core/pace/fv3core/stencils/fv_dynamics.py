@@ -224,6 +224,7 @@ class DynamicalCore:
             self.grid_data,
             comm,
             self.tracers,
+            adaptive_substeps=config.adaptive_tracer_substeps,
         )
         self._ak = grid_data.ak
         self._bk = grid_data.bk
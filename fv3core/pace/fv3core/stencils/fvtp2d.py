@@ -119,6 +119,43 @@ def final_fluxes(
             )
 
 
+def final_fluxes_mass_weighted_update(
+    q: FloatField,
+    q_advected_y_x_advected_mean: FloatField,
+    q_x_advected_mean: FloatField,
+    q_advected_x_y_advected_mean: FloatField,
+    q_y_advected_mean: FloatField,
+    x_mass_flux: FloatField,
+    y_mass_flux: FloatField,
+    rarea: FloatFieldIJ,
+    mass_before: FloatField,
+    mass_after: FloatField,
+):
+    """
+    Compute final x and y fluxes of a mass-weighted scalar q as in final_fluxes
+    and update q by their convergence, without storing the fluxes.
+
+    Args:
+        q (inout): scalar per unit mass, updated in-place
+        q_advected_y_x_advected_mean (in):
+        q_x_advected_mean (in):
+        q_advected_x_y_advected_mean (in):
+        q_y_advected_mean (in):
+        x_mass_flux (in): mass flux in x-direction
+        y_mass_flux (in): mass flux in y-direction
+        rarea (in): 1 / area
+        mass_before (in): mass (pressure thickness) before transport
+        mass_after (in): mass (pressure thickness) after transport
+    """
+    with computation(PARALLEL), interval(...):
+        x_flux = 0.5 * (q_advected_y_x_advected_mean + q_x_advected_mean) * x_mass_flux
+        y_flux = 0.5 * (q_advected_x_y_advected_mean + q_y_advected_mean) * y_mass_flux
+        q = (
+            q * mass_before
+            + (x_flux - x_flux[1, 0, 0] + y_flux - y_flux[0, 1, 0]) * rarea
+        ) / mass_after
+
+
 class FiniteVolumeTransport:
     """
     Equivalent of Fortran FV3 subroutine fv_tp_2d, done in 3 dimensions.
@@ -145,6 +182,7 @@ class FiniteVolumeTransport:
         # use a shorter alias for grid_indexing here to avoid very verbose lines
         idx = stencil_factory.grid_indexing
         self._area = grid_data.area
+        self._rarea = grid_data.rarea
         origin = idx.origin_compute()
 
         def make_quantity():
@@ -231,6 +269,100 @@ class FiniteVolumeTransport:
             origin=idx.origin_compute(),
             domain=idx.domain_compute(add=(1, 1, 1)),
         )
+        self._final_fluxes_mass_weighted_update = stencil_factory.from_origin_domain(
+            final_fluxes_mass_weighted_update,
+            origin=idx.origin_compute(),
+            domain=idx.domain_compute(),
+        )
+
+    @property
+    def damps_fluxes(self) -> bool:
+        """True if fluxes are damped, in which case transport_mass_weighted
+        cannot be used."""
+        return self._do_delnflux
+
+    def _compute_advected_means(self, q, crx, cry, x_area_flux, y_area_flux):
+        # TODO: consider whether to refactor xppm/yppm to output fluxes by also taking
+        # y_area_flux as an input (flux = area_flux * advected_mean), since a flux is
+        # easier to understand than the current output. This would be like merging
+        # yppm with q_i_stencil and xppm with q_j_stencil.
+        self._copy_corners_y(q)
+        self.y_piecewise_parabolic_inner(q, cry, self._q_y_advected_mean)
+        # q_y_advected_mean is 1/Delta_area * curly-F, where curly-F is defined in
+        # equation 4.3 of the FV3 documentation and Delta_area is the advected area
+        # (y_area_flux)
+        self.q_i_stencil(
+            q,
+            self._area,
+            y_area_flux,
+            self._q_y_advected_mean,
+            self._q_advected_y,
+        )  # q_advected_y out is f(q) in eq 4.18 of FV3 documentation
+        self.x_piecewise_parabolic_outer(
+            self._q_advected_y, crx, self._q_advected_y_x_advected_mean
+        )
+        # q_advected_y_x_advected_mean is now rho^n + F(rho^y) in PL07 eq 16
+
+        self._copy_corners_x(q)
+        # similarly below for x<->y
+        self.x_piecewise_parabolic_inner(q, crx, self._q_x_advected_mean)
+        self.q_j_stencil(
+            q,
+            self._area,
+            x_area_flux,
+            self._q_x_advected_mean,
+            self._q_advected_x,
+        )
+        self.y_piecewise_parabolic_outer(
+            self._q_advected_x, cry, self._q_advected_x_y_advected_mean
+        )
+
+    def transport_mass_weighted(
+        self,
+        q,
+        crx,
+        cry,
+        x_area_flux,
+        y_area_flux,
+        x_mass_flux,
+        y_mass_flux,
+        mass_before,
+        mass_after,
+    ):
+        """
+        Transport a scalar per unit mass, such as a tracer, updating it in-place.
+
+        Equivalent to calling this object to compute the fluxes of q followed by
+        q = (q * mass_before + convergence of fluxes / area) / mass_after, but
+        the flux computation is fused with the update so the fluxes are never
+        written to memory. This transports a single scalar, the shared courant
+        numbers and fluxes are read again on every call. Must not be used if
+        damps_fluxes is True.
+
+        Args:
+            q (inout): scalar per unit mass to be transported
+            crx (in): Courant number in x-direction
+            cry (in): Courant number in y-direction
+            x_area_flux (in): flux of area in x-direction, in units of m^2
+            y_area_flux (in): flux of area in y-direction, in units of m^2
+            x_mass_flux (in): mass flux in x-direction
+            y_mass_flux (in): mass flux in y-direction
+            mass_before (in): mass (pressure thickness) before transport
+            mass_after (in): mass (pressure thickness) after transport
+        """
+        self._compute_advected_means(q, crx, cry, x_area_flux, y_area_flux)
+        self._final_fluxes_mass_weighted_update(
+            q,
+            self._q_advected_y_x_advected_mean,
+            self._q_x_advected_mean,
+            self._q_advected_x_y_advected_mean,
+            self._q_y_advected_mean,
+            x_mass_flux,
+            y_mass_flux,
+            self._rarea,
+            mass_before,
+            mass_after,
+        )
 
     def __call__(
         self,
@@ -297,40 +429,7 @@ class FiniteVolumeTransport:
         else:
             y_unit_flux = y_mass_flux
 
-        # TODO: consider whether to refactor xppm/yppm to output fluxes by also taking
-        # y_area_flux as an input (flux = area_flux * advected_mean), since a flux is
-        # easier to understand than the current output. This would be like merging
-        # yppm with q_i_stencil and xppm with q_j_stencil.
-        self._copy_corners_y(q)
-        self.y_piecewise_parabolic_inner(q, cry, self._q_y_advected_mean)
-        # q_y_advected_mean is 1/Delta_area * curly-F, where curly-F is defined in
-        # equation 4.3 of the FV3 documentation and Delta_area is the advected area
-        # (y_area_flux)
-        self.q_i_stencil(
-            q,
-            self._area,
-            y_area_flux,
-            self._q_y_advected_mean,
-            self._q_advected_y,
-        )  # q_advected_y out is f(q) in eq 4.18 of FV3 documentation
-        self.x_piecewise_parabolic_outer(
-            self._q_advected_y, crx, self._q_advected_y_x_advected_mean
-        )
-        # q_advected_y_x_advected_mean is now rho^n + F(rho^y) in PL07 eq 16
-
-        self._copy_corners_x(q)
-        # similarly below for x<->y
-        self.x_piecewise_parabolic_inner(q, crx, self._q_x_advected_mean)
-        self.q_j_stencil(
-            q,
-            self._area,
-            x_area_flux,
-            self._q_x_advected_mean,
-            self._q_advected_x,
-        )
-        self.y_piecewise_parabolic_outer(
-            self._q_advected_x, cry, self._q_advected_x_y_advected_mean
-        )
+        self._compute_advected_means(q, crx, cry, x_area_flux, y_area_flux)
 
         self.stencil_transport_flux(
             self._q_advected_y_x_advected_mean,
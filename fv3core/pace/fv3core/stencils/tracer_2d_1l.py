@@ -6,7 +6,7 @@ from gt4py.cartesian.gtscript import PARALLEL, computation, horizontal, interval
 
 import pace.dsl.gt4py_utils as utils
 import pace.util
-from pace.dsl.dace.orchestration import orchestrate
+from pace.dsl.dace.orchestration import dace_inhibitor, orchestrate
 from pace.dsl.dace.wrapped_halo_exchange import WrappedHaloUpdater
 from pace.dsl.stencil import StencilFactory
 from pace.dsl.typing import FloatField, FloatFieldIJ
@@ -106,7 +106,7 @@ def cmax_stencil1(cx: FloatField, cy: FloatField, cmax: FloatField):
 
 
 def cmax_stencil2(
-    cx: FloatField, cy: FloatField, sin_sg5: FloatField, cmax: FloatField
+    cx: FloatField, cy: FloatField, sin_sg5: FloatFieldIJ, cmax: FloatField
 ):
     with computation(PARALLEL), interval(...):
         cmax = max(abs(cx), abs(cy)) + 1.0 - sin_sg5
@@ -183,7 +183,22 @@ class TracerAdvection:
         grid_data,
         comm: pace.util.CubedSphereCommunicator,
         tracers: Dict[str, pace.util.Quantity],
+        adaptive_substeps: bool = False,
     ):
+        """
+        Args:
+            stencil_factory: creates stencils
+            quantity_factory: creates quantities
+            transport: finite volume transport applied to each tracer
+            grid_data: metric terms, must include sin_sg5 if adaptive_substeps
+                is True
+            comm: communicator for halo updates and global reductions
+            tracers: tracers to be advected on each call
+            adaptive_substeps: if True, compute the number of tracer substeps
+                on each call from the maximum courant number across all ranks,
+                as in the Fortran code. Otherwise always take 3 substeps,
+                which is enough for courant numbers below 2.
+        """
         orchestrate(
             obj=self,
             config=stencil_factory.config.dace_config,
@@ -208,6 +223,12 @@ class TracerAdvection:
         )
         self._tmp_dp = quantity_factory.zeros([X_DIM, Y_DIM, Z_DIM], units="Pa")
         self._tmp_dp2 = quantity_factory.zeros([X_DIM, Y_DIM, Z_DIM], units="Pa")
+        self._comm = comm
+        self._adaptive_substeps = adaptive_substeps
+        if adaptive_substeps:
+            if grid_data.sin_sg5 is None:
+                raise ValueError("adaptive_substeps requires sin_sg5 in grid_data")
+            self._cmax = quantity_factory.zeros([X_DIM, Y_DIM, Z_DIM], units="")
 
         ax_offsets = grid_indexing.axis_offsets(
             grid_indexing.origin_full(), grid_indexing.domain_full()
@@ -248,7 +269,34 @@ class TracerAdvection:
             domain=grid_indexing.domain_compute(),
             externals=local_axis_offsets,
         )
+        if adaptive_substeps:
+            # as in the Fortran code, the grid distortion term is left out of
+            # the courant number on levels with (1-based) k < npz / 6
+            n_top_levels = max(grid_indexing.domain[2] // 6 - 1, 0)
+            if n_top_levels > 0:
+                self._cmax_top = stencil_factory.from_origin_domain(
+                    cmax_stencil1,
+                    origin=grid_indexing.origin_compute(),
+                    domain=(
+                        grid_indexing.domain[0],
+                        grid_indexing.domain[1],
+                        n_top_levels,
+                    ),
+                )
+            else:
+                self._cmax_top = None
+            self._cmax_bottom = stencil_factory.from_origin_domain(
+                cmax_stencil2,
+                origin=(grid_indexing.isc, grid_indexing.jsc, n_top_levels),
+                domain=(
+                    grid_indexing.domain[0],
+                    grid_indexing.domain[1],
+                    grid_indexing.domain[2] - n_top_levels,
+                ),
+            )
         self.finite_volume_transport: FiniteVolumeTransport = transport
+        # fluxes are only needed in memory if they are damped before being applied
+        self._fuse_tracer_update = not transport.damps_fluxes
 
         # Setup halo updater for tracers
         tracer_halo_spec = quantity_factory.get_quantity_halo_spec(
@@ -261,6 +309,21 @@ class TracerAdvection:
             [t for t in tracers.keys()],
         )
 
+    def _compute_cmax(self, x_courant, y_courant):
+        if self._cmax_top is not None:
+            self._cmax_top(x_courant, y_courant, self._cmax)
+        self._cmax_bottom(x_courant, y_courant, self.grid_data.sin_sg5, self._cmax)
+
+    @dace_inhibitor
+    def _get_n_split(self) -> int:
+        """
+        Number of tracer substeps needed to keep the courant number of each
+        substep below 1 everywhere, reduced across all ranks.
+        """
+        local_cmax = float(self._cmax.view[:].max())
+        cmax = self._comm.comm.allreduce(local_cmax, max)
+        return int(math.floor(1.0 + cmax))
+
     def __call__(
         self,
         tracers: Dict[str, pace.util.Quantity],
@@ -309,36 +372,12 @@ class TracerAdvection:
             self._y_area_flux,
         )
 
-        # # TODO for if we end up using the Allreduce and compute cmax globally
-        # (or locally). For now, hardcoded.
-        # split = int(grid_indexing.domain[2] / 6)
-        # self._cmax_1(
-        #     cxd, cyd, self._tmp_cmax, origin=grid_indexing.origin_compute(),
-        #     domain=(grid_indexing.domain[0], self.grid_indexing.domain[1], split)
-        # )
-        # self._cmax_2(
-        #     cxd,
-        #     cyd,
-        #     self.grid.sin_sg5,
-        #     self._tmp_cmax,
-        #     origin=(grid_indexing.isc, self.grid_indexing.jsc, split),
-        #     domain=(
-        #         grid_indexing.domain[0],
-        #         self.grid_indexing.domain[1],
-        #         grid_indexing.domain[2] - split + 1
-        #     ),
-        # )
-        # cmax_flat = np.amax(self._tmp_cmax, axis=(0, 1))
-        # # cmax_flat is a gt4py storage still, but of dimension [npz+1]...
-
-        # cmax_max_all_ranks = cmax_flat.data
-        # # TODO mpi allreduce...
-        # # comm.Allreduce(cmax_flat, cmax_max_all_ranks, op=MPI.MAX)
-
-        cmax_max_all_ranks = 2.0
-        n_split = math.floor(1.0 + cmax_max_all_ranks)
-        # NOTE: cmax is not usually a single value, it varies with k, if return to
-        # that, make n_split a column as well
+        if self._adaptive_substeps:
+            self._compute_cmax(x_courant, y_courant)
+            n_split = self._get_n_split()
+        else:
+            # courant numbers below 2 are assumed
+            n_split = 3
 
         if n_split > 1.0:
             self._divide_fluxes_by_n_substeps(
@@ -365,26 +404,43 @@ class TracerAdvection:
                 self.grid_data.rarea,
                 dp2,
             )
+            # TODO: each tracer is still transported by its own stencil calls,
+            # so the courant numbers and area and mass fluxes are re-read once
+            # per tracer. Transporting all tracers in one pass would need the
+            # xppm/yppm stencils to support a tracer data dimension.
             for q in tracers.values():
-                self.finite_volume_transport(
-                    q,
-                    x_courant,
-                    y_courant,
-                    self._x_area_flux,
-                    self._y_area_flux,
-                    self._x_flux,
-                    self._y_flux,
-                    x_mass_flux=x_mass_flux,
-                    y_mass_flux=y_mass_flux,
-                )
-                self._apply_tracer_flux(
-                    q,
-                    dp1,
-                    self._x_flux,
-                    self._y_flux,
-                    self.grid_data.rarea,
-                    dp2,
-                )
+                if self._fuse_tracer_update:
+                    self.finite_volume_transport.transport_mass_weighted(
+                        q,
+                        x_courant,
+                        y_courant,
+                        self._x_area_flux,
+                        self._y_area_flux,
+                        x_mass_flux,
+                        y_mass_flux,
+                        dp1,
+                        dp2,
+                    )
+                else:
+                    self.finite_volume_transport(
+                        q,
+                        x_courant,
+                        y_courant,
+                        self._x_area_flux,
+                        self._y_area_flux,
+                        self._x_flux,
+                        self._y_flux,
+                        x_mass_flux=x_mass_flux,
+                        y_mass_flux=y_mass_flux,
+                    )
+                    self._apply_tracer_flux(
+                        q,
+                        dp1,
+                        self._x_flux,
+                        self._y_flux,
+                        self.grid_data.rarea,
+                        dp2,
+                    )
             if not last_call:
                 self._tracers_halo_updater.update()
                 # we can't use variable assignment to avoid a data copy
@@ -1,9 +1,12 @@
 import unittest.mock
 
+import dacite
+import numpy as np
 import pytest
 
 import pace.driver
 import pace.driver.diagnostics
+import pace.util
 from pace.fv3core.initialization.dycore_state import DycoreState
 
 
@@ -68,3 +71,140 @@ def test_zselect_raises_error_if_3rd_dim_not_z(tmpdir):
         foo = quantity_factory.zeros(dims=["z", "x", "y"], units="-")
         state.foo = foo
         result.z_select[0].select_data(state)
+
+
+def test_returns_async_monitor_if_async_write(tmpdir):
+    config = pace.driver.DiagnosticsConfig(path=tmpdir, names=["foo"], async_write=True)
+    result = config.diagnostics_factory(unittest.mock.MagicMock())
+    assert isinstance(result.monitor, pace.driver.diagnostics.AsyncMonitor)
+    result.cleanup()
+
+
+def test_raises_if_async_queue_depth_not_positive(tmpdir):
+    with pytest.raises(ValueError):
+        pace.driver.DiagnosticsConfig(path=tmpdir, async_queue_depth=0)
+
+
+class RecordingMonitor:
+    def __init__(self):
+        self.stored = []
+        self.constants = []
+        self.cleaned_up = False
+
+    def store(self, state):
+        self.stored.append(
+            {
+                name: value if name == "time" else value.view[:].copy()
+                for name, value in state.items()
+            }
+        )
+
+    def store_constant(self, state):
+        self.constants.append(state)
+
+    def cleanup(self):
+        self.cleaned_up = True
+
+
+def test_async_monitor_stores_copies_of_state():
+    inner = RecordingMonitor()
+    monitor = pace.driver.diagnostics.AsyncMonitor(inner, queue_depth=1)
+    quantity = pace.util.Quantity(
+        np.zeros((5, 5)), dims=["x", "y"], units="m", origin=(1, 1), extent=(3, 3)
+    )
+    for i in range(4):
+        quantity.data[:] = i
+        monitor.store({"time": i, "foo": quantity})
+    monitor.cleanup()
+    assert inner.cleaned_up
+    assert [state["time"] for state in inner.stored] == [0, 1, 2, 3]
+    for i, state in enumerate(inner.stored):
+        np.testing.assert_array_equal(state["foo"], np.full((3, 3), i))
+
+
+def test_async_monitor_flushes_before_store_constant():
+    inner = RecordingMonitor()
+    monitor = pace.driver.diagnostics.AsyncMonitor(inner, queue_depth=2)
+    quantity = pace.util.Quantity(np.zeros((3, 3)), dims=["x", "y"], units="m")
+    monitor.store({"time": 0, "foo": quantity})
+    monitor.store_constant({"bar": quantity})
+    assert len(inner.stored) == 1
+    assert len(inner.constants) == 1
+    monitor.cleanup()
+
+
+def test_async_monitor_reraises_writer_errors():
+    inner = unittest.mock.MagicMock()
+    inner.store.side_effect = OSError("disk full")
+    monitor = pace.driver.diagnostics.AsyncMonitor(inner, queue_depth=1)
+    quantity = pace.util.Quantity(np.zeros((3, 3)), dims=["x", "y"], units="m")
+    monitor.store({"time": 0, "foo": quantity})
+    with pytest.raises(RuntimeError):
+        monitor.flush()
+
+
+def test_async_monitor_cleans_up_after_writer_error():
+    inner = unittest.mock.MagicMock()
+    inner.store.side_effect = OSError("disk full")
+    monitor = pace.driver.diagnostics.AsyncMonitor(inner, queue_depth=1)
+    quantity = pace.util.Quantity(np.zeros((3, 3)), dims=["x", "y"], units="m")
+    monitor.store({"time": 0, "foo": quantity})
+    with pytest.raises(RuntimeError):
+        monitor.cleanup()
+    inner.cleanup.assert_called_once_with()
+
+
+def test_raises_if_netcdf_mode_invalid(tmpdir):
+    with pytest.raises(ValueError):
+        pace.driver.DiagnosticsConfig(
+            path=tmpdir, output_format="netcdf", netcdf_mode="bad"
+        )
+
+
+def test_async_monitor_preserves_attrs():
+    inner = unittest.mock.MagicMock()
+    monitor = pace.driver.diagnostics.AsyncMonitor(inner, queue_depth=1)
+    quantity = pace.util.Quantity(np.zeros((3, 3)), dims=["x", "y"], units="m")
+    quantity.update_attrs({"long_name": "foo"})
+    monitor.store({"time": 0, "foo": quantity})
+    monitor.flush()
+    stored = inner.store.call_args[0][0]["foo"]
+    assert stored.attrs == {"units": "m", "long_name": "foo"}
+    monitor.cleanup()
+
+
+def test_encoding_from_dict():
+    config = dacite.from_dict(
+        data_class=pace.driver.DiagnosticsConfig,
+        data={
+            "path": "output.zarr",
+            "names": ["u"],
+            "encoding": {"u": {"compressor": "zstd", "keep_bits": 7}},
+            "default_encoding": {"dtype": "float32"},
+        },
+        config=dacite.Config(strict=True),
+    )
+    assert config.encoding["u"] == pace.util.VariableEncoding(
+        compressor="zstd", keep_bits=7
+    )
+    assert config.default_encoding == pace.util.VariableEncoding(dtype="float32")
+
+
+def test_async_write_uses_duplicate_communicator(tmpdir):
+    partitioner = pace.util.CubedSpherePartitioner(pace.util.TilePartitioner((1, 1)))
+    comm = pace.util.NullComm(rank=3, total_ranks=6)
+    timer = pace.util.Timer()
+    communicator = pace.util.CubedSphereCommunicator(comm, partitioner, timer=timer)
+    config = pace.driver.DiagnosticsConfig(
+        path=tmpdir,
+        output_format="netcdf",
+        names=["foo"],
+        async_write=True,
+    )
+    diagnostics = config.diagnostics_factory(communicator)
+    writer_communicator = diagnostics.monitor.monitor._communicator
+    assert writer_communicator.comm is not comm
+    assert writer_communicator.rank == 3
+    assert writer_communicator.comm.Get_size() == 6
+    assert writer_communicator.partitioner is partitioner
+    assert writer_communicator.timer is timer
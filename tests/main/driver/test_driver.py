@@ -1,3 +1,4 @@
+import types
 import unittest.mock
 from datetime import datetime, timedelta
 from typing import Literal, Tuple
@@ -6,6 +7,7 @@ import pytest
 
 import pace.driver
 import pace.dsl
+import pace.util
 from pace.driver import CreatesCommSelector, DriverConfig, NullCommConfig
 from pace.driver.performance.report import (
     TimeReport,
@@ -143,3 +145,17 @@ test_data = [timing_info, 365.0, 1.0]
 def test_sypd(timing_info, dt_atmos, expected_SYPD):
     sypd = get_sypd(timing_info, dt_atmos)
     assert sypd == expected_SYPD
+
+
+def test_update_driver_config_with_communicator_keeps_compile_workers():
+    config = get_driver_config()
+    config.stencil_config = pace.dsl.StencilConfig(
+        compilation_config=pace.dsl.CompilationConfig(compile_workers=4)
+    )
+    communicator = pace.util.CubedSphereCommunicator(
+        NullComm(rank=0, total_ranks=6),
+        pace.util.CubedSpherePartitioner(pace.util.TilePartitioner((1, 1))),
+    )
+    driver = types.SimpleNamespace(config=config)
+    pace.driver.Driver._update_driver_config_with_communicator(driver, communicator)
+    assert config.stencil_config.compilation_config.compile_workers == 4
@@ -0,0 +1,148 @@
+import dataclasses
+import os
+import unittest.mock
+
+import numpy as np
+import pytest
+
+import pace.util
+from pace.driver.grid import GeneratedGridConfig
+from pace.util.null_comm import NullComm
+
+
+def make_quantity_factory_and_communicator(nz):
+    layout = (1, 1)
+    partitioner = pace.util.CubedSpherePartitioner(pace.util.TilePartitioner(layout))
+    communicator = pace.util.CubedSphereCommunicator(
+        NullComm(rank=0, total_ranks=6, fill_value=0.0), partitioner
+    )
+    sizer = pace.util.SubtileGridSizer.from_tile_params(
+        nx_tile=12,
+        ny_tile=12,
+        nz=nz,
+        n_halo=3,
+        extra_dim_lengths={},
+        layout=layout,
+        tile_partitioner=partitioner.tile,
+        tile_rank=communicator.tile.rank,
+    )
+    quantity_factory = pace.util.QuantityFactory.from_backend(
+        sizer=sizer, backend="numpy"
+    )
+    return quantity_factory, communicator
+
+
+@pytest.fixture
+def quantity_factory_and_communicator():
+    return make_quantity_factory_and_communicator(nz=79)
+
+
+def get_grid(config, quantity_factory_and_communicator):
+    quantity_factory, communicator = quantity_factory_and_communicator
+    with unittest.mock.patch.object(
+        GeneratedGridConfig,
+        "_generate",
+        autospec=True,
+        side_effect=GeneratedGridConfig._generate,
+    ) as generate:
+        grid = config.get_grid(quantity_factory, communicator)
+    return grid, generate.call_count > 0
+
+
+def assert_grids_equal(grid, reference):
+    damping_coefficients, driver_grid_data, grid_data = grid
+    ref_damping_coefficients, ref_driver_grid_data, ref_grid_data = reference
+    assert damping_coefficients.da_min == ref_damping_coefficients.da_min
+    assert damping_coefficients.da_min_c == ref_damping_coefficients.da_min_c
+    for name in ("divg_u", "divg_v", "del6_u", "del6_v"):
+        np.testing.assert_array_equal(
+            getattr(damping_coefficients, name).data,
+            getattr(ref_damping_coefficients, name).data,
+        )
+    for field in dataclasses.fields(driver_grid_data):
+        np.testing.assert_array_equal(
+            getattr(driver_grid_data, field.name).data,
+            getattr(ref_driver_grid_data, field.name).data,
+        )
+    for name in ("area", "rarea", "dx", "dyc", "cosa_s", "sin_sg4", "sin_sg5", "ak"):
+        quantity = getattr(grid_data, name)
+        ref_quantity = getattr(ref_grid_data, name)
+        assert quantity.dims == ref_quantity.dims
+        assert quantity.origin == ref_quantity.origin
+        assert quantity.extent == ref_quantity.extent
+        np.testing.assert_array_equal(quantity.data, ref_quantity.data)
+
+
+def test_grid_cache_is_reused(tmpdir, quantity_factory_and_communicator):
+    config = GeneratedGridConfig(cache_path=str(tmpdir))
+    reference = GeneratedGridConfig().get_grid(*quantity_factory_and_communicator)
+    first_grid, generated = get_grid(config, quantity_factory_and_communicator)
+    assert generated
+    assert len(tmpdir.listdir()) == 1
+    assert [path.basename for path in tmpdir.listdir()[0].listdir()] == [
+        "rank_0000.npz"
+    ]
+    second_grid, generated = get_grid(config, quantity_factory_and_communicator)
+    assert not generated
+    assert_grids_equal(first_grid, reference)
+    assert_grids_equal(second_grid, reference)
+
+
+def test_grid_cache_key(tmpdir, quantity_factory_and_communicator):
+    get_grid(
+        GeneratedGridConfig(cache_path=str(tmpdir)), quantity_factory_and_communicator
+    )
+    # the target of the refinement has no effect on an unstretched grid
+    _, generated = get_grid(
+        GeneratedGridConfig(cache_path=str(tmpdir), lon_target=10.0),
+        quantity_factory_and_communicator,
+    )
+    assert not generated
+    _, generated = get_grid(
+        GeneratedGridConfig(cache_path=str(tmpdir), stretch_factor=3.0),
+        quantity_factory_and_communicator,
+    )
+    assert generated
+    assert len(tmpdir.listdir()) == 2
+
+
+def test_grid_cache_unreadable_file_is_regenerated(
+    tmpdir, quantity_factory_and_communicator
+):
+    config = GeneratedGridConfig(cache_path=str(tmpdir))
+    get_grid(config, quantity_factory_and_communicator)
+    (filename,) = tmpdir.listdir()[0].listdir()
+    with open(str(filename), "wb") as f:
+        f.write(b"truncated")
+    _, generated = get_grid(config, quantity_factory_and_communicator)
+    assert generated
+    _, generated = get_grid(config, quantity_factory_and_communicator)
+    assert not generated
+
+
+def test_grid_cache_missing_on_another_rank(tmpdir, quantity_factory_and_communicator):
+    _, communicator = quantity_factory_and_communicator
+    config = GeneratedGridConfig(cache_path=str(tmpdir))
+    get_grid(config, quantity_factory_and_communicator)
+    with unittest.mock.patch.object(
+        communicator.comm, "allgather", return_value=[True, False]
+    ):
+        _, generated = get_grid(config, quantity_factory_and_communicator)
+    assert generated
+
+
+def test_grid_cache_with_restart_vertical_grid(tmpdir):
+    # the restart data has 63 vertical levels
+    quantity_factory_and_communicator = make_quantity_factory_and_communicator(nz=63)
+    restart_dir = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "../../../util/tests/data/c12_restart",
+    )
+    config = GeneratedGridConfig(cache_path=str(tmpdir), restart_path=restart_dir)
+    reference = GeneratedGridConfig(restart_path=restart_dir).get_grid(
+        *quantity_factory_and_communicator
+    )
+    get_grid(config, quantity_factory_and_communicator)
+    grid, generated = get_grid(config, quantity_factory_and_communicator)
+    assert not generated
+    assert_grids_equal(grid, reference)
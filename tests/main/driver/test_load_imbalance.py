@@ -0,0 +1,97 @@
+import dataclasses
+import json
+import os
+
+import numpy as np
+import pytest
+
+import pace.util
+from pace.driver.performance.collector import PerformanceCollector
+from pace.driver.performance.report import TimeReport, get_load_imbalance
+from pace.util.null_comm import NullComm
+
+
+@pytest.fixture
+def partitioner():
+    return pace.util.CubedSpherePartitioner(pace.util.TilePartitioner((2, 2)))
+
+
+def timing_info_from_rank_times(rank_times):
+    """rank_times maps timer names to a list over ranks of lists over steps"""
+    return {
+        name: TimeReport(hits=0, times=[list(steps) for steps in times])
+        for name, times in rank_times.items()
+    }
+
+
+def test_load_imbalance(partitioner):
+    n_ranks = partitioner.total_ranks
+    mainloop = np.full((n_ranks, 3), 1.0)
+    wait = np.full((n_ranks, 3), 0.2)
+    pack = np.full((n_ranks, 3), 0.1)
+    # rank 13 is a straggler in compute, the others wait on it
+    mainloop[13, :] = 2.0
+    wait[13, :] = 0.0
+    timing_info = timing_info_from_rank_times(
+        {"mainloop": mainloop, "wait": wait, "pack": pack}
+    )
+    report = get_load_imbalance(timing_info, partitioner, n_slowest=2)
+    assert report.reference_timer == "mainloop"
+    mean_mainloop = (3.0 * (n_ranks - 1) + 6.0) / n_ranks
+    assert report.timers["mainloop"].max == 6.0
+    assert report.timers["mainloop"].imbalance == pytest.approx(6.0 / mean_mainloop)
+    assert report.timers["mainloop"].slowest_rank == 13
+    assert report.halo_wait.max == pytest.approx(0.6)
+    assert report.halo_wait.min == 0.0
+    assert report.halo_overhead.imbalance == pytest.approx(1.0)
+    assert report.compute.slowest_rank == 13
+    assert report.compute.max == pytest.approx(5.7)
+    assert report.compute.min == pytest.approx(2.1)
+    assert len(report.slowest_ranks) == 2
+    # rank 13 is on the fourth tile, the second subtile of a 2x2 layout
+    assert dataclasses.asdict(report.slowest_ranks[0]) == {
+        "rank": 13,
+        "time": 6.0,
+        "tile": 3,
+        "subtile_y": 0,
+        "subtile_x": 1,
+    }
+
+
+def test_load_imbalance_without_communication_timers(partitioner):
+    timing_info = timing_info_from_rank_times(
+        {"mainloop": np.ones((partitioner.total_ranks, 2))}
+    )
+    report = get_load_imbalance(timing_info, partitioner)
+    assert report.halo_wait is None
+    assert report.halo_overhead is None
+    assert report.compute.imbalance == 1.0
+    assert len(report.slowest_ranks) == 10
+
+
+def test_load_imbalance_wrong_number_of_ranks(partitioner):
+    timing_info = timing_info_from_rank_times({"mainloop": np.ones((6, 2))})
+    with pytest.raises(ValueError):
+        get_load_imbalance(timing_info, partitioner)
+
+
+def test_write_out_load_imbalance(tmpdir):
+    partitioner = pace.util.CubedSpherePartitioner(pace.util.TilePartitioner((1, 1)))
+    collector = PerformanceCollector(
+        experiment_name="test",
+        comm=NullComm(rank=0, total_ranks=6, fill_value=0.0),
+        load_imbalance_report=True,
+    )
+    for _ in range(2):
+        with collector.timestep_timer.clock("mainloop"):
+            pass
+        collector.collect_performance()
+    with tmpdir.as_cwd():
+        collector.write_out_load_imbalance(partitioner)
+        filenames = os.listdir(".")
+        assert len(filenames) == 1
+        assert filenames[0].endswith("_load_imbalance.json")
+        with open(filenames[0]) as f:
+            report = json.load(f)
+    assert report["reference_timer"] == "mainloop"
+    assert len(report["slowest_ranks"]) == 6
@@ -3,6 +3,7 @@ import shutil
 from datetime import datetime
 
 import numpy as np
+import pytest
 import xarray as xr
 import yaml
 
@@ -10,6 +11,7 @@ import pace.dsl
 from pace.driver import CreatesComm, DriverConfig
 from pace.driver.driver import RestartConfig
 from pace.driver.initialization import BaroclinicInit
+from pace.driver.state import _restart_driver_state
 from pace.util.null_comm import NullComm
 
 
@@ -36,6 +38,62 @@ def test_default_save_restart():
     assert restart_config.save_restart is False
 
 
+def test_invalid_restart_format():
+    with pytest.raises(ValueError):
+        RestartConfig(restart_format="grib")
+
+
+def test_binary_restart_round_trip(tmpdir):
+    mpi_comm = NullComm(rank=0, total_ranks=6, fill_value=0.0)
+    partitioner = pace.util.CubedSpherePartitioner(pace.util.TilePartitioner((1, 1)))
+    communicator = pace.util.CubedSphereCommunicator(mpi_comm, partitioner)
+    sizer = pace.util.SubtileGridSizer.from_tile_params(
+        nx_tile=12,
+        ny_tile=12,
+        nz=79,
+        n_halo=3,
+        extra_dim_lengths={},
+        layout=(1, 1),
+        tile_partitioner=partitioner.tile,
+        tile_rank=communicator.tile.rank,
+    )
+    quantity_factory = pace.util.QuantityFactory.from_backend(
+        sizer=sizer, backend="numpy"
+    )
+    (
+        damping_coefficients,
+        driver_grid_data,
+        grid_data,
+    ) = pace.driver.GeneratedGridConfig().get_grid(quantity_factory, communicator)
+    driver_state = BaroclinicInit().get_driver_state(
+        quantity_factory=quantity_factory,
+        communicator=communicator,
+        damping_coefficients=damping_coefficients,
+        driver_grid_data=driver_grid_data,
+        grid_data=grid_data,
+    )
+    restart_path = str(tmpdir.join("RESTART"))
+    driver_state.save_state(
+        comm=mpi_comm, restart_path=restart_path, restart_format="binary"
+    )
+    assert os.path.exists(os.path.join(restart_path, "restart_dycore_state_0.bin"))
+    assert not os.path.exists(os.path.join(restart_path, "restart_dycore_state_0.nc"))
+    restart_state = _restart_driver_state(
+        restart_path,
+        0,
+        quantity_factory,
+        communicator,
+        damping_coefficients=damping_coefficients,
+        driver_grid_data=driver_grid_data,
+        grid_data=grid_data,
+    )
+    for var, before_restart in driver_state.dycore_state.__dict__.items():
+        if isinstance(before_restart, pace.util.Quantity):
+            after_restart = restart_state.dycore_state.__dict__[var]
+            assert after_restart.units == before_restart.units
+            np.testing.assert_array_equal(before_restart.data, after_restart.data)
+
+
 def test_restart_save_to_disk():
     try:
         with open(
@@ -0,0 +1,173 @@
+import os
+
+import numpy as np
+import pytest
+
+import pace.physics
+import pace.util
+from pace import fv3core
+from pace.driver.restart import IntermediateRestartWriter, is_restart_complete
+from pace.driver.state import (
+    COMPLETE_MARKER,
+    NETCDF_WRITE_LOCK,
+    DriverState,
+    TendencyState,
+    _overwrite_state_from_binary_restart,
+    _restart_driver_state,
+)
+from pace.util.null_comm import NullComm
+
+
+@pytest.fixture
+def quantity_factory():
+    sizer = pace.util.SubtileGridSizer(nx=4, ny=4, nz=5, n_halo=3, extra_dim_lengths={})
+    return pace.util.QuantityFactory.from_backend(sizer, backend="numpy")
+
+
+@pytest.fixture
+def state(quantity_factory):
+    dycore_state = fv3core.DycoreState.init_zeros(quantity_factory=quantity_factory)
+    dycore_state.u.data[:] = np.random.uniform(size=dycore_state.u.data.shape)
+    return DriverState(
+        dycore_state=dycore_state,
+        physics_state=pace.physics.PhysicsState.init_zeros(
+            quantity_factory=quantity_factory, active_packages=["microphysics"]
+        ),
+        tendency_state=TendencyState.init_zeros(quantity_factory=quantity_factory),
+        grid_data=None,
+        damping_coefficients=None,
+        driver_grid_data=None,
+    )
+
+
+def read_u(quantity_factory, restart_path, rank=0):
+    dycore_state = fv3core.DycoreState.init_zeros(quantity_factory=quantity_factory)
+    _overwrite_state_from_binary_restart(
+        restart_path, rank, dycore_state, "restart_dycore_state"
+    )
+    return dycore_state.u.data
+
+
+@pytest.mark.parametrize("background", [True, False])
+def test_intermediate_restart_writer(tmpdir, state, quantity_factory, background):
+    writer = IntermediateRestartWriter(rank=0, background=background)
+    restart_path = str(tmpdir.join("RESTART_0"))
+    config_written = []
+    expected_u = state.dycore_state.u.data.copy()
+    writer.write(
+        state,
+        restart_path=restart_path,
+        restart_format="binary",
+        write_config=lambda: config_written.append(True),
+    )
+    state.dycore_state.u.data[:] = 0.0
+    writer.wait()
+    assert config_written == [True]
+    assert is_restart_complete(restart_path, total_ranks=1)
+    assert not is_restart_complete(restart_path, total_ranks=2)
+    assert not os.path.exists(os.path.join(restart_path, ".staging_0"))
+    if background:
+        # data was staged before the state was modified
+        np.testing.assert_array_equal(
+            read_u(quantity_factory, restart_path), expected_u
+        )
+
+
+def test_intermediate_restart_writer_keep_last(tmpdir, state):
+    writer = IntermediateRestartWriter(rank=0, background=True, keep_last=2)
+    paths = [str(tmpdir.join(f"RESTART_{step}")) for step in range(3)]
+    for path in paths:
+        writer.write(state, restart_path=path, restart_format="netcdf")
+    writer.wait()
+    assert not os.path.exists(paths[0])
+    assert is_restart_complete(paths[1], total_ranks=1)
+    assert is_restart_complete(paths[2], total_ranks=1)
+
+
+def test_intermediate_restart_writer_keep_last_shared_directory(tmpdir, state):
+    writers = [
+        IntermediateRestartWriter(rank=rank, background=False, keep_last=1)
+        for rank in range(2)
+    ]
+    paths = [str(tmpdir.join(f"RESTART_{step}")) for step in range(2)]
+    for path in paths:
+        for writer in writers:
+            writer.write(state, restart_path=path, restart_format="binary")
+    # directory is removed by the last rank to remove its files
+    assert not os.path.exists(paths[0])
+    assert is_restart_complete(paths[1], total_ranks=2)
+
+
+def test_intermediate_restart_writer_raises_error(tmpdir, state):
+    writer = IntermediateRestartWriter(rank=0, background=True)
+    writer.write(
+        state, restart_path=str(tmpdir.join("RESTART_0")), restart_format="grib"
+    )
+    with pytest.raises(RuntimeError):
+        writer.wait()
+
+
+def test_invalid_keep_last():
+    with pytest.raises(ValueError):
+        IntermediateRestartWriter(rank=0, keep_last=0)
+
+
+def test_restart_from_incomplete_directory_raises(tmpdir, state, quantity_factory):
+    restart_path = str(tmpdir.join("RESTART_0"))
+    IntermediateRestartWriter(rank=1).write(
+        state, restart_path=restart_path, restart_format="binary"
+    )
+    communicator = pace.util.CubedSphereCommunicator(
+        NullComm(rank=0, total_ranks=6, fill_value=0.0),
+        pace.util.CubedSpherePartitioner(pace.util.TilePartitioner((1, 1))),
+    )
+    with pytest.raises(RuntimeError):
+        _restart_driver_state(
+            restart_path,
+            0,
+            quantity_factory,
+            communicator,
+            damping_coefficients=None,
+            driver_grid_data=None,
+            grid_data=None,
+        )
+
+
+def test_restart_without_markers_loads_as_legacy(tmpdir, state, quantity_factory):
+    restart_path = str(tmpdir.join("RESTART"))
+    state.save_state(
+        comm=NullComm(rank=0, total_ranks=6),
+        restart_path=restart_path,
+        restart_format="binary",
+    )
+    assert is_restart_complete(restart_path, total_ranks=1)
+    # restarts written before completion markers were introduced have none
+    os.remove(os.path.join(restart_path, COMPLETE_MARKER.format(rank=0)))
+    communicator = pace.util.CubedSphereCommunicator(
+        NullComm(rank=0, total_ranks=6, fill_value=0.0),
+        pace.util.CubedSpherePartitioner(pace.util.TilePartitioner((1, 1))),
+    )
+    with pytest.warns(UserWarning, match="no completion markers"):
+        restart_state = _restart_driver_state(
+            restart_path,
+            0,
+            quantity_factory,
+            communicator,
+            damping_coefficients=None,
+            driver_grid_data=None,
+            grid_data=None,
+        )
+    np.testing.assert_array_equal(
+        restart_state.dycore_state.u.data, state.dycore_state.u.data
+    )
+
+
+def test_background_restart_waits_for_write_lock(tmpdir, state):
+    restart_path = str(tmpdir.join("RESTART_0"))
+    writer = IntermediateRestartWriter(rank=0, background=True)
+    with NETCDF_WRITE_LOCK:
+        writer.write(state, restart_path=restart_path, restart_format="netcdf")
+        writer._thread.join(timeout=0.1)
+        assert not is_restart_complete(restart_path, total_ranks=1)
+    writer.wait()
+    assert is_restart_complete(restart_path, total_ranks=1)
@@ -3,10 +3,21 @@ import unittest.mock
 import numpy as np
 import pytest
 
-from pace.driver.safety_checks import SafetyChecker
+from pace.driver.safety_checks import SafetyChecker, _min_max
 from pace.util import Quantity
 
 
+def make_quantity(data):
+    return Quantity(
+        data,
+        ("x", "y", "z"),
+        "unknown",
+        origin=(0, 0, 0),
+        extent=data.shape,
+        gt4py_backend="numpy",
+    )
+
+
 def test_register_variable():
     SafetyChecker.clear_all_checks()
     SafetyChecker.register_variable("u", minimum_value=10)
@@ -24,10 +35,10 @@ def test_check_state():
     SafetyChecker.clear_all_checks()
     SafetyChecker.register_variable("u", minimum_value=10, maximum_value=20)
     checker = SafetyChecker()
-    u = unittest.mock.MagicMock()
-    u.data.min.return_value = 11
-    u.data.max.return_value = 19
-    dycore_state = unittest.mock.MagicMock(u=u)
+    u_data = np.full((4, 4, 2), 15.0)
+    u_data[0, 0, 0] = 11
+    u_data[1, 0, 0] = 19
+    dycore_state = unittest.mock.MagicMock(u=make_quantity(u_data))
     checker.check_state(dycore_state)
 
 
@@ -35,9 +46,9 @@ def test_check_state_failing_min():
     SafetyChecker.clear_all_checks()
     SafetyChecker.register_variable("u", minimum_value=10)
     checker = SafetyChecker()
-    u = unittest.mock.MagicMock()
-    u.data.min.return_value = 9
-    dycore_state = unittest.mock.MagicMock(u=u)
+    u_data = np.full((4, 4, 2), 15.0)
+    u_data[0, 0, 0] = 9
+    dycore_state = unittest.mock.MagicMock(u=make_quantity(u_data))
     with pytest.raises(RuntimeError):
         checker.check_state(dycore_state)
 
@@ -46,9 +57,9 @@ def test_check_state_failing_max():
     SafetyChecker.clear_all_checks()
     SafetyChecker.register_variable("u", maximum_value=10)
     checker = SafetyChecker()
-    u = unittest.mock.MagicMock()
-    u.data.max.return_value = 11
-    dycore_state = unittest.mock.MagicMock(u=u)
+    u_data = np.full((4, 4, 2), 5.0)
+    u_data[0, 0, 0] = 11
+    dycore_state = unittest.mock.MagicMock(u=make_quantity(u_data))
     with pytest.raises(RuntimeError):
         checker.check_state(dycore_state)
 
@@ -94,8 +105,85 @@ def test_variable_not_present():
     SafetyChecker.clear_all_checks()
     SafetyChecker.register_variable("v", maximum_value=10)
     checker = SafetyChecker()
-    u = unittest.mock.MagicMock()
-    u.data.max.return_value = 11
-    dycore_state = unittest.mock.MagicMock(u=u)
+    u = make_quantity(np.full((4, 4, 2), 11.0))
+    dycore_state = unittest.mock.Mock(spec=["u"], u=u)
     with pytest.raises(NotImplementedError):
         checker.check_state(dycore_state)
+
+
+def test_check_state_reports_all_violations():
+    SafetyChecker.clear_all_checks()
+    SafetyChecker.register_variable("u", minimum_value=0.0, maximum_value=10)
+    SafetyChecker.register_variable("v", maximum_value=10)
+    SafetyChecker.register_variable("w", maximum_value=10)
+    checker = SafetyChecker()
+    u_data = np.full((4, 4, 2), 5.0)
+    u_data[0, 0, 0] = -1.0
+    u_data[1, 0, 0] = 11.0
+    v_data = np.full((4, 4, 2), 5.0)
+    v_data[2, 2, 1] = np.nan
+    dycore_state = unittest.mock.MagicMock(
+        u=make_quantity(u_data),
+        v=make_quantity(v_data),
+        w=make_quantity(np.full((4, 4, 2), 5.0)),
+    )
+    violations = checker.find_violations(dycore_state)
+    assert len(violations) == 3
+    assert "Variable u" in violations[0] and "0.0 specified" in violations[0]
+    assert "Variable u" in violations[1] and "10 specified" in violations[1]
+    assert "Variable v contains a NaN" in violations[2]
+    with pytest.raises(RuntimeError, match="(?s)Variable u.*Variable v"):
+        checker.check_state(dycore_state)
+
+
+def test_nan_in_halo_is_not_a_violation():
+    SafetyChecker.clear_all_checks()
+    SafetyChecker.register_variable("u", maximum_value=10)
+    checker = SafetyChecker()
+    u_data = np.ones((4, 4, 2))
+    u_data[0, 0, :] = np.nan
+    u_quantity = Quantity(
+        u_data,
+        ("x", "y", "z"),
+        "unknown",
+        origin=(1, 1, 0),
+        extent=(3, 3, 2),
+        gt4py_backend="numpy",
+    )
+    dycore_state = unittest.mock.MagicMock(u=u_quantity)
+    checker.check_state(dycore_state)
+
+
+@pytest.mark.parametrize("stride, expect_violation", [(None, True), (2, False)])
+def test_check_state_sampled(stride, expect_violation):
+    SafetyChecker.clear_all_checks()
+    SafetyChecker.register_variable("u", maximum_value=10)
+    checker = SafetyChecker(sample_stride=stride)
+    u_data = np.ones((6, 6, 4))
+    # not on a sampled point for a stride of 2
+    u_data[1, 3, 1] = 100
+    dycore_state = unittest.mock.MagicMock(u=make_quantity(u_data))
+    assert (len(checker.find_violations(dycore_state)) > 0) == expect_violation
+
+
+def test_invalid_sample_stride():
+    with pytest.raises(ValueError):
+        SafetyChecker(sample_stride=0)
+
+
+@pytest.mark.parametrize("shape", [(1000, 50, 20), (7,), (3, 200000)])
+@pytest.mark.parametrize("with_nan", [False, True])
+def test_min_max(shape, with_nan):
+    np.random.seed(0)
+    array = np.random.uniform(-1, 1, size=shape)
+    if with_nan:
+        # start of the last row, so also included in the strided view
+        array.ravel()[array.size - array.shape[-1]] = np.nan
+    # include a non-contiguous view
+    for view in (array, array[..., ::2]):
+        min_value, max_value = _min_max(view)
+        if with_nan:
+            assert np.isnan(min_value) and np.isnan(max_value)
+        else:
+            assert min_value == view.min()
+            assert max_value == view.max()
@@ -0,0 +1,151 @@
+import json
+import os
+
+import numpy as np
+import pytest
+from click.testing import CliRunner
+
+import pace.util
+from pace.driver.performance import PerformanceConfig
+from pace.driver.performance.collector import _StepAggregate
+from pace.driver.performance.telemetry import (
+    RANK_FILENAME,
+    SUMMARY_FILENAME,
+    TelemetryWriter,
+    aggregate_telemetry,
+    command_line,
+    read_jsonl,
+    summarize_across_ranks,
+)
+from pace.util.mpi import MPI
+
+
+requires_mpi = pytest.mark.skipif(MPI is None, reason="mpi4py is not installed")
+
+
+def write_rank_file(path, rank, step_times):
+    with open(os.path.join(path, RANK_FILENAME.format(rank=rank)), "w") as f:
+        for step, times in enumerate(step_times):
+            record = {"step": step, "rank": rank, "times": times, "hits": {}}
+            f.write(json.dumps(record) + "\n")
+
+
+@requires_mpi
+def test_telemetry_writer_flushes_every_n_steps(tmpdir):
+    comm = pace.util.MPIComm()
+    writer = TelemetryWriter(str(tmpdir), comm=comm, flush_frequency=2)
+    rank_filename = str(tmpdir.join(RANK_FILENAME.format(rank=comm.Get_rank())))
+    for step in range(5):
+        writer.record({"mainloop": float(step)}, {"mainloop": 1})
+    assert len(read_jsonl(rank_filename)) == 4
+    writer.flush()
+    records = read_jsonl(rank_filename)
+    assert [record["step"] for record in records] == list(range(5))
+    assert records[3]["times"] == {"mainloop": 3.0}
+    if comm.Get_rank() == 0:
+        summaries = read_jsonl(str(tmpdir.join(SUMMARY_FILENAME)))
+        assert [summary["step"] for summary in summaries] == list(range(5))
+        assert summaries[4]["max"]["mainloop"] == 4.0
+
+
+@requires_mpi
+def test_performance_config_builds_telemetry(tmpdir):
+    comm = pace.util.MPIComm()
+    config = PerformanceConfig(
+        collect_performance=True,
+        telemetry_path=str(tmpdir),
+        telemetry_flush_frequency=3,
+    )
+    collector = config.build(comm)
+    for _ in range(2):
+        with collector.timestep_timer.clock("mainloop"):
+            pass
+        collector.collect_performance()
+    collector.cleanup()
+    records = read_jsonl(str(tmpdir.join(RANK_FILENAME.format(rank=comm.Get_rank()))))
+    assert len(records) == 2
+    assert "mainloop" in records[0]["times"]
+
+
+@requires_mpi
+def test_collector_with_telemetry_keeps_running_aggregate(tmpdir):
+    comm = pace.util.MPIComm()
+    config = PerformanceConfig(collect_performance=True, telemetry_path=str(tmpdir))
+    collector = config.build(comm)
+    for _ in range(3):
+        with collector.timestep_timer.clock("mainloop"):
+            pass
+        collector.collect_performance()
+    collector.cleanup()
+    assert collector.times_per_step == []
+    assert collector.hits_per_step == []
+    n_steps, times_per_step, hits_per_step = collector._get_steps()
+    assert n_steps == 3
+    assert hits_per_step == [{"mainloop": 3}]
+    assert len(times_per_step) == 1
+    assert times_per_step[0]["mainloop"] >= 0.0
+
+
+def test_step_aggregate():
+    aggregate = _StepAggregate()
+    aggregate.add({"mainloop": 1.0, "remap": 0.5}, {"mainloop": 1, "remap": 2})
+    aggregate.add({"mainloop": 3.0}, {"mainloop": 1})
+    aggregate.add({}, {})
+    assert aggregate.steps == 2
+    assert aggregate.mean_times() == {"mainloop": 2.0, "remap": 0.5}
+    assert aggregate.hits == {"mainloop": 2, "remap": 2}
+
+
+def test_invalid_flush_frequency(tmpdir):
+    with pytest.raises(ValueError):
+        TelemetryWriter(str(tmpdir), comm=None, flush_frequency=0)
+
+
+def test_summarize_across_ranks():
+    times = np.array(
+        [
+            [[1.0, np.nan], [2.0, 1.0]],
+            [[3.0, np.nan], [1.0, 2.0]],
+            [[2.0, np.nan], [3.0, 6.0]],
+        ]
+    )
+    summaries = summarize_across_ranks(times, ["a", "b"])
+    assert summaries[0] == {
+        "min": {"a": 1.0},
+        "mean": {"a": 2.0},
+        "max": {"a": 3.0},
+        "max_rank": {"a": 1},
+    }
+    assert summaries[1]["mean"] == {"a": 2.0, "b": 3.0}
+    assert summaries[1]["max_rank"] == {"a": 2, "b": 2}
+
+
+def test_aggregate_telemetry_of_killed_run(tmpdir):
+    write_rank_file(str(tmpdir), 0, [{"mainloop": 1.0}, {"mainloop": 1.0}])
+    write_rank_file(
+        str(tmpdir), 1, [{"mainloop": 2.0}, {"mainloop": 4.0}, {"mainloop": 1.0}]
+    )
+    with open(str(tmpdir.join(RANK_FILENAME.format(rank=1))), "a") as f:
+        f.write('{"step": 3, "rank": 1, "ti')
+    aggregate = aggregate_telemetry(str(tmpdir))
+    assert aggregate["ranks"] == [0, 1]
+    assert aggregate["n_steps"] == 2
+    assert aggregate["timers"]["mainloop"] == {
+        "min": [1.0, 1.0],
+        "mean": [1.5, 2.5],
+        "max": [2.0, 4.0],
+        "rank_total": [2.0, 6.0],
+    }
+
+
+def test_aggregate_telemetry_command_line(tmpdir):
+    write_rank_file(str(tmpdir), 0, [{"mainloop": 1.0}])
+    write_rank_file(str(tmpdir), 1, [{"mainloop": 3.0}])
+    output = str(tmpdir.join("aggregate.json"))
+    result = CliRunner().invoke(command_line, [str(tmpdir), "--output", output])
+    assert result.exit_code == 0, result.output
+    assert "2 ranks, 1 steps" in result.output
+    # rank 1 is the slowest rank
+    assert result.output.splitlines()[-1].split()[-1] == "1"
+    with open(output) as f:
+        assert json.load(f)["n_steps"] == 1
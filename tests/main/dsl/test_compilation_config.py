@@ -1,5 +1,6 @@
 import unittest.mock
 from math import sqrt
+from typing import Tuple
 
 import pytest
 
@@ -16,46 +17,38 @@ def test_safety_checks():
 
 
 @pytest.mark.parametrize(
-    "size, use_minimal_caching, run_mode",
+    "layout, rank, is_compiling, equivalent, boundary_class",
     [
-        pytest.param(54, True, RunMode.Run, id="3x3 layout Run minimal"),
-        pytest.param(96, False, RunMode.BuildAndRun, id="4x4 layout BnR normal"),
-        pytest.param(96, True, RunMode.Run, id="4x4 layout Run minimal"),
+        pytest.param((2, 3), 4, True, 4, 4, id="2x3 layout - 4"),
+        pytest.param((2, 3), 10, False, 4, 4, id="2x3 layout - 10"),
+        pytest.param((4, 4), 10, False, 5, 4, id="4x4 layout - 10"),
+        pytest.param((4, 5), 19, True, 19, 8, id="4x5 layout - 19"),
+        pytest.param((4, 5), 33, False, 6, 4, id="4x5 layout - 33"),
     ],
 )
-def test_check_communicator_valid(
-    size: int, use_minimal_caching: bool, run_mode: RunMode
+def test_get_decomposition_info_non_square(
+    layout: Tuple[int, int],
+    rank: int,
+    is_compiling: bool,
+    equivalent: int,
+    boundary_class: int,
 ):
-    partitioner = CubedSpherePartitioner(
-        TilePartitioner((int(sqrt(size / 6)), int((sqrt(size / 6)))))
-    )
-    comm = unittest.mock.MagicMock()
-    comm.Get_size.return_value = size
-    cubed_sphere_comm = CubedSphereCommunicator(comm, partitioner)
-    config = CompilationConfig(
-        run_mode=run_mode, use_minimal_caching=use_minimal_caching
-    )
-    config.check_communicator(cubed_sphere_comm)
-
-
-@pytest.mark.parametrize(
-    "nx, ny, use_minimal_caching, run_mode",
-    [
-        pytest.param(2, 3, False, RunMode.BuildAndRun, id="2x3 layout BnR normal"),
-    ],
-)
-def test_check_communicator_invalid(
-    nx: int, ny: int, use_minimal_caching: bool, run_mode: RunMode
-):
-    partitioner = CubedSpherePartitioner(TilePartitioner((nx, ny)))
+    partitioner = CubedSpherePartitioner(TilePartitioner(layout))
     comm = unittest.mock.MagicMock()
-    comm.Get_size.return_value = nx * ny * 6
+    comm.Get_rank.return_value = rank
+    comm.Get_size.return_value = partitioner.total_ranks
     cubed_sphere_comm = CubedSphereCommunicator(comm, partitioner)
-    config = CompilationConfig(
-        run_mode=run_mode, use_minimal_caching=use_minimal_caching
-    )
-    with pytest.raises(RuntimeError):
-        config.check_communicator(cubed_sphere_comm)
+    config = CompilationConfig(use_minimal_caching=True, run_mode=RunMode.BuildAndRun)
+    (
+        _,
+        _,
+        computed_equivalent,
+        computed_is_compiling,
+    ) = config.get_decomposition_info_from_comm(cubed_sphere_comm)
+    assert equivalent == computed_equivalent
+    assert is_compiling == computed_is_compiling
+    config.run_mode = RunMode.Run
+    assert boundary_class == config.determine_compiling_equivalent(rank, partitioner)
 
 
 def test_get_decomposition_info_from_no_comm():
@@ -115,9 +108,7 @@ def test_get_decomposition_info_from_comm(
         pytest.param(28, 54, False, RunMode.Run, 1, id="3x3 layout - 28 - R"),
         pytest.param(10, 96, False, RunMode.Run, 4, id="4x4 layout - 10 - R"),
         pytest.param(20, 96, False, RunMode.Run, 3, id="4x4 layout - 20 - R"),
-        pytest.param(
-            10, 96, False, RunMode.BuildAndRun, 10, id="4x4 layout - 10 - BnR"
-        ),
+        pytest.param(10, 96, False, RunMode.BuildAndRun, 5, id="4x4 layout - 10 - BnR"),
         pytest.param(20, 96, False, RunMode.BuildAndRun, 4, id="4x4 layout - 20 - BnR"),
     ],
 )
@@ -148,7 +139,8 @@ def test_as_dict():
     assert asdict["device_sync"] is False
     assert asdict["run_mode"] == "BuildAndRun"
     assert asdict["use_minimal_caching"] is False
-    assert len(asdict) == 7
+    assert asdict["compile_workers"] == 1
+    assert len(asdict) == 8
 
 
 def test_from_dict():
@@ -190,3 +182,12 @@ def test_from_dict():
     specification_dict["run_mode"] = "Run"
     config = CompilationConfig.from_dict(specification_dict)
     assert config.use_minimal_caching is True
+
+    specification_dict["compile_workers"] = 4
+    config = CompilationConfig.from_dict(specification_dict)
+    assert config.compile_workers == 4
+
+
+def test_compile_workers_must_be_positive():
+    with pytest.raises(ValueError):
+        CompilationConfig(compile_workers=0)
@@ -1,5 +1,8 @@
 import unittest.mock
 
+import pytest
+
+from pace.dsl.dace.build import _can_read_layout
 from pace.dsl.dace.dace_config import DaceConfig
 from pace.dsl.dace.orchestration import (
     DaCeOrchestration,
@@ -91,3 +94,18 @@ def test_orchestrate_does_not_call_dace():
         a = A()
         a.foo()
     assert not mock_call_sdfg.called
+
+
+@pytest.mark.parametrize(
+    "layout, build_layout, can_read",
+    [
+        pytest.param((1, 1), (1, 1), True, id="1x1"),
+        pytest.param((2, 2), (2, 2), True, id="2x2"),
+        pytest.param((5, 4), (3, 3), True, id="5x4_from_3x3"),
+        pytest.param((1, 4), (1, 3), True, id="1x4_from_1x3"),
+        pytest.param((4, 4), (4, 4), False, id="4x4_from_4x4"),
+        pytest.param((3, 3), (2, 2), False, id="3x3_from_2x2"),
+    ],
+)
+def test_can_read_layout(layout, build_layout, can_read):
+    assert _can_read_layout(layout, build_layout) == can_read
@@ -10,6 +10,7 @@ from pace.dsl.stencil import (
     FrozenStencil,
     GridIndexing,
     StencilFactory,
+    _canonical_value,
     get_stencils_with_varied_bounds,
 )
 from pace.dsl.stencil_config import CompilationConfig, StencilConfig
@@ -209,3 +210,90 @@ def test_stencil_factory_numpy_comparison_runs_without_exceptions():
     q_out = make_storage_from_shape(indexing.max_shape, backend=backend)
     stencil(q_in, q_out)
     np.testing.assert_array_equal(q_in.data, q_out.data)
+
+
+def test_planned_compilation_defers_and_deduplicates(backend: str):
+    factory = get_stencil_factory(backend)
+    with factory.planned_compilation(max_workers=2) as plan:
+        copy = factory.from_origin_domain(
+            copy_stencil, origin=(3, 3, 0), domain=(1, 1, 3)
+        )
+        same_copy = factory.from_origin_domain(
+            copy_stencil, origin=(3, 3, 0), domain=(1, 1, 3)
+        )
+        add_1 = factory.restrict_vertical(k_start=1).from_origin_domain(
+            add_1_stencil, origin=(2, 2, 1), domain=(2, 2, 2)
+        )
+        assert copy.stencil_object is None
+        assert add_1.stencil_object is None
+        assert plan.n_unique == 2
+    assert not plan.is_open
+    assert factory.compile_plan is None
+    for stencil in (copy, same_copy, add_1):
+        assert stencil.stencil_object is not None
+    q, q_ref = setup_data_vars(backend=backend)
+    add_1(q)
+    q_ref[2:4, 2:4, 1:3] = 2.0
+    np.testing.assert_array_equal(q.data, q_ref.data)
+
+
+def test_planned_compilation_builds_stencils_called_early(backend: str):
+    factory = get_stencil_factory(backend)
+    with factory.planned_compilation(max_workers=2):
+        add_1 = factory.from_origin_domain(
+            add_1_stencil, origin=(2, 2, 0), domain=(1, 1, 3)
+        )
+        q, q_ref = setup_data_vars(backend=backend)
+        add_1(q)
+        assert add_1.stencil_object is not None
+        q_ref[2, 2, :] = 2.0
+        np.testing.assert_array_equal(q.data, q_ref.data)
+    # stencils created after the context are compiled on construction
+    copy = factory.from_origin_domain(copy_stencil, origin=(3, 3, 0), domain=(1, 1, 3))
+    assert copy.stencil_object is not None
+
+
+def test_planned_compilation_single_worker_compiles_on_construction():
+    factory = get_stencil_factory("numpy")
+    with factory.planned_compilation(max_workers=1) as plan:
+        assert plan is None
+        stencil = factory.from_origin_domain(
+            copy_stencil, origin=(3, 3, 0), domain=(1, 1, 3)
+        )
+        assert stencil.stencil_object is not None
+
+
+def test_stencil_factory_reuses_identical_stencils(backend: str):
+    factory = get_stencil_factory(backend)
+    stencil = factory.from_dims_halo(
+        func=copy_stencil,
+        compute_dims=[pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_DIM],
+    )
+    same_stencil = factory.from_dims_halo(
+        func=copy_stencil,
+        compute_dims=[pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_DIM],
+    )
+    halo_stencil = factory.from_dims_halo(
+        func=copy_stencil,
+        compute_dims=[pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_DIM],
+        compute_halos=(1, 1),
+    )
+    restricted_stencil = factory.restrict_vertical().from_dims_halo(
+        func=copy_stencil,
+        compute_dims=[pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_DIM],
+    )
+    assert same_stencil is stencil
+    assert restricted_stencil is stencil
+    assert halo_stencil is not stencil
+    assert "Stencils reused: 2 (of 2 unique stencils)" in factory.build_report()
+
+
+def test_canonical_value_distinguishes_scalar_types():
+    values = [True, 1, 1.0, np.float32(1.0), np.int64(1)]
+    assert len(set(_canonical_value(value) for value in values)) == len(values)
+    assert len(set(_canonical_value({"a": value}) for value in values)) == len(
+        values
+    )
+    assert _canonical_value({"a": [1, 2.0], "b": None}) == _canonical_value(
+        {"b": None, "a": (1, 2.0)}
+    )
@@ -142,6 +142,31 @@ def test_copy_frozen_stencil(
     np.testing.assert_array_equal(q_in, q_out)
 
 
+@pytest.mark.parametrize("validate_args", [True, False])
+def test_bound_frozen_stencil(backend: str, validate_args: bool):
+    config = get_stencil_config(
+        backend=backend, rebuild=False, validate_args=validate_args
+    )
+    stencil = FrozenStencil(
+        copy_stencil,
+        origin=(0, 0, 0),
+        domain=(3, 3, 3),
+        stencil_config=config,
+        externals={},
+    )
+    q_in = make_storage_from_shape((3, 3, 3), backend=backend)
+    q_out = make_storage_from_shape((3, 3, 3), backend=backend)
+    quantity_in = pace.util.Quantity(
+        q_in, dims=[pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_DIM], units="m"
+    )
+    bound_stencil = stencil.bind(quantity_in, q_out=q_out)
+    for value in (1.0, 2.0):
+        # bound arrays are updated in place between calls
+        q_in[:] = value
+        bound_stencil()
+        np.testing.assert_array_equal(q_out, value)
+
+
 @pytest.mark.parametrize("device_sync", [False])
 @pytest.mark.parametrize("rebuild", [False])
 @pytest.mark.parametrize("format_source", [False])
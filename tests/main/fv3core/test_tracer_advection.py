@@ -0,0 +1,198 @@
+import dataclasses
+import unittest.mock
+
+import numpy as np
+import pytest
+
+import pace.dsl.stencil
+import pace.util
+from pace.dsl.dace.dace_config import DaceConfig
+from pace.fv3core.stencils.fvtp2d import FiniteVolumeTransport
+from pace.fv3core.stencils.tracer_2d_1l import TracerAdvection
+from pace.util.grid import (
+    AngleGridData,
+    ContravariantGridData,
+    DampingCoefficients,
+    GridData,
+    HorizontalGridData,
+    MetricTerms,
+    VerticalGridData,
+)
+from pace.util.null_comm import NullComm
+
+
+@pytest.fixture(scope="module")
+def setup():
+    backend = "numpy"
+    layout = (1, 1)
+    mpi_comm = NullComm(rank=0, total_ranks=6, fill_value=0.0)
+    partitioner = pace.util.CubedSpherePartitioner(pace.util.TilePartitioner(layout))
+    communicator = pace.util.CubedSphereCommunicator(mpi_comm, partitioner)
+    sizer = pace.util.SubtileGridSizer.from_tile_params(
+        nx_tile=12,
+        ny_tile=12,
+        nz=79,
+        n_halo=3,
+        extra_dim_lengths={},
+        layout=layout,
+        tile_partitioner=partitioner.tile,
+        tile_rank=communicator.tile.rank,
+    )
+    quantity_factory = pace.util.QuantityFactory.from_backend(
+        sizer=sizer, backend=backend
+    )
+    stencil_factory = pace.dsl.stencil.StencilFactory(
+        config=pace.dsl.stencil.StencilConfig(
+            compilation_config=pace.dsl.stencil.CompilationConfig(
+                backend=backend, rebuild=False, validate_args=True
+            ),
+            dace_config=DaceConfig(communicator=communicator, backend=backend),
+        ),
+        grid_indexing=pace.dsl.stencil.GridIndexing.from_sizer_and_communicator(
+            sizer=sizer, cube=communicator
+        ),
+    )
+    metric_terms = MetricTerms(
+        quantity_factory=quantity_factory, communicator=communicator
+    )
+    return communicator, stencil_factory, quantity_factory, metric_terms
+
+
+def make_tracer_advection(setup, angle_data=None, adaptive_substeps=True):
+    communicator, stencil_factory, quantity_factory, metric_terms = setup
+    if angle_data is None:
+        angle_data = AngleGridData.new_from_metric_terms(metric_terms)
+    grid_data = GridData(
+        horizontal_data=HorizontalGridData.new_from_metric_terms(metric_terms),
+        vertical_data=VerticalGridData.new_from_metric_terms(metric_terms),
+        contravariant_data=ContravariantGridData.new_from_metric_terms(metric_terms),
+        angle_data=angle_data,
+    )
+    transport = FiniteVolumeTransport(
+        stencil_factory=stencil_factory,
+        quantity_factory=quantity_factory,
+        grid_data=grid_data,
+        damping_coefficients=DampingCoefficients.new_from_metric_terms(metric_terms),
+        grid_type=0,
+        hord=8,
+    )
+    tracers = {
+        "qvapor": quantity_factory.zeros(
+            [pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_DIM], units="kg/kg"
+        )
+    }
+    return TracerAdvection(
+        stencil_factory,
+        quantity_factory,
+        transport,
+        grid_data,
+        communicator,
+        tracers,
+        adaptive_substeps=adaptive_substeps,
+    )
+
+
+def get_n_split(setup, courant, remote_cmax):
+    communicator, _, quantity_factory, _ = setup
+    tracer_advection = make_tracer_advection(setup)
+    x_courant = quantity_factory.zeros(
+        [pace.util.X_INTERFACE_DIM, pace.util.Y_DIM, pace.util.Z_DIM], units=""
+    )
+    y_courant = quantity_factory.zeros(
+        [pace.util.X_DIM, pace.util.Y_INTERFACE_DIM, pace.util.Z_DIM], units=""
+    )
+    x_courant.data[:] = courant
+    # stands in for the maximum courant number on all other ranks
+    with unittest.mock.patch.object(
+        communicator.comm,
+        "allreduce",
+        side_effect=lambda value, op: op(value, remote_cmax),
+    ):
+        tracer_advection._compute_cmax(x_courant, y_courant)
+        return tracer_advection._get_n_split()
+
+
+# 1 - sin_sg5 is at most about 0.15 on a cubed sphere at this resolution
+@pytest.mark.parametrize("courant, n_split", [(0.0, 1), (0.3, 1), (1.5, 2), (2.2, 3)])
+def test_adaptive_substeps(setup, courant, n_split):
+    assert get_n_split(setup, courant, remote_cmax=0.0) == n_split
+
+
+def test_adaptive_substeps_reduced_across_ranks(setup):
+    assert get_n_split(setup, courant=0.3, remote_cmax=3.5) == 4
+
+
+def test_adaptive_substeps_requires_sin_sg5(setup):
+    _, _, _, metric_terms = setup
+    angle_data = dataclasses.replace(
+        AngleGridData.new_from_metric_terms(metric_terms), sin_sg5=None
+    )
+    with pytest.raises(ValueError):
+        make_tracer_advection(setup, angle_data=angle_data)
+    make_tracer_advection(setup, angle_data=angle_data, adaptive_substeps=False)
+
+
+def make_inputs(quantity_factory, n_tracers=1, seed=0):
+    random = np.random.default_rng(seed)
+    x_interface = [pace.util.X_INTERFACE_DIM, pace.util.Y_DIM, pace.util.Z_DIM]
+    y_interface = [pace.util.X_DIM, pace.util.Y_INTERFACE_DIM, pace.util.Z_DIM]
+    center = [pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_DIM]
+    inputs = {
+        "tracers": {
+            f"tracer_{i}": quantity_factory.zeros(center, units="kg/kg")
+            for i in range(n_tracers)
+        },
+        "dp1": quantity_factory.zeros(center, units="Pa"),
+        "x_mass_flux": quantity_factory.zeros(x_interface, units=""),
+        "y_mass_flux": quantity_factory.zeros(y_interface, units=""),
+        "x_courant": quantity_factory.zeros(x_interface, units=""),
+        "y_courant": quantity_factory.zeros(y_interface, units=""),
+    }
+    if seed is not None:
+        for tracer in inputs["tracers"].values():
+            tracer.data[:] = random.uniform(0.0, 1e-2, size=tracer.data.shape)
+        for name in ("x_courant", "y_courant"):
+            data = inputs[name].data
+            data[:] = random.uniform(-0.4, 0.4, size=data.shape)
+        for name in ("x_mass_flux", "y_mass_flux"):
+            data = inputs[name].data
+            data[:] = random.uniform(-1e9, 1e9, size=data.shape)
+    inputs["dp1"].data[:] = 100.0
+    return inputs
+
+
+def test_adaptive_substeps_call(setup):
+    communicator, _, quantity_factory, _ = setup
+    tracer_advection = make_tracer_advection(setup)
+    inputs = make_inputs(quantity_factory, seed=None)
+    # in calm conditions a single substep is taken
+    with unittest.mock.patch.object(
+        tracer_advection,
+        "_apply_mass_flux",
+        wraps=tracer_advection._apply_mass_flux,
+    ) as apply_mass_flux, unittest.mock.patch.object(
+        communicator.comm, "allreduce", side_effect=lambda value, op: value
+    ):
+        tracer_advection(**inputs)
+    assert apply_mass_flux.call_count == 1
+
+
+def test_fused_tracer_update_matches_separate_flux_computation(setup):
+    communicator, _, quantity_factory, _ = setup
+    fused = make_tracer_advection(setup)
+    separate = make_tracer_advection(setup)
+    separate._fuse_tracer_update = False
+    fused_inputs = make_inputs(quantity_factory, n_tracers=2)
+    separate_inputs = make_inputs(quantity_factory, n_tracers=2)
+    # a single substep, as values in the corners of the halo of the test grid
+    # are not valid and contaminate the domain on later substeps
+    with unittest.mock.patch.object(
+        communicator.comm, "allreduce", side_effect=lambda value, op: value
+    ):
+        fused(**fused_inputs)
+        separate(**separate_inputs)
+    for name, tracer in fused_inputs["tracers"].items():
+        assert np.isfinite(tracer.view[:]).any()
+        np.testing.assert_array_equal(
+            tracer.view[:], separate_inputs["tracers"][name].view[:]
+        )
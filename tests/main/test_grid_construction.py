@@ -0,0 +1,328 @@
+import unittest.mock
+
+import numpy as np
+import pytest
+
+import pace.util
+from pace.util.constants import PI, RADIUS
+from pace.util.grid import MetricTerms
+from pace.util.grid.gnomonic import _cart_to_latlon
+from pace.util.grid.mirror import _rot_3d, mirror_grid
+
+
+# reference implementation looping over every point, which the vectorized
+# mirror_grid must reproduce bit-for-bit
+
+
+def mirror_grid_loop(
+    mirror_data,
+    tile_index,
+    npx,
+    npy,
+    x_subtile_width,
+    y_subtile_width,
+    global_is,
+    global_js,
+    ng,
+    np,
+    right_hand_grid,
+):
+    istart = ng
+    iend = ng + x_subtile_width
+    jstart = ng
+    jend = ng + y_subtile_width
+    x_center_tile = (
+        global_is <= ng + (npx - 1) / 2
+        and global_is + x_subtile_width > ng + (npx - 1) / 2
+    )
+    y_center_tile = (
+        global_js <= ng + (npy - 1) / 2
+        and global_js + y_subtile_width > ng + (npy - 1) / 2
+    )
+
+    i_mid = npx // 2 - global_is + istart
+    j_mid = npy // 2 - global_js + jstart
+
+    # first fix base region
+    for j in range(jstart, jend + 1):
+        for i in range(istart, iend + 1):
+
+            iend_domain = iend - 1 + ng
+            jend_domain = jend - 1 + ng
+            x1 = np.multiply(
+                0.25,
+                np.abs(mirror_data["local"][i, j, 0])
+                + np.abs(mirror_data["east-west"][iend_domain - i, j, 0])
+                + np.abs(mirror_data["north-south"][i, jend_domain - j, 0])
+                + np.abs(mirror_data["diagonal"][iend_domain - i, jend_domain - j, 0]),
+            )
+            mirror_data["local"][i, j, 0] = np.copysign(
+                x1, mirror_data["local"][i, j, 0]
+            )
+
+            y1 = np.multiply(
+                0.25,
+                np.abs(mirror_data["local"][i, j, 1])
+                + np.abs(mirror_data["east-west"][iend_domain - i, j, 1])
+                + np.abs(mirror_data["north-south"][i, jend_domain - j, 1])
+                + np.abs(mirror_data["diagonal"][iend_domain - i, jend_domain - j, 1]),
+            )
+
+            mirror_data["local"][i, j, 1] = np.copysign(
+                y1, mirror_data["local"][i, j, 1]
+            )
+
+            # force dateline/greenwich-meridion consistency
+            if npx % 2 != 0:
+                if x_center_tile and i == ng + i_mid:
+                    mirror_data["local"][i, j, 0] = 0.0
+                    mirror_data["north-south"][i, -(j + 1), 0] = 0
+
+    if tile_index > 0:
+
+        for j in range(jstart, jend + 1):
+            x1 = mirror_data["local"][istart : iend + 1, j, 0]
+            y1 = mirror_data["local"][istart : iend + 1, j, 1]
+            z1 = np.add(RADIUS, np.multiply(0.0, x1))
+
+            if tile_index == 1:
+                ang = -90.0
+                x2, y2, z2 = _rot_3d(
+                    3,
+                    [x1, y1, z1],
+                    ang,
+                    np,
+                    right_hand_grid,
+                    degrees=True,
+                    convert=True,
+                )
+            elif tile_index == 2:
+                ang = -90.0
+                x2, y2, z2 = _rot_3d(
+                    3,
+                    [x1, y1, z1],
+                    ang,
+                    np,
+                    right_hand_grid,
+                    degrees=True,
+                    convert=True,
+                )
+                ang = 90.0
+                x2, y2, z2 = _rot_3d(
+                    1,
+                    [x2, y2, z2],
+                    ang,
+                    np,
+                    right_hand_grid,
+                    degrees=True,
+                    convert=True,
+                )
+
+                # force North Pole and dateline/Greenwich-Meridian consistency
+                if npx % 2 != 0:
+                    if (
+                        j == ng + j_mid
+                        and x_center_tile
+                        and y_center_tile
+                        and i_mid == j_mid
+                    ):
+                        x2[i_mid] = 0.0
+                        y2[i_mid] = PI / 2.0
+                    if j == ng + j_mid and y_center_tile:
+                        if x_center_tile:
+                            x2[: i_mid + 1] = 0.0
+                            x2[i_mid + 1 :] = PI
+                        elif global_is + i_mid < ng + (npx - 1) / 2:
+                            x2[:] = 0.0
+                        elif global_is + i_mid > ng + (npx - 1) / 2:
+                            x2[:] = PI
+            elif tile_index == 3:
+                ang = -180.0
+                x2, y2, z2 = _rot_3d(
+                    3,
+                    [x1, y1, z1],
+                    ang,
+                    np,
+                    right_hand_grid,
+                    degrees=True,
+                    convert=True,
+                )
+                ang = 90.0
+                x2, y2, z2 = _rot_3d(
+                    1,
+                    [x2, y2, z2],
+                    ang,
+                    np,
+                    right_hand_grid,
+                    degrees=True,
+                    convert=True,
+                )
+                # force dateline/Greenwich-Meridian consistency
+                if npx % 2 != 0:
+                    if j == ng + j_mid and y_center_tile:
+                        x2[:] = PI
+            elif tile_index == 4:
+                ang = 90.0
+                x2, y2, z2 = _rot_3d(
+                    3,
+                    [x1, y1, z1],
+                    ang,
+                    np,
+                    right_hand_grid,
+                    degrees=True,
+                    convert=True,
+                )
+                ang = 90.0
+                x2, y2, z2 = _rot_3d(
+                    2,
+                    [x2, y2, z2],
+                    ang,
+                    np,
+                    right_hand_grid,
+                    degrees=True,
+                    convert=True,
+                )
+            elif tile_index == 5:
+                ang = 90.0
+                x2, y2, z2 = _rot_3d(
+                    2,
+                    [x1, y1, z1],
+                    ang,
+                    np,
+                    right_hand_grid,
+                    degrees=True,
+                    convert=True,
+                )
+                ang = 0.0
+                x2, y2, z2 = _rot_3d(
+                    3,
+                    [x2, y2, z2],
+                    ang,
+                    np,
+                    right_hand_grid,
+                    degrees=True,
+                    convert=True,
+                )
+                # force South Pole and dateline/Greenwich-Meridian consistency
+                if npx % 2 != 0:
+                    if (
+                        i == ng + i_mid
+                        and x_center_tile
+                        and y_center_tile
+                        and i_mid == j_mid
+                    ):
+                        x2[i_mid] = 0.0
+                        y2[i_mid] = -PI / 2.0
+                    if global_js + j_mid > ng + (npy - 1) / 2 and x_center_tile:
+                        x2[i_mid] = 0.0
+                    elif global_js + j_mid < ng + (npy - 1) / 2 and x_center_tile:
+                        x2[i_mid] = PI
+
+            mirror_data["local"][istart : iend + 1, j, 0] = x2
+            mirror_data["local"][istart : iend + 1, j, 1] = y2
+
+
+def get_metric_terms(nx_tile, layout, rank):
+    communicator = pace.util.CubedSphereCommunicator(
+        comm=pace.util.NullComm(rank=rank, total_ranks=6 * layout[0] * layout[1]),
+        partitioner=pace.util.CubedSpherePartitioner(
+            pace.util.TilePartitioner(layout=layout)
+        ),
+    )
+    quantity_factory = pace.util.QuantityFactory(
+        sizer=pace.util.SubtileGridSizer(
+            nx=nx_tile // layout[0],
+            ny=nx_tile // layout[1],
+            nz=5,
+            n_halo=3,
+            extra_dim_lengths={},
+        ),
+        numpy=np,
+    )
+    return MetricTerms(quantity_factory=quantity_factory, communicator=communicator)
+
+
+@pytest.mark.parametrize(
+    "nx_tile, layout, rank",
+    [pytest.param(12, (1, 1), rank, id=f"odd_npx_1x1_tile{rank}") for rank in range(6)]
+    + [
+        pytest.param(9, (1, 1), rank, id=f"even_npx_1x1_tile{rank}")
+        for rank in range(6)
+    ]
+    + [
+        # center and edge subtiles of the tiles with pole corrections
+        pytest.param(12, (3, 3), rank, id=f"odd_npx_3x3_rank{rank}")
+        for rank in (18, 22, 26, 45, 49, 53)
+    ]
+    + [pytest.param(12, (2, 2), rank, id=f"odd_npx_2x2_rank{rank}") for rank in (9, 21)]
+    + [
+        pytest.param(9, (3, 3), rank, id=f"even_npx_3x3_rank{rank}")
+        for rank in (22, 49)
+    ],
+)
+def test_mirror_grid_matches_loop(nx_tile, layout, rank):
+    with unittest.mock.patch(
+        "pace.util.grid.generation.mirror_grid", new=mirror_grid_loop
+    ):
+        reference = get_metric_terms(nx_tile, layout, rank).grid.data
+    result = get_metric_terms(nx_tile, layout, rank).grid.data
+    np.testing.assert_array_equal(result, reference)
+
+
+def get_mirror_args(nx_tile, tile_index):
+    ng = 3
+    shape = (nx_tile + 1 + 2 * ng, nx_tile + 1 + 2 * ng, 2)
+    random = np.random.default_rng(0)
+    mirror_data = {
+        name: random.uniform(-PI / 2, PI / 2, size=shape)
+        for name in ("local", "east-west", "north-south", "diagonal")
+    }
+    kwargs = dict(
+        tile_index=tile_index,
+        npx=nx_tile + 1,
+        npy=nx_tile + 1,
+        x_subtile_width=nx_tile + 1,
+        y_subtile_width=nx_tile + 1,
+        global_is=ng,
+        global_js=ng,
+        ng=ng,
+        np=np,
+        right_hand_grid=False,
+    )
+    return mirror_data, kwargs
+
+
+@pytest.mark.parametrize("nx_tile", [48, 96, 192])
+def test_mirror_grid_matches_loop_large_tile(nx_tile):
+    results = {}
+    for name, func in (("vectorized", mirror_grid), ("loop", mirror_grid_loop)):
+        mirror_data, kwargs = get_mirror_args(nx_tile, tile_index=2)
+        func(mirror_data=mirror_data, **kwargs)
+        results[name] = mirror_data
+    for key in results["loop"]:
+        np.testing.assert_array_equal(results["vectorized"][key], results["loop"][key])
+
+
+def test_cart_to_latlon_matches_loop():
+    im = 20
+    q = np.random.default_rng(0).normal(size=(3, im + 1, im + 1))
+    # points on the z axis have zero longitude
+    q[:2, 0, 0] = 0.0
+    lon, lat = np.zeros((im + 1, im + 1)), np.zeros((im + 1, im + 1))
+    q_result = q.copy()
+    _cart_to_latlon(im, q_result, lon, lat, np)
+    for j in range(im):
+        for i in range(im):
+            p = q[:, i, j]
+            p = p / np.sqrt(p[0] ** 2 + p[1] ** 2 + p[2] ** 2)
+            if np.abs(p[0]) + np.abs(p[1]) < 1.0e-10:
+                expected_lon = 0.0
+            else:
+                expected_lon = np.arctan2(p[1], p[0])
+            if expected_lon < 0.0:
+                expected_lon = np.add(2.0 * PI, expected_lon)
+            assert lon[i, j] == expected_lon
+            assert lat[i, j] == np.arcsin(p[2])
+            np.testing.assert_array_equal(q_result[:, i, j], p)
+    # the last row and column are not converted
+    assert np.all(lon[im, :] == 0.0) and np.all(lon[:, im] == 0.0)
@@ -1,3 +1,5 @@
+import unittest.mock
+
 import numpy as np
 import pytest
 
@@ -99,3 +101,66 @@ def allclose(
     if not all_same:
         print(np.sum(~same), np.where(~same))
     return all_same
+
+
+def get_metric_terms(layout=(1, 1), rank=0):
+    return MetricTerms(
+        quantity_factory=get_quantity_factory(
+            layout=layout, nx_tile=12, ny_tile=12, nz=5
+        ),
+        communicator=get_cube_comm(rank=rank, layout=layout),
+    )
+
+
+@pytest.mark.parametrize("rank", [0, 4])
+def test_compute_matches_access_on_demand(rank: int):
+    names = ["rarea", "rarea_c", "rdx", "rdya", "rdxc", "divg_u", "del6_v", "da_min"]
+    metric_terms = get_metric_terms(layout=(2, 2), rank=rank)
+    metric_terms.compute(names)
+    reference = get_metric_terms(layout=(2, 2), rank=rank)
+    for name in names:
+        value = getattr(metric_terms, name)
+        reference_value = getattr(reference, name)
+        # vectorized trigonometric functions can differ in the last bit
+        # depending on memory alignment, so results are not bit-reproducible
+        if isinstance(value, pace.util.Quantity):
+            np.testing.assert_allclose(value.data, reference_value.data, rtol=1e-12)
+        else:
+            assert value == pytest.approx(reference_value, rel=1e-12)
+
+
+def test_compute_batches_halo_updates():
+    metric_terms = get_metric_terms()
+    communicator = metric_terms._comm
+    with unittest.mock.patch.object(
+        communicator, "start_halo_update", wraps=communicator.start_halo_update
+    ) as start_halo_update, unittest.mock.patch.object(
+        communicator,
+        "start_vector_halo_update",
+        wraps=communicator.start_vector_halo_update,
+    ) as start_vector_halo_update:
+        metric_terms.compute(["rarea", "rarea_c", "rdxa", "divg_u"])
+    # area and area_c are exchanged together
+    assert start_halo_update.call_count == 1
+    # dx, dxa and dxc are exchanged together, then divg and del6
+    assert start_vector_halo_update.call_count == 2
+    with unittest.mock.patch.object(
+        communicator, "start_vector_halo_update"
+    ) as start_vector_halo_update:
+        metric_terms.compute(["dx", "del6_v"])
+    assert start_vector_halo_update.call_count == 0
+
+
+def test_compute_only_dependencies():
+    metric_terms = get_metric_terms()
+    metric_terms.compute(["rdx", "cos_sg1"])
+    assert metric_terms._dx is not None
+    assert metric_terms._cos_sg1 is not None
+    assert metric_terms._dx_center is None
+    assert metric_terms._area is None
+    assert metric_terms._divg_u is None
+
+
+def test_compute_unknown_term():
+    with pytest.raises(ValueError):
+        get_metric_terms().compute(["not_a_term"])
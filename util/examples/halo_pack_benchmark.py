@@ -0,0 +1,147 @@
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+import pace.util
+from pace.util import _boundary_utils
+from pace.util.halo_data_transformer import HaloDataTransformer, HaloExchangeSpec
+from pace.util.quantity import QuantityHaloSpec
+from pace.util.rotate import rotate_vector_data
+
+
+DIRECTIONS = [
+    pace.util.NORTH,
+    pace.util.NORTHWEST,
+    pace.util.WEST,
+    pace.util.SOUTHWEST,
+    pace.util.SOUTH,
+    pace.util.SOUTHEAST,
+    pace.util.EAST,
+    pace.util.NORTHEAST,
+]
+
+
+def get_exchange_descriptors(quantity, n_halo, rotation):
+    specification = QuantityHaloSpec(
+        n_points=n_halo,
+        shape=quantity.data.shape,
+        strides=quantity.data.strides,
+        itemsize=quantity.data.itemsize,
+        origin=quantity.origin,
+        extent=quantity.extent,
+        dims=quantity.dims,
+        numpy_module=np,
+        dtype=quantity.data.dtype,
+    )
+    descriptors = []
+    for direction in DIRECTIONS:
+        slices = [
+            _boundary_utils.get_boundary_slice(
+                quantity.dims,
+                quantity.origin,
+                quantity.extent,
+                quantity.data.shape,
+                direction,
+                n_halo,
+                interior=interior,
+            )
+            for interior in (True, False)
+        ]
+        descriptors.append(
+            HaloExchangeSpec(specification, slices[0], rotation, slices[1])
+        )
+    return descriptors
+
+
+def pack_by_rotating(data_transformer, quantities_x, quantities_y):
+    """Pack as done before rotated views were described at compile time,
+    by rotating each slice then flattening it into the buffer."""
+    offset = 0
+    for quantity_x, quantity_y, info_x, info_y in zip(
+        quantities_x, quantities_y, data_transformer._infos_x, data_transformer._infos_y
+    ):
+        x_view, y_view = rotate_vector_data(
+            quantity_x.data[info_x.pack_slices],
+            quantity_y.data[info_y.pack_slices],
+            -info_x.pack_clockwise_rotation,
+            quantity_x.dims,
+            np,
+        )
+        for view in (x_view, y_view):
+            data_transformer._pack_buffer.assign_from(
+                view.flatten(), buffer_slice=np.index_exp[offset : offset + view.size]
+            )
+            offset += view.size
+
+
+def run_benchmark(quantity_x, quantity_y, n_halo, rotation, n_exchanges, rotate):
+    descriptors = get_exchange_descriptors(quantity_x, n_halo, rotation)
+    data_transformer = HaloDataTransformer.get(np, descriptors, descriptors)
+    quantities_x = [quantity_x] * len(descriptors)
+    quantities_y = [quantity_y] * len(descriptors)
+
+    def exchange():
+        if rotate:
+            pack_by_rotating(data_transformer, quantities_x, quantities_y)
+        else:
+            data_transformer.async_pack(quantities_x, quantities_y)
+        data_transformer.get_unpack_buffer().assign_from(
+            data_transformer.get_pack_buffer().array
+        )
+        data_transformer.async_unpack(quantities_x, quantities_y)
+        data_transformer.synchronize()
+
+    exchange()
+    tracemalloc.start()
+    exchange()
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for _ in range(n_exchanges):
+        exchange()
+    elapsed = time.perf_counter() - start
+    data_transformer.finalize()
+    return n_exchanges / elapsed, peak_bytes
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="compare CPU vector halo pack/unpack throughput when "
+        "rotating slices on every pack and with views described at compile time"
+    )
+    parser.add_argument("--n-points", type=int, default=192)
+    parser.add_argument("--nz", type=int, default=79)
+    parser.add_argument("--n-halo", type=int, default=3)
+    parser.add_argument("--rotation", type=int, default=-1)
+    parser.add_argument("--n-exchanges", type=int, default=100)
+    args = parser.parse_args()
+
+    sizer = pace.util.SubtileGridSizer(
+        nx=args.n_points,
+        ny=args.n_points,
+        nz=args.nz,
+        n_halo=args.n_halo,
+        extra_dim_lengths={},
+    )
+    quantity_factory = pace.util.QuantityFactory(sizer, np)
+    dims = [pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_DIM]
+    quantity_x = quantity_factory.zeros(dims, units="m/s")
+    quantity_y = quantity_factory.zeros(dims, units="m/s")
+    quantity_x.data[:] = np.random.randn(*quantity_x.data.shape)
+    quantity_y.data[:] = np.random.randn(*quantity_y.data.shape)
+
+    for label, rotate in [("rotate and flatten", True), ("compiled views", False)]:
+        exchanges_per_second, peak_bytes = run_benchmark(
+            quantity_x,
+            quantity_y,
+            args.n_halo,
+            args.rotation,
+            args.n_exchanges,
+            rotate,
+        )
+        print(
+            f"{label}: {exchanges_per_second:.1f} exchanges/s, "
+            f"{peak_bytes / 2 ** 20:.2f} MiB peak temporary memory per exchange"
+        )
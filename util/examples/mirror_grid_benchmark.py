@@ -0,0 +1,57 @@
+import argparse
+import time
+
+import numpy as np
+
+from pace.util.constants import PI
+from pace.util.grid.mirror import mirror_grid
+
+
+N_HALO = 3
+
+
+def get_mirror_args(nx_tile, tile_index):
+    shape = (nx_tile + 1 + 2 * N_HALO, nx_tile + 1 + 2 * N_HALO, 2)
+    random = np.random.default_rng(0)
+    mirror_data = {
+        name: random.uniform(-PI / 2, PI / 2, size=shape)
+        for name in ("local", "east-west", "north-south", "diagonal")
+    }
+    kwargs = dict(
+        tile_index=tile_index,
+        npx=nx_tile + 1,
+        npy=nx_tile + 1,
+        x_subtile_width=nx_tile + 1,
+        y_subtile_width=nx_tile + 1,
+        global_is=N_HALO,
+        global_js=N_HALO,
+        ng=N_HALO,
+        np=np,
+        right_hand_grid=False,
+    )
+    return mirror_data, kwargs
+
+
+def run_benchmark(nx_tile, n_repeats):
+    """Returns the mean time in seconds to mirror the grid of every tile."""
+    total = 0.0
+    for _ in range(n_repeats):
+        for tile_index in range(6):
+            mirror_data, kwargs = get_mirror_args(nx_tile, tile_index)
+            start = time.perf_counter()
+            mirror_grid(mirror_data=mirror_data, **kwargs)
+            total += time.perf_counter() - start
+    return total / n_repeats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="time mirroring the grid of all six tiles as the tile grows"
+    )
+    parser.add_argument("--nx-tile", type=int, nargs="+", default=[48, 96, 192])
+    parser.add_argument("--n-repeats", type=int, default=5)
+    args = parser.parse_args()
+
+    for nx_tile in args.nx_tile:
+        seconds = run_benchmark(nx_tile, args.n_repeats)
+        print(f"nx_tile={nx_tile}: {seconds:.4f}s")
@@ -0,0 +1,109 @@
+import argparse
+import copy
+
+import numpy as np
+from mpi4py import MPI
+
+import pace.util
+from pace.util.testing import halo_transfer_error
+
+
+def get_halo_spec(quantity, n_halo):
+    return pace.util.QuantityHaloSpec(
+        n_points=n_halo,
+        shape=quantity.data.shape,
+        strides=quantity.data.strides,
+        itemsize=quantity.data.itemsize,
+        origin=quantity.origin,
+        extent=quantity.extent,
+        dims=quantity.dims,
+        numpy_module=np,
+        dtype=quantity.data.dtype,
+    )
+
+
+def halo_update(communicator, quantity, n_halo, transfer_dtype):
+    """Update the halo of quantity, returning the bytes sent by this rank."""
+    updater = communicator.get_scalar_halo_updater(
+        [get_halo_spec(quantity, n_halo)], transfer_dtype=transfer_dtype
+    )
+    updater.update([quantity])
+    return sum(
+        transformer.get_pack_buffer().array.nbytes
+        for transformer in updater._transformers.values()
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="measure the error and message size of halo updates sent "
+        "in a reduced precision transfer dtype, run on a multiple of 6 ranks"
+    )
+    parser.add_argument("--n-points", type=int, default=48)
+    parser.add_argument("--nz", type=int, default=79)
+    parser.add_argument("--n-halo", type=int, default=3)
+    parser.add_argument("--transfer-dtype", type=str, default="float32")
+    parser.add_argument("--mean", type=float, default=280.0)
+    parser.add_argument("--std", type=float, default=20.0)
+    args = parser.parse_args()
+
+    comm = MPI.COMM_WORLD
+    ranks_per_edge = int((comm.Get_size() // 6) ** 0.5)
+    communicator = pace.util.CubedSphereCommunicator.from_layout(
+        comm=pace.util.MPIComm(), layout=(ranks_per_edge, ranks_per_edge)
+    )
+    sizer = pace.util.SubtileGridSizer(
+        nx=args.n_points // ranks_per_edge,
+        ny=args.n_points // ranks_per_edge,
+        nz=args.nz,
+        n_halo=args.n_halo,
+        extra_dim_lengths={},
+    )
+    quantity_factory = pace.util.QuantityFactory(sizer, np)
+    quantity = quantity_factory.zeros(
+        [pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_DIM], units="degK"
+    )
+    quantity.view[:] = np.random.default_rng(comm.Get_rank()).normal(
+        loc=args.mean, scale=args.std, size=quantity.extent
+    )
+    reduced_quantity = copy.deepcopy(quantity)
+    transfer_dtype = np.dtype(args.transfer_dtype).type
+
+    expected = halo_transfer_error(quantity, args.n_halo, transfer_dtype)
+    full_bytes = halo_update(communicator, quantity, args.n_halo, None)
+    reduced_bytes = halo_update(
+        communicator, reduced_quantity, args.n_halo, transfer_dtype
+    )
+    difference = np.abs(reduced_quantity.data - quantity.data)
+    with np.errstate(invalid="ignore"):
+        # corner halo points are never updated and are zero
+        relative = pace.util.testing.compare_arr(
+            reduced_quantity.data, quantity.data
+        )
+
+    results = comm.gather(
+        (
+            expected.max_absolute,
+            expected.max_relative,
+            float(np.max(difference)),
+            float(np.max(relative)),
+            full_bytes,
+            reduced_bytes,
+        ),
+        root=0,
+    )
+    if comm.Get_rank() == 0:
+        results = np.asarray(results)
+        print(
+            f"max absolute error: {results[:, 2].max():.3e} "
+            f"(expected from sent data {results[:, 0].max():.3e})"
+        )
+        print(
+            f"max relative error: {results[:, 3].max():.3e} "
+            f"(expected from sent data {results[:, 1].max():.3e})"
+        )
+        print(
+            f"bytes sent per rank: {results[:, 4].mean():.0f} in "
+            f"{quantity.data.dtype}, {results[:, 5].mean():.0f} in "
+            f"{np.dtype(transfer_dtype)}"
+        )
@@ -0,0 +1,83 @@
+import argparse
+import os
+import shutil
+import time
+from datetime import timedelta
+
+import cftime
+import numpy as np
+import zarr
+from mpi4py import MPI
+
+import pace.util
+
+
+OUTPUT_DIR = "output"
+
+
+def get_example_state(allocator, time, n_variables):
+    state = {"time": time}
+    for i in range(n_variables):
+        quantity = allocator.zeros(
+            [pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_DIM], units="degK"
+        )
+        quantity.view[:] = np.random.randn(*quantity.extent)
+        state[f"var{i}"] = quantity
+    return state
+
+
+def run_benchmark(comm, layout, n_steps, n_variables, time_block_size):
+    path = os.path.join(OUTPUT_DIR, f"benchmark_{time_block_size}.zarr")
+    if comm.Get_rank() == 0 and os.path.exists(path):
+        shutil.rmtree(path)
+    comm.barrier()
+    sizer = pace.util.SubtileGridSizer(
+        nx=48, ny=48, nz=70, n_halo=3, extra_dim_lengths={}
+    )
+    allocator = pace.util.QuantityFactory(sizer, np)
+    partitioner = pace.util.CubedSpherePartitioner(pace.util.TilePartitioner(layout))
+    monitor = pace.util.ZarrMonitor(
+        zarr.storage.DirectoryStore(path),
+        partitioner,
+        mpi_comm=comm,
+        time_block_size=time_block_size,
+        n_times=n_steps if time_block_size is not None else None,
+    )
+    model_time = cftime.DatetimeJulian(2020, 1, 1)
+    state = get_example_state(allocator, model_time, n_variables)
+    comm.barrier()
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        state["time"] = model_time
+        monitor.store(state)
+        model_time += timedelta(hours=1)
+    monitor.cleanup()
+    comm.barrier()
+    elapsed = time.perf_counter() - start
+    return n_steps / comm.allreduce(elapsed, op=MPI.MAX)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="compare ZarrMonitor write throughput with and without "
+        "blocked time allocation"
+    )
+    parser.add_argument("--n-steps", type=int, default=20)
+    parser.add_argument("--n-variables", type=int, default=10)
+    parser.add_argument("--time-block-size", type=int, default=16)
+    args = parser.parse_args()
+
+    comm = MPI.COMM_WORLD
+    # assume square tile faces
+    ranks_per_edge = int((comm.Get_size() // 6) ** 0.5)
+    layout = (ranks_per_edge, ranks_per_edge)
+
+    for label, time_block_size in [
+        ("resize every step", None),
+        (f"blocks of {args.time_block_size}", args.time_block_size),
+    ]:
+        steps_per_second = run_benchmark(
+            comm, layout, args.n_steps, args.n_variables, time_block_size
+        )
+        if comm.Get_rank() == 0:
+            print(f"{label}: {steps_per_second:.2f} steps/s")
@@ -17,7 +17,7 @@ from .checkpointer import (
     ThresholdCalibrationCheckpointer,
     ValidationCheckpointer,
 )
-from .comm import Comm, Request
+from .comm import Comm, PersistentRequest, Request
 from .communicator import Communicator, CubedSphereCommunicator, TileCommunicator
 from .constants import (
     BOUNDARY_TYPES,
@@ -50,11 +50,11 @@ from .constants import (
 )
 from .filesystem import get_fs
 from .halo_data_transformer import QuantityHaloSpec
-from .halo_updater import HaloUpdater, HaloUpdateRequest
-from .initialization import GridSizer, QuantityFactory, SubtileGridSizer
+from .halo_updater import HaloUpdater, HaloUpdaterBatch, HaloUpdateRequest
+from .initialization import GridSizer, QuantityArena, QuantityFactory, SubtileGridSizer
 from .io import read_state, write_state
 from .local_comm import LocalComm
-from .monitor import Monitor, NetCDFMonitor, ZarrMonitor
+from .monitor import Monitor, NetCDFMonitor, VariableEncoding, ZarrMonitor
 from .mpi import MPIComm
 from .namelist import Namelist, NamelistDefaults
 from .nudging import apply_nudging, get_nudging_tendencies
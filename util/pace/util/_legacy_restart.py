@@ -1,12 +1,13 @@
+import concurrent.futures
 import copy
 import os
-from typing import BinaryIO, Generator, Iterable
+from typing import BinaryIO, Generator, Iterable, Optional
 
 from . import _xarray as xr
 from . import constants, filesystem, io
 from ._properties import RESTART_PROPERTIES, RestartProperties
 from .communicator import CubedSphereCommunicator
-from .partitioner import get_tile_index
+from .partitioner import Partitioner, get_tile_index
 from .quantity import Quantity
 
 
@@ -24,6 +25,8 @@ def open_restart(
     only_names: Iterable[str] = None,
     to_state: dict = None,
     tracer_properties: RestartProperties = None,
+    parallel_read: bool = False,
+    max_workers: Optional[int] = None,
 ):
     """Load restart files output by the Fortran model into a state dictionary.
 
@@ -34,6 +37,15 @@ def open_restart(
         only_names (optional): list of standard names to load
         to_state (optional): if given, assign loaded data into pre-allocated quantities
             in this state dictionary
+        tracer_properties (optional): restart properties of tracers to load in
+            addition to the default restart properties
+        parallel_read (optional): if True, every rank reads only its own subtile
+            from the restart files instead of the tile root reading the full tile
+            and scattering it, which avoids communication and keeps peak memory
+            proportional to the subtile size. Default is False.
+        max_workers (optional): maximum number of restart files to read
+            concurrently when parallel_read is True, by default uses the
+            concurrent.futures default
 
     Returns:
         state: model state dictionary
@@ -44,6 +56,18 @@ def open_restart(
         restart_properties = {**tracer_properties, **RESTART_PROPERTIES}
     rank = communicator.rank
     tile_index = communicator.partitioner.tile_index(rank)
+    if parallel_read:
+        return _open_restart_subtile(
+            dirname,
+            tile_index,
+            communicator.partitioner.tile,
+            rank - communicator.partitioner.tile_root_rank(rank),
+            label=label,
+            restart_properties=restart_properties,
+            only_names=only_names,
+            to_state=to_state,
+            max_workers=max_workers,
+        )
     state = {}
     if communicator.tile.rank == constants.ROOT_RANK:
         filenames = restart_filenames(dirname, tile_index, label)
@@ -69,6 +93,56 @@ def open_restart(
     return state
 
 
+def _open_restart_subtile(
+    dirname: str,
+    tile_index: int,
+    partitioner: Partitioner,
+    rank: int,
+    label: str,
+    restart_properties: RestartProperties,
+    only_names: Optional[Iterable[str]],
+    to_state: Optional[dict],
+    max_workers: Optional[int],
+):
+    """Load the subtile of the given tile rank from restart files, reading the
+    restart files concurrently."""
+    filenames = restart_filenames(dirname, tile_index, label)
+    if len(filenames) == 0:
+        raise ValueError("no restart files found at {}".format(dirname))
+
+    def load(filename):
+        with filesystem.open(filename, "rb") as file:
+            return load_partial_state_from_restart_file(
+                file,
+                restart_properties,
+                only_names=only_names,
+                partitioner=partitioner,
+                rank=rank,
+            )
+
+    state = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for partial_state in executor.map(load, filenames):
+            state.update(partial_state)
+    coupler_res_filename = get_coupler_res_filename(dirname, label)
+    if filesystem.is_file(coupler_res_filename):
+        if only_names is None or "time" in only_names:
+            with filesystem.open(coupler_res_filename, "r") as f:
+                state["time"] = io.get_current_date_from_coupler_res(f)
+    # match the outputs of scatter_state
+    if to_state is None:
+        to_state = {}
+    for name, value in state.items():
+        if name == "time":
+            continue
+        if name in to_state:
+            to_state[name].view[:] = to_state[name].np.asarray(value.view[:])
+        else:
+            to_state[name] = value
+    to_state["time"] = state.get("time", None)
+    return to_state
+
+
 def get_coupler_res_filename(dirname, label):
     return os.path.join(dirname, prepend_label(COUPLER_RES_NAME, label))
 
@@ -144,8 +218,22 @@ def prepend_label(filename, label=None):
 
 
 def load_partial_state_from_restart_file(
-    file, restart_properties: RestartProperties, only_names=None
+    file,
+    restart_properties: RestartProperties,
+    only_names=None,
+    partitioner: Optional[Partitioner] = None,
+    rank: Optional[int] = None,
 ):
+    """Load the variables with restart metadata from a restart file.
+
+    Args:
+        file: restart file object
+        restart_properties: restart metadata of variables to load
+        only_names (optional): list of standard names to load
+        partitioner (optional): if given with rank, load only the subtile of the
+            given rank from the file
+        rank (optional): rank of the subtile to load
+    """
     ds = xr.open_dataset(file).isel(Time=0).drop_vars("Time")
     state = map_keys(ds.data_vars, _get_restart_standard_names(restart_properties))
     state = _apply_restart_metadata(state, restart_properties)
@@ -158,6 +246,15 @@ def load_partial_state_from_restart_file(
     }
     for name, array in state.items():
         if name != "time":
+            if partitioner is not None:
+                array = array[
+                    partitioner.subtile_slice(
+                        rank=rank,
+                        global_dims=array.dims,
+                        global_extent=array.shape,
+                        overlap=True,
+                    )
+                ]
             array.load()
             state[name] = Quantity.from_data_array(array)
     return state
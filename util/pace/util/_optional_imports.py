@@ -14,6 +14,16 @@ try:
 except ModuleNotFoundError as err:
     zarr = RaiseWhenAccessed(err)
 
+try:
+    import numcodecs
+except ModuleNotFoundError as err:
+    numcodecs = RaiseWhenAccessed(err)
+
+try:
+    import netCDF4
+except ModuleNotFoundError as err:
+    netCDF4 = RaiseWhenAccessed(err)
+
 try:
     import xarray
 except ModuleNotFoundError as err:
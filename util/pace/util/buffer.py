@@ -1,5 +1,20 @@
+import collections
 import contextlib
-from typing import Callable, Dict, Generator, Iterable, List, Optional, Tuple
+import dataclasses
+import importlib
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import numpy as np
 from numpy.lib.index_tricks import IndexExpression
@@ -14,8 +29,242 @@ from .utils import (
 )
 
 
-BufferKey = Tuple[Callable, Iterable[int], type]
-BUFFER_CACHE: Dict[BufferKey, List["Buffer"]] = {}
+BufferKey = Tuple[Callable, Tuple[int, ...], np.dtype]
+
+
+@dataclasses.dataclass
+class BufferCacheStats:
+    """Counters and memory accounting of a BufferCache.
+
+    Attributes:
+        hits: buffers retrieved from the cache without allocating
+        misses: buffers retrieved from the cache which had to be allocated
+        allocations: buffers allocated, on misses or when pre-warming
+        evictions: cached buffers dropped to stay within the byte budget
+        resident_bytes: bytes of the buffers held by the cache, waiting for reuse
+        peak_resident_bytes: largest resident_bytes since the last reset
+        in_use_bytes: bytes of the buffers retrieved and not yet returned
+    """
+
+    hits: int = 0
+    misses: int = 0
+    allocations: int = 0
+    evictions: int = 0
+    resident_bytes: int = 0
+    peak_resident_bytes: int = 0
+    in_use_bytes: int = 0
+
+
+def _allocator_name(allocator: Callable) -> str:
+    module = getattr(allocator, "__module__", None)
+    name = getattr(allocator, "__qualname__", getattr(allocator, "__name__", None))
+    return f"{module}.{name}"
+
+
+def _import_allocator(name: str) -> Optional[Callable]:
+    module_name, _, attribute = name.rpartition(".")
+    try:
+        return getattr(importlib.import_module(module_name), attribute)
+    except (ImportError, AttributeError, ValueError):
+        return None
+
+
+class BufferCache(Mapping[BufferKey, List["Buffer"]]):
+    """Pool of buffers waiting for reuse, bounded by a byte budget.
+
+    Buffers are kept in lists per key made of the allocator, shape and dtype.
+    When the bytes of the buffers held exceed the budget, buffers of the least
+    recently used keys are dropped first.
+
+    As a mapping, gives the list of buffers waiting for reuse for each key
+    which was ever retrieved.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        """
+        Args:
+            max_bytes: largest number of bytes held by buffers waiting for reuse,
+                unbounded if None
+        """
+        self._buffers: "collections.OrderedDict[BufferKey, List[Buffer]]" = (
+            collections.OrderedDict()
+        )
+        self._in_use: Dict[BufferKey, int] = {}
+        self._peak_in_use: Dict[BufferKey, int] = {}
+        self._max_bytes = max_bytes
+        self.stats = BufferCacheStats()
+
+    def __getitem__(self, key: BufferKey) -> List["Buffer"]:
+        return self._buffers[key]
+
+    def __iter__(self) -> Iterator[BufferKey]:
+        return iter(self._buffers)
+
+    def __len__(self) -> int:
+        return len(self._buffers)
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        """largest number of bytes held by buffers waiting for reuse"""
+        return self._max_bytes
+
+    def set_max_bytes(self, max_bytes: Optional[int]):
+        """Set the byte budget, evicting buffers if it is already exceeded.
+
+        Args:
+            max_bytes: largest number of bytes held by buffers waiting for reuse,
+                unbounded if None
+        """
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError(f"max_bytes must be non-negative, got {max_bytes}")
+        self._max_bytes = max_bytes
+        self._evict()
+
+    @staticmethod
+    def make_key(allocator: Allocator, shape: Iterable[int], dtype: type) -> BufferKey:
+        """Key under which buffers of the given allocation are cached."""
+        if isinstance(shape, (int, np.integer)):
+            shape = (int(shape),)
+        return (allocator, tuple(int(n) for n in shape), np.dtype(dtype))
+
+    def pop(self, allocator: Allocator, shape: Iterable[int], dtype: type) -> "Buffer":
+        """Retrieve a cached buffer, or allocate one if none is available.
+
+        Args:
+            allocator: used to allocate memory
+            shape: shape of array
+            dtype: type of array elements
+        Return:
+            a buffer wrapping an allocated array
+        """
+        key = self.make_key(allocator, shape, dtype)
+        buffers = self._buffers.get(key)
+        if buffers is None:
+            buffers = self._buffers[key] = []
+        else:
+            self._buffers.move_to_end(key)
+        if len(buffers) > 0:
+            buffer = buffers.pop()
+            self.stats.hits += 1
+            self.stats.resident_bytes -= buffer.array.nbytes
+        else:
+            buffer = self._allocate(key)
+            self.stats.misses += 1
+        self.stats.in_use_bytes += buffer.array.nbytes
+        in_use = self._in_use.get(key, 0) + 1
+        self._in_use[key] = in_use
+        if in_use > self._peak_in_use.get(key, 0):
+            self._peak_in_use[key] = in_use
+        return buffer
+
+    def push(self, buffer: "Buffer"):
+        """Return a buffer to the cache for reuse.
+
+        Args:
+            buffer: buffer to push back in cache, using internal key
+        """
+        key = buffer._key
+        if self._in_use.get(key, 0) > 0:
+            self._in_use[key] -= 1
+            self.stats.in_use_bytes -= buffer.array.nbytes
+        self._buffers.setdefault(key, []).append(buffer)
+        self._buffers.move_to_end(key)
+        self._add_resident_bytes(buffer.array.nbytes)
+        self._evict()
+
+    def clear(self):
+        """Drop all cached buffers and forget the keys and usage seen so far."""
+        self._buffers.clear()
+        self._in_use.clear()
+        self._peak_in_use.clear()
+        self.stats.resident_bytes = 0
+        self.stats.in_use_bytes = 0
+
+    def reset_stats(self):
+        """Reset the counters, keeping the memory accounting of current buffers."""
+        self.stats = BufferCacheStats(
+            resident_bytes=self.stats.resident_bytes,
+            peak_resident_bytes=self.stats.resident_bytes,
+            in_use_bytes=self.stats.in_use_bytes,
+        )
+
+    def profile(self) -> List[Dict[str, Any]]:
+        """Record the buffers needed by the allocations seen so far.
+
+        Returns:
+            for each key, the allocator name, shape, dtype and largest number of
+            buffers in use at once, as json-serializable dictionaries
+            to be given to `prewarm`
+        """
+        return [
+            {
+                "allocator": _allocator_name(key[0]),
+                "shape": list(key[1]),
+                "dtype": key[2].str,
+                "count": count,
+            }
+            for key, count in self._peak_in_use.items()
+        ]
+
+    def prewarm(
+        self,
+        profile: Sequence[Mapping[str, Any]],
+        allocators: Optional[Mapping[str, Allocator]] = None,
+    ) -> int:
+        """Allocate the buffers described by a profile ahead of their use.
+
+        Pre-warmed buffers count against the byte budget like any other.
+
+        Args:
+            profile: records as returned by `profile`
+            allocators: allocator to use for each allocator name of the profile,
+                by default allocators are imported by name and records whose
+                allocator cannot be imported are skipped
+
+        Returns:
+            number of buffers allocated
+        """
+        n_allocated = 0
+        for record in profile:
+            if allocators is not None and record["allocator"] in allocators:
+                allocator = allocators[record["allocator"]]
+            else:
+                allocator = _import_allocator(record["allocator"])
+            if allocator is None:
+                continue
+            key = self.make_key(allocator, record["shape"], record["dtype"])
+            n_missing = record["count"] - len(self._buffers.get(key, []))
+            for _ in range(n_missing):
+                self.push(self._allocate(key))
+                n_allocated += 1
+        return n_allocated
+
+    def _allocate(self, key: BufferKey) -> "Buffer":
+        allocator, shape, dtype = key
+        array = safe_mpi_allocate(allocator, shape, dtype=dtype)
+        assert is_c_contiguous(array)
+        self.stats.allocations += 1
+        return Buffer(key, array)
+
+    def _add_resident_bytes(self, nbytes: int):
+        self.stats.resident_bytes += nbytes
+        if self.stats.resident_bytes > self.stats.peak_resident_bytes:
+            self.stats.peak_resident_bytes = self.stats.resident_bytes
+
+    def _evict(self):
+        if self._max_bytes is None:
+            return
+        # keys are ordered from least to most recently used
+        for buffers in list(self._buffers.values()):
+            if self.stats.resident_bytes <= self._max_bytes:
+                break
+            while len(buffers) > 0 and self.stats.resident_bytes > self._max_bytes:
+                buffer = buffers.pop(0)
+                self.stats.resident_bytes -= buffer.array.nbytes
+                self.stats.evictions += 1
+
+
+BUFFER_CACHE = BufferCache()
 
 
 class Buffer:
@@ -50,15 +299,7 @@ class Buffer:
         Return:
             a buffer wrapping an allocated array
         """
-        key = (allocator, shape, dtype)
-        if key in BUFFER_CACHE and len(BUFFER_CACHE[key]) > 0:
-            return BUFFER_CACHE[key].pop()
-        else:
-            if key not in BUFFER_CACHE:
-                BUFFER_CACHE[key] = []
-            array = safe_mpi_allocate(allocator, shape, dtype=dtype)
-            assert is_c_contiguous(array)
-            return cls(key, array)
+        return BUFFER_CACHE.pop(allocator, shape, dtype)
 
     @staticmethod
     def push_to_cache(buffer: "Buffer"):
@@ -67,7 +308,7 @@ class Buffer:
         Args:
             buffer: buffer to push back in cache, using internal key
         """
-        BUFFER_CACHE[buffer._key].append(buffer)
+        BUFFER_CACHE.push(buffer)
 
     def finalize_memory_transfer(self):
         """Finalize any memory transfer"""
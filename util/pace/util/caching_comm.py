@@ -5,7 +5,7 @@ from typing import Any, BinaryIO, List, Optional, TypeVar
 
 import numpy as np
 
-from .comm import Comm, Request
+from .comm import Comm, PersistentRequest, Request
 
 
 T = TypeVar("T")
@@ -22,6 +22,23 @@ class CachingRequestWriter(Request):
         self._buffer_list.append(copy.deepcopy(self._buffer))
 
 
+class CachingPersistentRequestWriter(CachingRequestWriter, PersistentRequest):
+    def __init__(
+        self,
+        req: PersistentRequest,
+        buffer: np.ndarray,
+        buffer_list: List[np.ndarray],
+    ):
+        super().__init__(req, buffer, buffer_list)
+        self._persistent_req = req
+
+    def Start(self):
+        self._persistent_req.Start()
+
+    def Free(self):
+        self._persistent_req.Free()
+
+
 class CachingRequestReader(Request):
     def __init__(self, recvbuf, data):
         self._recvbuf = recvbuf
@@ -147,6 +164,11 @@ class CachingCommReader(Comm):
         new_data = self._data.get_split()
         return CachingCommReader(data=new_data)
 
+    def Dup(self) -> "CachingCommReader":
+        # duplicated comms are stored alongside split comms, in call order
+        new_data = self._data.get_split()
+        return CachingCommReader(data=new_data)
+
     def allreduce(self, sendobj, op=None) -> Any:
         return self._data.get_generic_obj()
 
@@ -217,6 +239,15 @@ class CachingCommWriter(Comm):
             req=req, buffer=recvbuf, buffer_list=self._data.received_buffers
         )
 
+    def Send_init(self, sendbuf, dest, tag: int = 0, **kwargs) -> PersistentRequest:
+        return self._comm.Send_init(sendbuf, dest, tag=tag, **kwargs)
+
+    def Recv_init(self, recvbuf, source, tag: int = 0, **kwargs) -> PersistentRequest:
+        req = self._comm.Recv_init(recvbuf, source, tag=tag, **kwargs)
+        return CachingPersistentRequestWriter(
+            req=req, buffer=recvbuf, buffer_list=self._data.received_buffers
+        )
+
     def sendrecv(self, sendbuf, dest, **kwargs):
         raise NotImplementedError()
 
@@ -226,6 +257,12 @@ class CachingCommWriter(Comm):
         self._data.split_data.append(new_wrapper._data)
         return new_wrapper
 
+    def Dup(self) -> "CachingCommWriter":
+        new_comm = self._comm.Dup()
+        new_wrapper = CachingCommWriter(new_comm)
+        self._data.split_data.append(new_wrapper._data)
+        return new_wrapper
+
     def dump(self, file: BinaryIO):
         self._data.dump(file)
 
@@ -1,5 +1,6 @@
 import abc
-from typing import List, Optional, TypeVar
+import functools
+from typing import Callable, List, Optional, Sequence, TypeVar
 
 
 T = TypeVar("T")
@@ -11,6 +12,40 @@ class Request(abc.ABC):
         ...
 
 
+class PersistentRequest(Request):
+    """A request which can be started any number of times, each start
+    posting the same communication again."""
+
+    @abc.abstractmethod
+    def Start(self):
+        ...
+
+    def Free(self):
+        """Release the resources held by this request."""
+        pass
+
+
+class StartedRequest(PersistentRequest):
+    """Persistent request posting a new non-blocking request on each start,
+    for comms without native persistent requests."""
+
+    def __init__(self, post: Callable[[], Request]):
+        """
+        Args:
+            post: posts the non-blocking communication and returns its request
+        """
+        self._post = post
+        self._request: Optional[Request] = None
+
+    def Start(self):
+        self._request = self._post()
+
+    def wait(self):
+        if self._request is not None:
+            self._request.wait()
+            self._request = None
+
+
 class Comm(abc.ABC):
     @abc.abstractmethod
     def Get_rank(self) -> int:
@@ -68,6 +103,37 @@ class Comm(abc.ABC):
     def Split(self, color, key) -> "Comm":
         ...
 
+    @abc.abstractmethod
+    def Dup(self) -> "Comm":
+        """Create a communicator over the same ranks, with the same rank and size,
+        whose messages do not interfere with those of this communicator."""
+        ...
+
     @abc.abstractmethod
     def allreduce(self, sendobj: T, op=None) -> T:
         ...
+
+    def Send_init(self, sendbuf, dest, tag: int = 0, **kwargs) -> PersistentRequest:
+        """Create a persistent request sending sendbuf on each start.
+
+        sendbuf is read at start time, so it can be refilled between exchanges.
+        """
+        return StartedRequest(
+            functools.partial(self.Isend, sendbuf, dest, tag=tag, **kwargs)
+        )
+
+    def Recv_init(self, recvbuf, source, tag: int = 0, **kwargs) -> PersistentRequest:
+        """Create a persistent request receiving into recvbuf on each start."""
+        return StartedRequest(
+            functools.partial(self.Irecv, recvbuf, source, tag=tag, **kwargs)
+        )
+
+    def Startall(self, requests: Sequence[PersistentRequest]):
+        """Start all given persistent requests."""
+        for request in requests:
+            request.Start()
+
+    def Waitall(self, requests: Sequence[Request]):
+        """Wait for all given requests to complete."""
+        for request in requests:
+            request.wait()
@@ -8,7 +8,12 @@ from . import constants
 from ._timing import NullTimer, Timer
 from .boundary import Boundary
 from .buffer import array_buffer, recv_buffer, send_buffer
-from .halo_updater import HaloUpdater, HaloUpdateRequest, VectorInterfaceHaloUpdater
+from .halo_updater import (
+    HaloUpdater,
+    HaloUpdaterBatch,
+    HaloUpdateRequest,
+    VectorInterfaceHaloUpdater,
+)
 from .partitioner import CubedSpherePartitioner, Partitioner, TilePartitioner
 from .quantity import Quantity, QuantityHaloSpec, QuantityMetadata
 from .types import NumpyModule
@@ -518,7 +523,12 @@ class Communicator(abc.ABC):
         req = halo_updater.start_synchronize_vector_interfaces(x_quantity, y_quantity)
         return req
 
-    def get_scalar_halo_updater(self, specifications: List[QuantityHaloSpec]):
+    def get_scalar_halo_updater(
+        self,
+        specifications: List[QuantityHaloSpec],
+        persistent_requests: bool = False,
+        transfer_dtype: Optional[type] = None,
+    ):
         if len(specifications) == 0:
             raise RuntimeError("Cannot create updater with specifications list")
         if specifications[0].n_points == 0:
@@ -530,12 +540,16 @@ class Communicator(abc.ABC):
             self.boundaries.values(),
             self._get_halo_tag(),
             self.timer,
+            persistent_requests=persistent_requests,
+            transfer_dtype=transfer_dtype,
         )
 
     def get_vector_halo_updater(
         self,
         specifications_x: List[QuantityHaloSpec],
         specifications_y: List[QuantityHaloSpec],
+        persistent_requests: bool = False,
+        transfer_dtype: Optional[type] = None,
     ):
         if len(specifications_x) == 0 and len(specifications_y) == 0:
             raise RuntimeError("Cannot create updater with empty specifications list")
@@ -549,6 +563,29 @@ class Communicator(abc.ABC):
             self.boundaries.values(),
             self._get_halo_tag(),
             self.timer,
+            persistent_requests=persistent_requests,
+            transfer_dtype=transfer_dtype,
+        )
+
+    def get_halo_updater_batch(
+        self, halo_updaters: Sequence[HaloUpdater]
+    ) -> HaloUpdaterBatch:
+        """Get a batch exchanging the halos of several updaters at once, with one
+        message per neighbor rank instead of one per updater and neighbor rank.
+
+        Args:
+            halo_updaters: scalar and/or vector updaters built by this communicator,
+                which must exchange data of the same dtype
+
+        Returns:
+            batch: a halo updater taking as quantities the quantities of each of
+                the halo_updaters
+        """
+        return HaloUpdaterBatch(
+            self,
+            halo_updaters,
+            self._get_halo_tag(),
+            self.timer,
         )
 
     def _get_halo_tag(self) -> int:
@@ -1,26 +1,95 @@
 from __future__ import annotations
 
 import os
-from typing import TYPE_CHECKING, Tuple
+from typing import TYPE_CHECKING, Sequence, Tuple
 
 from gt4py.cartesian import config as gt_config
 
+from .partitioner import CubedSpherePartitioner
+
 
 if TYPE_CHECKING:
     from pace.dsl.stencil_config import CompilationConfig
 
 
-def determine_rank_is_compiling(rank: int, size: int) -> bool:
-    """Determines if a rank needs to be a compiling one
+def _boundary_position(subtile_index: int, n_subtiles: int) -> int:
+    """Position of a subtile along one axis of a layout capped at 3 subtiles:
+    0 on the low tile edge, 1 in the interior and the last position on the
+    high tile edge."""
+    if subtile_index == 0:
+        return 0
+    elif subtile_index == n_subtiles - 1:
+        return min(n_subtiles, 3) - 1
+    else:
+        return 1
+
+
+def _boundary_class_index(
+    rank: int, partitioner: CubedSpherePartitioner
+) -> Tuple[int, int]:
+    subtile_y, subtile_x = partitioner.tile.subtile_index(rank)
+    return (
+        _boundary_position(subtile_y, partitioner.layout[0]),
+        _boundary_position(subtile_x, partitioner.layout[1]),
+    )
+
+
+def determine_boundary_class(rank: int, partitioner: CubedSpherePartitioner) -> int:
+    """Determines which boundary class a rank belongs to
+
+    Ranks of a class own the same tile edges and corners, and therefore share
+    compiled stencils. Classes are numbered like the ranks of a tile with the
+    layout capped at 3x3, so that caches built on a 3x3 layout can be read
+    by any layout with at least 3 subtiles along each axis.
+
+    Args:
+        rank (int): rank to classify
+        partitioner (CubedSpherePartitioner): decomposition of the domain
+
+    Returns:
+        int: index of the boundary class, at most 8
+    """
+    class_y, class_x = _boundary_class_index(rank, partitioner)
+    return class_y * min(partitioner.layout[1], 3) + class_x
+
+
+def determine_compiling_rank(rank: int, partitioner: CubedSpherePartitioner) -> int:
+    """Determines which rank compiles the stencils of a rank's boundary class
 
     Args:
-        rank (int): current rank
-        size (int): size of the communicator
+        rank (int): rank to find the compiling rank for
+        partitioner (CubedSpherePartitioner): decomposition of the domain
 
     Returns:
-        bool: True if the rank is a compiling one
+        int: lowest rank on the first tile in the same boundary class
     """
-    return rank < (size / 6)
+    class_y, class_x = _boundary_class_index(rank, partitioner)
+    layout = partitioner.layout
+    subtile_y = class_y if class_y < 2 else layout[0] - 1
+    subtile_x = class_x if class_x < 2 else layout[1] - 1
+    return subtile_y * layout[1] + subtile_x
+
+
+def determine_waiting_ranks(
+    rank: int, partitioner: CubedSpherePartitioner
+) -> Tuple[int, ...]:
+    """Determines which ranks wait for a compiling rank to finish compilation
+
+    Args:
+        rank (int): compiling rank
+        partitioner (CubedSpherePartitioner): decomposition of the domain
+
+    Returns:
+        Tuple[int, ...]: ranks loading the stencils compiled by rank, empty
+            if rank is not a compiling one
+    """
+    if determine_compiling_rank(rank, partitioner) != rank:
+        return ()
+    return tuple(
+        other
+        for other in range(partitioner.total_ranks)
+        if other != rank and determine_compiling_rank(other, partitioner) == rank
+    )
 
 
 def block_waiting_for_compilation(comm, compilation_config: CompilationConfig) -> None:
@@ -35,19 +104,16 @@ def block_waiting_for_compilation(comm, compilation_config: CompilationConfig) -
         _ = comm.recv(source=compiling_rank)
 
 
-def unblock_waiting_tiles(comm) -> None:
-    """sends a message to all the ranks waiting for compilation to finish
+def unblock_waiting_ranks(comm, waiting_ranks: Sequence[int]) -> None:
+    """sends a message to the given ranks waiting for compilation to finish
 
     Args:
         comm (MPI.Comm): communicator over which the ok is sent
+        waiting_ranks (Sequence[int]): ranks blocked on this rank's compilation
     """
-    rank = comm.Get_rank()
-    size = comm.Get_size()
-    if comm and size > 1:
-        for tile in range(1, 6):
-            tile_size = size / 6
-            message = "compilation finished"
-            comm.send(message, dest=tile * tile_size + rank)
+    if comm and comm.Get_size() > 1:
+        for rank in waiting_ranks:
+            comm.send("compilation finished", dest=rank)
 
 
 def check_cached_path_exists(cache_filepath: str) -> None:
@@ -68,7 +134,7 @@ def build_cache_path(config: CompilationConfig) -> Tuple[str, str]:
         target_rank_str = ""
     else:
         if config.use_minimal_caching:
-            target_rank_str = f"_{config.compiling_equivalent:06d}"
+            target_rank_str = f"_{config.boundary_class:06d}"
         else:
             target_rank_str = f"_{config.rank:06d}"
 
@@ -77,15 +143,17 @@ def build_cache_path(config: CompilationConfig) -> Tuple[str, str]:
 
 
 def set_distributed_caches(config: CompilationConfig):
-    """In Run mode, check required file then point current rank cache to source cache"""
+    """In Run mode, check required file then point current rank cache to source cache.
+    With minimal caching, all ranks of a boundary class share the class cache."""
 
     # Check that we have all the file we need to early out in case
     # of issues.
     from pace.dsl.stencil_config import RunMode
 
-    if config.run_mode == RunMode.Run:
+    if config.run_mode == RunMode.Run or config.use_minimal_caching:
         cache_filepath, target_rank_str = build_cache_path(config)
-        check_cached_path_exists(cache_filepath)
+        if config.run_mode == RunMode.Run:
+            check_cached_path_exists(cache_filepath)
         gt_config.cache_settings["dir_name"] = f".gt_cache{target_rank_str}"
         print(
             f"[{config.run_mode}] Rank {config.rank} "
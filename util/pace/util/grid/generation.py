@@ -1,7 +1,7 @@
 import dataclasses
 import functools
 import warnings
-from typing import Tuple
+from typing import Callable, Iterable, List, Sequence, Tuple
 
 from pace import util
 from pace.dsl.gt4py_utils import asarray
@@ -194,6 +194,44 @@ class GridDefinitions:
     edge_vect_w = GridDefinition(dims=(X_DIM, Y_DIM), units="")
 
 
+class _HaloUpdates:
+    """
+    Halo updates registered by several metric term computations, to be
+    exchanged together.
+    """
+
+    def __init__(self):
+        self._quantities: List[util.Quantity] = []
+        self._x_quantities: List[util.Quantity] = []
+        self._y_quantities: List[util.Quantity] = []
+
+    def halo_update(self, quantity: util.Quantity):
+        self._quantities.append(quantity)
+
+    def vector_halo_update(self, x_quantity: util.Quantity, y_quantity: util.Quantity):
+        self._x_quantities.append(x_quantity)
+        self._y_quantities.append(y_quantity)
+
+    def exchange(self, communicator: util.CubedSphereCommunicator, n_points: int):
+        """
+        Perform all registered halo updates, with one exchange for scalar
+        quantities and one for vector quantities.
+        """
+        halo_updaters = []
+        if len(self._quantities) > 0:
+            halo_updaters.append(
+                communicator.start_halo_update(self._quantities, n_points)
+            )
+        if len(self._x_quantities) > 0:
+            halo_updaters.append(
+                communicator.start_vector_halo_update(
+                    self._x_quantities, self._y_quantities, n_points
+                )
+            )
+        for halo_updater in halo_updaters:
+            halo_updater.wait()
+
+
 # TODO
 # corners use sizer + partitioner rather than GridIndexer,
 # have to refactor fv3core calls to corners to do this as well
@@ -203,6 +241,34 @@ class MetricTerms:
     CARTESIAN_DIM = GridDefinitions.CARTESIAN_DIM
     N_TILES = 6
     RIGHT_HAND_GRID = False
+    # computations which need a halo update, with the terms they set and the
+    # terms set by other such computations which they depend on
+    _HALO_COMPUTATIONS = {
+        "_compute_dxdy": (("dx", "dy"), ()),
+        "_compute_dxdy_agrid": (("dxa", "dya"), ()),
+        "_compute_dxdy_center": (("dxc", "dyc"), ()),
+        "_compute_area": (("area",), ()),
+        "_compute_area_c": (("area_c",), ()),
+        "_calculate_divg_del6": (
+            ("del6_u", "del6_v", "divg_u", "divg_v"),
+            ("dx", "dy", "dxc", "dyc"),
+        ),
+    }
+    # terms computed without a halo update from terms which need one
+    _DERIVED_TERMS = {
+        "rdx": ("dx",),
+        "rdy": ("dy",),
+        "rdxa": ("dxa",),
+        "rdya": ("dya",),
+        "rdxc": ("dxc",),
+        "rdyc": ("dyc",),
+        "rarea": ("area",),
+        "rarea_c": ("area_c",),
+        "da_min": ("area", "area_c"),
+        "da_max": ("area", "area_c"),
+        "da_min_c": ("area", "area_c"),
+        "da_max_c": ("area", "area_c"),
+    }
 
     def __init__(
         self,
@@ -253,6 +319,8 @@ class MetricTerms:
         self._dy_agrid = None
         self._dx_center = None
         self._dy_center = None
+        self._area = None
+        self._area_c = None
         self._ak = None
         self._bk = None
         self._ptop = None
@@ -323,6 +391,7 @@ class MetricTerms:
         self._da_max = None
         self._da_min_c = None
         self._da_max_c = None
+        self._completed_halo_computations = set()
 
         self._init_dgrid()
         self._init_agrid()
@@ -356,6 +425,52 @@ class MetricTerms:
             grid_type=grid_type,
         )
 
+    def compute(self, names: Iterable[str]):
+        """
+        Compute the given terms and the terms they depend on.
+
+        Terms are otherwise computed as they are first accessed, each with its
+        own halo update. Declaring all needed terms up front computes only
+        those terms and their dependencies, and performs the halo updates of
+        terms which do not depend on each other in a single exchange.
+
+        Args:
+            names: names of the terms to compute, such as "dx" or "cos_sg1"
+        """
+        names = list(names)
+        term_computations = {
+            term: computation
+            for computation, (terms, _) in self._HALO_COMPUTATIONS.items()
+            for term in terms
+        }
+        required = set()
+        to_visit = list(names)
+        while len(to_visit) > 0:
+            name = to_visit.pop()
+            if not isinstance(getattr(type(self), name, None), property):
+                raise ValueError(f"{name} is not a term of MetricTerms")
+            to_visit.extend(self._DERIVED_TERMS.get(name, ()))
+            computation = term_computations.get(name)
+            if computation is not None and computation not in required:
+                required.add(computation)
+                to_visit.extend(self._HALO_COMPUTATIONS[computation][1])
+        required -= self._completed_halo_computations
+        while len(required) > 0:
+            ready = [
+                computation
+                for computation, (_, dependencies) in self._HALO_COMPUTATIONS.items()
+                if computation in required
+                and all(
+                    term_computations[term] not in required for term in dependencies
+                )
+            ]
+            self._compute_with_halo_updates(
+                [getattr(self, computation) for computation in ready]
+            )
+            required.difference_update(ready)
+        for name in names:
+            getattr(self, name)
+
     @property
     def grid(self):
         return self._grid
@@ -432,7 +547,7 @@ class MetricTerms:
         the distance between grid corners along the x-direction
         """
         if self._dx is None:
-            self._dx, self._dy = self._compute_dxdy()
+            self._compute_with_halo_updates([self._compute_dxdy])
         return self._dx
 
     @property
@@ -441,7 +556,7 @@ class MetricTerms:
         the distance between grid corners along the y-direction
         """
         if self._dy is None:
-            self._dx, self._dy = self._compute_dxdy()
+            self._compute_with_halo_updates([self._compute_dxdy])
         return self._dy
 
     @property
@@ -450,7 +565,7 @@ class MetricTerms:
         the with of each grid cell along the x-direction
         """
         if self._dx_agrid is None:
-            self._dx_agrid, self._dy_agrid = self._compute_dxdy_agrid()
+            self._compute_with_halo_updates([self._compute_dxdy_agrid])
         return self._dx_agrid
 
     @property
@@ -459,7 +574,7 @@ class MetricTerms:
         the with of each grid cell along the y-direction
         """
         if self._dy_agrid is None:
-            self._dx_agrid, self._dy_agrid = self._compute_dxdy_agrid()
+            self._compute_with_halo_updates([self._compute_dxdy_agrid])
         return self._dy_agrid
 
     @property
@@ -468,7 +583,7 @@ class MetricTerms:
         the distance between cell centers along the x-direction
         """
         if self._dx_center is None:
-            self._dx_center, self._dy_center = self._compute_dxdy_center()
+            self._compute_with_halo_updates([self._compute_dxdy_center])
         return self._dx_center
 
     @property
@@ -477,7 +592,7 @@ class MetricTerms:
         the distance between cell centers along the y-direction
         """
         if self._dy_center is None:
-            self._dx_center, self._dy_center = self._compute_dxdy_center()
+            self._compute_with_halo_updates([self._compute_dxdy_center])
         return self._dy_center
 
     @property
@@ -993,12 +1108,7 @@ class MetricTerms:
         sina_v * dyc/dx
         """
         if self._divg_u is None:
-            (
-                self._del6_u,
-                self._del6_v,
-                self._divg_u,
-                self._divg_v,
-            ) = self._calculate_divg_del6()
+            self._compute_with_halo_updates([self._calculate_divg_del6])
         return self._divg_u
 
     @property
@@ -1007,12 +1117,7 @@ class MetricTerms:
         sina_u * dxc/dy
         """
         if self._divg_v is None:
-            (
-                self._del6_u,
-                self._del6_v,
-                self._divg_u,
-                self._divg_v,
-            ) = self._calculate_divg_del6()
+            self._compute_with_halo_updates([self._calculate_divg_del6])
         return self._divg_v
 
     @property
@@ -1021,12 +1126,7 @@ class MetricTerms:
         sina_v * dx/dyc
         """
         if self._del6_u is None:
-            (
-                self._del6_u,
-                self._del6_v,
-                self._divg_u,
-                self._divg_v,
-            ) = self._calculate_divg_del6()
+            self._compute_with_halo_updates([self._calculate_divg_del6])
         return self._del6_u
 
     @property
@@ -1035,12 +1135,7 @@ class MetricTerms:
         sina_u * dy/dxc
         """
         if self._del6_v is None:
-            (
-                self._del6_u,
-                self._del6_v,
-                self._divg_u,
-                self._divg_v,
-            ) = self._calculate_divg_del6()
+            self._compute_with_halo_updates([self._calculate_divg_del6])
         return self._del6_v
 
     @property
@@ -1321,19 +1416,23 @@ class MetricTerms:
             self._reduce_global_area_minmaxes()
         return self._da_max_c
 
-    @cached_property
+    @property
     def area(self) -> util.Quantity:
         """
         the area of each a-grid cell
         """
-        return self._compute_area()
+        if self._area is None:
+            self._compute_with_halo_updates([self._compute_area])
+        return self._area
 
-    @cached_property
+    @property
     def area_c(self) -> util.Quantity:
         """
         the area of each c-grid cell
         """
-        return self._compute_area_c()
+        if self._area_c is None:
+            self._compute_with_halo_updates([self._compute_area_c])
+        return self._area_c
 
     @cached_property
     def _dgrid_xyz(self) -> util.Quantity:
@@ -1641,7 +1740,25 @@ class MetricTerms:
             direction="y",
         )
 
-    def _compute_dxdy(self):
+    def _compute_with_halo_updates(self, computations: Sequence[Callable]):
+        """
+        Run computations which each need halo updates partway through,
+        exchanging the halos of all of them together.
+
+        Args:
+            computations: generator methods which take a _HaloUpdates, register
+                their halo updates on it and yield once before using the halos
+        """
+        halo_updates = _HaloUpdates()
+        generators = [computation(halo_updates) for computation in computations]
+        for generator in generators:
+            next(generator)
+        halo_updates.exchange(self._comm, n_points=self._halo)
+        for generator, computation in zip(generators, computations):
+            next(generator, None)
+            self._completed_halo_computations.add(computation.__name__)
+
+    def _compute_dxdy(self, halo_updates: "_HaloUpdates"):
         dx = self.quantity_factory.zeros([util.X_DIM, util.Y_INTERFACE_DIM], "m")
 
         dx.view[:, :] = great_circle_distance_along_axis(
@@ -1659,7 +1776,8 @@ class MetricTerms:
             self._np,
             axis=1,
         )
-        self._comm.vector_halo_update(dx, dy, n_points=self._halo)
+        halo_updates.vector_halo_update(dx, dy)
+        yield
 
         # at this point the Fortran code copies in the west and east edges from
         # the halo for dy and performs a halo update,
@@ -1673,9 +1791,9 @@ class MetricTerms:
             self._grid_indexing,
             vector=False,
         )
-        return dx, dy
+        self._dx, self._dy = dx, dy
 
-    def _compute_dxdy_agrid(self):
+    def _compute_dxdy_agrid(self, halo_updates: "_HaloUpdates"):
 
         dx_agrid = self.quantity_factory.zeros([util.X_DIM, util.Y_DIM], "m")
         dy_agrid = self.quantity_factory.zeros([util.X_DIM, util.Y_DIM], "m")
@@ -1701,7 +1819,8 @@ class MetricTerms:
 
         dx_agrid.data[:-1, :-1] = dx_agrid_tmp
         dy_agrid.data[:-1, :-1] = dy_agrid_tmp
-        self._comm.vector_halo_update(dx_agrid, dy_agrid, n_points=self._halo)
+        halo_updates.vector_halo_update(dx_agrid, dy_agrid)
+        yield
 
         # at this point the Fortran code copies in the west and east edges from
         # the halo for dy and performs a halo update,
@@ -1709,9 +1828,9 @@ class MetricTerms:
         # Not doing it here at the moment.
         dx_agrid.data[dx_agrid.data < 0] *= -1
         dy_agrid.data[dy_agrid.data < 0] *= -1
-        return dx_agrid, dy_agrid
+        self._dx_agrid, self._dy_agrid = dx_agrid, dy_agrid
 
-    def _compute_dxdy_center(self):
+    def _compute_dxdy_center(self, halo_updates: "_HaloUpdates"):
         dx_center = self.quantity_factory.zeros([util.X_INTERFACE_DIM, util.Y_DIM], "m")
         dy_center = self.quantity_factory.zeros([util.X_DIM, util.Y_INTERFACE_DIM], "m")
 
@@ -1754,7 +1873,8 @@ class MetricTerms:
             self._rank,
             self._np,
         )
-        self._comm.vector_halo_update(dx_center, dy_center, n_points=self._halo)
+        halo_updates.vector_halo_update(dx_center, dy_center)
+        yield
 
         # TODO: Add support for unsigned vector halo updates
         # instead of handling ad-hoc here
@@ -1768,10 +1888,9 @@ class MetricTerms:
             self._grid_indexing,
             vector=False,
         )
+        self._dx_center, self._dy_center = dx_center, dy_center
 
-        return dx_center, dy_center
-
-    def _compute_area(self):
+    def _compute_area(self, halo_updates: "_HaloUpdates"):
         area = self.quantity_factory.zeros([util.X_DIM, util.Y_DIM], "m^2")
         area.data[:, :] = -1.0e8
 
@@ -1781,10 +1900,11 @@ class MetricTerms:
             RADIUS,
             self._np,
         )
-        self._comm.halo_update(area, n_points=self._halo)
-        return area
+        halo_updates.halo_update(area)
+        yield
+        self._area = area
 
-    def _compute_area_c(self):
+    def _compute_area_c(self, halo_updates: "_HaloUpdates"):
         area_cgrid = self.quantity_factory.zeros(
             [util.X_INTERFACE_DIM, util.Y_INTERFACE_DIM], "m^2"
         )
@@ -1815,7 +1935,8 @@ class MetricTerms:
             self._rank,
             self._np,
         )
-        self._comm.halo_update(area_cgrid, n_points=self._halo)
+        halo_updates.halo_update(area_cgrid)
+        yield
 
         fill_corners_2d(
             area_cgrid.data[:, :, None],
@@ -1823,7 +1944,7 @@ class MetricTerms:
             gridtype="B",
             direction="x",
         )
-        return area_cgrid
+        self._area_c = area_cgrid
 
     def _set_hybrid_pressure_coefficients(self):
         ptop = self.quantity_factory.zeros([], "Pa")
@@ -2165,7 +2286,7 @@ class MetricTerms:
         )
         return ee1, ee2
 
-    def _calculate_divg_del6(self):
+    def _calculate_divg_del6(self, halo_updates: "_HaloUpdates"):
         del6_u = self.quantity_factory.zeros([util.X_DIM, util.Y_INTERFACE_DIM], "")
         del6_v = self.quantity_factory.zeros([util.X_INTERFACE_DIM, util.Y_DIM], "")
         divg_u = self.quantity_factory.zeros([util.X_DIM, util.Y_INTERFACE_DIM], "")
@@ -2196,15 +2317,18 @@ class MetricTerms:
             self._rank,
         )
         if self._grid_type < 3:
-            self._comm.vector_halo_update(divg_v, divg_u, n_points=self._halo)
-            self._comm.vector_halo_update(del6_v, del6_u, n_points=self._halo)
+            halo_updates.vector_halo_update(divg_v, divg_u)
+            halo_updates.vector_halo_update(del6_v, del6_u)
+        yield
+        if self._grid_type < 3:
             # TODO: Add support for unsigned vector halo updates
             # instead of handling ad-hoc here
             divg_v.data[divg_v.data < 0] *= -1
             divg_u.data[divg_u.data < 0] *= -1
             del6_v.data[del6_v.data < 0] *= -1
             del6_u.data[del6_u.data < 0] *= -1
-        return del6_u, del6_v, divg_u, divg_v
+        self._del6_u, self._del6_v = del6_u, del6_v
+        self._divg_u, self._divg_v = divg_u, divg_v
 
     def _calculate_divg_del6_nohalos_for_testing(self):
         """
@@ -268,26 +268,23 @@ def _cart_to_latlon(im, q, xs, ys, np):
 
     esl = 1.0e-10
 
-    for j in range(im):
-        for i in range(im):
-            p = q[:, i, j]
-            dist = np.sqrt(p[0] ** 2 + p[1] ** 2 + p[2] ** 2)
-            p = p / dist
-
-            if np.abs(p[0]) + np.abs(p[1]) < esl:
-                lon = 0.0
-            else:
-                lon = np.arctan2(p[1], p[0])  # range [-PI, PI]
+    p = q[:, :im, :im]
+    # np.power rather than ** 2, which squares arrays by multiplication and can
+    # differ in the last bit from the pointwise computation this replaces
+    dist = np.sqrt(np.power(p[0], 2.0) + np.power(p[1], 2.0) + np.power(p[2], 2.0))
+    p = p / dist
 
-            if lon < 0.0:
-                lon = np.add(2.0 * PI, lon)
+    lon = np.where(
+        np.abs(p[0]) + np.abs(p[1]) < esl, 0.0, np.arctan2(p[1], p[0])
+    )  # range [-PI, PI]
+    lon = np.where(lon < 0.0, np.add(2.0 * PI, lon), lon)
 
-            lat = np.arcsin(p[2])
+    lat = np.arcsin(p[2])
 
-            xs[i, j] = lon
-            ys[i, j] = lat
+    xs[:im, :im] = lon
+    ys[:im, :im] = lat
 
-            q[:, i, j] = p
+    q[:, :im, :im] = p
 
 
 def _mirror_latlon(lon1, lat1, lon2, lat2, lon0, lat0, np):
@@ -1,5 +1,6 @@
 import dataclasses
 import pathlib
+from typing import Optional
 
 import xarray as xr
 
@@ -32,6 +33,9 @@ class DampingCoefficients:
 
     @classmethod
     def new_from_metric_terms(cls, metric_terms: MetricTerms):
+        metric_terms.compute(
+            ["divg_u", "divg_v", "del6_u", "del6_v", "da_min", "da_min_c"]
+        )
         return cls(
             divg_u=metric_terms.divg_u,
             divg_v=metric_terms.divg_v,
@@ -85,6 +89,20 @@ class HorizontalGridData:
 
     @classmethod
     def new_from_metric_terms(cls, metric_terms: MetricTerms) -> "HorizontalGridData":
+        # declaring the terms up front batches their halo updates
+        metric_terms.compute(
+            [
+                "area",
+                "rarea",
+                "rarea_c",
+                "rdx",
+                "rdy",
+                "rdxc",
+                "rdyc",
+                "rdxa",
+                "rdya",
+            ]
+        )
         return cls(
             lon=metric_terms.lon,
             lat=metric_terms.lat,
@@ -288,6 +306,8 @@ class AngleGridData:
     cos_sg2: pace.util.Quantity
     cos_sg3: pace.util.Quantity
     cos_sg4: pace.util.Quantity
+    # only needed for adaptive tracer substeps, not available from serialized data
+    sin_sg5: Optional[pace.util.Quantity] = None
 
     @classmethod
     def new_from_metric_terms(cls, metric_terms: MetricTerms) -> "AngleGridData":
@@ -300,6 +320,7 @@ class AngleGridData:
             cos_sg2=metric_terms.cos_sg2,
             cos_sg3=metric_terms.cos_sg3,
             cos_sg4=metric_terms.cos_sg4,
+            sin_sg5=metric_terms.sin_sg5,
         )
 
 
@@ -619,6 +640,10 @@ class GridData:
     def sin_sg4(self):
         return self._angle_data.sin_sg4
 
+    @property
+    def sin_sg5(self):
+        return self._angle_data.sin_sg5
+
     @property
     def cos_sg1(self):
         return self._angle_data.cos_sg1
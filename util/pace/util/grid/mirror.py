@@ -35,183 +35,179 @@ def mirror_grid(
     i_mid = npx // 2 - global_is + istart
     j_mid = npy // 2 - global_js + jstart
 
-    # first fix base region
-    for j in range(jstart, jend + 1):
-        for i in range(istart, iend + 1):
+    # first fix base region, averaging the absolute values of the four
+    # mirrored grids, the mirror images are reversed views of the other grids
+    iend_domain = iend - 1 + ng
+    jend_domain = jend - 1 + ng
+    local = mirror_data["local"][istart : iend + 1, jstart : jend + 1, :]
+    east_west = mirror_data["east-west"][
+        iend_domain - iend : iend_domain - istart + 1, jstart : jend + 1, :
+    ][::-1, :, :]
+    north_south = mirror_data["north-south"][
+        istart : iend + 1, jend_domain - jend : jend_domain - jstart + 1, :
+    ][:, ::-1, :]
+    diagonal = mirror_data["diagonal"][
+        iend_domain - iend : iend_domain - istart + 1,
+        jend_domain - jend : jend_domain - jstart + 1,
+        :,
+    ][::-1, ::-1, :]
+    # last dimension holds longitude and latitude
+    average = np.multiply(
+        0.25,
+        np.abs(local) + np.abs(east_west) + np.abs(north_south) + np.abs(diagonal),
+    )
+    local[:] = np.copysign(average, local)
+
+    # force dateline/greenwich-meridion consistency
+    if npx % 2 != 0 and x_center_tile and istart <= ng + i_mid <= iend:
+        mirror_data["local"][ng + i_mid, jstart : jend + 1, 0] = 0.0
+        # rows -(j + 1) for j in the base region
+        n_rows = mirror_data["north-south"].shape[1]
+        mirror_data["north-south"][
+            ng + i_mid, n_rows - jend - 1 : n_rows - jstart, 0
+        ] = 0.0
 
-            iend_domain = iend - 1 + ng
-            jend_domain = jend - 1 + ng
-            x1 = np.multiply(
-                0.25,
-                np.abs(mirror_data["local"][i, j, 0])
-                + np.abs(mirror_data["east-west"][iend_domain - i, j, 0])
-                + np.abs(mirror_data["north-south"][i, jend_domain - j, 0])
-                + np.abs(mirror_data["diagonal"][iend_domain - i, jend_domain - j, 0]),
+    if tile_index > 0:
+        # rows are rotated all at once, the rotations only act pointwise
+        x1 = local[:, :, 0]
+        y1 = local[:, :, 1]
+        z1 = np.add(RADIUS, np.multiply(0.0, x1))
+        # index of the row at the center of the tile, if it is on this rank
+        j_center = ng + j_mid - jstart
+        has_center_row = 0 <= j_center <= jend - jstart
+
+        if tile_index == 1:
+            ang = -90.0
+            x2, y2, z2 = _rot_3d(
+                3,
+                [x1, y1, z1],
+                ang,
+                np,
+                right_hand_grid,
+                degrees=True,
+                convert=True,
             )
-            mirror_data["local"][i, j, 0] = np.copysign(
-                x1, mirror_data["local"][i, j, 0]
+        elif tile_index == 2:
+            ang = -90.0
+            x2, y2, z2 = _rot_3d(
+                3,
+                [x1, y1, z1],
+                ang,
+                np,
+                right_hand_grid,
+                degrees=True,
+                convert=True,
             )
-
-            y1 = np.multiply(
-                0.25,
-                np.abs(mirror_data["local"][i, j, 1])
-                + np.abs(mirror_data["east-west"][iend_domain - i, j, 1])
-                + np.abs(mirror_data["north-south"][i, jend_domain - j, 1])
-                + np.abs(mirror_data["diagonal"][iend_domain - i, jend_domain - j, 1]),
+            ang = 90.0
+            x2, y2, z2 = _rot_3d(
+                1,
+                [x2, y2, z2],
+                ang,
+                np,
+                right_hand_grid,
+                degrees=True,
+                convert=True,
             )
 
-            mirror_data["local"][i, j, 1] = np.copysign(
-                y1, mirror_data["local"][i, j, 1]
+            # force North Pole and dateline/Greenwich-Meridian consistency
+            if npx % 2 != 0 and has_center_row:
+                if x_center_tile and y_center_tile and i_mid == j_mid:
+                    x2[i_mid, j_center] = 0.0
+                    y2[i_mid, j_center] = PI / 2.0
+                if y_center_tile:
+                    if x_center_tile:
+                        x2[: i_mid + 1, j_center] = 0.0
+                        x2[i_mid + 1 :, j_center] = PI
+                    elif global_is + i_mid < ng + (npx - 1) / 2:
+                        x2[:, j_center] = 0.0
+                    elif global_is + i_mid > ng + (npx - 1) / 2:
+                        x2[:, j_center] = PI
+        elif tile_index == 3:
+            ang = -180.0
+            x2, y2, z2 = _rot_3d(
+                3,
+                [x1, y1, z1],
+                ang,
+                np,
+                right_hand_grid,
+                degrees=True,
+                convert=True,
             )
-
-            # force dateline/greenwich-meridion consistency
+            ang = 90.0
+            x2, y2, z2 = _rot_3d(
+                1,
+                [x2, y2, z2],
+                ang,
+                np,
+                right_hand_grid,
+                degrees=True,
+                convert=True,
+            )
+            # force dateline/Greenwich-Meridian consistency
             if npx % 2 != 0:
-                if x_center_tile and i == ng + i_mid:
-                    mirror_data["local"][i, j, 0] = 0.0
-                    mirror_data["north-south"][i, -(j + 1), 0] = 0
-
-    if tile_index > 0:
-
-        for j in range(jstart, jend + 1):
-            x1 = mirror_data["local"][istart : iend + 1, j, 0]
-            y1 = mirror_data["local"][istart : iend + 1, j, 1]
-            z1 = np.add(RADIUS, np.multiply(0.0, x1))
-
-            if tile_index == 1:
-                ang = -90.0
-                x2, y2, z2 = _rot_3d(
-                    3,
-                    [x1, y1, z1],
-                    ang,
-                    np,
-                    right_hand_grid,
-                    degrees=True,
-                    convert=True,
-                )
-            elif tile_index == 2:
-                ang = -90.0
-                x2, y2, z2 = _rot_3d(
-                    3,
-                    [x1, y1, z1],
-                    ang,
-                    np,
-                    right_hand_grid,
-                    degrees=True,
-                    convert=True,
-                )
-                ang = 90.0
-                x2, y2, z2 = _rot_3d(
-                    1,
-                    [x2, y2, z2],
-                    ang,
-                    np,
-                    right_hand_grid,
-                    degrees=True,
-                    convert=True,
-                )
-
-                # force North Pole and dateline/Greenwich-Meridian consistency
-                if npx % 2 != 0:
-                    if (
-                        j == ng + j_mid
-                        and x_center_tile
-                        and y_center_tile
-                        and i_mid == j_mid
-                    ):
-                        x2[i_mid] = 0.0
-                        y2[i_mid] = PI / 2.0
-                    if j == ng + j_mid and y_center_tile:
-                        if x_center_tile:
-                            x2[: i_mid + 1] = 0.0
-                            x2[i_mid + 1 :] = PI
-                        elif global_is + i_mid < ng + (npx - 1) / 2:
-                            x2[:] = 0.0
-                        elif global_is + i_mid > ng + (npx - 1) / 2:
-                            x2[:] = PI
-            elif tile_index == 3:
-                ang = -180.0
-                x2, y2, z2 = _rot_3d(
-                    3,
-                    [x1, y1, z1],
-                    ang,
-                    np,
-                    right_hand_grid,
-                    degrees=True,
-                    convert=True,
-                )
-                ang = 90.0
-                x2, y2, z2 = _rot_3d(
-                    1,
-                    [x2, y2, z2],
-                    ang,
-                    np,
-                    right_hand_grid,
-                    degrees=True,
-                    convert=True,
-                )
-                # force dateline/Greenwich-Meridian consistency
-                if npx % 2 != 0:
-                    if j == ng + j_mid and y_center_tile:
-                        x2[:] = PI
-            elif tile_index == 4:
-                ang = 90.0
-                x2, y2, z2 = _rot_3d(
-                    3,
-                    [x1, y1, z1],
-                    ang,
-                    np,
-                    right_hand_grid,
-                    degrees=True,
-                    convert=True,
-                )
-                ang = 90.0
-                x2, y2, z2 = _rot_3d(
-                    2,
-                    [x2, y2, z2],
-                    ang,
-                    np,
-                    right_hand_grid,
-                    degrees=True,
-                    convert=True,
-                )
-            elif tile_index == 5:
-                ang = 90.0
-                x2, y2, z2 = _rot_3d(
-                    2,
-                    [x1, y1, z1],
-                    ang,
-                    np,
-                    right_hand_grid,
-                    degrees=True,
-                    convert=True,
-                )
-                ang = 0.0
-                x2, y2, z2 = _rot_3d(
-                    3,
-                    [x2, y2, z2],
-                    ang,
-                    np,
-                    right_hand_grid,
-                    degrees=True,
-                    convert=True,
-                )
-                # force South Pole and dateline/Greenwich-Meridian consistency
-                if npx % 2 != 0:
-                    if (
-                        i == ng + i_mid
-                        and x_center_tile
-                        and y_center_tile
-                        and i_mid == j_mid
-                    ):
-                        x2[i_mid] = 0.0
-                        y2[i_mid] = -PI / 2.0
-                    if global_js + j_mid > ng + (npy - 1) / 2 and x_center_tile:
-                        x2[i_mid] = 0.0
-                    elif global_js + j_mid < ng + (npy - 1) / 2 and x_center_tile:
-                        x2[i_mid] = PI
+                if has_center_row and y_center_tile:
+                    x2[:, j_center] = PI
+        elif tile_index == 4:
+            ang = 90.0
+            x2, y2, z2 = _rot_3d(
+                3,
+                [x1, y1, z1],
+                ang,
+                np,
+                right_hand_grid,
+                degrees=True,
+                convert=True,
+            )
+            ang = 90.0
+            x2, y2, z2 = _rot_3d(
+                2,
+                [x2, y2, z2],
+                ang,
+                np,
+                right_hand_grid,
+                degrees=True,
+                convert=True,
+            )
+        elif tile_index == 5:
+            ang = 90.0
+            x2, y2, z2 = _rot_3d(
+                2,
+                [x1, y1, z1],
+                ang,
+                np,
+                right_hand_grid,
+                degrees=True,
+                convert=True,
+            )
+            ang = 0.0
+            x2, y2, z2 = _rot_3d(
+                3,
+                [x2, y2, z2],
+                ang,
+                np,
+                right_hand_grid,
+                degrees=True,
+                convert=True,
+            )
+            # force South Pole and dateline/Greenwich-Meridian consistency
+            if npx % 2 != 0:
+                # the last column of the base region is compared, as was done
+                # by the loop this replaces
+                if (
+                    iend == ng + i_mid
+                    and x_center_tile
+                    and y_center_tile
+                    and i_mid == j_mid
+                ):
+                    x2[i_mid, :] = 0.0
+                    y2[i_mid, :] = -PI / 2.0
+                if global_js + j_mid > ng + (npy - 1) / 2 and x_center_tile:
+                    x2[i_mid, :] = 0.0
+                elif global_js + j_mid < ng + (npy - 1) / 2 and x_center_tile:
+                    x2[i_mid, :] = PI
 
-            mirror_data["local"][istart : iend + 1, j, 0] = x2
-            mirror_data["local"][istart : iend + 1, j, 1] = y2
+        local[:, :, 0] = x2
+        local[:, :, 1] = y2
 
 
 def _rot_3d(axis, p, angle, np, right_hand_grid, degrees=False, convert=False):
@@ -15,7 +15,7 @@ from .cuda_kernels import (
     unpack_vector_f64_kernel,
 )
 from .quantity import Quantity, QuantityHaloSpec
-from .rotate import rotate_scalar_data, rotate_vector_data
+from .rotate import rotate_scalar_data
 from .types import NumpyModule
 from .utils import device_synchronize
 
@@ -108,6 +108,55 @@ def _slices_size(slices: Tuple[slice, ...]) -> int:
     return length
 
 
+@dataclass
+class _RotatedView:
+    """Indexing giving a rotated slice of an array as a view.
+
+    Rotating data only flips and transposes it, so the rotated slice of an
+    array is array[indexing].transpose(axes).
+    """
+
+    indexing: Tuple[slice, ...]
+    axes: Tuple[int, ...]
+    shape: Tuple[int, ...]
+    size: int
+
+    @classmethod
+    def from_slices(
+        cls, slices: Tuple[slice, ...], dims: Sequence[str], rotation: int
+    ) -> "_RotatedView":
+        """
+        Args:
+            slices: slice into the data, one per dimension
+            dims: dimension names of the data
+            rotation: number of clockwise rotations to apply to the slice
+        """
+        shape = tuple(s.stop - s.start for s in slices)
+        # rotate a view with a distinct stride along each axis, from which
+        # the flips and transposition done by the rotation can be read back
+        probe = np.empty(tuple(n + 1 for n in shape), dtype=np.int8)[
+            tuple(slice(0, n) for n in shape)
+        ]
+        rotated = rotate_scalar_data(probe, dims, np, rotation)
+        axes = tuple(probe.strides.index(abs(stride)) for stride in rotated.strides)
+        indexing = list(slices)
+        for axis, stride in zip(axes, rotated.strides):
+            if stride < 0:
+                s = slices[axis]
+                indexing[axis] = slice(
+                    s.stop - 1, s.start - 1 if s.start > 0 else None, -1
+                )
+        return cls(
+            indexing=tuple(indexing),
+            axes=axes,
+            shape=rotated.shape,
+            size=rotated.size,
+        )
+
+    def __call__(self, array):
+        return array[self.indexing].transpose(self.axes)
+
+
 @dataclass
 class HaloExchangeSpec:
     """Memory description of the data exchanged.
@@ -183,6 +232,7 @@ class HaloDataTransformer(abc.ABC):
         np_module: NumpyModule,
         exchange_descriptors_x: Sequence[HaloExchangeSpec],
         exchange_descriptors_y: Optional[Sequence[HaloExchangeSpec]] = None,
+        transfer_dtype: Optional[type] = None,
     ) -> None:
         """
         Args:
@@ -192,6 +242,9 @@ class HaloDataTransformer(abc.ABC):
             exchange_descriptors_y: list of memory information describing an exchange.
                 Optional, used for the y-component of vectors only. If `none` the
                 data will packed as a scalar.
+            transfer_dtype: dtype of the pack and unpack buffers, data is converted
+                to it when packed and back when unpacked. Defaults to the dtype of
+                the exchanged data.
         """
         self._type = (
             _HaloDataTransformerType.SCALAR
@@ -205,6 +258,7 @@ class HaloDataTransformer(abc.ABC):
                 "Vector halo exchange must have same exchange data for X and Y"
             )
         self._np_module = np_module
+        self._transfer_dtype = transfer_dtype
         self._infos_x = tuple(exchange_descriptors_x)
         self._infos_y = (
             tuple(exchange_descriptors_y)
@@ -213,6 +267,7 @@ class HaloDataTransformer(abc.ABC):
         )
         self._pack_buffer = None
         self._unpack_buffer = None
+        self._owns_buffers = True
         self._compile()
 
     def finalize(self):
@@ -221,16 +276,57 @@ class HaloDataTransformer(abc.ABC):
         self.synchronize()
 
         # Push the buffers back in the cache
-        Buffer.push_to_cache(self._pack_buffer)
+        if self._owns_buffers:
+            Buffer.push_to_cache(self._pack_buffer)
+            Buffer.push_to_cache(self._unpack_buffer)
         self._pack_buffer = None
-        Buffer.push_to_cache(self._unpack_buffer)
         self._unpack_buffer = None
 
+    @property
+    def buffer_size(self) -> int:
+        """Number of elements of the pack and unpack buffers."""
+        if self._pack_buffer is None:
+            raise RuntimeError("Buffer size can't be retrieved before allocate()")
+        return self._pack_buffer.array.size
+
+    def bind_buffers(self, pack_array: np.ndarray, unpack_array: np.ndarray):
+        """Pack into and unpack from arrays owned by the caller.
+
+        The buffers allocated by the transformer are returned to the cache. The
+        given arrays, e.g. views into the larger buffer of a batched message,
+        are not returned to the cache on finalize.
+
+        Args:
+            pack_array: contiguous array of buffer_size elements to pack into
+            unpack_array: contiguous array of buffer_size elements to unpack from
+        """
+        if not self._owns_buffers:
+            raise RuntimeError("Buffers of the transformer are already bound")
+        assert isinstance(self._pack_buffer, Buffer)  # e.g. allocate happened
+        assert isinstance(self._unpack_buffer, Buffer)  # e.g. allocate happened
+        for array in (pack_array, unpack_array):
+            if (
+                array.size != self.buffer_size
+                or array.dtype != self._pack_buffer.array.dtype
+            ):
+                raise ValueError(
+                    f"Expected an array of {self.buffer_size} elements of dtype "
+                    f"{self._pack_buffer.array.dtype}, got {array.size} elements "
+                    f"of dtype {array.dtype}"
+                )
+        self.synchronize()
+        Buffer.push_to_cache(self._pack_buffer)
+        Buffer.push_to_cache(self._unpack_buffer)
+        self._pack_buffer = Buffer(self._pack_buffer._key, pack_array)
+        self._unpack_buffer = Buffer(self._unpack_buffer._key, unpack_array)
+        self._owns_buffers = False
+
     @staticmethod
     def get(
         np_module: NumpyModule,
         exchange_descriptors_x: Sequence[HaloExchangeSpec],
         exchange_descriptors_y: Optional[Sequence[HaloExchangeSpec]] = None,
+        transfer_dtype: Optional[type] = None,
     ) -> "HaloDataTransformer":
         """Construct a module from a numpy-like module.
 
@@ -241,6 +337,8 @@ class HaloDataTransformer(abc.ABC):
             exchange_descriptors_y: list of memory information describing an exchange.
                 Optional, used for the y-component of vectors only. If `none` the data
                 will packed as a scalar.
+            transfer_dtype: dtype of the packed data, if different from the
+                dtype of the exchanged data.
 
         Returns:
             an initialized packed buffer.
@@ -250,12 +348,14 @@ class HaloDataTransformer(abc.ABC):
                 np,
                 exchange_descriptors_x,
                 exchange_descriptors_y=exchange_descriptors_y,
+                transfer_dtype=transfer_dtype,
             )
         elif np_module is cp:
             return HaloDataTransformerGPU(
                 cp,
                 exchange_descriptors_x,
                 exchange_descriptors_y=exchange_descriptors_y,
+                transfer_dtype=transfer_dtype,
             )
 
         raise NotImplementedError(
@@ -294,13 +394,15 @@ class HaloDataTransformer(abc.ABC):
         if self._type is _HaloDataTransformerType.VECTOR:
             for edge_y in self._infos_y:
                 buffer_size += edge_y.pack_buffer_size
+        if self._transfer_dtype is not None:
+            dtype = self._transfer_dtype
 
         # Retrieve two properly sized buffers
         self._pack_buffer = Buffer.pop_from_cache(
-            self._np_module.zeros, (buffer_size), dtype
+            self._np_module.zeros, (buffer_size,), dtype
         )
         self._unpack_buffer = Buffer.pop_from_cache(
-            self._np_module.zeros, (buffer_size), dtype
+            self._np_module.zeros, (buffer_size,), dtype
         )
 
     def ready(self) -> bool:
@@ -361,8 +463,46 @@ class HaloDataTransformerCPU(HaloDataTransformer):
     """Pack/unpack data in a single buffer using numpy flattening & slicing.
 
     Default behavior, could be done with any numpy-like library.
+
+    The rotated views to pack are described at compile time, so that packing
+    copies each of them into the buffer once without intermediate arrays.
     """
 
+    def __init__(
+        self,
+        np_module: NumpyModule,
+        exchange_descriptors_x: Sequence[HaloExchangeSpec],
+        exchange_descriptors_y: Optional[Sequence[HaloExchangeSpec]] = None,
+        transfer_dtype: Optional[type] = None,
+    ) -> None:
+        self._pack_views: Dict[UUID, _RotatedView] = {}
+        super().__init__(
+            np_module,
+            exchange_descriptors_x,
+            exchange_descriptors_y=exchange_descriptors_y,
+            transfer_dtype=transfer_dtype,
+        )
+
+    def _compile(self):
+        super()._compile()
+        # sending data across the boundary will rotate the data
+        # n_clockwise_rotations times, due to the difference in axis orientation.
+        # Thus we rotate that number of times counterclockwise before sending,
+        # to get the right final orientation
+        for info in self._infos_x + self._infos_y:
+            self._pack_views[info._id] = _RotatedView.from_slices(
+                info.pack_slices,
+                info.specification.dims,
+                -info.pack_clockwise_rotation,
+            )
+
+    def _pack_buffer_view(self, offset: int, pack_view: _RotatedView):
+        """Part of the pack buffer starting at offset, shaped as the pack view."""
+        assert isinstance(self._pack_buffer, Buffer)  # e.g. allocate happened
+        return self._pack_buffer.array[offset : offset + pack_view.size].reshape(
+            pack_view.shape
+        )
+
     def synchronize(self):
         if self._pack_buffer is not None:
             self._pack_buffer.finalize_memory_transfer()
@@ -397,22 +537,11 @@ class HaloDataTransformerCPU(HaloDataTransformer):
         assert isinstance(self._pack_buffer, Buffer)  # e.g. allocate happened
         offset = 0
         for quantity, info_x in zip(quantities, self._infos_x):
-            data_size = _slices_size(info_x.pack_slices)
-            # sending data across the boundary will rotate the data
-            # n_clockwise_rotations times, due to the difference in axis orientation.\
-            # Thus we rotate that number of times counterclockwise before sending,
-            # to get the right final orientation
-            source_view = rotate_scalar_data(
-                quantity.data[info_x.pack_slices],
-                quantity.dims,
-                quantity.np,
-                -info_x.pack_clockwise_rotation,
+            pack_view = self._pack_views[info_x._id]
+            np.copyto(
+                self._pack_buffer_view(offset, pack_view), pack_view(quantity.data)
             )
-            self._pack_buffer.assign_from(
-                source_view.flatten(),
-                buffer_slice=np.index_exp[offset : offset + data_size],
-            )
-            offset += data_size
+            offset += pack_view.size
 
     def _pack_vector(self, quantities_x: List[Quantity], quantities_y: List[Quantity]):
         if __debug__:
@@ -436,29 +565,28 @@ class HaloDataTransformerCPU(HaloDataTransformer):
             info_x,
             info_y,
         ) in zip(quantities_x, quantities_y, self._infos_x, self._infos_y):
-            # sending data across the boundary will rotate the data
-            # n_clockwise_rotations times, due to the difference in axis orientation
-            # Thus we rotate that number of times counterclockwise before sending,
-            # to get the right final orientation
-            x_view, y_view = rotate_vector_data(
-                quantity_x.data[info_x.pack_slices],
-                quantity_y.data[info_y.pack_slices],
-                -info_x.pack_clockwise_rotation,
-                quantity_x.dims,
-                quantity_x.np,
-            )
+            x_view = self._pack_views[info_x._id]
+            y_view = self._pack_views[info_y._id]
+            # rotating the vector swaps and negates its rotated components
+            # as in rotate_vector_data
+            rotation = -info_x.pack_clockwise_rotation % 4
+            if rotation == 0:
+                components = ((quantity_x, x_view, False), (quantity_y, y_view, False))
+            elif rotation == 1:
+                components = ((quantity_y, y_view, False), (quantity_x, x_view, True))
+            elif rotation == 2:
+                components = ((quantity_x, x_view, True), (quantity_y, y_view, True))
+            else:
+                components = ((quantity_y, y_view, True), (quantity_x, x_view, False))
 
             # Pack X/Y data slices in the buffer
-            self._pack_buffer.assign_from(
-                x_view.flatten(),
-                buffer_slice=np.index_exp[offset : offset + x_view.size],
-            )
-            offset += x_view.size
-            self._pack_buffer.assign_from(
-                y_view.flatten(),
-                buffer_slice=np.index_exp[offset : offset + y_view.size],
-            )
-            offset += y_view.size
+            for quantity, pack_view, negate in components:
+                buffer_view = self._pack_buffer_view(offset, pack_view)
+                if negate:
+                    np.negative(pack_view(quantity.data), out=buffer_view)
+                else:
+                    np.copyto(buffer_view, pack_view(quantity.data))
+                offset += pack_view.size
 
     def async_unpack(
         self,
@@ -565,12 +693,19 @@ class HaloDataTransformerGPU(HaloDataTransformer):
         np_module: NumpyModule,
         exchange_descriptors_x: Sequence[HaloExchangeSpec],
         exchange_descriptors_y: Optional[Sequence[HaloExchangeSpec]] = None,
+        transfer_dtype: Optional[type] = None,
     ) -> None:
+        # We only have written f64 kernels
+        if transfer_dtype is not None and np.dtype(transfer_dtype) != np.float64:
+            raise NotImplementedError(
+                f"Kernels require f64 buffers, given transfer dtype {transfer_dtype}"
+            )
         self._cu_kernel_args: Dict[UUID, HaloDataTransformerGPU._CuKernelArgs] = {}
         super().__init__(
             np_module,
             exchange_descriptors_x,
             exchange_descriptors_y=exchange_descriptors_y,
+            transfer_dtype=transfer_dtype,
         )
 
     def _flatten_indices(
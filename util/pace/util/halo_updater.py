@@ -1,5 +1,14 @@
 from collections import defaultdict
-from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Tuple
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import numpy as np
 
@@ -7,6 +16,7 @@ from . import constants
 from ._timing import NullTimer, Timer
 from .boundary import Boundary
 from .buffer import Buffer
+from .comm import PersistentRequest
 from .halo_data_transformer import HaloDataTransformer, HaloExchangeSpec
 from .quantity import Quantity, QuantityHaloSpec
 from .rotate import rotate_scalar_data
@@ -47,6 +57,7 @@ class HaloUpdater:
         tag: int,
         transformers: Dict[int, HaloDataTransformer],
         timer: Timer,
+        persistent_requests: bool = False,
     ):
         """Build the updater.
 
@@ -56,6 +67,9 @@ class HaloUpdater:
             transformers: mapping from destination rank to transformers used to
                 pack/unpack before and after communication
             timer: timing operations
+            persistent_requests: if True, create persistent send and recv
+                requests on the transformer buffers once, and only start them
+                on each exchange. Requires comm.comm to implement pace.util.Comm.
         """
         self._comm = comm
         self._tag = tag
@@ -66,12 +80,39 @@ class HaloUpdater:
         self._inflight_x_quantities: Optional[Tuple[Quantity, ...]] = None
         self._inflight_y_quantities: Optional[Tuple[Quantity, ...]] = None
         self._finalize_on_wait = False
+        self._persistent_recv_requests: List[PersistentRequest] = []
+        self._persistent_send_requests: List[PersistentRequest] = []
+        if persistent_requests:
+            for to_rank, transformer in self._transformers.items():
+                self._persistent_recv_requests.append(
+                    self._comm.comm.Recv_init(
+                        transformer.get_unpack_buffer().array,
+                        source=to_rank,
+                        tag=self._tag,
+                    )
+                )
+                self._persistent_send_requests.append(
+                    self._comm.comm.Send_init(
+                        transformer.get_pack_buffer().array,
+                        dest=to_rank,
+                        tag=self._tag,
+                    )
+                )
+
+    @property
+    def persistent_requests(self) -> bool:
+        """Whether exchanges start persistent requests created at init."""
+        return len(self._persistent_recv_requests) > 0
 
     def force_finalize_on_wait(self):
         """HaloDataTransformer are finalized after a wait call
 
         This is a temporary fix. See DSL-816 which will remove self._finalize_on_wait.
         """
+        if self.persistent_requests:
+            raise RuntimeError(
+                "cannot finalize on wait the buffers of persistent requests"
+            )
         self._finalize_on_wait = True
 
     def __del__(self):
@@ -83,6 +124,8 @@ class HaloUpdater:
             raise RuntimeError(
                 "An halo exchange wasn't completed and a wait() call was expected"
             )
+        for request in self._persistent_recv_requests + self._persistent_send_requests:
+            request.Free()
         if not self._finalize_on_wait:
             for transformer in self._transformers.values():
                 transformer.finalize()
@@ -96,6 +139,8 @@ class HaloUpdater:
         boundaries: Iterable[Boundary],
         tag: int,
         optional_timer: Optional[Timer] = None,
+        persistent_requests: bool = False,
+        transfer_dtype: Optional[type] = None,
     ) -> "HaloUpdater":
         """
         Create/retrieve as many packed buffer as needed and
@@ -109,6 +154,11 @@ class HaloUpdater:
             boundaries: informations on the exchange boundaries.
             tag: network tag (to differentiate messaging) for this node.
             optional_timer: timing of operations.
+            persistent_requests: create persistent send and recv requests once
+                instead of posting new ones on each exchange.
+            transfer_dtype: dtype in which halo data is sent, defaults to the
+                dtype of the data. A lower precision dtype reduces the message
+                size at the cost of rounding the halo values.
 
         Returns:
             HaloUpdater ready to exchange data.
@@ -134,10 +184,10 @@ class HaloUpdater:
         transformers: Dict[int, HaloDataTransformer] = {}
         for rank, exchange_specs in exchange_specs_dict.items():
             transformers[rank] = HaloDataTransformer.get(
-                numpy_like_module, exchange_specs
+                numpy_like_module, exchange_specs, transfer_dtype=transfer_dtype
             )
 
-        return cls(comm, tag, transformers, timer)
+        return cls(comm, tag, transformers, timer, persistent_requests)
 
     @classmethod
     def from_vector_specifications(
@@ -149,6 +199,8 @@ class HaloUpdater:
         boundaries: Iterable[Boundary],
         tag: int,
         optional_timer: Optional[Timer] = None,
+        persistent_requests: bool = False,
+        transfer_dtype: Optional[type] = None,
     ) -> "HaloUpdater":
         """
         Create/retrieve as many packed buffer as needed and queue
@@ -164,6 +216,11 @@ class HaloUpdater:
             boundaries: informations on the exchange boundaries.
             tag: network tag (to differentiate messaging) for this node.
             optional_timer: timing of operations.
+            persistent_requests: create persistent send and recv requests once
+                instead of posting new ones on each exchange.
+            transfer_dtype: dtype in which halo data is sent, defaults to the
+                dtype of the data. A lower precision dtype reduces the message
+                size at the cost of rounding the halo values.
 
         Returns:
             HaloUpdater ready to exchange data.
@@ -201,9 +258,10 @@ class HaloUpdater:
                 numpy_like_module,
                 exchange_descriptor_x,
                 exchange_descriptors_y=exchange_descriptor_y,
+                transfer_dtype=transfer_dtype,
             )
 
-        return cls(comm, tag, transformers, timer)
+        return cls(comm, tag, transformers, timer, persistent_requests)
 
     def update(
         self,
@@ -235,15 +293,19 @@ class HaloUpdater:
 
         # Post recv MPI order
         with self._timer.clock("Irecv"):
-            self._recv_requests = []
-            for to_rank, transformer in self._transformers.items():
-                self._recv_requests.append(
-                    self._comm.comm.Irecv(
-                        transformer.get_unpack_buffer().array,
-                        source=to_rank,
-                        tag=self._tag,
+            if self.persistent_requests:
+                self._comm.comm.Startall(self._persistent_recv_requests)
+                self._recv_requests = list(self._persistent_recv_requests)
+            else:
+                self._recv_requests = []
+                for to_rank, transformer in self._transformers.items():
+                    self._recv_requests.append(
+                        self._comm.comm.Irecv(
+                            transformer.get_unpack_buffer().array,
+                            source=to_rank,
+                            tag=self._tag,
+                        )
                     )
-                )
 
         # Pack quantities halo points data into buffers
         with self._timer.clock("pack"):
@@ -257,15 +319,23 @@ class HaloUpdater:
 
         # Post send MPI order
         with self._timer.clock("Isend"):
-            self._send_requests = []
-            for to_rank, transformer in self._transformers.items():
-                self._send_requests.append(
-                    self._comm.comm.Isend(
-                        transformer.get_pack_buffer().array,
-                        dest=to_rank,
-                        tag=self._tag,
+            if self.persistent_requests:
+                # buffers were taken at init, so wait on packing as
+                # get_pack_buffer() would before they are read
+                for transformer in self._transformers.values():
+                    transformer.synchronize()
+                self._comm.comm.Startall(self._persistent_send_requests)
+                self._send_requests = list(self._persistent_send_requests)
+            else:
+                self._send_requests = []
+                for to_rank, transformer in self._transformers.items():
+                    self._send_requests.append(
+                        self._comm.comm.Isend(
+                            transformer.get_pack_buffer().array,
+                            dest=to_rank,
+                            tag=self._tag,
+                        )
                     )
-                )
 
         self._timer.stop(TIMER_HALO_EX_KEY)
 
@@ -278,10 +348,14 @@ class HaloUpdater:
 
         # Wait message to be exchange
         with self._timer.clock("wait"):
-            for send_req in self._send_requests:
-                send_req.wait()
-            for recv_req in self._recv_requests:
-                recv_req.wait()
+            if self.persistent_requests:
+                self._comm.comm.Waitall(self._send_requests)
+                self._comm.comm.Waitall(self._recv_requests)
+            else:
+                for send_req in self._send_requests:
+                    send_req.wait()
+                for recv_req in self._recv_requests:
+                    recv_req.wait()
 
         # Unpack buffers (updated by MPI with neighbouring halos)
         # to proper quantities
@@ -303,6 +377,210 @@ class HaloUpdater:
         self._timer.stop(TIMER_HALO_EX_KEY)
 
 
+class HaloUpdaterBatch:
+    """Exchange halo information of several HaloUpdater at once.
+
+    Each HaloUpdater posts one message per neighbor rank. The batch instead packs
+    the data of all its updaters for a given neighbor rank into a single buffer,
+    sent as one message, dividing the number of messages by the batch size.
+
+    The updaters are only used for their pack/unpack transformers, which are
+    bound to consecutive parts of the batch buffers so data is packed and
+    unpacked without intermediate copies. An updater can therefore be part of
+    a single batch, and should not be started on its own while the batch is
+    in flight.
+    """
+
+    def __init__(
+        self,
+        comm: "Communicator",
+        updaters: Sequence[HaloUpdater],
+        tag: int,
+        timer: Timer,
+    ):
+        """Build the batch.
+
+        Args:
+            comm: communicator responsible for send/recv commands.
+            updaters: scalar and/or vector updaters to exchange together
+            tag: network tag to be used for communication
+            timer: timing operations
+        """
+        self._send_buffers: Dict[int, Buffer] = {}
+        self._recv_buffers: Dict[int, Buffer] = {}
+        self._inflight_x_quantities: Optional[Tuple[List[Quantity], ...]] = None
+        self._inflight_y_quantities: Optional[
+            Tuple[Optional[List[Quantity]], ...]
+        ] = None
+        if len(updaters) == 0:
+            raise ValueError("Cannot create a batch without halo updaters")
+        if any(updater.persistent_requests for updater in updaters):
+            raise ValueError(
+                "Cannot batch halo updaters with persistent requests, "
+                "as their requests are bound to their own buffers"
+            )
+        self._comm = comm
+        self._updaters = tuple(updaters)
+        self._tag = tag
+        self._timer = timer
+        # Transformers of each updater, sorted per target rank
+        self._transformers: Dict[
+            int, List[Tuple[int, HaloDataTransformer]]
+        ] = defaultdict(list)
+        for i_updater, updater in enumerate(self._updaters):
+            for to_rank, transformer in updater._transformers.items():
+                self._transformers[to_rank].append((i_updater, transformer))
+        for to_rank, transformers in self._transformers.items():
+            dtypes = set(
+                transformer.get_pack_buffer().array.dtype
+                for _, transformer in transformers
+            )
+            if len(dtypes) > 1:
+                raise ValueError(
+                    f"Halo updaters of a batch must share their dtype, got {dtypes}"
+                )
+            numpy_like_module = transformers[0][1]._np_module
+            buffer_size = sum(
+                transformer.buffer_size for _, transformer in transformers
+            )
+            send_buffer = Buffer.pop_from_cache(
+                numpy_like_module.zeros, (buffer_size,), dtypes.pop()
+            )
+            recv_buffer = Buffer.pop_from_cache(
+                numpy_like_module.zeros, (buffer_size,), send_buffer.array.dtype
+            )
+            offset = 0
+            for _, transformer in transformers:
+                size = transformer.buffer_size
+                transformer.bind_buffers(
+                    send_buffer.array[offset : offset + size],
+                    recv_buffer.array[offset : offset + size],
+                )
+                offset += size
+            self._send_buffers[to_rank] = send_buffer
+            self._recv_buffers[to_rank] = recv_buffer
+        self._recv_requests: List[AsyncRequest] = []
+        self._send_requests: List[AsyncRequest] = []
+
+    def __del__(self):
+        """Check no exchange is in flight on garbage collection.
+
+        The batch buffers are not returned to the cache, as the transformers of
+        the updaters, which may outlive the batch, still hold views into them.
+        """
+        if self._inflight_x_quantities is not None:
+            raise RuntimeError(
+                "An halo exchange wasn't completed and a wait() call was expected"
+            )
+
+    def update(
+        self,
+        quantities_x: Sequence[List[Quantity]],
+        quantities_y: Optional[Sequence[Optional[List[Quantity]]]] = None,
+    ):
+        """Exhange the data and blocks until finished."""
+        self.start(quantities_x, quantities_y)
+        self.wait()
+
+    def start(
+        self,
+        quantities_x: Sequence[List[Quantity]],
+        quantities_y: Optional[Sequence[Optional[List[Quantity]]]] = None,
+    ):
+        """Start data exchange.
+
+        Args:
+            quantities_x: for each updater of the batch, the quantities it
+                exchanges, or their x-component for vector updaters
+            quantities_y: for each updater of the batch, the y-component of the
+                quantities it exchanges, or None for scalar updaters. May be
+                omitted if all updaters are scalar.
+        """
+        self._comm._device_synchronize()
+
+        if self._inflight_x_quantities is not None:
+            raise RuntimeError(
+                "Previous exchange hasn't been properly finished."
+                "E.g. previous start() call didn't have a wait() call."
+            )
+        if quantities_y is None:
+            quantities_y = [None] * len(quantities_x)
+        if len(quantities_x) != len(self._updaters) or len(quantities_y) != len(
+            self._updaters
+        ):
+            raise ValueError(
+                f"Expected quantities for {len(self._updaters)} halo updaters, "
+                f"got {len(quantities_x)} (x) and {len(quantities_y)} (y)"
+            )
+
+        self._timer.start(TIMER_HALO_EX_KEY)
+
+        # Post recv MPI order
+        with self._timer.clock("Irecv"):
+            self._recv_requests = []
+            for to_rank, buffer in self._recv_buffers.items():
+                self._recv_requests.append(
+                    self._comm.comm.Irecv(buffer.array, source=to_rank, tag=self._tag)
+                )
+
+        # Pack quantities halo points data into the buffer of each rank
+        with self._timer.clock("pack"):
+            for transformers in self._transformers.values():
+                for i_updater, transformer in transformers:
+                    transformer.async_pack(
+                        quantities_x[i_updater], quantities_y[i_updater]
+                    )
+            for transformers in self._transformers.values():
+                for _, transformer in transformers:
+                    transformer.synchronize()
+
+        self._inflight_x_quantities = tuple(quantities_x)
+        self._inflight_y_quantities = tuple(quantities_y)
+
+        # Post send MPI order
+        with self._timer.clock("Isend"):
+            self._send_requests = []
+            for to_rank, buffer in self._send_buffers.items():
+                self._send_requests.append(
+                    self._comm.comm.Isend(buffer.array, dest=to_rank, tag=self._tag)
+                )
+
+        self._timer.stop(TIMER_HALO_EX_KEY)
+
+    def wait(self):
+        """Finalize data exchange."""
+        if __debug__ and self._inflight_x_quantities is None:
+            raise RuntimeError('Halo update "wait" call before "start"')
+        assert self._inflight_y_quantities is not None
+
+        self._timer.start(TIMER_HALO_EX_KEY)
+
+        # Wait message to be exchange
+        with self._timer.clock("wait"):
+            for send_req in self._send_requests:
+                send_req.wait()
+            for recv_req in self._recv_requests:
+                recv_req.wait()
+
+        # Unpack buffers (updated by MPI with neighbouring halos)
+        # to proper quantities
+        with self._timer.clock("unpack"):
+            for transformers in self._transformers.values():
+                for i_updater, transformer in transformers:
+                    transformer.async_unpack(
+                        self._inflight_x_quantities[i_updater],
+                        self._inflight_y_quantities[i_updater],
+                    )
+            for transformers in self._transformers.values():
+                for _, transformer in transformers:
+                    transformer.synchronize()
+
+        self._inflight_x_quantities = None
+        self._inflight_y_quantities = None
+
+        self._timer.stop(TIMER_HALO_EX_KEY)
+
+
 class HaloUpdateRequest:
     """Asynchronous request object for halo updates."""
 
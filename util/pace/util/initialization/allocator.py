@@ -1,10 +1,11 @@
-from typing import Callable, Optional, Sequence
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 
 from .._optional_imports import gt4py
 from ..constants import SPATIAL_DIMS
 from ..quantity import Quantity, QuantityHaloSpec
+from .arena import QuantityArena
 from .sizer import GridSizer
 
 
@@ -29,9 +30,21 @@ class StorageNumpy:
 
 
 class QuantityFactory:
-    def __init__(self, sizer: GridSizer, numpy):
+    def __init__(self, sizer: GridSizer, numpy, arena: Optional[QuantityArena] = None):
+        """
+        Args:
+            sizer: object which determines array sizes
+            numpy: module used to allocate arrays, numpy or a StorageNumpy
+            arena (optional): if given, quantities are carved out of the slabs
+                of the arena instead of being allocated separately, and empty
+                quantities are zero-initialized
+        """
         self.sizer: GridSizer = sizer
         self._numpy = numpy
+        self.arena = arena
+        self._arena_strides: Dict[
+            Tuple[Tuple[int, ...], Tuple[str, ...], np.dtype], Tuple[int, ...]
+        ] = {}
 
     def set_extra_dim_lengths(self, **kwargs):
         """
@@ -40,15 +53,19 @@ class QuantityFactory:
         self.sizer.extra_dim_lengths.update(kwargs)
 
     @classmethod
-    def from_backend(cls, sizer: GridSizer, backend: str):
+    def from_backend(
+        cls, sizer: GridSizer, backend: str, arena: Optional[QuantityArena] = None
+    ):
         """Initialize a QuantityFactory to use a specific gt4py backend.
 
         Args:
             sizer: object which determines array sizes
             backend: gt4py backend
+            arena (optional): arena to carve quantities out of, must allocate
+                in the memory of the backend
         """
         numpy = StorageNumpy(backend)
-        return cls(sizer, numpy)
+        return cls(sizer, numpy, arena=arena)
 
     def _backend(self) -> Optional[str]:
         try:
@@ -78,7 +95,11 @@ class QuantityFactory:
         units: str,
         dtype: type = float,
     ):
-        return self._allocate(self._numpy.ones, dims, units, dtype)
+        if self.arena is None:
+            return self._allocate(self._numpy.ones, dims, units, dtype)
+        quantity = self._allocate(self._numpy.empty, dims, units, dtype)
+        quantity.data[...] = 1
+        return quantity
 
     def from_array(
         self,
@@ -114,12 +135,17 @@ class QuantityFactory:
                 zip(dims, ("I", "J", "K", *([None] * (len(dims) - 3))))
             )
         ]
-        try:
-            data = allocator(
-                shape, dtype=dtype, aligned_index=origin, dimensions=dimensions
+        if self.arena is None:
+            data = self._allocate_data(allocator, shape, dtype, origin, dimensions)
+        else:
+            data = self.arena.allocate(
+                shape,
+                dtype=dtype,
+                strides=self._get_arena_strides(
+                    tuple(shape), tuple(dims), dtype, origin, dimensions
+                ),
+                aligned_index=origin,
             )
-        except TypeError:
-            data = allocator(shape, dtype=dtype)
         return Quantity(
             data,
             dims=dims,
@@ -129,6 +155,39 @@ class QuantityFactory:
             gt4py_backend=self._backend(),
         )
 
+    @staticmethod
+    def _allocate_data(
+        allocator: Callable,
+        shape: Sequence[int],
+        dtype: type,
+        origin: Sequence[int],
+        dimensions: List[str],
+    ):
+        try:
+            return allocator(
+                shape, dtype=dtype, aligned_index=origin, dimensions=dimensions
+            )
+        except TypeError:
+            return allocator(shape, dtype=dtype)
+
+    def _get_arena_strides(
+        self,
+        shape: Tuple[int, ...],
+        dims: Tuple[str, ...],
+        dtype: type,
+        origin: Sequence[int],
+        dimensions: List[str],
+    ) -> Tuple[int, ...]:
+        """Strides the backend uses for arrays of this shape, read from
+        a temporary allocation done once per shape, dims and dtype."""
+        key = (shape, dims, np.dtype(dtype))
+        if key not in self._arena_strides:
+            template = self._allocate_data(
+                self._numpy.empty, shape, dtype, origin, dimensions
+            )
+            self._arena_strides[key] = template.strides
+        return self._arena_strides[key]
+
     def get_quantity_halo_spec(
         self, dims: Sequence[str], n_halo: Optional[int] = None, dtype: type = float
     ) -> QuantityHaloSpec:
@@ -0,0 +1,156 @@
+from typing import Any, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def _round_up(value: int, multiple: int) -> int:
+    return -(-value // multiple) * multiple
+
+
+def _address(array) -> int:
+    try:
+        return array.__cuda_array_interface__["data"][0]
+    except AttributeError:
+        return array.__array_interface__["data"][0]
+
+
+class QuantityArena:
+    """
+    Allocates arrays as views into a few large, aligned slabs of memory.
+
+    A QuantityFactory given an arena lays out the quantities it allocates next
+    to each other, so that operations on a whole state (copying, saving,
+    page-locking) can act on the slabs instead of on each quantity.
+    Memory of the arena is never reused, arrays are zero-initialized.
+    """
+
+    def __init__(self, numpy, slab_nbytes: int = 2**28, alignment: int = 256):
+        """
+        Args:
+            numpy: module with which slabs are allocated, numpy or cupy
+            slab_nbytes: size of the slabs allocated when an array does not fit
+                in the current slab, arrays larger than this get a slab of their own
+            alignment: byte alignment of the aligned index of each array,
+                must be a power of two
+        """
+        if alignment <= 0 or alignment & (alignment - 1) != 0:
+            raise ValueError(f"alignment must be a power of two, got {alignment}")
+        if slab_nbytes <= 0:
+            raise ValueError(f"slab_nbytes must be positive, got {slab_nbytes}")
+        self.np = numpy
+        self.slab_nbytes = slab_nbytes
+        self.alignment = alignment
+        self._slabs: List[Any] = []
+        self._used_nbytes: List[int] = []
+
+    @property
+    def slabs(self) -> Tuple[Any, ...]:
+        """One-dimensional uint8 views of the used part of each slab."""
+        return tuple(
+            slab[:used_nbytes]
+            for slab, used_nbytes in zip(self._slabs, self._used_nbytes)
+        )
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes allocated for all slabs."""
+        return sum(slab.nbytes for slab in self._slabs)
+
+    @property
+    def used_nbytes(self) -> int:
+        """Bytes of the slabs holding arrays, including alignment padding."""
+        return sum(self._used_nbytes)
+
+    def reserve(self, nbytes: int):
+        """Make sure the next nbytes can be carved out of a single slab.
+
+        Reserving the size of a whole state before allocating it keeps the
+        state in one slab.
+        """
+        if not self._slabs or self._free_nbytes() < nbytes:
+            self._new_slab(nbytes)
+
+    def allocate(
+        self,
+        shape: Sequence[int],
+        dtype: type = float,
+        strides: Optional[Sequence[int]] = None,
+        aligned_index: Optional[Sequence[int]] = None,
+    ):
+        """Carve a zero-initialized array out of the slabs.
+
+        Args:
+            shape: shape of the array
+            dtype: data type of the array
+            strides: strides in bytes of the array, must be non-negative,
+                defaults to C-contiguous strides
+            aligned_index: index of the element aligned to the arena alignment,
+                defaults to the first element
+
+        Returns:
+            array: view into a slab
+        """
+        dtype = np.dtype(dtype)
+        shape = tuple(int(length) for length in shape)
+        if strides is None:
+            strides = self._contiguous_strides(shape, dtype.itemsize)
+        strides = tuple(int(stride) for stride in strides)
+        if any(stride < 0 for stride in strides):
+            raise ValueError(f"strides must be non-negative, got {strides}")
+        if aligned_index is None:
+            aligned_index = (0,) * len(shape)
+        if 0 in shape:
+            span_nbytes = 0
+        else:
+            span_nbytes = dtype.itemsize + sum(
+                (length - 1) * stride for length, stride in zip(shape, strides)
+            )
+        aligned_offset = sum(
+            index * stride for index, stride in zip(aligned_index, strides)
+        )
+        padded_nbytes = span_nbytes + self.alignment
+        if not self._slabs or self._free_nbytes() < padded_nbytes:
+            self._new_slab(padded_nbytes)
+        start = (
+            _round_up(self._used_nbytes[-1] + aligned_offset, self.alignment)
+            - aligned_offset
+        )
+        self._used_nbytes[-1] = start + span_nbytes
+        flat = self._slabs[-1][start : start + span_nbytes].view(dtype)
+        return self.np.lib.stride_tricks.as_strided(flat, shape=shape, strides=strides)
+
+    def snapshot(self) -> List[Any]:
+        """Copy the contents of the slabs, with one copy per slab."""
+        return [slab.copy() for slab in self.slabs]
+
+    def restore(self, snapshot: Sequence[Any]):
+        """Write back the contents of the slabs from a previous snapshot.
+
+        Arrays carved out after the snapshot was taken keep their values.
+        """
+        if len(snapshot) > len(self._slabs):
+            raise ValueError(
+                f"snapshot has {len(snapshot)} slabs, "
+                f"but the arena only has {len(self._slabs)}"
+            )
+        for slab, saved in zip(self._slabs, snapshot):
+            slab[: saved.shape[0]] = saved
+
+    def _free_nbytes(self) -> int:
+        return self._slabs[-1].shape[0] - self._used_nbytes[-1]
+
+    def _new_slab(self, nbytes: int):
+        nbytes = _round_up(max(self.slab_nbytes, nbytes), self.alignment)
+        raw = self.np.zeros(nbytes + self.alignment, dtype=np.uint8)
+        start = _round_up(_address(raw), self.alignment) - _address(raw)
+        self._slabs.append(raw[start : start + nbytes])
+        self._used_nbytes.append(0)
+
+    @staticmethod
+    def _contiguous_strides(shape: Tuple[int, ...], itemsize: int) -> Tuple[int, ...]:
+        strides = []
+        stride = itemsize
+        for length in reversed(shape):
+            strides.append(stride)
+            stride *= max(length, 1)
+        return tuple(reversed(strides))
@@ -30,6 +30,7 @@ class LocalComm(Comm):
         self.total_ranks = total_ranks
         self._buffer = buffer_dict
         self._i_buffer = {}
+        self._n_dups = 0
 
     @property
     def _split_comms(self):
@@ -41,6 +42,11 @@ class LocalComm(Comm):
         self._buffer["split_buffers"] = self._buffer.get("split_buffers", {})
         return self._buffer["split_buffers"]
 
+    @property
+    def _dup_buffers(self):
+        self._buffer["dup_buffers"] = self._buffer.get("dup_buffers", [])
+        return self._buffer["dup_buffers"]
+
     def __repr__(self):
         return f"LocalComm(rank={self.rank}, total_ranks={self.total_ranks})"
 
@@ -192,6 +198,16 @@ class LocalComm(Comm):
         self._split_comms[color].append(new_comm)
         return new_comm
 
+    def Dup(self):
+        # the n-th Dup call of each rank returns comms sharing the n-th buffer
+        if len(self._dup_buffers) == self._n_dups:
+            self._dup_buffers.append({})
+        buffer_dict = self._dup_buffers[self._n_dups]
+        self._n_dups += 1
+        return LocalComm(
+            rank=self.rank, total_ranks=self.total_ranks, buffer_dict=buffer_dict
+        )
+
     def allreduce(self, sendobj, op=None) -> Any:
         raise NotImplementedError(
             "sendrecv fundamentally cannot be written for LocalComm, "
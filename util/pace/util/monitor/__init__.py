@@ -1,3 +1,4 @@
+from .encoding import VariableEncoding
 from .netcdf_monitor import NetCDFMonitor
 from .protocol import Monitor
 from .zarr_monitor import ZarrMonitor
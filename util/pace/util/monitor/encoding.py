@@ -0,0 +1,135 @@
+import dataclasses
+from typing import Any, Dict, Mapping, Optional
+
+import numpy as np
+
+from .._optional_imports import numcodecs
+
+
+__all__ = ["VariableEncoding"]
+
+
+@dataclasses.dataclass(frozen=True)
+class VariableEncoding:
+    """
+    Describes how a variable is encoded when it is written by a monitor.
+
+    Attributes:
+        compressor: compression codec, one of "zlib", "zstd", "lz4" or "blosc",
+            if not given the default of the output format is used
+        compression_level: compression level given to the codec, if not given
+            the codec default is used. For "lz4" in zarr output this is the
+            LZ4 acceleration instead, where higher values compress faster
+            but less, while netCDF output uses lz4 through blosc and takes
+            it as the blosc compression level.
+        keep_bits: if given, floating point data is rounded to keep only this
+            many mantissa bits before being written. This is lossy, but greatly
+            improves compression of the trailing bits which carry little
+            information.
+        dtype: if given, data is converted to this dtype before being written,
+            for example "float32"
+    """
+
+    compressor: Optional[str] = None
+    compression_level: Optional[int] = None
+    keep_bits: Optional[int] = None
+    dtype: Optional[str] = None
+
+    COMPRESSORS = ("zlib", "zstd", "lz4", "blosc")
+
+    def __post_init__(self):
+        if self.compressor is not None and self.compressor not in self.COMPRESSORS:
+            raise ValueError(
+                f"compressor must be one of {self.COMPRESSORS}, got {self.compressor}"
+            )
+        if self.keep_bits is not None and self.keep_bits < 0:
+            raise ValueError(f"keep_bits must be non-negative, got {self.keep_bits}")
+        if self.dtype is not None:
+            np.dtype(self.dtype)  # raises TypeError if the dtype is invalid
+
+    def output_dtype(self, dtype) -> np.dtype:
+        """Return the dtype data of the given dtype is written with."""
+        if self.dtype is None:
+            return np.dtype(dtype)
+        else:
+            return np.dtype(self.dtype)
+
+    def encode(self, array: np.ndarray) -> np.ndarray:
+        """Return a copy of the array converted to the dtype being written,
+        with bit rounding applied if enabled."""
+        array = np.asarray(array, dtype=self.output_dtype(array.dtype))
+        if self.keep_bits is not None and np.issubdtype(array.dtype, np.floating):
+            array = bit_round(array, self.keep_bits)
+        return array
+
+    def zarr_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for zarr array creation."""
+        level = self.compression_level
+        if self.compressor is None:
+            return {}
+        elif self.compressor == "zlib":
+            compressor = numcodecs.Zlib(level=1 if level is None else level)
+        elif self.compressor == "zstd":
+            compressor = numcodecs.Zstd(level=1 if level is None else level)
+        elif self.compressor == "lz4":
+            compressor = numcodecs.LZ4(acceleration=1 if level is None else level)
+        else:
+            compressor = numcodecs.Blosc(
+                cname="lz4",
+                clevel=5 if level is None else level,
+                shuffle=numcodecs.Blosc.SHUFFLE,
+            )
+        return {"compressor": compressor}
+
+    def netcdf_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments for netCDF4.Dataset.createVariable."""
+        level = 4 if self.compression_level is None else self.compression_level
+        if self.compressor is None:
+            return {}
+        elif self.compressor == "zlib":
+            return {"zlib": True, "complevel": level}
+        elif self.compressor == "zstd":
+            return {"compression": "zstd", "complevel": level}
+        elif self.compressor == "lz4":
+            # netCDF has no standalone lz4 filter, so use it through blosc
+            return {"compression": "blosc_lz4", "complevel": level, "blosc_shuffle": 0}
+        else:
+            return {"compression": "blosc_lz4", "complevel": level, "blosc_shuffle": 1}
+
+
+def get_encoding(
+    name: str,
+    encoding: Optional[Mapping[str, VariableEncoding]],
+    default_encoding: Optional[VariableEncoding],
+) -> VariableEncoding:
+    """Return the encoding to use for the named variable."""
+    if encoding is not None and name in encoding:
+        return encoding[name]
+    elif default_encoding is not None:
+        return default_encoding
+    else:
+        return VariableEncoding()
+
+
+def bit_round(array: np.ndarray, keep_bits: int) -> np.ndarray:
+    """
+    Round floating point data to the given number of mantissa bits.
+
+    Rounds to nearest with ties to even, as in numcodecs.BitRound, and
+    returns a new array.
+
+    Args:
+        array: floating point data to round
+        keep_bits: number of mantissa bits to keep
+    """
+    n_mantissa_bits = np.finfo(array.dtype).nmant
+    if keep_bits >= n_mantissa_bits:
+        return array.copy()
+    int_dtype = np.dtype(f"u{array.dtype.itemsize}")
+    bits = array.copy().view(int_dtype)
+    drop_bits = int_dtype.type(n_mantissa_bits - keep_bits)
+    one = int_dtype.type(1)
+    half_quantum = (one << (drop_bits - one)) - one
+    bits += ((bits >> drop_bits) & one) + half_quantum
+    bits &= ~((one << drop_bits) - one)
+    return bits.view(array.dtype)
@@ -1,17 +1,26 @@
+import json
 import logging
 import os
+import tempfile
+from datetime import timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
+import cftime
 import fsspec
 import numpy as np
+from fsspec.implementations.local import LocalFileSystem
 
 from pace.util.communicator import Communicator
 
 from .. import _xarray as xr
+from .._optional_imports import netCDF4
 from ..filesystem import get_fs
+from ..partitioner import TilePartitioner
 from ..quantity import Quantity
 from .convert import to_numpy
+from .encoding import VariableEncoding, get_encoding
+from .zarr_monitor import get_calendar
 
 
 logger = logging.getLogger(__name__)
@@ -39,18 +48,31 @@ class _TimeChunkedVariable:
             units=self._units,
         )
 
+    def get(self, i_time: int) -> Quantity:
+        return Quantity(
+            data=self._data[i_time, ...], dims=self._dims, units=self._units
+        )
+
 
 class _ChunkedNetCDFWriter:
 
     FILENAME_FORMAT = "state_{chunk:04d}_tile{tile}.nc"
 
     def __init__(
-        self, path: str, tile: int, fs: fsspec.AbstractFileSystem, time_chunk_size: int
+        self,
+        path: str,
+        tile: int,
+        fs: fsspec.AbstractFileSystem,
+        time_chunk_size: int,
+        encoding: Optional[Mapping[str, VariableEncoding]] = None,
+        default_encoding: Optional[VariableEncoding] = None,
     ):
         self._path = path
         self._tile = tile
         self._fs = fs
         self._time_chunk_size = time_chunk_size
+        self._encoding = encoding
+        self._default_encoding = default_encoding
         self._i_time = 0
         self._chunked: Optional[Dict[str, _TimeChunkedVariable]] = None
         self._times: List[Any] = []
@@ -78,14 +100,6 @@ class _ChunkedNetCDFWriter:
         if self._chunked is None:
             pass
         else:
-            data_vars = {"time": (["time"], self._times)}
-            for name, chunked in self._chunked.items():
-                data_vars[name] = xr.DataArray(
-                    chunked.data.view[:],
-                    dims=chunked.data.dims,
-                    attrs=chunked.data.attrs,
-                ).expand_dims({"tile": [self._tile]}, axis=1)
-            ds = xr.Dataset(data_vars=data_vars)
             chunk_index = self._i_time // self._time_chunk_size
             chunk_path = str(
                 Path(self._path)
@@ -93,13 +107,179 @@ class _ChunkedNetCDFWriter:
                     chunk=chunk_index, tile=self._tile
                 )
             )
-            if os.path.exists(chunk_path):
-                os.remove(chunk_path)
-            ds.to_netcdf(chunk_path, format="NETCDF4", engine="netcdf4")
+            if self._encoding or self._default_encoding is not None:
+                self._write_encoded(chunk_path, self._chunked)
+            else:
+                self._write(chunk_path, self._chunked)
 
         self._chunked = None
         self._times.clear()
 
+    def _write(self, chunk_path: str, chunked_vars: Dict[str, _TimeChunkedVariable]):
+        data_vars = {"time": (["time"], self._times)}
+        for name, chunked in chunked_vars.items():
+            data_vars[name] = xr.DataArray(
+                chunked.data.view[:],
+                dims=chunked.data.dims,
+                attrs=chunked.data.attrs,
+            ).expand_dims({"tile": [self._tile]}, axis=1)
+        ds = xr.Dataset(data_vars=data_vars)
+        if os.path.exists(chunk_path):
+            os.remove(chunk_path)
+        ds.to_netcdf(chunk_path, format="NETCDF4", engine="netcdf4")
+
+    def _write_encoded(
+        self, chunk_path: str, chunked_vars: Dict[str, _TimeChunkedVariable]
+    ):
+        # written through netCDF4 directly rather than xarray, as not
+        # all versions of xarray support every compression codec
+        writer = _StreamingNetCDFWriter(
+            filename=chunk_path,
+            tile=self._tile,
+            fs=self._fs,
+            encoding=self._encoding,
+            default_encoding=self._default_encoding,
+        )
+        for i_time, time in enumerate(self._times):
+            state = {
+                name: chunked.get(i_time) for name, chunked in chunked_vars.items()
+            }
+            state["time"] = time
+            writer.append(state)
+        writer.flush()
+
+
+class _StreamingNetCDFWriter:
+    """
+    Appends each state to a single netCDF file along an unlimited
+    time dimension as soon as it is given.
+
+    netCDF4 can only write to local files, so on any other filesystem
+    the file is written to a local temporary file which is uploaded
+    when the writer is flushed.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        tile: int,
+        fs: fsspec.AbstractFileSystem,
+        encoding: Optional[Mapping[str, VariableEncoding]] = None,
+        default_encoding: Optional[VariableEncoding] = None,
+    ):
+        self._filename = filename
+        self._fs = fs
+        self._local_filename: Optional[str] = None
+        self._tile = tile
+        self._encoding = encoding
+        self._default_encoding = default_encoding
+        self._i_time = 0
+        self._dataset = None
+        self._dims: Dict[str, Tuple[str, ...]] = {}
+        self._encodings: Dict[str, VariableEncoding] = {}
+        self._time_units: Optional[str] = None
+        self._time_calendar: Optional[str] = None
+
+    def _init_dataset(self, state: Dict[str, Quantity], time):
+        if self._fs.exists(self._filename):
+            self._fs.rm(self._filename)
+        if isinstance(self._fs, LocalFileSystem):
+            self._local_filename = self._filename
+        else:
+            fd, self._local_filename = tempfile.mkstemp(suffix=".nc")
+            os.close(fd)
+        self._dataset = netCDF4.Dataset(
+            self._local_filename, mode="w", format="NETCDF4"
+        )
+        self._dataset.createDimension("time", None)
+        self._dataset.createDimension("tile", 1)
+        tile = self._dataset.createVariable("tile", np.int64, ("tile",))
+        tile[:] = self._tile
+        if time is not None:
+            self._init_time(time)
+        for name, quantity in state.items():
+            self._init_variable(name, quantity)
+
+    def _init_time(self, time):
+        time_variable = self._dataset.createVariable("time", np.float64, ("time",))
+        if isinstance(time, timedelta):
+            self._time_units = "seconds"
+        else:
+            self._time_units = f"seconds since {time}"
+            self._time_calendar = get_calendar(time)
+            time_variable.calendar = self._time_calendar
+        time_variable.units = self._time_units
+
+    def _init_variable(self, name: str, quantity: Quantity):
+        for dim, length in zip(quantity.dims, quantity.extent):
+            if dim not in self._dataset.dimensions:
+                self._dataset.createDimension(dim, length)
+            elif len(self._dataset.dimensions[dim]) != length:
+                raise ValueError(
+                    f"{name} has length {length} along dimension {dim}, "
+                    "which does not match the length "
+                    f"{len(self._dataset.dimensions[dim])} of earlier variables"
+                )
+        encoding = get_encoding(name, self._encoding, self._default_encoding)
+        variable = self._dataset.createVariable(
+            name,
+            encoding.output_dtype(quantity.data.dtype),
+            ("time", "tile") + tuple(quantity.dims),
+            chunksizes=(1, 1) + tuple(quantity.extent),
+            **encoding.netcdf_kwargs(),
+        )
+        variable.setncatts(quantity.attrs)
+        self._dims[name] = tuple(quantity.dims)
+        self._encodings[name] = encoding
+
+    def _encode_time(self, time) -> float:
+        if isinstance(time, timedelta):
+            return time.total_seconds()
+        else:
+            return cftime.date2num(
+                time, units=self._time_units, calendar=self._time_calendar
+            )
+
+    def append(self, state):
+        logger.debug("appending at time %d", self._i_time)
+        state = {**state}  # copy so we don't mutate the input
+        time = state.pop("time", None)
+        if self._dataset is None:
+            self._init_dataset(state, time)
+        if time is not None:
+            self._dataset["time"][self._i_time] = self._encode_time(time)
+        for name, quantity in state.items():
+            self._dataset[name][self._i_time, 0, ...] = self._encodings[name].encode(
+                to_numpy(quantity.transpose(self._dims[name]).view[:])
+            )
+        self._dataset.sync()
+        self._i_time += 1
+
+    def flush(self):
+        if self._dataset is not None:
+            self._dataset.close()
+            self._dataset = None
+            if self._local_filename != self._filename:
+                self._fs.put(self._local_filename, self._filename)
+                os.remove(self._local_filename)
+
+
+def _get_rank_slices(
+    partitioner: TilePartitioner, quantity: Quantity, rank: int
+) -> Tuple[Tuple[slice, ...], Tuple[slice, ...]]:
+    """
+    Returns the slice of the tile written by the given rank, and the
+    corresponding slice of the rank's compute domain.
+    """
+    tile_slice = partitioner.subtile_slice(
+        rank,
+        quantity.dims,
+        partitioner.global_extent(quantity.metadata),
+        overlap=False,
+    )
+    from_slice = tuple(slice(0, entry.stop - entry.start) for entry in tile_slice)
+    return tile_slice, from_slice
+
 
 class NetCDFMonitor:
     """
@@ -107,38 +287,91 @@ class NetCDFMonitor:
     """
 
     _CONSTANT_FILENAME = "constants"
+    _STREAMING_FILENAME_FORMAT = "state_tile{tile}.nc"
+    _PER_RANK_FILENAME_FORMAT = "state_rank{rank:04d}.nc"
+    _PER_RANK_INDEX_FILENAME = "state_index.json"
+    MODES = ("chunked", "streaming", "per_rank")
 
     def __init__(
         self,
         path: str,
         communicator: Communicator,
         time_chunk_size: int = 1,
+        mode: str = "chunked",
+        encoding: Optional[Mapping[str, VariableEncoding]] = None,
+        default_encoding: Optional[VariableEncoding] = None,
     ):
         """Create a NetCDFMonitor.
 
         Args:
             path: directory in which to store data
             communicator: provides global communication to gather state
-            time_chunk_size: number of times per file
+            time_chunk_size: number of times per file, only used in
+                "chunked" mode
+            mode: one of "chunked", "streaming" or "per_rank". In "chunked" mode
+                the tile root rank keeps time_chunk_size gathered states in
+                memory and writes them to a new file per time chunk. In
+                "streaming" mode the tile root rank appends each gathered state
+                to a single file per tile as soon as it is stored. In "per_rank"
+                mode nothing is gathered, each rank appends its own subtile to
+                its own file, and the global root rank writes a small json
+                index describing where each file's data lies on the tile,
+                which can be read using open_per_rank_dataset. Files
+                on non-local filesystems are written locally in "streaming"
+                and "per_rank" mode, and only uploaded on cleanup.
+            encoding: encoding to use for each stored variable by name,
+                constants are always written without any encoding
+            default_encoding: encoding to use for stored variables not
+                given in encoding
         """
+        if mode not in NetCDFMonitor.MODES:
+            raise ValueError(f"mode must be one of {NetCDFMonitor.MODES}, got {mode}")
         rank = communicator.rank
         self._tile_index = communicator.partitioner.tile_index(rank)
         self._path = path
         self._fs = get_fs(path)
         self._communicator = communicator
         self._time_chunk_size = time_chunk_size
-        self.__writer: Optional[_ChunkedNetCDFWriter] = None
+        self._mode = mode
+        self._encoding = encoding
+        self._default_encoding = default_encoding
+        self.__writer: Optional[Any] = None
         self._expected_vars: Optional[Set[str]] = None
 
     @property
     def _writer(self):
         if self.__writer is None:
-            self.__writer = _ChunkedNetCDFWriter(
-                path=self._path,
-                tile=self._tile_index,
-                fs=self._fs,
-                time_chunk_size=self._time_chunk_size,
-            )
+            if self._mode == "chunked":
+                self.__writer = _ChunkedNetCDFWriter(
+                    path=self._path,
+                    tile=self._tile_index,
+                    fs=self._fs,
+                    time_chunk_size=self._time_chunk_size,
+                    encoding=self._encoding,
+                    default_encoding=self._default_encoding,
+                )
+            elif self._mode == "streaming":
+                filename = NetCDFMonitor._STREAMING_FILENAME_FORMAT.format(
+                    tile=self._tile_index
+                )
+                self.__writer = _StreamingNetCDFWriter(
+                    filename=os.path.join(self._path, filename),
+                    tile=self._tile_index,
+                    fs=self._fs,
+                    encoding=self._encoding,
+                    default_encoding=self._default_encoding,
+                )
+            else:
+                filename = NetCDFMonitor._PER_RANK_FILENAME_FORMAT.format(
+                    rank=self._communicator.rank
+                )
+                self.__writer = _StreamingNetCDFWriter(
+                    filename=os.path.join(self._path, filename),
+                    tile=self._tile_index,
+                    fs=self._fs,
+                    encoding=self._encoding,
+                    default_encoding=self._default_encoding,
+                )
         return self.__writer
 
     def store(self, state: dict) -> None:
@@ -163,9 +396,72 @@ class NetCDFMonitor:
                     set(state.keys()), self._expected_vars
                 )
             )
-        state = self._communicator.tile.gather_state(state, transfer_type=np.float32)
-        if state is not None:  # we are on root rank
-            self._writer.append(state)
+        if self._mode == "per_rank":
+            self._store_per_rank(state)
+        else:
+            state = self._communicator.tile.gather_state(
+                state, transfer_type=np.float32
+            )
+            if state is not None:  # we are on root rank
+                self._writer.append(state)
+
+    def _store_per_rank(self, state: dict):
+        rank_state = {}
+        for name, value in state.items():
+            if name == "time":
+                rank_state[name] = value
+            else:
+                _, from_slice = _get_rank_slices(
+                    self._communicator.partitioner.tile,
+                    value,
+                    self._communicator.rank,
+                )
+                rank_state[name] = Quantity(
+                    to_numpy(value.view[:], dtype=np.float32)[from_slice],
+                    dims=value.dims,
+                    units=value.units,
+                )
+                rank_state[name].update_attrs(value.attrs)
+        if self.__writer is None and self._communicator.rank == 0:
+            self._write_per_rank_index(
+                {name: q for name, q in state.items() if name != "time"}
+            )
+        self._writer.append(rank_state)
+
+    def _write_per_rank_index(self, quantities: Dict[str, Quantity]):
+        partitioner = self._communicator.partitioner
+        files = []
+        for rank in range(partitioner.total_ranks):
+            variables = {}
+            for name, quantity in quantities.items():
+                tile_slice, _ = _get_rank_slices(partitioner.tile, quantity, rank)
+                variables[name] = [[entry.start, entry.stop] for entry in tile_slice]
+            files.append(
+                {
+                    "filename": NetCDFMonitor._PER_RANK_FILENAME_FORMAT.format(
+                        rank=rank
+                    ),
+                    "tile": partitioner.tile_index(rank),
+                    "slices": variables,
+                }
+            )
+        index = {
+            "variables": {
+                name: {
+                    "dims": list(quantity.dims),
+                    "tile_shape": list(
+                        partitioner.tile.global_extent(quantity.metadata)
+                    ),
+                }
+                for name, quantity in quantities.items()
+            },
+            "files": files,
+        }
+        index_filename = os.path.join(
+            self._path, NetCDFMonitor._PER_RANK_INDEX_FILENAME
+        )
+        with self._fs.open(index_filename, "w") as f:
+            json.dump(index, f)
 
     def store_constant(self, state: Dict[str, Quantity]) -> None:
         state = self._communicator.gather_state(state, transfer_type=np.float32)
@@ -200,3 +496,43 @@ class NetCDFMonitor:
 
     def cleanup(self):
         self._writer.flush()
+
+
+def open_per_rank_dataset(path: str) -> "xr.Dataset":
+    """
+    Open output written by a NetCDFMonitor in "per_rank" mode as a single
+    dataset with dimensions [time, tile] followed by the tile dimensions.
+
+    Args:
+        path: directory given to the NetCDFMonitor
+
+    Returns:
+        dataset: the combined dataset, loaded into memory
+    """
+    fs = get_fs(path)
+    with fs.open(str(Path(path) / NetCDFMonitor._PER_RANK_INDEX_FILENAME), "r") as f:
+        index = json.load(f)
+    n_tiles = max(entry["tile"] for entry in index["files"]) + 1
+    data_vars: Dict[str, Any] = {}
+    for entry in index["files"]:
+        ds = xr.open_dataset(str(Path(path) / entry["filename"]))
+        if "time" not in data_vars and "time" in ds:
+            data_vars["time"] = ds["time"]
+        for name, slices in entry["slices"].items():
+            if name not in data_vars:
+                variable_index = index["variables"][name]
+                data_vars[name] = xr.DataArray(
+                    np.empty(
+                        (ds.sizes["time"], n_tiles)
+                        + tuple(variable_index["tile_shape"]),
+                        dtype=ds[name].dtype,
+                    ),
+                    dims=["time", "tile"] + variable_index["dims"],
+                    attrs=ds[name].attrs,
+                )
+            target = (slice(None), entry["tile"]) + tuple(
+                slice(start, stop) for start, stop in slices
+            )
+            data_vars[name].values[target] = ds[name].values[:, 0, ...]
+        ds.close()
+    return xr.Dataset(data_vars=data_vars)
@@ -1,6 +1,6 @@
 import logging
 from datetime import datetime, timedelta
-from typing import List, Tuple, Union
+from typing import List, Mapping, Optional, Tuple, Union
 
 import cftime
 
@@ -9,6 +9,7 @@ from .. import constants, utils
 from .._optional_imports import cupy, zarr
 from ..partitioner import Partitioner, subtile_slice
 from .convert import to_numpy
+from .encoding import VariableEncoding, get_encoding
 
 
 logger = logging.getLogger("pace.util")
@@ -45,6 +46,10 @@ class ZarrMonitor:
         partitioner: Partitioner,
         mode: str = "w",
         mpi_comm=DummyComm(),
+        time_block_size: Optional[int] = None,
+        n_times: Optional[int] = None,
+        encoding: Optional[Mapping[str, VariableEncoding]] = None,
+        default_encoding: Optional[VariableEncoding] = None,
     ):
         """Create a ZarrMonitor.
 
@@ -54,7 +59,24 @@ class ZarrMonitor:
             mode: mode to use to open the store. Options are as in zarr.open_group.
             mpi_comm: mpi4py comm object to use for communications. By default, will
                 use a dummy comm object that works in single-core mode.
+            time_block_size: if given, the time dimension of each array is
+                allocated in blocks of this many times. Array metadata is then
+                only written and communicated once per block, and each rank
+                writes its own chunks without communication on other appends.
+                Unused times are trimmed on cleanup. By default the time
+                dimension is resized by the root rank on every append.
+            n_times: expected number of times to be stored, if given along
+                with time_block_size the time dimension is initially allocated
+                to hold this many times
+            encoding: encoding to use for each stored variable by name,
+                constants are always written without any encoding
+            default_encoding: encoding to use for stored variables not
+                given in encoding
         """
+        if time_block_size is not None and time_block_size < 1:
+            raise ValueError(
+                f"time_block_size must be at least 1, got {time_block_size}"
+            )
         if mpi_comm.Get_rank() == 0:
             group = zarr.open_group(store, mode=mode)
         else:
@@ -64,6 +86,13 @@ class ZarrMonitor:
         self._writers = None
         self._constants: List[str] = []
         self.partitioner = partitioner
+        if time_block_size is None:
+            self._initial_time_size: Optional[int] = None
+        else:
+            self._initial_time_size = max(time_block_size, n_times or 0)
+        self._time_block_size = time_block_size
+        self._encoding = encoding
+        self._default_encoding = default_encoding
 
     def _init_writers(self, state):
         self._writers = {
@@ -72,6 +101,9 @@ class ZarrMonitor:
                 self._group,
                 name=key,
                 partitioner=self.partitioner,
+                time_block_size=self._time_block_size,
+                initial_time_size=self._initial_time_size,
+                encoding=get_encoding(key, self._encoding, self._default_encoding),
             )
             for key in set(state.keys()).difference(["time"])
         }
@@ -80,6 +112,8 @@ class ZarrMonitor:
             self._group,
             name="time",
             partitioner=self.partitioner,
+            time_block_size=self._time_block_size,
+            initial_time_size=self._initial_time_size,
         )
 
     def _check_writers(self, state):
@@ -132,18 +166,39 @@ class ZarrMonitor:
             self._constants.append(name)
 
     def cleanup(self):
-        pass
+        if self._time_block_size is not None and self._writers is not None:
+            # make sure all ranks are done writing before trimming arrays
+            self._comm.barrier()
+            for writer in self._writers.values():
+                writer.trim()
 
 
 class _ZarrVariableWriter:
-    def __init__(self, comm, group, name, partitioner):
+    def __init__(
+        self,
+        comm,
+        group,
+        name,
+        partitioner,
+        time_block_size: Optional[int] = None,
+        initial_time_size: Optional[int] = None,
+        encoding: Optional[VariableEncoding] = None,
+    ):
         self.i_time = 0
         self.comm = comm
         self.group = group
         self.name = name
         self.array = None
+        self._time_block_size = time_block_size
+        if encoding is None:
+            self._encoding = VariableEncoding()
+        else:
+            self._encoding = encoding
 
-        self._prepend_shape = (1, 6)
+        if initial_time_size is None:
+            self._prepend_shape: Tuple[int, ...] = (1, 6)
+        else:
+            self._prepend_shape = (initial_time_size, 6)
         self._prepend_chunks = (1, 1)
         self._y_chunks = partitioner.tile.layout[0]
         self._x_chunks = partitioner.tile.layout[1]
@@ -178,9 +233,10 @@ class _ZarrVariableWriter:
         self.array = self.group.create_dataset(
             self.name,
             shape=self._prepend_shape + tile_shape,
-            dtype=quantity.data.dtype,
+            dtype=self._encoding.output_dtype(quantity.data.dtype),
             chunks=chunks,
             fill_value=None,
+            **self._encoding.zarr_kwargs(),
         )
 
     def sync_array(self):
@@ -217,14 +273,16 @@ class _ZarrVariableWriter:
         quantity = self._match_dim_order(quantity)
         self._check_units(quantity)
 
-        if self.i_time >= self.array.shape[0] and self.rank == 0:
-            new_shape = list(
-                self._prepend_shape
-                + self._partitioner.tile.global_extent(quantity.metadata)
-            )
-            new_shape[0] = self.i_time + 1
-            self.array.resize(*new_shape)
-        self.sync_array()
+        if self._time_block_size is None:
+            if self.i_time >= self.array.shape[0] and self.rank == 0:
+                self._resize_time(self.i_time + 1)
+            self.sync_array()
+        elif self.i_time >= self.array.shape[0]:
+            # all ranks append in lockstep, so they all reach the end of
+            # the allocated block on the same append
+            if self.rank == 0:
+                self._resize_time(self.array.shape[0] + self._time_block_size)
+            self.sync_array()
 
         target_slice = (
             self.i_time,
@@ -242,9 +300,22 @@ class _ZarrVariableWriter:
             f"assigning data from subtile slice {from_slice} to "
             f"target slice {target_slice}"
         )
-        self.array[target_slice] = to_numpy(quantity.view[:])[from_slice]
+        self.array[target_slice] = self._encoding.encode(
+            to_numpy(quantity.view[:])[from_slice]
+        )
         self.i_time += 1
 
+    def _resize_time(self, n_times: int):
+        new_shape = list(self.array.shape)
+        new_shape[0] = n_times
+        self.array.resize(*new_shape)
+
+    def trim(self):
+        """Remove any allocated times which were not written."""
+        if self.array is not None and self.rank == 0:
+            if self.array.shape[0] > self.i_time:
+                self._resize_time(self.i_time)
+
     def _get_attrs(self, quantity):
         return {
             "_ARRAY_DIMENSIONS": self._get_quantity_dims(quantity),
@@ -289,6 +360,7 @@ def _get_from_slice(target_slice):
 class _ZarrConstantWriter(_ZarrVariableWriter):
     def __init__(self, *args, **kwargs):
         super(_ZarrConstantWriter, self).__init__(*args, **kwargs)
+        self._time_block_size = None
         self._prepend_shape = (6,)
         self._prepend_chunks = (1,)
         self._PREPEND_DIMS = ("tile",)
@@ -337,7 +409,7 @@ class _ZarrTimeWriter(_ZarrVariableWriter):
 
     def __init__(self, *args, **kwargs):
         super(_ZarrTimeWriter, self).__init__(*args, **kwargs)
-        self._prepend_shape = (1,)
+        self._prepend_shape = self._prepend_shape[:1]
         self._prepend_chunks = (self._TIME_CHUNK_SIZE,)
         self._PREPEND_DIMS = ("time",)
 
@@ -371,14 +443,19 @@ class _ZarrTimeWriter(_ZarrVariableWriter):
         if self.array is None:
             self._init_zarr(array)
             self._set_time_encoding_attrs(time)
-        if self.i_time >= self.array.shape[0] and self.rank == 0:
-            new_shape = (self.i_time + 1,)
-            self.array.resize(*new_shape)
-        self.sync_array()
+        if self._time_block_size is None:
+            if self.i_time >= self.array.shape[0] and self.rank == 0:
+                self._resize_time(self.i_time + 1)
+            self.sync_array()
+        elif self.i_time >= self.array.shape[0]:
+            if self.rank == 0:
+                self._resize_time(self.array.shape[0] + self._time_block_size)
+            self.sync_array()
         if self.rank == 0:
             self.array[self.i_time] = self._encode_time(time)
         self.i_time += 1
-        self.comm.barrier()
+        if self._time_block_size is None:
+            self.comm.barrier()
 
 
 def get_calendar(time: Union[datetime, timedelta, cftime.datetime]):
@@ -3,9 +3,9 @@ try:
 except ImportError:
     MPI = None
 import logging
-from typing import List, Optional, TypeVar, cast
+from typing import List, Optional, Sequence, TypeVar, cast
 
-from .comm import Comm, Request
+from .comm import Comm, PersistentRequest, Request
 
 
 T = TypeVar("T")
@@ -68,12 +68,34 @@ class MPIComm(Comm):
         logger.debug("Irecv on rank %s with source %s", self._comm.Get_rank(), source)
         return self._comm.Irecv(recvbuf, source, tag=tag, **kwargs)
 
+    def Send_init(self, sendbuf, dest, tag: int = 0, **kwargs) -> PersistentRequest:
+        logger.debug("Send_init on rank %s with dest %s", self._comm.Get_rank(), dest)
+        return self._comm.Send_init(sendbuf, dest, tag=tag, **kwargs)
+
+    def Recv_init(self, recvbuf, source, tag: int = 0, **kwargs) -> PersistentRequest:
+        logger.debug(
+            "Recv_init on rank %s with source %s", self._comm.Get_rank(), source
+        )
+        return self._comm.Recv_init(recvbuf, source, tag=tag, **kwargs)
+
+    def Startall(self, requests: Sequence[PersistentRequest]):
+        logger.debug("Startall on rank %s", self._comm.Get_rank())
+        MPI.Prequest.Startall(list(requests))
+
+    def Waitall(self, requests: Sequence[Request]):
+        logger.debug("Waitall on rank %s", self._comm.Get_rank())
+        MPI.Request.Waitall(list(requests))
+
     def Split(self, color, key) -> "Comm":
         logger.debug(
             "Split on rank %s with color %s, key %s", self._comm.Get_rank(), color, key
         )
         return self._comm.Split(color, key)
 
+    def Dup(self) -> "Comm":
+        logger.debug("Dup on rank %s", self._comm.Get_rank())
+        return self._comm.Dup()
+
     def allreduce(self, sendobj: T, op=None) -> T:
         logger.debug("allreduce on rank %s with operator %s", self._comm.Get_rank(), op)
         return self._comm.allreduce(sendobj, op)
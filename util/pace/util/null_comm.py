@@ -91,5 +91,10 @@ class NullComm(Comm):
         self._split_comms[color].append(new_comm)
         return new_comm
 
+    def Dup(self):
+        return NullComm(
+            rank=self.rank, total_ranks=self.total_ranks, fill_value=self._fill_value
+        )
+
     def allreduce(self, sendobj, op=None) -> Any:
         return self._fill_value
@@ -441,6 +441,18 @@ class Quantity:
     def attrs(self) -> dict:
         return dict(**self._attrs, units=self._metadata.units)
 
+    def update_attrs(self, attrs: Dict[str, Any]):
+        """Update the attributes of the quantity.
+
+        Units are part of the quantity metadata and are not updated.
+
+        Args:
+            attrs: attributes to set, e.g. the attrs of another quantity
+        """
+        self._attrs.update(
+            {name: value for name, value in attrs.items() if name != "units"}
+        )
+
     @property
     def dims(self) -> Tuple[str, ...]:
         """names of each dimension"""
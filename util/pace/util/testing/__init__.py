@@ -1,3 +1,4 @@
 from .comparison import compare_arr, compare_scalar, success, success_array
 from .dummy_comm import ConcurrencyError, DummyComm
+from .halo_precision import HaloTransferError, halo_transfer_error
 from .perturbation import perturb
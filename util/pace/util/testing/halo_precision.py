@@ -0,0 +1,67 @@
+import dataclasses
+
+import numpy as np
+
+from .. import constants
+from .._boundary_utils import get_boundary_slice
+from ..quantity import Quantity
+from ..utils import safe_assign_array
+
+
+@dataclasses.dataclass
+class HaloTransferError:
+    """Largest errors of the halo data of a quantity when sent in a transfer dtype."""
+
+    max_absolute: float
+    """largest absolute difference between sent and original values"""
+    max_relative: float
+    """largest difference relative to the mean magnitude of sent and original
+    values, as in compare_arr"""
+
+
+def halo_transfer_error(
+    quantity: Quantity, n_points: int, transfer_dtype: type
+) -> HaloTransferError:
+    """Measure the error of sending the halo data of a quantity in a transfer dtype.
+
+    Halo updaters created with a transfer_dtype convert the data they send to
+    it and convert the data they receive back, so the halo values received by
+    the neighbors of this rank have exactly the error of this round-trip applied
+    to the interior points this rank sends.
+
+    Args:
+        quantity: quantity whose halo data is exchanged
+        n_points: number of halo points exchanged
+        transfer_dtype: dtype in which halo data is sent
+
+    Returns:
+        the largest absolute and relative errors of the data sent by this rank
+    """
+    max_absolute = 0.0
+    max_relative = 0.0
+    for boundary_type in constants.BOUNDARY_TYPES:
+        boundary_slice = get_boundary_slice(
+            quantity.dims,
+            quantity.origin,
+            quantity.extent,
+            quantity.data.shape,
+            boundary_type,
+            n_points,
+            interior=True,
+        )
+        original = np.empty(quantity.data[boundary_slice].shape, dtype=np.float64)
+        safe_assign_array(original, quantity.data[boundary_slice])
+        if original.size == 0:
+            continue
+        sent = original.astype(transfer_dtype).astype(np.float64)
+        absolute = np.abs(sent - original)
+        denominator = np.abs(sent) + np.abs(original)
+        relative = np.divide(
+            2.0 * absolute,
+            denominator,
+            out=np.zeros_like(absolute),
+            where=denominator != 0,
+        )
+        max_absolute = max(max_absolute, float(np.max(absolute)))
+        max_relative = max(max_relative, float(np.max(relative)))
+    return HaloTransferError(max_absolute=max_absolute, max_relative=max_relative)
@@ -1,6 +1,8 @@
 import numpy as np
 import pytest
 
+import pace.util
+
 
 try:
     import gt4py
@@ -57,6 +59,30 @@ def numpy(backend):
         raise NotImplementedError()
 
 
+@pytest.fixture(params=[(1, 1), (2, 2)])
+def layout(request):
+    return request.param
+
+
+@pytest.fixture
+def communicator_list(layout):
+    """Communicators of all ranks of a cube, sharing one in-memory buffer."""
+    partitioner = pace.util.CubedSpherePartitioner(pace.util.TilePartitioner(layout))
+    shared_buffer = {}
+    return [
+        pace.util.CubedSphereCommunicator(
+            comm=pace.util.LocalComm(
+                rank=rank,
+                total_ranks=partitioner.total_ranks,
+                buffer_dict=shared_buffer,
+            ),
+            partitioner=partitioner,
+            timer=pace.util.Timer(),
+        )
+        for rank in range(partitioner.total_ranks)
+    ]
+
+
 def pytest_addoption(parser):
     parser.addoption(
         "--gpu-only", action="store_true", default=False, help="only run gpu tests"
@@ -0,0 +1,48 @@
+import numpy as np
+
+import pace.util
+
+
+N_HALO = 3
+NX = 6
+NZ = 4
+
+STATE_DIMS = {
+    "a": [pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_DIM],
+    "b": [pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_INTERFACE_DIM],
+    "c": [pace.util.X_INTERFACE_DIM, pace.util.Y_INTERFACE_DIM, pace.util.Z_DIM],
+    "u": [pace.util.X_DIM, pace.util.Y_INTERFACE_DIM, pace.util.Z_DIM],
+    "v": [pace.util.X_INTERFACE_DIM, pace.util.Y_DIM, pace.util.Z_DIM],
+}
+
+
+def get_quantity_factory():
+    sizer = pace.util.SubtileGridSizer(
+        nx=NX, ny=NX, nz=NZ, n_halo=N_HALO, extra_dim_lengths={}
+    )
+    return pace.util.QuantityFactory(sizer, np)
+
+
+def get_state(seed, dtype=float, names=tuple(STATE_DIMS)):
+    quantity_factory = get_quantity_factory()
+    random = np.random.default_rng(seed)
+    state = {}
+    for name in names:
+        quantity = quantity_factory.zeros(STATE_DIMS[name], units="m", dtype=dtype)
+        quantity.data[:] = random.uniform(size=quantity.data.shape)
+        state[name] = quantity
+    return state
+
+
+def get_halo_spec(quantity):
+    return pace.util.QuantityHaloSpec(
+        n_points=N_HALO,
+        shape=quantity.data.shape,
+        strides=quantity.data.strides,
+        itemsize=quantity.data.itemsize,
+        origin=quantity.origin,
+        extent=quantity.extent,
+        dims=quantity.dims,
+        numpy_module=quantity.np,
+        dtype=quantity.metadata.dtype,
+    )
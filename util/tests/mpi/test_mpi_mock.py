@@ -226,6 +226,28 @@ def asynchronous_and_synchronous_send_recv(comm, numpy):
     return (data_async, data_sync)
 
 
+@worker()
+def persistent_send_recv(comm, numpy):
+    rank = comm.Get_rank()
+    size = comm.Get_size()
+    data = numpy.asarray([rank], dtype=numpy.int)
+    results = []
+    if rank < size - 1:
+        send_req = comm.Send_init(data, dest=(rank + 1) % size)
+    if rank > 0:
+        recv_req = comm.Recv_init(data, source=(rank - 1) % size)
+    for _ in range(2):
+        if rank < size - 1:
+            send_req.Start()
+            send_req.wait()
+        if rank > 0:
+            recv_req.Start()
+            recv_req.wait()
+        results.append(data.copy())
+        data += 1
+    return numpy.concatenate(results)
+
+
 @pytest.fixture(params=worker_function_list)
 def worker_function(request):
     return request.param
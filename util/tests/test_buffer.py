@@ -1,6 +1,12 @@
 import pytest
 
-from pace.util.buffer import BUFFER_CACHE, Buffer, recv_buffer, send_buffer
+from pace.util.buffer import (
+    BUFFER_CACHE,
+    Buffer,
+    BufferCache,
+    recv_buffer,
+    send_buffer,
+)
 from pace.util.utils import is_c_contiguous, is_contiguous
 
 
@@ -190,3 +196,75 @@ def test_mpi_unsafe_allocator_exception(backend, allocator):
     print(allocator)
     with pytest.raises(RuntimeError):
         Buffer.pop_from_cache(allocator, shape=(10, 10, 10), dtype=float)
+
+
+def test_buffer_cache_stats(numpy):
+    cache = BufferCache()
+    first_buffer = cache.pop(numpy.zeros, (10,), numpy.float64)
+    second_buffer = cache.pop(numpy.zeros, (10,), numpy.float64)
+    assert cache.stats.misses == 2
+    assert cache.stats.allocations == 2
+    assert cache.stats.in_use_bytes == 160
+    assert cache.stats.resident_bytes == 0
+    cache.push(first_buffer)
+    cache.push(second_buffer)
+    assert cache.stats.in_use_bytes == 0
+    assert cache.stats.resident_bytes == 160
+    assert cache.pop(numpy.zeros, (10,), numpy.float64) is second_buffer
+    assert cache.stats.hits == 1
+    assert cache.stats.allocations == 2
+    assert cache.stats.resident_bytes == 80
+    assert cache.stats.peak_resident_bytes == 160
+
+
+def test_buffer_cache_evicts_least_recently_used(numpy):
+    cache = BufferCache(max_bytes=160)
+    old_buffer = cache.pop(numpy.zeros, (10,), numpy.float64)
+    new_buffer = cache.pop(numpy.zeros, (10,), numpy.int64)
+    cache.push(old_buffer)
+    cache.push(new_buffer)
+    assert cache.stats.evictions == 0
+    large_buffer = cache.pop(numpy.zeros, (5,), numpy.float64)
+    cache.push(large_buffer)
+    # the least recently used key is evicted first
+    assert cache.stats.evictions == 1
+    assert len(cache[old_buffer._key]) == 0
+    assert len(cache[new_buffer._key]) == 1
+    assert len(cache[large_buffer._key]) == 1
+    assert cache.stats.resident_bytes == 120
+    cache.set_max_bytes(0)
+    assert cache.stats.evictions == 3
+    assert cache.stats.resident_bytes == 0
+
+
+def test_buffer_cache_prewarm_from_profile(numpy):
+    cache = BufferCache()
+    buffers = [cache.pop(numpy.zeros, 10, numpy.float64) for _ in range(3)]
+    for buffer in buffers:
+        cache.push(buffer)
+    cache.push(cache.pop(numpy.empty, (2, 3), numpy.int32))
+    profile = cache.profile()
+    assert sorted(record["count"] for record in profile) == [1, 3]
+
+    prewarmed_cache = BufferCache()
+    assert prewarmed_cache.prewarm(profile) == 4
+    assert prewarmed_cache.stats.allocations == 4
+    assert prewarmed_cache.stats.resident_bytes == cache.stats.resident_bytes
+    buffers = [prewarmed_cache.pop(numpy.zeros, (10,), numpy.float64) for _ in range(3)]
+    buffers.append(prewarmed_cache.pop(numpy.empty, (2, 3), numpy.int32))
+    assert prewarmed_cache.stats.hits == 4
+    assert prewarmed_cache.stats.misses == 0
+    for buffer in buffers:
+        prewarmed_cache.push(buffer)
+    # buffers already cached are not allocated again
+    assert prewarmed_cache.prewarm(profile) == 0
+
+
+def test_buffer_cache_prewarm_given_allocators(numpy):
+    cache = BufferCache()
+    profile = [
+        {"allocator": "my.allocator", "shape": [4], "dtype": "<f8", "count": 2},
+        {"allocator": "missing.allocator", "shape": [4], "dtype": "<f8", "count": 2},
+    ]
+    assert cache.prewarm(profile, allocators={"my.allocator": numpy.zeros}) == 2
+    assert len(cache[cache.make_key(numpy.zeros, (4,), numpy.float64)]) == 2
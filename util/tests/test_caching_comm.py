@@ -171,3 +171,48 @@ def test_Gather():
     root_comm.Gather(array_root, recvbuf=recvbuf_root, root=0)
     np.testing.assert_array_equal(recvbuf_root[0, :], array_root)
     np.testing.assert_array_equal(recvbuf_root[1, :], array_worker)
+
+
+def test_Recv_init_inserts_data_on_each_wait():
+    comm = pace.util.CachingCommWriter(
+        comm=pace.util.NullComm(rank=0, total_ranks=6, fill_value=0.0)
+    )
+    recvbuf = np.random.randn(12, 12)
+    req = comm.Recv_init(recvbuf, source=0)
+    assert len(comm._data.received_buffers) == 0
+    for i in range(2):
+        comm.Startall([req])
+        comm.Waitall([req])
+        assert len(comm._data.received_buffers) == i + 1
+    req.Free()
+
+
+def test_persistent_requests_replay():
+    array = np.random.uniform(size=(50,))
+    buffer_dict = {}
+    send_comm = pace.util.CachingCommWriter(
+        comm=pace.util.LocalComm(rank=0, total_ranks=2, buffer_dict=buffer_dict)
+    )
+    recv_comm = pace.util.CachingCommWriter(
+        comm=pace.util.LocalComm(rank=1, total_ranks=2, buffer_dict=buffer_dict)
+    )
+    sendbuf = np.zeros_like(array)
+    recvbuf = np.zeros_like(array)
+    send_req = send_comm.Send_init(sendbuf, dest=1)
+    recv_req = recv_comm.Recv_init(recvbuf, source=0)
+    received = []
+    for i in range(2):
+        sendbuf[:] = array + i
+        send_comm.Startall([send_req])
+        recv_comm.Startall([recv_req])
+        send_comm.Waitall([send_req])
+        recv_comm.Waitall([recv_req])
+        received.append(recvbuf.copy())
+
+    recv_comm = writer_to_reader(recv_comm)
+    recvbuf = np.zeros_like(array)
+    recv_req = recv_comm.Recv_init(recvbuf, source=0)
+    for expected in received:
+        recv_comm.Startall([recv_req])
+        recv_comm.Waitall([recv_req])
+        np.testing.assert_array_equal(recvbuf, expected)
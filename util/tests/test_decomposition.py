@@ -8,29 +8,76 @@ from pace.util.decomposition import (
     block_waiting_for_compilation,
     build_cache_path,
     check_cached_path_exists,
-    determine_rank_is_compiling,
-    unblock_waiting_tiles,
+    determine_boundary_class,
+    determine_compiling_rank,
+    determine_waiting_ranks,
+    unblock_waiting_ranks,
 )
 from pace.util.mpi import MPI
 from pace.util.partitioner import CubedSpherePartitioner, TilePartitioner
 
 
 @pytest.mark.parametrize(
-    "layout, rank, is_compiling",
+    "layout",
     [
-        pytest.param((1, 1), 0, True, id="1x1 layout"),
-        pytest.param((1, 1), 2, False, id="1x1 layout"),
-        pytest.param((2, 2), 1, True, id="2x2 layout"),
-        pytest.param((2, 2), 5, False, id="2x2 layout"),
-        pytest.param((3, 3), 8, True, id="3x3 layout"),
-        pytest.param((3, 3), 25, False, id="3x3 layout"),
+        pytest.param((1, 1), id="1x1 layout"),
+        pytest.param((2, 2), id="2x2 layout"),
+        pytest.param((3, 3), id="3x3 layout"),
+        pytest.param((1, 4), id="1x4 layout"),
+        pytest.param((2, 3), id="2x3 layout"),
+        pytest.param((5, 4), id="5x4 layout"),
     ],
 )
-def test_determine_rank_is_compiling(
-    layout: Tuple[int, int], rank: int, is_compiling: bool
+def test_boundary_classes_share_compiling_rank(layout: Tuple[int, int]):
+    partitioner = CubedSpherePartitioner(TilePartitioner(layout))
+    n_classes = min(layout[0], 3) * min(layout[1], 3)
+    compiling_ranks = set()
+    for rank in range(partitioner.total_ranks):
+        compiling_rank = determine_compiling_rank(rank, partitioner)
+        compiling_ranks.add(compiling_rank)
+        assert compiling_rank < partitioner.tile.total_ranks
+        assert determine_boundary_class(rank, partitioner) == determine_boundary_class(
+            compiling_rank, partitioner
+        )
+        for boundary_check in ("top", "bottom", "left", "right"):
+            on_boundary = getattr(partitioner.tile, f"on_tile_{boundary_check}")
+            assert on_boundary(rank) == on_boundary(compiling_rank)
+    assert len(compiling_ranks) == n_classes
+    assert {
+        determine_boundary_class(rank, partitioner) for rank in compiling_ranks
+    } == set(range(n_classes))
+    waiting_ranks = [
+        rank
+        for compiling_rank in compiling_ranks
+        for rank in determine_waiting_ranks(compiling_rank, partitioner)
+    ]
+    assert sorted(waiting_ranks + list(compiling_ranks)) == list(
+        range(partitioner.total_ranks)
+    )
+
+
+@pytest.mark.parametrize(
+    "layout, rank, boundary_class",
+    [
+        pytest.param((3, 3), 5, 5, id="3x3 layout matches ranks"),
+        pytest.param((4, 4), 10, 4, id="4x4 layout interior"),
+        pytest.param((4, 4), 31, 8, id="4x4 layout top right"),
+        pytest.param((2, 4), 6, 4, id="2x4 layout top interior"),
+    ],
+)
+def test_determine_boundary_class(
+    layout: Tuple[int, int], rank: int, boundary_class: int
 ):
     partitioner = CubedSpherePartitioner(TilePartitioner(layout))
-    assert determine_rank_is_compiling(rank, partitioner.total_ranks) == is_compiling
+    assert determine_boundary_class(rank, partitioner) == boundary_class
+
+
+def test_determine_waiting_ranks_not_compiling():
+    partitioner = CubedSpherePartitioner(TilePartitioner((4, 4)))
+    assert determine_waiting_ranks(6, partitioner) == ()
+    assert determine_waiting_ranks(5, partitioner) == (6, 9, 10) + tuple(
+        tile * 16 + rank for tile in range(1, 6) for rank in (5, 6, 9, 10)
+    )
 
 
 def test_check_cached_path_exists():
@@ -44,7 +91,7 @@ def test_check_cached_path_exists_working():
 
 
 @pytest.mark.parametrize(
-    "use_minimal_caching, compiling_equivalent, rank, size, target_rank_str",
+    "use_minimal_caching, boundary_class, rank, size, target_rank_str",
     [
         pytest.param(True, 2, 6, 24, "_000002", id="find_equivalent"),
         pytest.param(False, 2, 6, 24, "_000006", id="find_self"),
@@ -54,14 +101,14 @@ def test_check_cached_path_exists_working():
 )
 def test_build_cache_path(
     use_minimal_caching: bool,
-    compiling_equivalent: int,
+    boundary_class: int,
     rank: int,
     size: int,
     target_rank_str: str,
 ):
     compilation_config = unittest.mock.MagicMock(
         use_minimal_caching=use_minimal_caching,
-        compiling_equivalent=compiling_equivalent,
+        boundary_class=boundary_class,
         rank=rank,
         size=size,
     )
@@ -73,12 +120,11 @@ def test_build_cache_path(
     MPI is None or MPI.COMM_WORLD.Get_size() != 6,
     reason="mpi4py is not available or pytest was not run in parallel",
 )
-def test_unblock_waiting_tiles():
+def test_unblock_waiting_ranks():
     comm = MPI.COMM_WORLD
     compilation_config = unittest.mock.MagicMock(compiling_equivalent=0)
     rank = comm.Get_rank()
-    size = comm.Get_size()
     if rank != 0:
         block_waiting_for_compilation(comm, compilation_config)
     if rank == 0:
-        unblock_waiting_tiles(comm)
+        unblock_waiting_ranks(comm, range(1, comm.Get_size()))
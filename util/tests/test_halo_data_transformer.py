@@ -462,3 +462,99 @@ def test_data_transformer_vector_pack_unpack(quantity, rotation, n_halos):
 
     assert (targe_quanity_x.data == x_quantity.data).all()
     assert (targe_quanity_y.data == y_quantity.data).all()
+
+
+def test_data_transformer_vector_pack_distinct_components(quantity, rotation, n_halos):
+    x_quantity = quantity
+    y_quantity = copy.deepcopy(quantity)
+    y_quantity.data[:] = -2.0 * x_quantity.data - 1.0
+    send_boundaries, recv_boundaries = _get_boundaries(quantity, n_halos)
+    specification = QuantityHaloSpec(
+        n_points=n_halos,
+        shape=quantity.data.shape,
+        strides=quantity.data.strides,
+        itemsize=quantity.data.itemsize,
+        origin=quantity.metadata.origin,
+        extent=quantity.metadata.extent,
+        dims=quantity.metadata.dims,
+        numpy_module=quantity.np,
+        dtype=quantity.metadata.dtype,
+    )
+    directions = [NORTH, NORTHEAST, WEST, SOUTHWEST]
+    exchange_descriptors = [
+        HaloExchangeSpec(
+            specification,
+            send_boundaries[direction],
+            rotation,
+            recv_boundaries[direction],
+        )
+        for direction in directions
+    ]
+    data_transformer = HaloDataTransformer.get(
+        quantity.np, exchange_descriptors, exchange_descriptors
+    )
+    data_transformer.async_pack(
+        [x_quantity] * len(directions), [y_quantity] * len(directions)
+    )
+    pack_buffer = data_transformer.get_pack_buffer().array
+    expected = []
+    for direction in directions:
+        for rotated in rotate_vector_data(
+            x_quantity.data[send_boundaries[direction]],
+            y_quantity.data[send_boundaries[direction]],
+            -rotation,
+            quantity.dims,
+            quantity.np,
+        ):
+            expected.append(rotated.flatten())
+    assert (pack_buffer == quantity.np.concatenate(expected)).all()
+    data_transformer.finalize()
+
+
+def test_data_transformer_non_contiguous_quantity(n_halos):
+    shape = (8 + 2 * n_halos, 6 + 2 * n_halos)
+    data = np.arange(2 * shape[0] * shape[1], dtype=np.float64).reshape(
+        (shape[0], 2 * shape[1])
+    )
+    quantity = Quantity(
+        data[:, ::2],
+        dims=[X_DIM, Y_DIM],
+        units="m",
+        origin=(n_halos, n_halos),
+        extent=(8, 6),
+    )
+    contiguous_quantity = Quantity(
+        np.ascontiguousarray(quantity.data),
+        dims=[X_DIM, Y_DIM],
+        units="m",
+        origin=(n_halos, n_halos),
+        extent=(8, 6),
+    )
+    send_boundaries, recv_boundaries = _get_boundaries(quantity, n_halos)
+    specification = QuantityHaloSpec(
+        n_points=n_halos,
+        shape=contiguous_quantity.data.shape,
+        strides=contiguous_quantity.data.strides,
+        itemsize=contiguous_quantity.data.itemsize,
+        origin=contiguous_quantity.metadata.origin,
+        extent=contiguous_quantity.metadata.extent,
+        dims=contiguous_quantity.metadata.dims,
+        numpy_module=np,
+        dtype=contiguous_quantity.metadata.dtype,
+    )
+    exchange_descriptors = [
+        HaloExchangeSpec(
+            specification, send_boundaries[NORTH], -1, recv_boundaries[WEST]
+        )
+    ]
+    buffers = []
+    for q in (quantity, contiguous_quantity):
+        data_transformer = HaloDataTransformer.get(np, exchange_descriptors)
+        data_transformer.async_pack([q])
+        buffers.append(data_transformer.get_pack_buffer().array.copy())
+        data_transformer.get_unpack_buffer().assign_from(buffers[-1])
+        data_transformer.async_unpack([q])
+        data_transformer.synchronize()
+        data_transformer.finalize()
+    np.testing.assert_array_equal(buffers[0], buffers[1])
+    np.testing.assert_array_equal(quantity.data, contiguous_quantity.data)
@@ -0,0 +1,88 @@
+import copy
+
+import numpy as np
+from halo_updater_helpers import N_HALO, get_halo_spec, get_state
+
+from pace.util.testing import halo_transfer_error
+
+
+# only these quantities are halo updated
+NAMES = ("a", "u", "v")
+
+
+def exchange(communicator_list, states, transfer_dtype):
+    updaters = []
+    for communicator, state in zip(communicator_list, states):
+        scalar_updater = communicator.get_scalar_halo_updater(
+            [get_halo_spec(state["a"])], transfer_dtype=transfer_dtype
+        )
+        vector_updater = communicator.get_vector_halo_updater(
+            [get_halo_spec(state["u"])],
+            [get_halo_spec(state["v"])],
+            transfer_dtype=transfer_dtype,
+        )
+        scalar_updater.start([state["a"]])
+        vector_updater.start([state["u"]], [state["v"]])
+        updaters.append((scalar_updater, vector_updater))
+    for scalar_updater, vector_updater in updaters:
+        scalar_updater.wait()
+        vector_updater.wait()
+    return updaters
+
+
+def test_transfer_dtype_buffers(communicator_list):
+    states = [
+        get_state(seed=rank, names=NAMES) for rank in range(len(communicator_list))
+    ]
+    updaters = exchange(communicator_list, states, np.float32)
+    for scalar_updater, vector_updater in updaters:
+        for updater in (scalar_updater, vector_updater):
+            for transformer in updater._transformers.values():
+                assert transformer.get_pack_buffer().array.dtype == np.float32
+                assert transformer.get_unpack_buffer().array.dtype == np.float32
+    for state in states:
+        for quantity in state.values():
+            assert quantity.data.dtype == np.float64
+
+
+def test_transfer_dtype_error_is_measured(communicator_list):
+    states = [
+        get_state(seed=rank, names=NAMES) for rank in range(len(communicator_list))
+    ]
+    reference_states = copy.deepcopy(states)
+    exchange(communicator_list, reference_states, None)
+    errors = {
+        name: [halo_transfer_error(state[name], N_HALO, np.float32) for state in states]
+        for name in states[0]
+    }
+    exchange(communicator_list, states, np.float32)
+    # vector components are swapped across rotated tile edges
+    errors["u"] = errors["v"] = errors["u"] + errors["v"]
+    for name in states[0]:
+        max_absolute = max(error.max_absolute for error in errors[name])
+        max_relative = max(error.max_relative for error in errors[name])
+        assert max_absolute > 0.0
+        assert max_relative < np.finfo(np.float32).eps
+        difference = max(
+            np.max(np.abs(state[name].data - reference_state[name].data))
+            for state, reference_state in zip(states, reference_states)
+        )
+        assert difference > 0.0
+        assert difference <= max_absolute
+        for state, reference_state in zip(states, reference_states):
+            # only halo values differ, and by their float32 rounding
+            np.testing.assert_array_equal(
+                state[name].view[:], reference_state[name].view[:]
+            )
+            changed = state[name].data != reference_state[name].data
+            np.testing.assert_array_equal(
+                state[name].data[changed],
+                reference_state[name].data[changed].astype(np.float32),
+            )
+
+
+def test_halo_transfer_error_is_zero_for_same_dtype():
+    state = get_state(seed=0, names=NAMES)
+    error = halo_transfer_error(state["a"], N_HALO, np.float64)
+    assert error.max_absolute == 0.0
+    assert error.max_relative == 0.0
@@ -0,0 +1,171 @@
+import copy
+import unittest.mock
+
+import numpy as np
+import pytest
+from halo_updater_helpers import get_halo_spec, get_state
+
+
+def get_updaters(communicator, state):
+    return [
+        communicator.get_scalar_halo_updater(
+            [get_halo_spec(state["a"]), get_halo_spec(state["b"])]
+        ),
+        communicator.get_vector_halo_updater(
+            [get_halo_spec(state["u"])], [get_halo_spec(state["v"])]
+        ),
+        communicator.get_scalar_halo_updater([get_halo_spec(state["c"])]),
+    ]
+
+
+def start_updaters(updaters, state):
+    updaters[0].start([state["a"], state["b"]])
+    updaters[1].start([state["u"]], [state["v"]])
+    updaters[2].start([state["c"]])
+
+
+def start_batch(batch, state):
+    batch.start(
+        [[state["a"], state["b"]], [state["u"]], [state["c"]]],
+        [None, [state["v"]], None],
+    )
+
+
+def count_isend(communicator_list):
+    return [
+        unittest.mock.patch.object(
+            communicator.comm, "Isend", wraps=communicator.comm.Isend
+        )
+        for communicator in communicator_list
+    ]
+
+
+def test_batch_matches_separate_updaters(communicator_list):
+    states = [get_state(seed=rank) for rank in range(len(communicator_list))]
+    reference_states = copy.deepcopy(states)
+
+    updaters = [
+        get_updaters(communicator, state)
+        for communicator, state in zip(communicator_list, reference_states)
+    ]
+    for rank_updaters, state in zip(updaters, reference_states):
+        start_updaters(rank_updaters, state)
+    for rank_updaters in updaters:
+        for updater in rank_updaters:
+            updater.wait()
+
+    batches = [
+        communicator.get_halo_updater_batch(get_updaters(communicator, state))
+        for communicator, state in zip(communicator_list, states)
+    ]
+    patches = count_isend(communicator_list)
+    isend_mocks = [patch.start() for patch in patches]
+    try:
+        for batch, state in zip(batches, states):
+            start_batch(batch, state)
+        for batch in batches:
+            batch.wait()
+    finally:
+        for patch in patches:
+            patch.stop()
+
+    for state, reference_state in zip(states, reference_states):
+        for name, quantity in state.items():
+            np.testing.assert_array_equal(
+                quantity.data, reference_state[name].data, err_msg=name
+            )
+    # one message per neighbor rank, instead of one per updater and neighbor rank
+    for communicator, isend in zip(communicator_list, isend_mocks):
+        neighbor_ranks = set(
+            boundary.to_rank for boundary in communicator.boundaries.values()
+        )
+        assert isend.call_count == len(neighbor_ranks)
+
+
+def test_batch_can_be_reused(communicator_list):
+    states = [get_state(seed=rank) for rank in range(len(communicator_list))]
+    batches = [
+        communicator.get_halo_updater_batch(get_updaters(communicator, state))
+        for communicator, state in zip(communicator_list, states)
+    ]
+    for batch, state in zip(batches, states):
+        start_batch(batch, state)
+    for batch in batches:
+        batch.wait()
+    exchanged_once = copy.deepcopy(states)
+    for batch, state in zip(batches, states):
+        start_batch(batch, state)
+    for batch in batches:
+        batch.wait()
+    for state, reference_state in zip(states, exchanged_once):
+        for name, quantity in state.items():
+            np.testing.assert_array_equal(quantity.data, reference_state[name].data)
+
+
+@pytest.mark.parametrize("layout", [(1, 1)], indirect=True)
+def test_batch_wrong_number_of_quantities(communicator_list):
+    communicator = communicator_list[0]
+    state = get_state(seed=0)
+    batch = communicator.get_halo_updater_batch(get_updaters(communicator, state))
+    with pytest.raises(ValueError):
+        batch.start([[state["a"], state["b"]], [state["u"]]], [None, [state["v"]]])
+
+
+@pytest.mark.parametrize("layout", [(1, 1)], indirect=True)
+def test_batch_mixed_dtypes(communicator_list):
+    communicator = communicator_list[0]
+    state = get_state(seed=0)
+    single_precision_state = get_state(seed=0, dtype=np.float32)
+    with pytest.raises(ValueError):
+        communicator.get_halo_updater_batch(
+            [
+                communicator.get_scalar_halo_updater([get_halo_spec(state["a"])]),
+                communicator.get_scalar_halo_updater(
+                    [get_halo_spec(single_precision_state["a"])]
+                ),
+            ]
+        )
+
+
+@pytest.mark.parametrize("layout", [(1, 1)], indirect=True)
+def test_batch_needs_updaters(communicator_list):
+    with pytest.raises(ValueError):
+        communicator_list[0].get_halo_updater_batch([])
+
+
+@pytest.mark.parametrize("layout", [(1, 1)], indirect=True)
+def test_batch_packs_into_batch_buffers(communicator_list):
+    communicator = communicator_list[0]
+    state = get_state(seed=0)
+    batch = communicator.get_halo_updater_batch(get_updaters(communicator, state))
+    for to_rank, transformers in batch._transformers.items():
+        for _, transformer in transformers:
+            assert np.shares_memory(
+                transformer.get_pack_buffer().array,
+                batch._send_buffers[to_rank].array,
+            )
+            assert np.shares_memory(
+                transformer.get_unpack_buffer().array,
+                batch._recv_buffers[to_rank].array,
+            )
+
+
+def test_batched_updaters_can_be_used_alone(communicator_list):
+    states = [get_state(seed=rank) for rank in range(len(communicator_list))]
+    reference_states = copy.deepcopy(states)
+    for communicator, state in zip(communicator_list, reference_states):
+        updater = communicator.get_scalar_halo_updater([get_halo_spec(state["c"])])
+        updater.start([state["c"]])
+        updater.wait()
+
+    updaters = []
+    for communicator, state in zip(communicator_list, states):
+        rank_updaters = get_updaters(communicator, state)
+        communicator.get_halo_updater_batch(rank_updaters)
+        updaters.append(rank_updaters)
+    for rank_updaters, state in zip(updaters, states):
+        rank_updaters[2].start([state["c"]])
+    for rank_updaters in updaters:
+        rank_updaters[2].wait()
+    for state, reference_state in zip(states, reference_states):
+        np.testing.assert_array_equal(state["c"].data, reference_state["c"].data)
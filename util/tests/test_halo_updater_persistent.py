@@ -0,0 +1,101 @@
+import copy
+import unittest.mock
+
+import numpy as np
+import pytest
+from halo_updater_helpers import get_halo_spec, get_state
+
+
+# only these quantities are halo updated
+NAMES = ("a", "u", "v")
+
+
+def get_updaters(communicator, state, persistent_requests):
+    return (
+        communicator.get_scalar_halo_updater(
+            [get_halo_spec(state["a"])], persistent_requests=persistent_requests
+        ),
+        communicator.get_vector_halo_updater(
+            [get_halo_spec(state["u"])],
+            [get_halo_spec(state["v"])],
+            persistent_requests=persistent_requests,
+        ),
+    )
+
+
+def exchange(updaters, states):
+    for (scalar_updater, vector_updater), state in zip(updaters, states):
+        scalar_updater.start([state["a"]])
+        vector_updater.start([state["u"]], [state["v"]])
+    for scalar_updater, vector_updater in updaters:
+        scalar_updater.wait()
+        vector_updater.wait()
+
+
+def test_persistent_requests_match_posted_requests(communicator_list):
+    states = [
+        get_state(seed=rank, names=NAMES) for rank in range(len(communicator_list))
+    ]
+    reference_states = copy.deepcopy(states)
+    reference_updaters = [
+        get_updaters(communicator, state, persistent_requests=False)
+        for communicator, state in zip(communicator_list, reference_states)
+    ]
+    updaters = [
+        get_updaters(communicator, state, persistent_requests=True)
+        for communicator, state in zip(communicator_list, states)
+    ]
+    for _ in range(2):
+        for state in states + reference_states:
+            for quantity in state.values():
+                quantity.view[:] += 1.0
+        exchange(reference_updaters, reference_states)
+        exchange(updaters, states)
+        for state, reference_state in zip(states, reference_states):
+            for name, quantity in state.items():
+                np.testing.assert_array_equal(
+                    quantity.data, reference_state[name].data, err_msg=name
+                )
+
+
+@pytest.mark.parametrize("layout", [(1, 1)], indirect=True)
+def test_persistent_requests_are_created_once(communicator_list):
+    states = [
+        get_state(seed=rank, names=NAMES) for rank in range(len(communicator_list))
+    ]
+    updaters = [
+        get_updaters(communicator, state, persistent_requests=True)
+        for communicator, state in zip(communicator_list, states)
+    ]
+    patches = [
+        unittest.mock.patch.object(
+            communicator.comm, name, wraps=getattr(communicator.comm, name)
+        )
+        for communicator in communicator_list
+        for name in ("Send_init", "Recv_init", "Startall")
+    ]
+    mocks = [patch.start() for patch in patches]
+    try:
+        exchange(updaters, states)
+        exchange(updaters, states)
+    finally:
+        for patch in patches:
+            patch.stop()
+    calls = {}
+    for patch, mock in zip(patches, mocks):
+        calls[patch.attribute] = calls.get(patch.attribute, 0) + mock.call_count
+    # requests are only created with the updaters, before the patches
+    assert calls["Send_init"] == 0
+    assert calls["Recv_init"] == 0
+    # recv and send for 2 updaters on 6 ranks, on each of 2 exchanges
+    assert calls["Startall"] == 2 * 2 * 6 * 2
+
+
+def test_persistent_requests_cannot_finalize_on_wait(communicator_list):
+    state = get_state(seed=0, names=NAMES)
+    updater = communicator_list[0].get_scalar_halo_updater(
+        [get_halo_spec(state["a"])], persistent_requests=True
+    )
+    assert updater.persistent_requests
+    with pytest.raises(RuntimeError):
+        updater.force_finalize_on_wait()
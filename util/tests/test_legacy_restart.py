@@ -230,6 +230,50 @@ def test_open_c12_restart_to_allocated_state_without_crashing(layout):
                         assert extent == ny + 1
 
 
+@pytest.mark.parametrize("layout", [(1, 1), (3, 3)])
+@pytest.mark.parametrize("allocated", [False, True])
+@pytest.mark.cpu_only
+@requires_xarray
+def test_open_c12_restart_parallel_read_matches_scatter(layout, allocated):
+    total_ranks = 6 * layout[0] * layout[1]
+    scattered_state_list = get_c12_restart_state_list(
+        layout, only_names=None, tracer_properties=None
+    )
+    for rank, scattered_state in enumerate(scattered_state_list):
+        communicator = pace.util.CubedSphereCommunicator(
+            DummyComm(rank, total_ranks, {}),
+            pace.util.CubedSpherePartitioner(pace.util.TilePartitioner(layout)),
+        )
+        if allocated:
+            to_state = {
+                name: pace.util.Quantity(
+                    np.full(value.extent, np.nan), value.dims, value.units
+                )
+                for name, value in scattered_state.items()
+                if name != "time"
+            }
+        else:
+            to_state = None
+        state = pace.util.open_restart(
+            os.path.join(DATA_DIRECTORY, "c12_restart"),
+            communicator,
+            to_state=to_state,
+            parallel_read=True,
+            max_workers=2,
+        )
+        if allocated:
+            assert state is to_state
+        assert state.keys() == scattered_state.keys()
+        assert state["time"] == scattered_state["time"]
+        for name, value in state.items():
+            if name != "time":
+                assert value.dims == scattered_state[name].dims
+                assert value.units == scattered_state[name].units
+                np.testing.assert_array_equal(
+                    value.view[:], scattered_state[name].view[:]
+                )
+
+
 @pytest.fixture(
     params=[
         ("coupler_julian.res", cftime.DatetimeJulian),
@@ -52,3 +52,32 @@ def test_local_comm_tags(local_communicator_list, tags):
                 recv = comm.Irecv(rec_buffer[i], source=(rank - 1) % size, tag=i)
                 recv.wait()
             assert (rec_buffer[list(tags)] == data - 1).all()
+
+
+def test_local_comm_persistent_requests(local_communicator_list):
+    send_comm, recv_comm = local_communicator_list
+    sendbuf = numpy.zeros([3])
+    recvbuf = numpy.zeros([3])
+    send_request = send_comm.Send_init(sendbuf, dest=1, tag=5)
+    recv_request = recv_comm.Recv_init(recvbuf, source=0, tag=5)
+    for i in range(3):
+        sendbuf[:] = i
+        send_comm.Startall([send_request])
+        recv_comm.Startall([recv_request])
+        send_comm.Waitall([send_request])
+        recv_comm.Waitall([recv_request])
+        numpy.testing.assert_array_equal(recvbuf, i)
+
+
+def test_local_comm_dup_separates_messages(local_communicator_list):
+    dup_list = [comm.Dup() for comm in local_communicator_list]
+    for comm, dup_comm in zip(local_communicator_list, dup_list):
+        assert dup_comm.Get_rank() == comm.Get_rank()
+        assert dup_comm.Get_size() == comm.Get_size()
+    local_communicator_list[0].Send(numpy.asarray([1]), dest=1)
+    dup_list[0].Send(numpy.asarray([2]), dest=1)
+    data = numpy.asarray([0])
+    dup_list[1].Recv(data, source=0)
+    assert data[0] == 2
+    local_communicator_list[1].Recv(data, source=0)
+    assert data[0] == 1
@@ -0,0 +1,174 @@
+import unittest.mock
+from datetime import timedelta
+
+import cftime
+import numpy as np
+import pytest
+
+import pace.util
+import pace.util.monitor.netcdf_monitor
+from pace.util._optional_imports import netCDF4, zarr
+from pace.util.monitor.encoding import bit_round, get_encoding
+from pace.util.testing import DummyComm
+
+
+@pytest.mark.parametrize("dtype", [np.float32, np.float64])
+@pytest.mark.parametrize("keep_bits", [0, 3, 10])
+def test_bit_round_relative_error_is_bounded(dtype, keep_bits):
+    np.random.seed(0)
+    array = np.random.randn(1000).astype(dtype)
+    rounded = bit_round(array, keep_bits)
+    relative_error = np.abs((rounded - array) / array)
+    assert np.all(relative_error <= 2.0 ** -(keep_bits + 1))
+    assert rounded.dtype == array.dtype
+
+
+def test_bit_round_does_not_modify_input():
+    array = np.random.randn(10)
+    original = array.copy()
+    bit_round(array, 3)
+    np.testing.assert_array_equal(array, original)
+
+
+def test_bit_round_keeps_all_bits():
+    array = np.random.randn(10).astype(np.float32)
+    np.testing.assert_array_equal(bit_round(array, 23), array)
+
+
+def test_encode_casts_dtype():
+    encoding = pace.util.VariableEncoding(dtype="float32")
+    result = encoding.encode(np.ones(5, dtype=np.float64))
+    assert result.dtype == np.float32
+
+
+def test_encoding_raises_on_invalid_compressor():
+    with pytest.raises(ValueError):
+        pace.util.VariableEncoding(compressor="gzip")
+
+
+def test_get_encoding_falls_back_to_default():
+    default = pace.util.VariableEncoding(dtype="float32")
+    specific = pace.util.VariableEncoding(keep_bits=5)
+    assert get_encoding("a", {"a": specific}, default) == specific
+    assert get_encoding("b", {"a": specific}, default) == default
+    assert get_encoding("b", None, None) == pace.util.VariableEncoding()
+
+
+def get_state(time, value):
+    return {
+        "time": time,
+        "a": pace.util.Quantity(
+            np.full((4, 4, 5), value), dims=("x", "y", "z"), units="m"
+        ),
+        "b": pace.util.Quantity(
+            np.full((4, 4, 5), value), dims=("x", "y", "z"), units="m"
+        ),
+    }
+
+
+@pytest.mark.parametrize("compressor", ["zlib", "zstd", "lz4", "blosc"])
+def test_zarr_monitor_encoding(tmpdir, compressor):
+    partitioner = pace.util.CubedSpherePartitioner(pace.util.TilePartitioner((1, 1)))
+    monitor = pace.util.ZarrMonitor(
+        str(tmpdir),
+        partitioner,
+        encoding={
+            "a": pace.util.VariableEncoding(
+                compressor=compressor, keep_bits=2, dtype="float32"
+            )
+        },
+    )
+    time = cftime.DatetimeJulian(2000, 1, 1)
+    monitor.store(get_state(time, 1.1))
+    group = zarr.open_group(str(tmpdir), mode="r")
+    assert group["a"].dtype == np.float32
+    assert group["a"].compressor.codec_id == {"zlib": "zlib"}.get(
+        compressor, compressor
+    )
+    np.testing.assert_array_equal(
+        group["a"][0, 0], bit_round(np.full((4, 4, 5), 1.1, dtype=np.float32), 2)
+    )
+    assert group["b"].dtype == np.float64
+    np.testing.assert_array_equal(group["b"][0, 0], 1.1)
+
+
+def test_zarr_lz4_uses_compression_level_as_acceleration():
+    compressor = pace.util.VariableEncoding(
+        compressor="lz4", compression_level=8
+    ).zarr_kwargs()["compressor"]
+    assert compressor.acceleration == 8
+
+
+@pytest.mark.parametrize("mode", ["chunked", "streaming", "per_rank"])
+@pytest.mark.parametrize("compressor", ["zlib", "zstd", "blosc"])
+def test_netcdf_monitor_encoding(tmpdir, mode, compressor):
+    partitioner = pace.util.CubedSpherePartitioner(pace.util.TilePartitioner((1, 1)))
+    shared_buffer = {}
+    monitors = []
+    for rank in range(6):
+        communicator = pace.util.CubedSphereCommunicator(
+            partitioner=partitioner,
+            comm=DummyComm(rank=rank, total_ranks=6, buffer_dict=shared_buffer),
+        )
+        communicator.tile
+        monitors.append(
+            pace.util.NetCDFMonitor(
+                path=str(tmpdir),
+                communicator=communicator,
+                mode=mode,
+                time_chunk_size=2,
+                default_encoding=pace.util.VariableEncoding(
+                    compressor=compressor, keep_bits=2
+                ),
+                encoding={"b": pace.util.VariableEncoding()},
+            )
+        )
+    time = cftime.DatetimeJulian(2000, 1, 1)
+    for i_time in range(2):
+        for monitor in monitors:
+            monitor.store(get_state(time + i_time * timedelta(hours=1), 1.1))
+    for monitor in monitors:
+        monitor.cleanup()
+    filename = {
+        "chunked": "state_0000_tile0.nc",
+        "streaming": "state_tile0.nc",
+        "per_rank": "state_rank0000.nc",
+    }[mode]
+    with netCDF4.Dataset(str(tmpdir / filename)) as ds:
+        filters = ds["a"].filters()
+        assert filters[{"blosc": "blosc"}.get(compressor, compressor)]
+        np.testing.assert_array_equal(
+            ds["a"][:], bit_round(np.full((2, 1, 4, 4, 5), 1.1, dtype=np.float32), 2)
+        )
+        assert not ds["b"].filters()["zlib"]
+        np.testing.assert_array_equal(ds["b"][:], np.float32(1.1))
+
+
+def test_netcdf_monitor_without_encoding_writes_through_xarray(tmpdir, monkeypatch):
+    monkeypatch.setattr(
+        pace.util.monitor.netcdf_monitor,
+        "_StreamingNetCDFWriter",
+        unittest.mock.MagicMock(side_effect=AssertionError("must not be used")),
+    )
+    partitioner = pace.util.CubedSpherePartitioner(pace.util.TilePartitioner((1, 1)))
+    shared_buffer = {}
+    monitors = []
+    for rank in range(6):
+        communicator = pace.util.CubedSphereCommunicator(
+            partitioner=partitioner,
+            comm=DummyComm(rank=rank, total_ranks=6, buffer_dict=shared_buffer),
+        )
+        communicator.tile
+        monitors.append(
+            pace.util.NetCDFMonitor(
+                path=str(tmpdir), communicator=communicator, time_chunk_size=2
+            )
+        )
+    time = cftime.DatetimeJulian(2000, 1, 1)
+    for i_time in range(2):
+        for monitor in monitors:
+            monitor.store(get_state(time + i_time * timedelta(hours=1), 1.1))
+    for monitor in monitors:
+        monitor.cleanup()
+    with netCDF4.Dataset(str(tmpdir / "state_0000_tile0.nc")) as ds:
+        np.testing.assert_array_equal(ds["a"][:], 1.1)
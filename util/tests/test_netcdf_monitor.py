@@ -3,11 +3,13 @@ from datetime import timedelta
 from typing import List
 
 import cftime
+import fsspec
 import numpy as np
 import pytest
 
 import pace.util
 from pace.util._optional_imports import xarray as xr
+from pace.util.monitor.netcdf_monitor import open_per_rank_dataset
 from pace.util.testing import DummyComm
 
 
@@ -132,3 +134,108 @@ def test_monitor_store_multi_rank_state(
     assert ds_const2["var_const2"].dims == ("tile",) + dims
     assert ds_const2["var_const2"].attrs["units"] == units
     np.testing.assert_array_equal(ds_const2["var_const2"].values, 1.0)
+
+
+@pytest.mark.parametrize("layout", [(1, 1), (2, 2)])
+@pytest.mark.parametrize("mode", ["streaming", "per_rank"])
+@pytest.mark.parametrize(
+    "shape, ny_rank_add, nx_rank_add, dims",
+    [
+        pytest.param((5, 4, 4), 0, 0, ("z", "y", "x"), id="cell_center"),
+        pytest.param(
+            (5, 4, 4), 1, 1, ("z", "y_interface", "x_interface"), id="cell_corner"
+        ),
+    ],
+)
+@requires_xarray
+def test_monitor_store_multi_rank_state_unchunked(
+    layout, mode, tmpdir, shape, ny_rank_add, nx_rank_add, dims, numpy
+):
+    nt = 3
+    units = "m"
+    nz, ny, nx = shape
+    ny_rank = int(ny / layout[0] + ny_rank_add)
+    nx_rank = int(nx / layout[1] + nx_rank_add)
+    tile = pace.util.TilePartitioner(layout)
+    time = cftime.DatetimeJulian(2010, 6, 20, 6, 0, 0)
+    timestep = timedelta(hours=1)
+    total_ranks = 6 * layout[0] * layout[1]
+    partitioner = pace.util.CubedSpherePartitioner(tile)
+    shared_buffer = {}
+    monitor_list: List[pace.util.NetCDFMonitor] = []
+
+    for rank in range(total_ranks):
+        communicator = pace.util.CubedSphereCommunicator(
+            partitioner=partitioner,
+            comm=DummyComm(
+                rank=rank, total_ranks=total_ranks, buffer_dict=shared_buffer
+            ),
+        )
+        communicator.tile
+        monitor_list.append(
+            pace.util.NetCDFMonitor(path=tmpdir, communicator=communicator, mode=mode)
+        )
+
+    for i_t in range(nt):
+        for rank in range(total_ranks - 1, -1, -1):
+            state = {
+                "time": time + i_t * timestep,
+                "var1": pace.util.Quantity(
+                    numpy.full([nz, ny_rank, nx_rank], float(i_t)),
+                    dims=dims,
+                    units=units,
+                ),
+            }
+            monitor_list[rank].store(state)
+
+    for monitor in monitor_list:
+        monitor.cleanup()
+
+    if mode == "streaming":
+        ds = xr.open_mfdataset(str(tmpdir / "state_tile*.nc"), decode_times=True)
+    else:
+        ds = open_per_rank_dataset(str(tmpdir))
+    np.testing.assert_array_equal(
+        ds["var1"].shape, (nt, 6, nz, ny + ny_rank_add, nx + nx_rank_add)
+    )
+    assert ds["var1"].dims == ("time", "tile") + dims
+    assert ds["var1"].attrs["units"] == units
+    assert ds["time"].shape == (nt,)
+    assert ds["time"].values[0] == time
+    for i_t in range(nt):
+        np.testing.assert_array_equal(ds["var1"].values[i_t], float(i_t))
+
+
+def test_monitor_raises_on_invalid_mode(tmpdir):
+    communicator = pace.util.CubedSphereCommunicator(
+        partitioner=pace.util.CubedSpherePartitioner(pace.util.TilePartitioner((1, 1))),
+        comm=DummyComm(rank=0, total_ranks=6, buffer_dict={}),
+    )
+    with pytest.raises(ValueError):
+        pace.util.NetCDFMonitor(path=tmpdir, communicator=communicator, mode="bad")
+
+
+@requires_xarray
+def test_monitor_streaming_uploads_to_remote_filesystem(tmpdir):
+    fs = fsspec.filesystem("memory")
+    communicator = pace.util.CubedSphereCommunicator(
+        partitioner=pace.util.CubedSpherePartitioner(pace.util.TilePartitioner((1, 1))),
+        comm=DummyComm(rank=0, total_ranks=6, buffer_dict={}),
+    )
+    monitor = pace.util.NetCDFMonitor(
+        path="memory://netcdf_monitor", communicator=communicator, mode="per_rank"
+    )
+    for i_t in range(2):
+        monitor.store(
+            {
+                "var1": pace.util.Quantity(
+                    np.full([3, 4], float(i_t)), dims=("y", "x"), units="m"
+                )
+            }
+        )
+    assert not fs.exists("/netcdf_monitor/state_rank0000.nc")
+    monitor.cleanup()
+    fs.get("/netcdf_monitor/state_rank0000.nc", str(tmpdir / "state.nc"))
+    ds = xr.open_dataset(str(tmpdir / "state.nc"))
+    np.testing.assert_array_equal(ds["var1"].values[0], 0.0)
+    np.testing.assert_array_equal(ds["var1"].values[1], 1.0)
@@ -1,3 +1,5 @@
+import numpy
+
 import pace.util
 from pace.util.null_comm import NullComm
 
@@ -10,3 +12,21 @@ def test_can_create_cube_communicator():
     partitioner = pace.util.CubedSpherePartitioner(pace.util.TilePartitioner(layout))
     communicator = pace.util.CubedSphereCommunicator(mpi_comm, partitioner)
     communicator.tile.partitioner
+
+
+def test_persistent_recv_request_fills_buffer():
+    comm = NullComm(rank=0, total_ranks=6, fill_value=0.0)
+    recvbuf = numpy.ones([4])
+    send_request = comm.Send_init(numpy.ones([4]), dest=1)
+    recv_request = comm.Recv_init(recvbuf, source=1)
+    comm.Startall([send_request, recv_request])
+    comm.Waitall([send_request, recv_request])
+    numpy.testing.assert_array_equal(recvbuf, 0.0)
+
+
+def test_dup_keeps_rank_and_size():
+    comm = NullComm(rank=3, total_ranks=6, fill_value=1.0)
+    dup_comm = comm.Dup()
+    assert dup_comm is not comm
+    assert dup_comm.Get_rank() == 3
+    assert dup_comm.Get_size() == 6
@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+import pace.util
+
+
+NX = 8
+NZ = 5
+N_HALO = 3
+DIMS = {
+    "a": [pace.util.X_DIM, pace.util.Y_DIM, pace.util.Z_DIM],
+    "u": [pace.util.X_DIM, pace.util.Y_INTERFACE_DIM, pace.util.Z_DIM],
+    "v": [pace.util.X_INTERFACE_DIM, pace.util.Y_DIM, pace.util.Z_DIM],
+    "phis": [pace.util.X_DIM, pace.util.Y_DIM],
+}
+
+
+@pytest.fixture
+def sizer():
+    return pace.util.SubtileGridSizer(
+        nx=NX, ny=NX, nz=NZ, n_halo=N_HALO, extra_dim_lengths={}
+    )
+
+
+@pytest.fixture
+def arena():
+    return pace.util.QuantityArena(np, slab_nbytes=2**20, alignment=64)
+
+
+def get_state(quantity_factory):
+    return {
+        name: quantity_factory.zeros(dims, units="m") for name, dims in DIMS.items()
+    }
+
+
+def test_arena_quantities_share_one_slab(sizer, arena):
+    quantity_factory = pace.util.QuantityFactory(sizer, np, arena=arena)
+    state = get_state(quantity_factory)
+    assert len(arena.slabs) == 1
+    for name, quantity in state.items():
+        assert np.shares_memory(quantity.data, arena.slabs[0])
+        assert quantity.data.shape == sizer.get_shape(DIMS[name])
+        np.testing.assert_array_equal(quantity.data, 0.0)
+        aligned = quantity.data[tuple(slice(start, None) for start in quantity.origin)]
+        assert aligned.__array_interface__["data"][0] % arena.alignment == 0
+    for i, quantity in enumerate(state.values()):
+        quantity.data[:] = i
+    for i, quantity in enumerate(state.values()):
+        np.testing.assert_array_equal(quantity.data, i)
+
+
+def test_arena_matches_separate_allocation(sizer, arena):
+    quantity_factory = pace.util.QuantityFactory(sizer, np)
+    arena_factory = pace.util.QuantityFactory(sizer, np, arena=arena)
+    for dims in DIMS.values():
+        expected = quantity_factory.ones(dims, units="m")
+        result = arena_factory.ones(dims, units="m")
+        assert result.data.strides == expected.data.strides
+        assert result.origin == expected.origin
+        assert result.extent == expected.extent
+        np.testing.assert_array_equal(result.data, expected.data)
+
+
+def test_arena_snapshot_restore(sizer, arena):
+    quantity_factory = pace.util.QuantityFactory(sizer, np, arena=arena)
+    state = get_state(quantity_factory)
+    random = np.random.default_rng(0)
+    for quantity in state.values():
+        quantity.data[:] = random.uniform(size=quantity.data.shape)
+    expected = {name: quantity.data.copy() for name, quantity in state.items()}
+    snapshot = arena.snapshot()
+    for quantity in state.values():
+        quantity.data[:] = -1.0
+    arena.restore(snapshot)
+    for name, quantity in state.items():
+        np.testing.assert_array_equal(quantity.data, expected[name])
+
+
+def test_arena_adds_slabs_when_full():
+    arena = pace.util.QuantityArena(np, slab_nbytes=1024, alignment=64)
+    small = arena.allocate((8,), dtype=np.float64)
+    large = arena.allocate((4096,), dtype=np.float64)
+    assert len(arena.slabs) == 2
+    assert np.shares_memory(small, arena.slabs[0])
+    assert np.shares_memory(large, arena.slabs[1])
+    assert arena.nbytes >= 1024 + large.nbytes
+    assert arena.used_nbytes >= small.nbytes + large.nbytes
+
+
+def test_arena_reserve_keeps_allocations_in_one_slab():
+    arena = pace.util.QuantityArena(np, slab_nbytes=1024, alignment=64)
+    arena.reserve(64 * 1024)
+    for _ in range(8):
+        arena.allocate((512,), dtype=np.float64)
+    assert len(arena.slabs) == 1
+
+
+def test_arena_alignment_must_be_power_of_two():
+    with pytest.raises(ValueError):
+        pace.util.QuantityArena(np, alignment=48)
@@ -147,6 +147,28 @@ def test_monitor_file_store(state_list, cube_partitioner, numpy, start_time):
         validate_xarray_can_open(tempdir)
 
 
+@pytest.mark.parametrize(
+    "time_block_size, n_times_hint", [(1, None), (2, None), (2, 5)]
+)
+@requires_zarr
+@requires_xarray
+def test_monitor_file_store_time_blocks(
+    state_list, cube_partitioner, numpy, start_time, time_block_size, n_times_hint
+):
+    with tempfile.TemporaryDirectory(suffix=".zarr") as tempdir:
+        monitor = pace.util.ZarrMonitor(
+            tempdir,
+            cube_partitioner,
+            time_block_size=time_block_size,
+            n_times=n_times_hint,
+        )
+        for state in state_list:
+            monitor.store(state)
+        monitor.cleanup()
+        validate_store(state_list, tempdir, numpy, start_time)
+        validate_xarray_can_open(tempdir)
+
+
 @requires_zarr
 @requires_xarray
 def validate_xarray_can_open(dirname):
@@ -263,6 +285,59 @@ def test_monitor_file_store_multi_rank_state(
     numpy.testing.assert_array_equal(group["var1"], 1.0)
 
 
+@pytest.mark.parametrize("layout", [(1, 1), (2, 2)])
+@pytest.mark.parametrize("nt", [1, 3])
+@requires_zarr
+@requires_xarray
+def test_monitor_file_store_multi_rank_time_blocks(layout, nt, tmpdir_factory, numpy):
+    tmpdir = tmpdir_factory.mktemp("data.zarr")
+    nz, ny, nx = 5, 4, 4
+    ny_rank = ny // layout[0]
+    nx_rank = nx // layout[1]
+    time = cftime.DatetimeJulian(2010, 6, 20, 6, 0, 0)
+    timestep = timedelta(hours=1)
+    total_ranks = 6 * layout[0] * layout[1]
+    partitioner = pace.util.CubedSpherePartitioner(pace.util.TilePartitioner(layout))
+    store = zarr.storage.DirectoryStore(tmpdir)
+    shared_buffer = {}
+    monitor_list = []
+    for rank in range(total_ranks):
+        monitor_list.append(
+            pace.util.ZarrMonitor(
+                store,
+                partitioner,
+                "w",
+                mpi_comm=DummyComm(
+                    rank=rank, total_ranks=total_ranks, buffer_dict=shared_buffer
+                ),
+                time_block_size=2,
+            )
+        )
+    for i_t in range(nt):
+        for rank in range(total_ranks):
+            state = {
+                "time": time + i_t * timestep,
+                "var1": pace.util.Quantity(
+                    numpy.full([nz, ny_rank, nx_rank], float(i_t)),
+                    dims=("z", "y", "x"),
+                    units="m",
+                ),
+            }
+            monitor_list[rank].store(state)
+    for monitor in monitor_list:
+        monitor.cleanup()
+    group = zarr.hierarchy.open_group(store=store, mode="r")
+    assert group["var1"].shape == (nt, 6, nz, ny, nx)
+    assert group["time"].shape == (nt,)
+    for i_t in range(nt):
+        numpy.testing.assert_array_equal(group["var1"][i_t], float(i_t))
+
+
+def test_monitor_raises_on_invalid_time_block_size(cube_partitioner):
+    with pytest.raises(ValueError):
+        pace.util.ZarrMonitor({}, cube_partitioner, time_block_size=0)
+
+
 @pytest.mark.parametrize(
     "layout, tile_array_shape, array_dims, target",
     [